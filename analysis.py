@@ -0,0 +1,351 @@
+from workflows.random_coords import pface_mask_of, random_points
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from utils import to_df
+from cancel import CancelToken
+from timing import span
+from globals import REFERENCE_ENGINE, DEFAULT_ENGINES
+import pandas as pd
+import numpy as np
+import threading
+import logging
+import math
+import copy
+import time
+import cv2
+# sklearn (and scipy under it) load with the first intermediate that needs them, not at startup
+if TYPE_CHECKING:
+    from sklearn.neighbors import KDTree
+
+"""
+SHARED ANALYSIS INTERMEDIATES
+___________________
+Workflows ask an AnalysisContext for named intermediates (spatial index, nearest neighbors, cluster labels,
+centroids, landmark distances, mask products, ...) instead of rebuilding them. Every intermediate declares the ones it
+is built from, so the workflows selected for a run compile into one dependency graph (see plan) and each node is
+computed once per dataset, then shared by every page that needs it.
+An intermediate can have alternative engines (e.g. a faster clustering) next to its reference producer, a context
+computes each intermediate with the engine its engines setting names. benchmarks/golden.py gates engines against
+the reference ones.
+"""
+
+# name -> (reference producer(ctx, *params), intermediates it depends on)
+_producers: Dict[str, Tuple[Callable, List[str]]] = {}
+# name -> engine -> alternative producer, same params and dependencies as the reference one
+_engines: Dict[str, Dict[str, Callable]] = {}
+
+
+def intermediate(name: str, deps: List[str] = None, engine: str = REFERENCE_ENGINE):
+    """ REGISTER fn(ctx, *params) AS THE PRODUCER OF A NAMED INTERMEDIATE, OR AS AN ALTERNATIVE ENGINE FOR IT """
+    def _register(fn: Callable) -> Callable:
+        if engine == REFERENCE_ENGINE:
+            _producers[name] = (fn, list(deps or []))
+        else:
+            _engines.setdefault(name, {})[engine] = fn
+        return fn
+    return _register
+
+
+def engines_of(name: str) -> List[str]:
+    """ ENGINES AN INTERMEDIATE CAN BE COMPUTED WITH, REFERENCE FIRST """
+    return [REFERENCE_ENGINE] + list(_engines.get(name, {}))
+
+
+def plan(needs: List[str]) -> List[str]:
+    """ EVERY INTERMEDIATE needs PULLS IN, DEPENDENCIES FIRST AND EACH ONCE """
+    order = []
+
+    def visit(name: str, path: Tuple[str, ...]):
+        if name in order:
+            return
+        if name not in _producers:
+            raise KeyError(f'unknown intermediate {name}')
+        if name in path:
+            raise ValueError(f'intermediate {name} depends on itself ({" -> ".join(path + (name,))})')
+        for dep in _producers[name][1]:
+            visit(dep, path + (name,))
+        order.append(name)
+    for need in needs:
+        visit(need, ())
+    return order
+
+
+class AnalysisContext:
+    """
+    ANALYSIS CONTEXT
+    __________________
+    @coords: gold coords (px)
+    @alt_coords: landmark coords (px)
+    @img_path: image path
+    @mask_path: mask path
+    @rand_coords: random coords to use as the 'rand' population, otherwise pick them with with_random
+    @engines: intermediate or workflow name -> engine computing it, DEFAULT_ENGINES if not given
+
+    Memo of the intermediates of one loaded dataset. Intermediates are keyed by name and params, populations
+    ('real', 'rand' and 'alt') included, so e.g. SEPARATION reuses CLUST's cluster labels when the thresholds match.
+    Concurrent requests for the same intermediate wait for the thread computing it. Values are shared, treat them
+    as read only (copy frames before changing them). A run cancelled mid intermediate stores nothing, the next run
+    asking for it computes it again.
+    """
+    def __init__(self, coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]] = None,
+                 img_path: str = "", mask_path: str = "", rand_coords: List[Tuple[float, float]] = None,
+                 engines: Dict[str, str] = None):
+        self.coords = coords
+        self.alt_coords = alt_coords
+        self.img_path = img_path
+        self.mask_path = mask_path
+        self.engines = dict(DEFAULT_ENGINES if engines is None else engines)
+        # (count, seed) of the random coords 'rand' refers to
+        self.rand_key: Optional[tuple] = None
+        # cancellation of the run using this view
+        self.token: Optional[CancelToken] = None
+        self._values: Dict[tuple, object] = {}
+        self._locks: Dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        if rand_coords is not None:
+            self.rand_key = ('given',)
+            self._values[self._key('rand_coords', ('given',))] = rand_coords
+
+    def matches(self, coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], img_path: str,
+                mask_path: str) -> bool:
+        """ TRUE IF THIS CONTEXT WAS BUILT FROM EXACTLY THESE INPUTS """
+        return self.coords is coords and self.alt_coords is alt_coords and self.img_path == img_path and \
+            self.mask_path == mask_path
+
+    def with_random(self, count: int, seed: Optional[int], token: CancelToken = None) -> 'AnalysisContext':
+        """
+        VIEW FOR ONE RUN
+        __________________
+        @count: number of random coords the 'rand' population holds
+        @seed: seed they are drawn with
+        @token: cancels the run, checked between and inside intermediates
+        @return: view sharing this context's intermediates
+        """
+        view = copy.copy(self)
+        view.rand_key = (count, seed)
+        view.token = token
+        return view
+
+    def with_engines(self, engines: Dict[str, str]) -> 'AnalysisContext':
+        """ VIEW SHARING THIS CONTEXT'S INTERMEDIATES THAT COMPUTES WITH OTHER ENGINES (THEIR RESULTS ARE KEPT APART) """
+        view = copy.copy(self)
+        view.engines = dict(engines)
+        return view
+
+    def check(self):
+        """ RAISE Cancelled IF THIS VIEW'S RUN WAS CANCELLED, CALL AT CHUNK BOUNDARIES """
+        if self.token is not None:
+            self.token.check()
+
+    def points(self, pop: str) -> list:
+        """ COORDS OF A POPULATION: 'real', 'rand' OR 'alt' """
+        if pop == 'real':
+            return self.coords
+        if pop == 'alt':
+            return self.alt_coords if self.alt_coords is not None else []
+        return self.get('rand_coords', *self.rand_key)
+
+    def _key(self, name: str, params: tuple) -> tuple:
+        engine = self.engines.get(name, REFERENCE_ENGINE)
+        key = [name if engine == REFERENCE_ENGINE else f'{name}@{engine}']
+        for param in params:
+            if isinstance(param, str) and param == 'rand':
+                if self.rand_key is None:
+                    raise ValueError('no random coords picked, see with_random')
+                param = ('rand',) + self.rand_key
+            key.append(param)
+        return tuple(key)
+
+    def put(self, name: str, value, *params):
+        """ STORE INTERMEDIATE name FOR params COMPUTED ELSEWHERE (E.G. BY THE PROCESS THAT LOADED THE DATASET) """
+        key = self._key(name, params)
+        with self._lock:
+            self._values[key] = value
+
+    def get(self, name: str, *params):
+        """ INTERMEDIATE name FOR params, COMPUTED ON FIRST USE """
+        key = self._key(name, params)
+        self.check()
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            with self._lock:
+                if key in self._values:
+                    logging.debug('reusing %s', key)
+                    return self._values[key]
+            start = time.perf_counter()
+            engine = self.engines.get(name, REFERENCE_ENGINE)
+            producer = _producers[name][0] if engine == REFERENCE_ENGINE else _engines[name][engine]
+            with span(name):
+                value = producer(self, *params)
+            with self._lock:
+                self._values[key] = value
+            logging.info('computed %s in %.2fs', ' '.join(str(k) for k in key), time.perf_counter() - start)
+        return value
+
+
+def nearest_positive(src: list, dst: list, tree: 'KDTree' = None, k: int = 8,
+                     check: Callable = None) -> Tuple[List[int], List[float]]:
+    """
+    CLOSEST dst POINT OF EVERY src POINT
+    __________________
+    @src: points to measure from
+    @dst: points to measure to
+    @tree: KDTree over dst, built if not given
+    @k: neighbors fetched per query, grown for points whose answer is not settled yet
+    @check: called every few thousand points, e.g. AnalysisContext.check
+    @return: index into dst (-1 if none) and distance of each src point's closest dst point at a non zero distance.
+        Distances are computed exactly like the original brute force loops and ties go to the lowest index, so
+        results are identical to scanning every pair.
+    """
+    idx, dists = [-1] * len(src), [None] * len(src)
+    if len(src) == 0 or len(dst) == 0:
+        return idx, dists
+    if tree is None:
+        from sklearn.neighbors import KDTree
+        tree = KDTree(np.asarray(dst, dtype=np.float64).reshape(-1, 2))
+    src_arr = np.asarray(src, dtype=np.float64).reshape(-1, 2)
+    todo = np.arange(len(src))
+    k = min(k, len(dst))
+    while len(todo) > 0:
+        kd_dists, kd_idx = tree.query(src_arr[todo], k=k)
+        retry = []
+        for row, i in enumerate(todo):
+            if check is not None and row % 4096 == 0:
+                check()
+            a = src[i]
+            best, best_j = None, -1
+            for j in kd_idx[row]:
+                b = dst[j]
+                dist = math.sqrt(((b[1] - a[1]) ** 2) + ((b[0] - a[0]) ** 2))
+                if dist != 0 and (best is None or dist < best or (dist == best and j < best_j)):
+                    best, best_j = dist, int(j)
+            # settled once every point left out is further than the best one found (with room for rounding)
+            if k == len(dst) or (best is not None and kd_dists[row, -1] > best * (1 + 1e-9)):
+                idx[i], dists[i] = best_j, best
+            else:
+                retry.append(i)
+        todo = np.array(retry, dtype=int)
+        k = min(k * 4, len(dst))
+    return idx, dists
+
+
+# remove elements of list that show up fewer than k times
+def minify_list(lst: List[int], k: int = 3):
+    counted = Counter(lst)
+    return [el for el in lst if counted[el] >= k]
+
+
+""" MASK PRODUCTS """
+
+
+@intermediate('image_shape')
+def _image_shape(ctx: AnalysisContext) -> Tuple[int, ...]:
+    return cv2.imread(ctx.img_path).shape
+
+
+@intermediate('pface_mask', deps=['image_shape'])
+def _pface_mask(ctx: AnalysisContext, crop: bool) -> np.ndarray:
+    """ crop=True: cropped to the image (the whole image without a mask) as random coords use it, else as is """
+    if not crop:
+        return pface_mask_of(ctx.mask_path)
+    shape = ctx.get('image_shape')
+    if len(ctx.mask_path) > 0:
+        full = ctx.get('pface_mask', False)
+        if full.shape == shape[:2]:
+            # nothing to crop, same mask
+            return full
+    return pface_mask_of(ctx.mask_path, shape)
+
+
+@intermediate('pface_area', deps=['pface_mask'])
+def _pface_area(ctx: AnalysisContext) -> float:
+    pface_mask = ctx.get('pface_mask', False)
+    pface_cnts, pface_hierarchy = cv2.findContours(
+        pface_mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
+    pface_cnts2, pface_hierarchy2 = cv2.findContours(
+        pface_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)[-2:]
+    pface_area_external, pface_area_tree = 0, 0
+    for cnt in pface_cnts2:
+        area = cv2.contourArea(cnt)
+        pface_area_external += area
+    for cnt in pface_cnts:
+        area = cv2.contourArea(cnt)
+        pface_area_tree += area
+    difference = (pface_area_tree - pface_area_external)
+    return pface_area_external - difference
+
+
+@intermediate('rand_coords', deps=['pface_mask'])
+def _rand_coords(ctx: AnalysisContext, count: int, seed: Optional[int]) -> list:
+    if len(ctx.img_path) == 0:
+        return []
+    return random_points(ctx.get('pface_mask', True), count, seed, check=ctx.check)
+
+
+""" DISTANCES """
+
+
+@intermediate('spatial_index', deps=['rand_coords'])
+def _spatial_index(ctx: AnalysisContext, pop: str) -> 'KDTree':
+    from sklearn.neighbors import KDTree
+    return KDTree(np.asarray(ctx.points(pop), dtype=np.float64).reshape(-1, 2))
+
+
+@intermediate('nearest_neighbors', deps=['spatial_index'])
+def _nearest_neighbors(ctx: AnalysisContext, pop: str) -> Tuple[List[int], List[float]]:
+    points = ctx.points(pop)
+    return nearest_positive(points, points, ctx.get('spatial_index', pop) if len(points) > 0 else None,
+                            check=ctx.check)
+
+
+@intermediate('landmark_distances', deps=['spatial_index'])
+def _landmark_distances(ctx: AnalysisContext, pop: str) -> Tuple[List[int], List[float]]:
+    """ closest landmark of every particle of pop """
+    landmarks = ctx.points('alt')
+    return nearest_positive(ctx.points(pop), landmarks, ctx.get('spatial_index', 'alt') if len(landmarks) > 0 else None,
+                            check=ctx.check)
+
+
+""" CLUSTERS """
+
+
+@intermediate('cluster_labels', deps=['rand_coords'])
+def _cluster_labels(ctx: AnalysisContext, pop: str, distance_threshold: int, affinity: str = 'euclidean',
+                    linkage: str = 'single') -> pd.DataFrame:
+    """ X, Y and cluster_id of every particle of pop """
+    from sklearn.cluster import AgglomerativeClustering
+    hc = AgglomerativeClustering(n_clusters=None, distance_threshold=distance_threshold * 2, affinity=affinity,
+                                 linkage=linkage)
+    if pop == 'real':
+        df = to_df(ctx.coords)
+        df['cluster_id'] = hc.fit_predict(ctx.coords)
+        return df
+    coordinates = np.flip(np.array(ctx.points(pop)), 1)
+    df = pd.DataFrame(coordinates, columns=["X", "Y"])
+    df['cluster_id'] = hc.fit_predict(coordinates)
+    return df
+
+
+@intermediate('centroids', deps=['cluster_labels'])
+def _centroids(ctx: AnalysisContext, pop: str, distance_threshold: int, min_size: int, affinity: str = 'euclidean',
+               linkage: str = 'single') -> Tuple[List[Tuple[float, float]], List[int]]:
+    """ (y, x) centroids and ids of the clusters of pop with at least min_size particles """
+    cl_df = ctx.get('cluster_labels', pop, distance_threshold, affinity, linkage)
+    centroids, centroid_ids = [], []
+    for c in set(minify_list(cl_df['cluster_id'].to_numpy(), min_size)):
+        ctx.check()
+        cl = cl_df.loc[cl_df['cluster_id'] == c]
+        n, x, y = 0, 0, 0
+        for idx, entry in cl.iterrows():
+            x += entry['X']
+            y += entry['Y']
+            n += 1
+        if n > 0:
+            x /= n
+            y /= n
+            centroids.append((y, x))
+            centroid_ids.append(c)
+    return centroids, centroid_ids
@@ -0,0 +1,131 @@
+from typing import List, Tuple
+from spatial import GridIndex
+from globals import OVERLAY_GRID_CELL
+import numpy as np
+import cv2
+
+
+class AnnotationLayer:
+    """
+    ANNOTATION LAYER
+    __________________
+    @shape: shape of the image the annotations belong to (height, width, channels)
+
+    Records annotations as vector primitives instead of burning them into the image, so the viewer can show, hide
+    and recolor them without re-decoding the montage. Method signatures mirror their opencv counterparts and colors
+    are BGR, exactly as cv2 would interpret them. Call burn() to rasterize onto an image (e.g. for TIFF export).
+    """
+    def __init__(self, shape: Tuple[int, ...]):
+        self.shape = shape
+        # ordered list of (kind, args) so burning replays in the same order the workflow drew
+        self.ops: List[tuple] = []
+        # lazily built spatial index over op bounding boxes, dropped whenever an op is added
+        self._index: GridIndex = None
+        self._anchors: np.ndarray = None
+        self._density = {}
+        self._main_color = None
+
+    def _invalidate(self):
+        self._index, self._anchors, self._density, self._main_color = None, None, {}, None
+
+    def circle(self, center: Tuple[int, int], radius: int, color, thickness: int = 1):
+        self._invalidate()
+        self.ops.append(('circle', (tuple(int(v) for v in center), int(radius), tuple(color), int(thickness))))
+
+    def line(self, pt1: Tuple[int, int], pt2: Tuple[int, int], color, thickness: int = 1):
+        self._invalidate()
+        self.ops.append(('line', (tuple(int(v) for v in pt1), tuple(int(v) for v in pt2), tuple(color), int(thickness))))
+
+    def text(self, text: str, org: Tuple[int, int], color, font_scale: float = 1):
+        self._invalidate()
+        self.ops.append(('text', (str(text), tuple(int(v) for v in org), tuple(color), float(font_scale))))
+
+    def contours(self, cnts: List[np.ndarray], color, thickness: int = 1):
+        self._invalidate()
+        # one op per contour, each with its own bounding rect (x, y, w, h), so they are culled and aggregated apart
+        for c in cnts:
+            pts = np.asarray(c).reshape(-1, 2)
+            if len(pts) > 0:
+                self.ops.append(('contour', (pts, tuple(color), int(thickness),
+                                             tuple(int(v) for v in cv2.boundingRect(pts.astype(np.int32))))))
+
+    def __len__(self):
+        return len(self.ops)
+
+    def _build_index(self):
+        bounds, anchors = np.zeros((len(self.ops), 4)), np.zeros((len(self.ops), 2))
+        for i, (kind, args) in enumerate(self.ops):
+            if kind == 'circle':
+                (x, y), radius, color, thickness = args
+                pad = radius + max(thickness, 0) / 2
+                bounds[i], anchors[i] = (x - pad, y - pad, x + pad, y + pad), (x, y)
+            elif kind == 'line':
+                (x0, y0), (x1, y1), color, thickness = args
+                pad = thickness / 2
+                bounds[i] = (min(x0, x1) - pad, min(y0, y1) - pad, max(x0, x1) + pad, max(y0, y1) + pad)
+                anchors[i] = (x0, y0)
+            elif kind == 'text':
+                text, (x, y), color, font_scale = args
+                # HERSHEY_SIMPLEX glyphs are roughly 20px wide and 22px tall at scale 1
+                bounds[i], anchors[i] = (x, y - 22 * font_scale, x + 20 * font_scale * len(text), y), (x, y)
+            elif kind == 'contour':
+                pts, color, thickness, (x, y, w, h) = args
+                pad = thickness / 2
+                bounds[i], anchors[i] = (x - pad, y - pad, x + w + pad, y + h + pad), (x + w / 2, y + h / 2)
+        self._index = GridIndex(bounds, OVERLAY_GRID_CELL)
+        self._anchors = anchors
+
+    @property
+    def index(self) -> GridIndex:
+        """ GRID INDEX OVER OP BOUNDING BOXES, QUERY IT WITH A VIEWPORT RECT TO CULL OFF-SCREEN OPS """
+        if self._index is None:
+            self._build_index()
+        return self._index
+
+    def visible(self, rect: Tuple[float, float, float, float]) -> np.ndarray:
+        """ IDS OF OPS INTERSECTING RECT (x0, y0, x1, y1), IN DRAW ORDER """
+        return self.index.query(rect)
+
+    def density(self, cell: int) -> np.ndarray:
+        """ 2D HISTOGRAM OF OP ANCHOR POINTS BINNED INTO cell x cell PX BUCKETS, FOR LOW ZOOM LEVELS """
+        if cell in self._density:
+            return self._density[cell]
+        if self._index is None:
+            self._build_index()
+        h, w = self.shape[:2]
+        grid = np.zeros((max(1, -(-h // cell)), max(1, -(-w // cell))), dtype=np.int32)
+        if len(self._anchors) > 0:
+            cols = np.clip(self._anchors[:, 0] // cell, 0, grid.shape[1] - 1).astype(np.int64)
+            rows = np.clip(self._anchors[:, 1] // cell, 0, grid.shape[0] - 1).astype(np.int64)
+            np.add.at(grid, (rows, cols), 1)
+        self._density[cell] = grid
+        return grid
+
+    def main_color(self) -> Tuple[int, int, int]:
+        """ MOST COMMON OP COLOR (BGR) """
+        if self._main_color is not None:
+            return self._main_color
+        colors = {}
+        for kind, args in self.ops:
+            color = args[-2] if kind in ('circle', 'line', 'text') else args[1]
+            key = tuple(int(c) for c in color[:3])
+            colors[key] = colors.get(key, 0) + 1
+        self._main_color = max(colors, key=colors.get) if colors else (255, 255, 255)
+        return self._main_color
+
+    def burn(self, img: np.ndarray) -> np.ndarray:
+        """ RASTERIZE ALL ANNOTATIONS ONTO IMG (IN PLACE) """
+        for kind, args in self.ops:
+            if kind == 'circle':
+                center, radius, color, thickness = args
+                cv2.circle(img, center, radius, color, thickness)
+            elif kind == 'line':
+                pt1, pt2, color, thickness = args
+                cv2.line(img, pt1, pt2, color, thickness)
+            elif kind == 'text':
+                text, org, color, font_scale = args
+                cv2.putText(img, text, org=org, fontFace=cv2.FONT_HERSHEY_SIMPLEX, color=color, fontScale=font_scale)
+            elif kind == 'contour':
+                pts, color, thickness, rect = args
+                cv2.drawContours(img, [pts.reshape(-1, 1, 2)], -1, color, thickness)
+        return img
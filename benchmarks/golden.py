@@ -0,0 +1,251 @@
+"""
+GOLDEN OUTPUT EQUIVALENCE
+___________________
+Runs the reference implementations (workflows/*.py and the reference intermediates in analysis.py) and a candidate
+engine setting on the same seeded synthetic datasets and compares every output frame within tolerance:
+    - cluster ids only have to agree up to a permutation (same partition), frames keyed by cluster are compared
+      after mapping the candidate's ids onto the reference's
+    - cluster areas may differ by AREA_RTOL, circles rasterized another way differ in a few boundary pixels
+    - ripples may cover PIXEL_EPS of the p-face area and PARTICLE_EPS particles differently, LCPI is checked against
+      the bound that leaves
+    - random coords only have to hold the sampler's guarantees (count, inside the p-face, minimum spacing), a
+      different sampler cannot reproduce the reference's draws
+    - everything else (distances, centroids, coordinates, counts) within DIST_ATOL
+Exits non-zero if any case differs, so it can gate switching DEFAULT_ENGINES.
+
+    python -m benchmarks.golden                                  checks DEFAULT_ENGINES
+    python -m benchmarks.golden --engine cluster_labels=NAME     checks one engine
+    python -m benchmarks.golden -c rippler --engine RIPPLER=NAME -p 1000 20000 -s 4096
+"""
+from registry import WORKFLOWS, check_engines
+from globals import DEFAULT_SEED, DEFAULT_ENGINES, DEFAULT_DISTANCE_THRESH
+from typing import Dict, List, Optional, Tuple
+from pipeline import load_coords, default_values, workflow_inputs, run_plugin
+from analysis import AnalysisContext
+from progress import ProgressReporter
+from workflows.random_coords import pface_mask_of
+from benchmarks.synthetic import make_dataset, read_random
+from benchmarks.run import CASES, DEFAULT_DATA_DIR
+from sklearn.neighbors import KDTree
+import pandas as pd
+import numpy as np
+import argparse
+import logging
+import json
+import cv2
+import sys
+
+# (particles, image size) pairs checked by default
+DEFAULT_SCALES: List[Tuple[int, int]] = [(1000, 2048), (5000, 4096)]
+DIST_ATOL = 1e-6
+AREA_RTOL = 0.02
+PIXEL_EPS = 1e-3
+PARTICLE_EPS = 2
+# problems reported per case
+MAX_PROBLEMS = 10
+# ripples covering less of the p-face than this get an LCPI of 0 (see gold_rippler.run_rippler)
+LCPI_MIN_COVER = 0.01
+
+
+def run_outputs(case: str, ds: Dict[str, str], engines: Dict[str, str], seed: int = DEFAULT_SEED) -> Dict[str, pd.DataFrame]:
+    """
+    OUTPUT FRAMES OF ONE CASE
+    __________________
+    @case: one of benchmarks.run.CASES
+    @ds: synthetic dataset, see synthetic.make_dataset
+    @engines: intermediate or workflow name -> engine, {} for the reference implementations
+    @seed: random coordinate seed
+    @return: frames by output name (real_df1, ..., or rand_coords for random coordinate generation)
+    """
+    coords, alt_coords = load_coords(ds['img'], ds['mask'], ds['csv'], ds['csv2'])
+    if CASES[case] is None:
+        ctx = AnalysisContext(coords, alt_coords, ds['img'], ds['mask'], engines=engines).with_random(len(coords), seed)
+        return {'rand_coords': pd.DataFrame(np.asarray(ctx.points('rand'), dtype=np.int64).reshape(-1, 2),
+                                            columns=['row', 'col'])}
+    name, clust_area = CASES[case]
+    wf = next(wf for wf in WORKFLOWS if wf['name'] == name)
+    rand_coords = read_random(ds['rand'])
+    ctx = AnalysisContext(coords, alt_coords, ds['img'], ds['mask'], rand_coords=rand_coords, engines=engines)
+    return run_plugin(wf, default_values(wf), workflow_inputs(coords, rand_coords, alt_coords, ds['img'], ds['mask'],
+                                                              clust_area, ctx),
+                      ProgressReporter(lambda update: None), engine=engines.get(name))
+
+
+def cluster_mapping(ref_ids: np.ndarray, cand_ids: np.ndarray) -> Tuple[Optional[Dict[int, int]], str]:
+    """ CANDIDATE ID -> REFERENCE ID IF BOTH LABELINGS ARE THE SAME PARTITION, ELSE (NONE, WHY NOT) """
+    if len(ref_ids) != len(cand_ids):
+        return None, f'{len(cand_ids)} labels, reference has {len(ref_ids)}'
+    pairs = set(zip(cand_ids.tolist(), ref_ids.tolist()))
+    mapping = dict(pairs)
+    if len(mapping) != len(pairs):
+        return None, 'a candidate cluster spans several reference clusters'
+    if len(set(mapping.values())) != len(mapping):
+        return None, 'a reference cluster is split over several candidate clusters'
+    return mapping, ''
+
+
+def _as_array(col: pd.Series) -> np.ndarray:
+    """ NUMBERS OR TUPLES OF NUMBERS AS A FLOAT ARRAY """
+    if col.dtype == object:
+        return np.array([list(v) if isinstance(v, (tuple, list, np.ndarray)) else [v] for v in col], dtype=np.float64)
+    return col.to_numpy(dtype=np.float64)
+
+
+def compare_rippler(ref: pd.DataFrame, cand: pd.DataFrame) -> List[str]:
+    """ RIPPLE COVERAGE AND CAPTURED PARTICLES WITHIN PIXEL_EPS / PARTICLE_EPS, LCPI WITHIN THE BOUND THEY LEAVE """
+    problems = []
+    for i in range(len(ref)):
+        r, c = ref.iloc[i], cand.iloc[i]
+        eps_g = PARTICLE_EPS / max(r['total_gp'], 1)
+        if r['radius'] != c['radius'] or r['total_gp'] != c['total_gp']:
+            problems.append(f'row {i}: radius/total_gp {c["radius"]}/{c["total_gp"]} != {r["radius"]}/{r["total_gp"]}')
+        if abs(r['%_img_covered'] - c['%_img_covered']) > PIXEL_EPS:
+            problems.append(f'row {i}: %_img_covered {c["%_img_covered"]:.6f} != {r["%_img_covered"]:.6f}')
+        if abs(r['%_gp_captured'] - c['%_gp_captured']) > eps_g + DIST_ATOL:
+            problems.append(f'row {i}: %_gp_captured {c["%_gp_captured"]:.6f} != {r["%_gp_captured"]:.6f}')
+        if abs(r['%_img_covered'] - LCPI_MIN_COVER) <= PIXEL_EPS:
+            # either side of the cut off is within tolerance
+            continue
+        bound = (eps_g + r['LCPI'] * PIXEL_EPS) / max(r['%_img_covered'] - PIXEL_EPS, PIXEL_EPS) + DIST_ATOL
+        if abs(r['LCPI'] - c['LCPI']) > bound:
+            problems.append(f'row {i}: LCPI {c["LCPI"]:.6f} != {r["LCPI"]:.6f} (bound {bound:.6f})')
+    return problems
+
+
+def compare_frame(name: str, ref: pd.DataFrame, cand: pd.DataFrame) -> List[str]:
+    """ PROBLEMS WITH cand AGAINST ref, CLUSTER IDS ALREADY MAPPED """
+    if set(ref.columns) != set(cand.columns):
+        return [f'{name}: columns {sorted(cand.columns)} != {sorted(ref.columns)}']
+    if len(ref) != len(cand):
+        return [f'{name}: {len(cand)} rows != {len(ref)}']
+    if len(ref) == 0:
+        return []
+    if 'LCPI' in ref.columns:
+        return [f'{name}: {p}' for p in compare_rippler(ref.reset_index(drop=True), cand.reset_index(drop=True))]
+    problems = []
+    for col in ref.columns:
+        a, b = _as_array(ref[col]), _as_array(cand[col])
+        if a.shape != b.shape:
+            problems.append(f'{name}.{col}: shape {b.shape} != {a.shape}')
+            continue
+        if col == 'cluster_area':
+            bad = np.abs(a - b) > AREA_RTOL * np.abs(a) + DIST_ATOL
+        else:
+            bad = np.abs(a - b) > DIST_ATOL
+        bad = bad.reshape(len(a), -1).any(axis=1)
+        if bad.any():
+            i = int(np.argmax(bad))
+            problems.append(f'{name}.{col}: {int(bad.sum())} rows differ, first row {i}: '
+                            f'{cand[col].iloc[i]} != {ref[col].iloc[i]}')
+    return problems
+
+
+def compare_outputs(ref: Dict[str, pd.DataFrame], cand: Dict[str, pd.DataFrame]) -> List[str]:
+    """ PROBLEMS WITH A CANDIDATE'S OUTPUT FRAMES AGAINST THE REFERENCE'S """
+    if set(ref) != set(cand):
+        return [f'outputs {sorted(cand)} != {sorted(ref)}']
+    problems = []
+    ref, cand = dict(ref), dict(cand)
+    for pop in ('real', 'rand'):
+        names = [name for name in sorted(ref) if name.startswith(pop) and 'cluster_id' in ref[name].columns]
+        labels = next((name for name in names if 'X' in ref[name].columns), None)
+        if labels is None:
+            continue
+        mapping, why = cluster_mapping(ref[labels]['cluster_id'].to_numpy(), cand[labels]['cluster_id'].to_numpy())
+        if mapping is None:
+            problems.append(f'{labels}: clusters differ, {why}')
+            continue
+        for name in names:
+            frame = cand[name].copy()
+            frame['cluster_id'] = [mapping.get(c, -1 - c) for c in frame['cluster_id']]
+            if name != labels:
+                # rows per cluster come in cluster id order, which is only equal up to the permutation
+                frame = frame.sort_values('cluster_id', kind='stable').reset_index(drop=True)
+                ref[name] = ref[name].sort_values('cluster_id', kind='stable').reset_index(drop=True)
+            cand[name] = frame
+    for name in sorted(ref):
+        problems += compare_frame(name, ref[name], cand[name])
+    return problems
+
+
+def check_random(ds: Dict[str, str], ref: pd.DataFrame, cand: pd.DataFrame) -> List[str]:
+    """ SAME DRAWS, OR AT LEAST THE SAME COUNT INSIDE THE P-FACE AND NO CLOSER THAN DEFAULT_DISTANCE_THRESH """
+    if ref.equals(cand):
+        return []
+    if len(cand) != len(ref):
+        return [f'rand_coords: {len(cand)} coords != {len(ref)}']
+    pts = cand.to_numpy()
+    mask = pface_mask_of(ds['mask'], cv2.imread(ds['img']).shape)
+    problems = []
+    outside = int(np.count_nonzero(mask[pts[:, 0], pts[:, 1]] == 0))
+    if outside > 0:
+        problems.append(f'rand_coords: {outside} coords outside the p-face')
+    if len(pts) > 1:
+        dists, _ = KDTree(pts.astype(np.float64)).query(pts.astype(np.float64), k=2)
+        closest = float(dists[:, 1].min())
+        if closest < DEFAULT_DISTANCE_THRESH:
+            problems.append(f'rand_coords: coords {closest:.2f}px apart, closer than {DEFAULT_DISTANCE_THRESH}px')
+    return problems
+
+
+def parse_engines(entries: List[str]) -> Dict[str, str]:
+    engines = {}
+    for entry in entries:
+        target, _, engine = entry.partition('=')
+        engines[target.strip()] = engine.strip()
+    return engines
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.golden',
+                                     description='Check engines against the reference implementations.')
+    parser.add_argument('--engine', action='append', default=[], metavar='TARGET=ENGINE',
+                        help='intermediate or workflow name and engine to check, repeatable (default: DEFAULT_ENGINES)')
+    parser.add_argument('-p', '--particles', type=int, nargs='+', help='particle counts, crossed with --sizes')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', help='image sizes (px), crossed with --particles')
+    parser.add_argument('-c', '--cases', nargs='+', choices=CASES, default=list(CASES), help='cases (default: all)')
+    parser.add_argument('--seed', type=int, default=1, help='synthetic dataset seed')
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help='synthetic datasets are kept here')
+    parser.add_argument('--report', default=None, help='also write the results to this json file')
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s', stream=sys.stdout)
+    engines = parse_engines(args.engine) if args.engine else dict(DEFAULT_ENGINES)
+    check_engines(engines)
+    if len(engines) == 0:
+        logging.warning('no engines given and DEFAULT_ENGINES is empty, checking the reference against itself')
+    logging.info('checking %s against the reference', engines)
+    scales = DEFAULT_SCALES
+    if args.particles or args.sizes:
+        scales = [(p, s) for s in (args.sizes or sorted({s for _, s in scales}))
+                  for p in (args.particles or sorted({p for p, _ in scales}))]
+    results, failed = [], 0
+    for particles, size in sorted(scales):
+        ds = make_dataset(args.data_dir, particles, size, args.seed)
+        for case in args.cases:
+            ref = run_outputs(case, ds, {})
+            cand = run_outputs(case, ds, engines)
+            if CASES[case] is None:
+                problems = check_random(ds, ref['rand_coords'], cand['rand_coords'])
+            else:
+                problems = compare_outputs(ref, cand)
+            results.append({'case': case, 'dataset': ds['name'], 'engines': engines, 'ok': len(problems) == 0,
+                            'problems': problems})
+            if len(problems) == 0:
+                logging.info('%s %s: matches', case, ds['name'])
+            else:
+                failed += 1
+                logging.error('%s %s: %d differences\n  %s', case, ds['name'], len(problems),
+                              '\n  '.join(problems[:MAX_PROBLEMS]))
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(results, f, indent=2)
+    logging.info('%d of %d cases match the reference', len(results) - failed, len(results))
+    return 1 if failed > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
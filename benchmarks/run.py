@@ -0,0 +1,246 @@
+"""
+BENCHMARK SUITE
+___________________
+Times every workflow's analysis, graph and drawing (plus random coordinate generation) on synthetic datasets from 1k
+to 1M particles and up to 20k x 20k images, see benchmarks/synthetic.py. Each case runs in a fresh process with a
+time limit, so one slow or out of memory case does not take the suite down, and larger scales of a case that failed
+are skipped. Results are appended to a json lines history and compared against the previous run of the same case.
+
+Runs headless from the repository root:
+    python -m benchmarks.run                       quick preset
+    python -m benchmarks.run --preset full         every scale, takes hours with the current engines
+    python -m benchmarks.run -c nnd clust_area -p 1000 100000 -s 4096
+"""
+from registry import WORKFLOWS
+from globals import DEFAULT_SEED
+from typings import DataObj
+from typing import Dict, List, Optional, Tuple
+from pipeline import load_coords, default_values, workflow_inputs, run_plugin, finalize_data, layer_drawers
+from analysis import AnalysisContext
+from annotations import AnnotationLayer
+from graphs import render_graph
+from progress import ProgressReporter
+from timing import RunTimings, span, max_rss_mb
+from utils import create_color_pal
+from workflows.random_coords import gen_random_coordinates
+from benchmarks.synthetic import make_dataset, read_random
+import multiprocessing as mp
+import pandas as pd
+import subprocess
+import platform
+import datetime
+import argparse
+import logging
+import json
+import time
+import sys
+import os
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATA_DIR = os.path.join(BENCH_DIR, 'data')
+DEFAULT_HISTORY = os.path.join(BENCH_DIR, 'history.jsonl')
+
+# (particles, image size) pairs
+PRESETS: Dict[str, List[Tuple[int, int]]] = {
+    'quick': [(1000, 2048), (10000, 4096)],
+    'full': [(1000, 2048), (10000, 5000), (100000, 10000), (1000000, 20000)],
+}
+# case -> (workflow name, compute cluster areas), None for random coordinate generation
+CASES: Dict[str, Optional[Tuple[str, bool]]] = {
+    'random_coords': None,
+    **{wf['name'].lower(): (wf['name'], False) for wf in WORKFLOWS},
+    'clust_area': ('CLUST', True),
+}
+# slower than the previous run of a case by more than this factor counts as a regression
+REGRESSION_FACTOR = 1.25
+# stages too short to compare reliably
+MIN_COMPARE_SECS = 0.05
+# seconds a case process may take to import everything before its time limit starts
+STARTUP_SECS = 120
+
+
+def run_case(case: str, ds: Dict[str, str], size: int, seed: int = DEFAULT_SEED) -> dict:
+    """
+    RUN ONE BENCHMARK CASE IN THIS PROCESS
+    __________________
+    @case: one of CASES
+    @ds: synthetic dataset, see synthetic.make_dataset
+    @size: image width and height, annotation layers are drawn at it
+    @seed: random coordinate seed
+    @return: seconds per stage path (see timing.RunTimings.stages), peak memory and result sizes
+    """
+    timings = RunTimings(case)
+    rows = {}
+    with timings.activate():
+        with span('load'):
+            coords, alt_coords = load_coords(ds['img'], ds['mask'], ds['csv'], ds['csv2'])
+        if CASES[case] is None:
+            with span('analysis'):
+                rows['rand'] = len(gen_random_coordinates(ds['img'], ds['mask'], count=len(coords), seed=seed))
+        else:
+            name, clust_area = CASES[case]
+            wf = next(wf for wf in WORKFLOWS if wf['name'] == name)
+            vals = default_values(wf)
+            # pre-drawn random coords, generating them is its own case
+            rand_coords = read_random(ds['rand'])
+            ctx = AnalysisContext(coords, alt_coords, ds['img'], ds['mask'], rand_coords=rand_coords)
+            with span('analysis'):
+                outputs = run_plugin(wf, vals, workflow_inputs(coords, rand_coords, alt_coords, ds['img'], ds['mask'],
+                                                               clust_area, ctx), ProgressReporter(lambda update: None))
+            data = DataObj(*[outputs.get(key, pd.DataFrame()) for key in ('real_df1', 'real_df2', 'rand_df1', 'rand_df2')],
+                           rand_coords=rand_coords)
+            rows = {key: len(df) for key, df in outputs.items()}
+            finalize_data(wf, data, 1.0)
+            with span('graph'):
+                graph, n = render_graph(wf, data.final_real, data.final_rand, show_real=True, show_rand=True,
+                                        pal_type='rocket_r', r_pal_type='mako', n_bins='fd')
+            with span('draw'):
+                drawers = layer_drawers(wf, data, n, create_color_pal(n_bins=int(len(n)), palette_type='rocket_r'),
+                                        create_color_pal(n_bins=int(len(n)), palette_type='mako'), vals,
+                                        coords=coords, rand_coords=rand_coords, alt_coords=alt_coords,
+                                        mask_path=ds['mask'], clust_area=clust_area)
+                for draw in drawers.values():
+                    draw(layer=AnnotationLayer((size, size, 3)))
+    return {'stages': {path: stage['secs'] for path, stage in timings.stages().items()},
+            'peak_mb': max_rss_mb(), 'rows': rows}
+
+
+def _case_entry(conn, case: str, ds: Dict[str, str], size: int, seed: int):
+    logging.basicConfig(level=logging.WARNING)
+    # imports are done, the case's time limit starts now
+    conn.send(('ready', None))
+    try:
+        conn.send(('ok', run_case(case, ds, size, seed)))
+    except Exception as e:
+        conn.send(('error', f'{type(e).__name__}: {e}'))
+    conn.close()
+
+
+def run_isolated(case: str, ds: Dict[str, str], size: int, seed: int, timeout: float) -> Tuple[str, dict]:
+    """ run_case IN A FRESH PROCESS, RETURNS (STATUS, RESULT): ok, error, timeout OR crashed """
+    ctx = mp.get_context('spawn')
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_case_entry, args=(send, case, ds, size, seed), daemon=True)
+    start = time.perf_counter()
+    proc.start()
+    send.close()
+    result = None
+    try:
+        if recv.poll(STARTUP_SECS) and recv.recv()[0] == 'ready':
+            start = time.perf_counter()
+            if recv.poll(timeout):
+                result = recv.recv()
+    except EOFError:
+        pass
+    secs = time.perf_counter() - start
+    proc.join(5)
+    if proc.is_alive():
+        proc.kill()
+        proc.join()
+    if result is not None:
+        status, payload = result
+        return status, payload if status == 'ok' else {'error': payload, 'secs': secs}
+    if secs >= timeout:
+        return 'timeout', {'secs': secs}
+    # no result and no timeout: killed, most likely for running out of memory
+    return 'crashed', {'exitcode': proc.exitcode, 'secs': secs}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, capture_output=True, text=True,
+                              timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def host_info() -> dict:
+    return {'node': platform.node(), 'machine': platform.machine(), 'cpus': os.cpu_count(),
+            'python': platform.python_version(), 'platform': platform.platform(terse=True)}
+
+
+def read_history(path: str) -> List[dict]:
+    if not os.path.isfile(path):
+        return []
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(record: dict, history: List[dict]) -> List[str]:
+    """ STAGES OF record SLOWER THAN THE PREVIOUS OK RUN OF THE SAME CASE, DATASET AND HOST BY REGRESSION_FACTOR """
+    prev = [r for r in history if r['status'] == 'ok' and r['case'] == record['case'] and
+            r['dataset'] == record['dataset'] and r['host']['node'] == record['host']['node'] and
+            r['run'] != record['run']]
+    if len(prev) == 0 or record['status'] != 'ok':
+        return []
+    prev = prev[-1]
+    slower = []
+    for path, secs in record['stages'].items():
+        before = prev['stages'].get(path)
+        if before is not None and max(secs, before) >= MIN_COMPARE_SECS and secs > before * REGRESSION_FACTOR:
+            slower.append(f'{path} {before:.3f}s -> {secs:.3f}s ({prev["commit"] or prev["run"]})')
+    return slower
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description='Gold In-and-Out benchmarks.')
+    parser.add_argument('--preset', choices=PRESETS, default='quick', help='scales to run (default: quick)')
+    parser.add_argument('-p', '--particles', type=int, nargs='+', help='particle counts, crossed with --sizes')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', help='image sizes (px), crossed with --particles')
+    parser.add_argument('-c', '--cases', nargs='+', choices=CASES, default=list(CASES), help='cases (default: all)')
+    parser.add_argument('--seed', type=int, default=1, help='synthetic dataset seed')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per case')
+    parser.add_argument('--timeout', type=float, default=600, help='seconds a case may take')
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help='synthetic datasets are kept here')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='json lines file results are appended to')
+    parser.add_argument('--fail-on-regression', action='store_true', help='exit 1 if any stage regressed')
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s', stream=sys.stdout)
+    scales = PRESETS[args.preset]
+    if args.particles or args.sizes:
+        scales = [(p, s) for s in (args.sizes or sorted({s for _, s in scales}))
+                  for p in (args.particles or sorted({p for p, _ in scales}))]
+    scales = sorted(scales)
+    history = read_history(args.history)
+    run_id = datetime.datetime.now().isoformat(timespec='seconds')
+    base = {'run': run_id, 'commit': git_commit(), 'host': host_info()}
+    # smallest scale each case failed at, larger ones are not attempted
+    failed_at: Dict[str, Tuple[int, int]] = {}
+    regressions = 0
+    for particles, size in scales:
+        ds = make_dataset(args.data_dir, particles, size, args.seed)
+        for case in args.cases:
+            for i in range(args.repeat):
+                record = {**base, 'case': case, 'dataset': ds['name'], 'particles': particles, 'size': size,
+                          'repeat': i}
+                fail = failed_at.get(case)
+                if fail is not None and fail[0] <= particles and fail[1] <= size:
+                    status, result = 'skipped', {'after': f'p{fail[0]}_s{fail[1]}'}
+                else:
+                    status, result = run_isolated(case, ds, size, DEFAULT_SEED, args.timeout)
+                    if status != 'ok':
+                        failed_at.setdefault(case, (particles, size))
+                record.update(status=status, stages=result.pop('stages', {}), **result)
+                with open(args.history, 'a') as f:
+                    f.write(json.dumps(record) + '\n')
+                if status == 'ok':
+                    stages = record['stages']
+                    logging.info('%s %s: analysis %.3fs, graph %.3fs, draw %.3fs, peak %.0f MB', case, ds['name'],
+                                 stages.get('analysis', 0), stages.get('graph', 0), stages.get('draw', 0),
+                                 record['peak_mb'] or 0)
+                else:
+                    logging.warning('%s %s: %s %s', case, ds['name'], status, result)
+                for slower in compare(record, history):
+                    regressions += 1
+                    logging.warning('%s %s: regression %s', case, ds['name'], slower)
+                history.append(record)
+    logging.info('benchmarks appended to %s, %d regressions', args.history, regressions)
+    return 1 if args.fail_on_regression and regressions > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
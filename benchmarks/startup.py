@@ -0,0 +1,105 @@
+"""
+STARTUP BENCHMARK
+___________________
+Times a cold start of the interface in fresh interpreters: importing main, then building and showing the main window.
+Also lists the heavy modules already loaded when the window shows, which should be none of LAZY_MODULES (they load on
+first use, see README). Results go into the same history as benchmarks/run.py as case 'startup'.
+
+Runs headless from the repository root:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --fail-on-regression
+"""
+from benchmarks.run import DEFAULT_HISTORY, git_commit, host_info, read_history, compare
+from typing import List
+import subprocess
+import statistics
+import datetime
+import argparse
+import logging
+import json
+import time
+import sys
+import os
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# modules that must not be imported before the window shows. Not listed as they load with the window on purpose:
+# numexpr and pyarrow, which pandas imports itself if installed (the data types need pandas), and cv2 (~15ms), which
+# the analysis modules the window builds on import at module level
+LAZY_MODULES: List[str] = ['sklearn', 'scipy', 'seaborn', 'matplotlib']
+# seconds a single start may take before it counts as hung
+START_TIMEOUT = 120
+
+# runs in the fresh interpreter, prints one json line
+_CHILD = '''
+import time, sys, json, os
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+app.setStyleSheet(main.styles)
+app.setStyle("fusion")
+main.load_resources()
+gui = main.GoldInAndOut()
+gui.show()
+app.processEvents()
+shown = time.perf_counter()
+print(json.dumps({'shown_at': time.time(), 'import': imported - start, 'window': shown - imported,
+                  'loaded': [m for m in %r if m in sys.modules]}), flush=True)
+# skip tearing the window down
+os._exit(0)
+'''
+
+
+def start_once() -> dict:
+    """ ONE COLD START, SECONDS PER STEP ('total' INCLUDES STARTING THE INTERPRETER) AND THE LAZY MODULES LOADED """
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    began = time.time()
+    out = subprocess.run([sys.executable, '-c', _CHILD % LAZY_MODULES], cwd=REPO_DIR, env=env, capture_output=True,
+                         text=True, timeout=START_TIMEOUT)
+    lines = [line for line in out.stdout.splitlines() if line.startswith('{')]
+    if out.returncode != 0 or len(lines) == 0:
+        raise RuntimeError(f'start failed ({out.returncode}):\n{out.stderr[-2000:]}')
+    result = json.loads(lines[-1])
+    return {'stages': {'import': result['import'], 'window': result['window'], 'total': result['shown_at'] - began},
+            'loaded': result['loaded']}
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup', description='Gold In-and-Out startup time.')
+    parser.add_argument('--runs', type=int, default=5, help='cold starts, the median is recorded')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='json lines file results are appended to')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit 1 if startup regressed or a lazy module loads before the window shows')
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s', stream=sys.stdout)
+    # the first start warms the os file cache, it is not counted
+    start_once()
+    runs = [start_once() for _ in range(max(1, args.runs))]
+    stages = {stage: statistics.median(run['stages'][stage] for run in runs) for stage in runs[0]['stages']}
+    loaded = sorted({module for run in runs for module in run['loaded']})
+    record = {'run': datetime.datetime.now().isoformat(timespec='seconds'), 'commit': git_commit(),
+              'host': host_info(), 'case': 'startup', 'dataset': '-', 'runs': len(runs), 'status': 'ok',
+              'stages': stages, 'loaded': loaded}
+    history = read_history(args.history)
+    with open(args.history, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+    logging.info('startup (median of %d): import %.2fs, window %.2fs, total %.2fs', len(runs), stages['import'],
+                 stages['window'], stages['total'])
+    failed = False
+    if len(loaded) > 0:
+        failed = True
+        logging.warning('loaded before the window shows: %s', ', '.join(loaded))
+    for slower in compare(record, history):
+        failed = True
+        logging.warning('startup: regression %s', slower)
+    return 1 if args.fail_on_regression and failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
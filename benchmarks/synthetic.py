@@ -0,0 +1,127 @@
+from typing import Dict, List
+from output import write_tiff
+import pandas as pd
+import numpy as np
+import logging
+import json
+import cv2
+import os
+
+"""
+SYNTHETIC DATASETS
+___________________
+Montages, p-face masks, gold particles and landmarks at any scale, written in the same formats a real dataset comes
+in (3 channel tiffs, X/Y csvs in px) so benchmarks exercise the real loading path. Everything is derived from a seed,
+a dataset is generated once and reused from its folder afterwards.
+    - image: flat grey with a tiled noise texture (content never changes a workflow's cost)
+    - mask: p-face (black) blobs on white, covering about half of the image
+    - gold: clustered inside the p-face (gaussian clusters around uniform centres) plus uniform background particles
+    - landmarks: uniform inside the p-face
+    - random: uniform inside the p-face, stands in for generated random coords so workflows can be timed on their own
+"""
+
+# particles per gaussian cluster on average, and the spread of a cluster (px)
+CLUSTER_SIZE = 8
+CLUSTER_SIGMA = 12
+# share of gold particles that are not part of a cluster
+BACKGROUND_SHARE = 0.3
+# particles per landmark
+PARTICLES_PER_LANDMARK = 100
+
+
+def dataset_name(particles: int, size: int, seed: int) -> str:
+    return f'p{particles}_s{size}_seed{seed}'
+
+
+def make_image(size: int, seed: int) -> np.ndarray:
+    """ size x size BGR MONTAGE """
+    rng = np.random.default_rng(seed)
+    tile = rng.integers(150, 230, (256, 256), dtype=np.uint8)
+    reps = -(-size // 256)
+    grey = np.tile(tile, (reps, reps))[:size, :size]
+    return np.repeat(grey[:, :, None], 3, axis=2)
+
+
+def make_mask(size: int, seed: int) -> np.ndarray:
+    """ size x size BGR MASK, P-FACE BLACK ON WHITE """
+    rng = np.random.default_rng(seed + 1)
+    mask = np.full((size, size, 3), 255, dtype=np.uint8)
+    # overlapping ellipses until about half the image is p-face
+    covered, target = 0, size * size // 2
+    while covered < target:
+        centre = tuple(int(v) for v in rng.integers(0, size, 2))
+        axes = tuple(int(v) for v in rng.integers(size // 20 + 1, size // 5 + 2, 2))
+        cv2.ellipse(mask, centre, axes, float(rng.uniform(0, 180)), 0, 360, (0, 0, 0), -1)
+        covered = int(np.count_nonzero(mask[::8, ::8, 0] == 0)) * 64
+    return mask
+
+
+def points_in(inside: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """ count UNIFORM (ROW, COL) POINTS WHERE inside IS TRUE """
+    pts = np.empty((0, 2), dtype=np.int64)
+    h, w = inside.shape
+    while len(pts) < count:
+        cand = np.stack([rng.integers(1, h - 1, count * 2), rng.integers(1, w - 1, count * 2)], axis=1)
+        pts = np.concatenate([pts, cand[inside[cand[:, 0], cand[:, 1]]]])
+    return pts[:count]
+
+
+def clustered_points(inside: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """ count (ROW, COL) POINTS INSIDE, MOSTLY IN GAUSSIAN CLUSTERS """
+    n_background = int(count * BACKGROUND_SHARE)
+    n_clustered = count - n_background
+    centres = points_in(inside, max(1, n_clustered // CLUSTER_SIZE), rng)
+    h, w = inside.shape
+    pts = np.empty((0, 2), dtype=np.int64)
+    while len(pts) < n_clustered:
+        around = centres[rng.integers(0, len(centres), n_clustered)]
+        cand = np.rint(around + rng.normal(0, CLUSTER_SIGMA, around.shape)).astype(np.int64)
+        cand = cand[(cand[:, 0] > 0) & (cand[:, 0] < h - 1) & (cand[:, 1] > 0) & (cand[:, 1] < w - 1)]
+        pts = np.concatenate([pts, cand[inside[cand[:, 0], cand[:, 1]]]])
+    return np.concatenate([pts[:n_clustered], points_in(inside, n_background, rng)])
+
+
+def write_csv(pts: np.ndarray, path: str):
+    """ (ROW, COL) POINTS AS AN X,Y CSV LIKE THE ONES EXPORTED FROM IMAGEJ """
+    pd.DataFrame({'X': pts[:, 1], 'Y': pts[:, 0]}).to_csv(path, index=False)
+
+
+def make_dataset(root: str, particles: int, size: int, seed: int = 1) -> Dict[str, str]:
+    """
+    GENERATE (OR REUSE) A SYNTHETIC DATASET
+    __________________
+    @root: folder datasets are kept in, each in its own sub folder
+    @particles: gold particles
+    @size: image width and height (px)
+    @seed: seed everything is derived from
+    @return: dataset files keyed img, mask, csv, csv2 and rand plus a name, like utils.match_dataset_files
+    """
+    name = dataset_name(particles, size, seed)
+    folder = os.path.join(root, name)
+    ds = {'name': name, 'img': os.path.join(folder, 'synthetic_image.tif'),
+          'mask': os.path.join(folder, 'synthetic_mask.tif'), 'csv': os.path.join(folder, 'synthetic_gold.csv'),
+          'csv2': os.path.join(folder, 'synthetic_landmark.csv'), 'rand': os.path.join(folder, 'synthetic_random.csv')}
+    done = os.path.join(folder, 'dataset.json')
+    if os.path.isfile(done):
+        return ds
+    logging.info('generating synthetic dataset %s', name)
+    os.makedirs(folder, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    write_tiff(make_image(size, seed), ds['img'])
+    mask = make_mask(size, seed)
+    write_tiff(mask, ds['mask'])
+    inside = mask[:, :, 0] == 0
+    del mask
+    write_csv(clustered_points(inside, particles, rng), ds['csv'])
+    write_csv(points_in(inside, max(1, particles // PARTICLES_PER_LANDMARK), rng), ds['csv2'])
+    write_csv(points_in(inside, particles, rng), ds['rand'])
+    # written last, a half generated dataset is generated again
+    with open(done, 'w') as f:
+        json.dump({'particles': particles, 'size': size, 'seed': seed}, f)
+    return ds
+
+
+def read_random(path: str) -> List[np.ndarray]:
+    """ RANDOM COORDS IN THE FORM random_coords.random_points RETURNS THEM ([ROW, COL] INT ARRAYS) """
+    df = pd.read_csv(path)
+    return [np.array([y, x]) for x, y in zip(df['X'].to_numpy(), df['Y'].to_numpy())]
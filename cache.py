@@ -0,0 +1,191 @@
+from globals import CACHE_DIR, CACHE_MAX_MB, VERSION_NUMBER
+from output import atomic_write
+from typings import DataObj, Workflow
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import threading
+import hashlib
+import logging
+import pickle
+import json
+import time
+import sys
+import os
+
+_cache = None
+_cache_lock = threading.Lock()
+# file digests memoized by (size, mtime) so every workflow of a run does not re-hash the same image
+_digests: Dict[str, Tuple[int, int, str]] = {}
+_digests_lock = threading.Lock()
+
+
+def default_cache_dir() -> str:
+    """ CACHE_DIR, OR THE PLATFORM'S PER USER CACHE FOLDER, NEVER RELATIVE TO WHERE THE APP WAS STARTED """
+    if CACHE_DIR:
+        return os.path.abspath(os.path.expanduser(CACHE_DIR))
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~/AppData/Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'GoldInAndOut', 'results')
+
+
+def file_digest(path: str) -> str:
+    """ SHA256 OF FILE CONTENTS ('' FOR NO FILE) """
+    if not path:
+        return ''
+    stat = os.stat(path)
+    with _digests_lock:
+        memo = _digests.get(path)
+        if memo is not None and memo[:2] == (stat.st_size, stat.st_mtime_ns):
+            return memo[2]
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    with _digests_lock:
+        _digests[path] = (stat.st_size, stat.st_mtime_ns, sha.hexdigest())
+    return sha.hexdigest()
+
+
+class ResultCache:
+    """
+    RESULT CACHE
+    __________________
+    @cache_dir: folder holding one pickled DataObj per key, plus a small json sidecar describing it, see default_cache_dir
+    @max_bytes: total size the cache is trimmed back to after every put, least recently used entries go first
+
+    Content addressed: keys hash the input file contents and everything else a run depends on, so editing an input
+    or a param simply misses, and stale entries age out through eviction.
+    """
+    def __init__(self, cache_dir: str = None, max_bytes: int = int(CACHE_MAX_MB * 2 ** 20)):
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(wf_type: Workflow, vals: list, seed: Optional[int], files: List[str], arrays: List[list],
+            **params) -> str:
+        """
+        BUILD CACHE KEY
+        __________________
+        @wf_type: workflow being run
+        @vals: workflow props (get_custom_values)
+        @seed: random coordinate seed
+        @files: input files (image, mask, ...) hashed by content
+        @arrays: coordinate lists loaded from the csvs (already converted to px, so the input scalar is covered)
+        @params: any other values the results depend on (e.g. random coord count, cluster area)
+        """
+        sha = hashlib.sha256()
+        head = {'version': VERSION_NUMBER, 'wf': wf_type.name, 'vals': [str(v) for v in vals], 'seed': seed,
+                'files': [file_digest(f) for f in files], 'params': {k: str(v) for k, v in sorted(params.items())}}
+        sha.update(json.dumps(head, sort_keys=True).encode())
+        for arr in arrays:
+            sha.update(np.asarray(arr if arr is not None else [], dtype=np.float64).tobytes())
+            sha.update(b'|')
+        return sha.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.pkl')
+
+    def get(self, key: str) -> Optional[DataObj]:
+        """ CACHED RESULTS FOR KEY, OR NONE ON A MISS """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            # bump mtime, eviction is least recently used first
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logging.warning('dropping unreadable cache entry %s', key)
+            self.invalidate(key)
+            return None
+
+    def put(self, key: str, data: DataObj, meta: dict = None):
+        """ STORE RESULTS UNDER KEY, THEN EVICT DOWN TO max_bytes """
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        def _write(tmp: str):
+            with open(tmp, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def _write_meta(tmp: str):
+            with open(tmp, 'w') as f:
+                json.dump({'created': time.time(), **(meta or {})}, f, default=str)
+        atomic_write(os.path.join(self.cache_dir, f'{key}.json'), _write_meta)
+        atomic_write(self._path(key), _write)
+        self.evict()
+
+    def entries(self) -> List[Tuple[str, int, float]]:
+        """ (KEY, BYTES, LAST USED) OF EVERY ENTRY, LEAST RECENTLY USED FIRST """
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for f in os.listdir(self.cache_dir):
+            if f.endswith('.pkl') and not f.startswith('.'):
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, f))
+                    entries.append((f[:-4], stat.st_size, stat.st_mtime))
+                except FileNotFoundError:
+                    pass
+        return sorted(entries, key=lambda e: e[2])
+
+    def evict(self, max_bytes: int = None) -> List[str]:
+        """ DELETE LEAST RECENTLY USED ENTRIES UNTIL THE CACHE FITS, RETURNS EVICTED KEYS """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        with self.lock:
+            entries = self.entries()
+            total = sum(e[1] for e in entries)
+            evicted = []
+            for key, size, used in entries:
+                if total <= max_bytes:
+                    break
+                self.invalidate(key)
+                total -= size
+                evicted.append(key)
+        if len(evicted) > 0:
+            logging.info('evicted %d cached results', len(evicted))
+        return evicted
+
+    def invalidate(self, key: str) -> bool:
+        """ DROP A SINGLE ENTRY, TRUE IF IT EXISTED """
+        existed = False
+        for path in (self._path(key), os.path.join(self.cache_dir, f'{key}.json')):
+            try:
+                os.remove(path)
+                existed = True
+            except FileNotFoundError:
+                pass
+        return existed
+
+    def invalidate_inputs(self, *paths: str) -> int:
+        """ DROP EVERY ENTRY COMPUTED FROM ANY OF THE GIVEN INPUT FILE PATHS, RETURNS NUMBER DROPPED """
+        paths = {os.path.abspath(p) for p in paths if p}
+        dropped = 0
+        for key, size, used in self.entries():
+            try:
+                with open(os.path.join(self.cache_dir, f'{key}.json'), 'r') as f:
+                    inputs = json.load(f).get('inputs', [])
+            except (FileNotFoundError, ValueError):
+                continue
+            if paths.intersection(os.path.abspath(p) for p in inputs if p):
+                dropped += self.invalidate(key)
+        return dropped
+
+    def clear(self) -> int:
+        """ DROP EVERYTHING, RETURNS NUMBER OF ENTRIES DROPPED """
+        return sum(self.invalidate(key) for key, size, used in self.entries())
+
+
+def get_cache() -> ResultCache:
+    """ SHARED RESULT CACHE, CREATED ON FIRST USE """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache()
+        return _cache
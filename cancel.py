@@ -0,0 +1,34 @@
+from typing import Optional
+import threading
+
+
+class Cancelled(Exception):
+    """ RAISED BY CancelToken.check ONCE THE RUN IT BELONGS TO WAS CANCELLED OR SUPERSEDED """
+
+
+class CancelToken:
+    """
+    CANCEL TOKEN
+    __________________
+    @parent: token whose cancellation cancels this one too (e.g. every page's run under the loaded dataset's token)
+    @event: anything with set() and is_set(), e.g. a multiprocessing.Manager().Event() to reach worker processes.
+        Defaults to a threading.Event
+
+    Cooperative cancellation: the owner of a run calls cancel(), the run calls check() at chunk boundaries and
+    unwinds with Cancelled, leaving nothing half written behind.
+    """
+    def __init__(self, parent: Optional['CancelToken'] = None, event=None):
+        self.parent = parent
+        self.event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    def check(self):
+        """ RAISE Cancelled IF THE RUN WAS CANCELLED """
+        if self.cancelled:
+            raise Cancelled()
@@ -0,0 +1,211 @@
+"""
+HEADLESS BATCH RUNNER
+___________________
+Runs the selected workflows over one or more datasets without opening the GUI and writes the same output tree a GUI
+run does (tables, graph, drawn image and run manifest per workflow). Every dataset x workflow pair is a separate job
+run in parallel worker processes, see scheduler.BatchScheduler.
+
+Each input is either
+    - a dataset folder, files are picked by name like the home page's folder picker ('image', 'mask', 'gold' and
+      'landmark' in the file names),
+    - a folder of dataset folders, or
+    - a dataset manifest (.csv or .json) with image, mask, gold and optional landmark columns/keys, paths relative
+      to the manifest's folder, plus an optional name.
+
+e.g. python cli.py ./data/run1 ./data/batch -o ./output -w nnd clust --prop "distance threshold (px)=30"
+"""
+from registry import WORKFLOWS, analysis_plan
+from globals import UNIT_OPS, UNIT_PX_SCALARS, PALETTE_OPS, OUTPUT_FORMATS, TIFF_COMPRESSIONS, DEFAULT_OUTPUT_DIR, \
+    DEFAULT_SEED, MAX_DIRS_PRUNE
+from typings import BatchOptions, OutputOptions, WorkflowObj
+from typing import Dict, List, Optional
+from utils import match_dataset_files, unit_to_enum
+from pipeline import default_values
+from scheduler import BatchJob, BatchScheduler
+import pandas as pd
+import argparse
+import logging
+import json
+import sys
+import os
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    names = [wf['name'].lower() for wf in WORKFLOWS]
+    parser = argparse.ArgumentParser(prog='cli.py', description='Run Gold In-and-Out workflows without the GUI.')
+    parser.add_argument('inputs', nargs='+', help='dataset folders, folders of dataset folders or dataset manifests')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help='output folder')
+    parser.add_argument('-w', '--workflows', nargs='+', choices=names, default=names, metavar='WF',
+                        help=f'workflows to run, any of {", ".join(names)} (default: all)')
+    parser.add_argument('--in-unit', choices=UNIT_OPS, default='px', help='unit of the input csvs')
+    parser.add_argument('--in-scalar', type=float, default=None,
+                        help='input units per px (1px = N units), default: the unit\'s usual scalar, e.g. 0.888 for nm')
+    parser.add_argument('--out-unit', choices=UNIT_OPS, default=None, help='output unit (default: input unit)')
+    parser.add_argument('--out-scalar', type=float, default=None,
+                        help='output units per px (1px = N units), default: the input scalar for the same unit, '
+                             'else the unit\'s usual scalar')
+    parser.add_argument('--prop', action='append', default=[], metavar='NAME=VALUE',
+                        help='workflow prop by its title, e.g. "distance threshold (px)=30", or WF:NAME=VALUE for a '
+                             'single workflow. Repeatable')
+    parser.add_argument('--rand-count', type=int, default=None, help='random coords (default: as many as gold coords)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='random coordinate seed')
+    parser.add_argument('--bins', default='fd', help='hist bins: a count, [edges] or a numpy estimator name')
+    parser.add_argument('--palette', choices=PALETTE_OPS, default='rocket_r', help='real palette')
+    parser.add_argument('--rand-palette', choices=PALETTE_OPS, default='mako', help='random palette')
+    parser.add_argument('--show-random', action='store_true', help='graph and draw the random population too')
+    parser.add_argument('--clust-area', action='store_true', help='compute and draw cluster areas')
+    parser.add_argument('--formats', nargs='+', choices=OUTPUT_FORMATS, default=['csv'], help='table formats')
+    parser.add_argument('--tiff', choices=TIFF_COMPRESSIONS, default='deflate', help='drawn image compression')
+    parser.add_argument('--no-image', action='store_true', help='skip the drawn image')
+    parser.add_argument('--no-cache', action='store_true', help='always recompute, never reuse cached results')
+    parser.add_argument('--delete-old', action='store_true', help='prune old runs after writing')
+    parser.add_argument('--keep-runs', type=int, default=MAX_DIRS_PRUNE, help='runs kept when pruning')
+    parser.add_argument('--keep-days', type=float, default=None, help='prune runs older than this')
+    parser.add_argument('--keep-mb', type=float, default=None, help='prune oldest runs beyond this total size')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='dataset x workflow jobs run in parallel processes (default: one per core)')
+    parser.add_argument('--max-memory-mb', type=float, default=None,
+                        help='memory budget jobs are admitted against, larger jobs fall back to low memory engines '
+                             '(default: half of physical memory)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='trace allocations and sample resident memory, per stage peaks go into timings.json')
+    parser.add_argument('-q', '--quiet', action='store_true', help='only log warnings and errors')
+    args = parser.parse_args(argv)
+    # like the home page, a unit comes with its usual scalar unless one is given
+    args.out_unit = args.out_unit or args.in_unit
+    if args.in_scalar is None:
+        args.in_scalar = UNIT_PX_SCALARS[args.in_unit]
+    if args.out_scalar is None:
+        args.out_scalar = args.in_scalar if args.out_unit == args.in_unit else UNIT_PX_SCALARS[args.out_unit]
+    for entry in args.prop:
+        problem = check_prop(entry, [wf for wf in WORKFLOWS if wf['name'].lower() in args.workflows])
+        if problem is not None:
+            parser.error(f'--prop {entry!r}: {problem}')
+    return args
+
+
+def read_dataset_manifest(path: str) -> List[Dict[str, str]]:
+    """ DATASETS LISTED IN A .CSV OR .JSON MANIFEST, PATHS RESOLVED AGAINST THE MANIFEST'S FOLDER """
+    if path.lower().endswith('.json'):
+        with open(path, 'r') as f:
+            rows = json.load(f)
+        rows = rows.get('datasets', []) if isinstance(rows, dict) else rows
+    else:
+        rows = pd.read_csv(path, dtype=str).fillna('').to_dict('records')
+    root = os.path.dirname(os.path.abspath(path))
+    datasets = []
+    for i, row in enumerate(rows):
+        ds = {key: os.path.join(root, row[col]) if row.get(col) else ''
+              for key, col in (('img', 'image'), ('mask', 'mask'), ('csv', 'gold'), ('csv2', 'landmark'))}
+        ds['name'] = row.get('name') or os.path.splitext(os.path.basename(ds['img']))[0] or f'{path}#{i}'
+        datasets.append(ds)
+    return datasets
+
+
+def find_datasets(inputs: List[str]) -> List[Dict[str, str]]:
+    """ EXPAND INPUTS INTO DATASETS, EACH A DICT OF img, mask, csv, csv2 AND name """
+    datasets = []
+    for path in inputs:
+        if os.path.isfile(path):
+            datasets += read_dataset_manifest(path)
+        elif os.path.isdir(path):
+            found = match_dataset_files(path)
+            if found['img'] or found['csv']:
+                datasets.append({**found, 'name': os.path.basename(os.path.normpath(path))})
+            else:
+                # folder of dataset folders
+                for sub in sorted(os.listdir(path)):
+                    if os.path.isdir(os.path.join(path, sub)):
+                        found = match_dataset_files(os.path.join(path, sub))
+                        if found['img'] or found['csv']:
+                            datasets.append({**found, 'name': sub})
+        else:
+            logging.error('%s: no such file or folder', path)
+    return datasets
+
+
+def check_prop(entry: str, wfs: List[WorkflowObj]) -> Optional[str]:
+    """ REASON A --prop ENTRY IS INVALID FOR THE SELECTED WORKFLOWS, OR NONE """
+    name, sep, value = entry.partition('=')
+    if not sep:
+        return 'expected NAME=VALUE'
+    scope, _, name = name.rpartition(':')
+    if scope:
+        wfs = [wf for wf in WORKFLOWS if wf['name'].lower() == scope.strip().lower()]
+        if len(wfs) == 0:
+            return f'unknown workflow {scope.strip()!r}'
+    titles = {prop['title'].lower() for wf in wfs for prop in wf['props']}
+    if name.strip().lower() not in titles:
+        known = ', '.join(sorted(titles)) or 'none'
+        return f'unknown prop {name.strip()!r} (props: {known})'
+    try:
+        int(value)
+    except ValueError:
+        return f'{value.strip()!r} is not a whole number'
+    return None
+
+
+def parse_props(props: List[str], wf: WorkflowObj) -> List[int]:
+    """ WORKFLOW PROP VALUES, --prop OVERRIDES (SEE check_prop) ON TOP OF THE PLACEHOLDER DEFAULTS """
+    vals = default_values(wf)
+    titles = [prop['title'].lower() for prop in wf['props']]
+    for entry in props:
+        name, _, value = entry.partition('=')
+        scope, _, name = name.rpartition(':')
+        if scope and scope.strip().lower() != wf['name'].lower():
+            continue
+        name = name.strip().lower()
+        if name in titles:
+            vals[titles.index(name)] = int(value)
+    return vals
+
+
+def check_dataset(ds: Dict[str, str]) -> Optional[str]:
+    """ REASON THE DATASET CANNOT RUN, OR NONE """
+    for key, label in (('img', 'image'), ('mask', 'mask'), ('csv', 'gold csv')):
+        if not ds[key]:
+            return f'no {label} found'
+        if not os.path.isfile(ds[key]):
+            return f'{label} {ds[key]} does not exist'
+    if ds['csv2'] and not os.path.isfile(ds['csv2']):
+        return f'landmark csv {ds["csv2"]} does not exist'
+    return None
+
+
+def main(argv: List[str] = None) -> int:
+    """ RUN THE BATCH, EXIT CODE IS 1 IF ANY DATASET OR WORKFLOW FAILED AND 2 IF THERE WAS NOTHING TO RUN """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(asctime)s %(levelname)s %(message)s', stream=sys.stdout)
+    wfs = [wf for wf in WORKFLOWS if wf['name'].lower() in args.workflows]
+    datasets = find_datasets(args.inputs)
+    if len(datasets) == 0:
+        logging.error('no datasets found in %s', ', '.join(args.inputs))
+        return 2
+    failed, jobs = 0, []
+    for ds in datasets:
+        problem = check_dataset(ds)
+        if problem is not None:
+            logging.error('%s: skipped, %s', ds['name'], problem)
+            failed += 1
+            continue
+        jobs += [BatchJob(ds, wf, parse_props(args.prop, wf)) for wf in wfs]
+    batch_ops = BatchOptions(in_unit=unit_to_enum(args.in_unit), in_scalar=args.in_scalar, rand_count=args.rand_count,
+                             seed=args.seed, n_bins=args.bins, pal_type=args.palette, r_pal_type=args.rand_palette,
+                             show_rand=args.show_random, clust_area=args.clust_area, use_cache=not args.no_cache,
+                             draw_image=not args.no_image, profile_memory=args.profile_memory)
+    output_ops = OutputOptions(output_unit=unit_to_enum(args.out_unit), output_dir=args.output,
+                               output_scalar=args.out_scalar,
+                               delete_old=args.delete_old, formats=args.formats, tiff_compression=args.tiff,
+                               keep_runs=args.keep_runs, keep_days=args.keep_days, keep_mb=args.keep_mb)
+    if len(jobs) > 0:
+        logging.info('shared intermediates: %s', ', '.join(analysis_plan(wfs)))
+        scheduler = BatchScheduler(workers=args.jobs,
+                                   max_bytes=int(args.max_memory_mb * 2 ** 20) if args.max_memory_mb else None)
+        failed += sum(1 for job in scheduler.run(jobs, batch_ops, output_ops) if job.error is not None)
+    logging.info('finished %d datasets, %d failures', len(datasets), failed)
+    return 1 if failed > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,146 +1,10 @@
 from PyQt5.QtGui import QIcon, QColor
-from typings import Workflow, WorkflowObj
-from typing import List
+from typing import Dict, List
 
 
 """ VERSION NUMBER """
 VERSION_NUMBER: str = '1.18.1'
 
-"""
-WORKFLOW METADATA 
-___________________
-Array of JSON objects containing the following data:
-    @name: 
-    @type: ENUM type of Workflow
-    @header: string displayed as "header"
-    @desc: string displayed as "description" below header
-    @checked: is workflow checked by default
-    @graph: graph metadata:
-        @type: type of graph
-        @title: title of graph
-        @x_label: x_label of graph
-        @y_label: y_label of graph
-        @x_type: the value measured on x axis
-        @y_type: the value measured on y axis
-    @props: array of optional parameters in the following format:
-        @title: title of prop
-        @placeholder: placeholder for prop label
-"""
-
-# TODO: ADD NEW WORKFLOW METADATA HERE
-WORKFLOWS: List[WorkflowObj] = [
-    {
-    "name": "NND",
-    "type": Workflow.NND,
-        "header": "Nearest Neighbor Distance of Particles",
-    "desc": "Find the nearest neighbor distance (NND) between gold particles. Optionally generate random coordinates.",
-    "checked": True,
-    "graph": {
-        "type": "hist",
-        "title": "NND of Particles",
-        "x_label": "Distance",
-        "y_label": "Number of Particles",
-        "x_type": "dist"
-    },
-    "props": []
-},
-    {
-        "name": "CLUST",
-        "type": Workflow.CLUST,
-        "header": "Hierarchical Clustering of Particles",
-        "desc": "Cluster gold particles into groups. Optionally generate random coordinates.",
-        "checked": True,
-        "graph": {
-            "type": "bar",
-            "title": "Hierarchical Clustering of Particles",
-            "x_label": "Number of Particles In Cluster",
-            "y_label": "Number of Clusters",
-            "x_type": "cluster_id",
-            "y_type": "cluster_id"
-        },
-        "props": [
-            {
-                "title": "distance threshold (px)",
-                "placeholder": "27"
-            }
-        ]
-    },
-    {
-        "name": "SEPARATION",
-        "type": Workflow.SEPARATION,
-        "header": "Separation Between Clusters",
-        "desc": "Find the separation (NND) between clusters. Optionally generate random coordinates.",
-        "checked": True,
-        "graph": {
-            "type": "hist",
-            "title": "Separation Between Clusters",
-            "x_label": "Nearest Neighbor Distance",
-            "y_label": "Number of Entries",
-            "x_type": "dist",
-
-        },
-        "props": [
-            {
-                "title": "distance threshold (px)",
-                "placeholder": "27"
-            },
-            {
-                "title": "minimum clust size",
-                "placeholder": "2"
-            },
-        ]
-    },
-    {
-        "name": "RIPPLER",
-        "type": Workflow.RIPPLER,
-        "header": "Gold Rippler: Landmark-Particle Correlation",
-        "desc": "Separate landmark masks as individual components, grow components until they contain X gold particles, calculate Landmark Correlated Particle Index (LCPI): (% of gold particles within landmark masks) / (% of total area of img taken up by landmark masks).  Requires lighthouse population.",
-        "checked": False,
-        "graph": {
-            "type": "bar",
-            "title": "Landmark Correlated Particle Index (LCPI) By Radius",
-            "x_label": "radius",
-            "y_label": "LCPI",
-            "x_type": "radius",
-            "y_type": "LCPI"
-        },
-        "props": [
-            {
-                "title": "maximum steps",
-                "placeholder": "10"
-            },
-            {
-                "title": "step size (px)",
-                "placeholder": "60"
-            },
-            {
-                "title": "initial radius (px)",
-                "placeholder": "50"
-            }
-        ]
-    },
-    {
-        "name": "GOLDSTAR",
-        "type": Workflow.GOLDSTAR,
-        "header": "Gold Star Nearest Neighbor Distance",
-        "desc": "Find the nearest neighbor distance of two different populations. Requires lighthouse population",
-        "checked": False,
-        "graph": {
-            "type": "hist",
-            "title": "Gold Star NND",
-            "x_label": "Distance",
-            "y_label": "Number of Particles",
-            "x_type": "dist"
-        },
-        "props": [
-            {
-                "title": "A* (around landmarks)",
-                "placeholder": "0"
-            }
-        ]
-    },
-]
-
 """ COLOR PALETTE OPTIONS """
 PALETTE_OPS: List[str] = ["rocket", "crest", "mako", "flare", "viridis", "magma", "cubehelix", "rocket_r", "mako_r", "crest_r",
  "flare_r", "viridis_r", "magma_r", ]
@@ -162,12 +26,97 @@ UNIT_PX_SCALARS = {
 """ NAVBAR ICON """
 NAV_ICON = QIcon('foo.png')
 
+""" QT RESOURCES """
+RESOURCE_FILE: str = 'resources.rcc'  # compiled from resources.qrc with rcc -binary, registered at startup
+
 """ MAX DIRS TO KEEP WHEN PRUNING OLD DIRS """
 MAX_DIRS_PRUNE: int = 5
 
+""" DEFAULT RETENTION WHEN PRUNING OLD DIRS (NONE = NO LIMIT) """
+MAX_DIRS_AGE_DAYS: float = None
+MAX_DIRS_MB: float = None
+
+""" IMAGE VIEWER TILE PYRAMID """
+TILE_SIZE: int = 256  # edge length (px) of each square tile at every pyramid level
+TILE_CACHE_SIZE: int = 512  # max tile pixmaps kept in the LRU cache (~128MB of RGBA tiles)
+
+""" ANNOTATION OVERLAY CULLING & LEVEL OF DETAIL """
+OVERLAY_GRID_CELL: int = 256  # cell size (px) of the spatial index used to cull off-screen annotations
+LOD_MIN_TEXT_PX: float = 6  # labels smaller than this on screen (px) are skipped
+LOD_MIN_GLYPH_PX: float = 1.5  # circles smaller than this on screen (px) are drawn as single points
+LOD_MAX_ITEMS: int = 20000  # above this many visible annotations, draw aggregated density instead
+LOD_DENSITY_CELL_PX: int = 8  # on-screen size (px) of each density bucket
+
+""" OUTPUT WRITER """
+OUTPUT_WORKERS: int = 4  # threads shared by every download for writing result files
+OUTPUT_MAX_PENDING: int = 32  # max queued writes before submitting blocks, bounds memory held by pending results
+
+""" OUTPUT TABLE FORMATS """
+OUTPUT_FORMATS: List[str] = ['csv', 'parquet', 'npz']
+
+""" DRAWN IMAGE TIFF EXPORT """
+TIFF_COMPRESSIONS: List[str] = ['deflate', 'lzw', 'jpeg', 'none']  # 'none' writes the old flat, uncompressed tiff
+TIFF_TILE: int = 256  # tile edge (px), must be a multiple of 16
+TIFF_MIN_LEVEL: int = 512  # stop adding lower resolution levels once the longest side is below this (px)
+TIFF_JPEG_QUALITY: int = 90
+TIFF_DEFLATE_LEVEL: int = 3  # zlib level, higher levels are several times slower for no smaller files on micrographs
+
 """ DEFAULT OUTPUT DIRECTORY """
 DEFAULT_OUTPUT_DIR: str = './output'
 
+""" RESULT CACHE """
+CACHE_DIR: str = None  # None = GoldInAndOut/results in the user's cache folder (~/.cache, ~/Library/Caches, %LOCALAPPDATA%)
+CACHE_MAX_MB: float = 1024  # least recently used results are evicted beyond this
+
+""" BATCH SCHEDULER """
+BATCH_WORKERS: int = None  # processes running dataset jobs at once, None = one per core
+BATCH_MAX_MEMORY_MB: float = None  # memory jobs are admitted against, None = half of physical memory
+BATCH_IMAGE_COPIES: float = 6  # decoded image sized buffers a job holds at its peak (base, mask, drawn copy, pyramid, ...)
+BATCH_JOB_OVERHEAD_MB: float = 200  # fixed per job estimate on top of the image (coords, results, graph)
+BATCH_JOB_ATTEMPTS: int = 2  # jobs running when a worker process dies are retried up to this many times in total
+BATCH_REPORT_SECS: float = 10  # how often overall progress and eta are logged while jobs run
+
+""" WORKFLOW PAGE POOL """
+PAGE_WORKERS: int = None  # analyses and graph renders of the workflow pages running at once, None = one per core
+PAGE_VISIBLE_PRIORITY: int = 10  # queued jobs of the page on screen start before the others (priority 0)
+
+""" ANALYSIS BACKEND """
+ANALYSIS_BACKEND: str = 'thread'  # where workflow pages compute: 'thread' in the app's process, 'process' in worker processes (procpool.py)
+ANALYSIS_PROCESSES: int = None  # worker processes of the 'process' backend, None = one per core
+
+""" PROGRESS REPORTING """
+PROGRESS_MAX_RATE: float = 10  # updates per second a progress reporter passes on at most (stage changes always go through)
+PROGRESS_LOG_STEP: int = 25  # headless runs log progress every this many percent
+ANALYSIS_PROGRESS: float = 0.9  # share of a workflow page's progress bar the analysis fills, drawing results the rest
+
+""" ANALYSIS ENGINES """
+REFERENCE_ENGINE: str = 'reference'  # the original implementations, every other engine is checked against them
+DEFAULT_ENGINES: Dict[str, str] = {}  # intermediate or workflow name -> engine used instead of the reference one
+LOW_MEMORY_ENGINES: Dict[str, str] = {'CLUST': 'tiled', 'RIPPLER': 'tiled'}  # batch jobs over the memory budget fall back to these
+LOW_MEMORY_IMAGE_COPIES: float = 4  # BATCH_IMAGE_COPIES of a job on LOW_MEMORY_ENGINES
+
+""" RUN TIMINGS """
+TIMINGS_ENABLED: bool = True  # record per stage timings and peak memory of every run, see timing.py
+TIMINGS_FILE: str = 'timings.json'  # written into every run folder next to the outputs
+MEMORY_PROFILE: bool = False  # trace allocations and sample resident memory, per stage peaks in the timings (slower)
+MEMORY_SAMPLE_SECS: float = 0.02  # resident memory sampling interval while profiling
+
+""" LOGGER """
+LOG_MAX_LINES: int = 5000  # lines the logger window keeps, older ones are dropped
+LOG_FLUSH_MS: int = 200  # new lines are appended to the logger window in one batch this often
+LOG_FILE: str = None  # also log to this file, rotated by size, None = no log file
+LOG_FILE_MAX_MB: float = 5  # size a log file is rotated at
+LOG_FILE_BACKUPS: int = 3  # rotated log files kept
+
+""" WARM UP """
+WARMUP_ENABLED: bool = True  # import and initialize the analysis stack in the background once the window shows
+WARMUP_MODULES: List[str] = ['cv2', 'sklearn.cluster', 'sklearn.neighbors', 'seaborn', 'matplotlib.figure',
+                             'matplotlib.backends.backend_agg']  # imported by the warm up, in this order
+NUMERIC_THREADS: int = None  # numexpr and BLAS threads per process, None = one per core
+
+""" RANDOM COORDINATES DEFAULT SEED """
+DEFAULT_SEED: int = 42
+
 """ RANDOM COORDINATES DEFAULT DISTANCE THRESHOLD (px) """
 DEFAULT_DISTANCE_THRESH = 5
 
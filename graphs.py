@@ -0,0 +1,177 @@
+from typings import Unit, Workflow, WorkflowObj
+from typing import Dict, List, Tuple, Union, TYPE_CHECKING
+from utils import create_color_pal, enum_to_unit
+import numpy as np
+import pandas as pd
+import threading
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# one reusable figure per workflow type; the lock makes it safe to render from any worker thread
+_templates: Dict[Workflow, Tuple['Figure', 'FigureCanvasAgg', object, threading.Lock]] = {}
+_templates_lock = threading.Lock()
+
+
+def parse_bins(n_bins: Union[int, str]) -> Union[int, str, List[float]]:
+    """
+    PARSE NUMBER OF HIST BINS
+    __________________
+    @n_bins: user input, either a bin count ("10"), explicit edges ("[0, 5, 10]") or a numpy estimator name ("fd")
+    """
+    if isinstance(n_bins, (int, np.integer)):
+        return int(n_bins)
+    n_bins = str(n_bins).strip()
+    if n_bins.isdecimal():
+        return int(n_bins)
+    if n_bins.startswith('[') and n_bins.endswith(']'):
+        return [float(edge) for edge in n_bins[1:-1].split(',') if edge.strip()]
+    return n_bins
+
+
+def hist_edges(values: List[np.ndarray], n_bins: Union[int, str]) -> np.ndarray:
+    """ COMPUTE HIST BIN EDGES ONCE OVER EVERY SHOWN POPULATION SO REAL, RANDOM AND THE IMAGE PALETTE SHARE THEM """
+    data = [np.asarray(v, dtype=float) for v in values if len(v) > 0]
+    data = np.concatenate(data) if len(data) > 0 else np.zeros(0)
+    return np.histogram_bin_edges(data, bins=parse_bins(n_bins))
+
+
+def get_template(wf_type: Workflow) -> Tuple['Figure', 'FigureCanvasAgg', object, threading.Lock]:
+    """ FETCH (OR CREATE) THE FIGURE, AGG CANVAS AND AXES REUSED FOR A WORKFLOW TYPE """
+    with _templates_lock:
+        if wf_type not in _templates:
+            # matplotlib loads with the first graph, not at startup
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            # standalone figure, never registered with pyplot so no global state is touched
+            fig = Figure()
+            canvas = FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
+            _templates[wf_type] = (fig, canvas, ax, threading.Lock())
+        return _templates[wf_type]
+
+
+def render_graph(wf: WorkflowObj, final_real: pd.DataFrame, final_rand: pd.DataFrame, show_real: bool, show_rand: bool,
+                 pal_type: str, r_pal_type: str, n_bins: Union[int, str], output_unit: Unit = Unit.PIXEL,
+                 n: List[int] = np.zeros(11)) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    RENDER WORKFLOW GRAPH
+    __________________
+    @wf: selected workflow, its graph metadata decides what is plotted
+    @final_real: real output df in output unit
+    @final_rand: random output df in output unit
+    @show_real: plot real distribution
+    @show_rand: plot random distribution
+    @pal_type: seaborn palette name for real
+    @r_pal_type: seaborn palette name for random
+    @n_bins: hist bins, see parse_bins
+    @output_unit: unit shown on the x label
+    @n: fallback bin counts when the graph type has none (e.g. line)
+    @return: RGBA graph image as an (h, w, 4) uint8 array and the bin counts used to color image annotations
+    """
+    import seaborn as sns
+    fig, canvas, ax, lock = get_template(wf['type'])
+    graph = wf["graph"]
+    with lock:
+        ax.clear()
+        if graph["type"] == "hist":
+            real_vals = final_real[graph["x_type"]].to_numpy() if show_real else np.zeros(0)
+            rand_vals = final_rand[graph["x_type"]].to_numpy() \
+                if show_rand and graph["x_type"] in final_rand.columns else np.zeros(0)
+            edges = hist_edges([real_vals, rand_vals], n_bins)
+            if show_real != show_rand:
+                # create histogram
+                if show_real:
+                    graph_vals = real_vals
+                    cm = sns.color_palette(pal_type, as_cmap=True)
+                    ax.set_title(f'{graph["title"]} (Real)')
+                else:
+                    graph_vals = rand_vals
+                    cm = sns.color_palette(r_pal_type, as_cmap=True)
+                    ax.set_title(f'{graph["title"]} (Random)')
+                n, _ = np.histogram(graph_vals, bins=edges)
+                # plot precomputed counts, matplotlib does not re-bin
+                _, _, patches = ax.hist(edges[:-1], bins=edges, weights=n, color='green')
+                # normalize values
+                col = (n - n.min()) / max(n.max() - n.min(), 1)
+                for c, p in zip(col, patches):
+                    p.set_facecolor(cm(c))
+            elif show_real and show_rand:
+                rand_n, _ = np.histogram(rand_vals, bins=edges)
+                n, _ = np.histogram(real_vals, bins=edges)
+                ax.hist(edges[:-1], bins=edges, weights=rand_n, alpha=0.75,
+                        color=create_color_pal(n_bins=1, palette_type=r_pal_type), label='Random')
+                ax.hist(edges[:-1], bins=edges, weights=n, alpha=0.75,
+                        color=create_color_pal(n_bins=1, palette_type=pal_type), label='Real')
+                ax.set_title(f'{graph["title"]} (Real & Random)')
+                ax.legend(loc='upper right')
+        elif graph["type"] == "line":
+            # create line graph
+            if show_real:
+                ax.set_title(f'{graph["title"]} (Real)')
+                graph_df = final_real
+            elif show_rand:
+                ax.set_title(f'{graph["title"]} (Random)')
+                graph_df = final_rand
+            ax.plot(graph_df[graph["x_type"]], graph_df[graph["y_type"]], color='blue')
+        elif graph["type"] == "bar":
+            # create bar graph
+            if show_real != show_rand:
+                graph_df, pal = (final_real, pal_type) if show_real else (final_rand, r_pal_type)
+                ax.set_title(f'{graph["title"]} (Real)' if show_real else f'{graph["title"]} (Random)')
+                c = 1
+                graph_y = graph_df[graph["y_type"]].to_numpy()
+                graph_x = np.array(graph_df[graph["x_type"]])
+                if graph.get('x_mode') == 'sizes':
+                    graph_y = np.bincount(np.bincount(graph_df[graph["x_type"]]))[1:]
+                    graph_x = list(range(1, (len(graph_y) + 1)))
+                    c = len(graph_x)
+                c = create_color_pal(n_bins=c, palette_type=pal)
+                n = graph_x
+                if graph.get('x_mode') == 'values':
+                    ax.bar(graph_x, graph_y, width=(max(graph_x) / (len(graph_x) + 2)), color=c)
+                else:
+                    bar_plot = ax.bar(graph_x, graph_y, color=c)
+                    for idx, rect in enumerate(bar_plot):
+                        height = rect.get_height()
+                        ax.text(rect.get_x() + rect.get_width() / 2., 1.05 * height, graph_y[idx],
+                                ha='center', va='bottom', rotation=0)
+            elif show_real and show_rand:
+                if graph.get('x_mode') == 'values':
+                    rand_x = np.array(final_rand[graph["x_type"]])
+                    shift_rand_x = (max(rand_x) / (len(rand_x) + 2)) / 4
+                    ax.bar([el - shift_rand_x for el in rand_x], np.array(final_rand[graph["y_type"]]),
+                           width=(max(rand_x) / (len(rand_x) + 2)), alpha=0.7,
+                           color=create_color_pal(n_bins=1, palette_type=r_pal_type), label='Random')
+                    real_x = np.array(final_real[graph["x_type"]])
+                    shift_real_x = (max(real_x) / (len(real_x) + 2)) / 4
+                    ax.bar([el + shift_real_x for el in real_x], np.array(final_real[graph["y_type"]]),
+                           width=(max(real_x) / (len(real_x) + 2)), alpha=0.7,
+                           color=create_color_pal(n_bins=1, palette_type=pal_type), label='Real')
+                    ax.set_xlim(xmin=0, xmax=max(rand_x) * 1.3)
+                    n = rand_x
+                else:
+                    real_graph_y = np.bincount(np.bincount(final_real[graph["x_type"]]))[1:]
+                    real_graph_x = list(range(1, (len(set(real_graph_y))) + 1))
+                    rand_graph_y = np.bincount(np.bincount(final_rand[graph["x_type"]]))[1:]
+                    rand_graph_x = list(range(1, (len(set(rand_graph_y))) + 1))
+                    if graph.get('x_mode') == 'sizes':
+                        real_graph_x = list(range(1, (len(real_graph_y) + 1)))
+                        rand_graph_x = list(range(1, (len(rand_graph_y) + 1)))
+                    ax.bar([el + 0.2 for el in real_graph_x], real_graph_y, 0.4,
+                           color=create_color_pal(n_bins=len(real_graph_x), palette_type=pal_type), alpha=0.7,
+                           label='Real')
+                    ax.bar([el - 0.2 for el in rand_graph_x], rand_graph_y, 0.4,
+                           color=create_color_pal(n_bins=len(rand_graph_x), palette_type=r_pal_type), alpha=0.7,
+                           label='Random')
+                    n = rand_graph_x
+                ax.set_title(f'{graph["title"]} (Real & Random)')
+                ax.legend(loc='upper right')
+        # label graph
+        ax.set_xlabel(f'{graph["x_label"]} ({enum_to_unit(output_unit)})')
+        ax.set_ylabel(graph["y_label"])
+        ax.set_ylim(ymin=0)
+        # draw on canvas, copy out of the shared buffer before the lock is released
+        canvas.draw()
+        img = np.asarray(canvas.buffer_rgba()).copy()
+    return img, np.asarray(n)
@@ -1,28 +1,33 @@
 # views
 import logging
 import traceback
-import pandas as pd
-from globals import WORKFLOWS, NAV_ICON, DEFAULT_OUTPUT_DIR, VERSION_NUMBER
+from globals import NAV_ICON, DEFAULT_OUTPUT_DIR, VERSION_NUMBER, MEMORY_PROFILE, RESOURCE_FILE, WARMUP_ENABLED, \
+    NUMERIC_THREADS
+from registry import WORKFLOWS, analysis_plan
+from analysis import AnalysisContext
+from cancel import CancelToken
 from views.home import HomePage
 from typings import Unit, OutputOptions
-from utils import pixels_conversion, unit_to_enum, to_coord_list
+from typing import List
+from utils import pixels_conversion, unit_to_enum, to_coord_list, resource_path
 from views.logger import Logger
 from views.workflow import WorkflowPage
 # stylesheet
 from styles.stylesheet import styles
-# resources
-import resources
 # pyQT5
 import PyQt5
-from PyQt5.QtCore import Qt, QSize, QObject, pyqtSignal, QThread #, pyqt5_enable_new_onexit_scheme
+from PyQt5.QtCore import Qt, QSize, QObject, pyqtSignal, QThread, QResource, QTimer #, pyqt5_enable_new_onexit_scheme
 from PyQt5.QtGui import QIcon, QCursor
 from PyQt5.QtWidgets import (QWidget, QListWidget, QStackedWidget, QHBoxLayout, QListWidgetItem, QApplication,
                              QMainWindow)
+# not used here: names a module pandas imports dynamically so PyInstaller bundles it (pandas itself is loaded by
+# the workflows through registry either way, deferring it here would not save anything)
 import pandas._libs.tslibs.base
 # general
-from threads import DataLoadWorker
+from threads import DataLoadWorker, WarmupWorker, RunPool
+from timing import RunTimings, memory_profile
 from functools import partial
-import numexpr
+import multiprocessing
 import pathlib
 import sys
 
@@ -50,10 +55,14 @@ class GoldInAndOut(QWidget):
         # self.setWindowIcon(QIcon('./logo.png'))
         self.setMinimumSize(QSize(800, 850))
         self.logger_shown = False
+        # parent of every page's runs, cancelled when the pages are replaced
+        self.run_token = CancelToken()
+        # timings of loading the current dataset, the pages' run timings build on them
+        self.load_timings: RunTimings = None
+        # main progress bar: run the current pages belong to, each page's first run done (0..1)
+        self.run_count = 0
+        self.page_progress: List[float] = []
         logging.info("Booting up...")
-        # set max threads
-        numexpr.set_num_threads(numexpr.detect_number_of_cores())
-        logging.info("Detected %s cores...", str(numexpr.detect_number_of_cores()))
         # layout with list on left and stacked widget on right
         layout = QHBoxLayout(self, spacing=0)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -71,6 +80,7 @@ class GoldInAndOut(QWidget):
         """ INITIALIZE MAIN CHILD WINDOW """
         logging.info("Initializing main window...")
         self.nav_list.currentRowChanged.connect(self.page_stack.setCurrentIndex)
+        self.nav_list.currentRowChanged.connect(self.on_page_changed)
         self.nav_list.setFrameShape(QListWidget.NoFrame)
         self.nav_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.nav_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -85,7 +95,7 @@ class GoldInAndOut(QWidget):
         self.nav_list.item(0).setSelected(True)
         self.home_page.show_logs_btn.clicked.connect(self.open_logger)
         # init logger
-        self.dlg = Logger()
+        self.dlg = Logger.instance()
 
     def on_run_complete(self):
         self.home_page.start_btn.setText("Run Again")
@@ -118,7 +128,7 @@ class GoldInAndOut(QWidget):
             if len(self.home_page.img_le.text()) > 0 and len(self.home_page.csv_le.text()) > 0 and (self.props_checked() == True):
                 # gui elements to disable when running
                 self.home_props = [self.home_page.start_btn,
-                                   self.home_page.img_le,  self.home_page.mask_le, self.home_page.csv_le, self.home_page.csv2_le, self.home_page.ip_scalar_type, self.home_page.op_scalar_type, self.home_page.output_dir_le, self.home_page.dod_cb, self.home_page.csvs_lb_i, self.home_page.csvs_ip_o, self.home_page.clust_area, self.home_page.show_logs_btn]
+                                   self.home_page.img_le,  self.home_page.mask_le, self.home_page.csv_le, self.home_page.csv2_le, self.home_page.ip_scalar_type, self.home_page.op_scalar_type, self.home_page.output_dir_le, self.home_page.dod_cb, self.home_page.csvs_lb_i, self.home_page.csvs_ip_o, self.home_page.clust_area, self.home_page.use_cache, self.home_page.show_logs_btn] + [cb for cb in self.home_page.format_cbs if cb.isEnabled()] + [self.home_page.tiff_compression, self.home_page.keep_runs_le, self.home_page.keep_days_le, self.home_page.keep_mb_le]
                 for prop in self.home_props:
                     prop.setEnabled(False)
                 self.home_page.start_btn.setStyleSheet("font-size: 16px; font-weight: 600; padding: 8px; margin-top: 10px; margin-right: 450px; color: white; border-radius: 7px; background: #ddd")
@@ -144,20 +154,26 @@ class GoldInAndOut(QWidget):
             # print("OUTPUT SCALAR", s_o)
             dod: bool = self.home_page.dod_cb.isChecked()
             o_dir: str = self.home_page.output_dir_le.text() if len(self.home_page.output_dir_le.text()) > 0 else DEFAULT_OUTPUT_DIR
-            output_ops: OutputOptions = OutputOptions(output_unit=ou, output_dir=o_dir, output_scalar=s_o, delete_old=dod)
+            formats: List[str] = [cb.text() for cb in self.home_page.format_cbs if cb.isChecked()]
+            output_ops: OutputOptions = OutputOptions(output_unit=ou, output_dir=o_dir, output_scalar=s_o, delete_old=dod, formats=formats,
+                                                      tiff_compression=self.home_page.tiff_compression.currentText(),
+                                                      keep_runs=int(self.home_page.keep_runs_le.text()) if self.home_page.keep_runs_le.text() else None,
+                                                      keep_days=float(self.home_page.keep_days_le.text()) if self.home_page.keep_days_le.text() else None,
+                                                      keep_mb=float(self.home_page.keep_mb_le.text()) if self.home_page.keep_mb_le.text() else None)
             c_area = self.home_page.clust_area.isChecked()
+            # intermediates shared by every selected workflow's page, each is computed once per run
+            ctx = AnalysisContext(self.COORDS, self.ALT_COORDS, img_path, mask_path)
+            selected = [wf for wf, wf_cb in zip(WORKFLOWS, self.home_page.workflow_cbs) if wf_cb.isChecked()]
+            logging.info('shared intermediates: %s', ', '.join(analysis_plan(selected)))
 
-            # determine workflow pages
-            wf_td = 0
-            for wf_cb in self.home_page.workflow_cbs:
-                if wf_cb.isChecked():
-                    wf_td += 1
-            
-            # generate workflow pages
+            # the main progress bar follows the pages' first runs, each page's share equal
+            self.run_count += 1
+            self.page_progress = [0.0] * len(selected)
+
+            # generate workflow pages, their analyses queue on the shared RunPool in this order
             z = 0
             for i in range(len(WORKFLOWS)):
                 if self.home_page.workflow_cbs[i].isChecked():
-                    z += 1
                     item = QListWidgetItem(NAV_ICON, str(WORKFLOWS[i]['name']), self.nav_list)
                     item.setSizeHint(QSize(60, 60))
                     item.setTextAlignment(Qt.AlignCenter)
@@ -171,10 +187,15 @@ class GoldInAndOut(QWidget):
                                      csv=csv_path,
                                      csv2=csv2_path,
                                      output_ops=output_ops,
-                                     pg=partial(self.update_main_progress, (int((z / wf_td * 100)))),
+                                     pg=partial(self.update_main_progress, self.run_count, z),
                                      clust_area=c_area,
-                                     log=self.dlg
+                                     log=self.dlg,
+                                     use_cache=self.home_page.use_cache.isChecked(),
+                                     ctx=ctx,
+                                     token=self.run_token,
+                                     timings=self.load_timings
                                      ))
+                    z += 1
         except Exception as e:
             print(e, traceback.format_exc())
 
@@ -193,7 +214,8 @@ class GoldInAndOut(QWidget):
             self.load_thread = QThread()
             self.load_worker = DataLoadWorker()
             self.load_worker.moveToThread(self.load_thread)
-            self.load_thread.started.connect(partial(self.load_worker.run, img_path, mask_path, csv_path, csv2_path, unit, scalar))
+            self.load_timings = RunTimings('load')
+            self.load_thread.started.connect(partial(self.load_worker.run, img_path, mask_path, csv_path, csv2_path, unit, scalar, self.load_timings))
             self.load_worker.finished.connect(self.on_loaded_data)
             self.load_worker.finished.connect(self.load_thread.quit)
             self.load_worker.finished.connect(self.load_worker.deleteLater)
@@ -202,30 +224,80 @@ class GoldInAndOut(QWidget):
         except Exception as e:
             print(e, traceback.format_exc())
 
-    def update_main_progress(self, value: int):
-        """ UPDATE PROGRESS BAR """
-        if self.home_page.progress.value() != 100:
-            self.home_page.progress.setValue(value)
-        if value == 100:
+    def warm_up(self):
+        """ IMPORT AND INITIALIZE THE ANALYSIS STACK IN THE BACKGROUND (NUMERIC THREADS ARE SET THERE TOO) """
+        self.warmup_thread = QThread()
+        self.warmup_worker = WarmupWorker()
+        self.warmup_worker.moveToThread(self.warmup_thread)
+        self.warmup_thread.started.connect(self.warmup_worker.run)
+        self.warmup_worker.finished.connect(self.warmup_thread.quit)
+        self.warmup_worker.finished.connect(self.warmup_worker.deleteLater)
+        self.warmup_thread.finished.connect(self.warmup_thread.deleteLater)
+        self.warmup_thread.start(QThread.LowPriority)
+
+    def update_main_progress(self, run: int, page: int, fraction: float):
+        """
+        UPDATE PROGRESS BAR
+        __________________
+        @run: run the page belongs to, pages of replaced runs are ignored
+        @page: index of the page among this run's pages
+        @fraction: how much of the page's first run is done (0..1)
+        """
+        if run != self.run_count or self.home_page.progress.value() == 100:
+            return
+        self.page_progress[page] = max(self.page_progress[page], fraction)
+        done = sum(self.page_progress) / len(self.page_progress)
+        if done >= 1:
             self.on_run_complete()
+        else:
+            self.home_page.progress.setValue(int(done * 100))
+
+    def on_page_changed(self, index: int):
+        """ THE PAGE NOW ON SCREEN RUNS NEXT """
+        if index > 0:
+            RunPool.instance().prioritize(self.page_stack.widget(index))
 
     def empty_stack(self):
         """ CLEAR PAGE/NAV STACKS """
         try:
             logging.info("Clearing old run pages...")
+            # analyses still running for the old inputs stop at their next chunk boundary
+            self.run_token.cancel()
+            self.run_token = CancelToken()
             for i in range(self.page_stack.count()-1, 0, -1):
                 if i > 0:
+                    # queued jobs of the old pages never start
+                    RunPool.instance().discard(owner=self.page_stack.widget(i))
                     self.nav_list.takeItem(i)
                     self.page_stack.removeWidget(self.page_stack.widget(i))
         except Exception as e:
             print(e, traceback.format_exc())
 
 
+def load_resources() -> bool:
+    """ REGISTER THE COMPILED QT RESOURCES (ICONS), SEE RESOURCE_FILE """
+    if QResource.registerResource(resource_path(RESOURCE_FILE)):
+        return True
+    logging.warning('could not load %s, icons will be missing', RESOURCE_FILE)
+    return False
+
+
 if __name__ == '__main__':
+    # the process backend's workers start this executable again when frozen
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
+    load_resources()
     app.setStyleSheet(styles)
     app.setStyle("fusion")
     logging.basicConfig(level='INFO')
-    gui = GoldInAndOut()
-    gui.show()
-    sys.exit(app.exec_())
+    # per stage memory peaks in every run's timings while the app runs
+    with memory_profile(MEMORY_PROFILE):
+        gui = GoldInAndOut()
+        gui.show()
+        if WARMUP_ENABLED:
+            # once the window has painted
+            QTimer.singleShot(0, gui.warm_up)
+        else:
+            WarmupWorker.set_threads(NUMERIC_THREADS)
+        code = app.exec_()
+    sys.exit(code)
@@ -0,0 +1,158 @@
+from collections import deque
+from contextlib import contextmanager
+from output import atomic_write
+from typing import Deque, Dict, List, Optional
+import threading
+import logging
+import shutil
+import json
+import time
+import os
+
+""" MANIFEST FILE NAME (ONE PER WORKFLOW OUTPUT FOLDER) """
+MANIFEST_NAME = 'manifest.json'
+
+# one lock per manifest path so concurrent downloads of the same workflow do not lose each other's runs
+_locks: Dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _locks_lock:
+        return _locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+@contextmanager
+def _locked(o_dir: str, stale_secs: float = 30):
+    """ HOLD o_dir'S MANIFEST AGAINST OTHER THREADS AND OTHER PROCESSES (E.G. BATCH WORKERS) """
+    with _lock_for(o_dir):
+        os.makedirs(o_dir, exist_ok=True)
+        lock_path = os.path.join(o_dir, f'.{MANIFEST_NAME}.lock')
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    # a process that died holding the lock must not block every later run
+                    if time.time() - os.path.getmtime(lock_path) > stale_secs:
+                        os.remove(lock_path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                time.sleep(0.02)
+        try:
+            yield
+        finally:
+            os.remove(lock_path)
+
+
+def dir_size(path: str) -> int:
+    """ TOTAL SIZE (BYTES) OF ALL FILES UNDER PATH """
+    total = 0
+    for folder, dirs, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.path.getsize(os.path.join(folder, f))
+            except OSError:
+                pass
+    return total
+
+
+class RunManifest:
+    """
+    RUN MANIFEST
+    __________________
+    @o_dir: workflow output folder (e.g. ./output/nnd) holding one folder per run
+
+    Index of the runs in o_dir, oldest first, stored as o_dir/manifest.json. Every entry records the run folder
+    name, creation time (epoch seconds), size in bytes and the params it was run with, so the latest run and the
+    runs to prune are read off the ends of the index instead of listing and stat-ing the whole folder.
+    Folders created before the manifest existed are indexed once, the first time it is loaded.
+    """
+    def __init__(self, o_dir: str):
+        self.o_dir = o_dir
+        self.path = os.path.join(o_dir, MANIFEST_NAME)
+        self.runs: Deque[dict] = deque()
+        self.total_size = 0
+        self.migrated = False
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                self.runs = deque(json.load(f)['runs'])
+        elif os.path.isdir(self.o_dir):
+            # one time migration of run folders written before manifests existed
+            dirs = [d for d in os.listdir(self.o_dir) if os.path.isdir(os.path.join(self.o_dir, d))]
+            dirs.sort(key=lambda d: os.path.getctime(os.path.join(self.o_dir, d)))
+            self.runs = deque({'dir': d, 'created': os.path.getctime(os.path.join(self.o_dir, d)),
+                               'size': dir_size(os.path.join(self.o_dir, d)), 'params': {}} for d in dirs)
+            self.migrated = True
+        self.total_size = sum(run['size'] for run in self.runs)
+
+    def save(self):
+        os.makedirs(self.o_dir, exist_ok=True)
+        data = {'runs': list(self.runs)}
+
+        def _write(tmp: str):
+            with open(tmp, 'w') as f:
+                json.dump(data, f, indent=1)
+        atomic_write(self.path, _write)
+
+    def add(self, run_dir: str, size: int, params: dict = None, created: float = None):
+        """ RECORD A NEW RUN FOLDER (NAME RELATIVE TO o_dir) """
+        if self.migrated:
+            # the folder scan may already have picked up this run
+            self.runs = deque(run for run in self.runs if run['dir'] != os.path.basename(run_dir))
+            self.total_size = sum(run['size'] for run in self.runs)
+        self.runs.append({'dir': os.path.basename(run_dir), 'created': created if created is not None else time.time(),
+                          'size': int(size), 'params': params or {}})
+        self.total_size += int(size)
+
+    def latest(self) -> Optional[dict]:
+        return self.runs[-1] if self.runs else None
+
+    def prune(self, max_runs: int = None, max_age_days: float = None, max_bytes: int = None) -> List[str]:
+        """
+        DELETE OLDEST RUNS UNTIL THE RETENTION POLICY HOLDS
+        __________________
+        @max_runs: keep at most this many runs
+        @max_age_days: delete runs older than this
+        @max_bytes: keep total size of runs at or below this
+        @return: deleted run folder names. The latest run is never deleted.
+        """
+        pruned = []
+        now = time.time()
+        while len(self.runs) > 1:
+            oldest = self.runs[0]
+            if not ((max_runs is not None and len(self.runs) > max_runs) or
+                    (max_age_days is not None and now - oldest['created'] > max_age_days * 86400) or
+                    (max_bytes is not None and self.total_size > max_bytes)):
+                break
+            self.runs.popleft()
+            self.total_size -= oldest['size']
+            logging.info("pruning %s", os.path.join(self.o_dir, oldest['dir']))
+            shutil.rmtree(os.path.join(self.o_dir, oldest['dir']), ignore_errors=True)
+            pruned.append(oldest['dir'])
+        return pruned
+
+
+def record_run(o_dir: str, run_dir: str, size: int, params: dict = None, max_runs: int = None,
+               max_age_days: float = None, max_bytes: int = None) -> List[str]:
+    """ ADD RUN TO o_dir'S MANIFEST AND APPLY THE RETENTION POLICY, RETURNS PRUNED RUN FOLDERS """
+    with _locked(o_dir):
+        manifest = RunManifest(o_dir)
+        manifest.add(run_dir, size, params)
+        pruned = manifest.prune(max_runs, max_age_days, max_bytes)
+        manifest.save()
+        return pruned
+
+
+def latest_run(o_dir: str) -> Optional[str]:
+    """ PATH OF THE MOST RECENT RUN FOLDER IN o_dir, OR NONE """
+    if not os.path.isdir(o_dir):
+        return None
+    with _locked(o_dir):
+        latest = RunManifest(o_dir).latest()
+    return os.path.join(o_dir, latest['dir']) if latest is not None else None
@@ -0,0 +1,301 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from globals import OUTPUT_WORKERS, OUTPUT_MAX_PENDING, TIFF_TILE, TIFF_MIN_LEVEL, TIFF_JPEG_QUALITY, \
+    TIFF_DEFLATE_LEVEL
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import threading
+import logging
+import ast
+import re
+import uuid
+import time
+import os
+import cv2
+try:
+    # optional, only needed for parquet output
+    import pyarrow  # noqa: F401
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+try:
+    # optional, needed for tiled pyramidal tiffs (flat tiffs are written with opencv otherwise)
+    import tifffile
+    HAS_TIFFFILE = True
+except ImportError:
+    HAS_TIFFFILE = False
+try:
+    # optional, tifffile needs it to encode lzw and jpeg (deflate works without it)
+    import imagecodecs  # noqa: F401
+    HAS_IMAGECODECS = True
+except ImportError:
+    HAS_IMAGECODECS = False
+
+""" LIBTIFF COMPRESSION TAGS USED BY OPENCV """
+CV2_TIFF_COMPRESSION: Dict[str, int] = {'none': 1, 'lzw': 5, 'jpeg': 7, 'deflate': 8}
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def atomic_write(path: str, write: Callable[[str], None]):
+    """
+    ATOMICALLY WRITE FILE
+    __________________
+    @path: final output path
+    @write: callback writing the file to the temp path it is given
+
+    The temp file sits next to the target (same filesystem, so os.replace is atomic) and keeps the target's
+    extension, since cv2 and Qt pick the encoder from it. Readers never see a half-written result.
+    """
+    out_dir, name = os.path.split(path)
+    tmp_path = os.path.join(out_dir, f'.{uuid.uuid4().hex[:8]}.tmp-{name}')
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def flatten_table(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    SPLIT DF INTO PLAIN TYPED COLUMNS
+    __________________
+    @df: result frame, coordinate columns hold (x, y) tuples
+
+    Tuple columns become one numeric column per element named col[0], col[1], ... so binary formats keep real
+    dtypes instead of pickled objects. Other object columns are stored as strings.
+    """
+    cols = {}
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object and len(values) > 0 and isinstance(values.iloc[0], (tuple, list, np.ndarray)):
+            arr = np.array(values.tolist())
+            if arr.ndim == 2 and arr.dtype != object:
+                for i in range(arr.shape[1]):
+                    cols[f'{col}[{i}]'] = arr[:, i]
+                continue
+        cols[col] = values.astype(str).to_numpy() if values.dtype == object else values.to_numpy()
+    return cols
+
+
+def unflatten_table(df: pd.DataFrame) -> pd.DataFrame:
+    """ REJOIN col[0], col[1], ... COLUMNS BACK INTO A SINGLE TUPLE COLUMN (INVERSE OF flatten_table) """
+    groups: Dict[str, List[str]] = {}
+    for col in df.columns:
+        match = re.match(r'^(.*)\[(\d+)\]$', str(col))
+        groups.setdefault(match.group(1) if match else col, []).append(col)
+    out = {}
+    for name, cols in groups.items():
+        if len(cols) == 1 and cols[0] == name:
+            out[name] = df[name]
+        else:
+            out[name] = list(zip(*(df[col].tolist() for col in cols)))
+    return pd.DataFrame(out, index=df.index)
+
+
+def write_csv(df: pd.DataFrame, path: str):
+    atomic_write(path, lambda tmp: df.to_csv(tmp, index=False, header=True))
+
+
+def write_parquet(df: pd.DataFrame, path: str):
+    if not HAS_PARQUET:
+        raise ImportError('parquet output requires pyarrow (pip install pyarrow)')
+    atomic_write(path, lambda tmp: pd.DataFrame(flatten_table(df)).to_parquet(tmp, index=False))
+
+
+def write_npz(df: pd.DataFrame, path: str):
+    def _write(tmp: str):
+        # np.savez appends .npz to names without it, write through a file handle so the temp name is kept
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, **flatten_table(df))
+    atomic_write(path, _write)
+
+
+""" TABLE WRITERS BY FILE EXTENSION """
+TABLE_WRITERS: Dict[str, Callable[[pd.DataFrame, str], None]] = {
+    'csv': write_csv,
+    'parquet': write_parquet,
+    'npz': write_npz
+}
+
+
+def read_table(path: str) -> pd.DataFrame:
+    """ LOAD A RESULT TABLE WRITTEN IN ANY OUTPUT FORMAT, COORDINATE COLUMNS COME BACK AS TUPLES """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npz':
+        with np.load(path, allow_pickle=False) as npz:
+            return unflatten_table(pd.DataFrame({key: npz[key] for key in npz.files}))
+    if ext == '.parquet':
+        return unflatten_table(pd.read_parquet(path))
+    df = pd.read_csv(path)
+    for col in df.columns:
+        # csv stores tuples as "(x, y)" strings
+        if df[col].dtype == object and df[col].astype(str).str.startswith('(').all():
+            df[col] = df[col].map(ast.literal_eval)
+    return df
+
+
+def load_output_tree(root: str) -> Dict[str, pd.DataFrame]:
+    """
+    LOAD EVERY RESULT TABLE UNDER AN OUTPUT FOLDER
+    __________________
+    @root: output dir (or a single workflow/run folder inside it)
+    @return: one df per table name (e.g. real_nnd_output_px) with rows of every run stacked and a 'run' column
+        holding the run folder name. When a run saved a table in several formats the fastest to load is read.
+    """
+    preference = ['.npz', '.parquet', '.csv']
+    tables: Dict[str, List[pd.DataFrame]] = {}
+    for folder, dirs, files in os.walk(root):
+        dirs.sort()
+        found: Dict[str, str] = {}
+        for f in sorted(files):
+            stem, ext = os.path.splitext(f)
+            if ext.lower() not in preference or f.startswith('.'):
+                continue
+            if stem not in found or preference.index(ext.lower()) < preference.index(os.path.splitext(found[stem])[1]):
+                found[stem] = f
+        for stem, f in found.items():
+            df = read_table(os.path.join(folder, f))
+            df.insert(0, 'run', os.path.basename(folder))
+            tables.setdefault(stem, []).append(df)
+    return {stem: pd.concat(dfs, ignore_index=True) for stem, dfs in tables.items()}
+
+
+def tiff_levels(img: np.ndarray, min_size: int = TIFF_MIN_LEVEL) -> List[np.ndarray]:
+    """ FULL RES IMAGE FOLLOWED BY HALF SIZE LEVELS (SAME SIZES AS THE VIEWER'S TILE PYRAMID) """
+    levels = [img]
+    while max(levels[-1].shape[:2]) // 2 >= min_size:
+        h, w = levels[-1].shape[:2]
+        levels.append(cv2.resize(levels[-1], (max(1, w // 2), max(1, h // 2)), interpolation=cv2.INTER_AREA))
+    return levels
+
+
+def write_tiff(img: np.ndarray, path: str, compression: str = 'deflate'):
+    """
+    WRITE BGR IMAGE AS A TILED, COMPRESSED, PYRAMIDAL TIFF
+    __________________
+    @img: BGR image array (opencv channel order)
+    @path: output .tif path
+    @compression: one of TIFF_COMPRESSIONS
+
+    Lower resolution levels are stored as SubIFDs of the full res page, the layout QuPath, libvips, OpenSlide style
+    readers and read_tiff_levels understand, while plain readers still just see the full res image. Without
+    tifffile a flat (untiled, single level) tiff is written with opencv using the same compression.
+    """
+    if compression == 'none' or not HAS_TIFFFILE:
+        def _write_flat(tmp: str):
+            if not cv2.imwrite(tmp, img, [cv2.IMWRITE_TIFF_COMPRESSION, CV2_TIFF_COMPRESSION[compression]]):
+                raise IOError(f'could not encode {path}')
+        atomic_write(path, _write_flat)
+        return
+    if compression in ('lzw', 'jpeg') and not HAS_IMAGECODECS:
+        logging.warning('%s tiff compression requires imagecodecs, using deflate for %s', compression, path)
+        compression = 'deflate'
+    levels = tiff_levels(cv2.cvtColor(img, cv2.COLOR_BGR2RGB) if img.ndim == 3 else img)
+    opts = dict(tile=(TIFF_TILE, TIFF_TILE), compression=compression,
+                photometric='rgb' if img.ndim == 3 else 'minisblack')
+    if compression in ('jpeg', 'deflate'):
+        opts['compressionargs'] = {'level': TIFF_JPEG_QUALITY if compression == 'jpeg' else TIFF_DEFLATE_LEVEL}
+
+    def _write(tmp: str):
+        # switch to bigtiff before the classic 4GB offset limit, compressed output is usually far smaller
+        with tifffile.TiffWriter(tmp, bigtiff=img.nbytes > 2 ** 32 - 2 ** 28) as tif:
+            tif.write(levels[0], subifds=len(levels) - 1, **opts)
+            for level in levels[1:]:
+                tif.write(level, subfiletype=1, **opts)
+    atomic_write(path, _write)
+
+
+def read_tiff_levels(path: str) -> Optional[List[np.ndarray]]:
+    """
+    READ THE LOWER RESOLUTION LEVELS EMBEDDED IN A PYRAMIDAL TIFF
+    __________________
+    @path: image path
+    @return: RGB level arrays, each half the size of the previous one starting at level 1 (the full res image is
+        not decoded), or None if the file has no usable pyramid or tifffile is missing
+    """
+    if not HAS_TIFFFILE or not path.lower().endswith(('.tif', '.tiff')):
+        return None
+    try:
+        with tifffile.TiffFile(path) as tif:
+            series = tif.series[0]
+            if len(series.levels) < 2:
+                return None
+            h, w = series.levels[0].shape[:2]
+            levels = []
+            for level in series.levels[1:]:
+                h, w = max(1, h // 2), max(1, w // 2)
+                # only exact halvings of rgb 8 bit data line up with the viewer's pyramid
+                if level.shape[:2] != (h, w) or level.dtype != np.uint8 or len(level.shape) != 3 or level.shape[2] != 3:
+                    break
+                levels.append(level.asarray())
+            return levels or None
+    except Exception:
+        logging.warning('could not read tiff pyramid of %s', path)
+        return None
+
+
+def write_rgba(img: np.ndarray, path: str):
+    """ WRITE RGBA ARRAY (E.G. A RENDERED GRAPH), FORMAT IS PICKED FROM THE EXTENSION """
+    def _write(tmp: str):
+        if not cv2.imwrite(tmp, cv2.cvtColor(img, cv2.COLOR_RGBA2BGR)):
+            raise IOError(f'could not encode {path}')
+    atomic_write(path, _write)
+
+
+class ResultWriter:
+    """
+    RESULT WRITER
+    __________________
+    @max_workers: number of threads writing files concurrently
+    @max_pending: max writes queued or running at once, submit() blocks beyond it
+
+    Bounded I/O pool shared by every download. Writes go through atomic_write and each one is timed.
+    """
+    def __init__(self, max_workers: int = OUTPUT_WORKERS, max_pending: int = OUTPUT_MAX_PENDING):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='output')
+        self.slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(self, path: str, write: Callable[..., None], *args) -> Future:
+        """ QUEUE write(*args, path), FUTURE RESOLVES TO (PATH, SECONDS, BYTES) """
+        self.slots.acquire()
+
+        def _task():
+            try:
+                start = time.perf_counter()
+                write(*args, path)
+                return path, time.perf_counter() - start, os.path.getsize(path)
+            finally:
+                self.slots.release()
+        try:
+            return self.pool.submit(_task)
+        except BaseException:
+            self.slots.release()
+            raise
+
+    @staticmethod
+    def wait(futures: List[Future], name: str = 'output') -> List[Tuple[str, float, int]]:
+        """ BLOCK UNTIL ALL WRITES FINISH, LOG PER FILE TIMINGS AND RE-RAISE THE FIRST FAILURE """
+        timings, error = [], None
+        for future in futures:
+            try:
+                path, seconds, size = future.result()
+                timings.append((path, seconds, size))
+                logging.info('%s: wrote %s (%.1f KB) in %.3fs', name, os.path.basename(path), size / 1024, seconds)
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return timings
+
+
+def get_writer() -> ResultWriter:
+    """ SHARED RESULT WRITER, CREATED ON FIRST USE """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ResultWriter()
+        return _writer
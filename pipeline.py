@@ -0,0 +1,323 @@
+from utils import pixels_conversion, enum_to_unit, to_coord_list, create_color_pal
+from typings import Unit, DataObj, OutputOptions, WorkflowObj, BatchOptions
+from typing import Callable, Dict, List, Optional, Tuple
+from annotations import AnnotationLayer
+from graphs import render_graph
+from output import get_writer, write_tiff, write_rgba, TABLE_WRITERS
+from manifest import record_run
+from cache import ResultCache, get_cache
+from globals import DEFAULT_SEED, DEFAULT_OUTPUT_DIR, DEFAULT_ENGINES, REFERENCE_ENGINE, MEMORY_PROFILE
+from registry import get_plugin
+from analysis import AnalysisContext
+from cancel import CancelToken
+from progress import ProgressReporter, as_reporter
+from timing import RunTimings, span, memory_profile
+from workflows.random_coords import gen_random_coordinates
+import numpy as np
+import pandas as pd
+import datetime
+import logging
+import time
+import os
+import cv2
+
+"""
+ANALYSIS PIPELINE
+___________________
+The steps a workflow page runs (load -> analyze -> finalize -> annotate -> export) without any widgets, shared by the
+GUI's worker threads and the headless command line runner (cli.py).
+"""
+
+
+def load_coords(img_path: str = "", mask_path: str = "", csv_path: str = "", csv2_path: str = "",
+                unit: Unit = Unit.PIXEL, scalar: float = 1.0) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+    """
+    LOAD AND CONVERT INPUT COORDINATES
+    __________________
+    @img_path: image, used to place random landmarks when there is no landmark csv
+    @mask_path: mask, used to place random landmarks when there is no landmark csv
+    @csv_path: gold particle csv
+    @csv2_path: landmark (lighthouse) csv, optional
+    @unit: unit the csvs are in
+    @scalar: px per unit of the csvs
+    @return: gold coords and landmark coords, both in px
+    """
+    data = pd.read_csv(csv_path, sep=",")
+    coords = to_coord_list(pixels_conversion(data=data, unit=unit, scalar=scalar))
+    if len(csv2_path) > 0:
+        data = pd.read_csv(csv2_path, sep=",")
+        alt_coords = to_coord_list(pixels_conversion(data=data, unit=unit, scalar=scalar))
+    else:
+        alt_coords = gen_random_coordinates(img_path, mask_path, count=len(coords), seed=DEFAULT_SEED)
+    return coords, alt_coords
+
+
+def default_values(wf: WorkflowObj) -> List[int]:
+    """ WORKFLOW PROPS AT THEIR PLACEHOLDER VALUES """
+    return [int(prop['placeholder']) for prop in wf['props']]
+
+
+def workflow_inputs(coords: List[Tuple[float, float]] = None, rand_coords: List[Tuple[float, float]] = None,
+                    alt_coords: List[Tuple[float, float]] = None, img_path: str = "", mask_path: str = "",
+                    clust_area: bool = False, ctx: AnalysisContext = None) -> dict:
+    """ ANALYSIS INPUTS BY THE NAMES WORKFLOW PLUGINS DECLARE THEM UNDER """
+    return {'coords': coords, 'rand_coords': rand_coords, 'alt_coords': alt_coords, 'img_path': img_path,
+            'mask_path': mask_path, 'clust_area': clust_area, 'ctx': ctx}
+
+
+def run_plugin(wf: WorkflowObj, vals: List[int], inputs: dict, pb: ProgressReporter,
+               engine: str = None) -> Dict[str, pd.DataFrame]:
+    """ CALL THE WORKFLOW'S RUN FUNCTION (OR engine) WITH THE INPUTS AND PROPS IT DECLARES, RETURNS ITS DATAFRAMES BY OUTPUT NAME """
+    plugin = get_plugin(wf['type'])
+    run = plugin.run if engine in (None, REFERENCE_ENGINE) else plugin.engines[engine]
+    kwargs = {arg: inputs[name] for arg, name in plugin.inputs.items()}
+    kwargs.update({arg: val for arg, val in zip(plugin.props, vals) if arg is not None})
+    return dict(zip(plugin.outputs, run(pb=pb, **kwargs)))
+
+
+def run_workflow(wf: WorkflowObj, vals: List[int], coords: List[Tuple[float, float]], rand_count: int,
+                 alt_coords: List[Tuple[float, float]] = None, img_path: str = "", mask_path: str = "",
+                 clust_area: bool = False, seed: int = DEFAULT_SEED, use_cache: bool = True, pb=None,
+                 ctx: AnalysisContext = None, token: CancelToken = None, backend: str = 'thread') -> DataObj:
+    """
+    RUN WORKFLOW ANALYSIS
+    __________________
+    @wf: workflow to run
+    @vals: workflow props, see default_values
+    @coords: gold coords (px)
+    @rand_count: number of random coords to compare against
+    @alt_coords: landmark coords (px)
+    @img_path: image path
+    @mask_path: mask path
+    @clust_area: compute cluster areas
+    @seed: random coordinate seed
+    @use_cache: reuse results of identical earlier runs from the result cache
+    @pb: progress.ProgressReporter, or anything with emit(percent). Logs progress if not given
+    @ctx: intermediates shared with the other workflows run on the same data, a private one if not given
+    @token: cancels the run, it then raises cancel.Cancelled instead of returning (or caching) results
+    @backend: 'thread' computes in the calling thread, 'process' in a worker process (see procpool.py)
+    """
+    pb = as_reporter(pb, wf['name'])
+    # identical inputs, props and seed give identical results, reuse them if they were computed before
+    key = None
+    if use_cache:
+        engines = ctx.engines if ctx is not None else DEFAULT_ENGINES
+        # engines only match the reference within tolerance, keep their results apart
+        key = ResultCache.key(wf['type'], vals, seed, files=[img_path, mask_path], arrays=[coords, alt_coords],
+                              rand_count=rand_count, clust_area=clust_area,
+                              **({'engines': sorted(engines.items())} if engines else {}))
+        cached = get_cache().get(key)
+        if cached is not None:
+            logging.info('%s: loaded cached results', wf["name"])
+            pb.finish('cached')
+            return cached
+    if ctx is None or not ctx.matches(coords, alt_coords, img_path, mask_path):
+        ctx = AnalysisContext(coords, alt_coords, img_path, mask_path)
+    if backend == 'process':
+        # the same analysis on the dataset shared with a worker process
+        from procpool import ProcessBackend
+        data = ProcessBackend.instance().run(wf, vals, rand_count, clust_area, seed, pb, ctx, token)
+    else:
+        ctx = ctx.with_random(rand_count, seed, token)
+        rand_coords = ctx.points('rand')
+        pb.stage('analysis')
+        outputs = run_plugin(wf, vals, workflow_inputs(coords, rand_coords, alt_coords, img_path, mask_path,
+                                                       clust_area, ctx), pb, engine=ctx.engines.get(wf['name']))
+        # workflows check at chunk boundaries, this also catches one that finished after being superseded
+        ctx.check()
+        data = DataObj(*[outputs.get(name, pd.DataFrame()) for name in ('real_df1', 'real_df2', 'rand_df1',
+                                                                         'rand_df2')], rand_coords=rand_coords)
+    if key is not None:
+        get_cache().put(key, data, meta={'wf': wf['name'], 'inputs': [img_path, mask_path], 'vals': vals, 'seed': seed})
+    logging.info('finished %s analysis', wf["name"])
+    return data
+
+
+def finalize_data(wf: WorkflowObj, data: DataObj, output_scalar: float):
+    """ SORT RESULTS BY THE GRAPHED VALUE AND FILL final_real / final_rand IN THE OUTPUT UNIT (IN PLACE) """
+    x_type = wf["graph"]["x_type"]
+    # fix csv index not matching id
+    data.real_df1.sort_values(x_type, inplace=True)
+    data.real_df1 = data.real_df1.reset_index(drop=True)
+    data.final_real = pixels_conversion(data=data.real_df1, unit=Unit.PIXEL, scalar=float(output_scalar))
+    if x_type in data.rand_df1.columns and len(data.rand_df1[x_type]) > 0:
+        data.rand_df1.sort_values(x_type, inplace=True)
+        data.rand_df1 = data.rand_df1.reset_index(drop=True)
+    if not data.rand_df1.empty:
+        data.final_rand = pixels_conversion(data=data.rand_df1, unit=Unit.PIXEL, scalar=float(output_scalar))
+
+
+def layer_drawers(wf: WorkflowObj, data: DataObj, n: List[int], palette: List[Tuple[int, int, int]],
+                  r_palette: List[Tuple[int, int, int]], vals: List[int], coords: List[Tuple[float, float]] = None,
+                  rand_coords: List[Tuple[float, float]] = None, alt_coords: List[Tuple[float, float]] = None,
+                  mask_path: str = "", clust_area: bool = False) -> Dict[str, Callable[..., AnnotationLayer]]:
+    """
+    ANNOTATION LAYER DRAW CALLS
+    __________________
+    @wf: workflow that was run
+    @data: its results
+    @n: graph bin counts, decide each annotation's color
+    @palette: real palette, one color per bin
+    @r_palette: random palette, one color per bin
+    @vals: workflow props the results were computed with
+    @coords: gold coords (px)
+    @rand_coords: random coords (px)
+    @alt_coords: landmark coords (px)
+    @mask_path: mask path
+    @clust_area: draw cluster areas
+    @return: 'real' and 'rand' callables drawing onto the AnnotationLayer passed as layer=
+    """
+    return get_plugin(wf['type']).layers(data, n, palette, r_palette, vals, workflow_inputs(
+        coords, rand_coords, alt_coords, mask_path=mask_path, clust_area=clust_area))
+
+
+def export_results(wf: WorkflowObj, data: DataObj, output_ops: OutputOptions, img: str, base_img: np.ndarray,
+                   layers: List[AnnotationLayer], graph: np.ndarray, params: dict = None) -> str:
+    """
+    WRITE RUN OUTPUT
+    __________________
+    @wf: workflow that was run
+    @data: its finalized results
+    @output_ops: output options
+    @img: image path, names the run folder
+    @base_img: BGR image the layers are burned into, None to skip the drawn image
+    @layers: annotation layers to burn in
+    @graph: RGBA graph image, None to skip it
+    @params: workflow props recorded in the run manifest
+    @return: run folder
+    """
+    out_start = output_ops.output_dir if output_ops.output_dir is not None else DEFAULT_OUTPUT_DIR
+    o_dir = f'{out_start}/{wf["name"].lower()}'
+    logging.info('%s: prepare to download output', wf["name"])
+    img_name = os.path.splitext(os.path.basename(img))[0]
+    out_dir = f'{o_dir}/{img_name}-{datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}'
+    os.makedirs(o_dir, exist_ok=True)
+    # batches export same named images within the same second, never let two runs share a folder
+    run_dir, suffix = out_dir, 1
+    while True:
+        try:
+            os.mkdir(out_dir)
+            break
+        except FileExistsError:
+            suffix += 1
+            out_dir = f'{run_dir}-{suffix}'
+    # every artifact is written concurrently through the shared, bounded output pool
+    writer = get_writer()
+    unit = enum_to_unit(output_ops.output_unit)
+    jobs = []
+    if graph is not None:
+        jobs.append(writer.submit(f'{out_dir}/{wf["name"].lower()}_graph.jpg', write_rgba, graph))
+    for fmt in output_ops.formats:
+        jobs.append(writer.submit(f'{out_dir}/real_{wf["name"].lower()}_output_{unit}.{fmt}',
+                                  TABLE_WRITERS[fmt], data.final_real))
+        jobs.append(writer.submit(f'{out_dir}/rand_{wf["name"].lower()}_output_{unit}.{fmt}',
+                                  TABLE_WRITERS[fmt], data.final_rand))
+    if base_img is not None:
+        # annotations are only burned into pixels for export
+        def burn_and_write(path: str):
+            drawn_img = base_img.copy()
+            for layer in layers:
+                layer.burn(drawn_img)
+            write_tiff(drawn_img, path, output_ops.tiff_compression)
+        jobs.append(writer.submit(f'{out_dir}/drawn_{wf["name"].lower()}_img.tif', burn_and_write))
+    else:
+        logging.info('No display image generated. An error likely occurred when running workflow.')
+    # if workflow fills full dfs, output those two (converted inside the write task)
+    if not data.real_df2.empty and not data.rand_df2.empty:
+        for name, df in (('real', data.real_df2), ('rand', data.rand_df2)):
+            for fmt in output_ops.formats:
+                jobs.append(writer.submit(
+                    f'{out_dir}/detailed_{name}_{wf["name"].lower()}_output_{unit}.{fmt}',
+                    lambda df, fmt, path: TABLE_WRITERS[fmt](pixels_conversion(
+                        data=df, unit=Unit.PIXEL, scalar=float(output_ops.output_scalar)), path), df, fmt))
+    timings = writer.wait(jobs, name=wf["name"])
+    logging.info('%s: wrote %d files in %.3fs of write time', wf["name"], len(timings), sum(t[1] for t in timings))
+    # index the run and delete old ones to make space if applicable
+    run_params = {'img': img, 'unit': unit, 'scalar': output_ops.output_scalar, **(params or {})}
+    retention = dict(max_runs=output_ops.keep_runs, max_age_days=output_ops.keep_days,
+                     max_bytes=output_ops.keep_mb * 2 ** 20 if output_ops.keep_mb else None) \
+        if output_ops.delete_old else {}
+    pruned = record_run(o_dir, out_dir, size=sum(t[2] for t in timings), params=run_params, **retention)
+    if len(pruned) > 0:
+        logging.info('%s: pruned %d old runs', wf["name"], len(pruned))
+    return out_dir
+
+
+# coords and shared intermediates of the last dataset processed, a batch worker often runs several workflows on it
+_last_dataset: Optional[Tuple[tuple, AnalysisContext]] = None
+
+
+def process_dataset(ds: Dict[str, str], wf: WorkflowObj, vals: List[int], batch_ops: BatchOptions,
+                    output_ops: OutputOptions, pb=None, token: CancelToken = None,
+                    engines: Dict[str, str] = None) -> str:
+    """
+    RUN ONE WORKFLOW ON ONE DATASET END TO END
+    __________________
+    @ds: dataset files keyed img, mask, csv and csv2 (see utils.match_dataset_files) plus a display name
+    @wf: workflow to run
+    @vals: workflow props
+    @batch_ops: input, analysis and drawing settings
+    @output_ops: output options
+    @pb: progress.ProgressReporter, or anything with emit(percent). Logs progress if not given
+    @token: cancels the job, nothing is exported once it is cancelled
+    @engines: analysis engines (see AnalysisContext), DEFAULT_ENGINES if not given
+    @return: run folder the results were written to
+    """
+    timings = RunTimings(f'{ds["name"]}: {wf["name"]}')
+    with memory_profile(batch_ops.profile_memory or MEMORY_PROFILE):
+        with timings.activate():
+            out_dir = _process_dataset(ds, wf, vals, batch_ops, output_ops, as_reporter(pb, timings.name), token,
+                                       engines)
+        timings.write(out_dir)
+    return out_dir
+
+
+def _process_dataset(ds: Dict[str, str], wf: WorkflowObj, vals: List[int], batch_ops: BatchOptions,
+                     output_ops: OutputOptions, pb: ProgressReporter, token: Optional[CancelToken],
+                     engines: Optional[Dict[str, str]]) -> str:
+    global _last_dataset
+    start = time.perf_counter()
+    ds_key = (ds['img'], ds['mask'], ds['csv'], ds['csv2'], batch_ops.in_unit, batch_ops.in_scalar)
+    if _last_dataset is not None and _last_dataset[0] == ds_key:
+        ctx = _last_dataset[1]
+        coords, alt_coords = ctx.coords, ctx.alt_coords
+    else:
+        with span('load'):
+            coords, alt_coords = load_coords(ds['img'], ds['mask'], ds['csv'], ds['csv2'], batch_ops.in_unit,
+                                             batch_ops.in_scalar)
+        logging.info('%s: loaded %d particles and %d landmarks', ds['name'], len(coords), len(alt_coords))
+        ctx = AnalysisContext(coords, alt_coords, ds['img'], ds['mask'])
+        _last_dataset = (ds_key, ctx)
+    if engines is not None:
+        ctx = ctx.with_engines(engines)
+    with span('analysis'):
+        data = run_workflow(wf, vals, coords, batch_ops.rand_count or len(coords), alt_coords, ds['img'],
+                            ds['mask'], clust_area=batch_ops.clust_area, seed=batch_ops.seed,
+                            use_cache=batch_ops.use_cache, pb=pb.span(0, 0.8), ctx=ctx, token=token)
+    pb.stage('drawing', 0.8)
+    finalize_data(wf, data, output_ops.output_scalar)
+    with span('graph'):
+        graph, n = render_graph(wf, data.final_real, data.final_rand, show_real=True,
+                                show_rand=batch_ops.show_rand, pal_type=batch_ops.pal_type,
+                                r_pal_type=batch_ops.r_pal_type, n_bins=batch_ops.n_bins,
+                                output_unit=output_ops.output_unit)
+    base_img, layers = None, []
+    if batch_ops.draw_image:
+        with span('draw'):
+            base_img = cv2.imread(ds['img'])
+            drawers = layer_drawers(wf, data, n,
+                                    create_color_pal(n_bins=int(len(n)), palette_type=batch_ops.pal_type),
+                                    create_color_pal(n_bins=int(len(n)), palette_type=batch_ops.r_pal_type), vals,
+                                    coords=coords, rand_coords=data.rand_coords, alt_coords=alt_coords,
+                                    mask_path=ds['mask'], clust_area=batch_ops.clust_area)
+            kinds = ['real', 'rand'] if batch_ops.show_rand else ['real']
+            layers = [drawers[kind](layer=AnnotationLayer(base_img.shape)) for kind in kinds if kind in drawers]
+    if token is not None:
+        token.check()
+    pb.stage('exporting', 0.9)
+    with span('export'):
+        out_dir = export_results(wf, data, output_ops, ds['img'], base_img, layers, graph,
+                                 {prop['title']: val for prop, val in zip(wf['props'], vals)})
+    pb.finish()
+    logging.info('%s: %s done in %.1fs -> %s', ds['name'], wf['name'], time.perf_counter() - start, out_dir)
+    return out_dir
@@ -0,0 +1,357 @@
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context, shared_memory
+from multiprocessing.managers import SyncManager
+from logging.handlers import QueueHandler, QueueListener
+from globals import ANALYSIS_PROCESSES, NUMERIC_THREADS
+from typings import DataObj, WorkflowObj
+from typing import Dict, List, Optional, Tuple
+from analysis import AnalysisContext
+from cancel import CancelToken
+from progress import ProgressReporter, QueueSink
+from timing import RunTimings, activate, adopt
+import pandas as pd
+import numpy as np
+import threading
+import logging
+import atexit
+import signal
+import queue
+import uuid
+import time
+import os
+
+"""
+PROCESS EXECUTION BACKEND
+___________________
+Runs workflow analyses in worker processes instead of threads of the app, so their python loops (nearest neighbors,
+goldstar, random coords) do not hold the GIL the interface and the other pages need. Selected with
+ANALYSIS_BACKEND = 'process', see pipeline.run_workflow.
+A loaded dataset is published once: its coords and p-face masks are copied into shared memory blocks every worker
+maps instead of receiving pickled copies. Each worker keeps a context of the last dataset it attached, so workflows
+run by the same worker share its intermediates. Results come back as plain column arrays (see pack_data), progress
+through a queue and the worker's log records into this process' logging.
+Workers are spawned, never forked, a fork of the interface process would inherit its threads and Qt state.
+"""
+
+_spawn = get_context('spawn')
+# seconds between looking at progress and cancellation while a worker runs
+POLL_SECS = 0.05
+
+
+class SharedArray:
+    """
+    SHARED ARRAY
+    __________________
+    @name: shared memory block holding the data
+    @shape: array shape
+    @dtype: numpy dtype string
+
+    Picklable handle on an array in shared memory, see share and attach.
+    """
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    @classmethod
+    def share(cls, arr: np.ndarray) -> Tuple['SharedArray', shared_memory.SharedMemory]:
+        """ COPY arr INTO A NEW BLOCK, THE CALLER UNLINKS THE BLOCK ONCE NO WORKER NEEDS IT """
+        arr = np.ascontiguousarray(arr)
+        block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, arr.dtype, buffer=block.buf)[...] = arr
+        return cls(block.name, arr.shape, arr.dtype.str), block
+
+    def attach(self) -> Tuple[np.ndarray, shared_memory.SharedMemory]:
+        """ THE ARRAY, MAPPED WITHOUT COPYING. VALID WHILE THE BLOCK IS KEPT OPEN """
+        block = shared_memory.SharedMemory(name=self.name)
+        return np.ndarray(self.shape, np.dtype(self.dtype), buffer=block.buf), block
+
+
+class SharedDataset:
+    """
+    SHARED DATASET
+    __________________
+    @ctx: context of the loaded dataset, its masks are computed (once) to be shared
+
+    The inputs of one dataset in shared memory. spec is what a worker gets with every job.
+    """
+    def __init__(self, ctx: AnalysisContext):
+        self.ctx = ctx
+        self.blocks: List[shared_memory.SharedMemory] = []
+        # submitted runs that may still attach the blocks, see ProcessBackend.publish
+        self.jobs = 0
+        masks = {}
+        if len(ctx.img_path) > 0:
+            masks[True] = ctx.get('pface_mask', True)
+            if len(ctx.mask_path) > 0:
+                masks[False] = ctx.get('pface_mask', False)
+        shared = {}
+        for crop, mask in masks.items():
+            # usually one and the same array, see analysis._pface_mask
+            if id(mask) not in shared:
+                shared[id(mask)] = self.share(mask)
+        self.spec = {'id': uuid.uuid4().hex, 'img_path': ctx.img_path, 'mask_path': ctx.mask_path,
+                     'image_shape': ctx.get('image_shape') if len(ctx.img_path) > 0 else None,
+                     'coords': self.share(np.asarray(ctx.coords, dtype=np.float64).reshape(-1, 2)),
+                     'alt_coords': self.share(np.asarray(ctx.alt_coords).reshape(-1, 2))
+                     if ctx.alt_coords is not None else None,
+                     'masks': {crop: shared[id(mask)] for crop, mask in masks.items()}}
+
+    def share(self, arr: np.ndarray) -> SharedArray:
+        handle, block = SharedArray.share(arr)
+        self.blocks.append(block)
+        return handle
+
+    def release(self):
+        """ FREE THE BLOCKS, WORKERS STILL MAPPING THEM KEEP THEIR VIEWS UNTIL THEY LET GO """
+        for block in self.blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self.blocks = []
+
+
+def pack_frame(df: pd.DataFrame) -> dict:
+    """ DATAFRAME AS ITS COLUMNS' ARRAYS, ONE PICKLED BUFFER PER COLUMN """
+    plain = isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1
+    return {'columns': df.columns, 'arrays': [df.iloc[:, i].to_numpy() for i in range(df.shape[1])],
+            'index': None if plain else df.index, 'rows': len(df)}
+
+
+def unpack_frame(packed: dict) -> pd.DataFrame:
+    index = packed['index'] if packed['index'] is not None else pd.RangeIndex(packed['rows'])
+    df = pd.DataFrame({i: arr for i, arr in enumerate(packed['arrays'])}, index=index)
+    df.columns = packed['columns']
+    return df
+
+
+def pack_data(data: DataObj) -> dict:
+    """ RESULTS OF A RUN AS COMPACT ARRAYS, RANDOM COORDS AS ONE (N, 2) ARRAY INSTEAD OF A LIST OF POINTS """
+    return {'frames': [pack_frame(df) for df in (data.real_df1, data.real_df2, data.rand_df1, data.rand_df2)],
+            'rand_coords': np.asarray(data.rand_coords)}
+
+
+def unpack_data(packed: dict) -> DataObj:
+    return DataObj(*[unpack_frame(frame) for frame in packed['frames']], rand_coords=list(packed['rand_coords']))
+
+
+""" WORKER PROCESSES """
+
+# the dataset this worker attached last: spec id, its context and the blocks its arrays map
+_attached: Dict[str, object] = {}
+
+
+def _init_worker(level: int, log_q, threads: int):
+    # ctrl+c reaches the whole process group, the app handles it
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_q)]
+    root.setLevel(level)
+    # workers share the cores, keep their numeric pools from oversubscribing them
+    import numexpr
+    numexpr.set_num_threads(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=threads)
+    except ImportError:
+        pass
+
+
+def _noop():
+    return os.getpid()
+
+
+def _context(spec: dict) -> AnalysisContext:
+    """ CONTEXT OF THE DATASET spec DESCRIBES, MAPPED FROM SHARED MEMORY ON ITS FIRST JOB IN THIS WORKER """
+    if _attached.get('id') == spec['id']:
+        return _attached['ctx']
+    # the previous dataset's arrays go with its context, then its blocks can be closed
+    previous = _attached.get('blocks', [])
+    _attached.clear()
+    for block in previous:
+        try:
+            block.close()
+        except BufferError:
+            # still referenced, unmapped when collected
+            pass
+    blocks = []
+
+    def attach(handle: SharedArray) -> np.ndarray:
+        arr, block = handle.attach()
+        blocks.append(block)
+        return arr
+    # workflows expect the coords as lists of [y, x], as loaded
+    coords = attach(spec['coords']).tolist()
+    alt_coords = attach(spec['alt_coords']).tolist() if spec['alt_coords'] is not None else None
+    ctx = AnalysisContext(coords, alt_coords, spec['img_path'], spec['mask_path'])
+    if spec['image_shape'] is not None:
+        ctx.put('image_shape', spec['image_shape'])
+    for crop, handle in spec['masks'].items():
+        ctx.put('pface_mask', attach(handle), crop)
+    _attached.update({'id': spec['id'], 'ctx': ctx, 'blocks': blocks})
+    return ctx
+
+
+def _run(spec: dict, wf: WorkflowObj, vals: List[int], rand_count: int, clust_area: bool, seed: int,
+         engines: Dict[str, str], q, cancel_event) -> dict:
+    """ WORKER ENTRY, RETURNS THE PACKED RESULTS AND THE SPANS TIMED WHILE COMPUTING THEM """
+    from pipeline import run_workflow
+    ctx = _context(spec).with_engines(engines)
+    timings = RunTimings(wf['name'])
+    origin = time.time() - (time.perf_counter() - timings.origin)
+    with activate(timings):
+        data = run_workflow(wf, vals, ctx.coords, rand_count, ctx.alt_coords, spec['img_path'], spec['mask_path'],
+                            clust_area=clust_area, seed=seed, use_cache=False, pb=ProgressReporter(QueueSink(q, 0)),
+                            ctx=ctx, token=CancelToken(event=cancel_event))
+    return {'data': pack_data(data), 'spans': timings.spans, 'origin': origin}
+
+
+""" APP SIDE """
+
+
+class _Forward(logging.Handler):
+    """ HANDS A WORKER'S LOG RECORD TO THE LOGGER IT WAS LOGGED ON HERE """
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger(record.name).handle(record)
+
+
+class ProcessBackend:
+    """
+    PROCESS BACKEND
+    __________________
+    @workers: worker processes, ANALYSIS_PROCESSES or one per core if not given
+
+    Spawns its workers and the manager process (progress queues, cancel events, log queue) on first use. One per
+    app, see instance().
+    """
+    _instance: Optional['ProcessBackend'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, workers: int = ANALYSIS_PROCESSES):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.threads = NUMERIC_THREADS or max(1, (os.cpu_count() or 1) // self.workers)
+        self.lock = threading.Lock()
+        self.manager = SyncManager(ctx=_spawn)
+        self.manager.start()
+        self.log_q = self.manager.Queue()
+        self.log_listener = QueueListener(self.log_q, _Forward())
+        self.log_listener.start()
+        self.pool = self._new_pool()
+        # the dataset published last, and every published one by spec id until it is released: once replaced and
+        # its last run is done
+        self.dataset: Optional[SharedDataset] = None
+        self.datasets: Dict[str, SharedDataset] = {}
+        self.closed = False
+        atexit.register(self.shutdown)
+
+    @classmethod
+    def instance(cls) -> 'ProcessBackend':
+        """ THE APP'S BACKEND, STARTED ON FIRST USE (FROM ANY THREAD) """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=_spawn, initializer=_init_worker,
+                                   initargs=(logging.getLogger().getEffectiveLevel(), self.log_q, self.threads))
+
+    def start(self):
+        """ SPAWN EVERY WORKER NOW (E.G. DURING THE WARM UP) RATHER THAN WITH THE FIRST RUN """
+        for future in [self.pool.submit(_noop) for _ in range(self.workers)]:
+            future.result()
+        logging.info('process backend: %d workers ready', self.workers)
+
+    def publish(self, ctx: AnalysisContext) -> dict:
+        """ SPEC OF ctx'S DATASET IN SHARED MEMORY, PUBLISHED ON ITS FIRST RUN. COUNTS A RUN, SEE unpublish """
+        with self.lock:
+            if self.dataset is None or self.dataset.ctx is not ctx:
+                previous = self.dataset
+                self.dataset = SharedDataset(ctx)
+                self.datasets[self.dataset.spec['id']] = self.dataset
+                if previous is not None and previous.jobs == 0:
+                    self._release(previous)
+            self.dataset.jobs += 1
+            return self.dataset.spec
+
+    def unpublish(self, spec: dict):
+        """ A RUN ON spec'S DATASET IS DONE, A REPLACED DATASET IS RELEASED WITH ITS LAST RUN """
+        with self.lock:
+            dataset = self.datasets.get(spec['id'])
+            if dataset is None:
+                return
+            dataset.jobs -= 1
+            if dataset.jobs == 0 and dataset is not self.dataset:
+                self._release(dataset)
+
+    def _release(self, dataset: SharedDataset):
+        # holding self.lock
+        self.datasets.pop(dataset.spec['id'], None)
+        dataset.release()
+
+    def run(self, wf: WorkflowObj, vals: List[int], rand_count: int, clust_area: bool, seed: int,
+            pb: ProgressReporter, ctx: AnalysisContext, token: CancelToken = None) -> DataObj:
+        """ pipeline.run_workflow's analysis IN A WORKER, SAME ARGUMENTS, SAME RESULTS """
+        # the dataset's blocks stay until this run's worker is done with them
+        spec = self.publish(ctx)
+        try:
+            q, cancel_event = self.manager.Queue(), self.manager.Event()
+            with self.lock:
+                pool = self.pool
+            future = pool.submit(_run, spec, wf, vals, rand_count, clust_area, seed, ctx.engines, q, cancel_event)
+            try:
+                while True:
+                    try:
+                        result = future.result(timeout=POLL_SECS)
+                        break
+                    except TimeoutError:
+                        pass
+                    self._drain(q, pb)
+                    if token is not None and token.cancelled and not cancel_event.is_set():
+                        # the worker stops at its next chunk boundary and raises Cancelled
+                        cancel_event.set()
+            except BrokenProcessPool:
+                with self.lock:
+                    if self.pool is pool:
+                        logging.warning('process backend: a worker died, restarting the pool')
+                        self.pool = self._new_pool()
+                raise
+        finally:
+            self.unpublish(spec)
+        self._drain(q, pb)
+        # cancelled after the worker finished, e.g. superseded while the result was on its way
+        if token is not None:
+            token.check()
+        adopt(result['spans'], result['origin'])
+        return unpack_data(result['data'])
+
+    @staticmethod
+    def _drain(q, pb: ProgressReporter):
+        while True:
+            try:
+                _, fraction, stage, eta = q.get_nowait()
+            except queue.Empty:
+                return
+            pb.update(fraction, stage)
+
+    def shutdown(self):
+        """ STOP THE WORKERS AND THE MANAGER AND FREE THE SHARED MEMORY, ONLY THE FIRST CALL DOES ANYTHING """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+        atexit.unregister(self.shutdown)
+        with ProcessBackend._instance_lock:
+            # instance() starts a new backend after this
+            if ProcessBackend._instance is self:
+                ProcessBackend._instance = None
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.log_listener.stop()
+        with self.lock:
+            for dataset in list(self.datasets.values()):
+                self._release(dataset)
+            self.dataset = None
+        self.manager.shutdown()
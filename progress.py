@@ -0,0 +1,195 @@
+from globals import PROGRESS_MAX_RATE, PROGRESS_LOG_STEP
+from typing import Callable, Optional
+import logging
+import time
+
+"""
+PROGRESS REPORTING
+___________________
+Workflows report to a ProgressReporter (their pb) and never to a widget or queue directly. The reporter keeps the
+fraction done, the current stage and an ETA, and hands coalesced ProgressUpdates to a sink:
+    - GUI: a pyqtSignal(object)'s emit, see threads.AnalysisWorker
+    - headless: LogSink, logs every few percent
+    - process pool: QueueSink, sends updates back to the scheduler process
+"""
+
+
+class ProgressUpdate:
+    """
+    PROGRESS UPDATE
+    __________________
+    @fraction: 0..1 done
+    @stage: what is running right now
+    @eta: seconds left, None until there is enough progress to extrapolate from
+    """
+    fraction: float
+    stage: str
+    eta: Optional[float]
+
+    def __init__(self, fraction: float, stage: str = '', eta: Optional[float] = None):
+        self.fraction = fraction
+        self.stage = stage
+        self.eta = eta
+
+    @property
+    def percent(self) -> int:
+        return int(self.fraction * 100)
+
+    def __repr__(self):
+        return f'ProgressUpdate({self.fraction:.3f}, {self.stage!r}, {self.eta})'
+
+
+def fmt_eta(secs: Optional[float]) -> str:
+    """ SHORT HUMAN READABLE DURATION, '?' IF UNKNOWN """
+    if secs is None:
+        return '?'
+    secs = int(secs)
+    if secs >= 3600:
+        return f'{secs // 3600}h{secs // 60 % 60:02d}m'
+    return f'{secs // 60}m{secs % 60:02d}s' if secs >= 60 else f'{secs}s'
+
+
+class ProgressReporter:
+    """
+    PROGRESS REPORTER
+    __________________
+    @sink: called with every ProgressUpdate that is let through
+    @max_rate: updates handed to the sink per second at most, stage changes and completion always go through
+
+    Cheap enough to call once per item: update() only records the new state and checks the clock, the sink is
+    called when an update is due. Progress never goes backwards.
+    """
+    def __init__(self, sink: Callable[[ProgressUpdate], None], max_rate: float = PROGRESS_MAX_RATE):
+        self.sink = sink
+        self.min_interval = 1 / max_rate if max_rate else 0
+        self.start = time.perf_counter()
+        self.fraction = 0.0
+        self.stage_name = ''
+        self._sent_at = None
+
+    def eta(self) -> Optional[float]:
+        """ SECONDS LEFT, EXTRAPOLATED FROM THE RATE SO FAR """
+        if self.fraction <= 0:
+            return None
+        elapsed = time.perf_counter() - self.start
+        return elapsed * (1 - self.fraction) / self.fraction
+
+    def update(self, fraction: float = None, stage: str = None):
+        """ RECORD PROGRESS (0..1) AND/OR A NEW STAGE, PASSED ON TO THE SINK WHEN DUE """
+        force = False
+        if fraction is not None:
+            fraction = min(max(float(fraction), 0.0), 1.0)
+            if fraction > self.fraction:
+                force = fraction >= 1
+                self.fraction = fraction
+        if stage is not None and stage != self.stage_name:
+            self.stage_name = stage
+            force = True
+        now = time.perf_counter()
+        if force or self._sent_at is None or now - self._sent_at >= self.min_interval:
+            self._sent_at = now
+            self.sink(ProgressUpdate(self.fraction, self.stage_name, self.eta()))
+
+    def stage(self, name: str, fraction: float = None):
+        """ START A NAMED STAGE, OPTIONALLY AT A GIVEN FRACTION """
+        self.update(fraction, name)
+
+    def advance(self, done: int, total: int, start: float = 0.0, end: float = 1.0):
+        """ done OF total ITEMS OF A STEP SPANNING start..end OF THE WHOLE RUN """
+        if total > 0:
+            self.update(start + (end - start) * done / total)
+
+    def emit(self, value):
+        """ PERCENT (0..100), FOR CODE WRITTEN AGAINST A pyqtSignal(int). ANYTHING BUT A NUMBER IS IGNORED """
+        if isinstance(value, (int, float)):
+            self.update(value / 100)
+
+    def finish(self, stage: str = 'done'):
+        self.update(1.0, stage)
+
+    def span(self, start: float, end: float) -> 'ProgressReporter':
+        """ REPORTER FOR A STEP COVERING start..end OF THIS ONE, E.G. THE ANALYSIS PART OF A WHOLE RUN """
+        return ProgressSpan(self, start, end)
+
+
+class ProgressSpan(ProgressReporter):
+    """
+    PROGRESS SPAN
+    __________________
+    @parent: reporter the step is part of
+    @start: parent fraction the step starts at
+    @end: parent fraction the step ends at
+
+    0..1 of the step maps onto start..end of the parent, which does the coalescing, ETA and sending.
+    """
+    def __init__(self, parent: ProgressReporter, start: float, end: float):
+        self.parent = parent
+        self.start_at = start
+        self.end_at = end
+
+    @property
+    def fraction(self) -> float:
+        return min(max((self.parent.fraction - self.start_at) / ((self.end_at - self.start_at) or 1), 0.0), 1.0)
+
+    @property
+    def stage_name(self) -> str:
+        return self.parent.stage_name
+
+    def eta(self) -> Optional[float]:
+        return self.parent.eta()
+
+    def update(self, fraction: float = None, stage: str = None):
+        if fraction is not None:
+            fraction = self.start_at + (self.end_at - self.start_at) * min(max(float(fraction), 0.0), 1.0)
+        self.parent.update(fraction, stage)
+
+
+class LogSink:
+    """
+    LOG SINK
+    __________________
+    @name: label logged with every update
+    @step: only log when progress moves at least this many percent (or the stage changes)
+    """
+    def __init__(self, name: str, step: int = PROGRESS_LOG_STEP):
+        self.name = name
+        self.step = step
+        self.last = -step
+        self.stage = None
+
+    def __call__(self, update: ProgressUpdate):
+        if update.percent - self.last >= self.step or update.stage != self.stage or \
+                update.percent >= 100 > self.last:
+            self.last = update.percent
+            self.stage = update.stage
+            logging.info('%s: %d%% %s(eta %s)', self.name, update.percent,
+                         f'{update.stage} ' if update.stage else '', fmt_eta(update.eta))
+
+
+class QueueSink:
+    """
+    QUEUE SINK
+    __________________
+    @q: queue shared with the scheduler process
+    @job_id: job the updates belong to
+
+    Sends (job_id, fraction, stage, eta) tuples from a worker process, dropping them if the queue is gone.
+    """
+    def __init__(self, q, job_id: int):
+        self.q = q
+        self.job_id = job_id
+
+    def __call__(self, update: ProgressUpdate):
+        try:
+            self.q.put_nowait((self.job_id, update.fraction, update.stage, update.eta))
+        except Exception:
+            pass
+
+
+def as_reporter(pb, name: str = '') -> ProgressReporter:
+    """ pb AS A ProgressReporter: KEPT IF IT IS ONE, A LOGGING ONE FOR NONE, ELSE WRAPS ITS emit(PERCENT) """
+    if isinstance(pb, ProgressReporter):
+        return pb
+    if pb is None:
+        return ProgressReporter(LogSink(name))
+    return ProgressReporter(lambda update: pb.emit(update.percent))
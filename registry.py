@@ -0,0 +1,76 @@
+from typings import Workflow, WorkflowObj, WorkflowPlugin
+from typing import Dict, List
+from analysis import plan, engines_of
+from globals import REFERENCE_ENGINE, DEFAULT_ENGINES, LOW_MEMORY_ENGINES
+# workflows
+from workflows import nnd, clust, separation, gold_rippler, goldstar
+
+"""
+WORKFLOW REGISTRY
+___________________
+Every analysis workflow declares a WorkflowPlugin (metadata and graph spec, run function and its inputs/outputs,
+annotation layers, inspector table and the shared intermediates it reads) as WORKFLOW in its own module. The pages,
+pipeline, result cache, scheduler and headless runner all look workflows up here instead of switching on their type.
+"""
+
+_plugins: Dict[Workflow, WorkflowPlugin] = {}
+
+""" METADATA OF EVERY REGISTERED WORKFLOW, IN REGISTRATION (DISPLAY) ORDER """
+WORKFLOWS: List[WorkflowObj] = []
+
+
+def register(plugin: WorkflowPlugin) -> WorkflowPlugin:
+    """ ADD A WORKFLOW, ITS TYPE MUST BE UNIQUE """
+    wf_type = plugin.meta['type']
+    if wf_type in _plugins:
+        raise ValueError(f'workflow {wf_type.name} is already registered')
+    if len(plugin.props) != len(plugin.meta['props']):
+        raise ValueError(f'workflow {wf_type.name} maps {len(plugin.props)} of its {len(plugin.meta["props"])} props')
+    # unknown or circular intermediates fail here instead of mid run
+    plan(plugin.needs)
+    _plugins[wf_type] = plugin
+    WORKFLOWS.append(plugin.meta)
+    return plugin
+
+
+def analysis_plan(wfs: List[WorkflowObj]) -> List[str]:
+    """ SHARED INTERMEDIATES THE GIVEN WORKFLOWS NEED, DEPENDENCIES FIRST, EACH ONCE """
+    return plan([need for wf in wfs for need in get_plugin(wf['type']).needs])
+
+
+def check_engines(engines: Dict[str, str]):
+    """ RAISE KeyError IF AN ENGINE SETTING NAMES AN UNKNOWN INTERMEDIATE, WORKFLOW OR ENGINE """
+    by_name = {plugin.meta['name']: plugin for plugin in _plugins.values()}
+    for target, engine in engines.items():
+        if target in by_name:
+            known = [REFERENCE_ENGINE] + list(by_name[target].engines)
+        else:
+            try:
+                plan([target])
+            except KeyError:
+                raise KeyError(f'no workflow or intermediate named {target}') from None
+            known = engines_of(target)
+        if engine not in known:
+            raise KeyError(f'{target} has no {engine} engine, only {", ".join(known)}')
+
+
+def low_memory_engines(wf: WorkflowObj) -> Dict[str, str]:
+    """ LOW_MEMORY_ENGINES THAT APPLY TO A WORKFLOW: ITS OWN AND THOSE OF THE INTERMEDIATES IT NEEDS """
+    targets = {wf['name'], *plan(get_plugin(wf['type']).needs)}
+    return {target: engine for target, engine in LOW_MEMORY_ENGINES.items() if target in targets}
+
+
+def get_plugin(wf_type: Workflow) -> WorkflowPlugin:
+    """ REGISTERED PLUGIN OF A WORKFLOW TYPE """
+    try:
+        return _plugins[wf_type]
+    except KeyError:
+        raise KeyError(f'workflow {wf_type} is not registered') from None
+
+
+# ADD NEW WORKFLOWS HERE
+for module in (nnd, clust, separation, gold_rippler, goldstar):
+    register(module.WORKFLOW)
+# a misnamed default or low memory engine fails at startup instead of mid run
+check_engines(DEFAULT_ENGINES)
+check_engines(LOW_MEMORY_ENGINES)
@@ -0,0 +1,297 @@
+from concurrent.futures import ProcessPoolExecutor, Future, CancelledError, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from globals import BATCH_WORKERS, BATCH_MAX_MEMORY_MB, BATCH_IMAGE_COPIES, BATCH_JOB_OVERHEAD_MB, \
+    BATCH_JOB_ATTEMPTS, BATCH_REPORT_SECS, DEFAULT_ENGINES, LOW_MEMORY_IMAGE_COPIES
+from typings import BatchOptions, OutputOptions, WorkflowObj
+from typing import Deque, Dict, List, Optional, Tuple
+from pipeline import process_dataset
+from registry import low_memory_engines
+from cancel import CancelToken, Cancelled
+from progress import ProgressReporter, QueueSink, fmt_eta
+from multiprocessing.managers import SyncManager
+from PIL import Image
+import traceback
+import threading
+import signal
+import logging
+import queue
+import time
+import sys
+import os
+try:
+    import tifffile
+    HAS_TIFFFILE = True
+except ImportError:
+    HAS_TIFFFILE = False
+
+
+def image_shape(path: str) -> Optional[Tuple[int, int]]:
+    """ (HEIGHT, WIDTH) OF AN IMAGE READ FROM ITS HEADER ONLY, NONE IF IT CANNOT BE READ """
+    try:
+        if HAS_TIFFFILE and path.lower().endswith(('.tif', '.tiff')):
+            with tifffile.TiffFile(path) as tif:
+                return tuple(tif.pages[0].shape[:2])
+        with Image.open(path) as img:
+            return img.size[1], img.size[0]
+    except Exception:
+        return None
+
+
+def memory_budget() -> int:
+    """ BYTES JOBS ARE ADMITTED AGAINST, BATCH_MAX_MEMORY_MB OR HALF OF PHYSICAL MEMORY """
+    if BATCH_MAX_MEMORY_MB is not None:
+        return int(BATCH_MAX_MEMORY_MB * 2 ** 20)
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 2
+    except (ValueError, OSError, AttributeError):
+        # no sysconf (windows)
+        return 4 * 2 ** 30
+
+
+class BatchJob:
+    """
+    BATCH JOB
+    __________________
+    @ds: dataset files keyed img, mask, csv and csv2 plus a display name
+    @wf: workflow to run on it
+    @vals: workflow props
+
+    One dataset x workflow unit of work, plus the scheduler's bookkeeping for it.
+    """
+    def __init__(self, ds: Dict[str, str], wf: WorkflowObj, vals: List[int]):
+        self.ds = ds
+        self.wf = wf
+        self.vals = vals
+        self.name = f'{ds["name"]}: {wf["name"]}'
+        self.engines: Dict[str, str] = dict(DEFAULT_ENGINES)
+        self.low_memory = False
+        self.est_bytes = self.estimate_memory()
+        self.attempts = 0
+        self.progress = 0
+        self.stage = ''
+        self.reported_eta: Optional[float] = None
+        self.started: Optional[float] = None
+        self.secs: Optional[float] = None
+        self.out_dir: Optional[str] = None
+        self.error: Optional[str] = None
+
+    def estimate_memory(self) -> int:
+        """ PEAK BYTES THE JOB IS EXPECTED TO HOLD, DOMINATED BY DECODED COPIES OF THE IMAGE """
+        shape = image_shape(self.ds['img'])
+        if shape is not None:
+            img_bytes = shape[0] * shape[1] * 3
+        else:
+            # unknown header, assume a compressed file decodes to several times its size
+            img_bytes = 4 * os.path.getsize(self.ds['img']) if os.path.isfile(self.ds['img']) else 0
+        copies = LOW_MEMORY_IMAGE_COPIES if self.low_memory else BATCH_IMAGE_COPIES
+        return int(img_bytes * copies + BATCH_JOB_OVERHEAD_MB * 2 ** 20)
+
+    def use_low_memory(self) -> bool:
+        """ SWITCH TO THE WORKFLOW'S LOW_MEMORY_ENGINES, FALSE IF IT HAS NONE OR ALREADY USES THEM """
+        engines = low_memory_engines(self.wf)
+        if self.low_memory or len(engines) == 0:
+            return False
+        self.engines.update(engines)
+        self.low_memory = True
+        self.est_bytes = self.estimate_memory()
+        return True
+
+    @property
+    def done(self) -> bool:
+        return self.out_dir is not None or self.error is not None
+
+    def eta(self) -> Optional[float]:
+        """ SECONDS LEFT, AS REPORTED BY THE JOB OR EXTRAPOLATED FROM PROGRESS SO FAR """
+        if self.reported_eta is not None:
+            return self.reported_eta
+        if self.started is None or self.progress <= 0:
+            return None
+        elapsed = time.time() - self.started
+        return elapsed * (100 - self.progress) / self.progress
+
+
+def _ignore_interrupt():
+    # ctrl+c reaches the whole process group, only the scheduler handles it (by cancelling the batch)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _init_worker(level: int):
+    _ignore_interrupt()
+    logging.basicConfig(level=level, format='%(asctime)s %(levelname)s [%(processName)s] %(message)s',
+                        stream=sys.stdout)
+
+
+def _run_job(job_id: int, ds: Dict[str, str], wf: WorkflowObj, vals: List[int], engines: Dict[str, str],
+             batch_ops: BatchOptions, output_ops: OutputOptions, q, cancel_event) -> Tuple[Optional[str], Optional[str]]:
+    """ WORKER PROCESS ENTRY, RETURNS (RUN FOLDER, NONE) OR (NONE, TRACEBACK) """
+    try:
+        return process_dataset(ds, wf, vals, batch_ops, output_ops, pb=ProgressReporter(QueueSink(q, job_id)),
+                               token=CancelToken(event=cancel_event), engines=engines), None
+    except Cancelled:
+        return None, 'cancelled'
+    except Exception:
+        return None, traceback.format_exc()
+
+
+class BatchScheduler:
+    """
+    BATCH SCHEDULER
+    __________________
+    @workers: worker processes, defaults to BATCH_WORKERS or one per core
+    @max_bytes: memory budget, see memory_budget
+
+    Fans dataset x workflow jobs out to a process pool. A job is only admitted while the estimated memory of every
+    running job fits the budget, so several giant montages are never decoded at once (smaller jobs still fill the
+    gaps). A job larger than the whole budget falls back to its workflow's LOW_MEMORY_ENGINES, and runs alone if it
+    still does not fit. Every job exports its results the moment it finishes. A failing job is recorded and the batch
+    carries on. If a worker process dies (e.g. killed for running out of memory) the pool is rebuilt and the jobs it
+    took down are retried one at a time, on low memory engines where the workflow has them.
+    cancel() (or ctrl+c) drops the queued jobs and stops the running ones at their next chunk boundary.
+    """
+    def __init__(self, workers: int = None, max_bytes: int = None):
+        self.workers = max(1, workers or BATCH_WORKERS or os.cpu_count() or 1)
+        self.max_bytes = max_bytes if max_bytes is not None else memory_budget()
+        self._cancel = threading.Event()
+        # shared with the worker processes while a batch runs
+        self._cancel_event = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """ CANCEL THE BATCH, SAFE TO CALL FROM ANY THREAD """
+        self._cancel.set()
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(logging.getLogger().getEffectiveLevel(),))
+
+    def _admit(self, pending: Deque[BatchJob], running: Dict[Future, BatchJob]) -> Optional[BatchJob]:
+        """ FIRST PENDING JOB THAT FITS THE MEMORY BUDGET NEXT TO THE RUNNING ONES """
+        if len(running) >= self.workers or len(pending) == 0:
+            return None
+        # retries of jobs a dead worker took down run alone, so one crashing job cannot fail its neighbours again
+        if any(job.attempts > 1 for job in running.values()):
+            return None
+        used = sum(job.est_bytes for job in running.values())
+        for job in pending:
+            if job.attempts > 0 and len(running) > 0:
+                continue
+            if job.est_bytes > self.max_bytes and job.use_low_memory():
+                logging.warning('%s: over the %d MB budget, falling back to low memory engines (~%d MB)', job.name,
+                                self.max_bytes // 2 ** 20, job.est_bytes // 2 ** 20)
+            if len(running) == 0 or used + job.est_bytes <= self.max_bytes:
+                if job.est_bytes > self.max_bytes:
+                    logging.warning('%s: needs ~%d MB, more than the %d MB budget, running it alone', job.name,
+                                    job.est_bytes // 2 ** 20, self.max_bytes // 2 ** 20)
+                pending.remove(job)
+                return job
+        return None
+
+    def report(self, jobs: List[BatchJob], start: float):
+        """ LOG PER JOB AND OVERALL PROGRESS WITH ETAS """
+        running = [job for job in jobs if job.started is not None and not job.done]
+        for job in running:
+            logging.info('  %s: %d%% %s, eta %s', job.name, job.progress, job.stage, fmt_eta(job.eta()))
+        finished = sum(1 for job in jobs if job.done)
+        frac = (finished + sum(job.progress / 100 for job in running)) / max(len(jobs), 1)
+        elapsed = time.time() - start
+        eta = elapsed * (1 - frac) / frac if frac > 0 else None
+        logging.info('batch: %d/%d jobs done (%d%%), %d running, elapsed %s, eta %s', finished, len(jobs),
+                     frac * 100, len(running), fmt_eta(elapsed), fmt_eta(eta))
+
+    def run(self, jobs: List[BatchJob], batch_ops: BatchOptions, output_ops: OutputOptions) -> List[BatchJob]:
+        """ RUN EVERY JOB, RETURNS THEM WITH out_dir OR error FILLED IN """
+        start = last_report = time.time()
+        logging.info('batch: %d jobs on %d workers, %d MB memory budget', len(jobs), self.workers,
+                     self.max_bytes // 2 ** 20)
+        pending: Deque[BatchJob] = deque(jobs)
+        running: Dict[Future, BatchJob] = {}
+        ids = {id(job): i for i, job in enumerate(jobs)}
+        manager = SyncManager()
+        manager.start(_ignore_interrupt)
+        with manager:
+            q = manager.Queue()
+            self._cancel_event = manager.Event()
+            if self.cancelled:
+                self._cancel_event.set()
+            pool, broken = self._new_pool(), False
+            try:
+                while pending or running:
+                    if self.cancelled:
+                        # queued work is dropped, running jobs see the event and stop
+                        for job in pending:
+                            job.error = 'cancelled'
+                        pending.clear()
+                        for future in running:
+                            future.cancel()
+                    # nothing new goes to a broken pool, it is rebuilt once its last futures have failed
+                    job = self._admit(pending, running) if not broken else None
+                    while job is not None:
+                        job.attempts += 1
+                        job.started, job.progress, job.stage, job.reported_eta = time.time(), 0, 'queued', None
+                        running[pool.submit(_run_job, ids[id(job)], job.ds, job.wf, job.vals, job.engines,
+                                            batch_ops, output_ops, q, self._cancel_event)] = job
+                        job = self._admit(pending, running)
+                    try:
+                        done, _ = wait(list(running), timeout=0.5, return_when=FIRST_COMPLETED)
+                    except KeyboardInterrupt:
+                        if self.cancelled:
+                            raise
+                        logging.warning('batch: cancelling, press ctrl+c again to abort')
+                        self.cancel()
+                        continue
+                    # progress streamed from the workers
+                    while True:
+                        try:
+                            job_id, fraction, stage, eta = q.get_nowait()
+                        except queue.Empty:
+                            break
+                        job = jobs[job_id]
+                        job.progress, job.stage, job.reported_eta = fraction * 100, stage, eta
+                    for future in done:
+                        job = running.pop(future)
+                        try:
+                            job.out_dir, job.error = future.result()
+                        except CancelledError:
+                            job.error = 'cancelled'
+                        except BrokenProcessPool:
+                            broken = True
+                            if job.attempts < BATCH_JOB_ATTEMPTS and not self.cancelled:
+                                logging.warning('%s: worker process died, retrying%s', job.name,
+                                                ' on low memory engines' if job.use_low_memory() else '')
+                                job.started = None
+                                pending.appendleft(job)
+                                continue
+                            job.error = 'worker process died (out of memory?)'
+                        except Exception:
+                            job.error = traceback.format_exc()
+                        job.secs = time.time() - job.started
+                        finished = sum(1 for j in jobs if j.done)
+                        if job.error is None:
+                            logging.info('[%d/%d] %s: finished in %s', finished, len(jobs), job.name,
+                                         fmt_eta(job.secs))
+                        elif job.error == 'cancelled':
+                            logging.warning('[%d/%d] %s: cancelled after %s', finished, len(jobs), job.name,
+                                            fmt_eta(job.secs))
+                        else:
+                            logging.error('[%d/%d] %s: failed after %s\n%s', finished, len(jobs), job.name,
+                                          fmt_eta(job.secs), job.error)
+                    if broken and len(running) == 0:
+                        pool.shutdown(wait=False)
+                        pool, broken = self._new_pool(), False
+                    if time.time() - last_report >= BATCH_REPORT_SECS:
+                        last_report = time.time()
+                        self.report(jobs, start)
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+                self._cancel_event = None
+        failed = [job for job in jobs if job.error is not None]
+        cancelled = [job for job in failed if job.error == 'cancelled']
+        logging.info('batch: finished %d jobs in %s, %d failed, %d cancelled', len(jobs),
+                     fmt_eta(time.time() - start), len(failed) - len(cancelled), len(cancelled))
+        return jobs
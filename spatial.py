@@ -0,0 +1,85 @@
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class GridIndex:
+    """
+    UNIFORM GRID SPATIAL INDEX
+    __________________
+    @bounds: (N, 4) array of item bounding boxes as x0, y0, x1, y1
+    @cell_size: edge length of each grid cell in px
+
+    Items are bucketed into every cell their bounding box touches and stored CSR style (one sorted array of item
+    ids plus per-cell offsets), so a rect query only touches the cells it covers. Returned ids are sorted, i.e. in
+    the order items were added.
+    """
+    def __init__(self, bounds: np.ndarray, cell_size: int = 256):
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        self.cell_size = cell_size
+        n = len(self.bounds)
+        if n == 0:
+            self.n_cols = self.n_rows = 0
+            self.ids, self.starts = np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.int64)
+            return
+        lo = np.floor(np.maximum(self.bounds[:, :2], 0) / cell_size).astype(np.int64)
+        hi = np.floor(np.maximum(self.bounds[:, 2:], 0) / cell_size).astype(np.int64)
+        self.n_cols, self.n_rows = int(hi[:, 0].max()) + 1, int(hi[:, 1].max()) + 1
+        # expand every item into each (col, row) its bbox spans
+        span_x, span_y = hi[:, 0] - lo[:, 0] + 1, hi[:, 1] - lo[:, 1] + 1
+        counts = span_x * span_y
+        item = np.repeat(np.arange(n), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cols = lo[item, 0] + offset % span_x[item]
+        rows = lo[item, 1] + offset // span_x[item]
+        cells = rows * self.n_cols + cols
+        order = np.lexsort((item, cells))
+        self.ids = item[order]
+        self.starts = np.searchsorted(cells[order], np.arange(self.n_cols * self.n_rows + 1))
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def query(self, rect: Tuple[float, float, float, float]) -> np.ndarray:
+        """ RETURN SORTED IDS OF ITEMS WHOSE BBOX INTERSECTS RECT (x0, y0, x1, y1) """
+        if self.n_cols == 0:
+            return self.ids
+        x0, y0, x1, y1 = rect
+        c0, c1 = max(0, int(x0 // self.cell_size)), min(self.n_cols - 1, int(x1 // self.cell_size))
+        r0, r1 = max(0, int(y0 // self.cell_size)), min(self.n_rows - 1, int(y1 // self.cell_size))
+        if c0 > c1 or r0 > r1:
+            return np.zeros(0, dtype=np.int64)
+        chunks = [self.ids[self.starts[r * self.n_cols + c0]:self.starts[r * self.n_cols + c1 + 1]]
+                  for r in range(r0, r1 + 1)]
+        cand = np.unique(np.concatenate(chunks))
+        b = self.bounds[cand]
+        return cand[(b[:, 0] <= x1) & (b[:, 2] >= x0) & (b[:, 1] <= y1) & (b[:, 3] >= y0)]
+
+
+class ParticleIndex:
+    """
+    PARTICLE LOOKUP INDEX
+    __________________
+    @table: one row per particle, must contain pixel 'X' and 'Y' columns. Lookups return positional row numbers so
+        the table's own index (e.g. the particle ids drawn on the image) is left untouched
+
+    KD-tree over particle positions so hover/click lookups stay well under a millisecond even for 100k particles.
+    """
+    def __init__(self, table: pd.DataFrame):
+        self.table = table
+        self.points = np.column_stack([self.table['X'].to_numpy(dtype=float), self.table['Y'].to_numpy(dtype=float)])
+        # sklearn loads with the first index, not at startup
+        from sklearn.neighbors import KDTree
+        self.tree = KDTree(self.points) if len(self.points) > 0 else None
+
+    def __len__(self):
+        return len(self.points)
+
+    def nearest(self, x: float, y: float, max_dist: float = np.inf) -> Optional[Tuple[int, float]]:
+        """ ROW INDEX AND DISTANCE OF THE PARTICLE CLOSEST TO (x, y), OR NONE IF NOTHING IS WITHIN max_dist """
+        if self.tree is None:
+            return None
+        dist, idx = self.tree.query([[x, y]], k=1)
+        if dist[0][0] > max_dist:
+            return None
+        return int(idx[0][0]), float(dist[0][0])
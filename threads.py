@@ -1,145 +1,256 @@
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread, QSize, QByteArray
-from PyQt5.QtGui import QImage
-from utils import pixels_conversion, enum_to_unit, to_coord_list
-from globals import MAX_DIRS_PRUNE
-import os
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread, QSize, QByteArray, QRunnable, QThreadPool
 import traceback
 import logging
 from views.logger import Logger
-from typings import Unit, Workflow, DataObj, OutputOptions, WorkflowObj
-from typing import List, Tuple
-# workflows
-from workflows.clust import run_clust
-from workflows.gold_rippler import run_rippler
-from workflows.separation import run_separation
-from workflows.goldstar import run_goldstar
-from workflows.nnd import run_nnd
-from workflows.random_coords import gen_random_coordinates
+from typings import Unit, DataObj, OutputOptions, WorkflowObj
+from typing import Callable, Dict, List, Tuple
+from annotations import AnnotationLayer
+from graphs import render_graph
+from pipeline import load_coords, run_workflow, export_results
+from analysis import AnalysisContext
+from cancel import CancelToken, Cancelled
+from progress import ProgressReporter
+from timing import RunTimings, activate, span
+from globals import DEFAULT_SEED, ANALYSIS_PROGRESS, WARMUP_MODULES, NUMERIC_THREADS, PAGE_WORKERS, PAGE_VISIBLE_PRIORITY, \
+    ANALYSIS_BACKEND
+from registry import WORKFLOWS
 import numpy as np
-import datetime
 import pandas as pd
-import shutil
+import importlib
+import threading
+import time
+
+
+class PoolJob(QRunnable):
+    """ ONE CALL QUEUED ON A RunPool, KEPT ALIVE BY THE POOL UNTIL IT HAS RUN """
+    def __init__(self, pool: 'RunPool', fn: Callable[[], None], owner: object):
+        super().__init__()
+        # the pool releases it from the gui thread once run, not when the pool thread lets go
+        self.setAutoDelete(False)
+        self.pool = pool
+        self.fn = fn
+        self.owner = owner
+
+    def run(self):
+        with self.pool.lock:
+            self.pool.queued.pop(self, None)
+        try:
+            self.fn()
+        except Exception:
+            logging.error(traceback.format_exc())
+        finally:
+            self.pool.job_done.emit(self)
+
+
+class RunPool(QObject):
+    """
+    WORKFLOW RUN POOL
+    __________________
+    @max_threads: jobs running at once, None = PAGE_WORKERS or one per core
+
+    Bounded pool every workflow page runs its analyses and graph renders on, so selecting many workflows queues them
+    instead of starting a thread each. Queued jobs start highest priority first, in submission order otherwise;
+    prioritize() moves the queued jobs of the page being looked at (PAGE_VISIBLE_PRIORITY) to the front. One per app,
+    see instance().
+    """
+    _instance: 'RunPool' = None
+    # emitted from the pool thread when a job has run, handled in the gui thread
+    job_done = pyqtSignal(object)
+
+    def __init__(self, max_threads: int = PAGE_WORKERS):
+        super().__init__()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads or QThread.idealThreadCount())
+        self.lock = threading.Lock()
+        # every job not yet released, the ones not started yet (in submission order)
+        self.jobs: Dict[PoolJob, object] = {}
+        self.queued: Dict[PoolJob, None] = {}
+        self.job_done.connect(self._release)
+
+    @classmethod
+    def instance(cls) -> 'RunPool':
+        """ THE APP'S POOL, CREATED ON FIRST USE (FROM THE GUI THREAD) """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(self, fn: Callable[[], None], owner: object = None, priority: int = 0) -> PoolJob:
+        """
+        QUEUE A CALL
+        __________________
+        @fn: runs on a pool thread, reports back through queued signals
+        @owner: what the job belongs to (a page), see prioritize and discard
+        @priority: higher starts first
+        """
+        job = PoolJob(self, fn, owner)
+        with self.lock:
+            self.jobs[job] = owner
+            self.queued[job] = None
+        self.pool.start(job, priority)
+        return job
+
+    def prioritize(self, owner: object, priority: int = PAGE_VISIBLE_PRIORITY):
+        """ REQUEUE THE OWNER'S JOBS THAT HAVE NOT STARTED AT THE GIVEN PRIORITY """
+        with self.lock:
+            waiting = [job for job in self.queued if job.owner is owner]
+        for job in waiting:
+            # false if it started in the meantime
+            if self.pool.tryTake(job):
+                self.pool.start(job, priority)
+
+    def discard(self, job: PoolJob = None, owner: object = None) -> int:
+        """ DROP A JOB (OR ALL OF AN OWNER'S JOBS) THAT HAS NOT STARTED, RETURNS HOW MANY WERE DROPPED """
+        with self.lock:
+            waiting = [j for j in self.queued if j is job or (owner is not None and j.owner is owner)]
+        dropped = 0
+        for j in waiting:
+            if self.pool.tryTake(j):
+                with self.lock:
+                    self.queued.pop(j, None)
+                self._release(j)
+                dropped += 1
+        return dropped
+
+    def _release(self, job: PoolJob):
+        # the call (and the worker it references) goes away in the gui thread
+        with self.lock:
+            self.jobs.pop(job, None)
+        job.fn = None
+
+
+class WarmupWorker(QObject):
+    """
+    WARM UP WORKER
+    __________________
+    Imports the heavy analysis modules (WARMUP_MODULES) and runs each once on a few points, sets numexpr and BLAS
+    threads and builds the reusable graph figures, so the first run finds everything loaded (with the process backend,
+    also starts its workers). Runs in the background once the window shows. A failing step is logged and left to load on first use.
+    """
+    finished = pyqtSignal(float)
+
+    def run(self, threads: int = NUMERIC_THREADS):
+        start = time.perf_counter()
+        logging.info("Warming up analysis modules...")
+        for name in WARMUP_MODULES:
+            step = time.perf_counter()
+            try:
+                importlib.import_module(name)
+                logging.info("Warm-up: imported %s in %.2fs", name, time.perf_counter() - step)
+            except Exception:
+                logging.warning("Warm-up: could not import %s\n%s", name, traceback.format_exc())
+        try:
+            self.set_threads(threads)
+            self.first_use()
+            if ANALYSIS_BACKEND == 'process':
+                from procpool import ProcessBackend
+                ProcessBackend.instance().start()
+        except Exception:
+            logging.warning("Warm-up: %s", traceback.format_exc())
+        secs = time.perf_counter() - start
+        logging.info("Warm-up done in %.2fs, ready to run", secs)
+        self.finished.emit(secs)
+
+    @staticmethod
+    def set_threads(threads: int = None):
+        """ NUMEXPR AND BLAS THREAD POOLS, ONE THREAD PER CORE IF NOT GIVEN """
+        # imported here, not on start up
+        import numexpr
+        cores = numexpr.detect_number_of_cores()
+        numexpr.set_num_threads(threads or cores)
+        logging.info("Detected %s cores, numexpr uses %s threads", cores, threads or cores)
+        if threads is not None:
+            try:
+                # ships with sklearn, limits every BLAS / OpenMP pool loaded so far
+                from threadpoolctl import threadpool_limits
+                threadpool_limits(limits=threads)
+                logging.info("BLAS limited to %s threads", threads)
+            except ImportError:
+                logging.warning("threadpoolctl is not installed, BLAS threads left as they are")
+
+    @staticmethod
+    def first_use():
+        """ RUN CLUSTERING, A KD-TREE AND A PALETTE ONCE ON A FEW POINTS, BUILD EVERY WORKFLOW'S GRAPH FIGURE """
+        from sklearn.cluster import AgglomerativeClustering
+        from sklearn.neighbors import KDTree
+        from graphs import get_template
+        from utils import create_color_pal
+        pts = np.random.default_rng(0).uniform(0, 100, (32, 2))
+        AgglomerativeClustering(n_clusters=None, distance_threshold=10, linkage='single').fit_predict(pts)
+        KDTree(pts).query(pts, k=2)
+        create_color_pal(n_bins=11, palette_type='rocket_r')
+        for wf in WORKFLOWS:
+            get_template(wf['type'])
 
 
 class DataLoadWorker(QObject):
     finished = pyqtSignal(list)
 
-    def run(self, img_path: str = "", mask_path: str = "",  csv_path: str = "", csv2_path: str = "", unit: Unit = Unit.PIXEL, scalar: float = 1.0):
+    def run(self, img_path: str = "", mask_path: str = "",  csv_path: str = "", csv2_path: str = "", unit: Unit = Unit.PIXEL, scalar: float = 1.0, timings: RunTimings = None):
         try:
-            data = pd.read_csv(csv_path, sep=",")
-            scaled_df = pixels_conversion(data=data, unit=unit, scalar=scalar)
-            COORDS = to_coord_list(scaled_df)
-    
-            if len(csv2_path) > 0:
-                data = pd.read_csv(csv2_path, sep=",")
-                ALT_COORDS = to_coord_list(
-                    pixels_conversion(data=data, unit=unit, scalar=scalar))
-            else:
-                ALT_COORDS = gen_random_coordinates(img_path, mask_path, count=len(COORDS))
-    
+            with activate(timings), span('load'):
+                COORDS, ALT_COORDS = load_coords(img_path, mask_path, csv_path, csv2_path, unit, scalar)
             self.finished.emit([COORDS, ALT_COORDS])
             logging.info("Finished loading in and converting data")
         except Exception as e:
-            self.dlg = Logger()
-            self.dlg.show()
+            Logger.show_from_any_thread()
             logging.error(traceback.format_exc())
             self.finished.emit([])
 
 
 class AnalysisWorker(QObject):
     finished = pyqtSignal(object)
-    progress = pyqtSignal(int)
+    # progress.ProgressUpdate, at most PROGRESS_MAX_RATE a second
+    progress = pyqtSignal(object)
 
-    def run(self, wf: WorkflowObj, vals: List[str], coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]] = None, img_path: str = "", mask_path: str = "", clust_area: bool = False):
+    def run(self, gen: int, wf: WorkflowObj, vals: List[str], coords: List[Tuple[float, float]], rand_count: int, alt_coords: List[Tuple[float, float]] = None, img_path: str = "", mask_path: str = "", clust_area: bool = False, seed: int = DEFAULT_SEED, use_cache: bool = True, ctx: AnalysisContext = None, token: CancelToken = None, timings: RunTimings = None):
+        """ RUN ANALYSIS, EMITS (GEN, DATA), DATA IS NONE IF THE RUN FAILED OR WAS CANCELLED """
+        # the analysis fills most of the bar, drawing the results the rest
+        pb = ProgressReporter(self.progress.emit).span(0, ANALYSIS_PROGRESS)
         try:
-            real_df1 = real_df2 = rand_df1 = rand_df2 = pd.DataFrame()
-            print('vals', vals)
-            # ADD NEW WORKFLOWS HERE
-            if wf['type'] == Workflow.NND:
-                real_df1, rand_df1 = run_nnd(
-                    real_coords=coords, rand_coords=rand_coords, pb=self.progress)
-            elif wf['type'] == Workflow.CLUST:
-                real_df1, rand_df1, real_df2, rand_df2 = run_clust(
-                    real_coords=coords, rand_coords=rand_coords, img_path=img_path, distance_threshold=vals[0], pb=self.progress, clust_area=clust_area)
-            elif wf['type'] == Workflow.SEPARATION:
-                real_df2, rand_df2, real_df1, rand_df1 = run_separation(
-                    real_coords=coords, rand_coords=rand_coords,  distance_threshold=vals[0], min_clust_size=vals[1], pb=self.progress, clust_area=clust_area)
-            elif wf['type'] == Workflow.RIPPLER:
-                real_df1, rand_df1 = run_rippler(real_coords=coords, alt_coords=alt_coords, rand_coords=rand_coords, pb=self.progress, img_path=img_path, mask_path=mask_path, max_steps=vals[0], step_size=vals[1], initial_radius=vals[2])
-            elif wf['type'] == Workflow.GOLDSTAR:
-                real_df1, rand_df1 = run_goldstar(
-                    real_coords=coords, rand_coords=rand_coords, alt_coords=alt_coords, pb=self.progress) #img_path=img_path, mask_path=mask_path, a_star=vals[0])
-            self.output_data = DataObj(real_df1, real_df2, rand_df1, rand_df2)
-            self.finished.emit(self.output_data)
-            logging.info('finished %s analysis', wf["name"])
+            with activate(timings), span('analysis'):
+                self.output_data = run_workflow(wf, vals, coords, rand_count, alt_coords, img_path, mask_path,
+                                                clust_area=clust_area, seed=seed, use_cache=use_cache, pb=pb,
+                                                ctx=ctx, token=token, backend=ANALYSIS_BACKEND)
+            self.finished.emit((gen, self.output_data))
+        except Cancelled:
+            logging.info('%s: run %d cancelled', wf['name'], gen)
+            self.finished.emit((gen, None))
         except Exception as e:
-            self.dlg = Logger()
-            self.dlg.show()
+            Logger.show_from_any_thread()
             logging.error(traceback.format_exc())
-            self.finished.emit({})
+            self.finished.emit((gen, None))
 
 
-class DownloadWorker(QObject):
-    finished = pyqtSignal()
+class GraphWorker(QObject):
+    finished = pyqtSignal(object)
 
-    def run(self, wf: WorkflowObj, data: DataObj, output_ops: OutputOptions, img: str, display_img: QImage, graph: QImage):
-        """ DOWNLOAD FILES """
-        # logging.info(output_ops.delete_old, output_ops.output_dir, output_ops.output_scalar, output_ops.output_unit)
+    def run(self, gen: int, wf: WorkflowObj, final_real: pd.DataFrame, final_rand: pd.DataFrame, show_real: bool, show_rand: bool, pal_type: str, r_pal_type: str, n_bins: str, output_unit: Unit, n: List[int], timings: RunTimings = None):
+        """ RENDER GRAPH OFF THE GUI THREAD, EMITS (GEN, RGBA IMG, BIN COUNTS) """
         try:
-            out_start = output_ops.output_dir if output_ops.output_dir is not None else './output'
-            # delete old files to make space if applicable
-            o_dir = f'{out_start}/{wf["name"].lower()}'
-            if output_ops.delete_old:
-                while len(os.listdir(o_dir)) >= MAX_DIRS_PRUNE:
-                    oldest_dir = \
-                        sorted([os.path.abspath(
-                            f'{o_dir}/{f}') for f in os.listdir(o_dir)], key=os.path.getctime)[0]
-                    logging.info("pruning %s", oldest_dir)
-                    shutil.rmtree(oldest_dir)
-                logging.info('%s: pruned old output', wf["name"])
+            with activate(timings), span('graph'):
+                img, n = render_graph(wf=wf, final_real=final_real, final_rand=final_rand, show_real=show_real,
+                                      show_rand=show_rand, pal_type=pal_type, r_pal_type=r_pal_type, n_bins=n_bins,
+                                      output_unit=output_unit, n=n)
+            logging.info('%s: generated graph', wf['name'])
+            self.finished.emit((gen, img, n))
         except Exception as e:
-            self.dlg = Logger()
-            self.dlg.show()
             logging.error(traceback.format_exc())
-            self.finished.emit()
+            self.finished.emit((gen, None, None))
+
+
+class DownloadWorker(QObject):
+    finished = pyqtSignal()
 
-        # download files
+    def run(self, wf: WorkflowObj, data: DataObj, output_ops: OutputOptions, img: str, base_img: np.ndarray, layers: List[AnnotationLayer], graph: np.ndarray, params: dict = None, timings: RunTimings = None):
+        """ DOWNLOAD FILES, TIMINGS OF THE RUN ARE WRITTEN NEXT TO THEM """
         try:
-            logging.info(
-                '%s: prepare to download output', wf["name"])
-            img_name = os.path.splitext(
-                os.path.basename(img))[0]
-            out_dir = f'{out_start}/{wf["name"].lower()}/{img_name}-{datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}'
-            os.makedirs(out_dir, exist_ok=True)
-            logging.info('attempting to save cleaned dfs')
-            data.final_real.to_csv(f'{out_dir}/real_{wf["name"].lower()}_output_{enum_to_unit(output_ops.output_unit)}.csv',
-                                   index=False, header=True)
-            data.final_rand.to_csv(f'{out_dir}/rand_{wf["name"].lower()}_output_{enum_to_unit(output_ops.output_unit)}.csv',
-                                   index=False, header=True)
-            if display_img:
-                display_img.save(
-                    f'{out_dir}/drawn_{wf["name"].lower()}_img.tif')
-            else:
-                logging.info(
-                    'No display image generated. An error likely occurred when running workflow.')
-            graph.save(f'{out_dir}/{wf["name"].lower()}_graph.jpg')
-            # if workflow fills full dfs, output those two
-            logging.info('attempting to save dfs')
-            if not data.real_df2.empty and not data.rand_df2.empty:
-                real_df2 = pixels_conversion(
-                    data=data.real_df2, unit=Unit.PIXEL, scalar=float(output_ops.output_scalar))
-                rand_df2 = pixels_conversion(
-                    data=data.rand_df2, unit=Unit.PIXEL, scalar=float(output_ops.output_scalar))
-                real_df2.to_csv(
-                    f'{out_dir}/detailed_real_{wf["name"].lower()}_output_{enum_to_unit(output_ops.output_unit)}.csv', index=False,
-                    header=True)
-                rand_df2.to_csv(
-                    f'{out_dir}/detailed_rand_{wf["name"].lower()}_output_{enum_to_unit(output_ops.output_unit)}.csv', index=False,
-                    header=True)
+            with activate(timings), span('export'):
+                out_dir = export_results(wf, data, output_ops, img, base_img, layers, graph, params)
+            if timings is not None:
+                timings.write(out_dir)
             self.finished.emit()
             logging.info("%s: downloaded output, closing thread", wf["name"])
         except Exception as e:
-            self.dlg = Logger()
-            self.dlg.show()
+            Logger.show_from_any_thread()
             logging.error(traceback.format_exc())
             self.finished.emit()
@@ -0,0 +1,350 @@
+from globals import TIMINGS_ENABLED, TIMINGS_FILE, MEMORY_SAMPLE_SECS
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+import tracemalloc
+import threading
+import datetime
+import functools
+import logging
+import json
+import time
+import os
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    # windows
+    HAS_RESOURCE = False
+
+"""
+RUN TIMINGS
+___________________
+Where the time of a run goes (load, random coords, clustering, areas, graph, drawing, export). A RunTimings is
+activated on the thread doing a part of the run, every span opened on that thread while it is active is recorded into
+it. Spans nest, a stage is recorded under the path of the spans around it (e.g. analysis/run_clust/cluster_labels).
+With no RunTimings active (or TIMINGS_ENABLED off) span and timed cost a thread local lookup.
+
+Peak memory per stage is the traced peak when tracemalloc is running, otherwise there is none and the stage records
+how much resident memory grew while it ran. The process' resident high water mark (since it started, not per run) is
+written once per run as process_max_rss_mb. memory_profile (opt in, MEMORY_PROFILE) runs tracemalloc and samples resident memory in
+the background for a block, every stage then also records the highest resident memory seen while it ran, which
+includes what native code (opencv buffers, sklearn) allocates outside python's allocator.
+
+Both peaks are the whole process', so a stage that overlapped a span on another thread (pages running side by side on
+the RunPool, a batch next to the gui) shares them with it: such spans are recorded with peak_shared and are not
+picked as the run's peak stage.
+"""
+
+_local = threading.local()
+# set while memory_profile runs
+_sampler: Optional['RssSampler'] = None
+# spans open on any thread, see _open_shared
+_open_frames: List[dict] = []
+_open_lock = threading.Lock()
+
+
+def rss_mb() -> Optional[float]:
+    """ CURRENT RESIDENT MEMORY (MB) OF THIS PROCESS, NONE IF UNKNOWN """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def max_rss_mb() -> Optional[float]:
+    """ RESIDENT HIGH WATER MARK (MB) OF THIS PROCESS, NONE IF UNKNOWN """
+    if not HAS_RESOURCE:
+        return None
+    # kB on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+class RssSampler:
+    """
+    RSS SAMPLER
+    __________________
+    @interval: seconds between samples
+
+    Samples resident memory on a daemon thread. Spans open while it runs take the highest sample seen until they close.
+    """
+    def __init__(self, interval: float = MEMORY_SAMPLE_SECS):
+        self.interval = interval
+        self.peak = 0.0
+        self._open: List[dict] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        mb = rss_mb()
+        if mb is None:
+            return
+        with self._lock:
+            self.peak = max(self.peak, mb)
+            for frame in self._open:
+                frame['rss_peak'] = max(frame['rss_peak'], mb)
+
+    def open(self, frame: dict):
+        frame['rss_peak'] = 0.0
+        with self._lock:
+            self._open.append(frame)
+        self.sample()
+
+    def close(self, frame: dict) -> float:
+        """ STOP SAMPLING INTO frame, RETURNS ITS PEAK (MB) """
+        self.sample()
+        with self._lock:
+            self._open.remove(frame)
+        return frame['rss_peak']
+
+
+class RunTimings:
+    """
+    RUN TIMINGS
+    __________________
+    @name: run label, e.g. the workflow name
+    @base: earlier timings the run builds on (e.g. loading the dataset its pages share), copied in
+
+    Spans recorded while active on any thread. Thread safe.
+    """
+    def __init__(self, name: str, base: 'RunTimings' = None):
+        self.name = name
+        self.spans: List[dict] = list(base.spans) if base is not None else []
+        self.origin = base.origin if base is not None else time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self):
+        """ RECORD SPANS OPENED ON THIS THREAD INTO THESE TIMINGS """
+        if not TIMINGS_ENABLED:
+            yield self
+            return
+        prev = getattr(_local, 'timings', None)
+        prev_stack = getattr(_local, 'stack', None)
+        _local.timings, _local.stack = self, []
+        try:
+            yield self
+        finally:
+            _local.timings, _local.stack = prev, prev_stack
+
+    def record(self, span: dict):
+        with self._lock:
+            self.spans.append(span)
+
+    def stages(self) -> Dict[str, dict]:
+        """ SPANS AGGREGATED BY PATH, IN THE ORDER THEY FIRST STARTED """
+        stages = {}
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s['start'])
+        for s in spans:
+            stage = stages.setdefault(s['path'], {'calls': 0, 'secs': 0.0, 'peak_mb': None, 'rss_peak_mb': None,
+                                                  'rss_growth_mb': None, 'peak_shared': False})
+            stage['calls'] += 1
+            stage['secs'] += s['secs']
+            stage['peak_shared'] = stage['peak_shared'] or s.get('peak_shared', False)
+            for key in ('peak_mb', 'rss_peak_mb', 'rss_growth_mb'):
+                if s.get(key) is not None:
+                    stage[key] = s[key] if stage[key] is None else max(stage[key], s[key])
+        return stages
+
+    def peak_stage(self) -> Optional[str]:
+        """ INNERMOST STAGE THE HIGHEST PEAK WAS REACHED IN (ITS PARENTS SHARE IT), NONE WITHOUT OWN PEAKS """
+        def peak(stage: dict) -> float:
+            return stage['rss_peak_mb'] if stage['rss_peak_mb'] is not None else stage['peak_mb'] or 0.0
+        # a peak shared with other threads' spans may not be this stage's
+        stages = {path: stage for path, stage in self.stages().items() if not stage['peak_shared']}
+        if len(stages) == 0:
+            return None
+        top = max(peak(stage) for stage in stages.values())
+        if top <= 0:
+            return None
+        return max((path for path, stage in stages.items() if peak(stage) >= top), key=lambda path: path.count('/'))
+
+    def summary(self) -> str:
+        """ ONE LINE PER STAGE, INDENTED BY NESTING """
+        lines = [f'{self.name} timings:']
+        for path, stage in self.stages().items():
+            depth = path.count('/')
+            mem = f', peak {stage["peak_mb"]:.0f} MB' if stage['peak_mb'] is not None else ''
+            if stage['rss_peak_mb'] is not None:
+                mem += f', rss peak {stage["rss_peak_mb"]:.0f} MB'
+            elif stage['peak_mb'] is None and stage['rss_growth_mb'] is not None:
+                mem += f', rss {stage["rss_growth_mb"]:+.0f} MB'
+            if mem and stage['peak_shared']:
+                mem += ' (shared with other threads)'
+            calls = f' x{stage["calls"]}' if stage['calls'] > 1 else ''
+            lines.append(f'{"  " * (depth + 1)}{path.rsplit("/", 1)[-1]}{calls}: {stage["secs"]:.3f}s{mem}')
+        top = self.peak_stage()
+        if top is not None:
+            lines.append(f'  highest memory in {top}')
+        return '\n'.join(lines)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s['start'])
+        end = max((s['start'] + s['secs'] for s in spans), default=0.0)
+        start = min((s['start'] for s in spans), default=0.0)
+        return {'name': self.name, 'created': datetime.datetime.now().isoformat(timespec='seconds'),
+                'memory': 'tracemalloc' if tracemalloc.is_tracing() else 'rss_growth',
+                'rss_sampled': any(s.get('rss_peak_mb') is not None for s in spans), 'wall_secs': end - start,
+                # since the process started, earlier runs included
+                'process_max_rss_mb': max_rss_mb(), 'peak_stage': self.peak_stage(), 'stages': self.stages(),
+                'spans': spans}
+
+    def write(self, out_dir: str) -> Optional[str]:
+        """ WRITE TIMINGS_FILE INTO out_dir AND LOG THE SUMMARY, NOTHING IF NO SPAN WAS RECORDED """
+        if len(self.spans) == 0:
+            return None
+        path = os.path.join(out_dir, TIMINGS_FILE)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(self.summary())
+        return path
+
+
+def current() -> Optional[RunTimings]:
+    """ TIMINGS ACTIVE ON THIS THREAD, IF ANY """
+    return getattr(_local, 'timings', None)
+
+
+@contextmanager
+def activate(timings: Optional[RunTimings]):
+    """ RunTimings.activate THAT ALLOWS NONE (NOTHING RECORDED) """
+    if timings is None:
+        yield None
+    else:
+        with timings.activate() as active:
+            yield active
+
+
+def adopt(spans: List[dict], origin: float):
+    """
+    RECORD SPANS TIMED ELSEWHERE
+    __________________
+    @spans: RunTimings.spans of e.g. a worker process, nested under the span open on this thread
+    @origin: time.time() their starts are relative to
+    """
+    timings = getattr(_local, 'timings', None)
+    if timings is None:
+        return
+    stack = _local.stack
+    prefix = f'{stack[-1]["path"]}/' if stack else ''
+    # the other process's clock, moved onto this one's perf_counter
+    shift = origin - time.time() + time.perf_counter() - timings.origin
+    for s in spans:
+        timings.record(dict(s, path=prefix + s['path'], start=s['start'] + shift))
+
+
+def _open_shared(frame: dict):
+    """ TRACK frame AS OPEN, MARKING IT AND THE SPANS OPEN ON OTHER THREADS AS SHARING THEIR PEAKS """
+    with _open_lock:
+        for other in _open_frames:
+            if other['thread'] != frame['thread']:
+                other['shared'] = frame['shared'] = True
+        _open_frames.append(frame)
+
+
+def _close_shared(frame: dict) -> bool:
+    """ STOP TRACKING frame, RETURNS WHETHER A SPAN ON ANOTHER THREAD OVERLAPPED IT """
+    with _open_lock:
+        _open_frames.remove(frame)
+    return frame['shared']
+
+
+@contextmanager
+def span(name: str):
+    """ TIME THE BLOCK AS STAGE name OF THE ACTIVE TIMINGS """
+    timings = getattr(_local, 'timings', None)
+    if timings is None:
+        yield
+        return
+    stack = _local.stack
+    tracing = tracemalloc.is_tracing()
+    sampler = _sampler
+    frame = {'path': f'{stack[-1]["path"]}/{name}' if stack else name, 'floor': 0, 'thread': threading.get_ident(),
+             'shared': False}
+    _open_shared(frame)
+    if tracing:
+        # peaks of nested spans are folded back into their parent's, see below
+        frame['outer_peak'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+    rss_start = rss_mb()
+    if sampler is not None:
+        sampler.open(frame)
+    stack.append(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        secs = time.perf_counter() - start
+        stack.pop()
+        rss_peak_mb = sampler.close(frame) if sampler is not None else None
+        shared = _close_shared(frame)
+        if tracing:
+            peak = max(tracemalloc.get_traced_memory()[1], frame['floor'])
+            if stack:
+                stack[-1]['floor'] = max(stack[-1]['floor'], frame['outer_peak'], peak)
+            peak_mb = peak / 2 ** 20
+        else:
+            peak_mb = None
+        rss_end = rss_mb()
+        rss_growth_mb = rss_end - rss_start if rss_start is not None and rss_end is not None else None
+        timings.record({'name': name, 'path': frame['path'], 'thread': threading.current_thread().name,
+                        'start': start - timings.origin, 'secs': secs, 'peak_mb': peak_mb, 'rss_mb': rss_end,
+                        'rss_growth_mb': rss_growth_mb, 'rss_peak_mb': rss_peak_mb, 'peak_shared': shared})
+
+
+def timed(name: str = None) -> Callable:
+    """ DECORATOR, TIMES EVERY CALL AS A SPAN (NAMED AFTER THE FUNCTION BY DEFAULT) """
+    def _wrap(fn: Callable) -> Callable:
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def _timed(*args, **kwargs):
+            if getattr(_local, 'timings', None) is None:
+                return fn(*args, **kwargs)
+            with span(label):
+                return fn(*args, **kwargs)
+        return _timed
+    return _wrap
+
+
+@contextmanager
+def memory_profile(enabled: bool = True, interval: float = MEMORY_SAMPLE_SECS):
+    """
+    MEMORY PROFILING
+    __________________
+    @enabled: does nothing if False, so callers can pass a setting straight through
+    @interval: seconds between resident memory samples
+
+    Traces python and numpy allocations (tracemalloc) and samples resident memory while the block runs, spans then
+    record per stage peaks of both. Slows allocation heavy code down noticeably. Nested calls share the outer one.
+    """
+    global _sampler
+    if not enabled or _sampler is not None:
+        yield
+        return
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    _sampler = RssSampler(interval)
+    _sampler.start()
+    try:
+        yield
+    finally:
+        sampler, _sampler = _sampler, None
+        sampler.stop()
+        if started:
+            tracemalloc.stop()
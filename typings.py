@@ -1,6 +1,6 @@
 from enum import Enum
 from typing_extensions import TypedDict
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 import pandas as pd
 
 class Workflow(Enum):
@@ -23,12 +23,16 @@ class FileType(Enum):
     CSV2 = 4
 
 
-class WorkflowGraph(TypedDict):
+class WorkflowGraph(TypedDict, total=False):
     type: str
     title: str
     x_label: str
     y_label: str
     x_type: str
+    y_type: str
+    # bar graphs only: 'sizes' counts how many rows share each x_type label (e.g. particles per cluster),
+    # 'values' plots x_type against y_type directly with bars sized to the x spacing, unset labels each bar
+    x_mode: str
 
 
 class WorkflowProps(TypedDict):
@@ -47,6 +51,46 @@ class WorkflowObj(TypedDict):
    props: List[WorkflowProps]
 
 
+class WorkflowPlugin:
+    """
+    WORKFLOW PLUGIN
+    __________________
+    @meta: workflow metadata (name, type, header, desc, graph spec and props), shown on the home and workflow pages
+    @run: analysis function, called with pb (progress emitter) plus the keyword args described by inputs and props
+    @inputs: run kwarg -> analysis input it takes, one of coords, rand_coords, alt_coords, img_path, mask_path,
+        clust_area or ctx (see pipeline.workflow_inputs)
+    @needs: shared intermediates run reads from ctx (see analysis.plan)
+    @props: run kwarg each of meta's props is passed as, in order (None for props run does not take)
+    @outputs: DataObj frame each value returned by run fills, in order (real_df1, real_df2, rand_df1, rand_df2)
+    @layers: (data, bin counts, palette, random palette, props, inputs) -> {'real': draw, 'rand': draw}, each draw
+        annotating the AnnotationLayer passed as layer=
+    @table: (kind, data, props, inputs) -> one row per 'real' or 'rand' particle with pixel X and Y columns, used
+        by the image viewer's hover inspector
+    @engines: engine name -> alternative to run taking the same args, picked through AnalysisContext.engines and
+        checked against run by benchmarks/golden.py
+    """
+    meta: WorkflowObj
+    run: Callable
+    inputs: Dict[str, str]
+    needs: List[str]
+    props: List[Optional[str]]
+    outputs: List[str]
+    layers: Callable
+    table: Callable
+    engines: Dict[str, Callable]
+
+    def __init__(self, meta: WorkflowObj, run: Callable, inputs: Dict[str, str], outputs: List[str], layers: Callable, table: Callable, props: List[Optional[str]] = None, needs: List[str] = None, engines: Dict[str, Callable] = None):
+        self.meta = meta
+        self.run = run
+        self.inputs = inputs
+        self.needs = needs if needs is not None else []
+        self.props = props if props is not None else []
+        self.outputs = outputs
+        self.layers = layers
+        self.table = table
+        self.engines = engines if engines is not None else {}
+
+
 class DataObj:
     real_df1: pd.DataFrame
     real_df2: pd.DataFrame
@@ -54,12 +98,15 @@ class DataObj:
     rand_df2: pd.DataFrame
     final_real: pd.DataFrame
     final_rand: pd.DataFrame
+    rand_coords: List[Tuple[float, float]]
 
-    def __init__(self, real_df1: pd.DataFrame, real_df2: pd.DataFrame, rand_df1: pd.DataFrame, rand_df2: pd.DataFrame):
+    def __init__(self, real_df1: pd.DataFrame, real_df2: pd.DataFrame, rand_df1: pd.DataFrame, rand_df2: pd.DataFrame, rand_coords: List[Tuple[float, float]] = None):
         self.real_df1 = real_df1
         self.real_df2 = real_df2
         self.rand_df1 = rand_df1
         self.rand_df2 = rand_df2
+        # random coords the rand dfs were computed from
+        self.rand_coords = rand_coords if rand_coords is not None else []
         self.final_real = pd.DataFrame()
         self.final_rand = pd.DataFrame()
     
@@ -69,9 +116,56 @@ class OutputOptions:
     output_scalar: str
     output_dir: str
     delete_old: bool
+    formats: List[str]
+    tiff_compression: str
+    keep_runs: Optional[int]
+    keep_days: Optional[float]
+    keep_mb: Optional[float]
 
-    def __init__(self, output_scalar: str, output_unit: Unit = Unit.PIXEL, output_dir: str = "./output", delete_old: bool = False):
+    def __init__(self, output_scalar: str, output_unit: Unit = Unit.PIXEL, output_dir: str = "./output", delete_old: bool = False, formats: List[str] = None, tiff_compression: str = 'deflate', keep_runs: Optional[int] = 5, keep_days: Optional[float] = None, keep_mb: Optional[float] = None):
         self.output_unit = output_unit
         self.output_scalar = output_scalar
         self.output_dir = output_dir
         self.delete_old = delete_old
+        # table formats written for every result frame, see output.TABLE_WRITERS
+        self.formats = formats if formats else ['csv']
+        # compression of the drawn image tiff, see output.write_tiff
+        self.tiff_compression = tiff_compression
+        # retention policy applied per workflow folder when delete_old is set, None means no limit
+        self.keep_runs = keep_runs
+        self.keep_days = keep_days
+        self.keep_mb = keep_mb
+
+
+class BatchOptions:
+    in_unit: Unit
+    in_scalar: float
+    rand_count: Optional[int]
+    seed: int
+    n_bins: str
+    pal_type: str
+    r_pal_type: str
+    show_rand: bool
+    clust_area: bool
+    use_cache: bool
+    draw_image: bool
+    profile_memory: bool
+
+    def __init__(self, in_unit: Unit = Unit.PIXEL, in_scalar: float = 1.0, rand_count: Optional[int] = None, seed: int = 42, n_bins: str = 'fd', pal_type: str = 'rocket_r', r_pal_type: str = 'mako', show_rand: bool = False, clust_area: bool = False, use_cache: bool = True, draw_image: bool = True, profile_memory: bool = False):
+        # unit and px per unit of the input csvs
+        self.in_unit = in_unit
+        self.in_scalar = in_scalar
+        # random coords per dataset, None means as many as gold particles
+        self.rand_count = rand_count
+        self.seed = seed
+        # graph and annotation settings, see graphs.render_graph
+        self.n_bins = n_bins
+        self.pal_type = pal_type
+        self.r_pal_type = r_pal_type
+        self.show_rand = show_rand
+        self.clust_area = clust_area
+        self.use_cache = use_cache
+        # burn annotations into a drawn copy of the image
+        self.draw_image = draw_image
+        # per stage memory peaks in the timings (as with MEMORY_PROFILE), see timing.memory_profile
+        self.profile_memory = profile_memory
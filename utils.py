@@ -1,12 +1,14 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 from PIL import Image
 from typings import Unit, Workflow
-from typing import List, Tuple
-import seaborn as sns
-from matplotlib import pyplot as plt
+from typing import Dict, List, Tuple, TYPE_CHECKING
 import numpy as np
 import pandas as pd
 import io
+import os
+import sys
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 class Progress(QThread):
     """ PROGRESS BAR/THREADING  """
@@ -18,6 +20,8 @@ class Progress(QThread):
 
 def create_color_pal(n_bins: int = 10, palette_type: str ="mako") -> List[Tuple[int, int, int]]:
     """ GENERATE COLOR PALETTE USING SEABORN """
+    # seaborn (and matplotlib under it) load on first use, not at startup
+    import seaborn as sns
     palette = sns.color_palette(palette_type, n_colors=n_bins)
     color_palette = []
     for i in range(n_bins):
@@ -29,6 +33,11 @@ def create_color_pal(n_bins: int = 10, palette_type: str ="mako") -> List[Tuple[
     return color_palette
 
 
+def resource_path(name: str) -> str:
+    """ PATH OF A FILE SHIPPED NEXT TO THE SOURCES, OR UNPACKED NEXT TO THE EXECUTABLE BY PYINSTALLER """
+    return os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), name)
+
+
 def get_complimentary_color(hexcode):
     """ GENERATE COMPLIMENTARY COLOR PALETTE """
     color = int(hexcode[1:], 16)
@@ -37,7 +46,7 @@ def get_complimentary_color(hexcode):
     return comp_color
 
 
-def figure_to_img(fig: plt.Figure) -> Image:
+def figure_to_img(fig: 'Figure') -> Image:
     """ CONVERT FIGURE TO IMG """
     buf = io.BytesIO()
     # convert Matplotlib figure to PIL Image
@@ -47,10 +56,14 @@ def figure_to_img(fig: plt.Figure) -> Image:
     return img
 
 
+""" COLUMNS THAT ARE NOT LENGTHS AND SO ARE NEVER SCALED BETWEEN UNITS """
+UNITLESS_COLS: List[str] = ['cluster_id', 'cluster_size', '%_gp_captured',
+                            '%_img_covered', 'LCPI', 'total_gp']  # 'radius',
+
+
 def pixels_conversion(data: pd.DataFrame, unit: Unit = Unit.PIXEL, scalar: float = 1, r: int = 3) -> pd.DataFrame:
     """ UPLOAD CSV AND CONVERT DF FROM ONE METRIC UNIT TO ANOTHER """
-    ignored_cols = ['cluster_id', 'cluster_size', '%_gp_captured',
-                    '%_img_covered', 'LCPI', 'total_gp']  # 'radius',
+    ignored_cols = UNITLESS_COLS
     i = 0
     df = data.copy()
     if df.columns[0] == '' or df.columns[0] == ' ' or df.columns[0] == 'ID' or df.columns[0] == 'id':
@@ -82,6 +95,17 @@ def pixels_conversion(data: pd.DataFrame, unit: Unit = Unit.PIXEL, scalar: float
     return df
 
 
+def convert_value(col: str, val, scalar: float = 1, r: int = 3):
+    """ SCALE A SINGLE PX VALUE FROM COLUMN col TO THE OUTPUT UNIT, FOLLOWING THE SAME RULES AS pixels_conversion """
+    if col in UNITLESS_COLS or val is None or (isinstance(val, float) and np.isnan(val)):
+        return val
+    if isinstance(val, tuple):
+        return tuple([round((x * scalar), r) for x in val])
+    if col == 'cluster_area':
+        return round((val * (scalar * scalar)), 4)
+    return round((val * scalar), r)
+
+
 def pixels_conversion_w_distance(data, scalar=1):
     """ CONVERT DF FROM ONE METRIC UNIT TO ANOTHER INCLUDING DISTANCE """
     scaled_data = data.copy()
@@ -139,6 +163,29 @@ def to_df(coords: List[Tuple[float, float]]) -> pd.DataFrame:
     df = pd.DataFrame(data={'X': x_coords, 'Y': y_coords})
     return df
 
+
+def match_dataset_files(folder: str) -> Dict[str, str]:
+    """
+    MATCH DATASET FILES IN FOLDER BY NAME
+    __________________
+    @folder: folder holding one dataset
+    @return: paths keyed img, mask, csv (gold) and csv2 (landmark), '' when not found. Files are matched on
+        'image', 'mask', 'gold' and 'landmark' in their names and the first match (alphabetically) wins
+    """
+    found = {'img': '', 'mask': '', 'csv': '', 'csv2': ''}
+    for filename in sorted(os.listdir(folder)):
+        full_file = os.path.join(folder, filename)
+        name = filename.lower()
+        if 'image' in name and filename.endswith(('.tif', '.png', '.jpeg', '.jpg')) and 'mask' not in name and len(found['img']) == 0:
+            found['img'] = full_file
+        elif 'mask' in name and filename.endswith(('.tif', '.png', '.jpeg', '.jpg')) and 'image' not in name and len(found['mask']) == 0:
+            found['mask'] = full_file
+        elif 'gold' in name and filename.endswith('.csv') and 'landmark' not in name and len(found['csv']) == 0:
+            found['csv'] = full_file
+        elif 'landmark' in name and filename.endswith('.csv') and 'gold' not in name and len(found['csv2']) == 0:
+            found['csv2'] = full_file
+    return found
+
 # """ TURN ENUM INTO WORKFLOW NAME """
 # def enum_to_workflow(val):
 #     if val == Workflow.NND:
@@ -1,9 +1,8 @@
 # pyQT5
 import os
 import traceback
-
-import cv2
-from PyQt5.QtGui import QCursor, QMovie, QPixmap, QImage
+import importlib.util
+from PyQt5.QtGui import QCursor, QMovie, QPixmap, QImage, QIntValidator, QDoubleValidator
 from PyQt5.QtWidgets import (QLabel, QFileDialog, QSpacerItem, QCheckBox, QHBoxLayout, QPushButton, QWidget,
                              QSizePolicy, QFormLayout, QLineEdit, QColorDialog, QComboBox, QProgressBar, QVBoxLayout)
 from PyQt5.QtCore import Qt, QByteArray, QPropertyAnimation, QAbstractAnimation, QVariantAnimation
@@ -11,9 +10,13 @@ from PyQt5.QtCore import Qt, QByteArray, QPropertyAnimation, QAbstractAnimation,
 from pathlib import Path
 from functools import partial
 # utils
-from globals import UNIT_OPS, WORKFLOWS, MAX_DIRS_PRUNE, UNIT_PX_SCALARS, DEFAULT_OUTPUT_DIR, PROG_COLOR_1, PROG_COLOR_2
+from registry import WORKFLOWS
+from globals import UNIT_OPS, MAX_DIRS_PRUNE, MAX_DIRS_AGE_DAYS, MAX_DIRS_MB, UNIT_PX_SCALARS, DEFAULT_OUTPUT_DIR, PROG_COLOR_1, PROG_COLOR_2, OUTPUT_FORMATS, TIFF_COMPRESSIONS
 from typings import FileType
-from utils import get_complimentary_color
+from utils import get_complimentary_color, match_dataset_files
+
+# only checks pyarrow is installed, importing it (like output does) would slow the start down
+HAS_PARQUET = importlib.util.find_spec('pyarrow') is not None
 
 HEADER = "Automated Gold Particle Analysis"
 DESC = "Upload files, select workflows and desired parameters, and click \"Start\"!"
@@ -133,14 +136,59 @@ class HomePage(QWidget):
         p_bl.addWidget(self.show_logs_btn)
         layout.addRow(p_bl)
         # delete old dirs checkbox
-        self.dod_cb = QCheckBox(f'prune old output (delete folders older than {MAX_DIRS_PRUNE} runs)')
-        layout.addRow(self.dod_cb)
+        self.dod_cb = QCheckBox('prune old output, keep')
+        # retention policy, any combination of run count, age and total size
+        self.keep_runs_le = QLineEdit(str(MAX_DIRS_PRUNE))
+        self.keep_days_le = QLineEdit(str(MAX_DIRS_AGE_DAYS) if MAX_DIRS_AGE_DAYS is not None else '')
+        self.keep_mb_le = QLineEdit(str(MAX_DIRS_MB) if MAX_DIRS_MB is not None else '')
+        self.keep_runs_le.setValidator(QIntValidator(1, 1000000))
+        self.keep_days_le.setValidator(QDoubleValidator(0, 1e6, 2))
+        self.keep_mb_le.setValidator(QDoubleValidator(0, 1e9, 1))
+        dod_row = QHBoxLayout()
+        dod_row.addWidget(self.dod_cb)
+        for le, unit in ((self.keep_runs_le, 'runs'), (self.keep_days_le, 'days'), (self.keep_mb_le, 'MB')):
+            le.setPlaceholderText('any')
+            le.setStyleSheet("max-width: 60px; ")
+            unit_lb = QLabel(unit)
+            unit_lb.setStyleSheet("font-size: 17px; font-weight: 400;")
+            dod_row.addWidget(le)
+            dod_row.addWidget(unit_lb)
+        dod_row.addStretch()
+        layout.addRow(dod_row)
+        # output table formats
+        formats_lb = QLabel("save tables as")
+        formats_lb.setStyleSheet("font-size: 17px; font-weight: 400;")
+        formats_row = QHBoxLayout()
+        formats_row.addWidget(formats_lb)
+        self.format_cbs = []
+        for fmt in OUTPUT_FORMATS:
+            cb = QCheckBox(fmt)
+            cb.setChecked(fmt == 'csv')
+            if fmt == 'parquet' and not HAS_PARQUET:
+                cb.setEnabled(False)
+                cb.setToolTip('install pyarrow to enable parquet output')
+            self.format_cbs.append(cb)
+            formats_row.addWidget(cb)
+        # drawn image compression
+        tiff_lb = QLabel("drawn image compression")
+        tiff_lb.setStyleSheet("font-size: 17px; font-weight: 400; margin-left: 15px;")
+        self.tiff_compression = QComboBox()
+        self.tiff_compression.addItems(TIFF_COMPRESSIONS)
+        self.tiff_compression.setToolTip('tiled tiff with embedded lower resolution levels, "none" writes a flat uncompressed tiff')
+        formats_row.addWidget(tiff_lb)
+        formats_row.addWidget(self.tiff_compression)
+        formats_row.addStretch()
+        layout.addRow(formats_row)
         # show logs checkbox
         # self.show_logs = QCheckBox('display logger (open in new window)')
         # layout.addRow(self.show_logs)
         # cluster area checkbox
         self.clust_area = QCheckBox('find cluster area')
         layout.addRow(self.clust_area)
+        # result cache checkbox
+        self.use_cache = QCheckBox('reuse cached results of identical runs')
+        self.use_cache.setChecked(True)
+        layout.addRow(self.use_cache)
         # input
         ip_scalr_lb = QLabel("in")
         ip_scalr_lb.setStyleSheet("font-size: 17px; font-weight: 400;")
@@ -264,16 +312,11 @@ class HomePage(QWidget):
             input_folder = QFileDialog.getExistingDirectory(self, 'Select Input Folder', path)
             # print(input_folder)
             if len(os.listdir(input_folder)) > 0:
-                for filename in os.listdir(input_folder):
-                    full_file = os.path.join(input_folder, filename)
-                    if 'image' in filename.lower() and filename.endswith(('.tif', '.png', '.jpeg', '.jpg')) and 'mask' not in filename.lower() and len(self.img_le.text()) == 0:
-                        self.img_le.setText(full_file)
-                    elif 'mask' in filename.lower() and filename.endswith(('.tif', '.png', '.jpeg', '.jpg')) and 'image' not in filename.lower() and len(self.mask_le.text()) == 0:
-                        self.mask_le.setText(full_file)
-                    elif 'gold' in filename.lower() and filename.endswith('.csv') and 'landmark' not in filename.lower() and len(self.csv_le.text()) == 0:
-                        self.csv_le.setText(full_file)
-                    elif 'landmark' in filename.lower() and filename.endswith('.csv') and 'gold' not in filename.lower() and len(self.csv2_le.text()) == 0:
-                        self.csv2_le.setText(full_file)
+                found = match_dataset_files(input_folder)
+                # only fill in files that have not been picked yet
+                for le, key in ((self.img_le, 'img'), (self.mask_le, 'mask'), (self.csv_le, 'csv'), (self.csv2_le, 'csv2')):
+                    if len(le.text()) == 0 and len(found[key]) > 0:
+                        le.setText(found[key])
         except Exception as e:
             print(e, traceback.format_exc())
 
@@ -1,22 +1,244 @@
-from PyQt5.QtCore import Qt, QEvent, pyqtSignal, QRectF, QPoint
-from PyQt5.QtGui import QImage, QPixmap, QPalette, QPainter, QIcon, QCursor, QPainterPath, QBrush, QColor
+from PyQt5.QtCore import Qt, QEvent, pyqtSignal, QRectF, QRect, QPoint, QPointF
+from PyQt5.QtGui import QImage, QPixmap, QPalette, QPainter, QIcon, QCursor, QPainterPath, QBrush, QColor, QPen, \
+    QFont, QPolygonF
 from PyQt5.QtPrintSupport import QPrintDialog, QPrinter
 from PyQt5.QtWidgets import QLabel, QSizePolicy, QScrollArea, QMessageBox, QMainWindow, QMenu, QAction, \
-    qApp, QFileDialog, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QToolButton, QLineEdit, QWidget, QVBoxLayout, \
-    QHBoxLayout, QFrame, QToolBar, QPushButton
-# resources
-import resources
+    qApp, QFileDialog, QGraphicsView, QGraphicsScene, QGraphicsItem, QStyleOptionGraphicsItem, QToolButton, \
+    QLineEdit, QWidget, QVBoxLayout, QHBoxLayout, QFrame, QToolBar, QPushButton, QGraphicsEllipseItem
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+from annotations import AnnotationLayer
+from globals import TILE_SIZE, TILE_CACHE_SIZE, LOD_MIN_TEXT_PX, LOD_MIN_GLYPH_PX, LOD_MAX_ITEMS, LOD_DENSITY_CELL_PX
+import numpy as np
+import math
+
+
+class QTilePyramid:
+    """
+    TILE PYRAMID
+    __________________
+    @img: full resolution image, level 0 of the pyramid
+    @tile_size: edge length of each square tile in px
+    @cache_size: max number of tile pixmaps kept in the LRU cache
+    @levels: optional precomputed levels 1, 2, ... (e.g. embedded in a pyramidal tiff), each half the previous size
+
+    Each level is half the size of the one below it and is only built the first time it is needed. Tiles are cut
+    from their level on demand and kept in an LRU cache so panning/zooming never touches the full image again.
+    """
+    def __init__(self, img: QImage, tile_size: int = TILE_SIZE, cache_size: int = TILE_CACHE_SIZE,
+                 levels: List[QImage] = None):
+        self.tile_size = tile_size
+        self.cache_size = cache_size
+        self.width, self.height = img.width(), img.height()
+        # number of halvings until the whole image fits into a single tile
+        longest = max(self.width, self.height, 1)
+        self.n_levels = max(1, math.ceil(math.log2(longest / tile_size)) + 1) if longest > tile_size else 1
+        self._levels = [img] + [None] * (self.n_levels - 1)
+        for idx, level in enumerate((levels or [])[:self.n_levels - 1], start=1):
+            self._levels[idx] = level
+        self._tiles = OrderedDict()
+
+    def level(self, idx: int) -> QImage:
+        """ GET (AND LAZILY BUILD) PYRAMID LEVEL """
+        if self._levels[idx] is None:
+            prev = self.level(idx - 1)
+            self._levels[idx] = prev.scaled(max(1, prev.width() // 2), max(1, prev.height() // 2),
+                                            Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        return self._levels[idx]
+
+    def level_for_scale(self, scale: float) -> int:
+        """ PICK COARSEST LEVEL THAT STILL HAS AT LEAST ONE IMAGE PX PER SCREEN PX """
+        if scale <= 0:
+            return self.n_levels - 1
+        return min(self.n_levels - 1, max(0, int(math.floor(math.log2(1 / scale)))))
+
+    def tile(self, level: int, col: int, row: int) -> QPixmap:
+        """ GET TILE PIXMAP FROM LRU CACHE, CUTTING IT FROM ITS LEVEL ON A MISS """
+        key = (level, col, row)
+        pix = self._tiles.get(key)
+        if pix is not None:
+            self._tiles.move_to_end(key)
+            return pix
+        lvl = self.level(level)
+        rect = QRect(col * self.tile_size, row * self.tile_size, self.tile_size, self.tile_size).intersected(lvl.rect())
+        pix = QPixmap.fromImage(lvl.copy(rect))
+        self._tiles[key] = pix
+        while len(self._tiles) > self.cache_size:
+            self._tiles.popitem(last=False)
+        return pix
+
+    def clear(self):
+        self._tiles.clear()
+
+
+class QTiledPixmapItem(QGraphicsItem):
+    """ GRAPHICS ITEM THAT PAINTS ONLY THE VISIBLE TILES OF A QTilePyramid AT THE CURRENT ZOOM """
+    def __init__(self):
+        super(QTiledPixmapItem, self).__init__()
+        self.pyramid = None
+        # exposedRect is only filled in when extended style options are requested
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def setImage(self, img: QImage = None, levels: List[QImage] = None):
+        self.prepareGeometryChange()
+        self.pyramid = QTilePyramid(img, levels=levels) if img is not None and not img.isNull() else None
+        self.update()
+
+    def isNull(self):
+        return self.pyramid is None
+
+    def boundingRect(self):
+        if self.pyramid is None:
+            return QRectF()
+        return QRectF(0, 0, self.pyramid.width, self.pyramid.height)
+
+    def paint(self, painter, option, widget=None):
+        if self.pyramid is None:
+            return
+        pyr = self.pyramid
+        scale = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        level = pyr.level_for_scale(scale)
+        lvl = pyr.level(level)
+        # level px -> scene px, exact even when halving rounded down
+        sx, sy = pyr.width / lvl.width(), pyr.height / lvl.height()
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        ts = pyr.tile_size
+        col0, col1 = int(exposed.left() / sx) // ts, int(math.ceil(exposed.right() / sx)) // ts
+        row0, row1 = int(exposed.top() / sy) // ts, int(math.ceil(exposed.bottom() / sy)) // ts
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, level == 0 and scale < 1)
+        for row in range(row0, min(row1, (lvl.height() - 1) // ts) + 1):
+            for col in range(col0, min(col1, (lvl.width() - 1) // ts) + 1):
+                pix = pyr.tile(level, col, row)
+                target = QRectF(col * ts * sx, row * ts * sy, pix.width() * sx, pix.height() * sy)
+                painter.drawPixmap(target, pix, QRectF(pix.rect()))
+
+
+def paint_density(painter: QPainter, layer: AnnotationLayer, scale: float):
+    """ PAINT AGGREGATED ANNOTATION DENSITY (ONE SEMI-TRANSPARENT CELL PER ~LOD_DENSITY_CELL_PX SCREEN PX) """
+    # snap cell size to a power of two so zooming doesn't rebuild the histogram on every wheel tick
+    cell = 2 ** max(0, int(math.ceil(math.log2(max(1.0, LOD_DENSITY_CELL_PX / max(scale, 1e-6))))))
+    grid = layer.density(cell)
+    if grid.max() == 0:
+        return
+    b, g, r = (int(c) for c in layer.main_color()[:3])
+    alpha = np.log1p(grid) / np.log1p(grid.max())
+    # ARGB32 is stored as B, G, R, A bytes on little endian machines
+    bgra = np.zeros(grid.shape + (4,), dtype=np.uint8)
+    bgra[..., 0], bgra[..., 1], bgra[..., 2] = b, g, r
+    bgra[..., 3] = (alpha * 230).astype(np.uint8)
+    img = QImage(bgra.data, grid.shape[1], grid.shape[0], 4 * grid.shape[1], QImage.Format_ARGB32)
+    painter.drawImage(QRectF(0, 0, grid.shape[1] * cell, grid.shape[0] * cell), img)
+
+
+def paint_layer(painter: QPainter, layer: AnnotationLayer, exposed: QRectF = None, detail: bool = False):
+    """
+    PAINT RECORDED ANNOTATIONS WITH QPAINTER (IMAGE COORDINATES, BGR COLORS LIKE OPENCV)
+    _______________________________
+    @exposed: only annotations intersecting this rect (image px) are drawn, defaults to the whole layer
+    @detail: always draw every annotation at full detail (export/print) instead of picking a level of detail
+    """
+    def to_qcolor(color):
+        return QColor(int(color[2]), int(color[1]), int(color[0]))
+
+    h, w = layer.shape[:2]
+    rect = exposed if exposed is not None else QRectF(0, 0, w, h)
+    ids = layer.visible((rect.left(), rect.top(), rect.right(), rect.bottom()))
+    scale = 1.0 if detail else QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+    painter.save()
+    if not detail and len(ids) > LOD_MAX_ITEMS:
+        paint_density(painter, layer, scale)
+        painter.restore()
+        return
+    painter.setRenderHint(QPainter.Antialiasing, detail or scale >= 0.5)
+    font = QFont()
+    glyph_pts = {}
+    for i in ids:
+        kind, args = layer.ops[i]
+        if kind == 'circle':
+            center, radius, color, thickness = args
+            if not detail and radius * scale < LOD_MIN_GLYPH_PX:
+                # too small to tell apart from a dot, batch into one drawPoints call per color
+                glyph_pts.setdefault(color, []).append(QPointF(*center))
+                continue
+            if thickness < 0:
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(to_qcolor(color))
+            else:
+                painter.setPen(QPen(to_qcolor(color), thickness))
+                painter.setBrush(Qt.NoBrush)
+            painter.drawEllipse(QPointF(*center), radius, radius)
+        elif kind == 'line':
+            pt1, pt2, color, thickness = args
+            painter.setPen(QPen(to_qcolor(color), thickness, Qt.SolidLine, Qt.RoundCap))
+            painter.drawLine(QPointF(*pt1), QPointF(*pt2))
+        elif kind == 'text':
+            text, org, color, font_scale = args
+            # HERSHEY_SIMPLEX capitals are ~22px tall at scale 1
+            px = max(1, int(round(22 * font_scale)))
+            if not detail and px * scale < LOD_MIN_TEXT_PX:
+                continue
+            font.setPixelSize(px)
+            painter.setFont(font)
+            painter.setPen(to_qcolor(color))
+            painter.drawText(QPointF(*org), text)
+        elif kind == 'contour':
+            pts, color, thickness, (x, y, w, h) = args
+            if not detail and max(w, h) * scale < LOD_MIN_GLYPH_PX:
+                # as with circles, a contour this small is drawn as a dot
+                glyph_pts.setdefault(color, []).append(QPointF(x + w / 2, y + h / 2))
+                continue
+            painter.setPen(QPen(to_qcolor(color), thickness))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolygon(QPolygonF([QPointF(float(px), float(py)) for px, py in pts]))
+    for color, pts in glyph_pts.items():
+        # cosmetic pen: 2 screen px regardless of zoom
+        pen = QPen(to_qcolor(color), 2)
+        pen.setCosmetic(True)
+        painter.setPen(pen)
+        painter.drawPoints(QPolygonF(pts))
+    painter.restore()
+
+
+class QOverlayItem(QGraphicsItem):
+    """ GRAPHICS ITEM DRAWING AN ANNOTATION LAYER ON TOP OF THE BASE IMAGE """
+    def __init__(self, layer: AnnotationLayer):
+        super(QOverlayItem, self).__init__()
+        self.layer = layer
+        self.setZValue(1)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def boundingRect(self):
+        h, w = self.layer.shape[:2]
+        return QRectF(0, 0, w, h)
+
+    def paint(self, painter, option, widget=None):
+        paint_layer(painter, self.layer, option.exposedRect)
+
+
+def render_thumbnail(img: QImage, layers: List[AnnotationLayer], width: int, height: int) -> QPixmap:
+    """ SCALE BASE IMAGE AND PAINT ANNOTATION LAYERS OVER IT (NO FULL-RESOLUTION BURN) """
+    pixmap = QPixmap.fromImage(img.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    painter = QPainter(pixmap)
+    painter.scale(pixmap.width() / img.width(), pixmap.height() / img.height())
+    for layer in layers:
+        paint_layer(painter, layer)
+    painter.end()
+    return pixmap
+
 
 class QPhotoViewer(QGraphicsView):
     photoClicked = pyqtSignal(QPoint)
+    photoHovered = pyqtSignal(QPoint)
 
     def __init__(self):
         super(QPhotoViewer, self).__init__()
+        self.setMouseTracking(True)
         self._zoom = 0
         self._empty = True
         self._scene = QGraphicsScene(self)
-        self._photo = QGraphicsPixmapItem()
+        self._photo = QTiledPixmapItem()
         self._scene.addItem(self._photo)
+        self._overlays = []
         self.setScene(self._scene)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
@@ -29,7 +251,7 @@ class QPhotoViewer(QGraphicsView):
         return not self._empty
 
     def fitInView(self, scale=True):
-        rect = QRectF(self._photo.pixmap().rect())
+        rect = self._photo.boundingRect()
         if not rect.isNull():
             self.setSceneRect(rect)
             if self.hasPhoto():
@@ -41,19 +263,42 @@ class QPhotoViewer(QGraphicsView):
                              viewrect.height() / scenerect.height())
                 self.scale(factor, factor)
             self._zoom = 0
+            self._update_overlay_lod()
 
-    def setPhoto(self, pixmap=None):
+    def setPhoto(self, img=None, levels: List[QImage] = None):
         self._zoom = 0
-        if pixmap and not pixmap.isNull():
+        if isinstance(img, QPixmap):
+            img = img.toImage()
+        if img and not img.isNull():
             self._empty = False
             self.setDragMode(QGraphicsView.ScrollHandDrag)
-            self._photo.setPixmap(pixmap)
+            self._photo.setImage(img, levels)
         else:
             self._empty = True
             self.setDragMode(QGraphicsView.NoDrag)
-            self._photo.setPixmap(QPixmap())
+            self._photo.setImage(None)
         self.fitInView()
 
+    def setOverlays(self, layers: List[AnnotationLayer] = None):
+        """ REPLACE ANNOTATION OVERLAYS WITHOUT TOUCHING THE BASE IMAGE """
+        for item in self._overlays:
+            self._scene.removeItem(item)
+        self._overlays = [QOverlayItem(layer) for layer in (layers or [])]
+        for item in self._overlays:
+            self._scene.addItem(item)
+        self._update_overlay_lod()
+
+    def _update_overlay_lod(self):
+        """
+        CALLED WHENEVER THE ZOOM CHANGES. While the whole image fits in the viewport the overlays are cheap
+        aggregated/simplified drawings of bounded size, so cache them in device coordinates and let pans and hover
+        repaints blit the cache. Zoomed in, the cache would be as large as the zoomed image, so paint directly
+        (culled to the viewport) instead.
+        """
+        zoomed_in = self._zoom > 0
+        for item in self._overlays:
+            item.setCacheMode(QGraphicsItem.NoCache if zoomed_in else QGraphicsItem.DeviceCoordinateCache)
+
     def wheelEvent(self, event):
         if self.hasPhoto():
             if event.angleDelta().y() > 0:
@@ -68,11 +313,12 @@ class QPhotoViewer(QGraphicsView):
                 self.fitInView()
             else:
                 self._zoom = 0
+            self._update_overlay_lod()
 
     def toggleDragMode(self):
         if self.dragMode() == QGraphicsView.ScrollHandDrag:
             self.setDragMode(QGraphicsView.NoDrag)
-        elif not self._photo.pixmap().isNull():
+        elif not self._photo.isNull():
             self.setDragMode(QGraphicsView.ScrollHandDrag)
 
     def mousePressEvent(self, event):
@@ -80,17 +326,39 @@ class QPhotoViewer(QGraphicsView):
             self.photoClicked.emit(self.mapToScene(event.pos()).toPoint())
         super(QPhotoViewer, self).mousePressEvent(event)
 
+    def mouseMoveEvent(self, event):
+        if self.hasPhoto() and event.buttons() == Qt.NoButton:
+            self.photoHovered.emit(self.mapToScene(event.pos()).toPoint())
+        super(QPhotoViewer, self).mouseMoveEvent(event)
+
+    def sceneScale(self) -> float:
+        """ SCREEN PX PER IMAGE PX AT THE CURRENT ZOOM """
+        return self.transform().m11()
+
     def increment_zoom(self):
         self._zoom += 1
         self.scale(1.25, 1.25)
+        self._update_overlay_lod()
 
     def decrement_zoom(self):
         self._zoom -= 1
         self.scale(0.8, 0.8)
+        self._update_overlay_lod()
 
 
 class QImageViewer(QMainWindow):
-    def __init__(self, img):
+    """
+    IMAGE VIEWER
+    __________________
+    @img: base image
+    @layers: annotation layers painted over the base image
+    @inspector: optional lookup (x, y, max_dist) -> ((particle x, particle y), description) or None, used to show the
+        particle under the cursor in the status bar on hover and to pin it on click
+    @levels: optional lower resolution levels of img (e.g. read from a pyramidal tiff), see QTilePyramid
+    """
+    def __init__(self, img, layers: List[AnnotationLayer] = None,
+                 inspector: Callable[[float, float, float], Optional[Tuple[Tuple[float, float], str]]] = None,
+                 levels: List[QImage] = None):
         super(QImageViewer, self).__init__()
 
         self.setWindowTitle("EM Image Viewer")
@@ -99,8 +367,21 @@ class QImageViewer(QMainWindow):
         self.printer = QPrinter()
 
         self.img = img
+        self.layers = layers or []
         self.viewer = QPhotoViewer()
-        self.viewer.setPhoto(QPixmap(img))
+        self.viewer.setPhoto(img, levels)
+        self.viewer.setOverlays(self.layers)
+        self.inspector = inspector
+        if self.inspector is not None:
+            self.pinned = QLabel()
+            self.statusBar().addPermanentWidget(self.pinned)
+            self.marker = QGraphicsEllipseItem()
+            self.marker.setPen(QPen(QColor(255, 255, 0), 3))
+            self.marker.setZValue(2)
+            self.marker.setVisible(False)
+            self.viewer._scene.addItem(self.marker)
+            self.viewer.photoHovered.connect(self.on_hover)
+            self.viewer.photoClicked.connect(self.on_click)
         self.setCentralWidget(self.viewer)
 
         self.menu = self.menuBar()
@@ -108,24 +389,60 @@ class QImageViewer(QMainWindow):
         self.create_menus()
 
 
+    def inspect(self, pos: QPoint):
+        # pick radius of ~15 screen px regardless of zoom
+        return self.inspector(pos.x(), pos.y(), 15 / max(self.viewer.sceneScale(), 1e-6))
+
+    def on_hover(self, pos: QPoint):
+        found = self.inspect(pos)
+        if found is None:
+            self.statusBar().clearMessage()
+        else:
+            self.statusBar().showMessage(found[1])
+
+    def on_click(self, pos: QPoint):
+        found = self.inspect(pos)
+        if found is None:
+            self.marker.setVisible(False)
+            self.pinned.setText("")
+            return
+        (x, y), desc = found
+        self.marker.setRect(QRectF(x - 16, y - 16, 32, 32))
+        self.marker.setVisible(True)
+        self.pinned.setText(desc)
+
     def save(self):
         print("save file")
         options = QFileDialog.Options()
         path, _ = QFileDialog.getSaveFileName(self, "Save File", "output_file.tif", "All Files(*);;", options=options)
         print(path)
         if path:
-            self.img.save(path)
+            self.flattened().save(path)
+
+    def flattened(self) -> QImage:
+        """ BURN OVERLAYS INTO A COPY OF THE BASE IMAGE """
+        if not self.layers:
+            return self.img
+        out = self.img.convertToFormat(QImage.Format_RGB32)
+        painter = QPainter(out)
+        for layer in self.layers:
+            paint_layer(painter, layer, detail=True)
+        painter.end()
+        return out
 
     def print_(self):
         dialog = QPrintDialog(self.printer, self)
         if dialog.exec_():
             painter = QPainter(self.printer)
             rect = painter.viewport()
-            size = self._photo.pixmap().size()
+            size = self.img.size()
             size.scale(rect.size(), Qt.KeepAspectRatio)
             painter.setViewport(rect.x(), rect.y(), size.width(), size.height())
-            painter.setWindow(self._photo.pixmap().rect())
-            painter.drawPixmap(0, 0, self._photo.pixmap())
+            painter.setWindow(self.img.rect())
+            painter.drawImage(0, 0, self.img)
+            for layer in self.layers:
+                paint_layer(painter, layer, detail=True)
+            painter.end()
 
     def zoom_in(self):
         self.viewer.increment_zoom()
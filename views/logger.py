@@ -1,37 +1,157 @@
 import logging
-from PyQt5.QtCore import QSize
+import threading
+import atexit
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional, Tuple
+from PyQt5.QtCore import QSize, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QPlainTextEdit, QDialog, QVBoxLayout
-# resources
-import resources
+from globals import LOG_MAX_LINES, LOG_FLUSH_MS, LOG_FILE, LOG_FILE_MAX_MB, LOG_FILE_BACKUPS
 
-class QPlainTextEditLogger(logging.Handler):
-    def __init__(self, parent):
+"""
+LOGGING PIPELINE
+___________________
+Logging from any thread only formats the record and puts it on a queue (QueueHandler on the root logger). A listener
+thread hands records to the sinks: the handlers the root logger had (e.g. the console), the logger window's ring
+buffer and, if LOG_FILE is set, a rotating log file. The window drains the buffer on a timer in the GUI thread, so
+workers logging thousands of lines never wait for (or touch) a widget.
+"""
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_listener: Optional[QueueListener] = None
+
+
+def install_queue_logging(*sinks: logging.Handler) -> QueueListener:
+    """
+    ROUTE THE ROOT LOGGER THROUGH A QUEUE
+    __________________
+    @sinks: handlers fed on the listener thread, next to the ones the root logger already had
+    @return: the listener, stopped (and drained) at exit. Only the first call installs it
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    root = logging.getLogger()
+    handlers = list(root.handlers) + list(sinks)
+    if LOG_FILE:
+        file_sink = RotatingFileHandler(LOG_FILE, maxBytes=int(LOG_FILE_MAX_MB * 2 ** 20), backupCount=LOG_FILE_BACKUPS,
+                                        encoding='utf-8')
+        file_sink.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(file_sink)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    q = queue.SimpleQueue()
+    root.addHandler(QueueHandler(q))
+    _listener = QueueListener(q, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
+
+
+class LogBuffer(logging.Handler):
+    """
+    LOG RING BUFFER
+    __________________
+    @capacity: lines kept until drained, the oldest are dropped first
+
+    Collects formatted lines on the listener thread for the logger window to drain.
+    """
+    def __init__(self, capacity: int = LOG_MAX_LINES):
         super().__init__()
-        self.logger = QPlainTextEdit(parent)
-        self.logger.setStyleSheet("background: #ddd;")
-        self.logger.setReadOnly(True)
+        self.lines = deque(maxlen=capacity)
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._lock:
+            if len(self.lines) == self.lines.maxlen:
+                self.dropped += 1
+            self.lines.append(msg)
+
+    def drain(self) -> Tuple[List[str], int]:
+        """ LINES COLLECTED SINCE THE LAST DRAIN AND HOW MANY OLDER ONES WERE DROPPED """
+        with self._lock:
+            lines, dropped = list(self.lines), self.dropped
+            self.lines.clear()
+            self.dropped = 0
+        return lines, dropped
 
-    def emit(self, record):
-        msg = self.format(record)
-        self.logger.appendPlainText(msg)
-        print(f'DEBUG: {msg}')
+
+class QPlainTextEditLogger(QPlainTextEdit):
+    """
+    LOG VIEW
+    __________________
+    @parent: logger window
+    @buffer: ring buffer the records arrive in
+
+    Appends what the buffer collected every LOG_FLUSH_MS in one go while shown, keeping the last LOG_MAX_LINES lines.
+    """
+    def __init__(self, parent, buffer: LogBuffer):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.setStyleSheet("background: #ddd;")
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(LOG_MAX_LINES)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start(LOG_FLUSH_MS)
+
+    def flush(self):
+        # hidden, lines wait in the (capped) buffer
+        if not self.isVisible():
+            return
+        lines, dropped = self.buffer.drain()
+        if dropped > 0:
+            lines.insert(0, f'... {dropped} older lines dropped')
+        if len(lines) > 0:
+            self.appendPlainText('\n'.join(lines))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.flush()
 
 
 class Logger(QDialog):
+    """ LOGGER WINDOW, ONE PER APP (SEE instance). CREATING IT INSTALLS THE LOGGING PIPELINE """
+    _instance: Optional['Logger'] = None
+    show_requested = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle('GoldInAndOut Logger')
         self.setWindowIcon(QIcon(':/icons/logo.ico'))
         self.setMinimumSize(QSize(600, 300))
-        self.log_text_box = QPlainTextEditLogger(self)
-        self.log_text_box.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        logging.getLogger().addHandler(self.log_text_box)
+        self.buffer = LogBuffer()
+        self.buffer.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.log_text_box = QPlainTextEditLogger(self, self.buffer)
+        install_queue_logging(self.buffer)
         logging.getLogger().setLevel(logging.INFO)
+        # queued when emitted from a worker thread
+        self.show_requested.connect(self.show)
         layout = QVBoxLayout()
-        layout.addWidget(self.log_text_box.logger)
+        layout.addWidget(self.log_text_box)
         self.setLayout(layout)
 
+    @classmethod
+    def instance(cls) -> 'Logger':
+        """ THE APP'S LOGGER WINDOW, CREATED ON FIRST USE (FROM THE GUI THREAD) """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def show_from_any_thread(cls):
+        """ SHOW THE LOGGER WINDOW, E.G. AFTER A WORKER FAILED. NOTHING IF THERE IS NONE (HEADLESS) """
+        if cls._instance is not None:
+            cls._instance.show_requested.emit()
+
     def test(self):
         logging.debug('damn, a bug')
         logging.info('something to remember')
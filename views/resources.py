@@ -1,3608 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\xdd\xf6\
-\x00\
-\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00\x20\x00\xe0\xdd\x00\
-\x00\x16\x00\x00\x00\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\
-\x0d\x49\x48\x44\x52\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
-\x00\x00\x5c\x72\xa8\x66\x00\x00\x80\x00\x49\x44\x41\x54\x78\xda\
-\xec\xbd\x77\x9c\x64\x47\x75\xf7\xfd\x3d\x55\x75\x6f\xf7\xe4\xdd\
-\xd9\xa4\xb8\xca\x39\xe7\x0c\x42\x20\xa2\x6d\x92\xb1\xc1\xf0\x18\
-\x3f\x18\xdb\x24\xe7\x88\x79\x89\x36\x18\x78\x30\xe1\x21\xf3\x90\
-\x0d\x26\x9b\x20\x32\x22\x08\xe5\x2c\xad\x56\x5a\x85\x55\x5c\x69\
-\x73\x98\xd9\x49\xdd\x7d\x6f\xd5\x79\xff\xa8\xba\xdd\x3d\xb3\xbb\
-\xd2\x2c\xac\xb4\x41\x7b\xf4\x69\xed\x74\x4f\xcf\xed\xdb\x15\x4e\
-\x9d\xf0\x3b\xbf\x23\xaa\xaa\xec\x95\x5d\x4f\x34\x3d\x24\x3d\x97\
-\xd0\xf5\xcb\xee\x9f\xa5\xf3\xa6\xea\x6f\xb6\xf1\x2b\x61\x36\xa2\
-\xd0\xbd\x24\x04\xc0\xa4\xdf\x08\x01\x69\x7f\xc4\xcc\xeb\x99\x19\
-\x1f\xbd\x57\x76\x7d\x91\xbd\x0a\x60\x17\x97\xf6\xce\x0d\x33\x5e\
-\xd4\xf4\x2b\x01\xcc\xf4\x8d\x3f\x73\x87\x4a\x7c\x29\xf0\x58\x22\
-\x80\x62\xa7\x29\x01\xc3\xcc\xed\xac\x4c\xbf\x6e\xf7\x5f\xef\xdd\
-\xf8\xbb\x97\xec\x55\x00\xbb\xb0\x4c\xdf\x5c\xd3\x8f\x77\x4d\x3f\
-\x07\x0c\x01\x99\xb6\x4d\x25\xbd\x4d\x65\xfa\x75\x64\xc6\x35\xb7\
-\x26\xd2\xf5\x09\xd5\xb3\xea\x7a\xd3\x36\x77\xf5\xeb\xbd\x3b\x7e\
-\xb7\x16\xb7\xb3\x6f\x60\xaf\x6c\x5d\xba\xb7\x7b\xdc\xb8\xd2\xf5\
-\x9b\xea\xe4\xef\xec\x40\x4f\xe7\xac\x56\x99\x7e\x9d\xea\x1a\xa6\
-\xfb\x85\x47\x91\x20\xdd\x9f\x17\xff\x58\xb6\x76\xc1\x99\xd7\xdb\
-\xab\x0c\x76\x3b\xd9\x6b\x01\xec\x6e\xa2\xb3\x78\x7d\x6b\x47\xfd\
-\x6c\x37\x67\xf5\x77\xba\x95\xa8\x81\xa4\xd7\x1e\xed\xf4\x97\xad\
-\x5f\x6e\xaf\x6e\xd8\x35\x65\xaf\x05\xb0\xab\x8a\x82\x86\x80\x88\
-\x80\x6c\x63\xfb\x68\x15\x07\xf0\xf1\xb9\xc4\x9d\xaf\x5a\xe9\x00\
-\x45\xc4\xb4\xa3\x05\xf1\x2d\xb2\xad\x8f\xa3\xfa\x43\xe9\xde\xb5\
-\x5d\x47\x7f\x20\x5a\x1e\x6a\x94\xa0\x82\xc5\x24\x4b\xa4\x7a\x87\
-\x4e\x7b\x0e\x7b\x37\xfe\xae\x2e\x7b\x15\xc0\x2e\x2c\x71\xb3\x4a\
-\x57\x40\x4e\x08\xaa\x18\xd3\x89\x08\x18\x43\xb4\xf9\x05\x42\x08\
-\x71\x23\x4b\x7a\x2f\x8a\x11\x25\x84\x18\xbf\x37\x58\x42\xb7\xc1\
-\x17\x77\xfd\x16\x9b\x56\x85\x69\x5a\x40\x44\xf0\xaa\x28\x4a\xa8\
-\x94\x89\xc4\xbf\x35\xda\xd6\x3b\x7b\x4f\xfb\xdd\x50\xf6\xba\x00\
-\xbb\x80\x6c\x6d\x0a\x24\xa4\x9d\x95\x4e\xec\x90\x4e\xe7\x00\x78\
-\x94\x90\xfe\xc4\x2a\x58\x1f\x15\x81\xb8\xa8\x30\x3c\xd3\xad\xf4\
-\x1d\x11\xab\x0b\x40\xf0\x81\xb2\xf4\x38\x67\x41\x94\x40\xbc\x3f\
-\x21\xde\x66\x95\x06\x34\x7b\x55\xc0\x6e\x23\x7b\x15\xc0\x13\x2c\
-\x9a\x4e\xdd\x47\x7d\x0f\x20\x69\x5a\x0a\x5f\xa2\x46\x10\x63\xf1\
-\x0a\x62\x0c\x01\xb0\x44\xf3\x4d\x89\x1b\xaf\x00\x36\xb6\x0a\x8a\
-\xe0\x29\x55\x99\xf2\x25\x82\xd2\x2a\x0a\x46\x47\x47\xd8\x34\x3a\
-\xca\xaa\x0d\x1b\x08\xaa\x71\x23\xfb\x92\xa0\x4a\x6f\xbd\x07\x15\
-\xc8\xf3\x9c\x39\x73\xe6\x30\x77\x68\x88\x85\x73\xe6\x62\x35\x1e\
-\xeb\x75\x97\xd1\x67\x0c\x99\x31\xf4\x67\x19\x79\xd7\x7d\x86\xf4\
-\x50\x40\x35\x10\x7c\xc0\xa0\x38\x6b\xa3\x01\xa1\x82\xa4\x90\x81\
-\x4a\xb4\x34\xba\x5d\x90\x2d\x97\x9e\x6c\xd3\xdb\xd9\x2b\x8f\x8f\
-\xec\x75\x01\x9e\x70\x99\x19\xdf\xaf\x9e\x45\xdf\x5d\x35\x60\xc4\
-\x40\xda\xe8\xc6\xe4\x58\xa0\x05\x8c\x69\x8b\xf1\xb1\x29\x8a\x10\
-\x78\x68\xcd\x4a\xee\x59\xbe\x9c\x4d\xa1\x64\xd4\x59\xd6\x8f\x6c\
-\xe2\xf6\xbb\xef\x62\x74\x6a\x02\x6f\x60\xa2\xd9\x88\x8a\xc4\x08\
-\xcd\x66\x93\xa2\x28\xf1\x81\xf4\x19\x8a\xf7\x01\xd5\x80\xb3\x8e\
-\xa0\x31\xd6\x90\x67\x39\x59\x9e\x63\x9c\x45\x34\x60\x45\xe8\x35\
-\x19\x3d\x46\x18\xea\xe9\xe3\x84\x23\x8f\x66\xe1\xe0\x1c\x6c\x80\
-\x81\xbe\x3e\x4e\x3f\xf8\x60\x0e\x1e\x9e\x87\x18\x61\xb0\xbf\x9f\
-\x01\x97\x75\xc0\x40\x69\xe3\x97\xa5\x47\x55\x11\x23\x98\x64\x2d\
-\x6c\x69\x20\x68\xd7\xbf\x86\xc7\x92\xd9\x83\x9a\xf6\xca\x63\xc9\
-\x5e\x0b\xe0\xb1\x64\x6b\x8e\xed\x4c\xd0\x4d\x37\x6a\xcf\x44\x1f\
-\xda\xa3\x78\x52\xd0\x2c\x6d\x26\x51\x45\xc4\x23\x44\x7f\x1d\x35\
-\x84\xe4\xe7\x1b\x63\xb1\x5d\x97\x7c\x78\x6a\x8a\x8d\x1a\xb8\xfd\
-\xbe\xe5\xdc\xf7\xf0\x0a\x36\xb5\x1a\xdc\xba\x7c\x19\x2b\xd7\xad\
-\xa7\xa1\x25\xa3\xe3\x63\x8c\x6d\x9e\xa0\x30\x12\xed\x7f\x6b\x21\
-\x73\x88\xb3\xa8\x08\xc6\x5a\x82\x46\xe8\x8f\x48\xbc\x7e\x75\xfa\
-\x76\x9f\xc2\xa1\x0a\x34\xa6\x9f\xe3\x7d\x69\x27\x93\x10\x14\x42\
-\x88\x4f\x9b\x05\x34\x1b\xe0\x32\x8c\xb1\xec\xd3\xdb\xc7\x9c\x2c\
-\xa3\x6e\x1c\x8b\xf7\xdd\x97\x23\x17\x1f\xc4\xa2\xfe\x21\x8e\x3a\
-\xf8\x60\x8e\xd9\xff\x40\x06\xf2\x1a\x03\xb5\x1a\xf5\xea\x7b\x15\
-\x51\xc1\x89\xa1\x1d\x7f\xc0\x04\x30\x31\xf5\x58\x59\x14\x06\x21\
-\x43\xd0\x00\xa2\x29\xb9\x99\xc6\xb5\x4c\xef\x71\x74\x41\x94\xba\
-\xf5\x47\x15\x36\x49\x93\x22\x3b\xc4\x01\xda\x73\x65\xaf\x02\x78\
-\x2c\x79\xac\xe3\x46\xe3\x62\x53\x15\x44\x3a\x11\xb1\xd0\x7e\x1d\
-\xac\x31\x84\xa0\x58\x40\x8b\x02\x31\x20\x59\x34\xa6\x0b\x60\x33\
-\x30\x52\x34\xb8\xeb\x91\x07\x79\x70\xe5\x2a\xee\x79\xe0\x3e\x6e\
-\xbe\x7b\x39\x6b\xc6\xc6\x59\xbf\x79\x84\xd1\xa2\x49\xe9\x04\xad\
-\xe7\xa8\x31\x31\x40\x97\xe7\x58\x97\x55\xf6\x75\xfa\xac\x0e\x82\
-\x4f\x55\xe3\xc6\xd6\x8e\x85\x31\x1b\x91\x69\x49\xff\xce\xab\xa0\
-\x88\x31\x88\x48\xdb\x74\x0f\xa5\x07\x5f\xc6\x47\xe9\x31\x45\x49\
-\x5e\x7a\x86\xeb\x75\x86\x7b\xfb\xd8\x7f\xfe\x02\x8e\x39\xe2\x48\
-\x8e\xda\xf7\x00\x8e\xd9\x77\x7f\x0e\x3f\xe4\x10\xe6\x9a\x8c\x8c\
-\xe8\xc2\x68\x08\xa0\x01\x11\xc5\x7b\x8f\x71\x0e\x9f\x3e\xdb\xa8\
-\x22\x01\x8c\xd8\x08\x73\x4a\xaf\x57\xb1\x0f\x0c\x6d\x57\x48\xb6\
-\x34\xaa\x40\x14\xa5\x44\x70\xec\x55\x00\xdb\x96\xbd\x0a\xe0\x31\
-\x64\x6b\x87\xfd\xcc\x77\x78\xe2\x89\x2f\x28\x19\x82\x51\x89\xd0\
-\x7d\x1f\xd0\xa0\xa8\x35\x60\x04\x15\xc1\xa6\x85\xbb\x6e\x72\x8a\
-\xbb\x57\xaf\xe2\xfa\x7b\xee\x64\xe9\xca\x07\xb9\xe1\xde\xbb\x58\
-\x35\x36\xc2\xc6\xc6\x24\x01\xc5\x99\x1a\x75\x2c\x26\xcf\x09\x99\
-\xa1\x10\xc5\x6b\xe7\x84\x14\x11\xbc\x2f\xe3\x86\xb0\x76\x36\x5f\
-\x65\x87\x8b\xa4\xef\x55\x61\x06\x9c\x11\x24\x04\x7c\xd1\x42\xca\
-\x92\x50\x7a\x42\xab\x85\x09\x81\xf9\xfd\xfd\xec\x3f\x7f\x01\xc7\
-\x2f\x3e\x84\xd3\x8e\x39\x8e\x63\x0f\x38\x88\x63\x16\x1e\xc0\x02\
-\xe7\xda\xa7\xb9\xf7\x1e\x14\x42\x52\x36\xa4\x6c\x87\x43\x30\x15\
-\x96\x39\xc4\x31\xd7\x4c\xf1\x31\xaa\xd0\x09\x74\x4e\x9b\x1c\x4d\
-\xf5\x13\x5b\x42\x99\xf7\x4a\x47\xf6\x2a\x80\x47\x91\x99\xf8\xf9\
-\xe9\x5e\x40\x68\x9f\xac\x81\x68\x9a\x1a\x20\x43\xb0\x41\x08\xa5\
-\x52\xfa\x40\xde\xe3\xf0\xc0\x38\xb0\x7a\x62\x9c\x2b\x96\xdd\xce\
-\xad\xf7\xde\xc7\xcd\xb7\x2d\xe1\xc1\x75\xab\x18\x29\x9a\x34\x04\
-\xb4\xb7\x0e\xb5\x9c\x52\xc0\xd4\x72\xa4\xd9\xc4\x04\xa5\xac\xcc\
-\x59\x49\xa6\x7e\x10\x08\x01\x83\x60\x13\x40\xb8\x94\x59\x9e\xee\
-\x5b\x89\xb0\xfd\x76\xd3\x2f\x80\x8b\x5f\x3c\x28\xc9\x66\x8f\xbf\
-\x32\x82\x28\x58\x13\x03\x80\xde\x37\xa1\xd9\x82\x66\x8b\x0c\xc3\
-\xbc\xbc\x87\x63\xf7\x3b\x90\x33\x8f\x3c\x96\x33\x8e\x3c\x96\x13\
-\x0f\x3f\x92\xfd\x7a\x7a\xe8\x05\xd4\x43\xcb\x97\x88\x33\xa8\x18\
-\x4c\xca\x30\x18\x40\x92\x5b\x83\x84\x84\x56\x34\x6d\xd4\x62\xdb\
-\xd8\x6f\x07\x5a\xab\x94\xe5\x5e\x05\xb0\x2d\xd9\xab\x00\x1e\x45\
-\xba\xdd\xfb\x69\xe7\x88\x32\xad\x3a\x4f\xb5\xe3\x2e\x47\x7f\x35\
-\x1a\x9e\x63\xc0\xdd\x23\x1b\xb9\x71\xf9\x9d\x5c\xb5\xe4\x16\x6e\
-\xbc\xfb\x0e\xee\x1c\xd9\x48\x29\x80\x71\x98\x3c\xc7\x65\xf1\xfc\
-\xf3\x01\x30\x16\x0d\xd1\x4f\x56\xca\xe4\x1f\x5b\x08\x3e\x5e\x3c\
-\xcb\xa1\x0c\xd1\x75\xc6\x10\x5d\x69\xc5\xcb\x63\x97\xf9\x3c\x1e\
-\x92\x07\x83\x09\x24\x8c\x00\x88\xb1\x20\x82\x0f\x1e\xac\x45\x05\
-\xd4\x7b\x24\x33\x60\x02\x1a\x3c\xce\x39\xf0\x01\xca\x92\x30\x31\
-\x85\x99\x6c\x30\xbf\x77\x80\x85\x43\xc3\x9c\x79\xd4\x31\x3c\xed\
-\xe8\x63\x39\xeb\xf8\xe3\xd9\x77\x70\xa8\x93\x56\xd4\xd0\x06\x3d\
-\xc4\xb9\x08\x64\x95\x22\x40\x88\x41\x85\x19\x88\x86\xbd\x10\xe5\
-\x59\xc9\x5e\x05\x90\x64\xab\xc3\x20\xc4\x5c\xb7\x86\x84\x79\x93\
-\x69\x01\x27\x15\x45\x82\x12\xbc\xa2\xce\x60\xac\xd0\x00\x56\x15\
-\x4d\x7e\x75\xcb\x8d\xfc\x72\xc9\x8d\xdc\xb8\xfc\x2e\xee\x5b\xbb\
-\x86\x26\x01\xd7\xdf\x8b\xaf\xd5\xe2\x82\x15\x41\x55\xd2\xc9\x49\
-\x7c\x4d\x05\x51\x89\xa9\x3e\x2d\x3b\x01\xf1\xea\xde\x94\xf6\x69\
-\x26\x09\x14\xa0\x84\x99\xb6\xef\x13\x26\x26\xc4\xca\xc1\xf6\x49\
-\xac\x8a\x9a\xaa\x5c\x38\x7d\x47\x34\xea\x31\x8d\x08\x42\x8f\xc6\
-\xfb\xb5\xe0\xac\x05\xef\xd1\x56\x89\x96\x25\x61\x72\x8a\x7e\x23\
-\x2c\x5e\xb0\x80\xb3\x8e\x3a\x8e\xe7\x9c\x71\x2e\x67\x1f\x71\x34\
-\xfb\x64\x31\x13\xe2\x43\x54\xc7\x36\x7d\x76\x67\xf2\x42\x34\x35\
-\x44\xa2\x12\x98\x16\xfb\xa8\x06\x6e\xc6\xd4\xee\xb5\x0a\x80\xbd\
-\x0a\x00\xd8\xb6\x19\x5c\x55\xdc\x19\x31\x68\x88\xcb\x5c\x15\x34\
-\x44\xb3\xdf\xab\x92\xe7\x16\x01\x56\x95\x9e\xa5\x0f\xde\xcf\x2f\
-\x6f\xbe\x9e\x1f\x5f\x7f\x15\x77\xaf\x5f\xcd\xa4\x05\xad\xe5\x64\
-\x7d\x7d\x20\x06\x5f\x94\x6d\xd4\x5e\xfb\x33\xc5\x74\x95\xd7\x9a\
-\xea\x83\x41\x05\x9b\x0e\xb9\x50\xbd\xbc\xa5\xa3\xdb\x65\xee\x3e\
-\xe1\xa3\x46\xc7\x31\xef\xaa\x0f\xd0\x19\x51\x77\x15\x5c\x30\x38\
-\x6f\x08\x02\xa5\x81\x60\xb4\xab\xc4\xb0\xa3\xdc\x8c\x15\xd4\x78\
-\x74\x72\x12\x26\x1a\xcc\x75\x75\x0e\x19\x1c\xe6\xf9\xe7\x5f\xc8\
-\x53\x8e\x3d\x91\xd3\x0e\x3b\x9c\x81\x74\xd9\xb2\xf0\x88\x0f\x18\
-\x6b\x11\x2b\x84\xb2\x44\x6c\x65\x85\x18\x42\x15\x98\x9d\x5e\xd6\
-\x34\x4d\xf6\x2a\x81\xbd\x0a\x00\x78\x74\x3f\x58\x24\xa0\x5e\x10\
-\x13\x11\x76\x45\x08\x11\x90\xe3\x62\xe0\x6d\xe5\xc4\x38\xbf\xb8\
-\xfe\x3a\x7e\x70\xe3\x75\x5c\x77\xd7\xed\x6c\x6c\x4c\xc2\x40\x2f\
-\xda\x5b\xa3\x94\x78\x9a\xab\x57\xb4\x0c\x38\xe3\x48\x38\xbe\xae\
-\x4f\xe8\x52\x00\x5d\x29\x2b\xa3\x31\x98\x08\x9d\x14\x99\x8a\xa2\
-\x5b\xab\xcd\xdd\x59\x33\x28\x21\xb9\x42\x15\x16\xb8\x73\xff\x32\
-\x6d\x8f\x5b\xd0\xe4\x12\x00\x2a\x61\x7a\x35\xa1\x84\xb6\xef\x6e\
-\x08\x18\x1b\x0b\x12\x42\xe9\x31\xcd\x16\x8c\x4d\xb2\x5f\xcf\x00\
-\x4f\x39\xee\x64\x9e\x75\xd6\xb9\x9c\x77\xe2\xc9\xec\x5b\xaf\xa1\
-\x80\x2f\x03\x0e\xc5\x89\x60\xdb\xd1\x40\x93\x46\x59\x30\x09\xae\
-\xbc\xf5\xb9\xdd\xab\x00\xf6\x2a\x00\x1e\x45\x01\xa4\x14\x95\x22\
-\xb4\xbc\xc7\x5b\x47\x10\x43\x03\xb8\x69\xf5\x0a\x7e\x74\xd5\xe5\
-\x5c\x79\xd3\x0d\xdc\xb9\x62\x05\x63\x99\xa3\x3e\x67\x10\x9f\x72\
-\xd5\x31\x68\x67\x63\xaa\xab\x0c\x31\x9d\xa5\x8a\x37\x7e\xda\xa9\
-\x47\x95\x35\xa8\x62\x67\xed\x5f\xc5\xac\x41\x94\xd0\xa9\xed\x17\
-\x4d\x41\xc1\xea\x1e\x77\x5e\x9e\xbb\xdb\x18\xe9\x36\x4e\xaa\x9f\
-\xab\x3b\x2b\x05\xbc\x35\x6d\x6b\xc5\xa8\x4e\x53\x10\x2a\xf1\x61\
-\x54\x70\x2a\x78\xf5\xa8\x13\xbc\x89\xa9\xd5\xdc\x18\xfc\xe4\x14\
-\x3a\x3e\x49\x0d\xc3\x51\x07\x2e\xe6\x39\x67\x9d\xcb\x33\x4e\x3f\
-\x8b\x13\x16\xec\x4b\x0d\x30\x21\x50\x03\x6c\x0a\xfa\x05\x89\x59\
-\x02\x8b\x6e\xd3\x43\xda\xab\x00\xf6\x2a\x00\x60\xdb\xfe\xbf\x78\
-\x8f\xa6\x80\x96\x18\xc7\x28\x70\xcd\xf2\x3b\xf8\xce\x15\x97\xf1\
-\x93\x9b\x6e\x60\xc5\xf8\x28\x32\xd8\x87\xd6\x6a\x04\x1c\xc1\x07\
-\x6c\x96\xe1\x1b\x2d\xac\xc9\x62\xb5\x9e\x08\x41\x3d\xb8\xe8\xef\
-\x42\x98\x11\x95\x96\x2d\x3f\xb7\x3a\x4c\x21\xfa\xb7\xd5\xaf\x54\
-\xdb\xc4\x20\x95\x7b\xa2\x62\xd9\x69\x0a\x20\xd8\x36\xee\x7f\x3a\
-\xd6\x40\xdb\xf7\x2f\x0a\x21\x06\x01\x2a\xcc\x30\x36\x74\x94\x43\
-\x20\xba\x38\xd1\x33\x32\xa0\x26\x8e\x5b\xc4\x43\x63\x4c\x34\xef\
-\xb3\xcc\x22\x06\xca\xb2\x24\x14\x25\xb5\xf1\x49\xf6\xeb\x1b\xe4\
-\x39\x67\x9f\xcb\x1f\x5d\xf4\x2c\x4e\xdd\xe7\x00\x7a\x20\xa6\x5e\
-\x25\x42\x8a\x43\x32\x4c\xf6\xba\x00\xdb\x96\x3d\x4c\x01\x54\x2c\
-\x39\xc9\x8c\xae\x5e\x9a\x59\xde\x9a\x82\xca\xa5\x89\x9b\xca\x01\
-\x5e\x4b\xd4\x68\x34\xbd\xbd\x41\x3d\xf8\x3c\x9a\xad\x9b\x81\x2b\
-\xef\xbe\x83\xaf\xfe\xec\x87\xfc\xfa\x8e\xdb\x58\xd3\x9c\x20\xf4\
-\xf4\x62\x7b\x7b\x29\x51\x54\x93\x93\x2e\x06\x8a\x12\x41\x30\x24\
-\xc0\x8c\x91\x88\xae\x33\xd2\xc9\x99\x6f\x0d\x5c\x24\x8f\xf2\x9d\
-\xb4\xf3\xb3\xcc\xf4\xf9\xbb\x63\x08\x4f\xb0\x88\x9a\x4e\x4c\xa3\
-\xfb\x7e\xb7\x38\x72\x75\x9a\xd5\x53\x85\x00\xaa\x93\xbf\x53\xc1\
-\x98\xbe\x9a\xb1\xed\xb4\x8a\x48\xf7\x95\x03\x98\xa8\x72\xf2\x52\
-\x31\xcd\x82\x30\x39\xc1\x3e\xfd\x83\x5c\x7c\xc6\x99\xbc\xf0\xa9\
-\x17\x71\xf6\x41\x87\x33\x08\x84\x32\x90\x89\x24\xfc\x05\x98\x32\
-\x81\xa4\x4c\xd4\xb0\xde\x90\xea\x23\xbb\xac\xae\x2d\x75\xf1\x96\
-\x53\xb5\x87\xe1\x90\xf7\x20\x05\xd0\xc9\xda\xfb\x94\x1b\x16\x62\
-\xb5\x5c\x15\xa7\x22\x2d\x38\x09\xb1\xb2\xad\xe5\x84\x4c\xc1\x06\
-\x4f\x49\x81\x77\x71\xe1\x38\xcd\xc9\xb2\x8c\x8d\xc0\x4f\x6f\xbf\
-\x8d\x6f\xfc\xec\x47\xfc\xfa\x8e\x5b\xd9\xe0\x0b\x64\xee\x00\x9a\
-\xb9\x18\xc1\xf7\x80\x1a\x44\x35\xfa\xb5\x7b\xe5\x09\x11\x41\xb0\
-\xc1\x11\xd4\x93\xd7\x32\x1a\x93\x63\xd0\x6a\xb2\x4f\x5f\x3f\x4f\
-\x39\xe2\x58\x5e\x7e\xd1\xb3\xb8\xf0\xc8\x63\xe8\x07\xca\x32\xa0\
-\x21\x90\x89\x89\x4a\xd9\x44\x80\x50\x30\x55\x81\xb4\x74\x8c\x93\
-\x6d\x70\x1c\xee\x55\x00\xbb\x8b\x68\xac\x4d\x53\x31\xf8\x34\x4b\
-\x6d\xa8\x68\x9b\x18\x33\x62\xdb\xad\xc4\x9c\xbb\x04\x8d\xa9\x28\
-\x17\xf0\x56\x98\x12\xf0\x64\x5c\xf7\xc0\xbd\x7c\xfe\xbb\xdf\xe1\
-\x97\xb7\xdd\xc4\x58\x51\x60\x87\xfa\x29\xea\x19\x4d\x7c\xb2\x30\
-\x22\x28\xc7\x84\xa8\x68\x82\x09\x3b\xed\x24\x7e\x32\x8a\xf1\x36\
-\xce\xa5\x51\xac\x15\x28\x5b\xb8\xb2\x24\x9f\x6c\x30\xd7\x38\x9e\
-\x76\xf2\x19\xbc\xfc\x77\x9e\xcf\x05\x8b\x0f\xc1\x7a\x68\xaa\xc7\
-\x38\x83\x55\x25\xa3\xcb\x3a\x14\xd3\x71\x57\xd8\x7a\x3c\x75\x0f\
-\xda\xef\x5b\x7e\xb7\x3d\x4a\x01\xf8\x78\xd4\xab\xdd\xb2\x26\xde\
-\xd0\x21\xb4\x08\x1a\x70\x6a\x31\x21\xa6\xf7\x54\x15\x63\x95\x82\
-\xc0\x23\xc5\x14\xef\xfb\xd6\x57\xf8\xda\x2f\x7f\xc1\x84\x73\xd8\
-\xde\x5e\xc8\x2c\x0d\x94\x32\x78\xc4\xda\xe8\x9f\x26\xa4\xa9\xad\
-\x40\x40\xb2\xa5\x09\xb9\x57\x1e\x47\x09\x12\xe7\xc2\x17\xc9\xbd\
-\x52\x6c\xf0\x58\x1f\xe8\xb1\x8e\xc9\x8d\x23\x2c\x1c\x9a\xc3\xcb\
-\x2e\xbc\x98\x97\x3e\xf5\xe9\x1c\x31\x67\x1e\x0e\x70\xbe\x8c\xa7\
-\xbe\x35\x09\xb9\x28\x1d\x87\xf1\x37\xa5\x51\xdb\x8d\x65\x0f\x53\
-\x00\x11\x32\xab\x86\x8a\x24\x0b\xd0\x94\x0a\x8a\x0a\x20\x46\xd1\
-\x0d\x94\x11\x4d\x37\x15\x02\x79\x6e\x99\x68\xb5\xe8\xb5\x19\x0f\
-\x4e\x6e\xe6\x19\x7f\xff\x5a\x56\xf7\x38\xa8\xd5\x69\x26\x1f\xd7\
-\x04\x45\xad\x8d\xc0\x9f\x34\x64\xdd\xe9\xec\x60\xd8\x6b\x01\x3c\
-\xa1\xd2\x15\x34\x50\x45\x6c\x04\x22\x09\x01\x51\x8f\x75\x8e\xb2\
-\xd9\x42\xa7\xa6\x38\x7c\x70\x1e\x7f\x7a\xf1\xef\xf2\xaa\x0b\x2f\
-\x66\x61\xe6\xf0\xa5\xe2\x6d\x0c\x54\x1a\x14\xa7\x15\xc9\xaa\xd9\
-\xe6\x47\xed\xa9\xc0\xc2\xc7\x2e\xbe\xde\x9d\x44\x64\x0b\x87\xcd\
-\x12\x30\x3e\xc4\xe0\x7b\x50\x4c\x88\x65\xa6\x85\x06\x4a\x27\xac\
-\xcf\x2d\x1f\xbe\xfa\xe7\xfc\xed\xfb\xdf\xcd\x86\xd1\x11\xf6\x1f\
-\x18\xe2\x82\xb3\xcf\xa7\xd9\x6a\xd1\x72\x2e\x05\xa4\x0c\x01\x8b\
-\xfa\x18\x5a\x16\x95\x76\xe0\x28\x48\xc5\xa2\xbb\x57\x9e\x58\xd1\
-\x58\x34\x20\x09\xf9\x57\x06\x24\xc4\xda\x84\xa0\x96\x22\x08\x9a\
-\xd7\x31\x43\x03\xdc\xdf\x1c\xe7\xdf\xbe\xf8\x69\xfe\xf4\x3f\xfe\
-\x8d\xef\xde\x7c\x0b\x4d\x27\x6d\x70\x57\xa4\x4e\x4b\x2c\xc8\x6d\
-\x06\xb6\xad\x81\xad\xf6\xcc\x39\xde\xb3\x08\x41\xba\x80\x74\xf1\
-\xc7\xd0\x2e\x15\xd5\x14\xe5\xf1\x06\x9a\x28\x59\x96\x71\xf3\xfa\
-\x75\xbc\xfb\x07\x5f\xe7\xdb\x97\xfd\x98\x23\x7b\xe6\x31\xa5\xca\
-\x3e\xc0\xf1\xfb\x1d\x0c\xc5\x65\x18\x04\x5f\xc6\xab\x89\xc6\x12\
-\xd5\xb8\x4e\x04\x15\x8d\x69\x26\xd8\xb6\xf3\xb8\x57\x1e\x5f\x11\
-\x13\x95\x7a\x4a\x23\x48\x45\x78\x22\x8e\x10\xc9\x18\x10\x15\x5c\
-\x5e\xa3\x9c\xef\xf8\xd9\xca\x7b\xb8\xe6\x23\xef\xe1\x0f\x2e\x7c\
-\x06\xaf\x7a\xce\xef\x72\xe2\xfc\x85\x04\x05\x09\x01\x35\x12\x89\
-\x51\xba\x58\x89\x82\xf7\x98\x54\x69\x59\x4d\xf1\x1e\x16\x03\xdc\
-\xb3\x2c\x00\xa5\x63\xfa\x0b\x15\x52\x55\xc0\x38\xbc\x31\x4c\x19\
-\x08\xce\xb1\xc9\x18\x3e\xfa\xd3\x9f\xf0\xf2\x37\xff\x0b\xdf\xbe\
-\xfa\x72\xec\x01\xfb\xb1\x21\x83\x07\xc6\x36\x03\xf0\x8c\x13\x4f\
-\xe6\xd0\xa1\x79\xe8\xd4\x14\x99\x2a\x2e\x04\xac\x86\x2e\x58\x69\
-\x07\x98\xb3\x47\xad\x86\xdd\x4c\x8c\xce\x78\x24\x57\xcf\x06\x70\
-\xe9\x11\x51\x48\x86\x60\x2c\x7e\xa0\x9f\xcd\x73\xfb\xf8\xd4\x95\
-\x3f\xe7\x65\xff\xe7\xed\x7c\xec\xaa\x5f\x31\x29\x80\x35\xf8\x10\
-\x28\x54\xf1\x09\x77\x11\x34\xb4\x37\x7f\xb7\xec\x69\x7a\x7e\x8f\
-\x53\x00\x95\x27\x17\x4f\x7e\x43\x50\x65\xbc\xd9\x64\xd2\x40\xd3\
-\x39\x7e\xb9\xe2\x3e\xde\xf0\x81\xf7\xf2\xd6\xff\xfa\x2c\x6b\x2c\
-\x64\x73\xe6\x83\x77\x6c\x18\x1b\xe3\xca\x3b\x6e\xa3\x04\x8e\xda\
-\x6f\x3f\xce\x3e\xfa\x18\xc2\xf8\x38\xd6\x44\xb8\xab\x4a\x20\x98\
-\x58\x79\xe7\xcd\xb4\xd4\xfc\x9e\xb7\x2a\x76\x03\x99\x16\x7f\x49\
-\x6e\x58\xf4\xd0\x94\x90\x60\x86\x4a\xc0\x64\x8e\x42\x05\x83\x43\
-\x0b\xc1\x9b\x9c\x30\x34\xc0\xf2\x72\x8a\xbf\xff\xf4\x47\x78\xed\
-\xc7\xde\xcf\x6d\x6b\xd7\xa2\xd6\x10\xc4\x50\x8a\xe0\x93\x1b\xa0\
-\x5b\x99\xd8\x3d\x4d\xdf\xef\x51\x2e\xc0\xd6\x26\xc7\xab\x92\xf7\
-\xd4\x58\xa3\x9e\xcf\xfe\xe0\x12\xfe\xeb\xa7\xdf\xe7\xfe\xf1\x31\
-\xec\x82\x61\x10\x8b\x9f\xf4\x64\xb9\x01\x57\xe7\xf6\x87\xee\xa5\
-\x48\x83\x72\xe1\x69\xa7\xf3\x8d\x1b\xaf\xa0\x50\x9f\x90\x6a\xc9\
-\x41\xec\x86\xe0\x76\xd5\xb3\xec\xcd\x00\x3c\x71\x32\x13\x46\x1c\
-\xa6\x13\x01\xd0\x01\x4c\x75\x7e\xef\xc5\x60\x44\xf0\x85\x62\xb2\
-\xc8\x83\x98\xcf\x9d\xcb\xb7\x6e\xbc\x8a\xeb\xee\xbb\x8b\x7f\x7c\
-\xf1\x4b\xf9\xe3\x73\x2e\xc4\x61\x28\x82\xc7\xca\x96\xa7\xe3\x9e\
-\x38\xc5\xbb\xbc\x05\xb0\xc5\x01\x9b\xe0\xa4\x6d\x44\xdd\xcc\xf7\
-\xa5\xdf\x07\x02\x0d\x14\x9f\x39\xae\x5f\xf5\x08\x7f\xf7\xb1\x0f\
-\xf1\xae\xaf\x7f\x89\x95\x45\x81\x99\x33\x44\x91\x09\x25\x9e\x7a\
-\x56\xc3\xb4\xc0\xb8\x9c\x5b\x1f\xba\x9f\xfb\xa7\x26\x30\xc0\x79\
-\x47\x1f\xcb\x41\xf3\x16\xe0\x35\x44\x3f\x52\x4d\x2a\xdd\x8d\x76\
-\x86\xb4\x4d\xcf\xbd\xc7\xff\x13\x2e\xed\xba\x08\x3a\x71\x98\xf6\
-\xef\x12\x54\x5a\x62\x94\x3f\x84\x32\x16\x72\x85\x12\xef\x52\xc9\
-\x70\xab\xc4\xaa\xa5\x54\xc1\xcd\x9b\xc7\xfd\xbe\xc1\xdf\x7c\xf6\
-\x23\xbc\xee\x13\xef\x63\xe9\xe6\x0d\xe4\xc6\x12\x5a\xbe\xed\x4f\
-\x86\x54\xbe\x15\xb3\x0c\x30\x9d\x29\x62\xf7\x96\xdd\x40\x01\x44\
-\xca\xad\x69\x38\x3b\x4d\xf0\x3e\xd1\xce\x54\x28\x14\x1a\xf7\xa8\
-\x2f\x4b\x0a\x81\x49\x63\xf8\xd2\xf5\x57\xf2\x67\x1f\x78\x2f\xdf\
-\xbc\xe9\x3a\xc2\x81\xfb\x13\x7a\xfb\x93\xa2\x28\x50\x1b\x68\x85\
-\x26\xc1\x28\x21\x77\xac\x9c\x9c\xe0\xbe\xd5\xab\x30\xc0\xe1\xbd\
-\x43\x5c\x74\xf4\xf1\x30\xde\xa0\x47\xea\xd8\x49\x4f\x4d\x72\x44\
-\x32\x40\x30\x01\x32\x9f\xd2\x8b\x66\x2f\x0a\xf0\x89\x14\x25\xa6\
-\x5d\xa7\x6d\xfe\x0a\xca\x17\xaa\x7a\x82\x0a\xa6\x2c\x09\x42\x0c\
-\x41\x0b\x82\xf1\x04\x07\x85\x55\x0a\x23\x34\x03\xd8\xac\x97\xd6\
-\x82\x05\x7c\xf1\x8e\x9b\xf8\xa3\x77\xff\x1b\x3f\xbe\x7d\x29\xf5\
-\x7a\x8e\x68\x84\x71\x97\x28\xa5\x86\xe8\x16\x84\xf4\xaf\x06\x42\
-\x2c\x3a\xde\xad\xd5\xc1\x2e\xaf\x00\x60\x86\xbf\x8d\xa2\x06\x82\
-\x08\x2d\x88\x58\x7c\x1f\x30\x65\x3c\x8d\x7d\xf0\x68\x96\xb1\xbe\
-\x2c\x79\xc7\x7f\x7f\x8a\x37\x7f\xf4\x43\x3c\x3c\x3a\x42\xb6\x60\
-\x3e\x65\xb3\x49\x51\x36\xd1\xae\x90\xae\x26\xbf\x51\x9c\x65\xf3\
-\xd8\x18\x77\x3d\xf0\x00\x10\x11\x84\x4f\x3f\xe3\x6c\xea\xae\x86\
-\x16\x05\xa6\x27\xa7\x45\x40\xbd\x8f\xa9\x40\x3a\x58\xf6\xbd\xf2\
-\xc4\xcb\x6f\xb3\xd9\x66\xf2\x3c\x06\x55\x6c\x21\xd4\x6b\x43\x3c\
-\x30\xb2\x89\x57\x7f\xe0\xdd\xbc\xed\xbb\xdf\x64\xb5\x0b\x78\x6b\
-\x62\xf1\x52\x2b\x60\x34\x76\x66\x12\x8d\x91\x26\xd1\xe9\xad\xd1\
-\x76\xc7\xa5\xb0\x5b\x28\x00\xa0\x8d\xbe\x43\x23\xab\x4c\x01\x78\
-\xa2\x16\xae\xcc\x32\x2d\x3d\xd6\x59\x1e\xd8\xb0\x96\xd7\xbf\xfb\
-\x2d\x7c\xf2\x47\xdf\xa3\x39\x67\x88\xb2\xb7\x97\xb2\x54\xc8\x0c\
-\xd4\x12\x02\x4c\x3b\xac\x31\xa5\x80\x1a\x83\x1a\xc3\xed\xf7\xde\
-\x43\x8b\xd8\x90\xe3\xb4\x43\x8e\xe6\xb8\x85\xfb\xa1\xad\x06\xc1\
-\x86\x78\xd2\x4b\xc7\x07\xad\xea\xf4\x77\x4b\xd5\xbf\x57\x3a\x22\
-\x60\x8a\x80\x69\x40\x36\x38\xc4\xba\x7e\xc7\xbf\xff\xf0\xeb\xfc\
-\xd9\x47\xde\xc3\x9d\x63\xa3\x04\x1b\x0b\xae\x34\x90\x88\xd8\xb6\
-\x52\x0a\xdd\x75\xb9\xdd\xc9\x1a\xd8\xf5\x15\x80\x4e\x6f\x7b\xad\
-\x22\x18\xc0\x51\x61\xba\x85\x42\xc0\x3b\xc1\xb8\xc8\xad\xbf\x72\
-\xed\x3a\x6e\x7d\xe8\x01\xec\xa2\x05\x8c\x18\xa1\x69\xb3\xa8\x40\
-\x8a\x02\x0d\x25\x22\xda\xf6\xdd\x83\x90\x90\x83\x8a\xad\xe5\x2c\
-\xbb\xff\x3e\xd6\x37\x1a\x58\xeb\x38\xb0\x56\xe7\x39\x27\x9e\x8a\
-\x9f\x18\x27\xc2\xc5\x3c\x62\xa2\xef\x5f\x45\x9d\x55\x76\x4f\xcd\
-\xbf\x57\xba\x44\x41\xc4\x11\xb0\x4c\x36\x0b\x42\x2d\x27\xcc\x1d\
-\xe4\x47\x77\x2d\xe1\x7f\xbd\xe7\x2d\xfc\xf8\xde\x3b\xa1\xe6\xd0\
-\x8a\x9d\x5c\xb6\x9d\x03\xde\x5d\x36\x7e\x25\xbb\xbc\x02\xa8\xf2\
-\xf9\x22\x50\x26\x9f\xcb\x78\xc5\x16\xe0\x4a\x83\x94\xd0\x34\x86\
-\x87\x7d\x83\xfb\xd7\xae\xa4\x0c\xca\x51\x47\x1d\xcd\x91\x47\x1f\
-\xcb\xc4\x54\x13\x53\xeb\x21\x04\xc5\x18\x87\x88\x6d\x07\x10\xab\
-\x20\x5e\xb7\xfa\x16\x67\x59\xb1\x71\x2d\xf7\xae\x5f\x0b\x40\x06\
-\xbc\xe8\xfc\x0b\x58\xd4\xdf\x4f\xe9\x5b\x54\x75\xc4\x15\xf0\x44\
-\x25\x72\xd5\xee\x24\x4a\xbe\xbd\xb2\x03\xa5\x74\x42\x33\xb7\x28\
-\x06\x13\x32\x24\x58\xec\xc0\x00\xb7\x8e\xac\xe1\xb5\x1f\xfb\x3f\
-\x7c\xe2\xca\x5f\x30\x61\x85\x60\x85\x42\x95\xd0\xe6\x3e\x64\xda\
-\x91\xbf\xbb\x1d\x06\xbb\xbe\x02\x10\x01\xaf\x94\xde\xa7\x42\x1e\
-\x62\xa0\xa7\x14\xb4\x15\x10\x67\x18\x03\xfe\xe6\x23\xef\xe5\x9b\
-\xbf\xfc\x19\xce\x08\x83\xc6\x72\xce\x89\xa7\x81\x0f\x09\xdd\x05\
-\x94\x1e\xbc\x62\xba\xb4\x77\xa7\x01\x6e\xb4\xe5\x8d\x75\x8c\xb4\
-\x1a\x5c\x79\xdb\xcd\x31\xf0\x58\x78\x8e\x5d\xb8\x90\x0b\x4f\x3e\
-\x19\xbf\x69\x94\xcc\x65\x48\x48\x05\x24\x89\xd8\xb3\xdd\x19\x73\
-\xaf\xec\xb6\xa2\x1a\xb1\x03\xea\x40\x8c\xc1\xb5\xc0\x16\x86\x56\
-\x2b\x60\x86\x86\x58\x49\x8b\x37\x7d\xfa\x23\xbc\xf5\xcb\x9f\x63\
-\x23\x50\x08\x34\xcb\x18\x1c\x6c\x16\xe5\xf4\x8e\xcb\xec\x5e\x4a\
-\x60\x97\x57\x00\x40\xa2\x76\x8f\x9b\xce\x7b\x8f\x4a\xac\xf6\x93\
-\x9a\xe5\xc1\xf1\x09\x5e\xf7\xc1\xff\xe0\x7b\x37\x5e\xc7\x8d\x0f\
-\x3f\xc8\x88\x86\x98\xc7\x3f\xe9\x34\x16\xf4\x0e\xa0\x8d\x06\x8e\
-\x58\xb5\x27\x55\xf6\x50\xe8\x70\xeb\x41\x3c\xd5\xc5\x22\xc6\xd0\
-\x70\x70\xdd\x7d\x77\x32\x46\xf4\xf9\x6a\xc0\xef\x3f\xed\x62\x86\
-\x25\x43\xa6\x5a\x98\xc4\x74\xdb\xcd\xcb\xb1\xd7\x00\xd8\x03\x44\
-\x15\x82\x8f\x94\xec\x09\xee\x6d\x4d\x46\x98\x2a\xb0\xae\x4e\x98\
-\x3b\xc4\xc7\x7f\x76\x09\xff\xf0\xff\x3e\xcc\x58\x59\x12\x8c\xd0\
-\x0a\x9a\x20\xc4\x5b\xa3\x1d\xda\x3d\x32\x43\xbb\xbc\x02\x88\x3d\
-\xef\x3d\x42\xc0\xa9\x62\x33\x47\x03\x4f\xe8\x31\xdc\xb0\x71\x1d\
-\x7f\xf6\xde\x77\xf2\xf3\xa5\x4b\xa8\x2f\xdc\x87\x5b\x56\x3d\xcc\
-\x9a\x89\x71\x7c\x09\x27\x2c\xd8\x87\x33\x0f\x39\x1c\x37\x35\x49\
-\x26\xf1\xef\x35\xd1\x7c\x57\x04\x9b\xd3\x3e\xa7\x8c\x4c\x3e\xd4\
-\x73\x6e\x79\x70\x39\xf7\xaf\x5f\x8d\xe4\x96\x66\xd9\xe2\xcc\x23\
-\x8e\xe1\xa2\x63\x4f\xc6\x8c\x8c\x93\x61\xf0\x92\x4a\x88\x55\x13\
-\x19\xc8\x5e\x15\xb0\xbb\x8b\xa8\x47\x42\x09\x12\xf0\x46\x09\x06\
-\x8c\x1a\x32\x53\x43\x1b\x01\x71\x39\x66\xc1\x3c\xbe\xf1\xab\x4b\
-\x79\xd3\x7f\xfc\x1b\x53\x1a\xc8\xac\xc1\x4b\x0c\x1e\x03\xd3\x99\
-\x9b\x76\xf6\x17\x9a\xa5\xec\xb2\x0a\x20\xe6\x5a\x53\x7f\x3b\x1b\
-\xa9\xb4\xc4\x07\x5a\x93\x0d\x8c\x73\x7c\xff\xde\x3b\xf9\xa3\xf7\
-\xbe\x95\x5f\xae\xba\x17\x99\x3f\x9f\xa0\x39\x2b\x27\xc6\xb9\x72\
-\xd9\x52\xea\x0e\xe6\x00\xcf\x3e\xe3\x6c\xb2\xb2\x81\xa5\x40\xa5\
-\x44\x0d\xb1\xba\xcf\xce\x88\xdc\xa9\x60\x35\xe2\x7b\x83\x73\xac\
-\x19\x1b\xe1\xc6\xbb\x97\x61\x05\x4a\x2d\x58\x80\xe1\xa5\x4f\x7f\
-\x0e\x43\x92\x47\xfe\x80\x94\x83\x16\xdd\xbd\xcc\xbd\xbd\xb2\x6d\
-\x31\xaa\x18\x0d\x18\x8d\x7c\xc2\xd1\xdd\x54\x7c\xe1\xb1\x2e\xa7\
-\x0c\x50\xaa\x62\xfa\x7a\x38\xe4\xc8\x23\x29\x34\xf0\xc8\xc6\x0d\
-\xd4\x8d\x50\x14\x65\xe7\x42\xd3\xf8\xcd\x76\x7d\xd9\xa9\x0a\xe0\
-\xd1\xd2\x25\x55\x49\xa6\x12\xfb\xd9\x5b\x63\x29\x83\x92\xf7\xf6\
-\xf0\xdd\x3b\x6f\xe5\x2f\x3f\xf4\x6e\xee\x69\x6e\xc6\x2e\x1c\x66\
-\xa2\x55\x20\x58\xa6\x5a\x2d\x96\x3e\x70\x1f\x00\x21\xc0\x05\xc7\
-\x9c\xc0\x61\xfb\xec\x4b\xb3\xd1\xe8\xa4\x12\x8c\x24\x1e\x3d\xe9\
-\xdc\x44\x2a\x08\x6d\x95\x25\x2e\xcf\x68\x85\xc0\x2f\xae\xbf\x96\
-\x11\x62\xff\xbb\x22\x94\x5c\x74\xfc\xc9\x3c\xe7\xec\xf3\x29\x46\
-\x37\xe3\x8c\x49\x64\x98\x55\x79\x90\xe9\x4c\x79\x57\x50\xd1\x68\
-\x6c\xee\xd3\x89\x35\xec\xcc\xd1\xde\x4d\x24\x8d\x91\x0d\x90\x79\
-\xba\x28\xbd\xb5\xdd\x07\x70\xc7\x38\x5d\xd3\xe1\x3b\x8a\xc7\x9a\
-\x88\xf9\xb3\x89\xff\x01\x55\x5c\x96\xa1\x48\xa4\x96\x1b\x6b\xf0\
-\x7b\x4f\xb9\x98\xd7\xbd\xf4\x15\xfc\xf4\xda\xab\xf9\xb3\x7f\xfe\
-\x47\xae\xb9\x77\x39\xb5\xdc\x51\x84\xd0\xb9\x6c\xb7\x6f\xa8\x8f\
-\x7d\x07\x3b\x53\x76\x9a\x02\x08\xc4\xce\xb8\x45\x0a\xec\x55\xe0\
-\x3e\x5f\x06\xbc\x0f\x31\xd8\x97\x02\x80\xae\x10\x5a\x65\xa0\x99\
-\x67\x7c\xf1\xce\x25\xfc\xe5\xc7\x3e\xc2\xea\x00\xa6\x3e\x48\xd9\
-\x08\x18\x0d\x04\x69\xc1\x60\x3f\x57\x2e\x5d\xc2\xaa\xa9\x29\x9a\
-\xa6\xe4\x98\xa1\x61\x9e\x7b\xe6\xf9\x94\xcd\x26\x56\x1c\xb6\x0c\
-\x88\x2f\x92\x7b\xe6\x08\x18\x0c\x01\xd1\x80\xb7\x81\xe0\x14\x82\
-\xa1\x96\x0f\xf0\xeb\x7b\x96\x73\xc3\xda\x55\xd4\x4c\x1d\xe7\x3d\
-\x43\xc0\x3f\xbc\xec\xe5\x9c\x38\x7f\x21\x66\x74\x33\x3d\xb9\x8d\
-\x2d\xb1\x24\x03\xb5\x6d\x6a\xb0\xce\xae\x0f\xd8\x10\xa8\xf9\x80\
-\x55\xad\x1a\x07\xee\xc2\x36\xd7\x2e\x20\x06\xc8\x02\xd8\x40\xad\
-\x84\x81\xa6\x21\x2f\x4d\x64\x54\x76\x16\xa3\x11\xa0\x95\x18\x3c\
-\x66\x25\xd2\xe6\x8a\x4c\x8f\xaa\x97\x81\xf8\x69\x0f\x11\x20\xf8\
-\xd8\x60\xc8\x17\x38\x85\x4c\x1c\x01\x41\xc4\x53\xac\xdf\xc8\x2b\
-\xce\x38\x9f\xf7\xbc\xe2\x4f\x59\xd6\x6a\xf0\xe1\x1f\x7e\x8f\x1b\
-\x26\x47\xf8\x8b\x8f\xfc\x27\x97\xdc\xbd\x0c\x6f\x0c\x65\xab\x04\
-\x85\xd2\x17\xb4\x42\xd1\xa1\xa9\x9c\x89\x3c\xea\xd2\x0f\x55\xbb\
-\xf3\x9d\x39\xe4\x3b\x55\xe2\xc1\xac\x1d\x60\x8d\x01\x2f\x82\x58\
-\x43\x28\x4a\x8c\x08\x2d\x2b\x68\xe6\xf8\xe6\xad\x37\xf0\x96\x8f\
-\x7e\x88\x8d\x45\x0b\xe9\xed\x25\xf8\x58\xab\x1f\x8c\x44\xcc\x7e\
-\x56\xe7\xce\x95\x2b\xb9\x79\xc5\xfd\x64\x38\x0a\xe0\x15\xcf\xfa\
-\x1d\x8e\x5b\xb8\x3f\x7e\x72\x92\xdc\xba\x94\xba\x93\x36\xbe\xc0\
-\x86\x74\x7e\xab\x47\x5c\xdc\xd4\xb6\xa7\xce\xda\xe6\x04\xdf\xfe\
-\xf9\x4f\x11\x84\x96\x08\x45\x08\x1c\xd9\x3f\xc8\x3b\x5f\xfd\x3a\
-\x0e\xb4\x39\x53\x1b\xd6\x51\xab\x5b\x0c\x01\x9b\x3a\x05\xb5\x8d\
-\x89\x20\x88\xc6\xc6\x96\xde\x48\x6a\x2f\x06\x6d\x9e\xb2\xbd\xb2\
-\x75\x51\xaa\x92\x3e\x4a\x03\x0d\xa7\xb1\xf1\x69\xe9\x31\xc6\xe1\
-\x14\x92\x2d\x3e\xeb\x4b\x9a\x10\x9b\xb5\x76\xb5\x17\x4d\xbf\x89\
-\xc4\x2e\x36\x08\x2e\x01\x3a\x4a\x97\x83\x0a\x22\x96\x60\x95\x60\
-\x5b\x04\x3f\x89\xd9\x34\xc2\x9f\x5c\xfc\x6c\xde\xf5\xea\xd7\x60\
-\x81\x77\x7f\xea\x13\xdc\xb5\x6e\x0d\xd9\x7e\x0b\x59\x3e\x39\xc2\
-\xdf\x7f\xf8\xff\xf0\x93\xbb\x97\xa1\x35\x47\x2b\x78\xac\xb1\xb1\
-\xa9\x4b\xa5\xf8\x13\x60\xcc\x33\xbd\x8d\x83\xcc\xb8\xa3\x9d\x21\
-\xf6\x6d\x6f\x7b\xdb\xdb\x76\xd6\x87\xc7\x0d\x28\x6d\xd2\xce\x20\
-\x50\x98\x88\xf0\xb3\x22\x38\x84\xa2\x2c\x69\xe5\x19\xff\x7d\xe3\
-\x35\xbc\xe3\xe3\x1f\x61\x54\x20\xf4\xf5\x50\x76\xd9\xd9\x15\x0c\
-\x3c\x97\x1a\x93\x8d\x49\x7a\x9d\xe1\xf7\x4e\x3a\x8d\xcd\x65\x93\
-\x85\x79\x2f\x03\x7d\x83\xfc\xec\xea\x2b\xd1\xde\x1a\x41\x4c\x6c\
-\x19\xa5\x29\x33\x90\xee\x25\x18\xc1\x08\x04\x5f\x12\xac\xc1\x66\
-\x19\x6b\xee\xbb\x9f\xa7\x9e\x74\x0a\xc3\x73\x86\x51\x0d\x48\x11\
-\x38\x62\xe1\x42\x4e\x3d\xf1\x24\x96\x3d\xb0\x9c\x07\x57\x3e\x4c\
-\x6e\x1d\x99\x31\x14\x26\x31\xcb\x05\xc1\xa6\xeb\x47\x85\x56\x75\
-\xfa\x01\xe3\xd3\x17\xdd\xeb\x0a\x6c\x53\x24\x98\xd8\x5d\xd9\x40\
-\x2b\x83\xe0\x94\x4c\x1c\x76\x74\x02\xd3\x68\xe2\x04\xb0\x36\x2a\
-\xd5\x59\x8e\xa3\x76\x31\x45\x89\x46\x08\xaf\x51\xc1\x06\x83\x4d\
-\x3f\x07\x71\xb1\xb7\x83\x82\xd4\x2d\x21\x83\x72\x62\x33\xf3\x0b\
-\x78\xd3\xef\xff\x11\x7f\xfb\xc2\x97\xd2\x0a\x05\xef\xf8\xdc\x27\
-\xb8\xe4\x86\xeb\xd1\xfe\x3a\xe3\x94\xd8\x81\x3e\x46\x9b\x93\x5c\
-\x71\xfd\x35\x1c\x76\xc4\xd1\x1c\xb1\x60\x21\xbe\x15\xc8\x4d\x86\
-\x56\xdc\xb1\xd0\x61\x1d\x62\x3a\xdb\xf0\x93\x56\x01\xb4\x3b\xc9\
-\x74\x43\x2a\xd3\x0b\x21\xc4\x9d\x59\xb4\x1a\xe4\xf5\x1e\x3e\x75\
-\xc3\xd5\xbc\xe3\xd3\x9f\x60\xd4\x08\x65\x5f\x2f\x85\x35\xed\xf7\
-\xc4\x0d\x95\x1c\xed\x42\x20\x77\x6c\x5c\xbf\x8a\xa7\x9e\x7c\x1a\
-\xfb\x0f\xcc\xc5\x84\xc0\x51\x07\x2e\xe6\xbe\x87\x1f\xe1\xa6\x07\
-\x96\x93\xd7\x7b\xf0\x85\x47\xac\x74\xbb\xeb\x31\x35\x18\x4a\x24\
-\xcb\x22\xde\x3b\x73\x6c\x1e\x19\x65\x72\xd3\x08\xcf\x38\xeb\x5c\
-\x9c\x42\x2d\x00\xcd\x82\xc5\xf3\xe7\x73\xee\xd9\xe7\x22\xc0\x03\
-\xcb\x97\x33\x35\x35\x85\xf6\xd4\x62\x1f\xbc\x44\x17\x56\xd5\xa5\
-\x54\x36\x96\x0b\x90\xa9\x12\x44\xf6\xd6\x0f\x3c\x8a\x18\x35\xd4\
-\x52\x1f\x41\xcd\x02\xe2\x80\x8d\xe3\x5c\x74\xf8\x09\xfc\xfe\x73\
-\x9e\xc7\x92\xbb\x97\x31\xa9\x25\xc6\xb9\xd9\x19\x53\x16\x52\x1b\
-\x65\x8c\x12\xfb\x14\x56\x4a\x1a\x21\x24\x2b\xcd\x60\x11\xaf\xd8\
-\xbe\x1a\x65\x6b\x0c\xdd\x3c\xc2\xd9\xfb\x1e\xc2\xfb\xff\xf7\xeb\
-\x78\xf9\x59\xe7\x53\x02\xef\xf9\xfa\x67\xf9\xfc\xaf\x7e\x4c\x18\
-\x18\xa4\x69\x2d\xea\x0c\x45\x28\xa0\xa7\xce\x48\x63\x8a\x2b\xae\
-\xbd\x9a\x23\x8f\x38\x9a\xa3\x16\x2e\xa4\x6c\x95\x18\x2b\xa9\xb3\
-\x54\x14\xe9\xfa\x69\x8b\xf5\xbf\x93\xd6\xc4\x4e\xb5\x00\x2a\x51\
-\x13\x37\xbf\x84\x10\x51\x7e\x08\x93\x1a\x90\xbc\x87\xff\xb9\xed\
-\x7a\xde\xf4\x99\x4f\x31\x6a\x0d\x65\x3d\xa7\x30\xd2\x6e\x96\x1b\
-\x31\xf9\xda\xee\x4f\x67\x71\x38\xeb\xd8\x30\xba\x0e\x6b\xe1\x77\
-\x8e\x3b\x15\xe7\x3d\x75\x63\x38\xe4\xe0\x43\xf9\xd1\x8d\xd7\x32\
-\x3e\xd5\x8c\x9b\xbc\xc2\xf1\xa7\x7f\xad\x35\x29\x07\x1c\x2b\x85\
-\x34\x78\xb2\xbe\x1e\xee\x79\xf0\x01\xf6\x5b\xb4\x1f\xe7\x1c\xb8\
-\x18\x5f\x14\x38\x27\x04\xdf\x62\x41\xde\xcb\x53\x8f\x39\x91\x23\
-\x8f\x3a\x92\x3b\xef\x5f\xce\xea\x8d\x1b\xa9\xe5\x39\x41\x03\xa5\
-\x85\x60\x0c\x9d\x4e\xbe\xb4\x83\x57\xc1\xec\x55\x00\xdb\x16\x41\
-\xb1\x64\x3e\x82\x36\x42\x0e\x3a\x39\xc9\x21\x6e\x90\x8f\xfc\xd3\
-\xff\xc7\xdc\xfe\x7e\xbe\x79\xf9\x2f\x28\xeb\x2e\x75\x0a\x9e\xc5\
-\x40\x1a\x62\xd6\x07\x8b\x04\xc1\x75\x21\x40\x83\xa4\x3a\x10\x67\
-\x70\x02\xbd\xde\x33\xb5\x79\x23\xf3\xb3\x9c\xd7\x3e\xe3\x79\xfc\
-\xe7\x9f\xbc\x8e\xd3\x17\xed\xc7\xca\x56\x93\x7f\xfb\xda\xe7\xf9\
-\xcc\xcf\x7e\x88\xce\x9d\x4b\xc3\x65\x11\x0c\x16\x14\xb1\x19\xc1\
-\x7b\x6c\x2d\x67\xb2\xd9\xe4\x9a\x6b\xa2\x12\x38\x7c\xd1\x42\x42\
-\x08\x38\x31\x91\xb4\x18\x10\x7c\xda\xfa\x71\xe7\x4b\xb7\x2f\xf0\
-\x64\x55\x00\xa5\x89\xed\xb3\x84\x14\x8f\x49\xb1\x13\xcd\x33\xbe\
-\x7f\xcf\xad\xfc\xc3\xc7\xdf\xcf\x5a\x85\xd0\x93\xcc\x7e\x89\xa4\
-\x9e\x46\xc1\x69\x85\xe9\x97\x04\xee\xb1\xb1\x63\x6c\x4f\xc6\x03\
-\x2b\x1e\xe4\xe9\x27\x9c\xc6\xfe\x43\x73\x29\x9b\x25\x0b\x87\x06\
-\x30\xfd\x83\x5c\x76\xcd\xd5\xb8\xfe\x1e\x0a\xf1\xd1\xe2\xb0\xc9\
-\xff\x27\xfa\xed\x26\x10\x9b\x7d\x60\xe2\x69\x5d\xcf\xb8\xe1\xba\
-\xeb\x39\xf0\x80\xc5\x1c\x73\xc0\x81\x94\xa1\x88\x8d\x28\x83\xa2\
-\xa5\x72\xe8\xc2\x45\x9c\x7b\xce\x39\x3c\xb0\xe2\x61\xee\x7f\xe0\
-\x01\xb2\xbe\x1e\x0a\x09\x9d\x53\x27\x71\xd6\x05\x01\x6f\x42\x8a\
-\x41\xec\x95\xad\x8b\x24\x9e\x3f\x8f\x98\x80\x2d\x4b\xe6\x4c\x79\
-\x3e\xf8\x9a\xbf\xe1\xcc\x03\x0f\xe4\x2d\xff\xef\x53\x2c\x59\xf3\
-\x10\xa6\xaf\x37\x72\xfe\xcd\xe6\x8a\x62\x53\x63\xa2\x68\x25\x7a\
-\x09\x78\x0b\x5e\x3d\x58\xa1\x96\x3b\x42\x51\x50\x8e\x8d\x32\x27\
-\xb4\x78\xc9\x19\xe7\xf2\xfe\x57\xbe\x96\xff\x75\xc6\xf9\xcc\xb5\
-\x8e\x5b\x36\x8f\xf0\x86\x4f\xff\x5f\xbe\x76\xc3\xd5\xb8\x81\x61\
-\x3c\x39\xc1\x4a\x8a\x27\x1a\x4c\x09\xa4\xb5\x62\x33\xc7\x54\xa3\
-\xc9\xf5\x4b\x96\x70\xf8\x91\xc7\x70\xe8\xf0\xbc\xa8\x24\x90\x48\
-\x40\xea\x7d\x6c\x7c\x4a\xe4\xaa\x96\x8a\x92\x7c\x27\x1e\x08\x3b\
-\x57\x01\xa4\xe6\x3a\x1e\xb0\x12\x83\x32\x21\x6d\xe0\xcb\xee\xbb\
-\x9b\x3f\xff\xe0\xbb\x58\x93\x19\xa4\xd6\x17\x29\xff\xab\x0e\x5c\
-\xd5\xe6\xef\xea\x48\x17\x4b\xbf\xe3\x1b\xd4\x08\xe3\xe3\x63\xc8\
-\x64\x93\xe7\x9d\x7a\x06\xa5\xf7\x4c\x59\xc3\xf1\x8b\x0f\xe2\xbe\
-\x55\x2b\xb9\xf9\x9e\xbb\xa8\xf7\x0f\x50\x7a\x8f\x7a\x8f\xc9\xb3\
-\x58\x2f\x10\xa4\xdd\x29\x06\x12\x11\x44\x66\x69\xf8\x82\x2b\xaf\
-\xbf\x96\xc5\x8b\x0f\xe6\xf8\x7d\x0f\x04\x52\xbb\x70\x6b\x30\x41\
-\x99\x9f\xd7\x39\xe7\xcc\xb3\x59\xba\xec\x0e\x1e\x58\xfb\x08\xa6\
-\xa7\x46\x40\x91\x64\x6e\x82\x10\x2c\x29\x84\xbd\xf7\xf8\xdf\x96\
-\x88\x82\x04\x8f\x3a\x70\x46\xc9\xd7\x8f\xf2\xef\x2f\x7b\x15\x7f\
-\x72\xce\x79\x7c\x7f\xd9\xed\x7c\xe4\xd2\xef\xd0\xec\xc9\x31\x92\
-\x6d\x01\xbf\xdd\x96\x64\xad\x80\xf3\xd1\xb6\x08\x56\x21\x17\x54\
-\x02\xc6\x19\xb2\x10\x68\xad\xdb\xc4\x1c\x2f\x3c\xfd\x84\xe3\xf9\
-\xe7\x3f\xfe\x5f\xbc\xe1\xe2\x17\x70\xd8\xc0\x10\x16\xf8\xc1\xbd\
-\x77\xf2\xda\x4f\xfe\x27\xd7\xae\x5a\x01\xb5\x1e\xc4\xf4\xc6\xd6\
-\xf0\x46\x91\x20\xe4\x21\x26\x2d\x44\x25\x22\x02\x09\x64\xf5\x1a\
-\x6b\x46\x36\x71\xeb\x5d\x77\x70\xfa\xd1\xc7\xb3\xcf\xd0\x10\xa1\
-\x54\xac\xb1\x29\xd6\xa5\x6d\x32\xa9\x48\x40\xba\x73\xd7\xc3\x4e\
-\x55\x00\xed\x29\x0c\x1e\x0d\x21\x9e\xb8\x35\xc7\xe5\xf7\x2e\xe7\
-\xf5\x1f\x78\x37\x8f\x48\x20\xf4\xf4\xa0\xb1\xdd\x6e\xbb\xc5\x8f\
-\x68\x68\x9f\xfc\x55\x73\x49\x44\xb0\x84\x18\xac\xb3\x0e\x9b\xd5\
-\x78\xf0\x91\x15\x9c\x72\xd8\x51\x1c\xb2\x68\x11\x13\xbe\xc5\x90\
-\x71\x1c\x77\xe2\x09\x5c\x79\xf3\x8d\x6c\xde\x3c\x4e\x9e\x65\x94\
-\xd6\x80\x2f\xe3\xc9\xa3\x92\x4c\xb5\xd8\x99\x37\xa6\x74\x15\xcd\
-\x33\x9a\xea\xb9\xfc\xca\xab\x19\x1a\x9a\xc7\x91\x87\x1c\x4c\xcb\
-\xc6\xc2\x50\xe7\x03\xb6\xf0\x0c\x66\x19\x27\x9c\x70\x3c\x57\x5c\
-\x7b\x15\x63\x53\x53\x88\xcd\x92\xbe\x8a\x9d\x67\xb4\xbb\xa4\x71\
-\xaf\x6c\x55\x2c\x50\x8b\x4d\x18\x08\x23\x23\xbc\xe6\xa2\xe7\xf1\
-\x4f\x2f\x78\x09\x93\xc0\xdb\xbf\xf6\x39\x6e\x5d\xbb\x02\x33\x30\
-\x07\x26\x4a\xc4\xca\x63\xc6\x00\x04\xc8\x4a\xa5\x6e\x2c\xa5\x06\
-\x8c\x85\xcc\x19\x42\x59\x12\x46\x36\x33\xa7\x54\x9e\x73\xc2\xa9\
-\xfc\xeb\xcb\xff\x84\x37\x3c\xef\x45\x1c\x39\x6f\x5f\x7a\x81\x75\
-\xad\x16\xef\xbb\xe4\x7f\x78\xe3\x97\x3f\xc3\x43\x53\x13\x98\x7a\
-\x1f\x46\x72\x7c\x19\xd0\xcc\x00\x81\xaa\xdf\x69\xdb\xa0\x4f\x66\
-\x7c\x51\x14\xe4\xfd\xbd\xac\x1f\xd9\xc4\xed\xb7\x2d\xe5\xcc\xb3\
-\xce\x61\x4e\x4f\x1d\x2d\x3c\xd6\x98\x76\xd4\xaf\xad\x00\x76\xf2\
-\x81\xb0\xd3\x14\x40\x45\xc4\x60\x82\xc6\xc8\xae\x08\x4d\x6b\xb9\
-\xa7\x98\xe0\xaf\x3e\xf2\x3e\xee\x1c\xd9\x84\x19\x18\xc2\x7b\xc1\
-\x86\xd0\x69\xce\x20\x1d\x64\x4d\x24\xf3\x48\x3e\xb5\x28\x12\x62\
-\xda\x50\x03\x18\x93\x33\x36\x39\xc1\xfa\x8d\xeb\x79\xce\xb9\x17\
-\x30\xd7\x38\x42\xd1\xa2\x2f\xaf\x73\xd0\x21\x87\xf3\xf3\x5f\x5f\
-\x89\xf7\x25\x36\xcf\x69\x79\x1f\xe1\x9c\x49\x1b\xab\x44\x82\x48\
-\x14\x6a\x89\x31\x56\xb3\x9c\x16\x86\x9f\x5f\x79\x25\xa5\xb1\x9c\
-\x7a\xf4\x31\xa9\xa9\x44\x20\x43\x31\xbe\x64\x61\xdf\x20\xc7\x1e\
-\x7b\x2c\x57\x5d\x7b\x1d\x93\x8d\x06\xe4\x39\x05\x5d\xcc\x35\x55\
-\x35\xe2\x5e\xd9\xba\x84\x40\x3d\x73\x34\x47\x46\x78\xce\x31\xa7\
-\xf0\xde\x57\xbf\x8e\x01\x63\xf8\xe1\x5d\xb7\xf2\x9f\x97\x7c\x8d\
-\x72\xa0\x1f\x29\x05\x67\x6b\x04\x0d\x8f\x0d\xc1\x56\x30\x99\xa3\
-\x15\x4a\x32\x6b\x90\x56\x81\xdf\x38\xc6\x82\x60\x78\xce\x09\xa7\
-\xf2\xa6\x57\xbc\x8a\xd7\x3e\xf7\x05\x9c\xb8\x60\x21\x59\x7c\x3b\
-\xbf\xba\xf7\x2e\xde\xf8\xf9\x4f\xf2\xd9\x2b\x7f\x41\x39\x34\x80\
-\xcb\x7b\xb1\x05\x11\xa3\x22\x1e\x91\xc4\x0e\x9d\x28\xe6\x4b\x23\
-\x31\x6d\x2d\x20\x09\xb1\x1a\x82\xe2\xf2\x8c\x15\x6b\xd7\xf2\xe0\
-\xaa\x55\x3c\xed\xec\xf3\xe8\xb5\x06\xca\x12\x63\xe2\x7b\xdb\x0a\
-\x60\x27\xd7\x93\xef\x54\x05\xa0\x28\xa6\x28\x63\xce\xdc\x1a\xd6\
-\x4a\xe0\x2f\x3f\xf6\x5e\xae\x78\x70\x39\xcc\x99\x43\x59\x0a\x4e\
-\x1d\x26\x25\xd0\xb5\x0b\x7b\x1b\xcd\x28\xe9\xaa\xc8\x33\x11\xc6\
-\xa9\x20\xa6\x46\x50\x21\xeb\xed\x65\xf9\x83\xf7\x72\xc8\xbc\x61\
-\xce\x5c\x7c\x28\xcd\xd0\xc2\xf8\x92\x83\xe6\x2f\xa4\x67\xce\x30\
-\x57\xdf\x78\x3d\x2d\x03\x3e\x8b\x2d\xb6\xab\xe6\x10\x31\x38\xa8\
-\x18\x67\xa0\xd5\x8a\x8c\xb2\x2a\xf8\xcc\x11\xfa\x7a\xb8\xe6\xc6\
-\x1b\xa9\x8b\xe1\xdc\x63\x8e\xc5\xfa\x56\xe4\x17\x00\x08\x9e\xc5\
-\x73\x17\x70\xec\x09\x27\x72\xc5\xf5\xd7\xb3\xb1\x31\x89\xf6\xe4\
-\x28\x8a\xa8\xa1\xa6\xd2\x71\x57\x78\x72\x3b\x03\xed\x28\x78\x57\
-\x83\x1f\x67\x2d\x8d\xb1\x51\x4e\x3f\xe0\x10\x3e\xfa\x86\x7f\xe0\
-\xa0\x7a\x0f\xeb\x51\xde\xf4\xf5\xff\xc7\x9d\xeb\x56\x92\xb9\x3a\
-\xa6\x88\xf8\xfb\x80\x9f\xd1\x07\xa6\xda\x55\xed\xdd\x85\x18\x41\
-\x5d\xec\xfc\x5c\x6e\x1e\x67\x3f\x57\xe7\x8f\xce\x7d\x1a\x6f\xff\
-\x5f\xaf\xe6\x35\xcf\x78\x2e\x47\xcd\x5b\x48\xee\x3d\xb9\x31\x3c\
-\x32\xb6\x99\x0f\x7e\xfb\x6b\xbc\xed\x4b\x9f\xe1\xb6\x91\x75\xd8\
-\xe1\x79\x80\x43\x8a\x10\x01\x5f\x4e\x11\x89\xa0\x33\x51\x43\x30\
-\x15\x90\x84\xd8\x55\x4c\x03\xd6\x18\x24\x04\x6c\xac\x3c\x41\xfb\
-\x7b\xb8\xe7\xfe\xfb\x18\xdb\xb0\x89\xf3\x4f\x3d\x9d\x5c\x93\xab\
-\x2b\x92\x3a\x48\x77\x0f\xc8\xce\x59\x0d\x8f\x83\x02\xe8\xe2\xda\
-\xea\x46\x3d\x49\x57\x93\xde\xf4\xeb\x16\x05\xda\x2c\xb0\x59\xce\
-\xb8\x15\xde\xfc\xa5\x2f\xf0\xf5\xeb\xae\x84\x39\x43\x04\xb1\x11\
-\x08\x18\x0a\xd4\x24\x93\xbc\x62\xe6\xdd\x5a\xdf\xd6\xd8\xe7\x29\
-\x99\xee\xed\x08\x1c\x41\x02\xf7\x3c\x78\x1f\x67\x9f\x79\x36\x8b\
-\x7a\x07\xc9\x9a\x9e\xba\x58\x4e\x3a\xe4\x20\x7c\xcd\x70\xd5\x92\
-\x9b\x09\xf5\x1e\x82\x38\x8c\xb7\xe4\x5e\x70\x5a\xe2\x8c\xa2\xbe\
-\x85\x31\x11\x68\x14\xd3\x52\x86\x90\x59\xc8\x0c\x0f\xdc\x7b\x0f\
-\xe7\x9f\x74\x0a\x8b\xe7\x0c\x43\x28\x21\xcb\x53\x6b\xf1\xc0\xc1\
-\x73\x87\x39\xf2\xe8\x23\xb9\xe2\xc6\xab\xd9\xd8\x1a\xc7\xe4\x39\
-\x78\x70\xea\x08\x12\x10\xa3\xd8\xb4\x7e\x30\x5d\xe0\x10\x53\x8d\
-\x99\xd9\xa3\xb4\x83\x51\x45\x50\xd4\x46\x62\x07\x1b\xc0\x95\x29\
-\x38\xe6\x62\x1a\xd7\x5a\x8b\x9d\x9c\xe0\xa0\x5a\xc6\x07\x5f\xff\
-\x77\x9c\x34\x7f\x11\x01\xb8\x64\xe9\x2d\x7c\xf8\x87\xdf\x86\xc1\
-\x01\x42\xb0\xed\x0e\xdf\x86\x26\x26\x94\x71\x7e\x30\x10\x0c\x62\
-\x32\x8c\x71\x58\x6b\xe3\xb8\xb6\x1a\xe8\xe8\x46\x0e\xeb\xed\xe5\
-\x65\xe7\x9c\xc7\x3b\x5f\xf9\x2a\x5e\x7d\xde\x85\x1c\x3c\x34\x84\
-\xb4\x5a\xa8\xb5\x6c\x32\x86\x2f\x5c\x79\x39\xff\xf4\x99\x4f\xf2\
-\xbd\xa5\x37\xd3\x1a\xe8\xc3\xf6\x0f\x50\x56\x65\xbe\x89\x5e\x30\
-\x54\x8b\x59\xa2\xbf\x0f\x69\xce\x2a\x72\x5a\x23\x04\x5f\x82\xb1\
-\x78\x8d\x96\xa9\x58\x83\xeb\xeb\x61\xc9\xd2\xa5\x98\x00\xe7\x1d\
-\x7f\x02\x52\xc6\x58\x95\x4f\xed\xe3\x8d\x9a\xc7\xde\xfc\x8f\xe3\
-\x5a\x78\x9c\x2c\x80\xe9\x70\xa7\x6a\xf3\x47\xdc\x5e\xf5\x9b\x40\
-\x08\x1e\xb1\x8e\xe0\x2c\x1f\xfc\xe1\x0f\xf8\xd0\x77\xbf\x01\xf3\
-\x86\x51\x71\x29\x1a\x9f\xf8\xdd\x67\x9b\x3b\x97\xc4\x1c\x92\xd8\
-\x5b\x55\x3d\x79\xbd\xce\xda\x8d\x1b\xd8\xb0\x7e\x3d\xcf\x39\xfd\
-\x1c\x7a\xb0\x50\x34\x51\x09\x9c\x74\xe4\x71\x6c\x9a\x9a\xe4\xe6\
-\x25\xb7\xe1\x7a\x7a\x23\x07\x80\x51\x8c\xc4\x98\x44\xa7\xf4\x57\
-\x50\x63\xd3\x97\x10\x9c\xb3\x4c\x6c\xdc\xc8\x91\x07\xee\xcf\x59\
-\x07\x1f\x81\xa8\x12\xac\xeb\xaa\x0e\x50\x16\xcf\x5d\xc0\xc1\x47\
-\x1c\xc6\x35\x37\x5c\xc7\x64\xa3\xc0\xe5\x75\x0a\x1f\x03\x5c\x52\
-\xb1\xcb\x2a\x6d\xf6\xda\xee\x31\x93\xea\xbb\xec\x21\x52\x11\xba\
-\x68\x0a\x82\x9a\x00\x4e\x05\xc9\x2c\x9e\x02\xc9\x2c\xb6\x59\xd0\
-\xdf\xf2\xbc\xed\x7f\xfd\x6f\x5e\x70\xec\x29\x84\xc2\x33\x61\x0d\
-\xef\xf8\xfc\x67\xb9\x73\xd3\x3a\xa4\xa7\x97\xa0\xe9\xf4\x14\x41\
-\x2c\x58\xe3\x28\x8b\x48\xf6\x62\x32\x83\x18\x25\xf8\x26\x61\x62\
-\x82\xfe\xf1\x49\x4e\x1e\xde\x87\x3f\xbd\xe8\x99\xfc\xeb\xcb\x5e\
-\xc9\xcb\xcf\xba\x90\x03\xfa\x07\xf1\xc5\x14\xc6\x18\x1a\x2e\xe3\
-\x57\xf7\xde\xc9\x9b\xbe\xf0\x29\x3e\xfd\xb3\x1f\xf2\x48\xd9\x44\
-\x87\x06\xe2\xc6\x84\xf6\x3a\x9a\xd6\x32\xbc\x7d\x08\x6d\x6b\xfd\
-\x75\xfd\x6d\x4a\x27\x23\x06\x97\xe7\xdc\xb6\x64\x09\x0b\xe6\xce\
-\xe7\xe4\x43\x0f\xa1\x59\x78\x9c\x31\x6d\x2a\x09\x79\xac\x54\xc0\
-\xee\xa5\x00\x3a\xa6\x74\xf5\xa8\x36\x7f\xfb\x25\x01\x02\x58\x6f\
-\x28\x33\xc7\xd7\x96\xdd\xcc\x9b\x3f\xf7\x31\xfc\xf0\x20\xa5\x89\
-\xf9\x5a\xab\x9d\x02\x9b\x59\xc7\xcd\xda\x41\xc2\x18\xd0\x53\x31\
-\xf8\xb2\xc5\x60\x6f\x2f\x0f\xde\xb3\x9c\x05\x73\xe7\x71\xca\xa1\
-\x87\xd2\x4a\x53\x9a\x5b\xcb\x59\xc7\x9f\xc4\xda\xd5\xab\x59\xb2\
-\x6c\x29\x6e\x6e\x1f\xa5\x36\xf1\xbd\x35\xd4\x47\xfd\xe3\xad\x60\
-\x83\xc5\xf9\x88\x20\xc3\xa7\x13\xad\xd5\x64\x8e\xcb\xb9\xf8\x8c\
-\x73\xb1\x95\x65\x62\x0c\x18\x43\xa9\x9e\xa0\x70\xe4\xbc\x45\x1c\
-\x7e\xd0\x61\x5c\x75\xf5\xd5\x34\x8d\x52\xd6\x2d\x95\x5e\xd3\x2e\
-\x55\x28\xda\x29\x75\xa9\xba\xdc\xec\x69\xf1\xc2\xce\x77\xa9\xb2\
-\x2c\x4a\x61\x62\xc3\x95\x9a\x31\xf8\xd1\x09\x9e\x73\xe2\x69\xfc\
-\xe3\x0b\x5f\x86\x6f\xb5\xe8\xcd\x33\xbe\x7f\xed\x75\x7c\xee\x47\
-\xdf\x21\x0c\xf6\x53\x6a\x1c\x21\x2b\x36\x66\x8e\xc4\x10\xbc\x90\
-\xe5\x35\x8c\x7a\xca\xc9\x31\x4c\x73\x92\x85\xce\xf1\xec\xa3\x8f\
-\xe3\xef\x7e\xe7\xc5\xfc\xcb\x0b\x5f\xca\xef\x9d\x78\x0a\xfb\xf5\
-\x0e\xd0\x68\x15\xb4\x44\xf0\xae\xc6\xad\x63\x1b\x79\xff\x77\xbe\
-\xc6\x3b\xbe\xf8\x69\x96\xad\x5f\x8b\x0c\xf5\xa3\x79\x16\xf7\x2b\
-\x74\x22\xf3\xaa\xbf\xb9\x69\x2e\x12\x53\xd2\x1a\x31\x26\xc1\x2a\
-\xd7\x2f\xbb\x8d\x23\x8e\x3a\x8a\xa3\xe6\x2f\x84\x56\x89\xb3\x96\
-\x26\x1e\x63\xec\xa3\xef\xf1\xc7\x71\x1d\x3c\x6e\x8d\x41\xba\xeb\
-\x20\xaa\x53\xb1\x1b\xf6\xa8\xa5\x62\x72\xcb\x75\xab\x56\xf0\xc6\
-\xcf\x7d\x8c\x91\x7e\x87\xad\x3b\xb4\x99\xe0\xc1\x69\x93\x1a\x31\
-\xb1\xa9\xf7\x76\x0c\x42\xc7\xb5\x54\x6c\x5e\xa3\x51\x14\xd4\xeb\
-\x75\xde\xf7\xa5\x2f\x72\xe8\xc1\x87\x72\xc1\x41\x07\x63\x8b\x12\
-\xd7\x0a\xcc\xb3\xc2\x7b\x5f\xf3\x7a\xa6\x8a\x49\xbe\xb1\xe4\x5a\
-\xdc\xc2\xf9\xf8\xa9\x29\xc4\xf6\x26\xba\xef\x32\x56\x83\xa5\x14\
-\x61\xcb\x28\xa5\x2a\xb5\xde\x5e\xae\xb9\xed\x36\x36\x34\xa6\xe8\
-\xab\xf7\x20\x1a\xdb\x8b\xab\x08\xce\x64\xd4\x15\xca\x86\xe7\x05\
-\x47\x1f\x4f\xeb\x75\x7f\xcd\x5f\x7e\xe2\x3f\x19\xb7\x2d\x8c\xeb\
-\x21\x68\xea\x49\x1f\x40\x34\x7a\x8c\xb6\x0b\xdc\x04\x7b\xe0\xe6\
-\x17\x40\x4d\x5b\xc1\x79\xa3\x68\x32\x0d\xb4\x55\x30\x5f\x2c\x7f\
-\xf6\xbb\x2f\x66\x0e\x10\xac\x65\x14\xf8\xc1\x75\x57\x30\x8a\x47\
-\xad\x81\x10\xa2\xa5\x55\x81\xbe\x6c\x1d\xd4\xd3\x9a\x9a\x22\x2b\
-\x1a\x9c\xb9\xff\x01\x3c\xe7\xb4\xd3\x79\xf6\x49\x67\x70\xfc\xfe\
-\x8b\xe9\x4f\x2b\xa0\x35\xd9\x42\xac\xa5\x56\xcb\x58\x15\x02\x5f\
-\xfa\xe5\x4f\xf8\xcc\x0f\xbe\xc3\x83\x9b\x37\x62\xfa\xea\x98\x7a\
-\x0f\xcd\xb2\x04\x0d\x88\x58\x8c\xb1\xf8\x32\x96\xf7\x8a\x31\xfc\
-\xc6\xcd\xb3\x55\x41\x1c\xaa\xca\x94\x7a\xb2\x81\x1e\x56\x8c\x8d\
-\xf0\x96\xcf\x7f\x82\xc3\xfe\xee\xad\x1c\x3b\x34\x17\xef\x3d\x38\
-\x8b\xa7\x9b\xa9\xaa\xfa\xfb\x6d\xfc\xbc\x83\xd7\xc5\xe3\x82\x4a\
-\x91\x69\x3f\xc7\x7c\xbd\x25\xb6\x6e\x8e\x8d\x3a\x15\x53\xb3\x8c\
-\x94\x25\xef\xf8\xdc\xa7\x59\x39\x3e\x8a\x19\xe8\x8b\x10\xdd\x14\
-\x28\x2b\x91\x54\xad\xb7\xbd\xdf\x58\xdb\xbb\x48\x14\x42\xab\x24\
-\x18\x4b\x59\xaf\xb3\xc1\x28\xef\xfa\xea\x97\x59\xa7\x81\xcc\x39\
-\x8c\x89\x79\xe7\x01\xef\x79\xdf\xeb\xff\x96\x97\x9e\x7e\x0e\x3c\
-\xb2\x96\x3e\x53\x4b\xa7\x32\x29\xb6\x24\x04\x11\xbc\x28\x21\x13\
-\x82\x8b\xd8\xff\xac\xb7\x8f\x12\x8d\x8c\x43\x44\x05\x81\x86\x88\
-\x4f\x28\x3d\x16\x43\x68\x78\x9e\x7f\xc2\x29\xbc\xe5\x4f\xff\x9c\
-\x81\xc9\x06\xb6\xf4\x88\x49\x80\xa6\xc4\x31\xa7\x98\x14\x11\xae\
-\x20\xc4\xb3\x88\x70\xef\x86\x22\xc4\xe2\x2b\x25\x6e\x72\x50\x32\
-\x11\xcc\xe8\x18\x2f\x7f\xfa\xb3\x38\x7f\xf1\x41\x98\x66\x89\xb1\
-\x96\xe5\x9b\xd6\x71\xd5\x7d\x77\xe2\x07\xfb\x68\x11\x53\xbb\x22\
-\x82\x86\x12\x6b\xa3\x7f\xef\xc7\xc6\x38\x63\xc1\x7e\x7c\xec\x55\
-\xaf\xe7\x7b\xff\xfa\x4e\xde\xfa\xdc\xdf\xe7\xec\xfd\x0f\x22\x2b\
-\x5b\x34\x8b\x06\x41\x03\x59\x6f\xce\xc6\x9a\xe5\x1b\xb7\xde\xc0\
-\x9f\xff\xe7\xbb\xf8\xf7\x2f\x7d\x91\x07\x5a\x05\x66\xee\x42\xa8\
-\xf5\x13\x5a\x81\x5a\x29\x64\x29\x55\xe3\x7d\x57\x63\xf9\xdf\x22\
-\x63\x23\x1a\xd7\x04\x01\x4c\x9e\x51\x06\x8f\x19\x1c\xe0\xb6\x35\
-\x2b\x78\xf3\x67\x62\x4d\x4b\x69\x22\x74\xdc\x6d\x6d\x8d\x3f\x41\
-\x51\xe2\x1d\xef\x02\x74\x62\x25\xe9\xe4\x8f\x91\x53\x34\xa0\xa9\
-\x8f\xb6\x57\x65\xca\x18\xde\xf8\x85\xcf\xf2\xbd\x25\xd7\x23\xf3\
-\x86\xf0\xa5\x62\x42\x2c\xab\x0d\x46\xda\x79\xf3\x76\xdb\xad\xd9\
-\xc6\x00\xda\xd9\xd5\x4e\xc0\x26\x9e\xe3\x40\x5e\xe3\xfe\x47\x56\
-\x30\xb5\x69\x84\xa7\x9f\x72\x2a\x21\x28\x99\x28\x26\x78\x7a\x9d\
-\xe5\x82\xd3\xcf\xa1\xd5\x6c\xb1\xf4\xb6\xdb\xd1\xa6\x27\xaf\xe7\
-\xa8\x49\x10\x65\x84\xd2\x12\x7d\x78\xab\x48\x51\x30\xd0\xf2\xfc\
-\xc9\xc5\xcf\x65\xd8\x65\x10\x14\x6b\x24\x41\x3f\xe3\x8d\x0b\x11\
-\x2c\x54\xa8\x72\xf4\xfe\x07\x33\xd0\xd7\xc3\x95\x37\xde\x82\xb7\
-\xb6\x1d\x2f\xd0\x10\xc0\x9a\x98\x1d\x4c\xa7\xa2\x9a\x27\x70\x05\
-\x3c\x11\x62\xa2\x3f\x2c\x3e\x96\xd8\xc6\x3e\x7c\x01\x43\xc0\x35\
-\x1a\x9c\x30\x77\x1f\xde\xfb\xba\xbf\x65\x18\x8b\x2d\x15\xc9\x0c\
-\x5f\xbb\xe5\x3a\xbe\x76\xcd\xaf\x90\x39\x43\x68\x10\x9c\x31\x50\
-\x7a\x32\x01\x69\x36\x98\x57\x04\xfe\xea\xb9\x2f\xe0\xdd\xaf\xfa\
-\x33\x2e\x3a\xf0\x20\xfa\x11\x5a\xad\x26\x2d\x02\xde\xe5\x38\x9b\
-\x31\x21\xc2\x77\x6f\xbf\x85\xff\xf3\xed\x2f\xf1\x91\x6f\x7e\x8d\
-\xbb\x37\x6d\x44\x86\xe6\x10\xb2\x9c\x90\xca\xf3\x32\x84\xcc\xc7\
-\xf1\x2e\x0d\x1d\xb3\x3f\xc5\x00\x7e\x53\x17\x40\x20\x82\xc0\x9c\
-\x6d\x37\x1c\x55\x55\x7a\x6a\x3d\x2c\xbf\xff\x5e\xc4\x0a\xe7\x1e\
-\x7d\x02\xb9\x8f\x96\x71\x20\x36\x24\xad\x24\x84\x80\x31\x5b\x09\
-\x06\xef\xe0\x25\xb1\xe3\x5d\x80\x2e\x9e\x85\x98\xee\x48\x5a\xb4\
-\x54\x02\x4a\x61\xc0\x39\xc7\x57\xaf\xb9\x82\x4f\xff\xfa\xa7\xc8\
-\xfc\x39\xf8\x12\x6c\xb0\x48\xcb\x23\x36\xc3\xa7\x14\x8b\x06\xda\
-\x8d\x1e\x67\xf7\xd9\x5d\x74\x11\x52\x69\xf0\xf4\x9a\x89\x8d\x44\
-\xdc\xbc\x39\x7c\xe5\x8a\x9f\x73\xe4\xe2\x03\x78\xcd\xd3\x9f\x4d\
-\xab\x15\x70\xad\x48\x15\x3e\xe4\x72\xde\xfc\x87\xaf\xe4\xa4\x23\
-\x8f\xe3\x2b\xdf\xfa\x2e\x77\xac\x7a\x88\xb5\x66\x0a\xb1\x0e\x57\
-\xab\x11\x6c\x86\x51\x21\x53\x98\xda\xb4\x89\x93\x4f\x3c\x83\x05\
-\xbd\xbd\x91\xd8\xc0\x24\x78\x68\x35\x49\xc6\xe0\x53\xe7\x02\x80\
-\xac\x6c\xf0\xd7\x17\xfe\x0e\x9b\x1a\x81\xf7\x7d\xed\xcb\xd4\x87\
-\x87\x98\xf0\x9e\x3c\xaf\xd1\x0a\x01\x8c\xa0\x6a\x12\x1e\xba\x6b\
-\x2c\xf7\x14\x49\x74\xee\x41\x15\xaf\x31\xa5\x56\x53\xa1\x77\xaa\
-\xe0\xef\x5e\xfd\x0a\x16\xb9\x0c\x6d\x15\x60\x2d\x6b\x09\xfc\xe4\
-\x96\x6b\xa0\x9e\xc5\x21\xb0\x8e\xa2\xd9\xa4\x4f\x04\x69\x34\x98\
-\x97\xe5\x7c\xf4\x75\x7f\xc7\xb3\x8e\x39\x81\xa0\x4a\xd9\x6a\x41\
-\x80\x2c\xcf\x51\x63\x58\x5b\x96\xfc\x72\xc9\x2d\x7c\xe3\x67\x3f\
-\xe5\xca\x7b\x6e\x65\xb3\xb6\xe8\x9f\x37\x1f\x2b\x96\x66\xa1\x18\
-\x13\x23\xf0\x08\x14\x21\x45\xf9\x4d\xe7\x3e\xbb\xef\xf9\xb7\x92\
-\xd4\xa8\x06\x67\x22\x6c\x38\x78\x5a\x78\xf2\x05\xf3\xf8\xf0\xf7\
-\xbf\xc5\x49\x87\x1c\xc9\xef\x1f\x7f\x0a\xad\x56\x81\xcd\x1d\xd5\
-\xc4\xfb\x54\x52\xdc\x66\xc4\x7a\x1c\xe5\xf1\xb1\x00\xa6\x65\xe9\
-\x42\xc4\xfa\x8a\x23\x58\x4b\xcb\x5a\x6e\x59\xbb\x8a\x7f\xfc\xf8\
-\x87\x58\xdf\x5f\x27\xa0\x58\x1f\x67\xc2\x39\xd7\xee\xf4\x1a\x27\
-\xa0\xda\xcc\xb3\xdb\x09\x11\xc9\xd7\x95\x31\x90\xee\x1b\x4a\xb7\
-\x27\x42\xc8\x2c\xd7\x2f\xb9\x99\x83\x0e\x3e\x94\xd3\xf6\xdd\x0f\
-\x1f\x84\xcc\x58\xd4\x44\xda\xa7\x13\xf7\x3b\x80\xe7\x9e\x7f\x21\
-\x27\x1e\x7e\x38\x83\x7d\x75\x6c\xa3\x49\x31\x31\x41\x98\x9a\x84\
-\xc9\x06\xd9\x44\x83\xb3\x0f\x3e\x9c\x37\xbf\xea\x2f\x38\xac\x7f\
-\x10\x4a\x8f\xb8\x19\xde\x94\x08\x05\x42\x29\x60\x8d\xd0\x83\x40\
-\xab\xe4\xc4\xa3\x8f\x65\x64\x7c\x33\xb7\xdc\x72\x0b\xbd\x73\x06\
-\x69\x55\xad\x4d\xba\x9d\x7e\xe9\x1e\xc4\x3d\x40\x52\xd6\xc3\xaa\
-\x49\x6d\xde\x14\x67\x04\x36\x8e\xf2\xc2\xd3\xce\xe1\xf5\xbf\xf3\
-\x62\xb2\xb2\x89\x13\x45\xb2\x8c\xeb\x56\xad\xe0\x43\xdf\xfd\x06\
-\x8d\xde\x1e\x20\x83\x32\x50\x43\xc8\x1b\x4d\xe6\x89\xf0\xfe\xbf\
-\xfd\x17\x7e\xef\xc8\xe3\xf0\xcd\xa9\x58\x93\xa1\x42\x56\xcf\x19\
-\x13\xe1\x92\x1b\xae\xe7\xed\x9f\xff\x0c\x9f\xb8\xf4\x87\x2c\x1b\
-\x5d\x4b\x18\xe8\xa5\x36\x30\x40\xab\x54\xbc\x57\x8c\x49\xd6\x56\
-\xd5\x41\xd8\x06\xbc\xd3\xb4\xe6\x76\xdc\x78\x57\x97\x53\x43\xe2\
-\x1d\x88\x16\x41\x00\x4a\x1b\xfb\x50\xdc\xb5\x74\x19\x17\x9c\x75\
-\x2e\xc3\x7d\x7d\xb1\xe5\x18\x31\xe6\x85\x74\x10\x82\x5b\x28\x80\
-\x5d\xde\x02\x48\xfb\x20\x19\x3d\x48\x4a\xdd\xa8\x08\x0d\x94\x0d\
-\x08\xef\xfa\xf2\x67\xb9\x7f\x62\x14\x86\x87\xdb\xd5\x59\xde\x29\
-\x85\x04\xbc\xa4\x6a\xad\x36\x7b\xef\xec\x07\xdc\x76\xf9\xed\x6d\
-\xe5\x03\xa9\x0f\x40\x1c\xd2\x00\x84\x3c\x63\x4c\x95\x37\x7f\xe2\
-\xa3\x0c\xff\xfd\xbf\x70\xd1\x21\x87\x11\x5a\x05\xc6\x43\x2f\x1e\
-\x82\x67\x5e\xe6\x78\xde\x89\x27\x72\xf1\x89\x27\xb2\xd6\x37\x59\
-\xfe\xd0\x43\xac\xdc\xb0\x1e\xaf\x9e\x45\xfd\x43\x1c\x77\xe0\xc1\
-\xec\xd7\x3f\x40\xe1\x4b\x9c\x93\xaa\x0d\x5d\x27\x88\x57\xdd\x93\
-\x08\xb1\x72\xc5\x60\x0c\xcc\x0d\xf0\xb6\x3f\xfa\x13\x1a\x13\xe3\
-\x7c\xed\xda\x2b\x31\x73\xe7\x60\x92\xb6\x4f\xe8\x85\xc8\x86\xb4\
-\x27\x9d\xfe\xc4\x2f\xa5\x55\x0a\x28\x33\xd0\x2a\xd8\xb7\x7f\x2e\
-\xaf\x79\xfe\x1f\x30\x8f\x38\xcf\x85\xc6\x4d\x70\xd9\x4d\xd7\xb3\
-\x69\x62\x12\xd3\x33\x8f\x50\x28\xae\x84\x1e\x23\xb8\x66\x8b\xb7\
-\xbd\xee\x6f\x78\xd6\xa1\xc7\xb0\xb9\x9c\xa4\xee\x2c\xde\x1b\xf2\
-\x9a\x63\xe9\xea\xb5\xfc\xc7\x57\xbe\xc4\x8f\x96\xdd\xcc\x26\x29\
-\x71\x73\x07\xb1\x46\x12\xc3\x94\x80\xd8\x58\x03\x60\xc0\x68\xa4\
-\x98\xaf\x10\xa4\x6d\x85\xbb\x03\xc7\x5c\x45\xf1\x26\x36\x96\x8d\
-\xfc\x10\x82\x97\x04\x05\x2e\x15\xeb\xea\xdc\xb9\x7e\x0d\x6f\xff\
-\xea\x17\xf8\xc4\x5f\xfc\x35\x3d\x21\x60\xad\xa3\xd4\x58\x41\xa8\
-\xaa\x51\x19\x3c\xce\xb2\xc3\x15\x40\x45\x7c\x53\x29\x00\x47\x8c\
-\xa6\x16\x41\xc1\x1a\x3e\xff\xc3\xef\xf2\x93\x5b\x6e\x40\x16\xce\
-\x27\xf8\x18\x05\xf7\x65\x0b\x9f\x4b\xa4\xe4\xf2\x8a\x2d\xc1\x79\
-\x28\xac\x50\xda\xd9\x4f\x4c\xec\xd5\x16\x5b\x87\xc5\x17\x48\x75\
-\xe0\x9d\x4e\x40\xa2\xf1\xde\x4c\x96\xb3\xa6\x6c\xf0\xfa\x0f\xbc\
-\x9b\xff\xfb\xd7\xff\xc8\x73\x0f\x3b\x12\xdb\x68\x21\x62\x51\xa7\
-\x34\xb5\x89\x06\xa1\x37\x38\x16\x67\x35\x0e\x3a\xe4\x08\xe4\x90\
-\x23\x3a\x51\x53\x0f\xbe\x55\x10\x1c\x34\x08\x38\x6c\xbb\xf2\xb4\
-\x02\x2c\x66\x08\xde\x07\x8c\x75\x91\x63\xc0\x08\xae\x51\xb0\xa8\
-\x27\xe3\x6d\x7f\xf1\x06\x56\x15\x0d\x2e\x5d\x7a\x2b\xf9\xe0\x9c\
-\x48\x38\x99\x1c\xa6\x19\x8d\x8f\x77\x7b\x11\x11\x4c\x50\xbc\x06\
-\xd4\x39\xc4\x18\xca\xf1\x09\x9e\xff\xec\x17\x70\xfa\xfe\xfb\x43\
-\xe1\xc1\x17\xd8\x7a\x8d\xd5\x45\x8b\x5f\x5f\x7f\x1d\x2e\xcb\x09\
-\xc1\x62\x31\xf4\x3a\xcb\xd8\xea\x47\xf8\xfb\x57\xbc\x9c\x17\x9c\
-\x76\x36\xb6\x68\x52\x27\x23\x60\xf0\xb9\xe5\x5b\x77\xdf\xce\x3f\
-\x7f\xfc\x23\xdc\x3b\xb6\x11\x37\x3c\x14\xf1\x54\x1a\x90\x96\xc7\
-\x4b\x16\xd3\xb7\x12\xc0\x19\xbc\x96\x18\x09\xed\x5a\x7c\x4d\xae\
-\xaa\xee\xe8\xb4\x8b\x00\x12\x15\x80\xd1\x58\x2d\x18\x63\x0c\x82\
-\x55\x4b\x2e\x82\x1f\x1a\xe4\xeb\x37\x5e\xce\xd3\x2f\x3f\x96\x3f\
-\xbf\xe0\x62\x26\xca\x16\xb9\xb1\x11\x21\x5b\xe1\x08\x1e\x67\x2b\
-\xf0\x71\xca\x02\xa4\x8d\x4f\x3a\x71\x7d\xc0\x59\xc3\xe5\x0f\x2c\
-\xe7\x93\x3f\xf9\x1e\xcc\x99\x8b\x62\x31\x02\xad\xd0\x82\xdc\xc5\
-\x60\x58\xe2\x4c\x0a\x08\x65\x42\xdf\xcd\x76\x27\x28\x31\x5e\x10\
-\x64\xda\x0b\xed\x08\x62\x15\xc9\x57\x11\x5c\x30\x84\xa6\x47\xfb\
-\x7b\x78\xd0\x37\x78\xcd\x87\xdf\xcb\x97\xef\xb8\x85\xa2\x9e\xd3\
-\x90\xe8\x8b\xd7\xc4\x91\x89\x01\x2b\x98\x10\x62\x63\x91\xa6\x47\
-\x5b\x81\x30\xe5\x63\xd0\xcf\xda\x88\x3c\x33\xae\x4d\x38\xd5\x9e\
-\xfc\xc4\x55\xe0\x8c\x49\x9c\x05\x51\x11\x9a\xdc\xa2\x45\xc9\x3e\
-\x58\xde\xff\xea\x37\x70\xd1\x21\x47\x50\x6c\x58\x87\xab\x09\xa5\
-\xf5\x04\x55\xf2\xc2\x46\x84\x98\xd1\xce\x09\xd5\xfd\x20\x55\x44\
-\xfa\x8a\xee\x6a\xe7\x48\x34\x6b\xbb\x3c\xb4\x69\x5e\x4b\x7a\x22\
-\x82\xf1\x86\x9a\xd6\x50\x63\x30\x36\xa0\xa3\xa3\x9c\xb9\xff\x41\
-\xbc\xee\x79\xcf\x8f\x71\x01\x23\xa8\xcb\xb0\x64\x5c\xbd\xe4\x36\
-\x96\x3c\xb2\x02\xdf\x5f\x03\xeb\x71\xea\x29\x57\xad\xe2\x15\x4f\
-\x7d\x3a\x6f\x78\xf6\x0b\x70\x5a\x92\x4b\x44\x52\x7a\x67\xb9\xf4\
-\xfe\xbb\xf9\x9b\x8f\xbf\x9f\x7b\x8b\x31\xb2\x45\x0b\x28\x53\x91\
-\xbf\x2d\x05\xa3\x5d\xd5\xf7\x12\xfd\x7e\x4d\x24\x20\x9a\xee\x4f\
-\x52\x00\x60\x87\x8f\xa2\x02\xc4\xcf\xf1\x02\x5e\x34\xc6\x77\x0c\
-\xb1\x75\xbd\x06\x5a\xce\x41\x5f\x3f\xef\xf9\xee\x97\xb9\x69\xe3\
-\x4a\x7a\x5c\x0e\x25\x6d\x1c\x0b\x29\x68\x3e\xdd\x52\xd9\xb1\xb2\
-\xc3\x15\x80\x90\xaa\x5e\x53\x47\x1e\xd5\x18\x09\x5d\xdb\x6a\xf1\
-\x9f\x5f\xfe\x02\xab\x1a\x93\x84\xbc\x46\xf0\x1a\x0b\x3a\xac\x50\
-\x68\x19\xeb\xe4\xd3\x86\xf5\x46\x28\x6c\xdc\xb0\xdb\x23\xde\x68\
-\x0c\x20\x4e\xbb\x9b\x94\xc2\x33\xf1\xdf\x20\x02\x46\x52\x74\x1e\
-\x4c\x7f\x1f\xab\xca\x16\xff\xf0\x89\x0f\xf3\x6f\x3f\xfa\x2e\x9b\
-\x72\x4b\xe1\x2c\xad\x86\xc7\xa8\xa3\x99\x0a\xcf\xad\xb5\xed\xf4\
-\x9d\xa9\x25\x6a\x71\x1b\xd3\x94\x35\x0c\x8e\x19\xf4\x4e\x52\xa1\
-\xa1\x13\x9e\xa1\x72\x0d\x9c\x60\x9c\xa1\xd6\xf2\x1c\x5f\xef\xe3\
-\x3d\x7f\xf6\x7a\xce\x58\x7c\x30\xad\x91\x0d\xb8\xdc\x20\xce\xe1\
-\x7d\x2a\x6d\x6e\x5f\xb0\x3b\xb2\xaa\x5d\xdf\xac\x9b\x35\xf7\x89\
-\x17\xc3\x8c\x70\xc5\xb4\x30\x86\xb4\x17\xb1\x55\x17\x0b\x2e\xf3\
-\x8c\x10\x4a\xfa\x8b\x82\xbf\x7d\xd1\x4b\x38\xac\x56\x83\x10\xd7\
-\x00\x26\x1a\xa3\x37\xaf\xb8\x9f\x4d\xcd\x49\xb2\xde\x1e\x82\x6f\
-\xe1\xd7\xae\xe1\xc5\x67\x9e\xcd\xbf\xbf\xf2\x4f\x99\x0f\xd4\x88\
-\x29\xd2\x66\x6e\x59\x53\x34\x78\xd7\x67\x3e\xc6\xaa\xc9\x31\xdc\
-\x40\x1f\x45\xb3\x85\x09\x06\x1b\x0c\x04\x4b\x90\x94\x60\x13\x1f\
-\x23\xca\x69\xe4\x54\x0d\x2a\x36\x26\xa7\xc5\x24\xf8\xf8\x8e\x56\
-\x01\x02\x21\x7e\x46\xa4\x1c\x4c\xe6\x86\x7a\xd4\x0a\x2d\x0b\x05\
-\x42\x96\xf7\x72\xdf\xe4\x18\xff\xf1\x3f\x5f\x62\x04\xc8\x32\x8b\
-\xfa\x2e\x0b\x96\x6e\x4a\xb1\xc7\x67\x0e\x77\xac\x68\xa4\x56\xf6\
-\x12\xfd\xee\x52\x95\x49\xe0\x93\x3f\xbb\x84\x6b\xef\xba\x83\xa1\
-\xc1\x39\x68\x08\x1d\x33\xbd\xfb\x9b\x3e\x41\x52\xe0\x29\x6d\x20\
-\x14\x05\x12\x94\xde\x9e\x3e\xa6\x34\xf0\xfe\xaf\xfe\x17\xaf\x7d\
-\xff\xbb\xb8\xf2\x91\x07\x69\xf6\xd4\xf1\x40\x5d\x63\xef\xbf\x22\
-\x94\x84\xcc\xc4\x54\x60\x1b\xd8\xc2\x16\xb4\x66\xdd\xd2\x86\xad\
-\xa6\x07\x22\xf8\x94\x5a\x32\xd6\xd0\x6a\x16\x1c\x37\xbc\x90\x0f\
-\xfc\xf5\xbf\x70\xec\xe0\x42\xd8\x34\x86\x68\x81\xf4\x5b\x7c\x28\
-\x10\x6f\x31\x5e\x52\x04\x39\x71\x27\xa6\x13\x3f\x12\x8c\xcc\x54\
-\x78\x4f\xac\x78\x81\xd2\x74\x31\x61\x27\x6b\x20\x5a\x06\x01\x17\
-\x22\x81\x6f\xe9\x0b\x42\x2e\x38\x14\xc6\xa6\x38\xff\xb8\x93\xb8\
-\xe8\x84\x53\x63\x91\x0d\x42\x50\x30\xc6\xb2\xc1\x97\xdc\x78\xef\
-\x5d\x0c\xd6\xea\xd4\x56\xae\x67\xbf\xcd\x25\x6f\x7a\xc9\x2b\x78\
-\xdf\x5f\xfe\x35\x0b\xf2\x0c\x53\x94\x58\x1c\x25\x96\x49\x0c\x1f\
-\xfc\xfa\x7f\xb3\x74\xc5\x43\x64\xfd\x03\x94\x65\x00\x63\x13\xa9\
-\x6c\x24\x9a\xf1\xa6\x2b\xa0\xbc\x0b\x4a\xac\x75\x09\xd4\x7a\x07\
-\xf9\xd1\xd5\xd7\xf0\xdf\x57\xfd\x32\xce\x6b\xf0\xa8\x28\xa5\x89\
-\x16\x6d\x44\x4c\x3c\x1e\x4a\xea\xf1\x50\x00\x12\xf3\x99\xaa\x4a\
-\x08\x1e\x67\x2d\x57\xad\x7e\x88\x8f\xff\xf4\x7b\xc8\xdc\x21\x9a\
-\x8d\x02\xaf\x02\xb5\xec\x09\x18\xe2\x47\xf9\xd6\xb9\x03\x63\xd0\
-\x22\x50\x6a\xa0\xa8\x67\xe8\x82\xb9\xfc\xf4\xce\x25\xfc\xf1\x5b\
-\xfe\x85\x4f\x5c\xfa\x23\x9a\xd6\xa0\x3e\x44\xe6\x20\x63\x68\x86\
-\xd8\x12\xaa\x6c\xe3\xf7\x99\x49\x2f\xff\x58\x43\x93\x6a\x1b\xe2\
-\x23\x77\x19\xd2\x28\x39\x65\xce\x3c\x3e\xfe\x77\x6f\xe2\x90\x5a\
-\x3f\xa6\xd9\x8c\x14\xe7\x36\x9a\xf7\x46\x4d\x7a\x58\x4c\x88\x04\
-\x96\x95\x4c\xcb\x98\xec\x04\xa9\x3a\x2b\xb7\x87\x55\xc1\xfa\x0e\
-\x94\xb9\x8d\x01\xc9\xa0\x34\x25\xa6\xd5\xa4\xb7\x59\xf2\x82\x73\
-\x9e\xc2\x10\xa0\x21\xa4\x28\x77\x1c\xbc\x56\xb3\xc5\xfa\x35\x6b\
-\xa8\x6f\x9e\xe2\xf7\x4f\x38\x93\x2f\xfc\xe3\x9b\xf9\xfb\xdf\x7b\
-\x21\xfd\x0a\x59\x19\xa8\x89\xa1\x2c\x3c\xce\xe6\xfc\x64\xd9\x52\
-\xbe\x7a\xd9\xcf\xf1\x83\x03\x94\x99\x4d\xee\x72\xd4\xce\x41\x22\
-\x69\x87\xca\x2c\x27\x66\x27\x8a\xa2\x88\xe4\xb4\xfa\x06\xf8\xd0\
-\xf7\xbe\xc9\x4d\x23\xeb\xc9\x6b\x8e\x32\x94\x94\x04\x7c\x8a\xa6\
-\x3d\x5e\xd3\xfc\x5b\xa5\x01\xb7\x86\x94\x12\x09\x29\x1a\x1e\x69\
-\xb5\x36\x19\xe1\x5f\xbf\xf0\x71\x6e\x5e\xf3\x08\xd2\xd3\x8b\x60\
-\x09\xd6\x26\x93\xe8\x89\x18\xe2\xad\xdd\x78\x80\xe0\x11\xb1\x88\
-\x24\x1f\xcd\x46\x22\x4a\x53\xab\x51\x00\x57\xdd\x70\x03\xfb\xec\
-\xb3\x0f\xa7\x1f\x7c\x28\x63\x8d\x29\x72\x97\xc5\xb8\x46\xbb\xb6\
-\x21\xb2\x08\xb7\xd7\xd8\x2c\xb3\x76\x15\xc9\x48\xfc\x7c\x83\x13\
-\x4b\x28\x4a\xf6\x9b\x33\xc4\xe1\x47\x1e\xc5\x2f\xae\xfe\x35\x13\
-\xa1\xc0\x25\x8a\x6a\xad\x02\x83\x54\x10\xa7\xae\x3a\x81\x76\x79\
-\xf4\x4e\xd2\x02\x5d\x96\x50\x77\x0d\x43\x64\x43\xd6\x76\x16\x27\
-\x88\x27\xcf\x1d\x3a\xb2\x99\x67\x1e\x73\x22\x7f\xf7\xe2\x97\xd1\
-\x2f\x42\xde\xdd\x5c\xd5\x2b\x59\x9e\x33\x38\x3c\x8f\x17\x9c\x77\
-\x21\xaf\x7b\xe1\xef\x73\xf8\xdc\x79\x94\xa1\x49\x6e\x05\xa7\x8a\
-\x06\xc5\xe4\x19\xcb\x27\xc7\xf9\xeb\x8f\x7d\x90\x87\x9a\x93\x48\
-\x6f\x0f\xad\xc8\xe3\xd4\x45\xb0\x5f\x95\x5a\xee\xda\xe9\xd4\x88\
-\x93\x31\x94\xc1\xa0\x59\xce\xc6\xb1\x11\xfc\xc4\x38\xcf\x38\xf9\
-\x0c\x9c\x10\x2b\x47\x23\x5d\x69\xbb\xce\x6d\x47\xcb\x6f\x65\x01\
-\x6c\x0d\xa4\x10\x34\x06\xfd\x8c\x46\x1f\xf9\xbb\xd7\x5d\xc1\xcf\
-\x6f\xb9\x09\x3b\x30\x48\xd3\x2b\x2d\x13\x69\xb4\xb6\x87\xdb\x7d\
-\x47\x8b\x95\x48\x3d\x1d\xe9\x9d\x52\x85\x97\x18\x42\xa9\x14\x0a\
-\x45\xbd\xc6\xe4\x9c\x3e\xde\xfe\xa5\xcf\xf0\xcd\x65\x37\x23\x3d\
-\x7d\x14\x2d\xdf\xce\x4e\x58\x94\x12\xa5\x60\xfb\x31\xfb\x46\x35\
-\x4e\xa4\x73\x04\x13\xc0\x04\x72\x31\xb8\x66\xc9\xc5\x87\x1e\xc9\
-\x07\xff\xea\x9f\xd8\xbf\xb4\x64\x93\x53\x88\x28\x41\x7c\xdc\x4c\
-\x36\xfa\xaa\x26\xe5\x94\x4d\xdb\xee\xde\xc9\xa2\x1d\xb3\x5f\x14\
-\xbc\x01\x6f\x95\x60\x62\xb3\x15\x2f\x1e\x31\x8a\x34\xa6\xd8\xaf\
-\xde\xc3\x5f\xff\xfe\xcb\x58\x60\x0c\xb6\x08\xd1\xff\x0f\x21\x2a\
-\x36\x23\xd4\x04\x5e\x72\xfa\x99\xbc\xf8\xf4\xd3\xe9\x2d\x3c\xde\
-\x37\x70\x06\x14\x1f\xad\x34\x6b\xd9\x00\xbc\xe5\xb3\x9f\x62\xe9\
-\x9a\x55\x30\x30\x40\x53\x52\x95\x66\x52\x02\x95\x22\x9a\x91\x0f\
-\xde\x25\x45\x55\x53\x63\x51\x0b\xb6\x86\xe4\x3d\x7c\xf7\x8a\xcb\
-\xf8\xe9\xed\x37\xe3\xc4\x62\x7c\x64\xb8\x2a\x49\xa9\xab\xc7\x61\
-\xcf\xfc\xd6\x2e\xc0\x4c\x25\x10\x52\x4a\x45\x30\xdc\x37\x32\xc2\
-\xc7\xfe\xe7\x1b\xf8\x5a\x3d\x3a\x8b\x62\x53\x60\x53\xc8\x02\xec\
-\xac\x05\x6c\x4b\x25\x6f\x03\xee\x52\x02\xbf\x54\x2c\x0e\xeb\x85\
-\x22\x40\x51\xcb\x58\x69\x4a\xfe\xf6\x53\x1f\xe4\x96\x4d\x6b\xa8\
-\xd5\x32\x7c\xa1\x29\x4a\xdb\xe9\xea\x32\x6b\x98\x72\x7b\xbc\x62\
-\x64\xaf\x04\x4a\x11\xbc\x55\x70\x91\x0c\x23\x4c\xb5\x78\xce\x91\
-\xc7\xf3\xd1\xbf\xfc\x07\xe6\x79\x30\xad\x06\x4e\xaa\x96\x12\xb1\
-\x87\x4c\x48\xd6\xd5\xb4\x96\x63\x3b\x4b\xd2\x46\x6b\x73\x28\x4a\
-\x0c\x72\x46\xc6\xd6\x98\xc5\xb0\xce\x52\xf3\x8a\x6c\xdc\xc4\xdf\
-\xbd\xf4\x8f\x39\xff\xa0\x43\xd0\x56\x11\xeb\x42\x44\xa3\x32\x26\
-\x9d\x86\x01\x5c\x4b\x09\xad\x40\x66\x84\xdc\x98\x14\x47\x17\x70\
-\x39\xa3\x56\x78\xe3\x7f\x7f\x96\xaf\x2f\xb9\x0e\x99\x3b\x48\xe1\
-\x35\x06\xcc\xd4\xc4\xd6\xef\x5e\xdb\x56\x88\x51\x90\x5d\x39\x00\
-\xd0\x35\x88\x46\x04\x69\x95\xe4\x79\x2f\xe3\xd6\xf2\xb1\xef\x7c\
-\x83\x95\xcd\x29\x08\x51\xa9\x79\xa2\xf5\xf3\x78\x28\xb3\x1d\x1e\
-\x03\x50\x25\xa6\x59\x2c\x7c\xf9\x57\x97\xb2\x64\xd5\xc3\xb8\xbe\
-\x01\x48\xc1\x2c\x44\x11\xf5\x91\x59\xe5\x89\x18\xdf\xad\x48\x3b\
-\xa3\xd6\xfd\x1a\xa9\x4b\x50\x42\xf4\xa8\x2a\xa6\xaf\xce\xc3\x65\
-\xc1\x3f\x7d\xf4\x83\xac\x28\x0b\x6c\x6f\xca\xe7\x63\x12\x11\x8c\
-\x56\xd9\x9e\xd9\xcd\x4d\xa2\x03\x92\x94\x34\xac\x6a\x14\x42\x3a\
-\xb2\x7a\x73\x87\x34\x5a\x3c\xfb\xa8\x13\x78\xdf\x5f\xff\x03\x73\
-\x0a\x4f\xbd\xd9\x22\xab\x88\x29\x9c\x9d\x4e\x23\xbf\xd3\x4b\x06\
-\x13\x8f\x62\xbb\x7c\x39\x06\x80\xa3\x8b\x55\x62\xd5\xd2\xab\x16\
-\x5d\xbb\x91\x57\x3f\xfb\xf7\x78\xd9\xb9\x17\x12\x4a\x4f\x66\x0d\
-\x24\x45\x21\x68\x3b\x1f\x1f\x04\x9c\x13\x4c\x16\x95\x87\x41\xc8\
-\x83\x23\x94\xc2\x38\xf0\xc6\x4f\x7e\x84\x4f\xff\xe2\x87\xe8\x3e\
-\x43\xb1\x63\x50\x65\x7d\x68\xc0\x6a\x68\x2b\x15\x4d\x26\xb3\xd1\
-\x5d\xf9\xfc\xaf\x24\x92\x89\x9a\x10\x08\xde\x63\x06\xfa\xb9\xec\
-\xce\x3b\xf8\xf6\x55\x57\xe0\x32\x47\xe9\x93\x02\x6c\xbb\x34\x3b\
-\x7a\x06\x77\xf4\xd7\xf1\x0a\xd6\x71\xf9\xaa\x15\x7c\xee\x17\x3f\
-\xc2\xcc\x9d\x4b\xb3\xd4\x98\xe6\xab\x4a\x60\xc5\xa7\xc5\xb2\x73\
-\xa4\x34\x42\xab\xbb\xa5\xb3\x8f\x38\x91\x2a\xb2\x9e\x7a\x0d\x11\
-\x4a\xc5\xf5\x0f\x71\xdd\xfd\x0f\xf0\xf7\x1f\xfd\x10\xab\x34\xd0\
-\xaa\x45\xd4\x5e\x0d\xa5\x96\xb6\xf2\xac\xbf\x47\x57\xe6\x20\x03\
-\x5c\x52\x24\x4a\xac\x00\xf4\xa1\xa4\x27\xb3\xb4\xa6\x9a\x3c\xef\
-\xe8\x13\xf9\xcc\x3f\xbf\x95\x7d\xc4\x90\x4d\x4e\x52\x47\xd0\x56\
-\xab\x3d\x61\x49\x97\xec\x64\x99\xe9\x63\x27\xd4\xa3\xb3\xd8\x20\
-\xf4\x16\x4a\xf3\xa1\x35\xfc\xe1\x79\x4f\xe7\x4d\x2f\x7d\x15\xfd\
-\x90\xb8\xf7\x94\x42\x3c\xed\xba\xbb\xa0\x6d\x05\x80\x89\xbe\x6f\
-\x90\x88\x26\x29\x83\xc1\xb8\x8c\x0f\x7c\xf3\x6b\x7c\xf9\xd7\x3f\
-\xc7\xce\x1b\xa6\x6a\xcf\x1c\x4b\x46\xb4\x4d\xf9\x1d\x4c\xa0\x34\
-\x81\x60\x34\xe5\xfa\xcd\xae\x30\x48\x8f\x3d\x86\xbe\x40\xb3\xc8\
-\x23\xd1\x54\x60\xce\x1c\x3e\xf5\x83\x4b\xb8\x63\x74\x14\xe3\x2c\
-\x56\x25\x8e\x89\x99\x25\x17\xfa\x76\xc8\x0e\x55\x00\x0a\x38\x1c\
-\x2d\xe0\xa3\x3f\xfc\x1f\x1e\x6a\x8e\x11\xb2\x8c\x10\x12\xd8\x83\
-\xd8\x82\x39\x10\x27\x6a\x67\xb9\x00\xde\x42\x99\x25\x57\xc4\xc7\
-\x2e\xb4\x95\xff\x5a\x5a\x45\x4d\x40\x82\xc7\x90\x11\x5a\x86\x6c\
-\x68\x0e\xdf\xb9\xe9\x1a\xde\xf4\xc5\x4f\x32\x59\x05\xdd\x5a\x01\
-\x29\x03\x92\xfa\x02\x6e\xef\x88\x47\x6a\xf3\xf8\x20\xa4\x76\xd4\
-\xce\x50\xaa\x92\xd7\x32\xb2\xa2\xe0\xa2\x83\x0f\xe7\x63\x6f\x7c\
-\x3b\x07\xcd\x99\x47\x63\x74\x33\xf5\x2c\x43\x54\x93\xc2\xe8\x8e\
-\x40\xee\x3c\xd1\xee\x20\xa4\x2a\x58\x8b\xb4\x4a\xea\x6a\x31\x9b\
-\x26\x79\xc9\x79\x17\xf1\xf6\x57\xbd\x86\x61\x85\xac\xe1\xb1\x3e\
-\x50\x68\x41\x2b\xc5\x51\x62\x6e\x5c\xba\x98\x77\x62\x82\xb8\xc0\
-\xd0\xd4\xe8\x4a\x5c\xf6\xc0\xfd\x7c\xf6\xd2\x1f\xc3\xc2\x79\x18\
-\x71\x98\xb1\x12\x13\x12\xc7\x44\xa2\x1b\x0b\xe2\xe9\xb4\x00\x54\
-\xba\x70\x34\xbb\xbc\x38\x81\xe0\x1b\x84\x4c\xa2\x52\xac\xd5\xb8\
-\x7b\xd3\x06\xbe\xf8\xa3\x1f\xa6\xf6\x79\xca\x94\x94\xb4\xcc\x4e\
-\x76\x01\xba\x49\x3e\xaa\x27\xaa\x8a\x97\x0a\xb5\x17\xfd\xd9\x5f\
-\xdd\x75\x37\x3f\xb9\xfe\x3a\xcc\x40\x7f\xac\xe6\xcb\xab\xf2\x58\
-\x12\xf1\x45\x05\xf2\xd9\xd9\xda\xb9\xeb\x48\x96\xb8\xf1\xab\xa8\
-\xba\xa8\x40\x19\xd0\x00\x85\x35\xd8\x45\xf3\xf8\xf2\xd5\x97\xf1\
-\xde\x1f\xfd\x0f\x13\x46\xf0\x41\xa0\x19\x52\x00\x2a\x76\x94\xaf\
-\xfe\xab\x2c\x88\x6e\x4c\x6f\x35\x76\xdd\x1f\x5b\x1d\xe3\x46\x2a\
-\x32\x72\xd3\x46\x0c\xe6\x08\x59\x51\xf2\x94\x7d\x17\xf3\xf9\x7f\
-\x79\x3b\xe7\x1c\x78\x30\xc5\xa6\x8d\xa8\xf3\x94\x35\x25\xa8\xc7\
-\xaa\x8b\x10\xa4\x0e\xaf\xd4\x8c\x2a\x4c\x9d\xf9\xc9\x54\x08\x25\
-\xe9\x7a\x74\x3f\x37\x09\x3a\x1d\xcd\x6a\x8f\x55\x8d\x8f\x98\xdf\
-\x4d\x97\x90\x54\xe2\x6b\x31\xde\xb4\x91\x9b\x6a\x05\xab\x81\xdc\
-\x07\xcc\xc8\x08\x2f\x7f\xfa\x33\x78\xe7\x6b\x5f\xc7\xa2\x3c\x43\
-\x8a\x12\xe7\x22\x98\x2a\xb3\x19\x26\x91\x67\x76\x1c\x76\x80\x80\
-\xaa\x6f\x6f\xec\x60\x0c\xab\x43\xe0\xdd\x5f\xfe\x02\xab\xa4\xa0\
-\xac\x65\xf8\x46\x41\x1e\x62\x20\x59\x13\xf2\x33\x74\xa7\x65\xab\
-\xc1\x9e\x81\x9c\xdc\x95\xa5\x0c\x1e\xb1\x06\x5b\x06\x32\x71\x14\
-\x6a\x28\x87\x07\xf9\xaf\x2b\x7e\xce\x75\x2b\x56\xc4\x71\x0d\x36\
-\x95\x0d\xfb\xb4\xca\xba\xf6\xa1\x76\x9e\x54\xf6\xeb\x6c\x65\xbb\
-\x14\x40\xd5\xd2\x3b\x54\x4f\x42\x5c\xb6\x25\x4a\x0b\xc5\xfb\xc0\
-\x3a\xe0\xff\xfd\xf4\x27\x4c\x96\x60\x6c\x86\x1a\x0f\xb4\x40\x3d\
-\x36\xf8\xb4\xe5\xdb\x5d\x32\x76\x8e\x54\xca\x4b\x02\x85\x55\x0a\
-\x9b\x00\x35\x6d\xf8\xb0\x21\x88\x25\x58\x13\xe3\x4b\x3e\xd0\x54\
-\xa1\x1c\x1a\xe2\x03\x97\xfc\x0f\x9f\xbd\xf6\x4a\xa4\x1e\xab\x07\
-\x83\xc6\x36\x62\x71\x62\xe2\x43\x49\xc8\x33\xed\x28\x81\x76\x77\
-\xd8\xee\x91\x37\x80\x31\x88\xb1\x38\xe3\x70\x62\xc8\xad\x8b\x6e\
-\x81\x33\x58\x01\x57\x78\x4e\x1f\x1a\xe6\x4b\xff\xf8\x16\x9e\x7f\
-\xfa\xe9\x94\xe3\x23\x28\x05\x59\x4f\x1d\x0a\xc1\xb4\x52\x77\xe3\
-\x00\x06\x4b\xcd\xe5\x48\xe9\xe3\x09\xa9\xdd\x10\xe2\x44\xc9\x9a\
-\x7a\xe2\x75\x2b\x00\xab\x31\xbb\x60\x2a\x85\x90\xda\xb5\xc4\xfe\
-\x0b\xb1\xbd\xb9\xf8\x40\x6e\x33\x8c\xb8\xa8\x64\x52\xd7\xdd\x0c\
-\x17\x5b\xab\xe5\x39\xce\x1a\xfc\xe6\x71\xe6\x86\xc0\x1b\xff\xe8\
-\x8f\x79\xc7\x2b\xfe\x37\x8b\x04\xb2\xe0\x71\xb9\x8b\x95\x27\xc6\
-\x62\x83\xa1\x57\x6a\x64\xd8\x84\x91\x8f\xb1\x03\x13\x47\x0e\x4a\
-\x45\x5b\x9e\x0c\xf8\xf4\x25\xdf\xe5\xaa\x7b\xef\x80\xc1\x3e\x4a\
-\x02\xea\x6c\x3c\x70\x4c\x57\x37\x69\x93\xcc\xfd\x6a\x5d\x56\x05\
-\x15\xbb\xc5\xf9\x1f\xc9\x66\x35\x28\xb5\xd2\xe0\x9a\x44\x5a\xfa\
-\xdc\xb2\xba\x98\xe0\x33\xbf\xfa\x29\x13\x40\x1e\x84\xcc\x07\x02\
-\x3e\xfd\xd7\xb5\xd1\xa7\x29\x80\xf8\x9e\xd9\xca\xec\x15\x40\x15\
-\x5d\x9d\xf6\x97\x1a\x49\x1a\x10\x0a\x1f\xb0\x99\xe3\x8a\x65\x77\
-\x70\xe5\x2d\x37\x52\xef\x8f\x3c\x6e\x24\xf8\xac\x74\x57\xbb\xed\
-\xec\x83\x7f\x56\x52\x05\x92\x92\x55\x10\x22\xb8\x49\xac\xe3\x03\
-\x9f\xfd\x24\x3f\xbe\xeb\x2e\x8a\x1e\x87\x37\xed\xb3\x3b\x3d\xaa\
-\xda\x03\xa6\xb9\xc7\xdb\xdb\x05\x36\x08\x04\x67\x90\xcc\xd2\x6a\
-\xb6\xd8\x3f\xaf\xf3\xf1\xbf\xf8\x07\xde\xf2\xbc\x97\xb1\x60\x63\
-\x0b\xbf\x7e\x03\xb6\x0e\xea\x94\xbc\x54\x6a\x01\x4c\x51\xe0\x1b\
-\x8d\x54\x96\x14\x71\x18\x68\x7a\x24\xeb\xa2\x4d\x3a\x62\xe3\x23\
-\x24\xe6\xe4\xf6\xc3\xc4\xd4\xa8\xb7\x42\x69\x4d\xe2\xbd\x8f\x13\
-\x17\x5a\x2d\xb2\xd2\x53\xf7\x50\x2b\x15\x31\x4a\x91\x95\x38\xa7\
-\xc8\xd8\x66\xdc\xba\x11\xce\xdb\xef\x50\x3e\xf3\x77\x6f\xe5\x2f\
-\x2f\xfa\x1d\x06\x82\x52\xf7\xe0\xb4\x8b\xf3\x6e\x46\xf4\xb5\x5a\
-\x53\xd1\xd2\x48\xc5\x61\x26\x36\x88\xf9\xf9\x9d\x77\xf0\x5f\xdf\
-\xfb\x16\xa6\xbf\x37\xb2\xf2\xb6\x23\xa0\x5d\xe5\xdd\x3b\x7b\x99\
-\xec\x08\x49\xb5\x22\xde\xc4\x07\x68\x4c\xa5\xf7\xf5\xf1\xe3\x2b\
-\x7f\xcd\xf5\x0f\x3d\x80\xc9\x22\x23\x72\xd5\xeb\x74\x8b\xf5\xd4\
-\xe5\x8a\x6d\xcf\x3a\xdb\x2e\x0b\xc0\x28\x9d\xa0\x55\x0a\xb3\xaa\
-\x0f\x31\x7a\x6e\x0c\xab\x43\xc9\x67\x2f\xf9\x36\x93\x56\x29\xb4\
-\xa4\x52\x10\x84\x4e\x51\x46\xbb\x3e\x67\x77\x92\x04\x56\xd1\xd2\
-\x93\xd7\x72\x46\x43\xc1\x9b\x3f\xf5\x21\x6e\x1f\xdd\x44\xcb\xc6\
-\x40\x53\x85\xd2\x13\xed\x50\x7b\xb5\x4d\xf3\x64\xe9\x76\x28\x1f\
-\x66\x31\xd6\x91\x2f\x88\x66\x28\xc8\x6a\xd1\x84\x5e\x58\xc2\xdb\
-\x7f\xe7\x45\x7c\xee\xf5\x7f\xcf\xc9\x83\xf3\x28\x46\xd6\xa3\xda\
-\x8c\xad\xac\xc5\x13\x1c\x94\x2e\x56\x9d\x85\x54\x79\x96\x79\xa1\
-\x56\x46\x52\xd3\x38\x81\x01\x6c\x40\xd3\x03\xd3\xf9\x59\x6d\x88\
-\x6e\x90\x46\x1c\x3b\x1a\xb1\xf2\xde\x08\x3e\x83\x90\x1b\xbc\x78\
-\xbc\x96\xd8\x4c\x30\xb6\x44\x8b\x31\xca\x0d\xeb\x38\xac\xde\xc7\
-\xdb\x5f\xf6\x27\xfc\xf7\xbf\xbc\x9d\x67\x1c\x74\x18\xb5\x22\xc4\
-\x26\x9f\x98\x54\x0e\x9d\xcc\xae\x69\xab\x37\x65\x11\x42\x45\xe4\
-\x1a\x95\x55\x43\x0c\x0f\xb5\x1a\xfc\xc7\x97\x3e\xcb\x7a\x29\x09\
-\xf5\x3c\x16\x8b\x85\xaa\x7c\x6f\xbb\xa2\x2e\xbb\x85\x04\x88\xf5\
-\x01\x55\xfb\xb8\xc2\x93\xe5\x19\x1b\xcb\x06\x5f\xfe\xf1\xf7\x19\
-\x05\xb0\x2e\xb6\x4f\x4f\xdc\x8a\x40\xbb\x05\x79\xf7\x41\xb3\x3d\
-\x9b\x7a\xbb\x2c\x80\x36\xc0\x8a\x48\x95\xe9\x89\x27\xa2\x6f\x7a\
-\x7a\xc5\x70\xe9\x6d\x37\x70\xe5\x3d\x4b\x09\x3d\x19\x65\x66\x13\
-\xc0\xc3\x45\xc2\x0c\xed\xb8\xbe\xbb\x38\x3e\x63\xfa\x97\x4e\x11\
-\x66\x44\xb0\xd6\xd1\x2a\x4b\x64\xee\x20\x4b\x47\xd7\xf0\xae\xaf\
-\x7c\x96\x29\x88\x6c\xc0\x69\xf1\x4a\x57\xf5\x61\xe4\x35\x9c\xe1\
-\xab\xcd\x52\xa4\x0c\xb8\x10\xd1\x86\x2d\x0d\x18\x23\xe0\x3d\x61\
-\xbc\xe4\x79\x27\x9f\xcc\x97\xdf\xfe\x6e\xfe\xec\x69\xcf\xa2\xb7\
-\x28\x68\x4d\x8d\x43\xdd\x20\xb9\x40\xa6\xa8\xf1\x9d\xae\x49\xc9\
-\x0a\xb0\x41\x30\x3e\x15\xa4\x75\x3d\xac\x97\x69\x0f\xe3\xa3\xbf\
-\x69\x43\xd7\xd2\x30\x44\x02\x4f\x07\xd8\x80\xc9\x84\x89\xf1\x51\
-\xca\xb5\x6b\x38\xba\xd6\xcb\xdf\xfc\xee\x0b\xf8\xca\x5b\xde\xc9\
-\x5f\x3f\xe3\xd9\xec\x6f\x32\x6c\xd3\x47\xee\x43\xc0\xdb\x90\xe8\
-\xc0\xe3\x97\x0f\xed\x47\x57\xe6\xa0\xaa\xc5\x57\xa1\xd0\x78\xdf\
-\xef\xfb\xca\x17\xb9\x71\xd5\x83\x94\xc3\x03\x34\x48\x8d\x21\xbb\
-\x90\x86\xbb\xdd\x21\xf2\x28\x52\x85\x9e\xd4\x26\xa2\x54\x40\x8c\
-\xa3\x59\x96\x68\x5f\x0f\x3f\xb9\xf5\x7a\x6e\x7c\xf0\xfe\x78\x08\
-\x85\xca\x8d\xeb\x6c\xa1\xaa\xfc\xbe\xb3\xbc\x66\x3f\x38\xb3\x87\
-\x02\x6b\xe7\xdf\x20\x31\x56\x6b\x25\x9d\x7a\x46\x58\x67\xe1\xdd\
-\xdf\xfc\x12\xb7\x6f\x58\x0d\x7d\x7d\x31\x40\xe3\x4b\x20\x06\xb9\
-\xaa\xb2\x55\xed\x6e\x84\xb1\x8b\xdb\x6f\x52\x7d\x61\x0b\x88\x21\
-\x4b\x0b\xb0\x41\x89\xf4\xf7\x70\xcf\x7d\xf7\xb2\xcf\x9c\x79\x9c\
-\x71\xd0\xa1\x54\x2d\xbf\x24\xa5\x3b\x55\x4c\x17\x84\xb7\xab\xa8\
-\xaf\x73\xe1\x47\x97\xd4\xbf\x5c\x6c\xea\x52\x6c\x88\x0d\x45\x9c\
-\x21\x14\x81\xe1\x9e\x1a\x4f\x3b\xfe\x54\x8e\x3f\xf6\x58\x36\x6e\
-\xda\xc4\xc3\xf7\x2c\x8f\xc5\x4d\x0a\x2e\xcf\x22\x43\x91\x49\x9c\
-\x88\x26\x5a\x6c\x46\xe9\xf8\xfb\x21\x02\x6f\x6c\x9b\xa9\x57\xb0\
-\x18\xac\x98\xc8\x51\x68\x14\x63\x25\xd2\x67\x85\x12\x29\x4a\x74\
-\xd3\xe6\xc8\xdf\xef\xe1\x9c\x63\x8e\xe3\x35\xcf\xfa\x5d\xde\xf8\
-\x92\x57\xf0\x87\x27\x9f\xcd\xa2\x5a\x1d\x8a\x12\x87\x44\x7c\x84\
-\x13\x4a\x07\xad\x54\x32\x68\x93\x5b\x14\x17\x6a\x0a\x7a\xaa\x52\
-\x15\xc9\x89\x40\xa1\x8a\x3a\xc3\x37\xaf\xbf\x86\xff\xfb\xed\xaf\
-\x32\x39\x50\xa7\x95\x19\x30\x16\xbc\xa4\x8d\x12\xbf\xd3\x2e\xbe\
-\x74\xb6\x6b\x8d\x19\x8d\xbd\x2f\xa8\x52\xd3\x21\xa5\x97\x45\x31\
-\xf5\x8c\xcd\x23\xa3\xe4\xc6\xf1\xb4\x93\x4e\x25\x53\x45\xc4\x74\
-\xb6\xa3\x48\x3b\xc4\x2b\x15\x68\xaa\x62\xa7\x99\xcd\xe7\xeb\x6c\
-\xa9\x4f\xbb\x56\x73\x10\xa5\x20\xf9\x6c\x85\x62\x73\xcb\x77\x97\
-\x2d\xe5\x7f\x7f\xf8\x3f\x18\xed\xcd\x09\x26\xeb\x6c\x08\xa5\x6d\
-\xe6\x69\xf2\x73\x76\x47\xce\x3b\x21\xc2\x80\x55\x94\xd2\x29\xe2\
-\x14\x33\x3e\xc5\x89\xf5\xf9\x7c\xf9\xad\xef\xe2\xb0\xbe\x3e\xa4\
-\x28\x70\x26\x06\x37\xd5\x44\x3a\x30\x45\xe2\xc1\x59\xad\xfe\xd9\
-\x06\x03\x52\x03\x01\x35\x50\x4a\x15\x24\x03\x9b\xcc\xe6\x50\xf1\
-\x1d\x1a\xc3\x7a\xe0\x9a\xa5\x4b\xb8\xe4\xca\xcb\xb9\xfa\xae\xa5\
-\xdc\x3f\xba\x91\x49\x51\xe8\xeb\x69\xf7\x2a\x30\x2e\xc3\x6a\x8c\
-\xe4\x4b\x4a\x27\x85\x44\x76\x0a\x09\x96\x1a\x02\xc1\x07\xd4\x17\
-\x10\x02\x94\x05\x46\x60\x20\xaf\x33\xbf\xd6\xc3\xc9\x87\x1c\xc1\
-\xd9\x47\x1d\xc7\x99\x47\x1e\xcd\xb1\x07\x1d\xcc\x70\xfa\x3a\xa5\
-\x2f\xdb\x2d\xaf\x2a\x7f\x36\x48\x04\x39\x79\x12\xe6\x21\xa5\xfa\
-\xca\xaa\x65\xaa\x46\x85\x44\x4a\xa4\x78\x51\xb0\x86\x9b\xd6\xac\
-\xe5\xcf\xff\xe3\x1d\xdc\x57\x8e\x31\x35\xa7\x87\x90\x5c\x48\x54\
-\xb0\x9e\x76\x7a\x6f\x4f\x11\x81\x08\x02\x32\x12\xe9\xcf\xd3\x26\
-\x31\x1a\x08\x26\x20\x36\xe0\x1a\x05\xfb\x92\xf3\xa5\x37\xbe\x8d\
-\x73\xf7\xd9\x0f\xef\x43\x64\x12\x4e\xe5\xf4\x5e\x62\x7e\xc0\x42\
-\x9b\x5e\x9e\x59\xb2\x09\x6d\x1f\x23\x50\x97\x9f\x51\x35\x53\x2c\
-\x1d\x6c\x06\xbe\xfe\xab\x9f\x33\x52\x14\xe0\x7a\xa1\xaa\x67\xee\
-\xca\xc2\xec\x9e\x1b\x5f\xdb\xb8\x5f\x93\x4c\xe2\x00\xb1\x8a\xd0\
-\x7b\x6c\x4f\x1f\x77\xae\x59\xc3\x17\x7f\xf2\x23\xfe\xbf\x17\xfd\
-\x3e\xc6\xa4\xf6\xe2\x74\x48\x27\xab\xbf\xd9\xde\x9c\x87\x37\x51\
-\x79\x58\x55\x32\xad\x78\x0d\x12\xdb\x91\x48\x34\x4a\x02\x84\x66\
-\x60\x21\xf0\x7b\xc7\x9f\xc8\xb3\x8e\x3f\x91\x3b\xd7\xad\xe5\xb2\
-\x5b\x6f\xe6\xd6\x07\xef\xe3\x8e\x87\x1e\x60\xed\xe8\x08\xcd\x56\
-\xc9\xc4\xf8\x04\xde\x1a\xca\xc4\xaf\x5f\xb1\x0f\x05\x1f\x2b\x36\
-\xf3\x2c\x27\xcb\x73\xb2\x9a\x65\x9f\x7c\x98\x03\x17\x2c\x64\xdf\
-\x05\x0b\x38\x60\xe1\x42\x8e\x39\xec\x70\x0e\x5d\xb0\x0f\xfb\x0f\
-\x0c\x32\x9c\xa6\x4f\x9b\x01\x31\x01\x75\x8a\x35\x26\x75\x7f\xd2\
-\x69\x7d\x0f\x33\xed\x58\x4d\x33\xd3\x71\x26\x41\x7f\x23\x6f\x9e\
-\x52\x88\x61\x0c\x78\xff\xd7\xfe\x9b\xe5\x1b\xd7\x21\x0b\xe7\x12\
-\x9a\x1e\x71\x2e\x2e\x97\x90\x92\x5c\x55\x73\x58\xdd\xae\xf0\xd5\
-\x2e\x2b\x31\x2e\x96\x4e\xf4\x0a\xee\x2b\x81\x10\x42\xea\x4b\x00\
-\xae\xa7\x8f\x87\x56\xae\xe1\x1b\xbf\xba\x94\x93\x5f\xfa\xc7\x20\
-\x1a\xc9\x6a\x52\x4f\x09\x52\x5a\xb0\x1d\x02\xdc\x8e\x86\xa3\xdb\
-\x65\x01\x54\x7e\x97\xa4\x1c\x77\x00\x1a\x62\xf8\xd9\xf2\xbb\x78\
-\xed\x07\xde\xc5\xfa\xdc\x52\x64\x0e\x92\x69\x57\x59\x0c\x3a\xc3\
-\xe9\x97\x19\xd7\xdb\x75\x25\x06\x9c\x4c\x10\x5c\x10\x3c\x12\x1b\
-\x89\x86\x12\x12\xa7\x7b\xde\x2c\xd9\x47\x2c\x5f\x7b\xcb\x3b\x38\
-\x6a\xde\x22\x7a\x34\x72\xd8\x61\x24\x02\x8e\x88\x0a\xd3\xd1\xc9\
-\xc4\xcd\x66\x72\x8a\x34\x7c\x59\xf5\x77\x51\x0b\x51\x26\x43\xcf\
-\x12\x4d\x62\x82\x82\x4f\xfc\x0b\xce\x46\xb3\x1f\x68\x02\x6b\xc7\
-\xc7\x19\x9b\x9c\x64\x64\x62\x82\x0d\xa3\xa3\x34\x35\x50\xf8\x92\
-\xe0\x43\x67\x93\x66\x19\xce\x39\x7a\x7a\x7a\x18\x1c\x18\x60\xb0\
-\x56\x63\xb8\x5e\x67\xa0\xa7\x97\x7a\xf5\xf9\x74\x7c\x77\x29\x7d\
-\xdc\xbc\x55\x8a\x31\x15\x53\x55\x89\xa7\xee\x8c\x48\xe5\xc6\x54\
-\xb8\x5c\x15\xf0\x98\x0a\xab\x03\x5e\x09\x22\x4c\x49\x40\x8d\xe1\
-\x53\xbf\xfe\x19\x6f\xfe\xfc\xe7\xc9\x86\x87\xd8\x5c\x34\xc1\x65\
-\x11\x41\x8a\x20\x21\xc1\x7c\xf7\x30\x05\xd0\x2d\x92\x70\xe5\x2a\
-\x80\x35\x48\xac\xac\xc3\x89\x10\x8a\x16\x07\x9b\x8c\x2f\xbd\xe9\
-\x6d\x1c\x3b\x7f\x5f\xb2\x10\xa8\x07\x62\x9b\x74\x89\xe9\x53\x5b\
-\xe1\x57\x94\x59\x47\xf7\x66\x6d\x01\x44\xbf\x3f\x99\xc2\x69\xd1\
-\x05\x14\x9f\x19\x7e\x7c\xfd\x95\xac\x69\x4d\x91\x0d\xcc\x07\x5f\
-\x4c\xc3\xda\xc7\x4e\xbb\x5d\x17\xd2\x4e\xd0\xc3\xef\xea\x48\xad\
-\xf4\x25\xaa\x5e\xf0\x65\x85\xc4\x72\x39\xd2\x2a\xc8\x88\x90\xe2\
-\x15\x53\xe3\x7c\xef\xb2\x4b\x79\xe3\x8b\x5e\x8e\x0f\xda\x2e\xdf\
-\x6c\xf7\xc4\x23\xe9\xc2\x69\xed\x70\x1f\x5d\xda\x9d\x82\xda\xf7\
-\x22\xf8\xd8\x72\xa4\x5d\x16\x5c\xb9\x63\x65\xe6\x93\x2f\x19\x90\
-\x60\xd1\x00\x75\x11\x0e\xea\xe9\x47\xfa\xfb\xb7\xfb\x6b\x97\x09\
-\x47\xa0\x21\xe0\x43\xa4\x73\x8b\x0d\x39\x15\xac\x44\xfe\x7a\x9b\
-\x2a\x22\xb4\x53\xaa\x3a\x13\x18\x3c\x2d\x6f\xdc\x65\x19\x24\xcc\
-\x0f\x20\xf8\x10\x20\x33\xdc\xb9\x69\x35\x5f\xf8\xfe\xb7\x99\xea\
-\xab\xd1\x0c\x25\xae\xd6\x43\x28\x42\xec\xd4\x13\x02\x88\xb0\xf3\
-\xc0\xe3\x8f\xb3\x54\x94\x85\xc9\x99\x2f\x2c\x91\x51\x2b\x40\x8e\
-\xa3\x2c\x5a\x98\xde\x1e\x1e\x5a\xb3\x9a\x9f\xdf\x70\x35\x47\x3e\
-\xfb\x45\x64\x48\xa7\xfd\xa0\x74\x9f\xfe\xdb\xfd\xd1\xb3\x97\xe8\
-\xb2\x69\xc2\xf1\x2b\xd6\x65\xdc\xbf\x79\x23\x3f\x5f\x72\x13\xd4\
-\x6b\x04\xef\x23\xad\x7d\x57\xc0\x50\x1f\xe3\x7a\xbb\xb6\xa4\xe5\
-\x3a\x6d\x5c\x15\x8a\x82\x4c\x1c\xa5\xf7\x48\xee\x28\x32\xcb\xaf\
-\x6e\xbe\x81\x87\x26\xc7\xa2\x1f\x57\x61\x24\x54\xa7\x2f\xfa\xed\
-\xc8\x7e\x98\xa4\x28\x2b\x6d\x1e\xba\x2c\xa9\xee\xa0\xa2\x49\x4a\
-\x49\x44\x30\xc6\x20\x92\x0a\xf1\x24\xc6\x2b\x42\x08\x94\xbe\xa4\
-\x08\x81\x22\x14\x14\xbe\x45\x11\x5a\x94\xa1\xa0\xe5\x9b\xf8\xd0\
-\x22\x84\x02\x1f\x0a\x82\x16\x04\x2d\x63\x00\xcf\x04\xd4\x81\xcb\
-\x4c\x1b\x5e\x5b\x15\x4e\x62\x52\x13\x8b\x2e\x14\x5a\x5b\xe1\x75\
-\x4d\xaa\x4a\x05\x41\xe8\x84\xed\xa7\x0d\x81\x8f\xf1\x88\x02\xf8\
-\xe2\x8f\xbe\xc7\xf2\x75\xab\xb1\xfd\xbd\x68\x96\xe3\x8b\x14\x57\
-\xa8\x3a\x2d\x55\x29\x80\x3d\x58\x84\x2e\x98\x44\x88\xae\x15\x21\
-\x36\x3f\xf5\x0a\xa1\xde\xc3\x25\x57\x5f\xc5\xda\xa2\x19\x95\x7f\
-\x55\x78\x05\xed\x58\x4e\xfb\x22\xb3\x94\x59\x29\x00\x55\x8d\x69\
-\xa3\x10\xa1\x9a\xa5\x04\x4a\x6b\x68\x09\x7c\xe7\xea\xab\xb8\x77\
-\xed\x7a\x6c\x6f\x3f\x21\x80\x60\x08\x92\x1e\x26\x19\x83\x33\x5a\
-\x85\x87\x36\xe0\x61\x17\x97\xd8\xa7\x0b\x2f\x86\x96\x95\x98\xa2\
-\x89\x5f\x92\x42\xca\x98\x73\xd7\x80\xcd\x6b\xdc\xba\x7e\x3d\x37\
-\xae\x78\x20\xc2\x35\x43\x2b\x62\x23\x8d\x76\xcc\xff\xf6\xec\x6c\
-\xc7\xcc\x74\xc5\x4d\x2a\x1c\x41\xd6\x3d\x69\x06\x10\x21\x37\x39\
-\x4e\x32\x44\x1c\x22\x36\x46\xcd\x8d\xc1\x98\xa8\x14\x9c\x75\x64\
-\xc6\x90\x99\x8c\xcc\xe6\x64\x26\xc7\x99\x8c\xdc\xd6\xb0\x26\xef\
-\x10\x9b\x4a\x7c\x38\x0c\x59\x2c\x8e\x4e\xa4\x29\x26\x3a\x1d\x12\
-\x9b\xa0\x59\x2c\x56\xb2\xce\xd1\x33\x23\xa3\xc7\xd6\x9e\x26\x6d\
-\x20\x15\xcb\x8d\x44\xa4\xa4\xb5\xc2\x75\xab\x1f\xe1\xeb\xd7\x5c\
-\x83\x9f\x33\x87\xb2\x55\x10\x7c\x41\xb0\x81\xc2\x78\x0a\x29\xf1\
-\x26\x06\xc4\x3a\x3e\xe5\xee\xb0\x78\xb6\x43\x92\x2e\x2d\x0c\x14\
-\x36\x55\x54\x12\xb1\x34\x4d\xe3\x63\x13\xd5\xb2\x44\xfb\x06\xb9\
-\x79\xe5\x3a\x7e\x7e\xfd\x0d\x64\x22\x94\xbe\x89\x37\x9e\x90\x02\
-\xc3\xd1\xc5\x0c\x31\xd7\x3b\xcb\xe3\x75\xbb\x46\xd2\x26\x8c\xb9\
-\xa4\x7a\xf6\x11\x55\x7e\x7e\xed\xd5\x50\xcb\x23\x3c\x13\xda\xd1\
-\x7f\x1e\xe5\x16\x76\x1f\x90\x66\xba\x5f\xa1\xab\x58\xa5\xeb\x3b\
-\x48\x52\x8e\xce\xb1\xb9\x31\xc5\x0d\x4b\x6f\xa3\x24\x9e\xc6\xa1\
-\x6d\x12\x77\x5a\x81\x6f\xb7\x74\xed\x20\x99\xf1\xf2\x8e\x95\x69\
-\x76\xca\x56\x0c\x95\x99\xaf\xc8\x74\x33\x7f\x36\x96\x4d\x57\xda\
-\xb7\x3d\xff\x26\xc6\x3a\xbe\xff\xeb\x5f\xb2\x66\x62\x1c\xad\xd5\
-\xa6\xf9\x0f\x4a\xc5\x2a\xb4\x3b\xad\x96\xdf\x5c\xb6\xd6\x07\x63\
-\xda\xda\xb3\x96\x96\x31\xfc\xf2\xfa\x6b\x18\x23\xc2\xaf\x65\xe6\
-\x5c\xb0\xd5\x27\xdb\x94\x59\x2b\x00\x35\xb1\x03\x8b\xc3\x10\xca\
-\x40\xcd\x58\xae\xbb\xf3\x76\xee\x58\xf1\x20\xb6\xb7\x8e\x6a\x4a\
-\x29\x3d\x39\xe6\x6a\x9a\x04\x0d\x48\x4f\x8d\xa5\xf7\xdc\xc5\xa6\
-\xd0\x42\x5c\x2c\xd0\x89\x85\x19\x7b\xb8\xdd\xfa\x1b\x48\x1b\x0e\
-\x6e\x0d\x6b\x27\x27\xb9\xee\xd6\x5b\x70\x3d\xf5\xe8\xeb\xef\x95\
-\x6d\x4a\x28\x3d\xae\x9e\x73\xe3\xdd\x77\x70\xe3\x03\x77\x13\xb0\
-\x48\x30\xdd\x65\x1e\x49\x66\xbf\xe6\x66\xad\x00\x82\x42\xa0\x8c\
-\x11\x60\x0c\x4d\xe0\x7b\x97\xfd\x92\x31\x02\xc1\x59\x34\x04\x9c\
-\x48\xdb\x27\x7d\x32\x49\x2c\xe1\xcc\xb9\x7f\xf5\x2a\xc6\x27\x1b\
-\x04\x12\xcd\x18\xf0\xa4\xd4\x88\x33\xa4\xcd\x5d\xd0\x29\x58\x8c\
-\x38\x06\x0b\x0f\xad\x5f\xc7\xca\x4d\x1b\xd0\xdc\xcd\x60\x8a\xde\
-\x2b\x5b\x8a\x42\x6e\x78\x64\x6a\x33\x97\xde\x70\x7d\x44\x9a\xa6\
-\xf4\x8c\x6a\x55\x6c\xb6\x7d\x30\xc9\xed\xb0\x00\x92\x69\x5b\x7a\
-\xac\xcb\x58\xbe\x7e\x2d\xd7\xde\xb5\x8c\xd0\x5b\x4f\x94\x6c\x96\
-\xa0\xe5\xe3\x42\x5c\xb8\xeb\x8b\xa0\x79\xc6\x68\x63\x8a\x7b\x57\
-\xac\xc0\x92\xe8\xbf\x67\xda\xc6\x4f\xd2\xf5\x3d\xb3\x20\xb9\x7a\
-\x0d\xe0\x8e\xfb\x97\x33\xd2\x98\xc4\xd6\x6a\xec\xf1\x51\xbe\xdf\
-\x52\xa4\x72\x07\xfa\x7a\xb9\xf4\x96\x1b\x59\x3d\x35\x81\xb5\x76\
-\x3b\x0b\x80\xa7\xcb\x76\xc4\x00\xba\xaa\xdc\x80\xeb\xee\x5e\xc6\
-\x03\x23\x1b\xd1\x3c\x8f\xcd\x3f\x02\x6d\xb3\xf7\xc9\x27\x8a\x18\
-\xc3\x54\x51\xb2\x72\xfd\xba\xf8\x8a\x46\xbc\xfb\x74\x08\xf0\x8e\
-\x1d\x1b\x55\x6d\x3f\x66\xbe\xb6\xa3\xae\x3b\x9b\xc7\x63\x8f\x4e\
-\x57\x3d\x04\x55\x7a\x38\xae\xa5\xb5\x1b\x36\x52\x68\x20\x88\x99\
-\x35\x7a\xed\x49\x2b\x21\x10\x82\x87\x7a\xce\x7d\x6b\xd7\x72\xd3\
-\xfd\xf7\xc7\x1d\xac\x95\x8a\xf5\x71\x3e\xb6\xc3\x93\x9a\xfd\x88\
-\x07\x8f\x91\x58\x7b\xbd\x09\xf8\xe1\xb5\x57\x31\x61\x84\x60\x5c\
-\x9b\x7a\x25\xa0\x84\x3d\xb0\x52\xeb\xb1\x44\x10\x54\x4c\xe4\x71\
-\x57\xdf\x7e\x6d\x9a\x3c\xce\x7a\xf1\xb7\xdd\xf4\x4f\x94\x88\x76\
-\x92\x1b\x11\x0b\x22\x94\x3e\x61\xa4\x9f\x7c\x4b\x67\xbb\x44\x09\
-\x18\x1b\xf9\x23\x36\x97\x9e\x9f\x5e\x7b\x2d\x93\xc4\x26\x28\x22\
-\x1a\x2b\x75\x43\x40\xb7\xc3\x0d\x9f\xb5\x02\x70\x46\x28\xcb\x02\
-\x8c\xe5\xee\xf5\xab\xb8\xfe\xde\xbb\x71\x83\x03\x04\xaf\x88\x17\
-\x24\x08\xde\xe8\x1e\x85\xd3\x9e\xad\xc4\x50\x9f\x41\x83\x50\x96\
-\x49\x01\x88\x6c\x25\x28\xbb\x7b\x6c\xd2\x1d\x2d\x3a\xe3\x49\x55\
-\xd3\xae\x40\xbd\xb7\x97\x8a\xce\x5b\x74\xb7\x80\x87\xee\x3c\x31\
-\x82\x0f\x3e\xa6\x7b\xeb\x3d\x5c\x79\xc7\x6d\x3c\xd0\x98\xa2\xb4\
-\x86\x50\x96\x88\x4f\xeb\x70\x3b\xfc\xf0\xed\xb0\x00\x42\x9b\x12\
-\xea\xca\x5b\x6f\x66\xd5\xd4\x66\x42\xee\x90\x20\x64\x41\x22\x8a\
-\x49\xb6\xeb\x8a\x7b\x96\x24\x90\x4c\xd5\x82\x4e\xba\x17\x72\x57\
-\xf0\xeb\x71\xbd\x81\xc7\x90\xdf\xc4\x7c\xdf\x11\x32\xcd\x05\x48\
-\xf5\xe0\xb1\x7c\x05\x0e\x3c\xe0\x40\xfa\x7a\xfb\x08\x2d\xbf\xe7\
-\xe5\xf7\x77\xb8\xc4\x96\xe1\xbe\x59\x52\xef\xe9\xe3\xa1\x91\x8d\
-\xfc\x6a\xe9\x2d\x91\x5a\x4d\x23\x46\x45\x24\xb6\xe3\x9b\xad\x6c\
-\x07\x1f\x80\x60\x5d\xc6\x28\x81\x2b\x6e\xbf\x99\x32\x73\x04\x89\
-\x59\xc8\x8a\xa0\xb1\x8a\x00\x76\xa7\x86\x4d\xdb\x0f\xde\xda\x4d\
-\x75\x55\x30\xb7\xd9\xab\x3a\x3c\x75\x33\xa9\x6f\xb7\x46\xe7\x5d\
-\xad\xaa\xd9\x16\x88\x3e\x5e\xe7\x4b\x84\xc5\x77\x77\x99\xd5\x59\
-\x17\xfe\xfd\xe6\x1f\x1a\xad\x8f\x4e\xe1\x45\x37\x0c\x6f\xc6\x08\
-\x6d\xcd\x7f\xa7\x52\x02\x3a\xed\x6f\xe2\xac\x2a\xd3\x9c\xf6\x6e\
-\xf9\xad\xf4\x86\x50\xf1\x16\x02\x2c\x9e\xbf\x80\xc1\x9e\x5e\x42\
-\xab\x88\x20\xa6\xbd\x06\xc0\x36\x45\x10\xd4\x7b\x44\x15\xaf\xca\
-\x84\x96\x5c\x77\xcf\xed\x8c\xa5\xdf\x55\x15\x41\x66\x3b\x2c\x80\
-\x47\xad\x05\x98\x76\x42\x04\x45\x32\xc7\x6d\xeb\x56\x72\xe3\xfd\
-\x2b\x30\xae\x1f\xab\x86\x42\x0a\x9a\x39\x40\x40\x4a\x62\xe1\x4c\
-\x02\x86\x17\x45\x81\x11\xc1\x65\x59\x02\xd5\x29\xc1\x4a\x32\x99\
-\x05\x51\x0b\x3e\x86\xca\xac\x8d\xc4\x15\xc1\xc7\x6f\x11\xa9\xf4\
-\x04\x75\xe0\xa5\x81\x09\x1a\xbb\xf2\xa8\x89\x4d\x35\x2a\xf2\x04\
-\xf1\x48\x50\x5c\x50\x4a\xc9\x53\x97\x1f\x4d\x68\x28\x3a\x0c\x24\
-\x5a\xf5\xd9\x4b\xbd\xe3\x76\x34\xb8\x44\x63\x87\x9f\x1e\xe7\xd2\
-\x64\x6d\x89\xcb\xd8\x9e\x6a\xe0\x4a\x2a\x4c\x97\x25\xed\xf3\x0a\
-\x10\x67\x95\x52\x62\x97\xa1\xb2\x6c\x90\xbb\x2c\x55\xec\x48\xec\
-\x67\x88\x49\x9d\x90\x4d\x5c\x10\x56\xb6\x68\xe2\xd2\x85\xd8\x8e\
-\x38\x1d\xaf\x89\x4a\xaf\x15\x3f\xcc\x46\xce\xbe\x80\x80\x98\x44\
-\xdd\x45\x6c\xb8\xe1\x35\xc1\x12\x65\x3a\x1b\x45\x02\x7e\x46\x43\
-\xa8\x82\xa9\x26\xa8\x6a\x17\x43\x12\x09\x37\x72\x40\x6f\x1f\x87\
-\xf5\x0d\xb2\x6a\xe3\x6a\x0a\x93\x53\xd5\xfa\x74\x23\x7f\xbb\xa6\
-\xf0\x49\xea\x44\x45\x91\x84\xf8\x53\x2b\x94\x59\x20\xd4\x2d\xd7\
-\xde\x75\x3b\x0f\x8e\x6f\x62\xb8\x7f\x2e\xda\x6c\xc5\x40\xa1\x51\
-\x14\xbb\xd5\xce\x5d\x33\x65\xd6\xc5\x40\x55\x70\xf1\xe6\xbb\xef\
-\x66\xdd\xc4\x24\x79\xff\x20\xcd\xa9\x16\x92\x93\x2a\xb4\xc0\x94\
-\x82\x35\x96\xc2\xb7\x30\x2a\xec\xb7\x70\x21\x65\x63\x8a\xd5\xab\
-\x56\xa7\x1d\x21\x44\x12\xfe\x74\x41\x35\x88\x91\xc8\xbc\x0b\x11\
-\xc2\xaa\x0a\xc6\x22\x03\x7d\xa8\x44\xc5\x60\x28\x09\xc6\xe0\xc5\
-\x51\xb6\x3c\xce\x38\xac\xc6\x62\x15\x4d\xc6\x64\x90\x88\x45\x8f\
-\x4b\xae\xca\x45\x74\x96\xb8\xa8\x6d\xb3\xf5\x3c\x2e\x74\x12\x21\
-\xe2\xb2\x87\x06\x06\x80\x6d\x99\x56\x15\x1c\xee\xb1\x27\xa6\x0b\
-\xf8\xda\x61\x53\xd2\x00\x62\xda\x45\x20\x2e\x80\x06\x8f\x13\x47\
-\xd9\x2a\x29\x7d\x20\xaf\xf7\xc6\xb6\x63\x40\x0b\x18\x03\x26\x7d\
-\x8b\xb1\xd1\x71\xca\x56\x8b\x32\x04\x8a\x10\x50\x89\x34\x6e\xb5\
-\x5a\x9d\x5a\x96\x31\x50\xab\x33\xe8\x32\x7a\x00\x4b\x2d\xd2\x73\
-\x06\xed\x60\xfc\x83\x62\xac\xc1\x7b\x8f\xb1\x36\x72\x21\x4a\x6c\
-\x93\x26\xed\x42\x87\x6a\xb4\x3b\xf7\x6e\xba\x5f\xed\x5a\x90\x46\
-\x62\xc7\xe5\x03\x06\x06\x38\xe9\xd0\xc3\xb8\x6c\xf5\x43\x18\x37\
-\x80\x36\xcb\x2d\x46\xa7\x3d\x6a\xed\xea\xd2\x27\xa9\x68\x54\xc4\
-\x41\x3c\x41\x3d\x52\xcf\x78\x78\xf5\x6a\xee\x7c\xf8\x21\x4e\x38\
-\x7a\x2e\x0e\x03\xf8\x48\xea\x32\xcb\x41\x9a\x95\x02\x10\x20\x58\
-\x61\x0c\x58\x72\xe7\x1d\x14\xc1\x93\x1b\xc1\x38\x4b\x50\x9f\x9c\
-\xdf\x38\x3b\x21\x75\xd9\x30\x08\x2f\xbe\xf8\x99\x3c\xeb\xb4\x73\
-\xb9\xf3\x8e\xdb\xd8\xf8\xc8\x4a\x42\xb3\x89\x2f\x3c\xcd\xa9\x09\
-\x4c\x62\x73\xcd\x9c\x43\xac\xc5\xa3\x14\x46\x18\x2f\x5b\x2c\x7f\
-\xe8\x01\x56\x6e\x58\xcb\x58\x73\x8a\x75\x6b\x36\xa1\x3d\x35\xe8\
-\xeb\x8b\x14\x64\xb5\xd8\x2d\xc5\x7a\x83\xf5\xa6\xdd\x46\xd9\x1b\
-\xc5\x6a\x8c\x45\x68\x45\x85\x55\xf5\xab\x6e\x03\x72\x75\xab\x39\
-\xe9\xdf\x7e\x62\xe2\xe6\xac\xd5\x6b\x2c\x5a\xb8\xa8\x3d\x68\xda\
-\xae\xdd\x8b\xb2\x3d\xa7\x7f\xd7\x81\xda\x36\x1d\xd4\x08\x45\xba\
-\xfb\x5c\x05\x29\x40\x3d\x98\x5a\x86\xc9\x73\x0c\xb0\xba\x2c\x58\
-\x31\xb2\x91\xeb\xee\x5d\xc6\x43\xeb\xd7\x72\xcf\xca\x87\xb9\xfd\
-\xde\xe5\x94\x65\x89\xf3\x50\x94\xb1\x30\x28\xde\x4c\x6c\x3c\x99\
-\x19\xc3\x60\x5f\x3f\xc7\x1c\x7e\x24\x0b\xe7\xce\xe5\xb8\x03\x0e\
-\xe0\x8c\xc3\x8e\x61\x9f\xa1\x39\x2c\x34\x16\x07\x68\x11\xf0\xbe\
-\x44\x72\x47\x43\x94\x42\x20\x8f\x76\x46\x47\x01\x88\xb6\xcb\x86\
-\xe3\xbd\x57\xdf\x7d\xcb\xe4\x70\x35\x2b\x00\x27\x1d\x7f\x3c\xbd\
-\xd7\x5e\x4e\xa3\x2c\x29\xd1\x44\x19\xbf\xf5\x75\xd8\xe6\x5b\x7c\
-\x12\x8a\x6a\xb4\x9c\x8d\x18\xbc\x2f\xc8\x9c\x63\xaa\x68\x71\xed\
-\x4d\x37\xf1\x92\xa3\x4f\xc2\x8b\x62\xb7\x13\x88\x33\x2b\x05\x10\
-\x88\xe6\xe0\xba\xc9\x71\x96\xdc\x73\x37\xb6\x96\xd3\xf2\x45\xea\
-\x73\x07\x55\xc9\x5a\x8c\x84\x97\x38\x6b\x91\xa9\x26\x5f\xfe\xe2\
-\x17\x58\x71\xcb\x6d\x5c\x74\xcc\x89\x3c\xff\xf4\x73\x38\x72\xe1\
-\x02\x72\xa0\xbe\xad\x2f\x48\xac\x63\x5f\xef\x5b\x8c\x8c\x8f\x33\
-\x32\xba\x89\xab\x97\xdc\xcc\xd5\xf7\xdc\xc3\x15\x77\xde\xc6\x46\
-\x0a\x7c\x6f\x0f\x36\xef\x4b\xa5\xa1\x71\xa3\x87\x64\x6f\x07\xd1\
-\x76\x24\xd9\xa0\xf1\xb4\xac\x7a\xd0\x93\xf8\xe3\xab\xba\xd4\x1d\
-\x28\x22\xa0\x65\xc1\x40\x6f\x2f\x73\xe6\xce\x89\x65\xd3\xa2\x04\
-\x14\x4b\xd7\xb1\x35\xe3\xa4\x7c\x34\x31\x15\x1f\x61\xb5\xda\xbb\
-\x48\x1e\x54\x85\x42\x15\x67\x05\x53\xcb\xd8\x0c\xdc\xb1\x72\x25\
-\x57\xdc\x76\x33\xbf\xbc\xf5\x46\xee\x5a\xbd\x92\x87\xc7\x36\xd1\
-\x2c\x5b\xd0\xdb\x03\xf5\x3c\x56\x97\x05\x0b\xce\xa2\xd6\x25\x53\
-\x5f\xa3\x99\xe8\x03\x61\xc3\x7a\x6e\x1b\xd9\x84\x4e\x4d\x31\x54\
-\xcb\x98\x5b\xab\x73\xd2\xc1\x47\xf0\xd4\xe3\x4e\xe2\x69\x27\x9e\
-\xca\x31\x8b\x16\x62\x31\xb4\x42\x8c\x1b\xe4\xc6\x4c\x27\x39\x99\
-\x91\xfe\x95\xf4\x2d\xb6\xc0\x40\xb4\xc7\x21\x35\xf4\x00\xce\x3c\
-\xee\x04\x16\xe4\x75\x1e\x29\x3c\xc6\x99\xd4\x30\x73\x1b\x63\x9d\
-\x2c\x92\x27\x67\xb6\x29\x2e\x83\xaa\xd8\xd4\x07\xc5\xd5\xeb\xdc\
-\x72\xd7\x32\x36\x12\x98\x63\x0c\xd6\x74\x45\xa2\x67\x21\x8f\x4a\
-\x08\x52\xfd\xca\x6b\x2c\x4d\xfc\xd6\x6d\xb7\xf0\xba\x0f\xff\x1f\
-\x46\xfb\xfa\xf0\xc6\xa1\xde\x83\x23\xe5\xfe\x0d\xc6\x1b\x30\xb1\
-\x71\x41\x06\xb1\x0b\xcc\xf8\x04\x14\x05\x0b\x06\x07\x99\xd3\xd7\
-\xcf\x9c\xfe\x7e\x0e\x3b\xe4\x60\xf6\x1d\x1a\x66\x30\x58\x7a\x6b\
-\x75\x7a\xf3\x1a\xf3\x86\x86\x38\x74\x9f\xfd\x98\xd3\xdb\xc7\xa2\
-\xa1\x39\xf4\xd2\x59\x3b\x2d\xe0\xf6\x87\x1f\xe2\xab\x57\xfc\x82\
-\x1f\xdc\x7a\x1d\x77\xad\x5d\x83\xf4\xf6\xe1\x6a\xbd\x04\x31\xf8\
-\x36\xce\x34\x9d\xf8\x21\xa6\x94\x2a\x3b\xa0\x8d\x3d\x7f\x9c\xcc\
-\x47\x31\x82\x36\x26\x39\x6d\xde\x3e\x7c\xed\x4d\xff\xc6\xc1\xae\
-\x06\x94\xe9\xe0\xb6\x29\x4a\xcb\xf6\x29\x9e\x50\xb6\xe9\xb5\xd4\
-\x90\xfe\x27\x04\x15\x9a\xc4\xf9\x58\x17\x4a\x2e\xbf\xf3\x76\xbe\
-\x7d\xd9\xe5\x5c\xb7\xf4\x56\x36\x4c\x8d\xd1\x74\x06\x7a\xeb\x68\
-\xe6\x10\xe7\x22\xc5\x57\x88\x41\x37\x5f\x46\xda\x2d\x4c\x5b\x93\
-\xb4\x2d\x37\x2b\x26\xb9\xfd\x06\xd1\x92\xc6\xe4\x38\x52\x96\x64\
-\x85\x67\xdf\xbe\x7e\x9e\x76\xca\x69\xbc\xf0\xfc\xa7\xf1\x94\x23\
-\x8e\x61\x0e\xe0\x5b\x01\x2c\x88\x8d\xf4\x5e\x55\x4d\x70\xec\xd0\
-\x97\x82\xc3\x44\x9c\xba\x4a\x6c\xe2\x61\xd4\x74\x0a\xfa\x24\xba\
-\x4c\x8d\x00\x0d\xeb\xf8\x9b\x4f\x7f\x8c\xaf\x5c\xf5\x6b\x98\x3f\
-\x4c\x11\xb6\xce\x6b\xdf\x1d\x00\x7e\x32\x2a\x80\x4a\x6c\x9a\xb6\
-\x60\x3c\xae\x28\xd8\xcf\x0b\x9f\xfb\xa7\xb7\x72\xc1\xe2\x43\xa0\
-\x2c\xe2\x1c\x62\x76\x40\x0c\x20\x99\xf6\xaa\x4a\x13\x58\xba\xe2\
-\x7e\x46\x8b\x26\xea\x06\xd1\xa0\x88\x35\x68\xf0\xd3\xf8\xae\x6c\
-\x69\x62\x4d\x80\x08\x41\x3d\xd9\xe0\x10\xd6\x0a\xeb\x5a\x0d\x56\
-\x4f\x6c\x82\xc9\x4d\x5c\xf3\xc8\x3d\xb1\xd5\x71\x69\x30\xc6\x92\
-\x01\x03\x36\x63\xb8\xde\xcb\x70\x4f\x1f\x47\x1d\x78\x10\x67\x9d\
-\x70\x12\x67\x9f\x7a\x2a\x07\xf5\x0f\x31\x0c\x9c\xb1\xff\x62\x4e\
-\x7e\xe9\x9f\xf0\xf2\x8b\x9f\xcb\xb7\xae\xfa\x15\xdf\xbd\xfa\x0a\
-\xee\x5a\xb3\x0a\x6a\x75\xea\xb5\x3a\x58\x17\x1b\x7c\xc4\x22\xf9\
-\xf6\xda\x6e\xb3\xcf\x86\x76\x88\x94\xee\x8e\x3d\x3b\x42\x24\xc5\
-\x23\x86\x7a\x7a\xe8\xb1\x96\x10\x4a\xac\xb0\xe5\x04\x6c\x45\x09\
-\xcc\x4c\xc7\x55\x7f\x23\x12\xef\x59\x45\x50\x8d\xc6\xb4\xf7\x8a\
-\x71\x86\x26\xc2\xf7\x6f\xb9\x96\xcf\xff\xe4\xbb\x5c\xbf\xfc\x3e\
-\xc6\x82\xa1\x36\xd0\x87\xf6\x0e\x45\x4e\xfd\x6a\x5f\x37\x03\x19\
-\x16\x53\x44\x00\x49\xcb\xc4\x20\x9f\x7a\x6d\xdf\x4a\xd5\x48\x13\
-\x42\x57\x93\x13\x30\x7d\x03\x20\x4a\x29\x9e\x07\x8b\x16\x9f\xbf\
-\xfa\x17\xfc\xe8\xfa\xab\x78\xfa\x11\xc7\xf3\x17\xcf\x7b\x21\xe7\
-\x1d\x79\x54\x54\xb9\x55\x7b\x6f\x55\x42\xf0\x48\x62\x83\x6e\xc7\
-\x01\x0c\x74\x23\x48\xbb\xc7\x20\xc6\x32\x03\xfd\xc0\x33\xcf\x38\
-\x8b\xef\x5e\x7e\x19\x53\xa5\x8f\xdf\xdd\x1a\xf0\xa9\x3a\xc0\x98\
-\xb8\x0e\xab\xca\xc8\x27\x6b\x10\xa0\xfa\xe2\xa1\xe2\x84\x30\x68\
-\x96\xb1\x76\xf3\x08\xb7\xdd\xbb\x9c\x0b\x17\x1f\x82\xaf\xe6\x73\
-\x96\x0a\xf2\x51\x59\x81\xdb\xe9\x3b\x6b\x58\x17\x02\x1f\xfd\xce\
-\xd7\xb9\x6f\x74\x23\xa1\xa7\x1e\x53\x80\xde\x23\xed\xb6\x4c\x29\
-\xe4\x23\x26\x32\xd1\x8a\xa0\xc6\xe2\x81\x22\x04\xc4\x66\x58\x97\
-\x23\x2e\xc7\xd5\xfb\xb0\xbd\x03\xd0\x37\x88\xf6\xf6\xa2\x3d\xbd\
-\x14\x2e\x63\x5c\x95\xd5\xe3\xe3\xdc\xf6\xc0\xfd\x5c\xb1\xe4\x56\
-\x7e\x72\xed\x35\xac\x9a\x1a\x67\xde\x82\x39\xcc\xed\x1d\x84\x10\
-\x58\xd4\xd3\xc7\xd3\x8e\x3e\x9e\xa7\x9f\x73\x1e\x8b\x17\x2e\xa4\
-\x39\xb6\x99\x89\xb5\x6b\xf1\x9b\x37\x53\xa6\xc6\x05\x99\x49\x6e\
-\x41\x37\x5d\x4a\x45\x5b\xb3\x9d\xc5\x12\xb3\x1a\x44\x11\x64\x72\
-\x8a\x53\xf6\x3d\x90\x97\x9c\xfd\x14\xea\x1a\x22\xb1\x46\xaa\xa5\
-\x9f\x16\x10\x7c\x94\x8f\xee\x6c\xfe\xd8\x31\x56\xad\x69\x47\xf6\
-\x3d\x06\x9c\xe1\xfa\x47\x1e\xe6\x2d\x9f\xff\x04\x1f\xb9\xe4\x5b\
-\x2c\x1f\x1f\xa1\xec\xef\xc3\xf5\xf6\x53\x98\x88\xaa\x53\xed\x7c\
-\x47\xab\x16\xe3\x21\xc3\xc4\x16\x6e\xa6\x62\x6b\xd1\xf6\x16\x95\
-\x74\x72\x0b\xb1\xd1\x07\xd5\xc2\x0a\x31\x6e\x12\xe9\xc0\x2d\xa6\
-\xa7\x4e\x53\x03\xf7\x3e\xbc\x82\x4b\xaf\xb9\x8a\xfb\x46\x46\xd8\
-\x67\xff\x03\x58\xd0\x17\x1b\xc0\x48\x77\x21\x58\x17\x79\x49\x9a\
-\x05\x20\x75\x5e\xae\xc6\x20\x65\x30\x44\xa1\x34\x96\xbe\x81\x21\
-\xae\xbc\xf9\x06\x56\x4d\x4e\x60\xb3\x0c\x5f\x94\x18\x67\x13\x53\
-\xee\xf4\x1d\x2f\x3c\x49\xe3\x00\x69\x4d\xdb\x10\x79\x27\xbd\x11\
-\x6c\x66\x69\x4d\x4e\xb1\xcf\xc0\x10\x17\x9e\x72\x06\x79\xa2\x6b\
-\x13\x91\x59\x59\x00\x8f\x49\x0b\xae\x1a\xc1\x07\x0f\x8d\x8f\xf3\
-\xc9\x1f\x7c\x9b\xd1\x4c\xf0\x36\x6e\x74\x09\x9a\x0a\x14\x2a\xda\
-\xcb\xd8\x16\x5c\x2d\x6d\xfa\xef\xd8\xb8\x20\x76\x79\x57\x8d\x88\
-\x41\x2d\x63\xaf\x08\x55\x0b\x3e\x06\xb2\x54\x22\x8f\x3e\x79\x46\
-\x6d\xce\x1c\x0a\x67\xd8\xd0\x9c\xe2\xca\xdb\x97\xf0\x93\x1b\xae\
-\x60\x63\x31\xc5\xe1\x87\x1c\xc6\xb0\xcb\xf1\xad\x92\x79\xb5\x1e\
-\x4e\x3f\xf8\x70\x9e\x79\xf6\x05\x9c\x79\xdc\xf1\xec\x33\x30\xc8\
-\xd4\xc4\x18\x63\x1b\x47\x28\xc6\x27\xa9\x59\x17\xcd\xde\x76\x28\
-\xfd\xf1\x43\xe3\x38\x11\xcc\xf8\x24\xcf\x3f\xeb\x7c\x2e\x3a\xfa\
-\x38\x6c\x28\x31\x46\x22\xbe\x9d\x2e\x05\xb0\x2d\xbf\x76\x2b\x93\
-\x55\x8a\xa1\x19\x94\x10\xc0\x64\x19\x63\x02\x1f\xff\xe1\xf7\x78\
-\xeb\x17\x3f\xcd\x95\x2b\x96\x13\xe6\xce\x41\x6b\x3d\x20\x96\x50\
-\x56\x76\xce\xd6\x0a\xf3\x25\x11\xb0\x28\xc1\x86\x94\x3a\xdd\x92\
-\xc6\x47\x25\x75\x0c\x4a\xfd\x43\x8c\x26\x62\xd3\xea\xca\x2a\xa8\
-\x31\xd0\xd7\xc3\x26\x09\x5c\xb3\xfc\x4e\x2e\xbf\xee\x7a\xfa\x86\
-\xe6\x72\xe8\x81\x8b\xa3\xd2\x0a\x21\xb2\xd8\x4c\x5b\xb1\x55\xda\
-\x57\xa3\x02\x48\x0c\x47\x9d\x54\xa0\x52\x7a\xcf\x70\xbd\x87\xfb\
-\xd6\xad\xe3\xca\xbb\xee\xa2\xa7\xb7\x0f\x5f\x16\x09\x5c\x55\x11\
-\xac\xca\xb4\xab\x3e\x29\x15\x40\x1a\x37\x9b\x1a\xa9\x04\x13\xd3\
-\xbb\x8a\xe2\xa6\x5a\x3c\xe7\x9c\xf3\x99\x97\xe5\x31\xdb\xb5\x35\
-\x0b\x74\x2b\xf2\xa8\x0a\x20\x5a\x86\x01\x63\x0c\x3f\xbe\xfd\x16\
-\xbe\x75\xf5\xe5\x4c\x65\x16\x6a\x39\x78\xc5\x88\x60\x34\xa4\xc9\
-\x88\x7c\xb8\x26\x04\x50\x1f\x49\x1c\xa7\x81\x49\x24\x1d\x4c\x71\
-\x21\x29\x91\xc3\xce\x48\xd5\x84\x26\xe6\xfc\x31\x42\x33\xb4\x28\
-\x0c\x84\x3c\xc3\xf5\xf7\x30\x52\xb4\xb8\xf2\xd6\x25\x5c\x75\xd3\
-\x4d\xcc\x5b\xb4\x2f\x87\xec\xbb\x2f\x4e\x22\xce\xa0\xcf\x39\x8e\
-\x98\xb7\x80\x0b\x8e\x3b\x89\x67\x9e\x73\x01\x47\xef\x7b\x00\xc5\
-\xd8\x18\xab\x1f\x59\x05\x58\x4c\xee\x28\xb5\xd3\x58\x62\x87\x8b\
-\x08\x14\x25\x0b\x5c\xce\xdf\xfc\xc1\xcb\x39\x62\x70\x28\xd2\x6a\
-\xab\x82\x71\x69\xde\xb6\xc2\xea\xd1\x3d\xce\x33\xc2\x30\x9a\x5a\
-\xaa\xf9\x00\xea\x1c\x0f\x4d\x4d\xf0\xaf\x9f\xfc\x30\x9f\xfa\xd9\
-\x25\x6c\xea\xc9\xf1\x03\x7d\x14\x58\x44\x1d\x1a\x04\x11\x6d\xfb\
-\xc7\x91\x6e\x3b\x8e\x7b\xb5\xa9\x63\xbb\x2f\xa6\xdb\xce\x5b\x72\
-\x7c\x4c\x7b\x52\x6d\x5d\x4b\xe2\x44\x0c\xf1\x54\x2f\x55\xd1\x5a\
-\x0d\xd3\xdf\xcf\x68\x73\x8a\x9f\x5f\x75\x39\x8f\x6c\xda\xc0\x29\
-\x27\x9c\x48\x9f\xcb\x28\x7d\x89\x4b\x30\xe8\xc8\x23\x58\x99\xff\
-\xd3\x63\x00\x48\xec\x63\x17\x19\x8a\x0d\x6a\x2c\xd9\xd0\x10\xdf\
-\xbf\xee\x5a\x5a\xbe\x24\xcb\xb3\x98\x3b\x30\x5d\x0a\xa0\x2b\x1e\
-\xfa\xa4\x94\x34\x7f\x36\xb9\x00\xc1\x58\x94\x80\x35\x20\x13\x53\
-\x5c\x78\xe2\xc9\x1c\x36\x67\x18\x0d\x01\x31\x3b\xc0\x02\x88\xb9\
-\xe7\x58\xe9\xf6\x9d\xeb\xae\xe1\x67\xb7\xdf\x8a\x9d\x33\x48\x08\
-\x31\xd2\x2e\x09\x01\x58\x29\x00\x30\xb1\xb5\x94\x49\x9c\xb6\xdd\
-\xed\x80\x12\x53\xb0\x55\xc1\x6a\xea\x13\x19\x79\x76\x89\x66\x40\
-\x19\xfb\xf0\xc5\x88\x55\x74\xfb\x7c\x0c\x84\x59\xd3\x43\xd6\xd3\
-\xc7\xca\x91\x4d\xfc\xf8\xaa\xcb\xb8\xe7\x91\x87\x59\xb0\x70\x11\
-\x07\x0e\xcf\xa3\x4f\x84\xa2\x2c\xf1\xc1\x33\xcf\xe6\x9c\x74\xe0\
-\x41\x3c\xed\xbc\xa7\x30\x3c\x3c\x8f\xdb\xee\x5a\xc6\xe8\xf8\x24\
-\x79\xbd\x27\xc5\x02\x0c\x12\x3a\x84\x9a\x5d\xff\xfc\xc6\x62\xac\
-\x25\x4c\x4c\x70\xce\x51\xc7\xf1\xbf\x9f\xf9\x5c\x7a\x15\xb2\x10\
-\x52\x0f\xbe\x38\x26\xb3\xb5\x00\xda\x2e\x80\x11\x7c\xcb\xe3\x9c\
-\xe3\xba\x87\xef\xe3\x2f\xde\xf7\x6f\x5c\xf6\xd0\x5d\xf8\xf9\x73\
-\x69\x65\x16\xf5\x82\x84\xa8\x00\xd0\x80\x77\x09\xfc\x51\x99\xf2\
-\x68\x72\xcd\xba\xe6\x20\x1d\x9b\x55\x0b\xae\xee\xc7\xb4\xfe\x81\
-\x98\xd8\x2e\xcc\x74\xba\xd4\x98\x14\x4e\x15\x4d\x21\xcd\x20\x68\
-\x01\xa1\x6e\xd1\xfe\x3a\xb7\xdd\xb1\x94\x3b\x6f\xbf\x9d\xe3\x8e\
-\x3a\x92\x03\x07\xe7\xe2\x7d\x89\x93\x2a\x08\x55\x2d\x00\xa6\x07\
-\x01\x2b\x17\xc4\x07\xc4\xc4\x5c\x49\xff\x9c\xb9\xdc\xb8\x6a\x25\
-\xcb\xee\xb9\x87\x7a\x6f\x3d\x76\xbc\xa9\xac\xc8\x27\xeb\xa6\xef\
-\x96\x34\x9f\x36\x98\x8e\x05\xe0\x40\x9c\xa1\xd8\x34\xca\x69\x8b\
-\x0f\xe1\x8c\x43\x0e\x8b\xf1\xb9\xd9\x2b\x80\xb7\xbe\x4d\xbb\xcb\
-\x56\x25\x11\x5c\x68\x40\x42\x34\xde\x46\x0c\x7c\xf4\xe7\x3f\xe6\
-\xae\x0d\xeb\x31\x79\x2d\x71\x96\xdb\x18\xfc\x12\x49\xd4\xcd\xd3\
-\xee\x94\x36\x7b\xe4\xb4\xa3\x46\x92\x9f\x19\x9b\x52\xfa\xd4\xde\
-\x59\x44\x92\x62\x88\x8b\x4b\x7c\x8c\x9e\x6b\x00\x23\x31\x65\x55\
-\x68\x80\xde\x1a\x65\x9e\x71\xeb\xfd\xcb\xf9\xc9\xd5\x57\xb0\x6c\
-\xc5\x0a\xea\x73\xe7\xb0\xef\xfc\x85\xe4\xc6\xe2\x0a\x8f\x29\x0b\
-\x32\x63\x38\xf5\x90\xc3\x38\xe9\xe8\x63\x59\xbe\xfc\x6e\x56\xac\
-\x5d\x05\xfd\x3d\x11\x58\x14\x04\x13\x3c\x4e\x02\xa2\x01\xbc\x8f\
-\x91\xaa\xb6\x56\x48\xf7\xad\x36\xa6\xb6\xa4\x4c\x9a\xd7\x74\x7e\
-\x47\x0c\x4a\x19\x51\x08\x25\x79\xa3\xc9\xff\xf7\xc2\x3f\xe0\xec\
-\xfd\x0e\x24\x94\x25\xce\x46\x04\x5e\xe4\xd2\x9b\xae\x70\xaa\x7a\
-\x8a\x42\x24\x05\xc1\xa2\x5b\x44\xea\x78\xab\x12\xf0\x65\x8b\x56\
-\x5e\xe3\xbb\xf7\x2c\xe3\xaf\xde\xf7\x6e\x1e\x9c\x1a\x83\xa1\x21\
-\x1a\xde\xa3\xc1\x20\x26\x83\xd4\x68\x03\x6b\xd0\x0a\x8b\xd1\x26\
-\x22\x49\xb8\x07\x99\x3e\xf6\x5b\xa9\x51\x9c\x36\x65\x51\xba\x2c\
-\x36\xed\x6a\x72\x0a\x18\x67\xf1\xa9\xcf\x9f\x31\x06\x75\x31\x1f\
-\x9d\xf7\x0f\x70\xdf\xc3\x2b\xb9\xe1\xd6\xdb\x38\xec\xa8\x63\x58\
-\x3c\x3c\x2f\x16\x89\x29\x48\x85\xc8\x94\x18\x1c\xa4\x5d\xf5\x2b\
-\x5d\x96\x51\x0c\xde\xf6\x8a\xc5\xb9\x8c\x9f\xdc\x74\x15\x93\xf5\
-\x38\x72\x36\x38\x3c\x12\x83\x82\x02\x31\xac\xeb\xd9\xd2\x84\x79\
-\x32\x48\x82\x51\xab\xc6\x60\x6f\xea\x23\xe8\x82\x41\xca\x92\x05\
-\x83\x83\x3c\xf3\xe4\xd3\x71\x49\xa9\x76\x0f\x8f\x56\x29\xdf\x19\
-\x62\xdf\xf6\xb6\xb7\xbc\x2d\xbe\x43\xda\x16\x62\x21\x1e\x51\x8f\
-\x41\x08\x6a\x78\xa8\x31\xc1\xff\xfd\xf1\xf7\xd9\xe4\x0b\x8c\x89\
-\x5d\x4a\x45\x2b\xbe\xb6\xae\x89\x68\x87\x1f\xbb\x7b\x98\x26\xe5\
-\x50\xb9\x00\x95\x69\xda\x86\x89\x75\x22\xc4\x1a\xaa\xd3\xca\xe0\
-\x15\xd4\x46\x8e\x74\x9b\x6a\x48\x03\xd1\xec\x31\x7d\xbd\x4c\x59\
-\xc3\xb2\x07\xef\xe7\xa7\x97\x5f\xc6\xb2\x15\x0f\xb2\xe8\xc0\x03\
-\x39\x74\xce\x9c\x48\xae\xa8\xb1\x79\xf2\xc1\xc3\xf3\xb9\xe0\x8c\
-\xb3\x58\xb9\x6a\x25\xcb\x1f\xb8\x1f\x93\x39\xb2\x2c\x87\xb2\x85\
-\xf7\x1e\x6b\x2d\x26\x73\x91\xe1\x36\x7d\x6e\xfc\x1a\x51\x21\xc5\
-\x66\x96\x3e\x3e\x0f\x06\x51\x1b\xa3\xe6\xa2\x88\x33\x38\x02\x61\
-\x72\x92\xb3\x0e\x3e\x8c\xb7\xbf\xe8\x0f\xe9\x15\x13\x75\x89\x71\
-\xf8\xd4\x7c\x63\x0b\x5c\x76\x4a\x46\x84\xa4\x00\x12\x9a\x19\xd1\
-\x78\xdf\xcd\x50\x52\xcb\x7a\xf8\xe6\xdd\xb7\xf1\x97\x1f\xff\x10\
-\x23\xbe\x84\xde\x1e\x0a\xaf\xa8\x71\x31\xb1\xd9\x55\x5c\xaf\x89\
-\x32\xbb\xbd\x40\xba\x21\xb7\xd3\xaa\x32\xa6\xbf\x85\x6d\xfc\x7a\
-\x6b\x6f\xaa\xf2\xcf\x21\xf8\xd8\x96\x4b\x62\x6a\xaf\xc2\x29\x04\
-\x63\x31\xf5\x3e\xd6\x8f\x8e\x71\xed\x8d\x37\x71\xcc\xf1\x27\xb2\
-\x78\xce\x10\xa5\x8f\xad\xc5\x8d\x49\xc1\x61\xe9\xc0\x19\x64\xc6\
-\xfd\xaa\x89\x95\x6c\x07\x0d\xcf\xe3\xd2\xa5\x37\xf2\xd0\xd8\x7a\
-\x24\xaf\x63\x8b\xe8\x1e\x68\xe5\xc2\x54\x2e\x8e\x3c\x19\x15\x40\
-\x85\x63\x8d\x9d\x9d\x11\xb0\xde\xe2\x4a\x68\x15\x2d\x9c\x09\x3c\
-\xff\x82\xa7\x33\x28\xb1\x7d\xda\x16\xd1\xa0\xad\x28\x80\x0a\x53\
-\xb0\x85\xa8\xc4\xd4\x96\x75\xc2\xc8\xd8\x66\x26\xa6\x26\xaa\xdf\
-\xc4\x45\xb7\xed\x3b\x8c\x57\xec\xaa\x4f\x91\x10\x5b\x83\xc5\xc6\
-\xb4\x42\x96\x50\x7c\xed\x85\x2c\xd1\x4f\xf5\x4e\x29\xad\x52\x5a\
-\x8f\x3a\x0f\xb6\x04\x53\x46\x93\xc6\x6b\xe2\x25\x53\x82\xf7\x60\
-\x0d\xa6\xbf\x97\xa9\xde\x9c\xef\x5e\x7f\x25\x7f\xf1\x1f\x6f\xe7\
-\xbf\xae\xbe\x9c\x96\x73\xa8\xcb\xe3\x26\x0b\x9e\xc3\xfa\x07\xf9\
-\xc4\x5f\xfe\x23\xff\x74\xd1\xef\x32\xbc\xb9\x41\xd9\x18\xc3\xf4\
-\xd4\xc0\xd5\x28\xc4\x45\x60\x8b\x58\x70\xae\x7d\xc3\x46\x3d\x56\
-\xab\xd6\x9e\x06\x1b\x2c\xb9\x37\x64\x5e\xa3\x66\xb5\x8a\xfa\x26\
-\x56\x3d\x3d\x8d\x16\x7f\xfc\xdc\xdf\x65\x30\xab\x51\xf8\x32\x06\
-\x1e\x83\xc7\x9a\x6d\xf4\x02\x32\x71\xe1\x66\x09\x4a\xaf\x46\xf1\
-\xa9\x51\x82\x00\xd6\xd5\xf9\xe1\x9d\x4b\xf8\xd7\x0f\xbc\x97\xa2\
-\x2c\x11\x67\xa3\x19\x1c\x7c\x02\x5e\x75\x66\xcb\x68\x95\xd2\x7f\
-\x82\xf2\x62\x33\x16\x90\x28\x58\xb1\x84\x46\x13\xef\x4b\xf2\x79\
-\x03\x2c\x1f\x5d\xcb\xbf\x7c\xf8\x7d\x5c\xb7\x7e\x35\x64\x8e\xa0\
-\x82\x04\xd3\x8e\x4d\x98\x94\xa3\x6c\x63\x03\x25\x75\x57\xc6\x12\
-\x7c\x60\x28\xcb\x78\xc1\x79\x4f\xa3\xd6\x54\x6c\x50\x7c\xc5\x70\
-\x9b\x20\x86\x26\xa4\x7a\x84\x27\x69\x20\xa0\x8d\x2d\x4d\xa6\x59\
-\x65\xa1\xb9\x2c\x63\xd3\xe8\x28\xeb\xc7\x36\xc5\xa0\x7b\x6a\x67\
-\xff\x58\xd2\xb6\xdd\xb5\xfb\x10\x21\x36\xfe\xac\xea\x8a\xaf\xbd\
-\x7d\x09\x1b\x47\x46\xb0\x79\x4e\x59\x96\x89\x7f\x5e\xb6\xf1\x01\
-\x9a\x4c\xe7\x80\x21\xc4\x49\xa7\x0a\x36\x1b\x4c\xf2\x3b\x8d\x1a\
-\x5c\x19\xfb\xed\x99\xd4\x07\x8f\x8a\x2e\x5a\x2a\xa2\xb3\xf8\x48\
-\xe5\x28\x11\xe5\x47\x8c\x3f\xf8\xe0\x29\x32\xcb\x66\xa3\x84\x45\
-\x0b\x78\x80\x16\xaf\xfb\xf4\x87\xf9\xc8\x2f\x7e\x82\x15\x21\x0f\
-\x42\x26\x8a\xb4\x1a\x2c\xf4\xf0\xef\x2f\x7b\x39\x1f\xf9\xf3\x37\
-\x70\x60\x4f\x1f\x8d\x91\x4d\xe0\x32\xac\xc9\x20\x18\x9c\x71\xb1\
-\x73\x6e\x50\x44\x43\x6c\xb6\x61\x7c\xf4\xb1\xc8\x62\x61\x85\x9a\
-\xe8\xcd\x7b\x8f\xaa\xc7\xd6\x2c\xc5\x86\x8d\xbc\xe4\x9c\x0b\x78\
-\xfe\x49\x67\x52\xa8\xc7\xb9\x2c\xba\x47\x12\x9b\x67\x6c\x73\x02\
-\xd2\xd7\x13\x0d\x11\x3a\x6d\x34\x12\x8b\x3a\xc7\xd2\xb5\x6b\xf9\
-\x87\x4f\x7e\x84\x4d\xd6\xe0\xad\xc1\x3b\x28\x43\x4c\xc5\xf9\xb2\
-\xa0\x0d\x78\x22\x59\x53\x3b\x09\x19\x2f\x10\xeb\xcf\x0b\x4f\x2d\
-\xaf\x21\x16\x36\x37\x27\x61\xe1\x10\x4b\x47\x57\xf1\x2f\x1f\xfd\
-\x4f\x1e\x6c\x4e\x61\xb2\x0c\xf5\xa1\x33\xb5\x3a\xe3\x22\xe9\x07\
-\x13\x0c\x4e\x0c\x2d\xe0\xf9\x67\x9c\xc7\xf1\x73\xf6\x41\x27\xa6\
-\x90\xdc\x02\x65\x0c\x2e\x87\x2a\xd0\xf9\xe4\x3c\xfd\xa1\x6a\x3f\
-\xdf\x01\x72\x85\x10\x62\x33\x9a\xcc\xb1\x7e\x74\x84\xe5\x2b\x1e\
-\x02\x98\x35\xc1\x6a\xb2\x00\xba\x22\x62\x0a\x2e\x55\x1d\x55\x8a\
-\x77\xa4\xd1\xa0\x55\x16\x18\x6b\x31\xd6\xb6\x3f\x7c\xeb\x93\xd0\
-\x89\xfc\x87\x76\xb4\x37\xfa\xfa\x41\xa0\x14\xa1\xb0\x31\x2d\x98\
-\xa9\xc5\x06\x9b\xfa\xc3\xa7\xdc\x61\x7a\xa3\x04\x83\xf5\x82\xf3\
-\xed\x54\x78\x15\x95\x04\x04\xb5\x39\x65\x00\xcd\x6b\xb4\x8c\xa1\
-\xec\xed\x61\x7c\xe1\x30\x6f\xfe\xd2\x67\xf9\xd4\xcf\x7e\x42\xdd\
-\x39\x4c\x51\x52\xb7\x02\xbe\x85\x36\x4b\x5e\x7c\xc6\x59\x7c\xed\
-\x8d\xef\xe0\xf7\xcf\xb8\x80\xde\xd1\x49\xdc\xe8\x18\xfd\x22\x68\
-\xab\x49\x85\x19\xd0\xd4\xea\x2a\x88\x25\xd5\xe0\x11\x44\x68\x39\
-\xa5\x65\xa2\x4b\xe0\x8c\x60\x47\xc7\x39\x7a\xde\x02\xfe\xee\x0f\
-\x5e\xce\xbc\x38\xe2\xd1\x95\x88\xd3\xd4\x56\x04\xdb\x96\xa8\x28\
-\x05\xa5\x54\x4f\x69\x84\x0d\x85\xe7\x9d\x9f\xfb\x0c\xcb\x27\x26\
-\x29\x7a\x6a\xb4\x22\x0d\x6b\xc4\x14\x5a\x13\x5b\x7f\xb5\x4f\xce\
-\x4e\x4f\xd8\x9d\x21\x4a\xac\x4d\xf0\x42\xda\xe0\x8a\x64\x96\x16\
-\x25\x32\x3c\xc8\xf5\x2b\xee\xe3\x9d\x9f\xf9\x38\xeb\x21\xb6\x53\
-\xeb\x42\x02\x55\x4d\xd3\xab\x79\xd5\xca\xb7\x45\xf0\xa5\xe7\xf0\
-\xbe\x7e\x5e\x78\xe6\x05\x98\xa9\x06\x5e\x4a\xd4\x28\x56\xab\x6a\
-\x0e\xd3\x59\xaf\x4f\x4a\x99\xe6\xd8\x47\x26\x20\x6b\x50\x63\xd8\
-\x3c\x35\xc5\x83\x6b\xd7\x00\x11\xa0\xd5\x0d\x32\xdb\xd6\x5a\xac\
-\x22\x2b\x9d\xf9\x49\x91\xe4\x8a\xef\x7e\x0c\xb8\xe7\x91\x87\xa3\
-\x89\x9c\x02\x09\xb1\x96\x7c\x0b\x8b\x30\xfd\xbd\xc4\x34\x60\x55\
-\x25\x96\x02\x5b\x41\x34\xa6\xfb\x5c\x40\x4d\xa0\xb4\xd0\x52\x62\
-\xaf\x3b\x97\xd3\x09\xbc\xc5\x06\x14\x12\x4c\x64\x1a\xc2\x26\x60\
-\xd1\xf4\x0a\x33\x29\xab\xce\x34\x16\xef\x85\x80\x43\xd4\x11\xe6\
-\xcd\xe5\xcd\x5f\xfd\x2c\x1f\xf8\xd9\x0f\xc8\xf3\x7a\x54\x62\x4e\
-\x69\xd6\x60\xa2\x6c\x72\xc6\xd0\x3c\x3e\xf7\xa7\xaf\xe3\x13\xaf\
-\x79\x03\xe7\x2e\xda\x17\xbb\x69\x23\x26\x14\x60\x63\x27\x1c\xac\
-\x05\xc9\xb0\xa5\xc5\x16\x51\x21\xa9\x8d\x16\x81\x77\x9e\xdc\x0a\
-\x66\x64\x33\x07\xdb\x3a\xef\xf9\x8b\xbf\xe6\xd8\xa1\x79\x68\xe1\
-\xb1\xc9\x2a\x72\xd6\xb5\x03\x2e\x5b\x1d\xf4\x0a\xe5\x6a\xab\x0a\
-\xb7\x80\x11\x4b\xb0\xc2\xfb\xbe\xf2\x5f\xfc\xec\x8e\x25\x98\xb9\
-\xc3\x34\x31\x04\x67\xe3\xe6\x77\x16\x5f\x46\x57\x68\xfa\x50\xcf\
-\x9e\x07\xe1\xf1\x10\x35\xa0\x99\x50\x92\x02\x7e\x3e\x2a\xa5\x16\
-\x8a\x9d\x3b\xc8\x25\xd7\x5e\xc5\xa7\x7f\x7c\x09\x85\x40\x29\x15\
-\xff\x40\x5a\xc4\x92\x28\xe4\xe8\x58\x9f\x41\x63\xf4\xda\x00\x2f\
-\xba\xe0\x42\x0e\x1c\x9a\x4b\x28\x5b\xa9\xaf\xa0\x42\xf0\xc9\xff\
-\x35\x3b\xf1\x5b\xef\x7c\x99\xee\xf5\x29\x5e\x63\x35\x2c\xb9\xe3\
-\xc1\x35\xab\x69\x11\xb3\x53\x11\xfe\xf2\xe8\xca\xd2\xbe\xed\xad\
-\x6f\x7b\x5b\x35\x01\x1d\x88\x78\xa2\xb5\x32\x96\xf5\xad\x16\xef\
-\xff\x9f\xaf\xb1\x21\x78\xd4\xd9\xe9\xd1\xc4\xad\x5e\x3b\xc2\x4e\
-\x4d\xa2\x29\x32\x02\x2e\xb5\xac\x12\xd1\xd8\x41\xd7\x80\xb5\x16\
-\xac\x23\x58\x49\xd5\x1d\xf1\x94\x23\xa1\xc8\x49\x81\xa3\x40\x6a\
-\x9b\x9c\xa4\xa2\x8e\x92\x64\x0e\xc5\x4d\x24\x90\xe2\x0b\x38\x43\
-\xb3\xd7\x71\xe5\x75\xd7\x50\xb3\x8e\xd3\x8e\x3e\x81\x29\x02\x4d\
-\x81\x5e\x63\x91\x4d\x0d\x6a\x18\x4e\x38\x70\x7f\x2e\xbe\xe0\x42\
-\x06\xfa\x7b\xb9\xff\x81\x7b\xd9\xb0\x61\x03\x88\x90\x49\x4e\x4d\
-\x72\x72\x71\x64\x41\x71\x26\x60\x4c\x40\x5c\x4c\x5b\x96\xeb\xd6\
-\x73\xfc\xdc\x45\xbc\xef\xb5\x7f\xc3\xc5\x47\x1c\x87\x6f\xb6\xc8\
-\x2b\xcb\xa8\x1a\x96\x2a\xad\xb7\xb5\x01\x4a\xcd\x32\x5b\xc4\xc8\
-\xbd\xf7\x4a\x6e\x33\xbe\x77\xc7\xad\xbc\xe7\x5b\x5f\x65\xbc\xbf\
-\x17\x9f\xc0\x34\x4a\xe8\x4c\xca\xb4\xc0\xde\xd6\x56\xc4\x4e\x90\
-\xaa\xe5\x51\x2a\x4d\x36\xa9\x92\x4f\x04\xc4\xc6\x40\xf0\x9d\xf7\
-\xde\xcb\x71\xc7\x1e\xc7\xa1\x73\x87\x29\x42\x88\xed\xcd\xad\xe0\
-\x7d\x99\xb8\xeb\x62\x36\x40\x2a\x9f\xd6\x82\xb4\x02\x0b\x06\xfa\
-\xb8\x7f\x62\x94\x6b\x96\xdd\xd6\xe9\x19\x90\xa5\x4e\xc1\xe6\xb7\
-\x63\xc2\xdd\x7d\x25\x66\x95\xac\x46\x6e\x0d\xa4\xea\xcf\x18\xcf\
-\x4e\x5f\xb4\x98\x6b\x1c\x17\x9f\x75\x1e\x83\xce\x6d\x9f\x02\x98\
-\x46\x56\x21\x21\xfa\x1a\x62\x78\xb8\x31\xc5\x67\x7f\xfe\x63\x36\
-\xe3\x63\xbd\x7e\xb7\x6c\x6d\x2d\x26\x04\x48\x28\x4a\x72\x11\xac\
-\x57\x5c\xe9\xd1\x46\x03\x26\x1b\x84\xf1\x09\xc2\xc4\x14\x61\x6a\
-\x92\xd0\x98\x80\x66\x03\x2d\x0b\x8c\x18\x32\x1b\xab\x99\x54\x43\
-\x7c\x58\x12\x76\x7f\xfa\xf5\xdb\xb9\x6e\xed\xf4\x99\x37\xa9\x35\
-\x52\x08\x25\xe2\x0c\x65\xee\xf8\xd5\x2d\x37\xd2\xca\x2d\x67\x1d\
-\x79\x02\xb6\x08\xd4\x8d\xc1\xe6\x0e\x35\x9e\x02\x4f\xdd\x3a\xce\
-\x3b\xec\x28\x9e\x71\xf6\x79\xec\x57\x1f\x64\x72\xe5\x3a\x46\xd7\
-\xac\xa3\x6c\x35\x99\x6c\x4c\x91\xe1\xa9\x4d\x8e\xa3\xad\x06\xad\
-\xf1\xcd\xcc\xc1\xf0\x07\xe7\x5f\xc4\x3b\xff\xec\x0d\x9c\xbd\xdf\
-\x41\x50\x44\xd0\x4b\xbb\x0b\xe8\xcc\xb1\xd8\x86\x8b\x14\x51\x92\
-\x31\x5b\xa2\xd6\xf2\x70\xab\xc9\xbf\x7c\xf2\xc3\xdc\xb1\x79\x23\
-\x32\x38\x80\x16\xa4\x3a\xdf\x19\x8b\x7c\xa6\xef\xbb\xb3\x5d\xe1\
-\xea\xf3\x43\x85\x1e\x4c\xc5\x4b\x29\x41\x60\x9c\x63\xe3\xc4\x18\
-\x9b\x36\x6e\xe4\xe2\x33\xcf\x45\xc4\x90\x5b\x41\xbc\xa6\x76\x81\
-\x9d\x2c\x40\xf4\x45\x15\x2f\x05\xce\x18\x54\x0c\x3d\x73\xe6\xf0\
-\x93\x6b\xae\x64\x4a\x40\x9d\x89\x45\x6e\x21\xf2\x48\x3c\x39\xa9\
-\xe7\xa2\x02\x30\x9a\x5a\xa5\xa5\xda\x68\xf5\xb1\x4c\x5e\x8b\x16\
-\x3d\x1e\x7e\xff\x82\x8b\x98\x9b\x65\x9d\x6a\xcf\x47\x91\x2d\x8b\
-\x81\x94\x69\x01\xbe\x87\xd7\xac\x61\xac\xd5\xc2\xd6\x33\xca\x59\
-\xc5\x15\x04\x2d\x4b\x72\x97\x63\x5a\x2d\xec\x54\x93\xf9\xbd\x03\
-\xcc\x1f\x5a\xc0\x21\x07\x1c\xc0\xdc\xfe\x01\x7a\x6c\xc4\xb5\xb7\
-\xac\xa1\x55\x94\xac\x5c\xbd\x8a\x07\x1f\x7a\x98\xb5\x1b\x37\x30\
-\xe1\x4b\x7a\xfa\x7b\xf1\xf5\x5a\xc4\x09\x68\x40\x35\x1e\x35\x2a\
-\x21\x12\x21\xa8\x4f\x27\xac\x69\x17\xa2\x08\x81\xe0\x04\xca\x80\
-\x69\x0a\x21\xab\xd3\x5a\x50\xe3\xdd\xdf\xfe\x26\xa8\xe3\x4d\xcf\
-\x7d\x3e\x65\x51\xe2\x33\xda\xa0\x20\x7c\x41\x28\x95\xe3\x07\x87\
-\x39\xfe\xf7\x5e\xc4\xab\x2f\x7e\x2e\xbf\xbc\x6d\x09\x97\x2f\x5b\
-\xc2\xc3\x8d\x71\x56\x3f\xbc\x82\x81\xa0\x2c\xda\x6f\x1f\x0e\x58\
-\xb4\x0f\xcf\x3c\xef\x42\x4e\xda\x77\x31\x7d\x40\x28\x4a\xea\xd6\
-\xa1\x11\xb5\x3f\xeb\x7d\x18\x4c\x40\x15\x32\x2c\x2d\x1f\x50\x67\
-\xf8\xfc\xcf\x7e\xcc\x55\x0f\xdc\x8b\xdb\x67\x3e\x45\x59\x60\x03\
-\x60\x14\xbf\x05\x47\xde\xd6\xd8\x0c\x76\xa2\x16\xe8\xba\x95\xd2\
-\x26\x9c\x8a\x91\xc8\xf2\x24\x96\x60\x0d\x6e\x68\x0e\xbf\x5e\x72\
-\x2b\xdf\xbe\xf2\xd7\xbc\xe2\x82\x0b\x69\xf8\x40\x4f\x50\x8c\x13\
-\x3a\xfd\x7e\x4d\x9b\xc9\x29\x83\xc4\x72\xe4\x39\x69\xbf\xc5\x3c\
-\xe3\xb8\x53\xf8\xef\x1b\xae\x24\x5f\x38\x9f\x66\xa3\xc0\x8a\x8d\
-\x3d\x17\x9e\x8c\x06\x40\x97\x4c\x2b\x89\x96\x74\xf0\x65\x8e\xc9\
-\xa2\x64\xb2\xd5\x42\x7a\x7b\xab\x8c\xf3\xa3\x8a\x83\x69\x80\xdd\
-\xf6\x4f\x55\x49\xf6\x7d\x0f\x3d\xc8\xe6\xa9\x09\xa8\x0f\x75\x78\
-\x3f\x1e\x4d\x54\xb1\xd6\x12\x5a\x2d\x7a\x54\xf8\xab\x3f\x7d\x0d\
-\xcf\x39\xf1\x34\x86\x5c\xc6\x02\xe7\x18\x04\x6a\xe9\xad\x9e\x58\
-\xea\x3b\x01\x3c\xb2\x61\x3d\x77\x3d\xbc\x82\xeb\x96\xdd\xce\x95\
-\xcb\x96\xb0\x74\xe5\x0a\x9a\x46\xd1\x3c\x03\xdb\x87\xcb\x1c\xe2\
-\x4c\x0c\x02\xf9\xe4\x3b\x6a\xc7\x0a\x08\xaa\xa8\x86\xd8\x2f\x5d\
-\x0d\xa1\x00\xeb\x32\xa4\x7f\x98\x8f\x7e\xf3\x9b\x0c\x65\x35\xfe\
-\xea\xe2\x67\x43\xd9\x24\xb7\x0e\xd4\x60\xc4\x22\x39\x14\xa5\xc7\
-\x0b\x0c\xf7\xd4\x79\xf1\x99\x67\xf2\xe2\x33\xcf\x64\x0c\x65\xc3\
-\xf8\x66\xc4\x59\xe6\xd5\xfb\xe9\x27\x31\xd9\xfa\x80\x7a\x4f\x9e\
-\x65\x34\x8a\x22\xfa\xac\x33\x6b\xe3\xb7\x35\x34\x28\x53\x28\x39\
-\x8a\x69\x0a\x79\xcd\x70\xeb\xc6\x4d\x7c\xf5\xb2\x5f\x10\x06\xfb\
-\x08\x41\x23\xbd\x59\x82\x11\x7b\xf5\x74\x27\xfe\xda\xa0\xca\x69\
-\x19\x1b\x76\xda\x66\xc8\xca\xf8\x6f\x69\x63\x3a\x53\xd3\x0d\x1a\
-\xeb\x52\xda\xd6\x10\x08\x84\x2c\xe7\x2b\x3f\xfc\x3e\xcf\x38\xf3\
-\x1c\xf6\xab\xd5\x22\xdc\x42\x7d\x6a\x29\x5e\x29\x35\x69\xd7\x6c\
-\x05\x2d\xb1\x38\xe6\x02\x2f\x3c\xe7\xa9\x7c\xff\xd6\x1b\xd8\x3c\
-\x35\x85\x93\x1c\x13\x0c\x5e\x43\x07\xe1\xf8\x24\x14\x99\xf9\xc4\
-\x5a\x34\x94\x98\x2c\x63\x64\x74\x9c\xbb\x1e\xb8\x9f\xe3\x4f\x3e\
-\x65\x56\xd7\x72\x24\x34\x5f\xfb\xc2\x5d\x91\x76\x80\x87\x36\x6d\
-\xc0\x87\x40\x86\x50\x76\x75\x68\xdf\xe6\xd8\xa7\xc5\xab\x06\x0a\
-\xef\xb9\xeb\xe1\x15\x34\x27\xa6\x68\x8d\x8e\x12\xc6\xa7\xc8\x44\
-\xe8\xc9\x6b\x0c\xf6\xd4\x39\xf6\x90\xc5\x1c\xb2\x68\x3f\x0e\x9c\
-\xbf\x80\x93\xe6\xcd\xe7\x84\x79\xf3\xf9\xdd\x93\x4e\x61\x65\xab\
-\xc9\x75\xcb\x97\xf1\xcb\x25\x37\x70\xeb\xdd\xcb\x58\xb7\x66\x33\
-\x23\x23\xa3\x4c\x52\xd2\x34\x01\xea\x0e\x32\x07\x2e\x62\xe1\x43\
-\x10\x72\x57\xc3\x59\x4b\xa9\x01\x5f\x65\x32\x82\xe2\x14\xcc\x60\
-\x1f\xef\xfb\xef\x2f\x50\x33\xc2\x6b\x9f\xfe\x2c\x7c\xb3\x24\x4f\
-\x18\x25\x2f\x8a\x71\x36\x41\x12\xb4\xdd\x8e\x7a\x9e\x18\xe6\xf6\
-\x0f\xd1\x00\x72\x40\xbc\xc7\x04\x10\x63\xc0\x3a\x14\x25\xcb\x62\
-\x0f\xc0\x0e\x5c\x66\x36\xe2\x53\xf1\x53\xcc\xef\x7f\xe3\xf2\x5f\
-\x73\xcf\x86\xb5\xc8\xfc\x21\x8c\x8f\x3e\x72\xb0\x50\xf8\x02\xb1\
-\x5b\xab\x5f\xd8\x35\x56\x7d\x5b\x07\x75\xe1\x3d\x2a\xa4\x5a\x04\
-\x72\x15\x9d\x32\xa0\xfe\x1e\x6e\x5c\xb5\x82\x4b\xae\xb9\x82\x37\
-\x3c\xf5\xe9\xb4\x8a\x92\x9a\x95\x84\x63\x48\x6b\xad\x8d\xf5\x77\
-\x18\x2b\x84\xc2\x13\x4a\xe5\xa2\x13\x4f\xe6\x29\x47\x1d\xc7\x25\
-\x77\xdc\x0c\x83\x39\x85\x57\x9c\x75\x94\xe2\x53\x08\xf1\xc9\x24\
-\x89\x2f\x13\xa8\x7c\x20\x4d\xd6\x2f\x1a\x03\xd0\x9b\x5b\x9b\xb9\
-\x6b\xe5\x0a\x38\xf9\x94\x18\x1b\xa8\x60\xf8\x5b\xf4\x0a\x88\x57\
-\x71\x84\x32\xc2\x56\xbb\x09\xab\x92\x72\x9d\x04\xd6\x16\x8d\x18\
-\x0f\x48\xc9\x9b\xae\xb7\x6c\x55\x14\xc1\x17\x11\xa8\x33\x69\xe0\
-\xeb\x3f\xbe\x04\x8a\x12\x6c\xf2\x36\xb4\xe3\x24\x0e\xd6\x73\xf6\
-\xef\x9f\xc3\xa9\x07\x1e\xc6\xef\x9d\x73\x2e\xe7\x1f\x77\x3c\xfb\
-\xf6\xf6\xb0\x7f\x5e\xe3\x05\xc7\x9e\xcc\xef\x1e\x7b\x32\x1b\x26\
-\x37\xb3\x7a\xf5\x3a\x6e\xbf\xef\x1e\xd6\x37\x27\xd9\x6c\x02\x0f\
-\x6c\x58\xc7\xb2\x15\x0f\x31\x3a\x31\x49\xb3\x55\xe2\x0b\xcf\xe4\
-\xd8\x24\xe3\xc5\x14\x6a\x4d\x4c\xc1\xd5\x72\x6c\x9e\xd3\x08\x25\
-\x62\x32\xf2\x9e\x1a\x1f\xf9\xfa\x57\xe9\x9f\x3b\xcc\x2b\x4f\x3d\
-\x83\xa2\x28\x20\x08\xce\xd8\x08\x68\x21\x7d\xb9\x84\x4b\xaf\x3a\
-\x1d\xf7\x40\xdc\xe4\xd6\x4e\xe3\x3d\xa8\xf0\x8e\xd3\x5f\xd9\xc6\
-\x98\xb4\xcd\x26\xa5\x97\x48\xea\xe1\x6b\x86\xbb\x5b\x2d\xbe\x73\
-\xc3\xd5\x84\x7a\x8e\xf3\x01\xe7\x63\x94\xbb\xe5\x62\x0a\x52\xbb\
-\x6a\xe0\xab\xb1\xdd\xca\x1c\xee\x14\x51\xa0\xe8\x1e\x80\x2e\xc6\
-\xce\xa0\x71\xfe\x4b\x3c\x28\x34\x73\x8b\xf6\x5a\x7e\x70\xf5\x55\
-\xfc\xd1\x05\x4f\x63\xa1\x73\x68\x28\x53\xb1\x51\x45\x19\x2a\x6d\
-\x64\x68\x80\x88\xd0\x2c\x02\x73\x10\x5e\x7c\xce\x53\xf8\xc5\x92\
-\x9b\x98\xb4\x4a\x50\x1f\x31\x1b\xf6\xc9\x18\x06\x0c\xa8\x68\x0a\
-\x12\xa7\xbc\x7a\x42\x65\x4a\xf0\x48\x29\xb4\xb4\x64\x34\x36\x60\
-\xa7\x08\x21\xf1\xb6\x76\xd6\x8d\x87\x94\x48\xd5\x94\xf2\xdf\xca\
-\xba\x55\x11\xc4\xc4\x06\xa0\x9b\x27\xc6\x30\x46\x66\x85\x2a\x02\
-\xda\xe4\x0d\x11\x63\x2f\x64\xc3\x73\xb1\x98\xc4\x54\xdb\x15\x37\
-\x92\xc0\x66\xdf\x60\xbc\xdc\xcc\xb2\x3b\xae\xe6\x7f\x6e\xbb\x8a\
-\x93\x17\x1f\xcc\x8b\xce\x7f\x1a\x2f\x3c\xfb\x29\x1c\xd2\xd3\x0b\
-\x2d\xa5\x2f\xeb\x67\xf8\xd0\x41\x4e\x38\xf4\x30\xaa\xee\x71\x0a\
-\x8c\xb6\x0a\x9a\x3e\xd0\x12\x65\xf5\xa6\x4d\x2c\xbb\xff\x3e\x1e\
-\xda\xb4\x8e\xa6\x06\xc6\x8a\x16\x77\x3d\x74\x3f\xcb\x57\x3e\x4c\
-\xd3\x44\x18\xb1\x29\x4b\xd6\xae\x5a\xc3\x1b\xff\xf3\xdf\x98\xff\
-\x0f\x6f\xe2\x05\xa7\x9c\x45\xab\xd5\x02\x5c\xaa\x9e\x9a\xee\x6f\
-\x47\x6b\x48\x76\xfc\x79\x5b\xf9\xc9\xc0\xe5\x37\xde\xcc\xf2\x87\
-\x1f\xc2\x2d\x18\xc4\x87\xb2\x4d\xb0\xdb\xb6\xa5\xf7\x10\x51\xef\
-\xb1\xfd\x7d\xdc\x76\xf7\x9d\x5c\xb3\xf4\x36\x5e\x78\xe2\x49\xb1\
-\x56\x20\x99\xfd\x6d\xf2\x90\xf4\xfe\xea\x35\x63\x62\x39\xf7\x53\
-\x4f\x3f\x93\x63\x7e\x78\x10\x37\x6c\x5c\x8d\xeb\xeb\xa7\x7c\xb2\
-\x76\x11\x9e\xb1\x2c\x84\x14\x48\x0d\x31\x26\x66\xc5\x42\xe6\x68\
-\x25\x46\xa5\xb6\x61\x66\xa4\x5d\x20\x34\x53\xdc\x56\x93\xf9\x21\
-\x80\xb1\x8c\x34\xa7\x78\x70\xc5\x0a\xc4\x65\x29\xbf\x3f\x8b\x9b\
-\x6c\x97\x6e\xc6\xeb\x16\xad\x16\x5e\x4c\xc4\x83\x57\x6e\x5b\xaa\
-\xad\x31\xd6\x81\x53\xb2\xbe\x41\xa6\xca\x92\xab\x37\xac\xe0\x86\
-\xaf\x7c\x96\xaf\x5d\xfa\x13\xfe\xe8\x82\x8b\x79\xfe\xd9\xe7\xb1\
-\x78\xce\x10\x7d\x40\x43\x95\xc2\x7b\xac\x87\xcc\x58\x86\x8d\x03\
-\x17\x4f\x8d\x83\xf6\xdd\x97\xb3\xf6\xdd\xb7\x7d\x0b\x25\xb0\x51\
-\x03\x1b\x47\x46\x69\x4a\x24\x1b\x1d\x9b\x18\x63\xe5\x43\x0f\xf2\
-\xc8\x7d\x0f\x90\x8d\x37\x80\x58\xdc\x12\xa3\xd6\x4f\x0c\xb4\x24\
-\x7a\x57\x82\x17\x61\x04\xf8\xc9\x55\x97\x53\xa4\x94\xa9\x2a\x94\
-\x29\xa1\xb0\xdd\xf4\x61\xbb\xb2\x08\x10\x14\x93\x39\x26\xd4\x73\
-\xe9\x75\x57\xf3\xec\x13\x4f\x22\x13\x49\x55\x86\x5d\x45\x4a\x1d\
-\x36\x51\x02\x60\x4d\x04\x54\x2d\xb4\x8e\x17\x3f\xf5\x19\xdc\xf4\
-\xf9\x4f\x61\xea\x7d\x69\x90\xf6\x94\x01\xfa\x0d\xc6\x53\xdb\x09\
-\x80\xe4\x72\x47\xab\xd7\xab\x87\x2c\xe3\x9e\xfb\xef\x65\x02\xa5\
-\xd7\xb9\xc8\x2d\x19\xb6\xbd\xa8\xdc\xcc\x2b\xc7\xda\xeb\xc8\xf9\
-\xdc\x6a\x35\x19\x9d\x18\xc7\xd5\x6a\x94\xdb\x73\x28\x25\x25\x50\
-\xa5\x20\x82\x6a\x1b\x25\x57\x7d\x94\xf8\x10\x2d\x3e\x6b\x28\x1a\
-\x05\x64\x19\xd2\xd3\x87\xf6\x08\x37\x8d\xae\x67\xc9\x57\x3f\xc7\
-\xa7\x2e\xfd\x31\x17\x9e\x76\x06\x4f\x39\xea\x48\x4e\x3f\xe6\x38\
-\xf6\xe9\xe9\x27\x77\xd0\x2c\x4a\xac\x82\x09\xf1\xba\xc1\x08\xa5\
-\x06\x9c\x2a\x0e\x8b\x0d\xb0\xd0\x38\x16\xce\x9d\xdb\xbe\xe5\x30\
-\x38\x17\xb3\xef\x62\xe4\xac\x0b\x00\x28\x35\x24\x02\x0b\x8b\xb1\
-\x5b\x9e\xfe\x8f\xc7\xf9\xab\x09\xc6\x69\xad\xe5\xee\x95\x8f\xb0\
-\xf4\xc1\x7b\x71\xfd\xbd\x51\x63\x1b\x21\x74\x71\x74\x74\xbb\x5b\
-\xbb\xbd\x18\x43\xe1\x3d\x52\x77\xdc\x78\xef\x5d\x3c\x34\x31\xc6\
-\x61\x7d\x03\x5d\x6b\xa2\x5d\x8f\x9a\x9e\xc5\x87\x97\xc4\xb6\x04\
-\x3c\xff\xec\xf3\xf9\xc6\xa5\x3f\xe5\xa6\x4d\x6b\x90\xa1\x3e\xb4\
-\x64\x4f\x32\x92\x7e\x23\x89\x38\x98\x4e\x10\x46\x53\x0f\x8e\x55\
-\xab\x57\x33\x32\x31\x46\x4f\xdf\x60\x57\x71\x67\x5c\xe3\xd3\x98\
-\xa9\x25\x56\x13\xd3\x4e\xaa\x56\x1d\x7e\x53\x74\xbd\x59\x94\x14\
-\x21\x46\xc8\xfd\x36\x88\x1a\xb7\x7a\x63\x22\x9d\x62\x84\x6e\x0b\
-\xa3\xdb\x9f\x4d\x7e\x8c\xa2\x88\xc9\xa1\x88\x1a\xca\x8b\x20\xbd\
-\x7d\x84\x81\x41\xee\x9c\xdc\xcc\x9d\xbf\xfa\x21\x5f\xba\xfc\x47\
-\x1c\xd8\x3f\xc4\x45\x27\x9d\xc1\x0b\x2e\xb8\x90\xd3\x17\x1f\xca\
-\x20\x50\x86\x48\x3f\x1e\x88\x26\x10\x92\xf2\xcb\x26\x9e\xea\xea\
-\x63\x8a\xae\xd4\x90\x48\x29\x49\x79\xfb\xe8\x77\x3a\xe7\xb6\xbc\
-\xb1\xc7\x75\xc6\x3a\x87\xdc\xcd\xf7\x2d\x67\xe5\xd8\x08\x2c\x1c\
-\x8e\xe5\x80\x5a\xf9\x73\xd2\x6e\xa0\xb9\x27\x19\xba\x62\x1d\xda\
-\x5b\xe7\x9e\x75\xab\xb9\xe5\xfe\xe5\x1c\x71\xfc\x29\x1d\x5e\xc9\
-\xee\x37\xce\x08\xee\x1b\x81\x50\x06\x0e\xef\xe9\xe3\xc5\x17\x5c\
-\xc4\xd2\x6f\x7e\x11\xaf\x9e\x52\x23\x4a\xb4\xca\x23\xb4\x0f\x1d\
-\xb6\xcc\x9a\xec\x69\xd2\x39\xcb\x35\x6e\x6c\x8d\x0d\x41\x7d\x50\
-\x7c\x59\x50\x04\x4f\x08\x1d\xd5\x20\x55\xfa\x4e\x64\xc6\xdf\x57\
-\xec\xd3\x6d\x5c\x55\x34\xdd\x43\x2a\xcb\x1d\x6f\x34\x68\x14\x05\
-\xc1\x6e\xdf\x62\xd4\x19\x6e\xc0\x56\xc5\x80\xb7\x9a\x2a\xdd\xc0\
-\x04\x83\xf5\x16\x5b\x1a\x28\x85\xb2\x08\x48\xbd\x17\x33\x77\x98\
-\xc9\xfe\x7e\xee\x6e\x4d\xf1\xf1\x5f\xfc\x88\x57\xbe\xe7\x1d\xbc\
-\xe1\x13\x1f\xe4\xfb\x77\xdd\xc1\xa4\x31\x88\x71\x64\x2d\x4b\x4f\
-\xd3\x60\xcb\x44\x01\x16\x11\x44\x11\x5b\x8e\x10\x6c\x8c\xdc\xe3\
-\x1c\x65\xc5\x9d\x27\xd1\x32\x2a\x7d\x49\xd8\xce\xad\xb6\x3d\x3d\
-\xf5\xb6\xc0\x63\x8b\x61\x1c\xb8\xe9\xee\x65\xb4\x5c\x54\x78\x6d\
-\x9c\x33\x5b\x09\xf4\xed\x09\x12\x40\xbd\xe2\x9d\x65\xb3\x78\x6e\
-\xbe\xe7\xae\x88\x88\x6e\x73\x17\x54\x95\x01\xda\xae\x8a\xec\x64\
-\x38\xa5\x5d\x5c\xfe\xfc\x73\xcf\xe7\xf0\xe1\x05\xe8\x64\x33\x32\
-\x2d\xa7\x7e\x95\x12\x2a\x30\x58\xc7\x82\xaa\x7e\xde\x03\x47\xb3\
-\x43\x8e\x9a\xc6\x20\x96\xfe\xa6\x81\x73\x8e\xa6\x2f\x62\x65\x2a\
-\x33\x1a\xe5\x6c\x65\xd9\x6e\x49\x56\xd3\xf5\x26\xaf\x01\xaf\x91\
-\xea\x79\x36\xec\x22\x8f\x7d\xe7\x33\x1e\x6d\xd6\xb0\x84\xed\xeb\
-\xaa\x17\x37\x41\xa0\x00\x29\x04\xeb\x73\x82\x66\x98\x79\xf3\x59\
-\x55\xb3\x7c\xf9\xe6\x6b\xf8\x93\x0f\xbc\x8b\x57\x7e\xe0\x3f\xf8\
-\xf6\x92\x9b\x59\x53\x34\xa1\x9e\x61\xb3\x3a\x56\xf2\x48\x56\x62\
-\x04\xb1\x42\xcd\x1a\x7a\xc5\x92\x15\xe0\xa6\x3c\x79\x43\xb0\x85\
-\xe2\x43\xb4\x0e\x8c\x49\x05\x3f\x15\x27\xc0\xe3\x20\xd5\xd8\x69\
-\x4a\xb9\x6e\xf2\x2d\x6e\xbc\xeb\x0e\xa4\xa7\x27\x96\x56\x7b\x6d\
-\xcf\x6a\x37\x6f\xe6\x9e\x22\xa2\x60\x13\x3d\x78\x59\xcf\x58\x7a\
-\xff\xbd\x8c\x57\xfc\x81\x5d\x95\xe3\x11\x44\x10\xff\xc6\xa2\x98\
-\x76\x9b\x11\x25\x14\x81\x23\x06\x87\x78\xc1\x79\x4f\x21\x1b\x9b\
-\xa4\xc7\xe5\xd3\x3b\x30\xef\x88\xf5\xb9\x9b\x4b\x3b\xe0\x47\xb4\
-\x8e\x63\x21\xb5\x6e\x95\x0c\xa4\xda\xe6\xc9\x06\xee\xfc\x52\xba\
-\x9e\x6e\x9e\x9c\xa0\xe5\x63\x60\x61\x47\x27\x5d\xac\xaf\x16\x45\
-\x6a\xd8\x91\xcc\xe3\x2a\x00\x5e\x65\x3b\xdb\x15\x63\x2e\xa3\x4c\
-\x15\x76\xd9\x9c\x39\x4c\x16\x05\x3f\x5c\xb6\x84\x5f\xde\xb1\x84\
-\x63\x0e\x3e\x8c\x53\x8e\x39\x86\x03\x87\xe7\x71\xc0\xf0\x02\xf6\
-\x5b\xb8\x88\xb9\xfd\x03\xf4\xda\x1c\x4b\xec\x1b\xb8\xa8\xaf\x8f\
-\xfe\xcc\x40\x09\x3e\x94\x84\x44\x5d\xde\x55\x53\xb1\xe5\xc9\xde\
-\x3d\x18\xbf\xc9\x84\xcc\xe4\xfa\x43\x51\x63\xd8\x38\x3a\xce\x44\
-\xf0\x14\xc1\xa7\x4a\xc8\xf8\xe5\xd5\x48\x3b\x95\xbe\x27\x99\xae\
-\x16\x89\x3d\x19\x55\x21\x77\x2c\x5f\xb1\x82\xb1\x46\x83\xb9\xbd\
-\xbd\x5d\xd6\x67\xb4\x1a\x13\x08\x32\x3d\x4d\x69\x50\x2b\x18\x1f\
-\x83\xbb\x2f\x79\xea\xd3\xf9\xce\xaf\x2e\xe5\xee\x89\x71\x6c\x4f\
-\x5f\x82\x8d\x6b\x6c\x59\x66\x9e\x1c\xf8\xe0\x8e\x65\xd3\x31\x71\
-\xb4\xfa\xd9\x08\x5e\xb4\x9d\x29\x69\xbb\x00\xd0\xb6\xae\xba\xd7\
-\x96\xab\xf0\xe5\xed\x4c\xb5\xc6\xba\x78\x80\x75\xeb\xd7\x31\xd9\
-\x6c\x40\x4f\x7d\x16\x10\xc0\xc7\xb8\xe9\xea\x87\x2e\xb3\xcc\xa7\
-\xea\x56\xed\x2a\x6f\x8a\xb8\x90\x2e\x75\x23\x15\xa1\xa7\xa6\x26\
-\x97\x19\xa1\x2c\x62\xd9\xee\x50\x1f\x2d\xe7\xb8\x6e\xcd\x03\x5c\
-\xf7\xf0\x3d\x98\x20\xf4\x99\x1a\x35\x9b\x93\x5b\x4b\x9e\x39\xf0\
-\x25\x39\xca\xc9\x47\x1c\xc9\xb3\xce\x3a\x87\xd3\x8e\x3e\x96\x23\
-\xfa\x62\xe3\x91\x16\x01\xf5\x09\xbf\x1e\x02\xd6\x65\xd3\x39\xfa\
-\x77\x50\xb0\x39\x42\xab\x63\x89\xa6\xb3\x70\xcb\x9d\xcb\xd8\x38\
-\x36\x86\xe9\xed\x41\x30\xd8\x10\xf9\xf7\xca\xaa\x4a\x6e\x0f\x3b\
-\xcc\x4c\xd5\x0e\x32\x37\xe0\x1c\x93\x13\x05\xeb\x37\x8d\xb2\xb8\
-\xb7\xb7\x1a\xa1\xf6\x7b\x4b\x22\x51\x4a\x35\xed\x41\x02\x41\x24\
-\x72\x0c\x86\xc0\x91\x73\xe6\xf1\x87\x17\x3f\x97\xb7\x7c\xfb\x6b\
-\x48\xad\xde\xa6\xc0\xb6\xd6\x3e\x61\xed\xce\x77\x19\x49\x25\xb9\
-\xed\x54\xaa\x2a\xe2\x2c\x93\x53\x53\x6c\x18\xd9\xc0\x51\xf3\x17\
-\x45\xd8\xb4\x98\x69\x31\x80\x6e\x71\x1d\x24\x5b\xba\x66\xbb\x48\
-\x03\x46\xc7\xc6\xe2\x29\x65\x23\xf5\xf4\x6f\x2a\x15\xc4\xb3\xfd\
-\x5c\xc1\x77\xb1\x85\xb5\x89\x1e\xda\x41\xe1\xc8\x62\x5b\xfd\x89\
-\xa9\xb8\x07\xdb\xbf\x8b\xf8\x7f\xc4\xd0\x6c\x15\xd8\x5a\x0f\x59\
-\xad\x1f\x51\xa1\x54\x68\x94\x25\x8a\x4f\xd4\xd2\x8a\xfa\x82\xbb\
-\x97\x5c\xc7\xb7\x6f\xba\x9a\x43\xf6\xdd\x97\xa7\x1e\x76\x0c\xcf\
-\x3d\xf5\x4c\x4e\x3f\xf6\x04\x16\xb8\x1a\x15\x75\xa7\x2f\x03\xc6\
-\x48\xec\xf4\x93\x4a\x2c\x15\x4d\xd5\x6a\xdd\x51\x6a\x69\xe3\xac\
-\x4d\x05\xb7\x92\xad\x9f\x3e\xdd\x8d\x3e\x42\x5a\xa0\xab\xd7\xae\
-\x61\xf3\xd4\x04\x6e\x68\x88\xa2\x51\xe2\x30\x9d\x4c\x4d\x35\x60\
-\x7b\x90\x44\x27\xb2\x22\x03\x34\x4c\x16\x0d\x1e\x5c\xf5\x30\xa7\
-\xee\xbf\x6f\x55\x13\x4d\x75\x3c\x75\x47\xa8\xa3\x97\x9b\x02\x7d\
-\x12\x2d\x89\x00\xbc\xe8\xa9\x4f\xe7\xbf\xaf\xbb\x9a\x7b\x46\x36\
-\xa0\xc6\xe0\x89\xf0\x73\xf1\xb1\xc4\xb8\x4d\x3b\xd6\x9d\x2e\xdb\
-\x13\xa4\xeb\x40\xaa\x80\x97\xd3\x23\x78\x82\x33\x8e\xb1\x89\xcd\
-\xac\x58\xb3\x06\x7b\xf8\xb1\x09\xd4\xab\x9d\xa3\xbf\x03\xf7\x05\
-\xc0\xa9\x09\x91\x8c\x33\x0d\x94\x17\xda\x0d\x1e\xa6\x42\x41\xc0\
-\x63\x83\xfe\x56\xb9\xe9\x69\xf8\x75\xba\xae\x13\xa6\xbf\x27\x54\
-\xc0\x77\x31\xd3\x4c\xf3\xb6\x31\xd3\x0e\x6b\xa6\x72\xd0\x00\x48\
-\xe4\xdf\x6b\xd7\x02\x18\xc1\xd6\xb3\x44\x30\x14\x31\xe3\x62\x33\
-\x6c\xbd\x1f\x0d\x81\xbb\x47\xc7\xb9\xfb\xda\x2b\xf8\xec\x75\x57\
-\x72\xe2\x01\x87\xf0\x3b\xa7\x9e\xc3\xb3\x4f\x3c\x85\xd3\xf6\xdb\
-\x8f\x9a\x11\x42\x19\x28\x7c\x89\xcb\x2c\x0d\x4a\x14\xe8\x51\x83\
-\x94\xb6\x8d\xbc\xf2\x79\xec\x66\x9c\xa1\x91\xc9\x38\x68\x0c\x57\
-\xcf\xa4\xcc\x9a\xf1\xbc\x42\x64\x35\x51\xd4\x19\x08\x01\x67\x0c\
-\x05\x15\x1f\x7f\xe4\x38\x08\x15\xef\xc7\x1e\x72\xa0\xc5\xef\xa3\
-\x48\x01\x18\xcb\x78\x28\xb8\x77\x7d\x24\xae\x10\x2d\x23\xd3\x52\
-\x6a\x24\x91\xb5\xb9\x57\x3b\x55\x82\xd2\x65\x36\x5a\xef\x39\xb6\
-\x6f\x80\xbf\x78\xc6\xf3\x78\xd3\xe7\x3e\x81\x1f\x1e\xa0\x29\x21\
-\x81\xd4\x4d\xec\x51\x61\x23\xef\x80\x2d\xc3\x74\xce\xca\xdd\x5e\
-\x62\x90\x4c\xdb\x56\x62\xda\xf8\x01\x62\xfb\xf6\x08\x8b\x6f\x89\
-\x65\x63\x19\xeb\x48\x9c\x46\x3e\x0e\x25\xd2\xf2\x55\x18\x1c\x4d\
-\xe3\x5a\xe1\x73\xe9\x6e\x9a\xdd\xfe\xb7\x72\x1d\x9e\xa0\x85\xd8\
-\xd1\x6a\x8f\xf5\xc6\x99\x37\x24\xed\x4a\x59\x15\x69\xd3\x21\x75\
-\x94\x04\xc9\x27\x12\xa4\x5e\x27\xcb\x72\x9c\x06\x6e\x7f\xe8\x41\
-\xee\xb8\xeb\x6e\xbe\xfc\xc3\xef\xf0\xd4\x93\x4e\xe1\x85\x4f\xb9\
-\x90\xb3\x8f\x38\x96\x41\x0c\x85\x6a\x62\xec\x2d\xd1\x94\x39\x10\
-\x67\x30\x89\xb0\x22\xaf\x6e\x55\x64\xab\x9b\xff\xd1\xa4\xd4\x10\
-\x6b\x08\x8d\xa6\xca\xc4\x44\xe9\xad\x5d\xd8\xfa\x3d\x48\x62\xbc\
-\x37\xe5\xfa\x45\x68\x16\x2d\x36\x4f\x46\x8e\xc9\x0a\x0a\xb4\x85\
-\xc8\x8c\x0b\x24\x89\x0d\xb0\xe1\xc5\xe7\x9e\xcf\x25\xbf\xba\x94\
-\x2b\x56\xde\x87\x99\x33\x40\x68\x45\xa6\x60\x13\x4c\x8c\x0b\x88\
-\xe2\xcd\x1e\x37\x94\x5b\x0c\x49\x5b\xbd\xb5\x8d\x28\xc1\xfb\x10\
-\xb3\x77\x5d\xef\x0f\xe8\x56\x09\x40\xf7\xb0\xa8\xc9\x56\xca\x15\
-\xa7\xad\xae\x88\x0d\x70\x2a\xd8\x12\xa8\x65\x98\xfd\x86\xb9\xdf\
-\x34\xf9\xdc\x8d\x97\xf1\xc7\x1f\x7c\x27\xaf\xfa\xd0\xbb\xb8\xe4\
-\x8e\xdb\x18\x13\xc1\x99\x8c\x8c\x3a\x90\x11\x9c\xa5\xb0\xd0\x8c\
-\x6c\xf5\x38\x0d\xb1\x6c\x17\xd9\xa6\xf9\xbf\x2d\x29\xb5\x4c\x77\
-\x93\x0c\xb8\x3d\xe5\x80\xda\x86\x54\x16\x60\x68\xc7\x71\x4c\x1b\
-\x04\xd4\x6e\x52\x36\xdb\xca\x46\x11\xd4\x7b\x16\x19\xc3\x5f\xff\
-\xe1\x4b\xe9\x6f\x14\x98\xc2\xc7\xe2\x30\x31\x38\x6f\xa8\x17\x06\
-\xe7\xa9\xfa\xa9\x3e\xe9\x24\x9e\x49\xc9\x7a\x92\x47\x87\xf1\xef\
-\x61\x0a\x20\xca\xcc\x86\x9b\x33\x47\xa7\xe1\x4b\x5a\xce\xe0\x6b\
-\x19\x53\xa1\x84\xba\x43\x86\x87\xd8\xdc\x93\xf3\xb3\x3b\x97\xf2\
-\x9a\xf7\xbd\x8b\x3f\xff\xe0\xfb\xf8\xf1\xbd\xf7\x31\xee\x84\xd2\
-\x08\x8d\x32\x15\xaf\x88\xc6\xf8\x82\x84\x68\x61\x74\x15\xc1\x3c\
-\xb6\x08\x05\xd0\x28\x5a\xb4\x5b\x38\x1b\xb3\xa5\xf5\xb0\xa7\x59\
-\x01\x42\x2a\x38\x23\xb2\x4d\x25\x97\x2d\x7e\xd5\x36\x02\x60\xd6\
-\xd4\x06\x56\x04\x29\x4b\x2e\x3a\xe2\x58\x5e\xfe\xf4\x67\x12\x36\
-\x8c\xe2\xc4\x56\x16\x32\x56\x63\xa5\x61\x04\x03\xec\xec\x2f\xff\
-\x04\x4b\x3a\x03\x43\x65\x05\x57\x48\xc0\x6d\x0c\xc4\x1e\xa5\x00\
-\x66\x87\x55\x50\x42\x66\x68\x66\x26\xb9\x0a\x06\x55\x8b\x36\x53\
-\x7f\xc3\x81\x21\xa6\x86\x06\xb9\xe4\xce\xa5\xbc\xf2\x3d\x6f\xe7\
-\xcd\x5f\xf9\x2f\x96\x4f\x4e\x90\x39\x07\x21\xb4\xc9\x29\x83\x6a\
-\x4c\xdb\x75\xe3\x19\x66\xf1\xd9\x0e\x22\x02\xd1\x18\xc4\x24\xf6\
-\xe0\x2e\x1f\x4b\xb6\xf8\x61\xf7\x17\x0d\x51\x59\x8a\xb5\xa9\x61\
-\x4a\x67\x39\xce\xf6\xe0\x9f\x71\x45\x9c\x09\xf4\x02\xaf\xfd\xdd\
-\x17\x73\xe2\xbc\x7d\x60\x62\x12\x31\x86\xd2\xc6\x2a\xc5\xaa\xad\
-\xc3\x1e\xa5\x48\x67\x37\x34\x40\xf7\x5e\xd0\xdf\xc4\x02\xe8\x42\
-\xae\x75\xa3\x04\x77\x71\x99\x75\x1a\x48\x12\xfc\x50\x22\xf1\xa8\
-\x2d\x0c\xae\xb4\x98\x90\x51\x94\xca\x94\x15\xc2\x50\x1f\xa3\x03\
-\x75\x3e\x7e\xe9\x0f\x78\xe9\x9b\xff\x89\xef\xde\x76\x33\xde\x38\
-\x5a\x5e\x63\xea\xb0\xf0\xb1\x73\x52\x17\x7e\x60\xa6\xe5\x51\x3d\
-\x6f\x3f\x92\xbf\x5b\xb7\x39\x94\x25\xde\x27\xce\xbf\x76\xfc\x62\
-\x67\x8f\xe0\xe3\x23\x62\x2d\xa4\x16\xea\xa4\xfe\x0e\x79\x2a\x0f\
-\x9f\x4d\xbd\x65\x77\xeb\x34\x63\x62\x61\x59\x30\x10\x7c\x93\xa3\
-\x07\xe7\xf0\xcf\x7f\xf4\xc7\xf4\x4e\xb6\x70\xa1\x44\x33\x68\xda\
-\x00\xce\x75\x5a\x91\xed\xe1\x22\x8f\xfa\x42\x1c\xb7\x6d\xe1\x78\
-\x1e\xd5\x02\x90\x6d\x5d\x73\x37\x17\xd1\x98\x9b\x36\xa9\x27\x41\
-\x55\x56\x19\x41\x47\x31\x2c\x15\x7c\xa0\x34\x86\x30\x3c\xc4\xdd\
-\xcd\x31\x5e\xfb\x81\x77\xf3\xce\xef\x7c\x8d\x71\x97\x13\xbc\xc1\
-\x78\x8b\xb6\x22\x91\x40\x69\xa5\x8b\x2a\xe5\xb1\xc5\x05\xc0\x3a\
-\xac\xb1\xb1\x37\xde\x1e\x8e\x62\x9b\xa6\x14\x51\x9c\xb1\x0c\x0d\
-\x0c\xb4\x5f\xdb\xde\x38\xbd\x12\x4b\x47\xc4\x18\xd4\x7b\x9e\x7f\
-\xca\x69\xbc\xf2\xa2\x8b\xf1\x23\x1b\xc9\xa4\x44\x6c\x6c\x35\x66\
-\x82\xc3\x8a\xdb\x8e\x2b\x3f\xf9\x64\xd6\x2e\xc0\x9e\xa4\x48\x6d\
-\x88\x0d\x49\x6c\x95\xfa\x34\xf1\x11\x2a\x08\x9a\x2a\x26\x28\xc6\
-\x2b\x2a\x06\xdf\x5b\x67\x72\xc1\x10\xef\xfb\xee\xd7\x79\xd3\x67\
-\x3f\xc1\x28\x8a\xc9\xb3\x08\x54\xd1\xae\x9e\x05\x8f\x21\xd5\x5b\
-\x7a\xf3\x1a\x26\xa4\xc2\xa4\x3d\xcd\xdf\xdf\x9a\x28\xed\x9e\x88\
-\x28\xf4\xd6\x7b\xd8\x7f\x51\xa7\x7c\x7b\xfb\xd5\x5f\x6c\x56\x8a\
-\x58\xf0\x8a\x6d\x96\xfc\xd3\x1f\xbc\x8c\x67\x1d\x73\x3c\xc5\xc6\
-\x8d\x58\x93\xda\x91\xb5\x42\x4c\x7d\xed\xe1\xf2\xdb\x2c\x9f\x47\
-\x55\x00\xdd\x17\xde\x93\x86\x51\x25\x62\x0e\xbc\xe9\xaa\xc3\xa9\
-\x72\x70\xa6\xab\x3b\x91\x06\xb4\xf4\x20\x96\x26\x02\x0b\x17\xf0\
-\x85\xcb\x7e\xc1\xff\xf7\x85\xcf\xb0\xc1\x42\x91\x47\x68\x8a\xd3\
-\x72\x56\xa9\xd2\xca\xdc\x3d\xf8\x80\x03\xe9\xcd\x6a\x94\xad\x12\
-\x53\xa1\xb4\xf6\x60\x89\x05\x98\x26\xf2\xfd\x95\x25\xb9\xcb\xd8\
-\x67\xe1\xa2\xf8\xcb\xe4\xf7\x6c\xcf\xfa\x12\xa0\x2e\x8e\x50\xc6\
-\x5a\x78\x2b\xca\xfe\x36\xe3\x5d\xaf\x7e\x3d\xc7\xcf\x5f\x88\xdf\
-\x3c\x8e\x09\x82\x73\xf5\xe8\x66\xed\xe1\xf2\xdb\xec\x4d\xd3\xe6\
-\x63\xdf\xca\x25\xa5\xcb\x31\xdd\x93\x08\x98\xbc\x51\x4a\x5b\x51\
-\x2b\x77\x36\x7b\xa7\x67\x57\x20\xd8\x80\x5a\xc5\x58\x8b\x06\xc1\
-\x04\x4b\xe9\x05\xb7\x60\x3e\x5f\xf8\xf5\xcf\x79\xcf\x77\xbe\xce\
-\x04\xc4\x26\xa3\xb3\x44\x49\x56\x8c\x2c\xc7\x1e\x7e\x38\xc3\x73\
-\xe7\x50\xb4\x1a\x64\x89\x0c\xa4\xca\x88\xb7\x71\xf1\x7b\xce\x70\
-\x47\x51\x45\x12\xb6\x62\x20\xaf\xb1\x60\x60\x30\x8e\xc9\x8c\xea\
-\xbf\xd9\x91\xce\x00\x2d\xc5\x89\x4d\x65\xb0\x25\xbe\xd5\xe0\x98\
-\xc1\x61\xde\xfb\x86\xbf\xe7\xe0\xc1\x61\xfc\xc4\x44\xcc\x16\xb4\
-\x71\xf0\xd5\x5a\xae\xda\x6b\x55\x68\xc1\x99\x15\x6a\xd3\x51\x84\
-\xb0\xeb\x1c\x7e\xdb\x32\x34\x43\x97\x21\xd9\xae\xa5\xd1\xb0\xc5\
-\xdf\x6e\xed\x07\x43\x30\x6d\x04\x60\x7c\xb9\x03\x6a\x71\x21\x42\
-\x0b\x43\x85\xcc\xda\x53\x44\x2b\xd2\x80\xae\x07\x66\x8b\xd7\x14\
-\xf0\x78\x42\x28\x63\xb0\xaf\x08\x04\x04\xb7\x70\x98\x4f\xfc\xf4\
-\x7b\xfc\xcf\x6d\x37\x52\xb8\x8c\xd2\x47\x5a\x6b\x9f\x10\x5a\x5d\
-\x45\x8e\xd3\x27\x21\x15\xfd\xcc\xc9\x6b\x0c\xd7\x72\x0c\x05\x9e\
-\x92\xd8\x71\xcc\x00\x16\x6f\x05\x93\x36\xcb\x9e\x22\x8a\x10\x8c\
-\x43\x8c\xe0\x26\x27\x39\xeb\xa0\xc3\x58\xd4\xdb\x47\x00\xbc\x31\
-\xb1\xfd\x77\x1b\x52\x3d\x8b\x0b\x0a\x88\x95\xd4\x83\x42\xb1\xf5\
-\x1c\x97\x67\xe0\x0b\x9e\xb2\xef\x21\xbc\xf7\x4f\x5f\xc7\xe2\x5a\
-\x8e\x6f\x6c\x8a\x7d\x08\x82\x60\xab\x39\xc6\xc6\xb6\x73\xc1\xe0\
-\x42\xc0\xe0\x31\x94\x08\x25\x46\x3d\x46\x03\x26\x84\xf8\x6f\xea\
-\x39\x11\x95\x41\x6c\x57\x27\xba\xe3\x13\x67\xdd\x25\xcc\x46\x1f\
-\xe3\x7d\xdd\x45\xab\x22\x68\xea\xe1\xa9\xd6\x10\x24\x76\x6a\xce\
-\x8c\x61\x50\x4d\x1a\x5f\x30\x6a\x62\xb7\xeb\x2e\xea\x0f\x49\xac\
-\x96\x6d\xc6\xa0\xd0\xae\xc2\xeb\xd4\xa4\xd7\xb3\x1c\x43\x75\x42\
-\xed\x51\x19\xc3\x47\x91\xee\x90\xbc\x89\x96\x4f\xaa\x0d\x30\xd6\
-\x50\x94\x25\xa5\x15\xa6\x9c\xf0\xbe\xff\xfa\x34\x8f\x34\xa6\x90\
-\xdc\x4d\xa3\x15\xdb\x56\xcb\x4e\x01\xd4\x7b\xe6\xdb\x9c\x53\x8e\
-\x3c\x8a\xd0\x98\x02\x49\x54\xe6\x5d\xef\xd3\x9d\xdc\xf2\x6b\xc7\
-\x4a\x24\xad\x88\x98\x89\x80\x34\x5a\x1c\xbd\xff\x81\xcc\x21\x76\
-\x6f\x0e\xdd\x15\x99\xdb\xf3\x9d\xd3\x14\x75\xd9\x6d\xe4\xe2\x30\
-\xad\x92\x67\x1f\x71\x0c\xff\xf9\xb7\xff\xc8\x22\x6b\x29\x36\x8f\
-\x44\x25\x90\x88\x68\x9d\x00\xc1\xa7\xaa\x4b\x49\x9b\x26\x06\x81\
-\xb5\xe2\x89\x30\xdd\xaf\x47\x77\x51\x0d\xa8\x8d\x45\x5b\x3b\x5a\
-\x66\x7b\xb4\x4a\xea\xae\x6c\x43\xfc\x57\x42\x88\x2c\xd6\x0a\x56\
-\x35\x2a\xb4\xb2\xa4\xdf\xe5\x2c\x1a\x9e\xd7\xce\x50\xb7\xd7\xb4\
-\x6c\x69\xa9\x9a\xaa\xfc\xb4\xf3\x21\xb4\x4f\x9f\xe1\xb9\xc3\xd4\
-\xb2\x2c\xb5\x0a\xdb\xf3\x7d\xa9\x2d\x45\xbb\x7c\xfb\x0e\x62\xad\
-\xd4\x40\x56\xaf\xf1\xf0\xba\xb5\x7c\xe3\xd2\x1f\x47\xc8\xa9\x0f\
-\x33\x88\x29\xb6\xb2\x50\xa4\x8d\x4c\xe6\xf4\xa3\x8e\x27\xf7\x82\
-\xb3\x82\x27\xa0\x26\xfd\x8d\x56\xcd\x49\xf7\x14\x8b\x4b\x22\xd4\
-\x47\x14\x2b\x42\x7f\xad\xce\x49\x47\x1f\xd3\x36\xb3\x0d\x9a\x5a\
-\xb0\xa6\x01\x9a\xed\xfe\x6a\x7b\xa7\xa9\x5b\x0e\x20\x21\x90\x6b\
-\xac\x17\x78\xfa\xe2\xc3\xf8\xcc\x9b\xff\x9d\xd3\x17\x1f\x4c\x39\
-\x32\x42\xdd\x40\x26\x01\xef\x5b\x50\xcb\x28\x13\xbb\xae\x4a\xec\
-\x47\x19\xeb\x4f\x6c\x7a\x98\x76\x93\xd8\x36\x9a\x50\xda\x13\xbb\
-\xc3\x47\x48\x65\xa6\x13\xb2\xed\xf7\x79\x13\x08\xc9\x6d\x15\x09\
-\x88\xfa\xd8\x85\x3b\x78\x6c\xf0\x48\xab\x45\x7f\x2d\x67\xbf\x45\
-\xfb\x74\xca\x77\xcc\xb6\xa3\xd4\xa6\x1a\xcc\x69\xff\x26\x99\x3f\
-\x3c\x4c\x2d\xcb\x53\xdb\xec\x3d\xe5\x44\x9a\xbd\x4c\x9b\xef\x54\
-\xa2\xac\x12\x5b\x2f\xb7\x8c\x40\x5f\x2f\xdf\xfa\xd5\xa5\x3c\x38\
-\x31\x8e\x73\x36\x99\x52\x3a\x2d\x9e\xd8\x2d\x4a\x9c\x0b\x07\x9c\
-\x71\xe8\xd1\x1c\x30\x34\x97\xb2\xd5\x8c\x6f\x34\x9d\x35\xb6\xc7\
-\x89\x28\x92\x09\xad\x89\x09\x16\x2f\x58\xc4\xb1\x87\x1f\x49\x09\
-\x58\x31\xb4\x8b\x42\x55\x3a\x01\x81\xed\x94\x0e\xa6\x50\xb1\x0a\
-\x35\x0f\xb6\xd9\xe4\x82\x85\xfb\xf2\x99\x7f\x7a\x0b\x2f\x3d\xfb\
-\x02\xcc\xda\xf5\xd8\xa2\x89\xab\x59\x82\x94\x60\x25\xf5\x26\x34\
-\x10\x1c\x04\x87\x68\xd5\x15\x5b\xb6\xdc\x95\x1d\x6e\x92\x1d\x2e\
-\xd5\xba\x52\xe1\x51\xb1\x20\xc1\x40\xb0\xb1\xc9\x6e\x30\xd5\x43\
-\xf1\x46\xf1\x12\xe2\x73\x09\xd8\x3c\x63\xa0\xb7\xb7\x8b\x0e\x8c\
-\x76\xa0\x79\xe6\xed\x9b\x68\x16\x74\x23\xd1\x3a\xec\x21\x75\x97\
-\x61\x50\x8c\x3c\x79\x5b\x32\xb7\x8b\x73\x44\x63\x55\x95\x44\x60\
-\x4b\x50\xc5\xd7\x32\x1e\x18\xd9\xc4\xe5\x77\x2c\x8d\x6f\xae\x94\
-\xa4\x6a\xfb\xe7\x4a\x81\x68\xc7\xab\x40\x15\x0e\x9d\xb7\x80\x33\
-\x8f\x3c\x96\x62\xb2\x81\x71\x02\x89\xbf\xa5\xa3\x70\x76\xf6\x37\
-\xdf\x81\xa2\xb1\xa9\x37\xad\x26\x67\x1d\x73\x1c\xfb\x64\x39\xbe\
-\xf4\xed\xaf\x69\x7e\x43\xc6\xa9\x69\x65\xec\xc4\x83\x1c\x07\x46\
-\x0c\x3d\x38\xa4\x55\x70\x68\x5e\xe3\xc3\x7f\xfa\x3a\xde\xf5\xe7\
-\x6f\x60\xbf\xac\x8e\x1f\xd9\x04\x65\x03\xb1\x15\x8a\x33\xda\xf8\
-\x12\x6c\x3b\x38\x68\x14\x8c\x8f\x85\x45\x26\x44\xf2\x9a\xcc\x07\
-\xf2\x32\xe0\xfc\x13\xbb\x13\xa6\xc5\x06\x54\xa2\xb2\x52\x1b\x1f\
-\x21\xfd\x8b\x41\x55\x08\xc4\x18\x00\x89\x85\x3b\x15\xfe\x75\x8d\
-\xd0\xf4\xb1\x6b\x13\x30\x49\xd7\x23\xfa\xb2\xa9\x56\xd8\x5a\x72\
-\xe3\x28\x5b\xc5\xb4\xe6\x02\x4f\x1e\x49\x3b\x76\x1a\x22\x4a\xc0\
-\x07\x50\xc5\x67\x8e\x8d\xbe\x60\xe9\x43\x0f\xb4\x2b\xde\x2a\x4a\
-\xa6\xad\x55\x07\xc6\x50\x4a\xec\x9d\x38\x0f\x78\xfa\x29\xa7\xd3\
-\xaf\x40\x51\x80\x2f\x63\x9b\xb1\x4a\x63\x6f\x67\x81\xd1\xae\x24\
-\xdd\xc8\xbd\xaa\x87\x3d\xad\x16\xf3\x6c\x8d\x67\x9e\x75\x76\x6c\
-\x0d\xd7\x85\x0b\x98\x36\xdc\xb3\x95\x64\x65\x45\xf7\x41\x08\x98\
-\xc4\x1e\xa4\x60\x03\x26\x13\x32\x67\xa9\x37\x3d\xfd\xad\xc0\xab\
-\xcf\x7b\x2a\xff\xf5\xe6\x77\xf2\x07\x67\x3f\x95\xe1\x46\x40\xd7\
-\xac\xa7\x5e\x94\xf4\x38\x8b\x0d\x1e\xc4\xa3\xc6\xa3\x26\x20\x4e\
-\x50\x89\xcd\x59\xa3\x11\x17\x62\x71\x8d\x46\x37\xe3\x09\x19\x43\
-\x3a\xd6\x60\x05\x9d\xb6\xde\x90\x85\x8c\xcc\x5b\x5c\x69\x71\xde\
-\xe2\x4a\x83\x34\x15\x4b\x86\x11\x17\xbb\x64\x1b\x8b\x4b\x74\x6b\
-\xc1\x87\x36\x71\xc8\xd6\x64\xab\xab\x4c\xcb\x58\xad\xd6\x5f\xab\
-\xd1\xd3\x53\xc3\x89\x3e\x61\x25\xc1\xbb\x9a\x68\xb7\x76\x24\xb1\
-\x25\x89\x01\x71\x04\x0c\xd4\x6b\x3c\xb8\x71\x03\x53\x80\xcd\x2a\
-\x86\xb5\xad\x57\x60\x29\x11\x17\xef\x8c\x50\x02\x4f\x3b\xe9\x54\
-\x8e\x9a\xb7\x88\x6c\xaa\xc4\x9a\x48\x02\xe0\x35\x46\x64\x1f\x87\
-\x96\x24\x4f\xdc\x98\x75\x41\xa3\x91\xd8\x7d\xc9\x8f\x6c\xe6\x9c\
-\xa3\x8f\xe3\xcc\x23\x8e\x25\x00\x99\xab\x48\x0f\x78\x6c\xe7\x77\
-\x6b\x03\x99\xfe\x4d\x89\x3d\x14\xc1\x63\x08\x62\xda\x49\x9d\xea\
-\x91\x19\x21\xb4\x4a\x4e\x99\x33\x9f\x8f\xbf\xf2\x75\x7c\xe5\x1f\
-\xdf\xca\xab\xce\x7a\x2a\x0b\xa6\x0a\xa6\x1e\x79\x84\x4c\x14\xe7\
-\x14\xa9\x09\x6a\x3c\x41\x9b\xa8\x53\x82\x0d\x60\x02\xea\xa4\x53\
-\x63\x60\x9f\xa0\xf0\xac\x76\xf0\xfc\xc1\xc7\x0e\x4b\x62\x6c\xf2\
-\x44\x2a\x72\x9c\xd8\xdb\xc2\x38\x1b\x83\xd4\xa2\xa0\x1e\xe3\x0c\
-\xce\x58\xac\xd0\x56\xc2\xdd\x37\xdd\xbd\xb2\x66\x94\x08\x47\xf3\
-\xc6\xd8\x48\x03\x9c\x39\x97\xd8\x57\x9f\x0c\x70\xb5\x2d\x65\xe6\
-\xb7\x16\xa2\x02\xb0\xc9\x54\x0c\x5e\xc1\x66\xdc\x71\xef\xbd\x6c\
-\x6a\x4e\xe2\x11\x8a\xd0\xc9\xd3\x6c\xa9\x04\x34\xa5\x6e\x62\x4f\
-\x82\xfd\x7b\xfa\x78\xc9\xf9\x17\x51\x1b\x6b\xd0\x23\x06\x5f\xb6\
-\x50\x2b\x38\x9b\xa1\xbf\x05\x03\xd3\xae\x20\x1a\x02\x55\x7b\xea\
-\xac\x54\xe6\xa8\xf0\xfc\xb3\x2f\x60\x5f\xc0\x15\xb1\xaf\x5f\xf8\
-\x4d\xab\xf5\xa6\x99\xac\x15\xd7\x7d\x7c\xc1\xa7\xc4\x5e\x48\x17\
-\x0e\x4e\x08\x0e\xea\x99\x25\xf7\x81\xfe\xa6\xe7\x99\x07\x1f\xc6\
-\x87\xff\xe2\xf5\x7c\xfc\x6f\xff\x99\x57\x3e\xe3\x59\x2c\x34\x86\
-\x62\xfd\x3a\xc2\x86\x8d\xe4\x21\x5a\x15\x4e\x62\xe5\x27\xc9\xdf\
-\xf6\xe9\x7e\xf5\x09\x4c\x87\x57\xeb\xc7\x24\x6b\x30\x18\x4f\x70\
-\x1e\x75\x8a\xe4\x40\x16\x08\xda\x02\x6d\xe1\x8c\x47\x42\x01\x65\
-\x93\xbe\x5a\x8e\xb3\x59\xec\xef\x63\xa6\x5b\xb0\xd3\x1c\x7e\xdd\
-\x5a\x7b\xf0\x6a\x91\x06\xcf\x40\x7f\x3f\x0b\x86\xe7\x71\xf7\xc6\
-\x4d\x98\x9e\xda\x1e\x8f\x58\xdb\xaa\xc8\xf4\x1f\x4d\x82\xb5\x06\
-\x63\x09\x46\x30\xf5\x8c\x4d\xe3\x63\xac\x5d\xbf\x9e\x85\xfb\x2f\
-\x26\x18\x49\x14\x55\xa6\xcd\xad\x38\xfd\x7a\x89\xcb\x3d\x44\x82\
-\x86\x17\x9c\x77\x21\xdf\xfe\xe5\x2f\x59\x32\xbe\x81\x7c\xce\x00\
-\xad\x46\x03\x63\x2c\x56\x63\x54\x60\x77\x17\x63\x0c\x8d\x91\x4d\
-\x9c\x79\xf0\x11\x3c\xfb\xac\x73\xd1\x32\x36\x6e\x0d\x06\x0a\x42\
-\x87\x58\x65\x7b\xa5\xf2\x94\x48\xae\x80\x90\xf0\x04\xdd\x24\x19\
-\xa9\x98\x4d\x2b\x33\xda\x63\xad\xe0\x1b\x2d\x32\x94\xe7\x1d\x7d\
-\x0c\xe7\x1e\x7d\x0c\x77\x8e\xac\xe3\xf2\x25\xb7\x72\xd9\x0d\xd7\
-\xb1\xf4\x9e\x7b\xd8\x30\x39\x46\xd3\x09\xb6\xb7\x07\xc9\x73\xd4\
-\x1a\x70\x19\x20\xb1\x10\x4c\x1f\x07\xe5\xdc\x61\xe9\xea\x7c\xbf\
-\xa0\x58\x31\x58\x67\x09\x21\xc4\x32\xf4\xa2\x49\x68\x36\x23\x45\
-\x5f\x51\x32\xd4\xd3\x4b\xdd\x3a\x32\x63\xe8\xc9\x73\x46\x8b\x49\
-\xce\x3a\xf8\x70\xe6\xf5\xd6\xd1\x32\xb5\xbc\x93\x99\x17\xef\x3c\
-\x75\x5b\xda\xf6\xe9\xdc\x13\xc3\xa0\x71\x2c\x3e\x60\x31\x97\xdf\
-\x7d\x77\xf4\x29\x9e\x04\xb0\xca\x69\xd2\x9d\x1d\x49\xc3\x64\x89\
-\x7d\x13\xb4\xf4\xe0\x2c\x82\x61\xb2\xd1\x64\xc9\x3d\x77\x72\xf2\
-\xfe\x8b\x69\x69\xc0\xb6\x49\x18\x69\xfb\xaa\x2a\xa9\xbd\xb8\x42\
-\x20\x20\x62\x09\xa5\xe7\xe0\xa1\x41\x5e\xfe\xdc\xdf\xe5\xa6\x2f\
-\x7c\x82\x30\xd4\x8b\x18\x43\xf0\x1e\x2b\x51\x91\xec\x96\x52\xc5\
-\x00\x88\xe6\x6b\x8f\x75\xfc\xd1\xf3\x9e\xcf\x7c\x63\x08\x53\x25\
-\xc6\x99\x36\xf6\x24\x15\x61\x6f\xb7\xf8\x48\x56\xdf\x71\x95\x92\
-\x12\x68\xa7\xbe\xd2\x32\x36\x69\xe0\xcb\xe0\x29\x4d\xc0\x4a\x6c\
-\x24\x63\x82\x50\x34\x9b\x0c\x19\xc7\x39\x73\x16\x70\xf6\x53\x9e\
-\xc1\x9f\x3e\xe5\x19\x3c\xb0\x66\x0d\x97\x2d\xb9\x85\x65\x0f\x3f\
-\xc8\x8d\xf7\x2e\x67\xf5\xf8\x28\x1b\xc6\xc6\x69\xa9\x82\x73\x60\
-\x63\xff\x3d\x4c\x57\x85\xa2\xcc\xc0\x71\xb0\xb5\x27\xed\x3b\xdb\
-\xca\x78\x75\xfe\x6d\xff\xa8\xe0\x9c\xc1\x97\x25\xcd\xcd\x9b\x21\
-\x04\x7a\x33\xc7\x82\x7a\x8d\x43\x8f\x38\x8c\x23\xf6\x3f\x88\x85\
-\x3d\x03\x1c\xb8\x70\x01\xc7\x1e\x72\x28\x43\xb5\x1e\xea\x36\x23\
-\x14\x05\x83\x3d\xf5\x18\x1b\xb1\x26\x05\xb1\xb7\x6d\x69\xb9\xb8\
-\xa4\x3b\x39\x6e\xc1\xa0\x5a\xa2\x1a\xe8\xc5\x32\x4f\x1c\xf8\x62\
-\x8f\x63\xaa\x9d\x8d\xb4\xe7\x2e\x74\xfe\x29\x2d\x68\x32\xc9\x44\
-\x23\x17\xdd\x58\x28\x58\xba\x61\x0d\x05\x60\x4b\x8f\x73\x9a\xe8\
-\x03\x6d\xac\x58\x83\x36\xf4\xb4\x45\x3c\xd9\xeb\x22\x04\xaf\x58\
-\x81\x97\x5c\xf0\x54\xbe\x7e\xcd\x2f\xb9\xe2\x91\xfb\xb1\x83\x73\
-\x31\x53\x0a\x65\x89\x73\x50\x1a\xa2\xd9\x91\xd2\x8a\x59\x32\x0b\
-\x0a\x13\x4d\xdb\xee\xfb\xdb\x29\x23\x94\xd2\x1b\xae\xe2\xab\xb3\
-\x4a\xf0\x1e\x31\xd1\xbc\x6c\x8d\x8f\xf1\x9c\x33\xce\xe1\x0f\x4e\
-\x39\x33\x72\x20\xf6\x54\x65\xc0\xb1\xe5\xbc\xa9\x90\xa7\xdb\xa9\
-\xeb\xcc\xb4\xc0\xcc\x74\x5a\x86\x8a\x5c\x44\x24\xc6\x04\x53\x88\
-\x90\x4c\xa2\xaa\xb1\x2e\x6b\x2b\x07\x0d\x0a\x5e\xf1\x1a\xe8\x75\
-\x96\x13\x17\x2d\xe2\xa4\x8b\x9f\x45\x13\x58\x3d\x35\xc9\xca\x91\
-\x4d\x2c\x5b\xf1\x20\xf7\x3e\xbc\x82\x07\x56\x3f\xc2\x03\xeb\xd6\
-\xb0\x6a\xf3\x26\x1a\x45\x41\xab\x2c\x98\x2a\x4a\x5a\x65\xd9\x21\
-\x76\x71\x36\x35\xc8\x25\x75\xa0\x22\xc5\x8c\xd8\x76\x8f\xbe\x76\
-\xd6\x28\x44\x90\x92\x8f\x3c\x93\x56\x95\xf9\x79\x0f\xc7\x2c\x3e\
-\x84\x53\x8f\x3b\x9e\xd3\x0f\x3b\x92\xa3\xf7\xdd\x97\x85\xf3\x86\
-\x19\x96\x2c\x76\xfe\x4d\xd3\x50\xc1\x81\xc5\x7b\x8c\x57\xca\x10\
-\xdd\xaf\x08\x2a\xeb\x68\x96\xb6\xb2\x4d\xc3\xe7\x48\x20\x8a\x36\
-\x62\x48\x68\x07\xb1\x2c\xb0\xa8\xb7\x3f\x72\x8d\x6f\x47\x6b\xb0\
-\x3d\x4e\xba\x52\x79\x85\x74\x5e\x68\x83\x2c\x6a\x86\xfb\x47\x47\
-\xd8\x0c\xcc\x77\x39\x4a\x11\x5b\x91\xa5\xe1\x0e\xe9\x6d\x52\xf9\
-\x64\x80\x6a\xc0\x5a\xd0\xd2\xb3\xb0\x66\xf9\x9b\x3f\x7c\x05\x4b\
-\xde\xfb\xef\x4c\x35\x5a\x88\xc9\x09\x5b\x21\x64\x34\xda\x89\xda\
-\xb6\xe7\x6c\x67\x2a\xe6\x14\x0b\x89\x0c\x3c\x12\x4f\x74\x1f\x90\
-\xcc\x62\x43\x49\x5e\x94\xcc\xef\x1d\xe0\x6f\x5e\xf8\x52\x86\x48\
-\x68\xbb\x44\x50\x61\xaa\x22\xa0\x2e\xce\xfa\xed\x91\x36\x4b\xf3\
-\x4c\xb8\x75\x1a\xb2\xd0\x6d\xbd\x21\x98\xb4\xf9\x67\x92\xe9\x55\
-\xc9\x16\x83\xc1\xa5\x34\xac\x84\xd8\x16\xfe\xb0\x9e\x5e\x0e\xeb\
-\xe9\xe5\x82\x7d\xf7\xa7\x38\x13\x26\x81\x51\xdf\x64\xb4\x31\xc9\
-\x86\x91\x4d\xac\x5d\xb7\x9e\x55\xeb\x37\xb0\x61\x6c\x8c\x89\xb2\
-\x64\x64\x72\x92\x91\xf1\x71\xa6\x5a\x05\xa5\x7a\x4a\x5f\x32\xd5\
-\x68\x50\x14\x45\x9b\xc7\x20\xce\x7d\x52\x4e\xd6\x92\xfd\xff\xed\
-\xbd\x77\x9c\x64\x47\x75\xf6\xff\x3d\x55\x75\xbb\x7b\xf2\x6c\xde\
-\xd5\x2a\xed\x6a\xb5\xab\xb0\xca\x39\x4b\x20\x24\x81\x00\x19\x44\
-\x0e\x02\x1b\x0c\xc6\x24\x03\xc6\xc6\xc6\x01\xa7\xd7\x38\x1b\x63\
-\x82\x13\x18\x0c\xd8\xaf\x7f\x2f\x18\xdb\x04\x9b\x20\x10\x51\x59\
-\x20\x24\x24\x50\xce\x61\xb5\x79\x52\xf7\xad\xaa\xf3\xfb\xa3\xea\
-\xde\xee\x99\x9d\x95\x66\x61\xa5\x59\x89\x3d\x9f\x4f\x6b\x35\xa9\
-\xfb\xa6\x3a\x75\xc2\x73\x9e\xc7\x15\x34\xc4\xd0\x6c\xb6\xb0\x4d\
-\x47\x51\x14\x0c\x0d\xf4\x33\xe4\x0a\x96\x0c\x0c\x72\xca\x21\x87\
-\xb1\xfe\xc0\xd5\x2c\x10\x4b\xa3\x3a\xc9\x10\xf0\xda\xa1\xd4\x88\
-\xf1\x16\x6b\x1d\xed\x42\x28\x05\x06\xad\x05\x0d\xd8\x59\xab\x7e\
-\x3b\x5e\xe4\x1d\x6b\x00\x9a\x09\x04\xf3\x05\x5b\xbe\x74\x29\xad\
-\xa2\x49\x27\x3e\x95\xc6\x81\x76\x8f\xd5\xbe\xdc\x5a\xee\xbe\xf7\
-\x1e\xb6\x4f\x8c\xb1\xb8\x7f\x30\xe5\x89\x89\x6f\x24\x93\x80\x74\
-\x6b\xfa\x2e\x76\x59\x5d\x83\x4b\x71\xeb\x54\x8c\x9c\xbb\x7a\x1d\
-\x6f\xba\xf0\xf9\xfc\xd9\xbf\x7d\x02\xbb\x62\x19\x65\x91\x25\xda\
-\x94\x9a\xcd\x55\x81\x4e\x4f\xdf\xc6\x7a\x7a\x18\x62\x9f\x78\x13\
-\xa4\xa6\xdf\x52\x51\x82\x25\x15\xc9\x4c\xa4\x08\x4a\x73\xeb\x14\
-\xbf\xfe\x9a\x57\x73\xfc\xc2\xa5\xf8\x10\xb0\xc6\xcc\xaa\x52\xf3\
-\x13\x7e\xf8\xb4\x1b\x51\x75\x00\xab\x10\xa0\xde\xe9\x12\x31\x5e\
-\xf7\x5e\x75\x33\x86\x69\xff\x56\x81\x56\x7a\xef\x7c\xbd\xcb\x98\
-\xa8\xcb\x32\x69\xcb\x80\x18\x86\x6d\x93\xfd\xfb\x9b\x30\xb0\x00\
-\x56\xae\x9e\x76\x48\x53\xc0\x94\x42\xdb\x97\x84\x98\x18\x22\x42\
-\x4c\x05\xdf\xea\xc3\x7b\xb3\x71\x93\x09\x4e\x44\xc1\x5a\x83\x75\
-\x05\x46\xc8\x2c\x94\xd3\x53\x23\xf5\x91\x32\x26\xfe\x48\x55\x25\
-\x36\x92\x3b\x90\x02\xb6\x02\xf7\x4f\x8e\x73\xfb\xc6\x87\xb8\xf7\
-\x86\x1b\x78\xfe\x69\x67\xb2\x6c\x68\x94\x18\x1f\x9b\x6b\xc2\x55\
-\xd7\x64\x5a\x6b\x40\x0c\x9a\x17\xfc\xe1\x6b\xd6\xb2\xb0\x7f\x80\
-\x07\xca\x36\xd2\x28\xe6\xce\xba\xf3\x33\x62\x29\x0a\xb0\x6c\xdc\
-\xba\x95\xc9\xd2\x77\xbf\x6f\x7a\x26\x2a\x7b\x2d\xe6\x9f\x89\x24\
-\x61\x12\xd1\xb4\x03\x28\xbc\xed\x39\xcf\xe3\xd6\xdb\x6f\xe3\x33\
-\x37\x5c\x85\x59\xbc\x90\xe8\x05\x13\x24\x3d\xd8\xc4\x7a\x7c\x19\
-\x12\xa7\x41\x11\x53\xaa\x51\x3e\x51\xad\xa9\x19\x66\x35\x81\x70\
-\xa3\x89\x04\x23\xa8\x0d\xe0\x14\xd3\x29\x89\x9b\xb6\xf3\x92\x33\
-\xce\xe5\xe7\x4f\x3f\x8b\x46\xcc\xb8\xfb\xfc\x40\xa6\x94\x73\x37\
-\x1c\xf1\xce\x06\x2e\x24\x76\x21\x75\x46\xa6\x55\xbe\xab\x7f\xe3\
-\x8c\xaf\x53\x38\xdd\xa3\x4f\x9e\x07\x8e\x6c\x96\xab\xb2\xd5\x7d\
-\x0c\xa0\x26\xa9\x11\xc5\xbc\x59\x86\x9c\x63\xab\x40\x53\x2c\x8d\
-\xc2\x22\x6a\x68\x88\xe9\xfe\x1d\x5d\x40\x5e\x05\x78\xac\xbe\x0e\
-\x19\xc5\x68\x88\x79\x60\x2c\x0b\xeb\x2a\x44\x8d\x39\x7a\xb0\x4c\
-\x29\x14\x45\x4a\x7e\x1e\x21\x72\xc3\xdd\x77\x70\xdd\xcd\x37\xf3\
-\xfd\x9b\x7f\xc4\x75\xf7\xdd\xc1\x86\x6d\x1b\x59\x12\x0c\x67\x9f\
-\x78\x2a\xcb\xe6\x78\x09\x5d\x25\xca\x60\xe8\x46\x9b\x5e\x23\x56\
-\x52\x10\xb1\x60\x60\x80\x7e\x04\x23\x4f\x8d\xaa\xf4\xee\xb0\xe9\
-\x4c\xab\x82\x75\x8e\xf1\x76\x9b\x07\xb7\x6e\xe6\xb0\x91\x51\xd2\
-\xf5\xec\x52\xd2\x56\x37\xbb\xfb\x55\xc2\xc0\x57\xf8\x3f\xa2\xc7\
-\x05\xc3\xe2\xc2\xf2\x9e\xd7\xbc\x8e\x1f\xfe\xf1\x1d\xdc\xb0\x79\
-\x13\x76\x68\x41\x1a\x98\xa1\x3b\xb8\x92\x2a\x8a\xf9\x81\xa3\x52\
-\x80\x9d\x9f\x10\x20\x09\xa4\x28\xd1\x4a\x4d\xb1\xe4\xa2\x20\x5b\
-\xb6\xf3\x8c\xc3\x8f\xe4\x37\x2e\x79\x0d\x83\x21\xd5\x4a\xd4\x49\
-\x96\xb2\x37\x35\x45\xda\x4f\x15\x09\xcc\x48\xa5\x13\xa8\x4f\x7b\
-\xae\x49\xa2\x09\x2f\xd4\xd4\xe9\x46\x2f\xcc\xd6\xf6\xde\x18\x48\
-\x60\xa5\x0a\x35\x2b\xb1\x4e\xf2\xd4\x24\xfd\x06\x03\xb9\xd8\xa7\
-\xf5\x9c\x86\xe6\x31\x72\x27\x69\xd3\x0c\x1a\xd2\x70\x8e\x54\x15\
-\x8a\xa4\x41\xa9\x9a\xd0\xb4\x15\x15\x9d\x66\x6e\x7f\x48\xbb\xb9\
-\x66\xf0\x98\x6a\xc4\x92\xb8\x22\xc9\xf8\x1d\x35\x16\x2f\x82\x35\
-\x42\x30\xc2\x0d\x8f\x6c\xe0\xb2\xcb\xbf\xc3\xa5\xd7\x5f\xc5\x8d\
-\xf7\xdd\xcd\xc6\x6d\xe3\x68\xa3\x45\x1c\xee\x23\x18\xc3\xbe\x23\
-\x0b\x69\xb6\xfa\xe6\x7c\x19\xdd\xf4\xa4\xa8\xba\x18\x29\xf8\x30\
-\xc0\x88\x73\x2c\xee\x1f\xe0\x8e\xcd\xe3\x48\xa3\x51\xbb\xb0\xbd\
-\x91\x40\xb2\xc4\x41\x2f\x4c\xf8\x92\x07\x37\x3e\x02\xfb\xaf\x02\
-\xb2\xc4\x7a\x4f\xf1\xa5\x46\x62\x57\x91\x41\x84\x46\xc6\x61\xd6\
-\x80\x8f\x49\xcf\x9a\xc1\x61\x7e\xff\x17\xdf\xc0\x3b\x3f\xfc\x01\
-\xee\xde\xba\x9d\x62\xa0\x9f\x29\xd1\x54\x50\xf2\x21\xc1\x3c\xb3\
-\x52\x52\xe9\xe6\x77\x66\x30\x12\x90\x66\x03\x28\xc1\x66\x98\xec\
-\x23\x9b\x39\x75\xe5\x2a\xfe\xe8\x75\x6f\x66\x49\x51\x50\x76\x7c\
-\x06\xfd\x74\xeb\x1f\x35\x4a\xf0\xa7\xb9\xee\x52\x2d\xd1\x8a\x8e\
-\x2d\xbd\x5f\xa8\x55\xa4\xd2\xb5\x71\x12\xf3\x10\x5c\x8e\xc5\x7a\
-\xf5\xde\x2a\x34\x4d\x5d\x4f\x90\x3c\x02\x9e\xf4\x1a\x62\x76\x25\
-\x26\x2f\xd0\x48\xc4\xa8\xe4\x3a\x8c\xc1\x92\x95\x6c\x34\xe4\xb4\
-\xa3\x27\x3f\xd3\xbc\xb1\x8a\x99\x0e\xc2\x33\x36\xff\x58\x6b\x9c\
-\x44\x4f\xdc\x01\x21\x50\xe1\x1b\x4b\x04\xb5\x96\x0e\x70\xe3\x03\
-\xf7\xf1\xa9\x4b\xbf\xcc\x57\xae\xbb\x8a\xfb\x1e\xb8\x0f\x1d\x6a\
-\xd1\x69\xb5\x90\x65\x8b\x51\x71\x74\x44\xd1\xc9\x36\xab\x57\x1e\
-\xc0\x60\xab\x8f\x30\x47\x88\x45\x57\x1c\xb4\xca\x9f\x2a\x6f\x84\
-\x42\x8c\x8c\x16\x05\xc7\x1f\x72\x28\x97\x7f\xfd\x6e\xec\xe0\x40\
-\x4d\xe7\xfc\x58\x7c\xe3\x4f\x65\x9b\x49\xfc\x59\x51\x8d\x3f\xbc\
-\x79\x73\xcd\x7e\xd5\xdb\x9e\xaa\xef\x84\xe9\x3e\x73\x12\x05\x13\
-\x95\xa6\x21\x3f\x6c\x01\x71\x06\x2d\x4b\xce\x3f\x70\x3d\xf6\x97\
-\xde\xc6\xbb\xfe\xf6\x6f\xb8\x63\x6c\x33\xc5\xc8\x00\xa5\x7a\xc4\
-\x5a\x8c\x4f\x7d\x1b\x4f\x1a\x0c\xa9\x47\x0c\xe7\xc1\xc4\x0a\x5a\
-\x4e\x41\xcb\x61\x3b\x25\x6e\xa2\xcd\x31\xcb\xf6\xe3\xaf\xdf\xfc\
-\x4e\xd6\x0e\x2f\x80\x10\x88\x45\x3a\xd6\x62\x37\x43\xc9\x03\x69\
-\x44\xdb\x8a\xd4\xad\x2e\x93\x8b\x7d\x31\x86\x3c\xe1\x97\x7b\xf6\
-\x26\x91\x8f\xd7\x69\x80\x50\x4f\x10\x26\x8b\x68\x34\x88\x13\x9b\
-\x10\xee\x00\x00\x5d\x9b\x49\x44\x41\x54\x31\xf5\x74\x9c\x66\x82\
-\x18\x67\xec\xf4\x38\x6b\x86\x6a\x95\xaa\x80\xda\x8c\xc2\xab\x6e\
-\x38\x79\x7e\x78\x96\xd8\xac\x92\x8a\xcb\x0e\x02\x55\x5c\x2e\x3e\
-\x48\x4e\x37\x14\xc5\x3b\x47\x10\xb8\xea\xfe\xbb\xf8\xc4\xff\xfe\
-\x0f\x5f\xbe\xea\x0a\xee\x6b\x8f\xc3\x50\x3f\xcd\x7d\x96\x30\x45\
-\xc0\x8b\xa4\xf3\x8c\x82\xb5\x8e\x18\x22\x47\x1d\xb8\x86\xa5\xc6\
-\xd0\x29\x3d\xce\x9a\xb9\xd4\x00\x62\x8d\xa2\xaa\x4e\x2a\x56\x83\
-\x59\x01\x9a\x06\x56\x2c\x5c\x04\x53\x9d\x7a\xd1\x3f\xd5\x49\x2c\
-\x77\xc9\x14\x4c\x61\x29\x63\xe4\xe1\xcd\x9b\x12\x09\x83\x2a\x85\
-\x4c\x67\xa4\xed\xcd\x3d\x45\x2a\x6c\x86\xc9\x2d\xaa\x74\xcd\x8d\
-\x33\xd8\xe0\x89\x65\x9b\x67\x1c\xb8\x96\xbe\xb7\xbe\x83\x77\xbc\
-\xff\xcf\xb8\x79\xd3\x23\xf4\x2f\x5e\x4c\xa7\xed\x13\x0b\x4e\x94\
-\x1e\x66\x88\x47\xe9\x2f\x3f\xde\xa7\x2e\x69\x61\xf5\xfb\x48\x67\
-\xe3\x36\x4e\xd8\xff\x20\xfe\xfc\x8d\x6f\xe7\x90\x45\x4b\xb1\x65\
-\x99\xfa\xef\xa4\x05\xe7\x66\x21\xd2\xf8\x69\x9e\xa3\x14\xaa\x4b\
-\x1e\x78\xc9\xb1\x7c\xac\x58\x87\x0c\x51\x92\xf0\xab\x34\x0c\xc1\
-\x68\xaa\x55\x40\xbd\xab\x13\x23\x84\x80\x91\x2a\x45\x50\xc4\x64\
-\xd0\x90\x42\xc3\x24\x32\x00\x0d\x9a\xc1\x34\xe9\xef\xa2\x6a\x5a\
-\x78\xf9\x3e\x56\xc5\xbd\xae\xb6\x56\xb5\x9a\x24\x3b\x87\x99\xe7\
-\x5c\x5d\xbb\xea\x67\x95\x43\x48\x3f\x8c\x16\x82\x11\x1e\x2e\xc7\
-\xf9\xb3\x8f\x7d\x84\xcf\x5d\x73\x05\xf7\xfa\x0e\x32\x3a\x8c\x8e\
-\x8c\xe2\x43\xc0\xc7\x88\xba\xcc\x7d\x9e\x23\x4d\xf1\x1d\x1a\x31\
-\xb2\x62\x30\x91\xad\x0a\xcc\x69\xbd\x9a\x99\xd5\xd4\xf4\x4f\x3e\
-\x95\x98\xa0\x28\x2b\x97\x2c\x61\x70\x68\x18\x1f\x32\xd6\xea\x67\
-\x74\xe7\x9f\xd5\xa4\x8a\x02\xa0\xe3\x3d\x81\x04\xa5\x8e\x3a\x1b\
-\x2d\x88\x62\x33\x92\xbb\xc6\xab\xab\x49\x15\x03\xd7\xa0\x24\x5d\
-\xfb\x96\x75\x18\xdf\xe1\xf4\xfd\x56\xf1\xe1\xb7\xff\x06\x67\x1d\
-\xb8\x96\x78\xdf\xc3\x0c\x4b\x46\x08\x6a\xcc\x4f\x52\xc6\xa9\xce\
-\x8b\xa5\xc9\xf9\xbe\x10\xb0\x0f\x6d\xe6\x79\xeb\x4f\xe4\xef\xde\
-\xf9\x3b\x1c\xb1\x64\x05\x1a\x3c\xd1\x28\x62\x84\x86\x42\x63\x37\
-\xf3\x9d\x2b\x60\x34\xe0\xd2\xe4\x7e\x3d\x88\x55\x0a\xc4\xc2\x10\
-\x1b\x82\x14\x06\x6d\x59\x26\x8d\x30\xa1\xc2\xa6\x4e\xc9\xc6\x4e\
-\x87\x6d\x21\xd0\xc6\xa0\xc6\xd1\x28\x9a\x38\x57\x60\x0a\x87\x29\
-\x1c\x1d\x11\xa6\x8c\xd0\xb1\x82\xd7\x88\x0f\x11\x8d\x09\xd6\x1c\
-\x83\x26\x6a\x38\x4d\xb2\x70\x45\xcf\xcb\xa5\xf9\xa3\x34\xd5\x1d\
-\xbb\x2d\xca\x20\x09\xc7\x31\xed\x25\x3d\xaf\xde\xef\xe5\xff\x0f\
-\x49\xe8\x8f\xfb\x1f\x78\x88\x3b\xee\xbd\x9b\x32\x46\xa2\x46\xda\
-\x9d\x36\x1a\x22\xd6\x36\x28\xa4\x40\x3c\x10\x05\x23\xae\x1e\xe2\
-\x1b\xec\x6b\xb0\xfa\x80\x7d\x81\xae\xbe\xe7\x63\x59\xdd\x06\xdc\
-\xe1\xd7\x33\x62\xcd\x02\x47\xac\x59\xc7\x82\x05\xa3\x8c\x4d\x8e\
-\x23\xd6\x11\x63\xa8\x8b\x39\x3f\xf3\x56\xa5\x90\xd6\xb2\x7d\x6a\
-\x12\x0f\x34\x30\xf5\x9e\x30\x1d\x9a\x46\x95\x1f\xd0\x91\x54\x54\
-\x2a\x94\xc4\x95\x9f\x2b\xf9\xd6\x16\x50\x7a\x9a\x40\xa7\x3d\xce\
-\x31\xcb\x56\xf2\xc1\x77\xfe\x16\x7f\xf2\xaf\x9f\xe0\xdf\xbe\xf1\
-\x35\xca\xfe\x7e\x68\x34\x10\x14\x17\x72\x91\xe9\x09\xa6\x6b\x4b\
-\xe8\x37\x83\x6f\x4f\xd0\xec\x78\x5e\xfb\xac\x8b\xf8\xcd\x17\xbc\
-\x8c\xc5\x46\x98\xea\x94\x68\xc3\x30\x19\x4a\x06\xc5\xe1\x3a\x69\
-\xaa\x2e\xa9\x7e\xfe\x84\x97\x78\xe6\x73\xa6\xb9\xe5\x27\x4a\xd4\
-\x00\xc6\xa1\xc6\x50\x02\xf7\x94\x6d\x6e\xbe\xff\x1e\xbe\xfb\xfd\
-\xeb\xd8\xd2\x9e\x64\xcb\xf8\x18\x63\x63\x63\x8c\x4f\x4e\x12\x62\
-\xc0\x35\x1a\x0c\x0f\x0c\xd2\x5f\x34\x18\x6e\xf6\x25\x7e\xc2\x05\
-\x0b\x39\x60\xdf\x7d\x59\xb9\x7c\x29\x8b\x1a\x83\x8c\xb4\xfa\x58\
-\x64\x4c\x8d\xe3\x81\x14\x9e\xb7\xa3\xc7\x08\x18\xaf\x19\xe0\x95\
-\x68\xc9\xb4\x46\xda\x55\xd0\xcf\x14\x03\x74\xd9\x76\xba\xc7\x5f\
-\xed\xc6\xbd\xe7\x54\x15\x15\x6d\x55\xf9\xc7\x73\xe4\xfe\xab\xf9\
-\xc8\x7b\xfe\x94\xef\xdd\x7b\x27\x5f\xbd\xee\x3a\x2e\xbd\xea\x2a\
-\xbe\xff\xd0\xfd\x4c\x31\x45\xd1\x68\x31\xd8\xd7\xa4\xad\x4a\xe8\
-\x04\xc4\x08\x3e\x76\x18\x5d\x3c\xc2\xca\xfd\xf6\x49\x9f\xd3\xf3\
-\x4c\x68\x4f\xda\x3e\xd3\x6a\x24\x20\xd5\xf1\x4b\x2a\x41\x18\x31\
-\x88\x13\x62\x84\x05\xc6\xb2\x50\x2c\xf7\x96\x59\x2a\x5c\x0c\x84\
-\xc4\x5d\xd7\xd5\x5e\x10\x44\x2d\xa2\x9a\xc8\x36\x7f\xd6\xcc\x3a\
-\x36\x6d\xdf\x4e\x07\x68\xe5\xfa\x78\x85\x32\xe9\x4e\xac\x75\xf1\
-\x6b\xf5\xb3\x25\x64\xc4\x98\x76\xef\x84\x4d\xe1\x67\xc3\x38\x7c\
-\x88\xec\xd7\x68\xf1\x27\xaf\x7a\x2d\x47\x1e\xb4\x86\x8f\x7e\xe1\
-\xbf\xb8\xe1\xbe\xbb\x69\x8c\x2e\x80\xc2\xa5\xf7\x8d\x59\x7a\x5c\
-\x24\x4d\xab\x55\xf9\x65\x4a\x52\x33\xf3\x9b\xd6\x91\x5b\x2f\x48\
-\x46\x32\x5b\x4c\x77\x78\xc7\x20\xb8\xdc\xbb\xce\xe8\x25\x4d\x02\
-\x26\x06\xc5\x89\xe0\x3b\x6d\xc2\x54\x9b\xc3\x16\x2f\xe1\x37\x5f\
-\xf6\x6a\x2e\x3c\xec\x18\x9a\x65\xc0\x77\x22\xcd\x66\x41\x07\xa5\
-\x69\x9b\xa4\xd9\x54\xbb\xd3\x51\xd4\xb9\x5a\xbd\x58\x54\xeb\x42\
-\x22\x11\x3a\xa1\x84\x56\x8b\x31\xe0\xdb\x77\xdd\xce\x97\xaf\xfa\
-\x2e\x97\x5e\x75\x05\x1b\x26\xc7\xd8\x30\xb1\x3d\x47\x59\xb6\x9b\
-\x73\xf5\xf6\xde\x62\x6e\x15\x76\x4a\x8c\x71\x2c\x1a\x1e\xa4\x29\
-\x89\x6d\x78\xdd\x01\xab\x38\xe4\x80\x55\x0c\xbb\x06\x87\xad\x5a\
-\xcd\xda\x7d\x0f\xa0\xe9\x0a\x16\x0c\x0c\x30\x42\xda\xf5\x2b\x8b\
-\x9a\x9d\x50\x4e\x1d\xc4\x24\xe7\x9f\x90\x7f\x55\x1f\xbe\xfa\xec\
-\xde\x5a\x42\x2a\x20\x77\x6b\x0a\x69\xcb\x30\x92\x5a\x8e\x26\x46\
-\x46\x10\xce\xde\x77\x15\xa7\xec\xbb\x8a\x5f\xbe\xf0\x79\x7c\xfd\
-\x07\xd7\xf1\xa5\xab\x2f\xe7\xca\x6b\xae\xe1\xde\x07\x1f\x26\x0e\
-\xf6\x13\x9a\x0d\x5c\xab\x0f\xb6\x95\xec\x37\xb2\x88\x25\x45\x3f\
-\xda\x09\x50\x98\x39\x25\x87\x8e\x19\x8b\x1f\xa0\xc8\x8f\xa7\x8f\
-\x1e\x6b\x22\xfb\x0d\x8f\x70\xea\x9a\x43\xb8\xe9\xdb\x5f\x87\x56\
-\x2b\xff\xba\x60\xc5\x52\x6a\x99\xdd\x71\x81\xf1\xbb\x0e\xe9\x7c\
-\xd2\x5b\x1e\xda\x40\xa1\x1d\xcb\x94\x02\xe4\x8b\x10\xb3\x13\xa8\
-\xa2\xfd\x88\x50\x0d\x67\xf5\x3e\x44\xa9\xed\x2c\x3d\xe0\x95\x94\
-\xaf\xaa\x82\x43\xb0\xd1\xe3\x14\xde\x72\xfa\xd9\x9c\xb3\x7e\x3d\
-\x1f\xf8\x8f\xff\x8f\xcf\x5e\xf1\x5d\x36\x4e\x8c\x61\x07\x06\x30\
-\xae\x20\x90\xe0\xac\xc9\x11\x24\x87\x92\x00\x26\x16\x7c\x44\x54\
-\xeb\xca\x79\xa5\xc2\x9e\xd6\x42\xce\x21\xab\xc7\x20\xc6\x24\x81\
-\x26\x36\x85\xa3\x62\x30\x56\x13\x72\xad\x5d\x52\x4c\xb5\x59\x60\
-\x1c\x17\x3f\xeb\x39\xbc\xf1\x69\xcf\xe4\xb0\xc1\x51\x26\x3b\x6d\
-\x1a\x45\x41\x90\x84\xc7\x6f\xd4\x7d\x7e\x83\xba\x5d\x1c\x6c\xde\
-\xb1\x29\x95\x5a\x65\x51\xb1\xc6\x10\x43\xea\x8b\x97\xa2\x98\x56\
-\x8b\x6b\x1f\x79\x98\xbf\xf8\xcc\xbf\xf1\x95\xeb\xbf\xcf\xa6\xa9\
-\x49\xe8\xef\x47\x5c\x03\xb3\x68\x71\x3e\x27\xa9\x87\x82\x76\xb8\
-\x71\x68\x9d\x27\x3f\xe2\x7d\x86\x05\x07\x6e\xfd\xd1\x8d\x7c\xfe\
-\x86\xef\x43\xe9\x19\x1d\x18\x62\xb4\xd9\xcf\xa0\x2d\x38\xf6\xb0\
-\x23\xd8\x6f\x64\x84\x95\x83\x7d\x1c\xbb\xfe\x48\x96\x8e\x8c\xd2\
-\xdf\x6c\xb2\xc0\x15\x5d\x94\x1e\x40\x8c\x04\x1f\x08\xd9\x19\x28\
-\xa9\x13\x61\xea\xc3\xe8\x56\x0c\x54\x43\xa2\x25\x23\x11\x7c\x46\
-\x4d\xcf\x53\x72\x04\x50\x96\x25\xd6\x08\xcb\x8d\xe5\x15\x47\x1d\
-\xcb\xc5\x47\x1d\xc9\x2d\xcf\x7d\x90\xff\xb9\xe6\x1a\xfe\xf3\xba\
-\x6b\xb8\xea\xde\x3b\x29\x3b\x13\xc8\xf8\x24\xa7\x1e\xb0\x8e\x45\
-\x49\x24\x7c\x9a\xd8\xea\x0e\x3b\x7f\xcf\xa5\x98\x55\x36\xa5\x1e\
-\x43\xb4\x96\x10\x02\xce\x18\x56\x2c\x5e\x42\x98\x9a\xa2\xcf\x2d\
-\xa2\xd3\x29\x53\x24\x1b\x23\x62\xbb\x2d\x2e\x45\x7f\x5a\x67\xff\
-\xa4\xb4\xea\x9c\xcb\xd2\x13\xa8\xf2\xf3\xae\x5f\x4f\xd1\xd1\xae\
-\x6d\x84\xa9\xaf\x5d\x45\x0b\x82\x43\xe9\x04\xcf\xea\xd1\xc5\xfc\
-\xc1\xcf\xbf\x81\x0b\x9e\xf6\x0c\x3e\xf1\xb9\xcf\xf1\xb5\x1b\xbf\
-\xc7\xa6\xc9\xed\xd0\x2c\x28\xfa\xfa\x12\x71\xa9\xa6\x26\xb2\xfa\
-\x80\x57\x03\x1a\x31\xc6\xd6\x33\x0c\xd5\xfb\x57\x0b\x44\x63\x00\
-\x15\x4c\xe6\x24\x30\x12\x31\x36\x15\x1a\x95\x40\x9c\x9c\x42\xda\
-\x9e\x65\xae\xc5\xb3\x8e\x3d\x8d\xd7\x3e\xeb\xe7\x38\x66\xe5\xca\
-\x84\xf5\x2f\x4b\x1a\x45\x91\xc0\x63\x66\xf6\xfe\xfe\x2e\x97\x29\
-\x67\xfc\xb2\xb5\x16\xaf\x1e\x35\x42\x54\x98\x0c\x9e\x58\x14\xfc\
-\xe7\xf7\xaf\xe2\x4f\xfe\xf1\xc3\xdc\xb1\x7d\x3b\x71\x68\x88\xbe\
-\x45\x8b\x28\x7d\x4c\xa3\xc6\x3e\x31\x2c\x75\x8b\x6d\xb3\xdc\xb0\
-\xde\xcf\xd0\x8c\xd7\x74\x82\x14\x0e\x63\x04\x27\x86\x8e\xf7\x3c\
-\xd8\x1e\xa3\x88\x70\xfb\x37\xbe\x42\xbb\xec\x40\x9f\xb0\xe8\x4b\
-\x23\xf4\xdb\x82\x55\x4b\x97\x73\xe4\xea\x83\x59\x39\xba\x88\xd5\
-\x4b\x96\xb3\x66\xc5\x3e\x2c\x1a\x1a\x61\xa0\xd1\x60\x90\xe9\x0b\
-\xac\xfe\xd4\x8a\x5e\x8c\x0c\x9d\x16\x45\x4d\xa8\xa5\xf8\x50\x45\
-\x35\x39\x8f\x82\x54\x53\xd0\xd2\x33\x21\x1d\x82\x13\x0e\x5b\xb2\
-\x0f\xeb\x2f\xd8\x97\x57\x3c\xe3\xd9\x5c\x7b\xe7\xed\xfc\xd7\xd7\
-\xbf\xca\xd7\xbf\xfe\x15\xd6\x2c\x59\x4a\x00\xbc\xd3\x34\x9b\x31\
-\x97\x4b\xad\xb3\x24\xf2\xbd\x39\x43\xf0\x1e\xe3\x1c\x9f\xbf\xed\
-\xc7\xbc\xfe\xaf\xfe\x84\x8d\xce\xd0\x36\x16\x57\x34\xa0\xd3\x4e\
-\x33\xca\x56\x01\x87\x09\x49\x03\xee\x67\x2d\x05\x30\x56\x88\xdb\
-\xc6\x38\x6f\xcd\x21\x7c\xfc\x1d\xbf\xc1\x32\x95\x04\x44\x91\x1c\
-\xd4\xef\x04\xb7\xfe\x68\x96\x1e\xdf\x0c\x18\xd2\x34\xdd\x1e\x01\
-\xaf\x30\x19\x15\xeb\x1c\x6d\xe0\xdb\x77\xde\xc6\x7f\x5d\xf5\x2d\
-\xbe\x71\xd5\xe5\xdc\xfd\xe0\x83\xd0\xdf\x24\x34\x1c\xda\x6c\x62\
-\x1a\x8e\x50\x7a\xa4\x70\xc9\x9b\xf8\x3c\xa1\xd7\x7b\x1c\x31\x62\
-\x10\xac\x49\xe4\x9a\xc4\xf4\xc9\x9d\xc9\x09\xc4\x7b\xfa\xc4\x70\
-\xe0\xe8\x62\x9e\x76\xe4\xb1\x5c\x7c\xc6\xd9\x9c\xb0\xdf\x01\xf4\
-\x01\x3a\x95\xee\xb3\x34\x12\xd6\xad\xf4\x25\x85\xeb\xc6\x35\x5d\
-\x45\xc9\x5e\xf8\xd3\x1c\xac\xea\x8e\xe5\x2f\x04\x4d\x85\x38\x49\
-\xed\xc4\x71\xef\x31\x45\xc1\x07\x2e\xfb\x1f\xfe\xf4\xe3\xff\x88\
-\xb6\xfa\x88\xfd\x03\x94\xaa\x74\xbc\x22\xc6\xd6\xfd\x7e\x91\x98\
-\xda\x85\x33\x3e\x22\xfd\x7c\xfa\x11\x39\x95\x3c\x82\xad\x44\x22\
-\x41\x52\x9a\x20\xc6\x50\x38\x47\xec\xb4\x13\xd3\x8e\x4b\xd8\x86\
-\x50\xfa\xb4\xe5\x05\x8f\xb6\xdb\x18\x84\xc1\x56\x1f\x83\x83\x03\
-\x0c\x0e\x0c\xb0\x74\x78\x84\xa3\x96\xac\x60\xd9\xf0\x28\x4b\x17\
-\x2f\x61\xe5\xb2\xe5\x2c\x1f\x1d\x65\xc0\x16\xf4\x17\x0d\xfa\x1b\
-\x4d\xfa\x9c\xa5\xc5\x74\x27\x31\x0d\x13\x50\x3d\x0b\x3e\x7d\x9e\
-\xb1\x80\x15\x4c\xd0\xd4\x7a\x34\x0e\x0a\x61\x0a\xf8\xf1\xbd\x77\
-\xd1\x3f\xd0\x62\xdf\x05\x8b\x93\xd3\xa8\x1a\x9a\x8f\x11\x01\xcc\
-\xea\x00\x20\xe3\x8d\x2b\xb0\x82\xb5\xdc\xd1\x9e\xe2\xe2\xdf\xfe\
-\x35\x6e\xda\xbe\x85\x38\x32\x8c\xef\x04\x0a\x94\x20\x3e\x39\x00\
-\xb5\x48\x4c\x3b\x88\xfe\x8c\xd1\x07\x55\x0e\xe0\xc2\x43\xd7\xf3\
-\x91\xb7\xfc\x3a\x4b\x34\x57\xfa\xc5\x74\x1d\x40\xb5\x0d\xce\x71\
-\x25\x74\x1d\x40\x8e\x22\x34\xe4\x82\x93\xe0\x63\x02\x8e\x8a\x0a\
-\xd6\x09\x93\xc0\x9d\x9b\x37\xf2\xdd\x1b\xaf\xe7\x6b\xd7\x5c\xc9\
-\x0d\xf7\xdc\xc5\x03\x63\x5b\xd9\x52\xb6\x09\x85\x43\x5d\xde\xfd\
-\x6d\xe6\xdf\x35\x52\xe7\xa3\x54\xda\x88\x9d\x12\xf2\x54\xdb\xa8\
-\xb1\x1c\xb8\x68\x09\x47\xad\x3e\x98\x33\x8f\x38\x86\x53\xd6\x1d\
-\xc6\xea\xe1\x11\x9a\x80\xef\xc4\x4c\x32\x2b\x88\x13\x7c\xa8\xd8\
-\x8c\xd2\xa2\xaf\xc8\x2b\x76\xa7\x03\x20\x0a\x6d\x8d\x4c\x89\x20\
-\xc6\xf0\xb1\x4b\xff\x97\x77\x7d\xf2\x9f\x60\xd1\x08\x65\x88\x78\
-\x0c\xb6\x68\x10\xcb\x3c\x22\xac\x49\xc2\x3d\x12\x13\x92\x6f\x96\
-\x4f\x9f\x96\x14\x48\x92\x8a\x33\x9a\x37\x67\x93\x08\x36\xd3\x80\
-\x81\x49\xe0\x9c\x04\x63\x44\x4a\xc5\x9a\x16\x46\x24\x73\xc0\xfa\
-\x7a\x56\x20\xd5\x02\x22\x94\x9d\xf4\xbe\xed\x0e\xc6\x47\xac\x31\
-\x0c\x34\x1a\x0c\x35\x5a\x0c\x36\xfa\x58\x30\x34\xc4\xc2\xc1\x61\
-\x46\x06\x07\x59\x38\x3c\xc2\x82\x46\x83\x96\xb5\x34\xfb\x5b\xf4\
-\x0f\x0c\xd0\xd7\xd7\x87\x84\x48\x7f\xa3\xc9\xc1\xfb\xef\xcf\xfe\
-\x43\x0b\x69\x92\x1c\x45\xa1\x11\xed\xf8\x8c\x29\x13\xa2\x04\xc4\
-\x59\xc4\x14\x94\x5a\x52\xa8\x49\x33\x24\x19\x7c\xf5\x58\x0e\x60\
-\xd6\x14\x20\xc6\x8c\x3f\x26\x63\x95\x63\x64\xb4\xd9\xe2\xc8\xd5\
-\x6b\xf8\xf1\xb5\x57\x24\x6f\x64\x4c\xee\xbb\x76\x2b\x9d\x2a\xb1\
-\x3b\xa5\xf5\x33\x64\x95\xba\x92\x31\xdd\xd1\xea\x64\xd3\x9e\xe6\
-\x5d\xb2\x1d\x6a\xe6\x92\xe8\xb5\x45\xa0\xb0\x26\x41\x45\x15\x28\
-\x23\x7d\xaa\x1c\xbe\x60\x11\x87\x9f\x7e\x0e\x2f\x3a\xfd\x1c\x1e\
-\x1a\x1b\xe3\xc6\x7b\xee\xe0\x07\xb7\xde\xc2\x03\x9b\x37\x73\xdb\
-\x9d\x77\xb2\x69\x7c\x8c\x31\xda\x94\xde\x13\x42\x40\xc4\x62\xad\
-\xa1\xd9\x2c\xe8\x6b\x34\x19\x1e\x18\xe4\x80\x7d\xf7\xe3\xc0\x15\
-\x2b\x39\x66\xff\x03\x38\x62\xbf\x55\x2c\x6c\xf6\x31\x44\x5a\x14\
-\xc1\xc7\x44\x80\xe2\x04\x31\x52\xab\x1d\x5b\x63\x6b\xbc\x7a\x6f\
-\xb6\xbf\xdb\xf0\xfe\x74\x93\x29\x63\x0c\xdf\xb9\xf3\x36\xfe\xfa\
-\x93\x1f\x43\x87\x86\x68\x63\xa0\x28\x20\x46\xbc\x0f\x88\x98\xb4\
-\x3b\x66\x9a\xf5\x24\xdf\x3e\xfb\xf3\x38\x6d\xdf\xd3\x6e\x25\x3e\
-\x4a\xe6\x01\x8c\x19\xb5\xe9\xab\x62\x68\xe2\xc3\x50\x6b\xf1\x69\
-\xbe\x33\x5d\x19\xe9\x21\x12\x8d\x82\x95\x02\x63\x5d\x7a\x9f\xbe\
-\xc4\xcc\xeb\x81\x2d\x21\xb0\xa5\x53\xc2\x78\x1b\xd9\xbe\x09\x42\
-\x48\x9c\x12\x51\x29\xbc\x4f\x40\xa2\xc2\x60\x9c\x43\xac\xa1\x30\
-\x06\xda\x9e\x7d\x16\x2c\x62\xfd\xea\xb5\x9c\x78\xd4\xb1\x9c\x78\
-\xd0\x5a\x0e\x1c\x5d\xc8\xd2\x66\x83\x02\xf0\x24\x2a\x7a\x34\x12\
-\xca\x29\xac\x2d\x28\xa3\xe6\xe7\x70\x6e\x36\xab\x03\x30\x3d\xfd\
-\x0f\x31\x82\x86\xc0\x42\x63\x38\xfe\x90\x43\xf9\xcc\xe5\xdf\xc2\
-\x4a\x02\x43\x24\x8c\x73\xea\x62\xa5\x42\xe7\xcf\xd6\xce\x5f\x5f\
-\x23\xd2\xb9\xf7\x15\x0d\x1c\x5d\xb4\x69\xf5\x98\xfc\x24\x2e\xb1\
-\xcb\x46\x5c\x01\x5e\xaa\x7b\x52\x75\x18\xa6\xb7\x7a\x42\xf4\x44\
-\x15\xfa\xad\xe5\xc0\xc1\x41\x56\x1d\x7a\x04\x17\x1d\x7a\x04\x25\
-\x30\x56\x06\xc6\x27\x27\x28\xa3\xa7\x53\x96\x69\x32\x4f\x4c\x1e\
-\x47\xb5\xb4\x8a\x82\x46\xa3\xc5\x70\xe1\xa6\x57\xb8\x63\x2a\x2c\
-\xaa\x11\x8c\xeb\x41\xc0\x65\x47\x94\x0e\x22\x15\x83\x67\xbf\x2e\
-\x3f\x1d\xd0\xa7\xaa\x98\x87\x10\x89\x92\xa6\xed\x3e\xf1\xc5\xcf\
-\xf1\xb0\x2f\x51\x37\x4c\xac\x2a\xa5\x55\x94\x91\xe7\xed\xd3\x84\
-\x64\x5d\xf2\x9f\xfd\x0e\xcc\xd8\x15\x63\x8e\x5c\xbb\x65\x52\xba\
-\x8e\xbb\xaa\xf0\x63\xb3\x10\x6c\x0f\xf3\x40\xfe\x47\x62\x1a\x9f\
-\x37\x21\x50\xb1\x1d\xb6\x73\xea\x92\x1a\x10\x16\x29\x5c\x55\xfa\
-\xab\x77\xe5\xea\x28\x83\x74\xf1\x0c\xaa\x19\x7e\x6c\x3b\x4c\x4e\
-\x4d\x72\xf3\x95\x97\xf3\x9f\x97\x5f\xce\xd2\xe1\x51\x56\xaf\x5c\
-\xc9\x91\x6b\xd6\x70\xd4\xea\xd5\x9c\x72\xf8\x61\xec\x5b\x0c\x32\
-\x98\x4e\x9e\x28\x42\x70\x42\x00\x1a\x73\x5c\x8b\x73\xd2\x4e\xb6\
-\x99\xdd\xe5\x88\x55\xab\x19\x69\x35\xd9\x10\x93\xcb\x9b\x7e\x83\
-\x63\x7a\x48\xeb\x7e\xe8\xcf\x8e\x89\x08\x5a\x06\x46\xfb\x07\xe9\
-\x27\x4d\x70\xd9\x4c\x04\x52\x17\xdb\x76\xd5\x37\xf6\xe6\x69\xd4\
-\x25\xd6\x5c\x3f\xae\xc2\x70\xad\x7f\x6e\x49\x0d\x5d\xa5\x9a\x52\
-\x83\x4e\x4c\x0b\x68\xa4\xb0\x8c\x16\x43\x3b\x38\xa4\xea\xeb\xf4\
-\xff\x89\x8c\x22\xe4\x66\x65\xea\xf5\xd3\x65\x83\xd6\x6e\x65\x59\
-\xe9\x0a\x9c\x3c\x1e\x77\xba\x46\xa5\x43\x6e\x4d\x82\x75\x96\xdb\
-\x37\x3d\xc2\x77\x6e\xfc\x01\x71\x78\x20\x81\x72\x98\xae\xcc\x5c\
-\xd1\xb6\x57\x5d\x38\x65\xd7\xb0\x07\xbd\x95\x73\xa8\xa8\xb8\xf3\
-\x35\xcb\xec\xb0\x36\x26\xe0\xf6\x74\x3d\x3e\xc5\x77\xd5\x4d\xf2\
-\x87\x0b\x2e\x58\x0a\x4d\xa9\x82\x66\x2f\x12\xd2\x03\x53\xc3\x8b\
-\x93\x65\x7a\xef\x5a\x50\x42\x12\xa9\x4a\xa3\x9f\x32\x78\x9a\x0b\
-\x5a\x58\x0c\x1b\x26\xdb\x3c\x7c\xdb\xad\x7c\xfb\xd6\x9b\x41\x4a\
-\x56\x2d\x59\xc2\xe9\x07\xad\xe3\x84\x95\xab\x78\xc1\x59\xe7\x31\
-\xda\x68\x60\xbc\xa6\xae\xf2\x1c\x4f\x7d\x6e\xe2\xe9\x92\xb6\xb3\
-\x43\x0f\x38\x90\x7d\x57\xac\xe0\xfe\x0d\x0f\x62\xfa\x86\xa8\xe5\
-\xc6\xb4\xba\x11\xba\xd3\x90\xeb\x29\x6b\x19\x83\x8e\x0f\xf4\x37\
-\x5b\xdd\xeb\x05\x3f\x5d\x08\x2c\x33\xbf\x34\x3d\x11\x56\xd5\xc8\
-\x4b\x9f\x92\x12\x56\xcd\x1b\x72\x6a\x21\x45\xc0\x58\x43\x00\x3a\
-\x99\xdc\xa5\x99\x5b\x52\xd5\x3c\x07\x22\xb9\x6d\xd9\x03\xa7\x55\
-\xf0\x19\x94\xe4\xa8\x38\x10\x01\xcd\x03\x3c\x26\x8d\x20\x87\xfc\
-\x37\x3f\x09\x9d\xd7\xa3\x5f\x4f\xa6\x8d\xa6\x54\x4c\x4a\x06\xb8\
-\xe9\xf6\xdb\xd9\xe2\x3b\x74\x06\x9a\x69\xea\x0e\xe9\x71\x00\x9a\
-\xc9\x56\x7f\x8a\x41\x23\xad\xdf\x8a\x1e\xff\x0a\xf4\x2a\x35\x49\
-\x17\x16\x5c\x3b\x9e\xea\x47\xbd\xc5\x5e\x21\xd4\x0b\xbe\x7a\x53\
-\xed\xa2\x7f\xa5\xc7\x01\xcc\xa4\x32\xa2\xe2\x8d\x4c\xf7\xba\x1d\
-\x03\x22\x91\x56\xa3\x00\xe7\x88\x0d\xc5\xbb\xc8\x6d\xed\x71\x6e\
-\xfd\xf2\x17\xb8\xef\xe0\x23\x79\xc1\x33\x2e\xc4\x68\xba\x67\x9a\
-\x3d\xfb\x5c\x9e\xbe\x39\xf9\x09\x01\xd4\x7b\x86\xb0\x1c\x7d\xd8\
-\x11\xd0\x29\xd3\xc9\xe4\x61\x07\xa9\x42\xa1\xfa\x64\x7f\x86\x2c\
-\xd3\x2e\x1b\x15\x46\x87\x86\x7b\x80\x5f\xe9\x49\xce\x6b\x67\xd7\
-\xb7\x4b\xe9\xf9\xbb\xfa\xcf\x2b\x65\xdb\x6a\x49\xf4\x80\x4c\x7a\
-\x1e\x7a\x21\x29\xe4\x18\x14\x47\xa4\x21\x11\x47\xc4\x44\xc5\xaa\
-\xc5\x49\x81\x33\x05\x0e\x9b\xc6\x4f\x13\xf4\x84\x4a\x14\x35\x49\
-\x68\x76\x45\x23\xd4\x48\xd2\xcb\xcb\x1a\x7a\xa9\x2d\x29\xbb\xb8\
-\xbf\xfe\x24\x96\x56\x62\x08\xc9\x81\x6d\x1c\xdb\xce\xe6\xa9\x49\
-\x7c\xd3\x11\x2c\xb5\x44\x56\x17\x83\x9b\x4e\x01\x2a\x95\x77\x99\
-\x33\x9d\xbd\xe9\x85\xf3\x6a\x77\xf1\x27\xd1\xd7\xfc\xca\x23\xb9\
-\x41\x12\x5e\xbf\xd2\x13\xac\x3f\xb8\x92\xeb\xc9\xc4\x0d\x2a\x9a\
-\xb8\x03\x24\xbf\xb2\xf2\x74\x55\xc0\x91\xa8\x59\x67\x20\x20\x24\
-\x61\x52\xab\x11\x53\x31\xfa\x84\x4e\xea\x26\xd9\x48\x14\x8f\x37\
-\x01\x6f\x7c\xea\x50\x00\x85\x6b\x30\x3c\xb4\x88\xb3\x4e\x3a\x9d\
-\x51\xc9\x1d\x1c\x09\x88\x0d\x73\x46\xeb\xcf\xf9\x1e\x46\x51\x9a\
-\xc0\x29\x87\xac\xa7\xcf\x38\x6c\x75\xae\x54\xf9\x69\x42\xaf\x3d\
-\x55\x1b\x00\x3b\x93\x86\x13\x12\x56\xbc\x70\x86\xe5\xa3\x0b\x28\
-\x48\x40\x8e\x10\xbb\xd9\xa4\xf4\xec\x6a\x73\x35\x9d\xf1\xef\xf4\
-\x2f\xaa\xce\x42\x7a\xf8\xa2\x4c\x0f\x85\xc9\x8b\xdf\x46\xc5\x45\
-\x68\x84\x34\x17\x4f\x06\x9c\xf4\xe6\x26\x22\xbd\x8e\x24\x15\xf8\
-\x6c\xcc\x44\x18\xe4\x02\xa0\x08\x21\x81\x3f\xeb\xd0\xbf\x97\x9e\
-\x6c\xb7\x59\x15\x98\x50\xc5\x38\xb9\xce\x94\x3f\xa8\x33\x31\x05\
-\xa4\x89\xbf\xaa\x08\x39\x6d\x27\x9d\x71\xc1\xa4\xea\xed\xff\x24\
-\xd7\x3d\xd7\x11\x22\x79\x76\xbf\xa2\x30\xef\x05\x17\xf5\xbc\x44\
-\x4d\x72\x38\xd5\xab\x06\x1f\xf5\x1e\x5f\xb5\xe8\x15\x13\x35\xfb\
-\xad\x2c\x5c\x9a\x9d\x99\x4a\xea\x20\x45\x5f\x26\xf5\x22\x9b\x8b\
-\xbf\x56\x28\x09\xc4\x86\x4d\x77\x25\x42\x9c\x2c\x19\xc1\x71\xea\
-\x61\x47\x24\x20\x52\x54\x82\x04\x3a\x12\x1f\x7d\xb3\xe9\xf9\xd9\
-\xa3\xa6\x00\xbd\xa1\x54\xc7\x59\x9a\xc0\x39\xfb\xad\xe6\xb0\xa1\
-\x85\x5c\x33\xb1\x09\x19\x1c\x20\x94\x20\x39\x04\x75\xf9\xa1\xf1\
-\x4f\x5e\x51\x9b\x19\x96\x1e\x30\x89\x15\xb9\x64\x6e\x13\xf5\x8c\
-\x84\x5a\x0c\x1a\x03\xcd\x56\x93\x95\x0b\x96\x90\x6e\x8f\x50\x66\
-\x74\x5f\x1d\x42\xdb\x3c\x4f\x3e\x63\xfe\x6a\xa7\xd7\x7e\x4e\xdf\
-\xac\x30\xe7\x3b\xf9\xbd\x39\x3e\xfb\x75\xe4\x5a\xe7\xfb\xdd\x6f\
-\xee\x34\x9d\xdc\x75\x68\xc3\xdc\xaf\x79\x4c\x88\xc9\x80\xc1\x0b\
-\x20\x1e\x0b\x2c\x6c\x34\x69\x46\x61\xca\xe7\xa2\x1a\x71\x3a\x43\
-\x77\x5e\xa0\x5d\xae\xc4\xb9\xe3\x51\x62\xc5\x54\x34\xed\x84\x7a\
-\x16\xef\x63\x78\x6f\x7d\xac\x45\x97\xaf\xa6\xee\x78\x89\xa7\x39\
-\x9d\xfa\x3e\x98\xcc\xea\x17\x01\x1c\x1a\x48\x05\x4f\xaf\x68\x08\
-\xb4\x5a\x05\xed\x72\x92\x7d\x0f\x38\x90\x03\x56\x2c\x4b\xa8\xeb\
-\x20\x44\xb1\x04\x23\x14\x95\xeb\xdb\xd9\x31\x49\x75\x44\x73\x31\
-\x49\xf9\x5e\x59\x06\x56\x8c\x8e\x70\xe4\xda\x83\x53\xcf\x38\x26\
-\xd6\x95\x7a\xea\xf9\x29\xba\xfb\xe7\x4b\x50\x9b\xce\xf8\x81\xc6\
-\xd4\x01\x58\xb6\x70\x34\xfd\x5c\xb5\x67\x06\x48\x1e\xc7\xc5\xf2\
-\x04\x9c\xec\x13\xfe\xd9\x33\x43\xac\xee\x1e\x3e\x3c\x38\x44\x7f\
-\xab\x2f\xe1\xf8\x1f\x87\x63\x7c\xa2\xcb\x57\x33\x62\x97\xc7\xfc\
-\xbe\x31\x96\x10\x53\x51\x34\xf8\x80\x2d\x3d\xc7\xae\x3d\x8c\x7d\
-\x9a\x7d\x49\x03\xc0\xa6\x22\x7c\xc1\xdc\xdb\x80\x73\x73\x00\x4a\
-\xca\x49\x34\xd0\x00\xce\x38\xfa\x38\x9a\x5e\x31\x95\x57\xca\x95\
-\x9a\x38\xc7\xc2\xc3\x93\xc7\x72\x88\x27\x95\x93\xcb\x39\x5f\x55\
-\xad\x95\xdc\x3a\x0a\x25\x8b\x07\x06\x58\xd0\xd7\x97\x82\x06\x53\
-\x89\x55\xc9\xb4\x07\xf5\xf1\xaa\x9a\x3f\x65\xac\xb7\x56\xa2\xdd\
-\xe8\x43\x32\xb8\x68\xd5\xfe\x2b\x69\x36\x0a\xd0\x34\x38\xbd\x03\
-\x19\x6a\xcf\xca\x91\x59\xd2\xb5\x27\xbb\xa9\x2a\xa6\x28\x90\xa2\
-\x80\x10\x59\xe0\x5a\x9c\x7b\xd4\x71\x29\x5d\x4a\x6d\xa0\x1c\xd3\
-\xcf\x9d\xbc\x6f\xce\xc1\xba\x41\x71\xb6\xc0\x03\xc7\x1d\xb6\x9e\
-\x35\x8b\x96\x61\x27\xda\x99\x5b\xad\xdb\xb5\x7d\xea\xe9\x07\xa4\
-\x7c\x2e\x75\xdf\xa5\xdb\x5f\xae\x72\x4f\x81\x58\x7a\x0e\xda\x67\
-\x5f\x46\x07\x87\xd0\x40\xf2\xc4\xf4\x2c\xf6\x1e\x20\xe0\x5e\x7b\
-\x74\x9b\x16\xd1\x6b\x4e\xbd\x34\x15\x02\xf7\xdd\x67\x25\x2b\x97\
-\x2e\x81\x76\xfb\x31\x07\x2b\x84\xf4\xb7\x4f\x19\xb9\x75\x05\xb1\
-\x05\xa1\x4c\xb4\x70\xf8\xc0\xda\xc5\x2b\x38\x65\xcd\x21\xe9\x3c\
-\x25\x8d\x11\xa7\x02\xee\xdc\x4f\x7a\xce\x0e\x40\x72\x61\xc9\x47\
-\x65\xdf\x81\x21\xce\x5a\x7f\x34\x32\x36\x89\x13\x72\x14\x60\xeb\
-\x5d\xf2\xa9\x6a\xba\x93\xdc\x5a\xbd\x67\xcd\xf2\x15\x2c\x90\x44\
-\x25\xa5\xb9\x54\xd6\x9d\x07\x87\x1d\x0b\x42\x7b\x6d\xa6\x55\xe5\
-\x92\x1a\x1d\x53\xf5\xe1\xf3\x18\xdd\x10\xc2\xfa\x55\xab\xa0\x53\
-\xe2\x2a\x38\xf3\x2c\xc3\x47\x33\xbb\x6c\x4f\x09\x13\x88\xde\x63\
-\x1b\x45\xd2\x3d\x18\x9b\xe0\xdc\xe3\x4f\x66\x91\x18\xc4\xa7\x3e\
-\x62\x12\x2e\xdd\x35\x8a\xd8\xb9\x97\xeb\xaa\xa6\x2c\x4a\x3f\x70\
-\xc6\xe1\x47\xb1\xd0\x35\xa0\x2c\xb1\xd6\x40\xf0\x98\x39\xf0\x90\
-\x3f\xb9\xac\xaa\x47\xf7\x7c\x47\xe8\xca\x5e\xe7\xe2\x60\xd3\x18\
-\xd6\x2c\x5b\x91\xa8\x1c\x25\x31\xb8\x68\xec\xde\x88\x84\x96\x56\
-\x66\xaa\xb4\xee\xb5\xe9\xd6\xe5\xf4\x9d\x61\x39\xea\x6a\x02\xa7\
-\x1c\xbe\x9e\x61\x04\xeb\x93\x64\x77\x05\x52\xab\xf9\xb6\x7b\xdf\
-\xef\xa9\xf4\x28\x92\x51\xb9\x1a\x91\x4e\x87\x65\x7d\x83\x9c\x76\
-\xc4\x51\x09\x79\x9a\x23\xd1\x2e\x2c\x6c\xee\x27\x3e\x47\x07\x50\
-\x01\x1f\xd2\x4b\x80\x53\x0e\x39\x8c\xc3\xf6\x3b\x90\xce\xc4\x04\
-\xd6\x0a\xe2\x03\xd6\x35\x9f\x92\x2c\x41\x95\xf6\xbc\x0a\x68\x16\
-\xb8\x48\xfd\xf8\x08\xde\x33\x58\x34\x38\x7a\xd5\x41\xf9\x4a\xa5\
-\x1d\xc9\x9a\x6e\x41\x64\xda\x66\xf4\x54\x4b\x4c\x77\xa3\x75\x81\
-\x4e\x39\xa5\xac\xeb\x4a\x5a\xcd\xdb\x70\xfa\xba\xc3\x59\xbb\x68\
-\x19\x61\x62\x12\x42\xc6\x45\x7a\x9f\x15\xad\x63\xfd\xd7\xd5\xfd\
-\x7a\x2a\xa5\xa4\x89\x57\x20\x22\x13\x53\x1c\x7d\xe0\x41\x1c\xb9\
-\x6a\x35\x31\x68\x86\x84\x57\x84\x32\x15\x8a\x63\x6e\x36\xf7\x08\
-\xc0\x64\x2e\x3a\x14\xf1\x91\x03\x5a\x2d\x4e\x59\x7f\x04\x4d\x11\
-\x62\x59\x22\x45\x83\x50\x96\x35\x07\xfb\x53\xc7\x7a\xe2\x7e\x95\
-\x44\xd6\x51\x26\xed\xc4\x86\xb5\x68\xbb\xc3\xfe\x4b\x96\x71\xe0\
-\xf2\x15\x19\x5b\x9b\x99\x58\x55\x7a\x61\xea\x7b\x6d\x4e\x26\x33\
-\xf5\xea\x89\x08\x41\x21\x46\x8f\x74\xda\xac\x1a\x18\xe6\xdc\xa3\
-\x8e\x47\x3a\x9e\xa6\x2b\x50\x1f\x68\x14\xcd\x4c\xa7\xdd\xf3\x77\
-\xf2\xd4\x8b\x00\xd0\x48\xcb\x1a\xfa\xcb\xc0\xd3\x8f\x3b\x81\x85\
-\x48\x9e\x46\x4c\x0f\x5a\x4a\x3a\x77\xad\x07\xbf\x4b\xbf\xad\x26\
-\xc1\x4c\x8b\x3c\x84\x72\xee\xe9\x67\xd0\x74\x05\x62\x0b\xb4\xf4\
-\xb9\xf9\xf0\x54\xbb\xea\x52\x63\xbb\x53\x21\x26\xed\x34\x4e\x49\
-\x22\x8c\x53\x1d\x8e\x58\xbb\x8e\xa5\xb6\xc8\x18\xcc\x88\x47\xeb\
-\x29\xb1\x9e\x79\x91\xbd\xe1\xff\x63\x58\xef\xc8\x13\xe4\x21\x19\
-\xd2\x0e\x67\x14\x9c\x49\xfa\x78\xcf\x39\xed\x4c\x06\x8a\x26\x31\
-\x44\x9c\x71\x68\x48\x53\x75\x62\xa7\xef\x7c\x4f\xb5\xcb\x2d\xce\
-\xd0\x9e\x1c\x67\xbf\x91\x05\x9c\x7f\xd2\xa9\x89\xfc\x43\xaa\xf1\
-\x7b\xa9\x15\x42\x77\xe5\xbc\x77\xa9\x06\x20\x18\x82\xc6\x24\x14\
-\xda\x89\x1c\xbe\x7c\x25\xa7\x1d\x7d\x2c\xe5\xe6\x4d\x34\x9a\x8d\
-\x4c\x28\x31\xfd\xe3\x9f\xf4\xee\x40\xba\xe1\xa8\x08\x69\x24\xd4\
-\xd8\x54\x76\x0d\x81\x01\x5b\x70\xcc\xba\xc3\x12\x06\xbb\xa2\xd7\
-\x22\xf3\xca\xcf\x3c\xf9\x47\x69\x5b\xcd\x72\xb9\xa7\x49\x5a\xcd\
-\xfa\xfb\x73\xf4\x2c\x8f\xe7\x42\x98\x8e\x73\xdb\xc5\x3f\xd2\x99\
-\xdf\x9a\xc1\x1e\x20\x3d\x3f\x95\x24\xe0\x69\x82\x72\xc4\xbe\xfb\
-\x71\xe6\x31\xc7\xd3\x19\x1b\x43\x44\x13\x4d\xb6\x31\xd4\xa8\xa0\
-\xba\x9d\xf8\x54\x72\x01\x69\x08\xcc\x8f\x8f\x71\xda\xb1\xc7\xb2\
-\xff\xe0\x10\x9a\xc7\xb0\x67\x47\x8b\xce\xcd\xe6\x36\x0b\x20\x06\
-\xd4\x22\xea\x12\x6f\x99\x03\xd5\xc0\x62\xe0\xe5\xa7\x9e\x49\xa1\
-\x11\xdb\x10\x42\xe8\x60\x25\xc3\x44\xeb\x19\xe9\xee\xff\x3f\xf9\
-\x2c\x82\x94\x60\x02\x2a\x11\x1b\xc1\x85\xe4\x09\xbc\x03\x8f\x67\
-\xbf\x66\x3f\x67\xed\x77\x50\xfe\xed\x44\xd4\x61\xd4\x60\xeb\x49\
-\xa9\x6a\x52\xcf\x80\xf4\x70\xd3\xf7\x2e\x82\x5e\xb0\x59\xfe\xda\
-\x03\x6d\xa0\x24\x57\xc6\xab\xdf\xab\x68\x81\x42\x9a\x03\x4f\xaa\
-\x34\x81\xd4\xfb\x8d\x3b\x14\x1a\x23\xe9\xbd\x3c\xbb\xdf\x62\xfe\
-\xd4\x9e\x4f\x9f\x36\xd7\x32\xcb\x29\xe6\x73\x50\xf2\x88\x5c\xbd\
-\x63\x79\x12\xac\xbc\xce\x5f\x4d\x7a\x38\x1b\xd5\xfc\x83\x29\xd2\
-\x94\x9c\x46\x86\x80\x57\x9d\x75\x0e\x0b\x14\x4a\x6d\x43\xcb\xa0\
-\x06\xc4\x27\x62\xda\xf4\xf7\x0a\x52\x1d\xd5\x93\xd0\x54\x71\x62\
-\x93\xe2\x5a\x4c\xda\xc5\x6e\x2a\xb0\xac\xd5\xe2\x82\xd3\xce\x4c\
-\xe2\xa1\x65\xa0\x91\x45\xe8\xb4\x9a\x83\x90\x5d\xf3\x7b\xbb\x90\
-\x02\x74\x51\x1a\x0a\xe9\x02\x97\x91\x53\xd7\x1d\xc6\x11\xfb\x1f\
-\xc8\xc4\xe6\x4d\xb8\x86\x45\x45\xa7\xe5\x5f\x33\xff\x7d\x72\xd9\
-\xf4\x47\xb8\xe2\x3e\x51\x01\xe3\x2c\x9d\x89\x49\x8e\x3e\xf8\x10\
-\xd6\x2c\x5d\x92\xb0\xff\x39\x35\x32\x9a\xd8\x5d\x67\x82\x80\xaa\
-\x01\x9e\xd9\xf0\xe9\xd5\xc2\xa9\xae\x9d\x41\x29\x88\x54\xcd\xd5\
-\xaa\x04\x51\xcd\x9a\x78\xa3\x74\x8c\x52\x9a\xde\xba\xb9\x4e\x2f\
-\x02\xe7\x1e\xba\xcb\xfd\xf4\xdd\x6d\x15\x44\xbe\xea\xb7\x57\xff\
-\xe6\x09\x85\xde\xc3\xe8\x3a\x07\xa9\x67\x8e\xea\xa7\x6f\x87\x63\
-\xdc\x01\x3c\x55\x0d\xde\xa4\x96\x60\x19\x23\x67\xae\x3b\x94\xf3\
-\x8e\x3d\x1e\x33\x31\x05\x28\xc6\xa5\xf9\x00\xd1\x19\x1f\xf8\x64\
-\x35\x49\x6c\x4b\xe2\x5c\xe2\x26\x01\x64\x72\x8a\xe3\x0f\x3e\x94\
-\x23\x0e\x5a\x83\x57\x28\xac\x9b\x5e\xf8\xfc\x09\x3e\x66\x97\x6a\
-\x00\xc9\x3f\x67\xe5\x13\x6b\x88\x44\x96\xbb\x16\xcf\x3e\xe9\x0c\
-\xdc\x94\x47\x5c\x1a\x58\xa8\x0e\xa8\x7a\x98\xab\xd9\xe9\x27\x9f\
-\x49\x97\xfb\x81\x3c\x0c\x63\x81\x90\x26\xeb\x9a\x08\x27\xac\x3f\
-\x9c\x01\x12\x6b\x92\xe4\x39\xfa\x47\xcb\x7b\x0c\x3d\x03\x53\x39\
-\x42\x88\xd2\x7d\x5e\xab\x08\xc1\x6a\xc0\xc5\x12\x1b\x3d\xa2\x1e\
-\xf2\x28\x6f\xd0\x90\x04\x39\x49\x74\xd4\xa9\xef\x6b\x50\xcd\x83\
-\x2b\x4c\xbf\xd6\xd2\x9d\x33\xd9\xfd\x57\xa7\x5a\xf0\xf5\x90\x5b\
-\x8e\x4c\x82\x76\x77\xf9\xac\xd6\x63\x72\x8c\x10\x89\x94\xa2\x49\
-\x0c\x83\x2e\x7d\xdc\x63\x21\xf7\x6a\x3d\xc1\xdc\xea\xeb\x03\x5e\
-\xfb\xdc\xe7\xb3\x4c\x9a\x14\xe3\x53\xa8\x2f\xa1\x65\x51\x22\x2e\
-\x18\x6c\x00\xa3\xbb\x5e\x14\x9b\x4f\x9b\xf6\xd8\x18\x01\x67\x08\
-\x04\xc4\x28\xce\x08\xae\xe3\x39\xef\xd8\x93\x58\x8a\x85\x18\x32\
-\xeb\x7c\xd7\xe3\xf7\x66\x4c\x73\xb5\x5d\xea\x02\x18\x2a\x19\x65\
-\x83\x1a\x83\xb8\x14\x7e\x5c\x7c\xca\xd9\xac\x5d\xb4\x94\xa9\xc9\
-\x31\xa4\x31\xfd\x2d\x9f\x9c\x0b\x3f\x9f\xb2\xa6\x69\xad\x64\x69\
-\xbc\x33\x6a\xa4\x68\x16\xd8\xb6\x67\xe5\xe0\x08\x67\x1f\x7f\x42\
-\x9a\x9d\x37\x8f\xad\xc3\x36\xed\x82\x64\xe7\x58\x91\x50\xf6\x06\
-\xd3\x52\xb9\x82\x08\x68\x24\xc6\x80\x0f\x3e\xed\x04\x6a\x28\xc4\
-\xd0\x50\x4b\xab\x23\x34\xda\x42\x08\x49\x86\x4a\x7a\x59\x2a\xe8\
-\x7e\xce\xce\x27\x7a\x7e\x3a\x0b\xa2\x04\xa3\xe8\xb4\xf9\xd9\x2a\
-\x2b\x49\xb2\x5a\x99\x53\x0e\xca\x80\x89\x11\xa3\x89\xd6\x24\x12\
-\x09\x44\x3c\x31\xa9\xfa\xca\xce\xb9\x24\x7b\xaf\xab\x88\xe0\x24\
-\xf1\xe6\x9f\xbc\x72\x3f\x2e\x3e\xf9\x34\xec\xb6\x31\x1c\x8a\x6a\
-\x89\x98\x4a\x3a\xdd\x62\x74\x57\x30\x71\xf3\x6b\xf5\xc0\x61\xd5\
-\x39\x8a\x21\xf1\x11\x0a\x14\x56\x98\xda\xba\x99\xf5\x07\xac\xe2\
-\x59\xc7\x9f\x8c\x00\x4d\x63\xd1\x10\xb3\x96\x67\xcf\x3c\xce\x2e\
-\xda\x2e\x47\x00\xd5\x1c\x78\xda\x93\xc0\xfa\xc8\xba\xc1\x61\xce\
-\x3f\xee\x64\x68\x4f\x52\xc7\x5d\x32\xe3\xd5\xfb\x3e\x4f\x92\x9a\
-\x40\x3d\x75\x5f\xc9\x6f\xe5\xc2\x92\xf1\x01\xbf\x69\x2b\x67\x1c\
-\x76\x24\xab\x86\x17\xe0\x83\x76\x99\x73\xe8\xd9\xad\x1e\xe5\x8d\
-\xd3\x92\x4f\xab\xd5\xa2\x58\x8d\x38\x8d\xb8\x58\x5d\x1b\x4b\x10\
-\x43\x69\x1c\xc1\x36\x89\xb6\x60\xcc\x18\xee\x6d\x4f\x70\xdb\xd6\
-\xcd\xdc\x3b\xb6\x8d\xad\x46\xd0\xa6\xc3\x24\x7d\xea\xe4\x2f\x82\
-\x76\xa3\x16\x49\xb2\x53\x6d\x51\xda\x12\x77\xfb\x62\x88\x44\x3c\
-\x81\x20\x31\x8d\xc0\x1b\xc1\x8b\x22\x59\x9a\x4b\x0a\x83\x58\x93\
-\x48\x2b\x5d\x41\x08\x29\xe1\x77\x9a\xa6\xd5\xaa\x9a\x7d\x49\xa4\
-\x2d\x91\x72\x17\x8e\xb1\x81\xd0\x0f\xfc\xe2\x45\x17\xb3\x6e\xf1\
-\x32\xc2\xd4\x54\x22\x67\xcd\xa9\x1a\x90\xb5\xf9\x9e\x24\xb9\xe7\
-\x4c\xc7\x6d\xd2\x7c\xbf\xc4\x12\x1b\x03\xb6\xd3\xe1\xa2\xd3\xce\
-\x64\x55\xff\x20\x2e\x44\x5c\xcc\x37\x38\x93\xbf\xfc\xa4\x03\x79\
-\x73\x63\x04\x82\xee\x2c\x2c\x99\x03\x23\x7f\x29\x65\xa4\x61\x0c\
-\xcf\x3f\xf3\x1c\x3e\xf1\xdd\x2f\xf3\x48\xa7\x83\x75\xfd\x35\xab\
-\x70\x45\x20\x59\xc3\x3b\x79\x12\x75\x06\x34\xad\x54\x63\xd3\xb8\
-\xa8\xe6\xa1\x27\x13\x02\x0b\x4d\x83\x73\x8f\x3f\x89\x41\xc8\xf0\
-\xdf\x1e\xce\xfd\x47\x91\x62\x42\x66\xa6\xa7\x0a\xc1\x67\x72\xd5\
-\xcc\xa8\x6b\x85\xb6\xa6\xd9\x8b\x71\xe0\x9a\x7b\xee\xe4\xb2\xef\
-\x5f\xcb\x2d\x0f\xde\xc7\xcd\x77\xdd\xc9\xb6\xf1\x71\x8a\xc2\xb2\
-\x62\xe9\x72\xd6\x2e\xdf\x87\xc3\x57\xec\xcb\x99\xc7\x1c\xcf\xc1\
-\x0b\x16\x31\x60\x84\x58\xc6\x4c\x48\x11\x89\xce\xd2\xd1\x80\x91\
-\x24\x59\xb6\x3b\xcd\x91\x52\x1f\x8c\xa3\xa3\x29\x45\x6a\x38\xc3\
-\x9d\xed\x29\x36\x6f\xdf\xc6\xed\xf7\xdf\x43\xa3\xd5\x64\xff\xc5\
-\xcb\x59\xd4\xd7\xcf\x8a\xbe\xfe\xc4\x76\xec\x13\x98\xca\x89\x21\
-\xe6\xfd\xcb\x4b\x55\x44\xdd\xb1\x8f\xb5\x03\xd4\x57\x04\x8d\x25\
-\xbe\x54\xd6\x8e\x2e\xe4\xd5\xcf\xb9\x88\x77\x7e\xfc\xef\x60\x78\
-\x00\x35\x8a\xd7\x40\x61\x5c\x5d\x14\xdb\xf3\xe3\xd0\x6e\x58\x58\
-\x2f\x13\x49\x5d\x0d\x27\x82\x8e\x4f\x72\xc0\xe8\x22\xce\x3f\xf1\
-\xe4\x4c\xd4\x92\xab\x48\xa6\x82\x4e\xf5\x8c\x98\xf7\xac\xb3\xb9\
-\xde\xc3\xb9\x5b\x35\x07\xd3\x33\xb7\x6c\xac\xa0\x21\x72\xe4\x8a\
-\x95\x5c\x78\xcc\x89\xfc\xf3\x65\x97\x52\x2c\x19\x62\xca\x77\x10\
-\x67\x93\xe8\xc4\xcc\x1b\xa8\xdd\x29\xd9\x3d\xfa\xd6\x08\x09\xd8\
-\x43\x75\xa0\x9a\x34\x66\xc7\x27\x59\xb7\x64\x39\x27\xaf\x5b\x9f\
-\x46\xfd\x7f\x82\x75\x55\x9d\xb7\x21\x09\x4f\xda\xbc\x53\x79\x07\
-\xa5\x31\xb4\x81\x6f\xfe\xf8\xc7\xfc\xdb\x17\x3f\xcf\x77\x6f\xfa\
-\x01\x0f\x4c\x8d\xd1\x69\x35\x88\x4d\x9b\x28\x9f\x3b\x91\x1f\xdd\
-\xfe\x43\xbe\x7e\xcb\x0d\xf4\x95\x81\x7d\xfe\xfb\xd3\x9c\xb6\xe6\
-\x70\x5e\xfd\xcc\xe7\x70\xd6\xea\xd5\x74\xda\x81\xc2\x0a\x45\x04\
-\x11\xfb\x13\x93\x93\x3e\xea\xe5\xf1\x82\x55\x8b\x0f\x11\x29\x1c\
-\x9b\x80\x4f\xfd\xcf\xe7\xf8\xec\x37\xbe\xc6\x86\xf1\x6d\x6c\xeb\
-\x4c\x10\xad\x30\xd4\x6a\xb2\x7c\x60\x84\xf3\x4f\x3d\x8b\xe7\x9d\
-\x7e\x0e\x6b\x06\x86\x71\x11\x5c\xe9\x71\x26\x69\x49\x38\x22\xc6\
-\xda\x39\x8a\xa7\xa4\x8d\xa5\x10\xa1\x1d\x02\x17\x9f\xf5\x0c\xbe\
-\xfc\x83\xeb\xf8\xfc\x0d\xd7\x60\x87\x46\xa0\xb0\x74\x7c\x89\x71\
-\x2d\xf0\x9d\x27\xc1\x8e\xa3\xf5\xae\x5a\xb3\x6c\xab\x22\x56\x28\
-\x82\xc1\x8c\x4f\x70\xd1\xd3\x9e\xc9\x21\xa3\x0b\xd3\xd8\xaf\x98\
-\x3c\x89\xda\x1d\x32\xeb\xe5\x2a\xd9\x95\xf3\xdd\xa9\x2e\xc0\x2c\
-\x87\xd8\xe5\x58\x30\x11\x4f\xf2\x57\x36\x0a\xd1\x07\xb4\x61\xf9\
-\xe6\x3d\xb7\x73\xc9\x7b\xff\x90\x87\x8b\x02\xcd\x0a\xab\x51\xc8\
-\x5a\x77\x5d\xcf\x5e\xf1\xbc\xed\xe9\x30\xcd\xaa\x95\x6c\x48\x8c\
-\x38\x4a\xa4\x88\x91\x81\xcd\xe3\xbc\xeb\x79\x2f\xe1\x57\x9f\x73\
-\x11\x65\x59\x52\x38\x83\x99\x65\x77\xdd\x59\x1a\xd0\x8d\x00\x14\
-\x8b\x47\x82\x41\x63\x12\x0c\xf5\xce\x72\x7b\x7b\x9c\x0f\xfe\xfb\
-\xbf\xf3\x5f\xdf\xfa\x26\x5b\x26\x26\x90\x81\x7e\xec\xf0\x00\x13\
-\xea\x33\xcf\x7d\x2e\xac\x09\xa8\x33\x44\x2d\x91\xa9\x12\xb3\x75\
-\x82\x65\xea\xb8\xe4\xfc\x0b\x79\xd3\x0b\x5f\xc2\x02\x63\x28\x7c\
-\xc4\x64\x75\x20\x0a\xb3\x7b\x17\x43\x3b\xa0\x11\x42\x9f\xe5\xb6\
-\xc9\x49\xfe\xf0\x23\x7f\xcf\x67\x2e\xff\x26\x7e\xa0\x85\x0e\xb4\
-\xf0\x05\xa9\x26\xe0\x4b\x68\x97\xd8\xb6\x67\xd5\xd0\x42\x5e\x78\
-\xd6\xb9\xbc\xe2\xbc\x67\x72\x60\xdf\x00\xa6\xed\x69\x54\xa5\x3a\
-\x63\xc0\xed\xb8\x29\xec\x78\x1d\x15\xd5\x40\x8c\x91\x18\xa1\x2c\
-\x1a\x7c\xf7\xfe\xbb\x79\xed\x9f\xbc\x87\xfb\x43\x9b\xd8\x6c\x42\
-\xb3\x9f\x30\xd9\x01\x5b\xe9\x07\xef\xc1\x96\xe9\xf4\x4d\x4c\x10\
-\xf3\x60\x40\x6d\x44\x62\x49\x7f\xa9\xec\x17\x0c\x9f\xfc\xbd\xf7\
-\x72\xc4\xa2\x25\xb8\x90\x14\x84\xaa\xae\x08\xcc\x94\xf8\xde\x35\
-\xb3\xef\x79\xcf\x7b\xde\x33\xe7\xe3\xac\xff\xa7\x62\x35\xcd\xb9\
-\x6e\x04\x1f\x02\x07\x2c\x5c\xc4\xed\x5b\xb6\x70\xf9\xcd\x3f\x64\
-\x60\x70\x10\x1f\x35\x51\x1a\x85\x50\xb7\xc8\xaa\xf7\xa9\xc0\x75\
-\x7b\xba\xd5\x02\x17\x92\xf2\x6c\xa6\x3a\x1c\x34\xb4\x90\xdf\xbe\
-\xe4\x35\x2c\x69\x35\xb1\x46\xf1\x35\xd3\xcf\x8e\xa1\xea\x0e\x16\
-\xbb\x9e\x5a\x6b\xe8\x8b\xd0\x41\x51\xe7\xf8\xc6\xfd\x77\xf3\xd6\
-\xf7\xfd\x09\x5f\xb8\xfe\x5a\x26\xfb\x9a\x98\x91\x61\x4a\xe7\xf0\
-\xaa\x84\x8e\xc7\x8a\x45\xca\x88\x0d\x4a\xa1\x4a\xd9\x29\x09\x58\
-\x68\x34\xa1\x70\x84\x96\xe3\x1b\xd7\x5e\xc9\xc6\xb1\x6d\x1c\x7b\
-\xf4\x31\xf4\x1b\x9b\xf3\x45\xb3\xab\xf1\xde\x63\x5a\x34\xd0\x36\
-\xca\x98\x31\xbc\xf5\x2f\xfe\x98\xcf\x7f\xef\x1a\xcc\xf2\x25\xb4\
-\x5b\x0d\x82\xad\xd0\x0f\x16\xe3\xfa\x10\xd7\xc4\xf6\xf7\xb3\x79\
-\x62\x9c\xab\x7e\xf8\x03\xbe\x73\xdd\xb5\x2c\x5c\xb1\x9c\x03\x97\
-\xaf\x40\x9c\x41\x82\x4f\x0f\xb2\xdd\xf1\x9a\xcd\x76\x1d\x43\x16\
-\x4a\xb1\xc6\x42\x19\x38\x60\x74\x21\xde\x58\xbe\xf9\xfd\x6b\x88\
-\x03\x2d\x7c\x88\x49\xee\xcb\x3c\x19\x1c\x40\x06\x90\xa9\x60\x55\
-\xf2\xce\x1e\x29\x44\x88\x9b\xb6\xf0\x8b\x17\x3e\x8f\xe7\x1f\x73\
-\x02\x36\x44\x4c\x45\x3d\x98\x87\xa0\xd2\x66\xda\x05\x4e\xf5\x94\
-\x7f\xe6\x64\x3f\xa1\x03\xc8\xbd\x59\x12\x30\x43\x6c\x12\x4d\x28\
-\xac\xa1\xb5\x6c\x19\x9f\xbb\xee\x6a\xa6\xa6\xda\x09\x9c\x21\x26\
-\xcf\xd0\x3f\x39\x1d\x00\xa6\x6a\x5a\x0b\xc6\x08\x71\xfb\x38\x2f\
-\x3a\xf3\x69\x5c\x7c\xdc\x09\xd8\x32\xc9\x4f\x89\x91\xac\x88\xf3\
-\x18\x0e\xa0\xa7\x03\x20\x55\x5e\xa1\xe0\xa3\xe2\x9d\xe3\x33\xd7\
-\x5c\xc1\x5b\xfe\xfa\xbd\xdc\x32\xb5\x9d\x62\xe1\x08\xa5\x35\x94\
-\x31\xa4\x76\x90\x46\x6c\x5f\x03\x1f\x3a\xa8\x55\xd4\x41\x47\x02\
-\xa8\xc1\x85\x02\x8d\x01\x2d\x2c\x1d\x13\x29\x46\x06\xb8\xfa\x86\
-\xeb\x98\x6c\x4f\x71\xda\xfa\x63\x69\x4a\xb5\xc3\xee\xde\x4b\xb3\
-\x1d\x65\xcc\x5a\xde\xfb\xa9\x8f\xf2\x99\xab\xbe\x4b\x5c\xb4\x80\
-\x71\x40\x4d\x01\x41\x69\x46\x47\xab\x34\x18\x0f\x1a\x2d\xd1\x47\
-\x6c\xab\x85\xf6\x37\x78\x70\xcb\x46\xbe\xf2\xed\xcb\x68\x13\x59\
-\xb7\x76\x1d\x0d\xeb\x12\x1f\xe1\xcc\x6b\x26\x30\x1b\x6e\x42\xd1\
-\xcc\x45\x23\x48\xa9\x88\x1a\x0e\x3e\xf8\x60\x6e\x78\xe0\x1e\x6e\
-\xbe\xf7\x2e\x4c\x5f\x0b\x1b\x12\x71\xad\xce\xe2\x40\xf6\xa8\x47\
-\xcf\xa4\x9c\xb8\x02\xcc\x45\x01\x8c\x10\x26\x27\x39\x78\xc9\x72\
-\xde\xfd\xea\xd7\xb2\x4f\xd1\x4c\xd2\x65\x66\xba\xe6\x92\x30\xbb\
-\x03\x98\xeb\xad\x9e\x3b\x1f\xc0\x8c\xff\xa9\xbb\x4b\x92\xe8\xaa\
-\xad\x33\x84\xd2\x73\xfc\xb2\x15\xbc\xf8\xf4\xd3\xe9\x4c\x6d\xc3\
-\x3a\x41\x3b\x1e\xa7\x2e\x15\x35\xac\xcd\xde\x2e\xe1\xbe\xe6\xcb\
-\xaa\x96\xcb\xcc\xd7\xcc\x2e\x94\x8d\x86\xc2\x3b\xd4\x82\x16\x81\
-\x38\xbe\x8d\x75\x83\x43\x5c\xf2\xb4\x73\x69\x02\x62\x52\x0f\x5e\
-\xa2\xd4\x73\xec\xd3\x98\x7b\x7b\x61\x71\xb9\xea\xd7\x31\x4a\xa9\
-\x01\xdf\x6e\x63\x7c\x22\x0f\x9d\x72\x8e\x0f\x5d\xf6\x25\xde\xf4\
-\xc1\xbf\x62\x53\xb3\x89\x6b\x8e\xd0\x69\x57\xf4\x9b\x10\x63\x00\
-\x51\x42\x48\xd2\x5d\x9a\x07\x64\x94\xd4\x2b\x8e\xe2\x33\x33\x11\
-\x10\x1d\xa5\x17\xfa\x96\x2e\xe7\xe3\x5f\xf9\x1f\x3e\xfb\xfd\x2b\
-\x13\xf0\x26\xc6\x0a\xce\x34\x2d\x1d\xdb\x01\xa5\xa7\x8a\xe2\x53\
-\xca\x90\x8f\x3f\x02\x25\xa9\x05\xaa\x59\xd1\xa6\xe3\x13\x31\xc5\
-\xd7\x6f\xbf\x89\x7f\xfb\xce\xd7\x98\xe8\x6f\x31\xe1\x04\x9c\x83\
-\xa8\xd8\x08\x1a\x3d\xa5\xb6\x09\x2e\x12\x4c\xc0\xb8\x54\x2f\xf2\
-\x01\x74\x68\x80\xc9\xd1\x41\xfe\xfc\xd3\x9f\xe2\x57\x3f\xf0\x57\
-\xdc\x35\x35\x49\xc7\x18\x7c\x67\x0a\x89\x25\x68\x20\x68\x4c\xce\
-\x91\xae\x54\x5a\x35\x32\x2c\x58\xc4\xba\xa4\x95\xd7\x72\x58\x0b\
-\xcb\x8c\xe1\xb7\x5e\xf0\x4a\x0e\x6b\x2e\xa2\x6f\xac\x4c\xe7\xe4\
-\x6c\x0f\x6f\x40\x7a\x99\x18\xeb\x96\xe4\xf4\x87\x7b\x9e\x2c\xa6\
-\x1d\x41\x4d\x86\xd1\xc6\x36\xb6\x50\x98\x9a\xe0\x05\x67\x9c\xc3\
-\xa1\xfd\xc3\xf8\xd2\xd7\x69\x77\x45\xc7\x5e\xe9\x37\xf4\x1e\xff\
-\xae\xcd\x02\xfe\x94\x7b\x42\x3d\x2d\xaf\xb9\xf5\x65\x0d\x2d\xe0\
-\x95\x67\x9e\xcd\x01\x23\x23\xc4\xb2\x83\x6b\x36\x88\x21\xa6\x5d\
-\x34\x27\xfd\xdd\x9e\xef\xfc\x85\x66\x3b\x85\xaa\xf6\x9e\x5c\xc8\
-\x9c\xff\x1a\x31\xa2\x98\x89\x71\x9e\x73\xc2\xc9\x1c\xb5\x78\x19\
-\xd1\xfb\xb4\xb0\x54\x32\xe0\x64\xb6\x7e\xe7\x6c\xef\xaf\xb4\x3b\
-\x6d\x8c\x18\xca\x32\xd0\xb1\x8e\xf7\x7d\xf1\xb3\xfc\xce\xc7\xfe\
-\x9e\xa9\x45\x23\x94\x8d\x16\xaa\x0e\x43\x91\xfa\xe8\xbd\xbb\x57\
-\x05\x9f\xad\x40\x04\x6a\x89\xaa\x04\x9b\xa5\xb0\x14\x6c\x16\x01\
-\x0d\xe2\xe8\xb4\x9a\x7c\xe8\xdf\x3f\xc5\x03\xed\x36\xe2\x4c\xea\
-\x4e\xcc\x82\xc1\x9f\x86\x11\xea\xf5\x06\xf9\x77\xeb\x36\x53\x46\
-\xda\xa5\x99\x10\x61\x3b\xf0\xe9\xaf\x7c\x89\x0d\xe3\x13\x98\xe1\
-\x01\xb0\x0e\xca\x32\xd3\x8f\x07\x94\x40\xa7\x08\x74\xa4\x8d\x8a\
-\x47\x43\xfa\x99\x28\xf8\xa0\x4c\xc5\x48\xb1\xcf\x0a\xbe\x78\xdd\
-\x95\xfc\xf2\x9f\xfc\x3e\x37\x6d\x78\x18\x69\x36\xe8\x44\x8f\x0f\
-\xa1\x87\x53\x21\xf1\xeb\xfb\x9e\x2e\x41\x35\xf9\x16\x45\x88\x15\
-\x45\x71\x88\x1c\xbb\x64\x19\xbf\xf6\xa2\x57\xd0\x3f\x59\xe2\x8c\
-\x25\x78\x8f\x58\x8b\x6b\x34\x12\x1e\xc1\x07\xc4\x98\x3d\x0c\x9c\
-\x66\x52\xa4\x1c\x3c\x58\x68\xb4\x1a\xf8\x2d\x5b\x38\x7c\x9f\x7d\
-\x79\xe9\x39\xe7\x65\xba\x72\xc1\x9a\x94\x22\x98\xcc\xbe\x3d\x6d\
-\xc3\xea\xd9\x98\x77\xc5\x9f\xed\xd6\xa0\x30\x29\xe4\x94\x1c\xb3\
-\x70\x39\x2f\x3e\xed\x69\x74\xb6\x6e\xa5\x94\x12\x69\x08\xcd\x32\
-\xd2\xec\x44\x4c\x9c\xc1\xa7\x3e\x0f\x56\xc1\x79\x67\x7b\xf5\xfe\
-\x52\x2c\x84\x12\x8f\x2d\x1c\xae\xa3\x1c\x30\xbc\x98\x17\x9c\x77\
-\x61\x52\xa4\x51\xcd\xd1\x4f\x75\x21\x67\x20\xfc\x2a\xa0\x4f\xee\
-\xc5\x07\x93\xb8\x14\x1a\x41\x19\x68\xf4\xe1\x9d\xa3\xdd\xd7\xe0\
-\xaf\xfe\xeb\xd3\xfc\xd9\xa7\xfe\x05\xb7\x78\x11\x21\x24\x41\xcb\
-\x18\x3b\x49\x09\x76\x0e\xa0\xee\x1a\x53\x51\x0d\x84\x01\x52\x58\
-\xda\xbe\x43\xd1\xdf\xe2\xb6\xfb\xef\xe5\xd3\x97\x7e\xa5\x67\x9c\
-\x7b\x76\x8b\xbd\xc7\xbd\xc3\x5c\x5e\x7e\x50\xf2\xa0\x57\x14\x68\
-\x14\x86\x2b\x6f\xbb\x99\x6f\x5e\x7b\x35\xad\xc1\x41\x42\x59\x26\
-\xad\x3b\xe3\xb2\xef\x48\x8b\xb3\x97\x25\x6a\x66\x28\x6f\xfa\xfa\
-\x98\xf4\x6d\xcc\x82\x11\xae\xbb\xef\x2e\x5e\xf7\xa7\xef\xe1\x5b\
-\xf7\xde\x45\x28\xfa\x29\x11\x9c\x0a\x26\xc4\x4c\x11\x9e\xab\x4e\
-\x2a\x3b\xf0\xfd\xd7\x95\x70\x63\xf0\x31\xf2\xec\x53\x4e\xe1\x85\
-\xcf\x38\x0f\xdd\xb0\x91\xc1\x46\x0b\xf5\x11\x3f\x39\x85\xc5\x61\
-\x6c\x91\xa2\x09\x63\xd2\x8e\x4b\x46\x32\xce\xa3\x37\x10\x63\x51\
-\x1f\x71\xd6\xd1\xe9\xb4\xb1\x0a\xfd\x63\x25\x97\x9c\x79\x01\x2b\
-\x9a\x7d\x78\x02\x85\x49\x9c\x1b\xbd\x1b\x42\xd4\xf8\x53\xf3\x6f\
-\xec\x76\x7c\x58\x43\x52\x14\xf0\xba\xf3\x9e\xc3\x91\xfb\xee\x4f\
-\x9c\x1a\x43\x9c\x52\x28\x34\x43\x1a\x0e\x42\x6c\x7a\xed\xe1\xa6\
-\x46\xd1\x06\x98\xe0\x89\x1b\x36\xf3\x92\xb3\x9e\xc1\x91\x8b\x97\
-\xe1\x43\xa4\xb0\x16\x9f\xd1\x5a\x69\x58\xaa\xe7\xef\xf2\xc2\x0f\
-\x19\xbe\x1b\x2b\xa5\x5a\x22\x84\x54\xcc\x2b\x8d\xf0\x0f\x97\x7d\
-\x95\xbf\xfa\xdc\x7f\x10\x96\x2e\x66\x22\x44\x62\xd1\x40\x63\x40\
-\x2c\x04\x5f\x32\x17\x07\x39\x73\xe8\x4d\x85\x24\x2b\x65\x84\x8e\
-\x11\xda\x85\xe5\xd2\xef\x5d\xc5\xc3\x90\xa8\xa6\x67\x88\x62\x56\
-\xff\x68\xcf\x1b\x6a\xef\x76\x42\x4f\xba\x67\xf2\xb8\xa9\xc0\x24\
-\xf0\x99\x4b\xbf\xcc\x16\xdf\x86\xbe\x66\xc2\x03\xe4\x69\x48\x93\
-\x05\x63\x92\x6c\x41\x75\x0e\x15\x88\x24\xe6\x24\xd5\x11\xda\x1d\
-\xb4\xd9\x62\xc2\x59\x3a\x23\x43\xdc\x3c\xb6\x95\xd7\xfe\xe5\xff\
-\xe1\x2b\x77\xde\x86\x14\x0d\xbc\xc6\xac\xab\x10\x30\x19\xe8\x2c\
-\xb5\xf7\x26\xf1\xe9\xd7\x31\x42\x4c\x63\xda\x08\x0e\x78\xfb\x8b\
-\x5e\xce\x05\x47\x1c\x4d\xf9\xc8\x66\xfa\x5c\x13\x47\xc2\xd4\xd7\
-\x3a\x6d\xd3\x2e\xed\x0e\x73\x97\x4f\xec\x73\xe6\x7d\xaa\x21\xa9\
-\xe2\xfa\x5b\xb4\x37\x6f\xe1\xbc\xc3\x8e\xe6\x92\xb3\xce\xa5\x41\
-\x1e\xc6\x93\xe4\xe0\x76\xb7\xed\xf6\x77\x34\x62\xd0\xa9\x92\x55\
-\x03\x03\xfc\xd2\xb3\x9f\x4f\x11\x14\xf5\x25\xa5\x8b\x78\x13\xf2\
-\xd3\x56\xeb\xce\xec\xd9\xa6\x8a\x38\xd0\xf1\x09\x8e\x59\x79\x00\
-\x97\x3c\xe3\x42\x1c\xd0\x94\x14\x8e\x49\xfe\x9d\x5e\x40\x83\xf6\
-\x2c\x7c\x43\xc4\x12\x70\x1a\xb1\x39\x7c\xf6\x44\x6c\xab\xe0\x33\
-\xdf\xbb\x9a\xf7\xfe\xeb\xc7\x19\x1b\x18\x60\xca\x38\xa2\x6d\xa1\
-\x51\xd0\xa8\x44\x02\x3a\x47\xff\x38\x2d\x8e\xaa\xd4\x67\x9c\xc1\
-\x14\x05\x31\x46\xb4\xbf\xc5\xf5\xf7\xde\xc5\x35\xb7\xdf\x3a\xbd\
-\x09\x30\x23\xfd\xed\x75\x02\x3a\xe3\x03\x7a\x05\xbf\x63\x1e\xc8\
-\xb9\xe1\x81\xfb\xb8\xfc\x87\x3f\x40\x07\xfb\x99\xf4\x25\xe2\x5c\
-\x8a\x88\x42\xe8\x61\xf6\xc9\x6f\x90\x0f\xb2\x62\x8d\x96\xea\x42\
-\x49\x81\x04\x88\x2a\x94\x62\x60\x64\x84\xbb\xca\x92\x37\xfe\xd9\
-\x1f\xf1\xcd\x3b\x6f\x47\x1a\x05\x65\x5e\xf8\x8e\xc4\xc1\xa0\xd3\
-\x4f\x38\xff\x9b\x18\x9b\x62\x56\xd4\x29\x42\x60\x85\xb1\xfc\xee\
-\x25\xaf\xe5\xe0\xe1\x05\xb0\x75\x8c\x86\x35\x48\x21\x04\xd5\x34\
-\x59\x18\x24\x6d\x46\xe4\xe1\xa4\x79\xac\x03\x88\x24\x18\x79\x30\
-\x4a\x6c\x4f\xb1\x10\xc7\xeb\x2f\xba\x98\xe5\x45\x41\xe1\x43\xe2\
-\xdd\xcc\x75\x91\x5e\x07\x6e\xe6\x0a\x3f\x7f\x14\xfb\xa9\x57\xe1\
-\x8e\x21\x48\x56\x31\x29\x23\x2f\x38\xe9\x0c\xce\x59\x73\x28\x61\
-\x7c\x1b\x65\x4b\x69\xdb\x94\x53\x17\x6a\x6a\xbf\x3d\x6f\x36\x33\
-\x03\xd1\x04\xe7\x4d\x05\xd8\xac\xd6\xa2\x91\x46\x08\x0c\xb4\x4b\
-\x7e\xfe\x82\xe7\xb0\x7a\x70\x10\xf1\xe9\x81\xd4\x2c\x00\x5a\xdf\
-\x80\x1a\xdb\x9f\xce\xcb\xa0\x18\x8d\x48\x50\x6c\x4c\x43\x45\x3e\
-\x2a\xa1\xd1\xe0\x3f\x6f\xf9\x21\xef\xfe\x87\xbf\x65\x4b\xc3\x52\
-\x16\x05\x11\x41\xbc\x62\xda\x11\x5b\xe5\xb4\x73\xbd\xaf\xb5\x54\
-\x58\xf7\xbc\xa2\x2a\xb1\x92\xb5\x6e\x35\x79\x60\x7c\x9c\xef\xdc\
-\xf8\x83\x3c\x69\x50\x29\xea\xec\x78\x19\x7a\xab\xcb\xd3\x3e\x02\
-\xd0\xa8\x68\x48\xba\x82\x1e\xb8\xe2\x87\x37\x72\xf7\xe6\x4d\x68\
-\xab\x45\x34\x26\xd5\x2b\x62\xa8\x37\xfc\x58\x37\xdf\x2a\x4f\x23\
-\xf5\x70\x98\xa0\xd8\x98\xea\x42\x9a\x74\xb6\x88\x38\x26\x83\xa0\
-\x7d\xfd\x3c\x18\x4a\xde\xfe\xa1\xbf\xe6\x9b\xf7\xdf\x43\x2c\x1a\
-\x49\xa1\xdb\x93\xd9\x99\xb3\xf0\x8c\xa9\xa2\x9f\xee\xd1\x1a\x9b\
-\x0a\xd2\x7d\x46\xb0\xde\x73\xf4\xd2\x65\xfc\xd1\xeb\xdf\xc4\x72\
-\xe3\x30\xed\x76\xa2\xce\x4a\xf0\x45\x1a\x51\x68\x26\xd5\xad\x9e\
-\x62\xd6\xfc\x98\x51\x25\x86\x0e\xd2\xb2\xc4\xed\xe3\x3c\xe7\xa4\
-\xd3\x39\xed\xd0\xc3\x13\x40\x4c\xc0\x6a\x04\xd7\x6d\x91\x3e\x26\
-\xd4\x7c\x57\x3e\xfb\xa7\xf9\xe3\xd9\xf2\x8f\x88\x12\x2d\x18\x13\
-\x59\x82\xf0\xf6\x8b\x5e\xcc\x62\x53\x10\xe3\x14\xa1\xcf\x24\xe9\
-\xa3\x50\x79\xb2\xf9\x2e\xbf\x4e\x37\x6b\x12\xdb\x8f\x86\x48\x61\
-\x0b\x9a\x62\xe8\x6c\xd8\xc4\x69\x6b\x0f\xe7\xa2\x33\xcf\x4e\x73\
-\xfd\x46\x72\x27\x83\x2c\x47\xdd\xad\x1f\xf4\x42\x7c\x4d\xae\x9e\
-\x85\xa9\x40\x22\x6a\x36\x60\x1d\x97\x3d\x74\x1f\x6f\xf9\xdb\x3f\
-\x67\x03\x9e\xd0\x2c\x40\x93\x83\x70\x21\x0b\x3a\x64\x8d\xaf\x5d\
-\x49\xed\xb4\x67\x97\x85\x2e\xd2\x12\x84\x28\x86\xb2\x59\x70\xfd\
-\x1d\xb7\x31\x56\x21\xce\x32\xa9\x69\xf5\x21\x3d\xe2\x60\x5d\x9b\
-\xe1\x19\xc4\x28\xc6\x5a\xa2\x35\x6c\x00\xbe\x74\xed\xe5\xf8\x66\
-\x03\xaf\x9a\xdd\x9d\xe4\xe6\x42\xe6\x8e\x34\x5a\x1f\x43\xbd\xc2\
-\x72\x6a\x14\x25\x3d\xf4\xce\x07\x8c\x8f\x49\x8a\x2c\x90\xbb\x29\
-\x16\x1d\xe8\xe7\xd6\xf1\x2d\xbc\xf5\xfd\x7f\xca\x77\x1f\xb8\x07\
-\x6c\x81\x2f\x23\xea\x03\x25\x91\x8e\x74\x35\x01\xea\x6a\x45\x2e\
-\x8e\x26\xd9\x06\xa5\x29\x06\x5f\x7a\x2e\x5c\xb7\x8e\xb7\xbf\xf8\
-\xe5\x34\xa7\xda\x88\xef\xe4\xdf\x57\x1a\x2a\x14\x55\x2d\x61\xfe\
-\xca\x51\x15\xd8\x14\xac\x12\xa7\xa6\xd8\x7f\x68\x84\xd7\x5e\x78\
-\x11\x2d\xa0\x43\xc0\x98\x0c\xf4\x31\x96\x28\x3f\xfd\x8e\x3f\xd3\
-\x7e\xba\x2e\x40\xf6\x44\xbd\x2f\x35\x86\x68\x84\x80\x12\xca\xc0\
-\xd3\x57\xaf\xe3\xa5\x67\x3c\x0d\xb6\x6c\xc5\x9a\x40\x10\x0f\x76\
-\xd7\x35\xdb\x76\xbb\xcd\xa8\x86\x8b\x08\xbe\xd3\xa1\xd1\x68\x62\
-\x14\x42\xe9\x31\xed\x0e\x2b\x6d\x8b\xb7\xbd\xf8\x95\x2c\x45\x08\
-\x3e\x8d\xb3\xf6\xca\xbe\xa9\x76\x17\xfd\xb4\x71\x76\x05\x3c\x38\
-\x57\xe0\x51\xa6\xac\xe1\xd6\xb1\xed\xbc\xeb\xef\xdf\xc7\xbd\xe5\
-\x14\xb1\xbf\x0f\xb5\x02\x65\x07\x93\x73\x5c\x24\x87\xcf\xbb\x18\
-\x18\xcd\x08\x00\x12\x71\xa4\x0a\x88\x23\x44\x41\x5a\x7d\xdc\x78\
-\xfb\xed\x6c\x1c\xdb\xda\x83\xcb\x98\xfe\x37\xb5\x86\x61\xf7\x5d\
-\xba\x97\x29\x9f\x6f\x88\xa9\x82\x7e\xf7\xd6\x8d\xdc\x70\xff\x3d\
-\x68\xb3\x31\x2d\x26\x4f\xbf\x96\x16\x7f\x8d\xf2\xac\x99\x3d\xb3\
-\x63\x93\x24\xea\x59\x69\xe0\x39\x4d\xd1\x80\x8d\x8a\x0d\x01\x62\
-\xc0\x1b\x28\xfb\x1a\xdc\xb4\x75\x23\xbf\xf9\x0f\x7f\xcb\x0f\xb7\
-\x6e\x26\xf6\x35\x99\x8c\x95\xe8\x65\x24\x54\xf3\x16\xf9\xb8\x8d\
-\x58\x44\x0c\x5d\x89\xfa\x34\x42\x1b\xbd\xf2\xf3\x67\x9f\xc5\xab\
-\x2f\x78\x16\x6c\xda\x4c\x4b\x05\x27\x69\x7e\x23\xd0\x03\xf3\x9e\
-\xc7\x60\x54\x43\x49\xcb\x5a\x64\xd3\x36\x7e\xf1\xc2\x9f\xe3\x98\
-\xe5\xfb\x24\xfc\x87\x35\x15\x02\x3d\x69\x52\x3c\x0e\x9f\xbd\xdb\
-\x03\x1f\x91\xd4\x22\x12\x31\x18\x23\x48\x54\x7e\xf9\xd9\x17\x73\
-\xc2\x3e\xab\x09\x1b\xb7\x60\x1a\x96\xa8\x21\xab\xa2\xee\x19\x26\
-\x9a\x78\x0e\xac\xb1\xf8\xc9\x36\x16\xa1\x28\x1c\x76\xfb\x14\xaf\
-\x39\xef\xb9\x9c\xb2\xff\x81\xb4\x3b\xa9\xb0\x16\x8c\xe4\xf1\xdd\
-\x58\x77\xca\x92\x40\x5a\xb5\x93\x56\x25\x34\x83\x8a\x61\x32\x06\
-\x26\xad\xe1\x81\xe0\x79\xd7\xdf\xbf\x9f\x1f\xdc\x7d\x2f\x8d\xe1\
-\x11\x4a\x1f\x89\xa5\xc7\x34\x1d\x9e\x12\x6f\x03\xde\x24\xe7\x62\
-\x74\x47\x50\xd1\xce\x6c\xb6\x81\x37\x8b\xc1\xf8\x08\x21\x39\x28\
-\x63\x1b\x8c\x75\x3a\x3c\xf0\xf0\xc3\xe9\x78\x35\x76\x91\x99\x33\
-\x5b\xe1\x3a\x03\x5a\xda\xd3\x2e\x0b\xb9\x28\x77\xd9\x95\x57\x70\
-\xef\xb6\x2d\xd8\xbe\x3e\x34\x26\x61\xcc\x0a\xc0\xa2\x32\x7d\x2d\
-\x55\xaa\xbb\x52\x29\x8b\xa2\xa8\x01\x6f\x22\x51\x42\x56\xce\xd5\
-\xa4\xf4\x6b\x05\xa3\x01\x24\x12\x8d\xc1\x0c\x8d\x70\xe5\x9d\x77\
-\xf1\xab\x1f\x78\x3f\xf7\xc4\x00\xad\x26\x53\xed\x49\x24\xb4\x11\
-\x49\x9c\x08\xe9\x10\x7b\x3e\x54\x04\x95\x34\xae\x8e\x18\x1c\x91\
-\x42\x23\xbf\xfe\x82\x97\xf1\x92\x53\xce\x81\x87\x36\xd1\x40\x68\
-\x3b\x98\x2a\x94\x60\xc0\x06\x93\x8e\x6f\x1e\x4c\x55\xb1\x0d\x47\
-\x67\xd3\x26\xce\x5b\x7b\x04\xbf\xf8\xf4\x67\xa3\x68\x8a\xf8\xc9\
-\x9a\x07\x92\x20\xc2\x3f\x0d\xe4\x77\x67\xf6\xb8\x08\xbc\x1a\xa4\
-\x1e\x6e\x51\x8d\x1c\xd4\x3f\xc2\xdb\x9e\xfd\x62\x46\x63\x5a\xfc\
-\x2a\x09\xe6\xb8\x27\x24\x00\x92\x5b\xc8\x31\x44\xac\x18\x44\x95\
-\x46\xa3\xc1\xd4\xb6\xed\x1c\xbe\xfa\x60\x7e\xfe\xd9\x17\x61\x03\
-\xb4\xac\xc1\xab\xe2\x73\x4f\xba\x3e\xd9\xea\x9f\x58\x39\x92\xbc\
-\x9d\x88\xa4\x59\xf7\xc2\xd2\x06\xfe\xe8\x93\x1f\xe1\x0b\xdf\xbf\
-\x86\x62\x68\x04\x4a\xc1\x89\x49\xb9\x5f\x39\x89\x3a\xc5\x5b\x8f\
-\xb7\x91\x20\x99\x02\x6a\x17\xaa\x52\x15\x34\xa0\x3a\x1f\x8b\x20\
-\x21\x49\x96\x13\xc0\x5a\xc7\xc4\xe4\x24\xb7\xde\x75\x3b\x0e\x12\
-\x87\x1e\x29\xaf\x67\x26\x36\x40\x67\x8f\x88\x93\xd3\x30\x4c\x01\
-\xb7\xdd\x7f\x0f\x91\x00\xc6\x22\x41\xa6\x83\xa8\xba\x9e\xb0\x06\
-\x5c\xb9\x98\xc2\xed\xc4\x5f\x21\xf5\x45\x0f\x36\xe2\x4d\xc4\xdb\
-\x88\xb7\x4a\x90\x74\x75\x25\x44\x50\xa1\x13\x94\xc6\xa2\x45\x7c\
-\xeb\x96\x9b\xf9\xcd\x0f\xbc\x8f\x2d\x40\xb3\xd5\xa2\x11\xd3\x05\
-\x8f\xd3\x6e\x40\xf7\x7f\x93\xa2\x6f\x7e\xa9\xc7\x84\x0e\xa3\xc0\
-\xef\xfd\xfc\x2f\x71\xce\x11\xc7\x30\xb6\x75\x2b\xb1\xe5\x08\x2e\
-\x09\xbd\x36\x3d\xb4\x1e\x0f\xce\xb4\xb9\x3c\x7f\x46\x68\x87\x36\
-\x4b\xfa\xfa\x79\xc7\xc5\x2f\x67\x09\x40\xf0\xb8\x5c\xae\xa8\xba\
-\x29\x26\x76\x8b\x96\xbb\xd3\x76\x7f\x17\x00\x70\x92\x72\xb1\x14\
-\x8d\x29\x36\x44\x5e\x70\xec\x49\xbc\xf2\x8c\xf3\xb1\x1b\xc7\x30\
-\xd8\xc4\x9c\x1b\x02\x26\xc4\x84\x3a\x4b\x7d\x1d\x8c\x2a\x2d\x0f\
-\x4d\x9f\xd3\x04\x2b\xbb\x3d\x3f\xb3\x1a\xb1\x9a\xcb\x75\x92\x1e\
-\x18\x8c\x50\x9a\x88\x36\x0d\xb1\x3d\xc1\x62\x31\xfc\xc6\xcb\x5e\
-\xc9\xbe\xad\x26\x45\x8c\x88\xa4\x5c\x4d\xa8\xb8\xd7\x0d\xe4\x4e\
-\x40\x55\xb0\x8f\x15\xba\x3f\x46\x08\x31\xb1\xd4\x3a\xc7\x87\xbe\
-\xfa\x45\xfe\xf5\x1b\x5f\xc5\x2e\x59\x4c\x29\x29\x94\x56\x4c\x6a\
-\xeb\x98\x84\x9c\x43\xba\x21\xb2\xee\x42\x53\xba\xa6\x5f\xab\x52\
-\x12\x12\x51\x87\x5a\xc9\xd5\xf8\xb4\xc3\x6e\xf7\x1d\x6e\xdf\xb2\
-\x31\x1d\xaf\x26\xc7\x9c\x85\xf7\xba\x51\x44\xce\x87\x2b\xc9\xc7\
-\x64\x49\x14\xcd\xa8\xd0\xb0\x05\x77\x6d\xdd\xc2\x15\x37\xdf\x88\
-\x19\x18\x22\x86\xd4\xd7\x55\xe9\xce\xe0\xf7\x3a\x93\xaa\x6b\x10\
-\xf2\x6e\xdf\xfd\x79\x15\xe1\x98\x2e\x26\x24\xbf\x47\x14\x12\xe9\
-\xaa\x4f\x27\x33\x19\x22\x2c\x1c\xe1\xbf\xaf\xfa\x36\xbf\xf7\xd1\
-\x0f\x30\x25\x8e\x60\x8b\x94\xe6\x64\x16\x41\x20\x93\x8f\x74\x29\
-\xc9\x94\x84\xbf\xd0\xc2\x62\x54\xb0\x9d\x92\xfd\x9d\xe3\x2f\xde\
-\xfc\x2b\x9c\xbe\x6e\x2d\x71\xf3\x23\xd8\x46\x4e\x5a\xd4\xe6\x28\
-\xa6\x72\xde\xe9\x25\x9a\x14\xaf\x6d\xa5\xbd\x6e\x6c\x7a\xcd\xc9\
-\x12\x50\xcb\x04\x8b\x0b\xb9\x65\x69\x14\xc4\xe3\x88\xd8\x32\x24\
-\x50\x8f\xb5\xb8\x8d\x5b\x78\xed\x39\xe7\x73\xd6\x9a\x83\xe9\x78\
-\x8f\x33\x69\xe9\x4b\x6f\x24\xf8\x38\xed\x96\xbb\x3f\x05\xa8\x5e\
-\xf9\xd8\xad\x35\xf5\x22\x79\xd3\x45\x2f\xe4\x98\x85\xfb\x62\x27\
-\xdb\xc9\xab\x89\xa4\xf5\x5d\x3d\x95\x26\x41\x50\x8a\x00\x45\x48\
-\x68\xaf\xde\x21\xa2\xdd\x77\x8c\xe9\xe6\xa6\x57\xca\x1b\xa3\xb5\
-\x89\xee\x4b\x02\x7e\xeb\x66\xde\xf6\xdc\xe7\xf1\xec\x83\x0e\x86\
-\x32\xe4\x71\x5f\xc5\x01\x45\x46\xa1\x45\x93\x88\x28\xd3\x28\x2b\
-\x74\x62\xa0\x54\xc5\x07\x9f\xf3\xe5\x88\xb5\x86\x4f\x5f\x7b\x05\
-\x7f\xf1\xef\x9f\x80\xd1\x51\xbc\xb1\x78\x89\x78\x9b\x2a\xd9\x01\
-\x83\x56\x8a\x8e\xd1\xd6\xb1\x7c\x05\x1a\xda\x25\xab\x1c\x80\x40\
-\x69\x20\x58\x21\xe4\xc9\x23\x2f\x1e\xfa\x1b\x3c\x54\x06\x4a\x12\
-\x56\x43\x7b\x58\x59\xa6\xf1\x13\x48\x17\x76\x9b\xe8\xbc\x52\x3b\
-\x53\x72\x52\xff\xe0\xf8\x76\x1e\x99\x9c\xc4\x18\x9b\xe0\xc5\x52\
-\x09\xc6\xec\x78\x2c\x90\x16\xb4\x37\xe0\x6d\xcf\x39\xa9\xe4\xf3\
-\xad\x5e\x5d\x24\x96\xe6\x5e\xb7\x88\x4d\x75\x0c\x0b\x93\x12\xd0\
-\x85\x23\xfc\xdb\xd7\xbf\xc6\xdf\xfc\xe7\xa7\xe9\x98\x82\x4e\x66\
-\x16\xf2\x21\xc1\xa0\xc5\x74\xd3\x80\xee\xb2\x51\x22\x09\x73\x62\
-\x10\x4c\x19\x58\xd3\xe8\xe3\xcf\x5f\xff\x46\x0e\x5d\xb0\x90\xb8\
-\x69\x0b\x85\x11\x42\xe1\xf0\x2e\x17\x46\x6b\x84\x6a\x2a\x2e\x26\
-\x52\xdb\x6a\x37\x33\xb5\xa3\x9e\xcb\xfd\x30\x19\xdf\x2f\x31\x3b\
-\x63\x93\x76\x7c\x0d\x9e\x96\xb3\x34\x8d\x25\x6c\xdd\xce\x79\x07\
-\x1d\xc6\x9b\x9f\xf5\x3c\x26\x42\x99\x00\x4a\x1a\xf3\x4d\x90\xdc\
-\xe5\xe1\x71\x63\x75\xda\xfd\x6f\xd9\xb3\x13\xf5\xc2\x5f\x43\x08\
-\xec\x3f\x34\xc4\x9b\x5f\xf9\x2a\xfa\xa6\x3a\x34\x7d\x40\x5d\x6a\
-\x0d\x89\x92\x99\x6e\x21\x88\x61\xbc\x01\x53\x2e\x77\x19\xfc\xb4\
-\x37\xda\x2d\xe6\x8d\xc1\x1b\x43\x23\x08\x7d\x65\x22\xa4\xc4\x77\
-\x68\x58\x4b\xd8\xbc\x9d\x67\x1d\x7d\x22\xaf\x7e\xe6\x45\x04\x55\
-\x8c\x4d\x4e\xc8\x88\xa9\xfb\xb5\xf5\x59\xe5\xe0\x44\x55\xc1\x42\
-\x21\x8a\x53\xf0\x6a\xd0\xa2\xe0\xd2\xbb\x6e\xe3\x0f\x3e\xf6\xf7\
-\x4c\x35\x2d\x3e\x78\x8c\xce\x4f\xdd\xa3\x2a\xc6\x6f\xdb\xbe\x9d\
-\x92\x5c\xbc\x9d\x71\x87\xea\x9d\x74\x5a\x07\xb2\x27\xb6\x97\x74\
-\x2b\xae\xfd\xe1\x8d\x6c\xd8\xba\x19\xe3\x76\xf3\x68\x61\xf5\x79\
-\xb5\xe4\x5a\x35\x29\x99\xae\x7f\xe9\x0c\x3a\x3a\xc4\x07\x3f\xfb\
-\xef\x7c\xe2\xf2\x6f\xe2\x6c\x93\x76\x04\x71\x05\x65\x08\x04\x42\
-\x2e\x3e\x76\x3b\x1b\x85\x0a\x16\x41\xad\x25\x3a\x93\x2a\xed\x31\
-\xb0\x7e\x68\x09\xef\xff\xe5\x5f\x63\xad\x1b\xa4\x35\xd1\x01\x9d\
-\xa2\x74\x4a\x34\x06\x51\x83\x0d\x06\x17\x52\xe1\xd2\x5b\x28\x93\
-\x02\x2e\xe2\x15\xf1\x73\xab\x18\xa6\x6e\x43\x3a\x26\x5f\xa4\xe9\
-\xbd\x84\x0e\x13\x28\x1c\xa5\x96\x48\x67\x8a\x45\x38\xde\xf8\xe2\
-\x57\x32\xd2\xec\xa7\x90\xe4\x1c\xac\xcc\x68\x93\x3f\x8e\xb9\xf2\
-\xe3\xd8\xfd\xac\xe0\x23\xb1\xba\x87\x4c\x79\xcf\x05\x47\x1c\xc5\
-\xab\xce\x3d\x1f\xd9\xbc\x15\x2b\x8e\x20\xa9\x85\xe4\xb0\x58\x6c\
-\xea\x63\x3b\xf0\x45\x0a\x5f\x8b\x32\xee\x7e\x98\xa6\x49\x63\xa2\
-\x36\x1a\x1a\x01\x4c\x0c\xd8\x86\x23\x6e\x1f\x63\xdd\xd0\x42\x7e\
-\xeb\x92\x5f\x64\x31\xe0\x54\xd3\x81\xf7\x0c\x5c\x54\x09\x40\x45\
-\xb6\x59\x9d\xa3\x88\x47\x7d\x89\x11\x47\x74\x96\x1f\x95\x53\xbc\
-\xeb\x63\x7f\xcf\x1d\xed\x09\xe8\x6b\x61\x0b\x8b\x09\xa1\x26\xc0\
-\x78\x22\x4d\x15\x30\x86\x6d\xdb\xb7\xd1\xf6\x3e\x85\xfd\x3a\x7b\
-\x1b\xb7\x3a\xd5\xe4\x34\xaa\x4e\xbe\xe0\x35\x10\x80\x3b\x1e\xba\
-\x9f\x50\xb8\xbc\x53\xed\xee\xf3\xa8\xc2\x78\xed\x42\x9c\x33\xd9\
-\x68\x6c\xb6\x98\x74\x96\xed\x83\x2d\xfe\xf0\x93\x1f\xe1\xcb\x3f\
-\xfe\x21\x6a\x1b\x8c\xfb\xac\x4d\x29\x09\x40\xe5\x93\x2b\xa8\xab\
-\xb3\x12\x41\x45\xf0\xc6\x50\x4a\x72\x08\xb6\xed\x79\xfa\xca\x03\
-\x79\xff\x1b\xdf\xc1\xd2\x5c\x87\x49\x5c\x6c\x20\x6a\x70\x31\x3d\
-\x1b\x9a\x23\xbd\x74\x31\x22\x2e\x24\x28\xf7\x5c\x9f\x47\x43\x40\
-\x4d\xc8\x19\x8f\x45\x62\x7a\xc6\x35\x6a\x22\xd5\xdd\xbc\x99\x5f\
-\x79\xde\x0b\x38\xe3\xe0\x43\x09\xd1\xe7\x89\x5a\x4b\xf4\x61\x87\
-\x76\xdf\xe3\xf5\xc4\x3c\xae\xf0\x87\xda\x57\xe6\x96\x4f\x4b\x12\
-\xa9\xe8\xdb\x5f\xf0\x52\xce\x3c\xe8\x10\x74\xdb\x38\xce\x48\x0a\
-\x25\xab\x84\x51\xa5\x0e\x77\x84\xb4\x08\x1f\x0f\x07\xa8\x58\xbc\
-\x40\xe9\x22\x22\x91\x66\xe9\x19\x9e\x2a\xf9\xed\x57\xfd\x22\x47\
-\x2f\x58\x44\x51\xfa\x54\x49\xef\x39\x97\x99\x56\x1d\x57\x92\xb1\
-\x4e\x40\x22\x35\xc2\xc3\x1a\xf9\xf5\xbf\xfb\x00\x57\xdf\x77\x37\
-\x66\xe1\x02\x3a\x21\xa4\xa1\x1d\x62\xba\xd1\xf3\x21\xa0\x2a\xc2\
-\x96\x6d\xdb\x98\xea\x74\xf2\xf9\xec\x74\x0c\xaa\x76\xdd\xd5\x09\
-\x2a\xe0\x5c\x83\x0d\xa1\xe4\x7b\xb7\xff\x98\xd8\x70\x29\xfb\x96\
-\xdd\xfd\xf8\x74\x0b\x09\x15\xec\x57\x44\x10\xe3\xd0\xd2\xe3\x8d\
-\xe0\x07\xfa\xd8\xe0\x3d\xef\xfa\xf0\xfb\xb9\xfa\x81\x7b\x31\xae\
-\xc0\x6b\xc0\x4a\xc4\x90\xda\xa9\x3a\x03\xda\xdb\x7d\x0e\x2d\x56\
-\x84\xa6\x38\x74\xcc\xf3\x8c\xb5\xeb\xf8\xab\xb7\xff\x1a\xcb\x9c\
-\x81\x89\x09\x8c\x98\x7a\x42\xb0\xae\xad\xd4\xde\x30\xf1\x36\x9a\
-\x39\x3b\x3d\x25\x48\x26\x78\xcc\x52\x71\x12\x85\x50\x26\xaa\x37\
-\xbf\x75\x3b\xcf\x3a\xfe\x44\x5e\x7f\xde\xb3\x30\x21\x20\x41\x69\
-\x1a\x8b\x45\xa6\xf1\x4b\x4e\x7f\xc7\xdd\x6f\x4f\x08\xfe\x49\x33\
-\x7b\x4d\xc3\x40\x2b\x7a\xf6\x29\x1a\xbc\xf3\xe5\xaf\x62\x1f\xdb\
-\xc2\xb5\x4b\x6c\xd3\x11\xaa\xd0\x4d\x7b\x93\x50\xdd\xa5\x82\xd8\
-\x1c\x8f\x06\x1b\x1d\x78\xa5\xd3\x84\x49\xe7\x29\x1c\x84\x07\x1f\
-\xe6\x97\x9f\xf5\x73\x3c\xef\xa8\xe3\xe8\x74\xca\x5c\xb4\x49\x24\
-\x93\x15\x7a\x6e\xa6\x7a\x6d\x7a\xa8\x32\x06\x22\x87\xac\x53\x02\
-\x7f\xfc\x89\x7f\xe6\xf3\xdf\xbb\x1a\xbb\x68\x21\xa5\x57\x4c\xb0\
-\xd8\x48\x06\xc7\xcc\x4f\xc3\x59\x8c\x30\x36\x39\x41\xe9\xfd\x74\
-\xbc\xff\x8c\x96\xdf\xcc\x2e\x80\xe6\xfb\xa7\x02\x8f\x6c\xdf\xc6\
-\xdd\x9b\x1e\x81\xac\x02\x25\xbb\x3d\x02\x90\x6e\xbe\x52\x8d\x24\
-\x85\x98\xc6\x9c\x31\x60\x9b\x94\x3e\xc2\xf0\x10\x3f\xda\xbe\x85\
-\xdf\xfe\xc7\x0f\xf1\x50\xd9\xc1\x98\x02\x0d\x69\xc4\xb7\x2e\xc8\
-\xa6\x1a\x1c\x62\xba\xed\x59\x53\xcf\x3e\x06\xa4\xe1\x28\x3b\x81\
-\x73\x0f\x3a\x84\x3f\x7f\xfd\x5b\x59\xe1\x05\x3b\xd1\xc6\xa1\x94\
-\x12\xf0\x4e\xba\xf7\x2a\xcf\x1d\x84\xdc\xb1\x98\x53\x09\xc0\x40\
-\xb0\xe9\x8f\x4d\xd0\xd4\x26\x8d\x81\xa2\x51\xa0\x63\xe3\xac\x1d\
-\x5e\xc8\x3b\x5f\xf6\x2a\x16\x20\xf4\x89\xd0\x30\x26\x45\x87\x31\
-\x01\xae\xe8\x45\x98\xf2\xf8\x4d\x2b\xec\x7e\x07\x30\x0b\xa4\xcc\
-\xe4\x61\x06\x43\xc2\xd1\x4b\x28\x79\xda\xea\x35\xfc\xda\x4b\x5e\
-\x81\xd9\x3a\x86\x29\x4b\x52\xd3\x3a\xe0\x02\x98\x40\x0a\xfb\x8c\
-\xd2\xb1\xbb\x9b\x3a\x2c\x49\x4b\x37\x24\xe5\x84\xd2\xb2\x4c\x6e\
-\xdd\xcc\x0b\x4f\x3f\x9b\x37\x3d\xe7\x62\x24\x04\x9a\x4e\xc0\x99\
-\xc4\x66\x34\xe3\xc2\x0b\x24\x3a\x66\xd2\xa2\xea\x84\x12\x1f\x23\
-\x31\x1a\xd4\x35\xf8\xc4\x37\x2f\xe5\xdf\x2e\xfb\x2a\x6e\xe1\x28\
-\x21\x80\xf5\x86\x66\x4c\x61\x9f\x3e\x0e\x05\xcd\x39\x9f\xb5\x31\
-\x39\x57\x8e\xdd\xdb\x54\xf1\xd0\xcd\xb8\x7f\xbd\x00\xbe\x88\x12\
-\x33\xe2\xf1\xbe\x8d\x8f\xb0\xcd\x77\xa0\xb0\x09\x78\xa3\x8f\xc7\
-\xfe\x21\x99\xf1\x06\x10\xc5\x66\xa4\xa4\xf1\x89\xf8\x03\x75\x74\
-\x42\x44\x17\x8d\xf0\xed\x3b\x7f\xcc\x7b\xfe\xe9\x43\x6c\x22\x12\
-\x6d\x01\xd8\x94\x96\x85\x88\x47\xe8\x64\xe8\x81\x05\x8a\x3c\x5d\
-\x88\x64\xda\x31\xf1\xb8\xc2\xe0\x3b\x6d\x5e\x78\xc8\xb1\xbc\xef\
-\x97\xdf\xc1\xd2\x20\x98\xc9\x29\x8a\x42\x50\xc9\xb4\xdc\x59\xf3\
-\x40\x10\x4a\x0b\xa5\xd5\xda\xe9\x3f\xa6\x99\xa4\x1f\xd9\xc2\x62\
-\x7d\xa0\xd9\x6a\xa0\x65\x9b\x05\x1e\x7e\xf3\x15\xbf\xc0\x31\x8b\
-\x57\x20\xa1\xc4\x98\x8c\x42\x85\xb4\xf8\xeb\x4b\x21\x3d\x57\xe5\
-\xf1\x29\x05\x3c\x2e\x11\x40\xb5\x60\x2a\x1d\x1c\xad\x4b\x98\x92\
-\x81\x26\x86\xd2\x07\x5e\x76\xfa\x19\xbc\xfc\xec\xa7\xe3\xb6\x8d\
-\xd1\xe7\x8a\x04\x89\xcc\x12\x5c\x55\x7e\x1d\x1f\x8f\x23\x0c\x89\
-\x6d\xd5\xc6\x48\xd8\xba\x95\xe3\x0f\x38\x88\xdf\x7f\xed\x2f\xb3\
-\xd8\x58\x0a\x12\x86\x3e\x64\xc4\x5f\x2f\x4a\xae\x2a\x10\x5b\x6b\
-\xeb\xc8\x40\x8c\xa1\xa3\xa0\xae\xc9\xe7\x7e\x78\x3d\x7f\xfc\x89\
-\x8f\x32\xde\xdf\x20\x18\x85\x90\x88\x31\x24\xc3\x65\x93\xcd\x17\
-\xe0\x04\x7c\x0c\x84\x99\x93\x3e\xb3\x1d\x51\x6f\x1b\x2f\xff\x9f\
-\x05\x6e\xbe\xf3\x56\xb6\x4d\x8d\x63\x8a\x06\xb1\xe3\x1f\x9f\x11\
-\xda\xdc\x95\x09\x46\x52\x54\x28\x31\x8b\xa4\xc4\x84\x18\x54\x45\
-\x34\x51\xca\xb8\x25\x8b\xf8\xec\xe5\xdf\xe2\x4f\x3f\xf9\xcf\x4c\
-\x60\xf1\x5a\xa0\xea\xb0\x26\x31\x24\x05\x12\x6e\x83\xaa\x5e\x93\
-\x61\x8d\xd1\x18\x3a\xd6\x10\x44\x18\x28\x1c\xd2\x9e\xe2\xa2\xc3\
-\x8e\xe2\x6f\xde\xf6\x4e\x96\x28\xe8\xb6\xed\xb4\x0a\x0b\xd1\xd7\
-\x75\xd0\x1a\x6b\x31\xe7\x19\x0d\x20\x9a\x34\x7e\x3c\x35\x45\xc3\
-\x1a\x4c\x67\x0a\xb7\x7d\x8c\x5f\xb8\xe0\x42\x9e\x7f\xf4\x09\x10\
-\x4a\xcc\xa3\xf1\xe3\xcf\x44\x78\x3e\x0e\x97\x7b\xb7\x2f\xaf\x98\
-\x27\xe1\x52\x08\xd7\xed\x99\x6b\x46\xc6\x55\x1d\x15\x2b\xd0\xaf\
-\xf0\xee\x57\xbc\x9a\xb3\x0f\x3a\x84\xf8\xc8\x26\x9c\x11\xbc\x84\
-\xd4\x19\x98\xe5\x22\xec\x2e\x0b\x46\x21\x7a\xdc\xf6\x49\xd6\x34\
-\x47\xf9\xb3\xd7\xbd\x85\xe5\x45\x0b\x89\x1e\x67\x33\xe9\xa6\xb1\
-\xc4\x4c\x5e\x51\x2d\x7c\x51\xd0\x18\x09\x21\x64\xc4\x23\xb4\x63\
-\xc0\x38\xc7\xe5\x0f\x3d\xc4\xbb\x3e\xfc\x01\x1e\x76\x10\x1a\x36\
-\x63\x5d\x22\x51\x22\x6d\x07\xde\xe6\xea\xe6\xbc\x8d\x9d\x69\x12\
-\x76\xdd\xa5\x7b\x59\x41\x03\xd2\x31\x3f\xf0\xc8\x23\x69\x57\x8a\
-\x11\x3b\x0b\x07\xe2\xee\x39\xcc\xba\x02\x91\x14\x93\x24\xa6\x42\
-\x9a\x64\xcd\xa4\x4a\x44\x24\x44\x4a\x20\x2c\x18\xe1\xa3\x5f\xfd\
-\x12\x1f\xff\xee\x37\xe9\x58\xa1\xcc\x5e\xcb\x02\x42\xa0\x16\xcf\
-\xa9\xde\x94\xfc\x64\x1a\x43\x27\x06\xc0\x60\x8c\x23\x4e\xb5\xb9\
-\xe0\xe0\x43\xf8\xc0\xaf\xfd\x16\xeb\x06\x16\xc0\x86\xad\xb4\xd4\
-\x20\xc4\xe9\x52\xe3\x73\x76\x7a\x02\xc1\x11\x3c\x48\x5f\x13\x55\
-\x8f\x6c\xdb\xca\xb3\x8f\x3b\x9e\xb7\x3e\xef\xc5\x38\xa5\xcb\xed\
-\xdf\xf3\x27\xd5\xab\x26\x07\x9e\x76\x07\x77\xbf\x3d\x2e\x11\x40\
-\x7a\x70\xb4\x3b\xb7\x4d\x9d\x79\x11\x24\x4d\x76\x1b\x2b\x98\xd0\
-\x66\x1f\xd7\xe0\x77\x5f\xf5\x3a\x0e\x5e\xb8\x84\xa9\xa9\x09\xb4\
-\x61\x08\xd5\x51\x3d\x1e\xd5\x72\x85\xd0\xb2\xb4\x63\xc9\x32\x6f\
-\xf9\xc0\x1b\x7e\x95\x13\x96\xac\xc4\x84\x32\x51\x6f\x65\x4d\x3b\
-\x0d\x8a\x31\x76\x87\x9c\xd8\x88\xc9\xc4\x13\xa9\xe2\x5c\xb8\x82\
-\x07\xc7\xb7\xf3\xab\x1f\xfe\x1b\x6e\xe9\x4c\xe0\x87\x06\xc0\x39\
-\xa4\xe3\x91\x18\xf1\x2e\xe0\x8b\xc4\xd8\x63\x66\x10\x59\x3c\xe1\
-\x36\x1b\xfa\xb2\xf7\x29\x93\x1d\x7f\x14\x55\x71\xc6\x30\x19\x95\
-\x07\x1f\x7a\x18\x9c\x4b\x2a\x44\x61\xf7\xeb\x0d\x4a\x86\x0d\x9b\
-\x6a\x20\xca\x24\xa8\xae\x17\x25\x98\x40\x30\x81\x98\xd4\x32\x31\
-\x31\xdd\xa3\xa9\x86\x65\xfb\xe8\x00\xbf\xf7\xb1\x7f\xe2\x0b\x3f\
-\xbc\x11\xe3\x0c\x5a\x26\x5e\x80\x96\x26\x04\xbd\x42\x2f\x38\xa0\
-\xee\x30\xb4\x32\x3f\x82\x47\x69\xb6\x0a\x8c\x2f\x39\x7f\xf5\xc1\
-\xbc\xef\xed\xef\xe2\xf0\x45\x2b\xf0\x5b\xb6\x63\xad\x4d\x27\x2a\
-\x29\x97\x2f\x42\xb5\x21\x3c\xfa\xc9\x4b\x14\x0a\xef\x30\xa6\x41\
-\x59\xc0\x44\x7b\x8c\x43\xf6\xdd\x97\x77\xbd\xf4\x12\x16\x02\x36\
-\x96\x98\xc2\xe5\x5a\x4c\x97\xad\x59\x67\xbc\xa6\xbd\xe7\xe3\xf0\
-\x48\x3c\x2e\x0e\xa0\x0a\x9b\x67\x3a\xb7\xee\x17\x86\xa8\xe0\xac\
-\x85\x4e\xc9\x89\x2b\x56\xf2\xbb\xaf\x79\x03\x0b\x30\x68\xa7\x8d\
-\x14\xe9\x0f\x0a\x75\x48\x29\xb3\xf2\xf5\xed\xe4\xaa\xe7\x8e\x43\
-\x4a\x23\xac\xd2\xb3\x4b\xa5\x7f\x0b\x63\x28\xda\x6d\x86\xda\x93\
-\xfc\xc1\x2f\xbd\x91\x73\xd7\x1c\x9c\x66\xae\x55\x52\x68\x1f\xb2\
-\xd3\xca\x4a\xb4\x15\x7f\x44\x2a\x48\x42\x49\x20\x6a\xcc\xb8\x00\
-\xc7\x36\x55\xde\xf3\x8f\x1f\xe2\xaa\xbb\xef\x80\xd1\x61\x3a\xde\
-\x13\x4b\x9f\x52\x9f\x6a\x52\x25\x1f\x82\xd1\x27\x0e\xfe\xdc\x8b\
-\xed\xaf\xf2\xfd\x1d\xab\xcb\xb3\x54\xfc\x66\x98\xc1\x20\x62\xd9\
-\x3c\x39\xc1\xad\x0f\xdd\x0f\xd6\xa1\x46\x12\x20\x7a\x37\x0b\x0e\
-\xa6\xe3\xec\x2d\x50\x52\x8b\x89\x4e\xdf\x85\xd3\xa8\x75\xe5\x04\
-\xb4\xd9\x62\x13\x81\xdf\xf9\xfb\x0f\x71\xf9\xfd\xf7\x13\x5b\x96\
-\x10\x62\xaa\x19\x20\x5d\x28\x49\xde\x89\x4c\xcc\x04\xc9\x79\x90\
-\x2b\x3a\x47\x50\xa5\x85\x41\x43\xe4\xa4\x95\xfb\xf1\xbe\x5f\xff\
-\x0d\x8e\x5e\xbd\x1a\xbf\x75\x33\x46\xd2\xe8\xb7\x33\x05\x68\x06\
-\x81\xd9\x84\x83\x30\x31\x69\x45\x88\xa4\xbe\xa3\xe4\x07\x46\x0d\
-\x89\xd7\x41\x03\x71\x7c\x92\x7d\xfb\x87\xf8\xfd\x5f\x78\x03\xeb\
-\x17\x2c\x01\xef\x31\xc6\x10\x55\x73\xa9\x53\x77\x7a\x3d\x66\xfb\
-\xff\xdd\x69\x8f\x03\x14\x58\x92\x14\x76\x2d\xfd\xda\xfd\x20\x47\
-\x57\x5a\x4c\x30\x68\xb4\x14\x38\x42\x27\xf0\xec\x43\xd6\xf3\xbb\
-\x2f\xbb\x84\xfe\xb1\x71\x5c\x4c\x81\xaa\x8d\x05\x7d\x65\x13\x1b\
-\x2d\x5d\xd6\x86\x94\xd0\x89\xa6\x9c\x50\xaa\x2a\x8d\x8d\xd5\xd4\
-\x49\xfe\x99\x26\x04\x56\x94\x04\xac\x90\x04\xf8\x31\xed\x0e\x0b\
-\x37\x6f\xe3\x0f\x2f\x7e\x31\x17\x1f\x7b\x02\x93\x9d\x0e\xd6\x18\
-\x2c\x16\x51\x8b\xb1\x0e\x35\x8e\x30\x83\xb6\x4c\x45\x73\x7a\xa2\
-\xc4\x90\x26\x1d\x4b\xe0\x3d\xff\xf2\x71\xfe\xef\xf7\xaf\xc5\x2d\
-\x1c\xc1\x7b\x0f\x58\x54\x2c\xc1\x26\x98\x2b\xd1\x90\x65\x6f\x08\
-\x36\x3e\x21\x5a\x08\x92\xef\x83\xc9\xd5\xeb\xaa\x88\x55\x7d\x6f\
-\xd6\x8a\xf2\x8c\xad\xa7\x7a\x28\x5d\xbe\x8f\xf7\x94\x6d\xee\x9c\
-\x9c\xc0\x36\x5a\xd0\x6e\xa3\xb6\x4c\x6d\xae\xdd\x68\x15\x6c\x58\
-\x4d\x3e\xc2\x5a\x4a\x38\x51\x8c\x43\xf5\x1c\xa4\xfc\xdd\x28\x34\
-\xa2\xc5\x4e\x45\x9a\x43\x43\xfc\x78\x72\x2b\x6f\xfd\xe8\x07\xb8\
-\xbe\x33\x91\xb0\x0a\x3e\x55\x90\x03\x8a\xef\x95\x4d\xaf\x95\x9b\
-\x52\x71\x54\x25\x09\xab\x46\x91\x44\x3a\xd2\xee\x70\xf4\xe8\x22\
-\xfe\xf6\xad\x6f\xe3\xc2\xf5\x47\xe0\x1e\x7c\x04\x33\x3e\x89\xaa\
-\x12\xfa\x5a\x89\x68\x34\x26\x7c\x8a\x35\x80\x2f\x31\x31\xa9\x2f\
-\x29\x21\x5d\x73\x63\xd0\x56\xa4\x88\x6d\xf6\x9b\x8c\xbc\xff\x15\
-\x6f\xe0\xfc\x03\xd6\x40\x0c\x89\x40\x37\x3f\x5f\x46\xec\xb4\x54\
-\xaa\x7a\xe2\x7a\x47\xb4\x1f\xcf\x47\x66\xfe\x68\x10\x6a\xf4\x67\
-\x2e\x8f\xb5\x4b\x2e\x39\xe5\xe9\x5c\x72\xce\x33\xd1\x0d\x9b\x28\
-\x80\x20\x1e\xef\x22\xd1\x48\xb7\x27\x8b\x20\xd1\x24\xe4\x30\x3d\
-\x1a\x83\x2a\x14\x1d\x28\x7c\x2e\xf2\x34\xc1\x37\x12\xb9\x86\x44\
-\xe8\xf7\x4a\x7f\x19\x61\x62\x92\x5f\x7c\xe1\x4b\x78\xe5\xb9\x17\
-\xe1\x35\xe0\xac\x21\xc6\xee\x74\x5c\xcd\x3d\x97\xbe\x48\x82\xb7\
-\x26\x3d\x1c\x56\xa1\x49\x6a\xd1\xf8\x86\xe3\xef\xfe\xf7\x8b\x7c\
-\xec\xcb\x5f\xc0\x8e\x8e\x50\xce\x98\x6e\x9c\x2d\x84\x7b\x22\xa3\
-\xff\x69\xf2\x64\x92\x5a\x50\xce\xb9\x1a\x9a\x3d\xc7\x77\xa9\x3b\
-\x00\x0f\x6f\xdb\xcc\x94\xf7\x74\xc9\x38\xe1\xf1\xe0\xdb\x9f\x73\
-\x97\x3d\x4b\xa4\x57\xad\xd8\x4e\x54\xdc\xf0\x20\xdf\xbf\xe3\x56\
-\x7e\xe7\x43\x7f\xc3\x06\x8d\x68\x7f\x92\xcf\x6e\x92\xe6\x53\x82\
-\xc4\x54\x54\x76\xb9\xf8\xa9\xa9\x3a\x95\x5a\x7f\xca\x84\xf1\x44\
-\x51\xfa\xc5\xd1\x37\x51\x72\xd2\xc0\x42\x3e\xfe\xa6\x77\xf1\x27\
-\xaf\x7e\x1d\x47\x2d\x5b\x86\x1f\xdf\x4c\x1c\xdb\x42\x5f\x09\xcd\
-\x98\x94\x20\x7c\x54\x30\x05\xa2\x05\xd2\x31\x34\x63\x81\x50\x60\
-\xa2\xd0\xa7\xc0\xa6\x2d\xbc\xf9\xc5\x2f\xe7\xd9\x47\x1f\x43\xf0\
-\x3e\x0d\xc1\x69\x55\x23\xd3\xc4\x29\x31\x8f\x69\xe1\xbc\x39\x80\
-\x98\xf9\xda\xd3\x90\x8d\xa5\x69\x1d\xfd\xc0\x6f\xbe\xf8\xd5\x5c\
-\x7c\xc2\x19\x84\xcd\x5b\x88\x45\xa4\x6c\x06\x02\xbe\xa7\x0c\x5f\
-\x4d\x99\x49\x9a\x90\xaa\x54\x71\xa3\x80\xa6\x1b\x81\x3a\x32\xac\
-\x0b\x9c\x10\x28\x69\x10\x90\xcd\x9b\x79\xc3\xb3\x9e\xcb\x1b\x2f\
-\x7c\x01\x8a\xa7\xa9\xe0\x2a\xd8\xa5\xc6\x9a\xd4\xa3\x0a\x42\x6d\
-\xde\x80\x4a\x22\x25\x89\x02\x3c\x94\x91\xc2\x59\x3e\x73\xdd\x55\
-\xbc\xf7\x33\x9f\x84\x65\x0b\x98\x32\xf3\x7a\x0f\x77\xb0\xd9\x8e\
-\x45\x63\x64\xa0\xaf\x9f\xa2\x28\xd2\x35\x7c\x34\x4c\xbb\x54\x43\
-\x4f\x49\x80\x03\xe0\xee\xfb\xef\x63\xb2\xdd\x49\x75\x91\xea\x6f\
-\xe7\xaf\xab\x59\x6f\x20\x5e\x52\x0e\x1f\xc5\xd0\x51\xa5\x39\x32\
-\xc2\xa5\xdf\xbb\x86\x3f\xfa\xc4\x47\x79\x10\x50\x6b\x91\xd2\x23\
-\xf9\x77\xca\x0c\x69\x8e\x09\xc3\x8d\xc9\xc3\x3e\xad\x00\x7d\xd1\
-\x24\x39\x76\x09\x98\x42\x50\x5f\x32\xa8\x81\x5f\x3c\xe7\x02\x3e\
-\xfe\x6b\xbf\xc3\x9f\xbf\xf4\x55\x1c\xef\xfa\x69\x3d\xf0\x30\x76\
-\xfb\x76\x1a\x02\xd2\x68\xa2\xb6\x81\x4a\x81\xa5\x81\x78\x83\x94\
-\x4a\xd3\x08\xf6\xa1\x8d\xbc\xee\xfc\xe7\xf0\xaa\xa7\x9f\x47\x27\
-\x2a\x05\x92\x28\xd3\xf2\xe7\x9a\x3d\x80\x9a\x78\xde\x1c\x80\x11\
-\x21\x46\x5f\xa3\xa5\xa4\x0c\xb8\xa9\xc4\xe5\xf6\x17\xaf\x7f\x0b\
-\x17\x1e\x7d\x3c\x71\xeb\x16\xc4\xc6\x1e\x4c\xa8\xe6\x1b\x9f\x57\
-\x66\xe6\xe4\xaf\xe6\xe7\x4b\xe7\x28\x6d\x81\x55\x83\xf1\x06\x89\
-\x60\xa2\xa7\x69\x61\xfc\x91\x0d\xbc\xea\xbc\x67\xf2\xdb\xcf\x7f\
-\x09\x43\x1a\x69\x86\x24\x96\x69\xab\x47\xdd\x98\x69\xb3\xec\x26\
-\xd7\x0f\x54\x43\xe2\x2f\x20\x55\xfd\x4d\xc3\xf1\xb5\xdb\x6e\xe3\
-\xb7\xff\xf1\x43\x6c\xef\x2b\x98\xb0\x10\xec\x6e\x96\xdc\xda\x4d\
-\x56\x13\xb5\x00\x44\x65\x64\x68\x88\x86\x4b\x0e\x40\x35\xd6\xc0\
-\xff\x3a\x3f\x9e\x79\x8f\x30\xd8\x8c\xf6\xbb\xf7\xe1\x0d\x74\xca\
-\x4e\xee\x84\x54\x11\xce\x3c\x9e\xb4\x4e\x8f\xb1\x22\x49\xa0\xa5\
-\x2d\x42\xb1\x78\x31\x1f\xf9\xf2\x17\xf9\x3f\x9f\xfd\x77\xb6\x0b\
-\xa8\x4d\xc2\x2a\xc4\x90\x64\xc4\x2b\x9a\xd6\x5c\xa8\xd2\x00\x06\
-\x8b\xb5\x0e\x8a\x26\x53\x12\x29\x4d\x24\x5a\x88\xa1\xc4\x85\x0e\
-\x07\x35\x1a\xbc\xfd\xac\x67\xf2\xdf\xbf\xf7\x27\xbc\xfb\x15\xaf\
-\xe4\xd0\xc5\x8b\x28\xb7\x6c\x21\x4e\x4e\x22\xc6\x12\x44\x29\x4d\
-\x02\x0f\xb5\x5a\x8e\x89\x87\x1e\xe4\xe5\x67\x3d\x9d\xdf\x7a\xd9\
-\xab\x18\x00\xfa\x34\xa6\x59\x90\x3c\x81\x29\xd5\xb8\xac\xce\xaf\
-\x13\x98\x37\x07\x90\x76\xd8\xd4\xd2\x09\xea\xa1\x69\x30\xc6\x60\
-\xda\x81\xc5\x58\xfe\xf8\xf5\x6f\xe6\xac\x35\x87\x22\x1b\xb7\x50\
-\x54\xc0\xfb\x5c\x02\x50\x05\x6f\x4d\x82\xa3\xda\x5c\x49\x55\xc0\
-\x28\x9a\x49\x35\x5a\x08\xfd\xa5\x52\x6c\xde\xce\xd0\xb6\x09\xde\
-\x7a\xf1\x4b\xf9\xed\x57\xbe\x86\xc1\x08\x03\x6a\x70\xb9\x3f\x8f\
-\xf6\x12\x59\x64\x2a\xae\x6a\x10\x25\xcd\xf8\xd0\xc2\x21\x21\x12\
-\x8c\xe1\xaa\x47\x1e\xe1\x57\x3f\xf0\x57\x3c\x1c\x4b\xb4\xd9\x4c\
-\x1d\xf2\x9a\x53\x7b\x0f\xb1\x1d\xca\xc7\x02\x51\x19\xea\x1b\xa0\
-\x69\x5d\xe2\x32\xe9\xa9\x62\xcf\x1a\x31\xd4\x29\x84\x21\x00\x9b\
-\x26\xc6\x52\x25\x5c\x4c\x9e\x4e\x33\xb3\x2a\xee\x3c\xa1\xe7\xd8\
-\xe3\x04\x24\xef\x11\x8a\x30\x8e\x62\x96\x2e\xe1\x1f\xbe\xf0\xdf\
-\x7c\xf4\xbb\x97\x32\x6e\x2c\x9d\x4c\x3b\x66\x23\xb8\x3c\x94\x55\
-\x92\xb4\x06\xa4\x80\xbb\x1f\x7e\x90\x7f\xbf\xe2\x1b\xdc\x30\xb6\
-\x85\x49\xd7\x44\x6c\x03\x4b\x41\x23\x16\x14\x11\x5c\x8c\xc4\xf6\
-\x04\xcb\x87\x06\x78\xc3\x05\xcf\xe6\x23\xbf\xf5\x7b\xbc\xf3\x45\
-\x2f\xe5\xc0\xfe\x61\xe2\xe6\xcd\x29\x95\x28\xc0\xd9\xc0\xf8\x23\
-\x0f\xf2\xac\x53\x4e\xe5\xdd\xaf\xfc\x05\x46\x81\x46\x4c\x4c\x4f\
-\x69\x02\x53\xba\xd5\xce\xde\x64\x7f\x9e\x6c\x97\xa4\xc1\x76\xf7\
-\x1d\x34\x62\xf2\xa0\x46\xba\x18\x46\x52\x85\x2a\xf8\xc0\x68\xab\
-\xc9\xb1\xeb\x8f\xe0\xe6\x1b\x6f\xe0\xee\x07\x1f\xa0\x35\xd0\x8f\
-\x8f\x21\x39\x09\x91\xa4\x91\x61\x2c\x84\x90\x5a\x35\x46\x49\x9c\
-\x15\x42\x61\x85\x30\xbe\x8d\xbe\x89\x29\xce\x5a\x75\x08\x7f\xf0\
-\x0b\xbf\xc4\x25\xa7\x3f\x8d\xbe\x18\x31\x31\xcd\x90\x5b\x6b\xbb\
-\x0b\xbd\xc7\x01\x88\x24\x79\x2a\x21\x85\xcd\xa2\x10\x03\xe0\x2c\
-\xb7\x4e\x8c\xf3\x96\x0f\xfe\x25\xd7\x3d\x72\x3f\x3a\x38\x98\x40\
-\x35\x7b\xa2\xc2\xe9\xcc\xe8\x5c\x04\x9d\x9c\xe0\xd8\xd5\x6b\x78\
-\xfe\x31\xc7\x63\x83\xd6\x30\x7e\xc1\x76\x45\x26\xf3\xd8\x69\xac\
-\x86\x72\x04\xc0\x30\x21\xf0\x2f\xdf\xfe\x3a\x3f\x7a\xf8\x01\x8a\
-\x66\x1f\x3e\xc4\x1a\x25\x39\x9f\x66\x34\x11\xa7\x98\x8c\x39\xe9\
-\xd6\x30\x25\x15\xd9\x0a\xcb\xd5\xdf\xbf\x8a\x25\xfb\x2c\xe3\xa8\
-\x7d\x0e\x48\x73\xf9\x5e\x32\xb3\x93\x52\x4d\x45\x14\x62\xb8\x6d\
-\xeb\x26\x5e\xfb\xd7\xff\x87\xff\xef\xdb\x5f\xe7\x86\x87\xee\x63\
-\xac\x13\x58\xb9\x78\x39\x83\xcd\x02\xac\x65\xd2\xd8\xac\xc7\x17\
-\x21\x76\x58\xda\x1c\xe0\x8c\x83\x0e\xe1\xac\x93\x4e\x21\x96\x9e\
-\xbb\xee\xb8\x85\x72\x72\x0c\x33\x31\xc6\x39\x87\x1f\xce\x7b\x5f\
-\xf7\x16\x56\x37\xfb\xb0\x31\x24\x1e\x49\x93\x47\x96\xa9\x22\xa7\
-\x1e\x34\xe1\xcf\xa4\x03\xe8\xc1\xfa\x27\xe9\xa7\x2e\x8d\x98\x33\
-\x86\xe8\x23\xcb\xfb\x07\x38\x76\xfd\x91\x7c\xef\x47\x37\xf3\xe0\
-\x03\x0f\xd0\x68\x36\xf1\x1a\xd3\xc2\x17\x93\xa4\x9e\x8c\x10\x43\
-\x62\x77\xb3\x56\x30\x65\x07\x36\x6f\xe1\x90\xe1\x85\xbc\xfd\x45\
-\x2f\xe3\x5d\xaf\x78\x15\x47\x2d\x59\x86\x0b\x31\xe5\x6c\x90\x2a\
-\xc2\xd6\xe0\x7d\x99\x88\x2e\x63\x25\xb9\x9c\xee\x44\x5d\x81\x95\
-\xc4\xe4\x2b\x85\x65\x43\xa7\xc3\xaf\x7c\xf0\xaf\xf8\xf2\x8f\x7f\
-\x80\x2e\x1c\x25\x06\x68\xc4\xc4\x20\x54\xb7\xfb\xf6\x20\x9b\xd6\
-\x42\x12\x41\x27\xa7\x38\x61\xf5\x5a\x9e\x7b\xe4\x31\xb8\x98\x8b\
-\xaf\x66\x16\x07\x20\x09\x09\x51\x61\xfd\xd5\x08\x8f\xb4\xa7\xf8\
-\xe8\x65\x5f\xe2\xde\xb1\x31\x9c\x34\xd2\x35\xaf\x22\xb2\x79\x7a\
-\x7a\x4d\x0f\x1b\x72\x77\x59\x49\xed\x08\x00\xc4\x5a\x26\x42\x9b\
-\xcb\xaf\xbd\x86\xc3\xd6\x1e\xc2\xba\x25\x4b\x89\xed\x80\xb1\x09\
-\x6b\x12\x49\xa9\x68\xa1\x82\x1b\x1e\xe6\x1b\x37\xdd\xc4\xf5\x0f\
-\xdf\xc7\xb5\xf7\xdd\xc5\xd7\xaf\xbb\x96\xcf\x7f\xe3\xdb\xdc\xba\
-\x69\x13\xdb\x5a\x0d\x46\x16\x2d\x66\xd0\x58\x8c\x18\xac\xfa\x44\
-\xe8\x11\x0c\xfb\xf6\xf7\xf1\xb4\x23\x8e\xe2\xe8\xc3\x0e\xe3\xd6\
-\x1b\xae\xe7\xd0\xa5\x4b\x79\xff\x5b\x7f\x93\x55\x7d\x03\x18\x5f\
-\x62\xf3\x34\x61\x55\xbd\xd2\x9e\xe3\xab\xc8\x5c\xe7\x73\x0b\x99\
-\xc7\x08\x20\xdf\x3c\xe9\x7a\xee\xa4\xb3\x97\x80\x38\xce\x5a\xd4\
-\x07\x96\x0e\x0d\x73\xf4\x31\xc7\x70\xe3\x0d\x3f\xe0\xe1\x87\x1f\
-\xa6\xd1\xdf\x4f\x3b\x24\xb9\x27\xf5\x1e\x6b\x0d\x4d\x31\x58\xef\
-\x89\xdb\xb7\xb1\xd0\xc3\x6b\xce\x39\x9f\xf7\xbe\xf6\x0d\x9c\xbf\
-\xee\x30\x9a\x22\xf8\x10\xd2\x85\xce\x99\x44\x87\x48\x5b\x22\xc6\
-\xd8\xba\x37\x5e\x93\x9a\x56\xfe\x59\xc9\x64\x9e\x96\xad\x28\xef\
-\xfe\xa7\x0f\xf3\x99\x6b\xaf\xc0\x2e\x5b\x4a\x08\x20\x6a\x2b\x7c\
-\x48\x77\x68\x64\x0f\x0a\x06\x66\x73\x00\x67\x1c\xb6\x9e\x67\x1d\
-\x76\x04\x04\x4d\x73\x10\x92\x9a\x83\x15\xe4\xb9\xfa\x9b\x2c\x55\
-\x97\x06\x53\x8c\xf0\xf0\xd4\x04\xff\xf0\xd5\xff\x61\x73\xf4\xb8\
-\x68\x11\x6b\xf0\x4c\x57\xa9\x99\x97\xf3\xab\xba\x84\x52\xdd\x83\
-\xca\x09\xe4\xef\xa9\x22\xad\x06\x53\x65\xe0\xaa\x2b\xaf\x61\xfd\
-\x61\xeb\x59\xbd\x64\x11\xed\x90\xc8\x5a\x2a\x75\x8a\xe0\x03\x03\
-\xd6\x72\xc7\xc6\x4d\x7c\xe3\xe6\x1b\x29\x96\x8c\x32\x65\x0b\x36\
-\x8e\x4d\x70\xed\xad\x3f\xe6\xf3\x57\x7d\x9b\x2b\x6f\xf9\x21\x9b\
-\xc6\xc7\x59\xba\x62\x39\x03\x8d\x01\x1a\xce\x21\x11\xe2\x64\xc0\
-\x01\x07\x2d\x5a\xcc\x39\xa7\x9c\xc6\xb3\x4f\x3e\x9d\x03\x06\x86\
-\x71\x9d\x12\xe7\x4c\x97\x9d\xb9\x8e\x53\xd2\x48\x72\x6f\x2f\x66\
-\x3e\xc9\xf1\xe6\xd1\x01\x54\xa7\x9e\x69\xb5\xaa\x87\xc9\x48\x8e\
-\x3d\x15\x6b\x0c\x9d\xb2\xc3\xb2\x81\x61\x4e\x3c\xe1\x44\xbe\x77\
-\xe3\x8d\xdc\xf1\xc0\x03\x34\x86\x87\xf0\x21\xe0\x5c\x41\x43\x85\
-\x72\x7c\x1c\xdb\x29\xb9\x60\xfd\x51\xfc\xfe\xcf\xbf\x8e\xd7\x9c\
-\xf5\x34\x96\xb7\x5a\xd0\x09\x48\x4c\xd4\xca\x65\x0c\xa8\x28\x0d\
-\x57\xe0\xac\x25\x8a\x45\xc5\x24\xf4\x9f\x4e\x17\x59\x48\x05\xe2\
-\x88\x17\xc3\x84\x08\xbf\xf3\xb1\xbf\xe3\x5f\xbe\x73\x29\xb2\x74\
-\x11\x9d\x76\x4c\x78\x01\x95\x0c\x50\x09\xb3\x12\x73\xce\xb7\xed\
-\xe0\x00\xa6\xa6\x78\xfa\x91\xc7\xf2\xf4\x83\x0f\x49\xe3\xd7\x39\
-\xe0\xa9\x72\x7c\xe8\x16\x84\x82\x64\x9a\xb3\x98\x22\xac\xbb\xb7\
-\x6e\xe6\xa3\x97\x7d\x89\x31\xc0\x69\x9a\x83\x78\x5c\x66\x34\x76\
-\xc1\xea\x6b\x5e\xa3\xce\xb4\xc6\x35\x99\x7a\x9f\x55\x14\x4b\x51\
-\xf4\xb1\x75\x7c\x3b\x57\xfe\xe0\x3a\x0e\x5c\x7b\x30\xab\x17\x2e\
-\x06\x5f\xd2\x50\xb0\x9a\xb1\x82\xc6\xd0\x1c\x1a\xe6\xf3\x57\x7d\
-\x9b\x2d\xb1\x04\xdb\xc4\xb9\x26\xa6\xaf\x8f\x31\xe3\xb9\x63\xd3\
-\x43\x5c\x76\xc5\xb7\xb9\xec\xca\xcb\xb9\x69\xe3\x83\xc8\x40\x3f\
-\xcb\x16\x2f\xa1\xaf\x91\x2e\x44\x28\xdb\x2c\xea\x1b\x64\xa8\x68\
-\x80\xf7\x58\x6b\x13\x67\x02\x64\xe2\xb2\xaa\x81\xda\x3d\x70\x11\
-\x9d\xe6\x06\xe6\xc3\xe6\xcf\x01\xf4\xa0\xcf\x2a\xc6\x53\x93\x6f\
-\x5b\xa8\xaa\xfd\x04\x9c\x75\xc4\xd2\xb3\xa0\x7f\x80\x23\x4f\x38\
-\x81\xeb\x6f\xfd\x31\x77\xde\x7f\x3f\xad\xc1\x3e\x4c\x8c\xb4\x37\
-\x6e\x61\xcd\xd2\x15\xbc\xe3\xa5\x97\xf0\x5b\x17\xbf\x84\xa3\x16\
-\x2e\x22\xc6\x40\xf4\x3e\x89\x11\xa3\xc4\x32\xd0\xdf\x68\x81\xb1\
-\xdc\xb0\xe1\x7e\xfe\xe3\xf2\xcb\xf8\xef\x6f\x7c\x85\x2b\xae\xbc\
-\x9c\xe3\x8f\x3c\x9a\xc1\x46\x33\xf3\xc3\x57\xa0\x91\x04\xd2\x68\
-\x8b\xf0\x87\xff\xf7\xa3\xfc\xd3\x57\xbf\x40\x5c\xb2\x80\x12\x83\
-\x51\x8b\x0b\x09\x97\x10\x6c\x85\x4d\x8f\xcc\xe7\xf6\x5f\x73\xdb\
-\xcf\x72\x79\xd3\x17\x82\x4e\x4e\x72\xde\xe1\x47\x71\xe6\xc1\xeb\
-\xd2\xce\x68\x2b\xe7\x6b\xba\x9d\x8f\x7a\x02\x10\x24\xc4\x04\x68\
-\xb1\x86\x1f\x3c\x70\x1f\xff\xfa\xdd\xcb\x98\x32\x06\x27\x2e\x71\
-\x1a\xb8\xf9\xf6\x78\x66\x7a\xd8\x52\x8f\x93\xf7\x7c\x5b\xc8\xd3\
-\x64\x82\x69\x3a\x1e\xde\xbe\x85\xef\xdf\xf8\x7d\x8e\x5a\x7f\x14\
-\xfb\x0f\x2f\x40\x3a\x01\x71\x26\x09\x57\x63\x18\x6a\xf5\xf3\xdd\
-\x5b\x6e\xe6\x96\x87\x1e\xc4\xf5\xb5\x08\x21\xd2\xd6\x08\x7d\x0e\
-\xdb\x70\x14\xad\x26\x1b\x26\xc7\xb9\xe2\x96\x9b\xf9\xd2\x15\xdf\
-\xe5\xc6\x5b\x6f\x61\xd3\xd6\xad\x1c\xb0\x72\x25\x43\xad\x16\xd1\
-\x77\xd2\x14\xab\x4d\x40\xb0\xde\x84\xb2\x77\xa8\xac\x2e\x60\x4e\
-\x3b\xd0\xf9\xb9\x9e\x8f\x07\xaf\xd3\xdc\x6d\x3a\x4a\x37\xa1\xf5\
-\x72\x88\x54\x7f\x03\x70\x8d\x02\x1f\x02\x47\x0c\x8e\xf2\x81\xb7\
-\xbe\x93\x77\xfe\xed\x9f\xf1\xad\x1f\x5d\x4f\xab\xd5\xe2\xe5\xcf\
-\x78\x3a\x6f\x7b\xf6\x8b\x39\x7c\x78\x34\xc9\x6e\x6b\x49\xa1\x89\
-\x43\xbd\x14\x83\xd8\x02\x1c\x5c\x7d\xcf\x7d\x7c\xf4\x6b\x5f\xe6\
-\x3f\x6e\xb8\x92\xed\xdb\xb7\xd3\xb9\xff\x61\x7e\xe9\xe2\x17\xe1\
-\x9a\x7d\x68\x19\x10\x1f\x89\x4e\x99\x30\x86\x29\xb1\x0c\x18\xe1\
-\x83\x5f\xfa\x02\x7f\xfb\xf5\xaf\x11\x46\x16\x00\x45\xba\xb9\x84\
-\x5c\x01\xd7\x1e\x3c\xf8\xfc\x6d\x87\x15\x4c\x3a\x52\xcf\xd1\x64\
-\x00\x53\x48\xd7\x51\xd2\x8e\xde\x2a\x1c\x07\x2f\x1a\x05\xc0\x9b\
-\x84\xa2\xab\xae\xb3\xeb\x19\x3c\xc9\x23\x37\x58\x51\x08\x01\x0a\
-\xcb\x43\xdb\xc7\xf0\x9d\x08\x85\xa5\x6d\x41\xa3\x41\x62\x45\x86\
-\x3e\x5f\x8e\x20\x76\x0f\x3a\x5d\x89\xf4\x5d\xd3\xfd\x5e\xda\x68\
-\x03\x2a\x21\x9d\x4a\xff\x10\x37\x6c\xdc\xca\x9b\xfe\xf6\x7d\x7c\
-\xe4\x9d\xef\xe6\xe8\xe1\x51\x62\xbb\x83\x71\x81\x18\x1d\x0b\x1a\
-\x05\xcf\x3c\xee\x24\xbe\xfe\xbd\xab\x91\x51\x65\xdc\x75\xc0\x16\
-\xd8\x29\xa5\xd9\x81\x50\x34\x29\x87\x9a\xd8\x85\xc3\x4c\xb6\x23\
-\xff\xef\xd2\xaf\xd0\x7e\x78\x23\xcf\x3d\xe3\xec\x5c\xbf\x32\x69\
-\x88\x0c\x21\xa8\x54\x42\x3e\xb5\x4d\x1b\x70\x9b\x47\x71\xdc\x5e\
-\x9b\x5f\x07\x50\x5d\x8c\x9d\x7e\x4b\xd2\x6e\xa5\x4a\x9f\x58\x62\
-\x50\xd6\x0f\x8c\xf0\x97\xbf\xf4\x2b\xfc\xd5\xc7\xff\x91\x13\x4e\
-\x3a\x91\x17\x9f\xf8\x34\x86\x23\x30\xe9\x71\x05\xa8\x49\x64\x1f\
-\xae\x59\x30\x05\x5c\x7e\xff\x5d\xfc\xfb\x97\xfe\x97\xaf\x5e\x79\
-\x25\x0f\x4e\x4d\x50\x0e\x0f\x40\x54\x4e\x3d\xf9\x24\xde\xf0\x8a\
-\x57\xe1\x80\x18\x23\xb6\x61\x20\x8f\x02\xb7\x8c\xf0\xc9\xef\x7c\
-\x83\xbf\xfc\xf7\x4f\x52\x8e\xf4\x83\xd8\xcc\x3a\x9b\x66\xc1\xe3\
-\x6e\x86\xc0\xee\xf6\x4b\xda\x05\xd5\xd7\x17\xb4\xbf\xd9\x64\xf9\
-\xe8\x02\x20\x01\x9b\x1a\x98\x9a\x0f\x00\xed\xfe\x7a\x7a\x65\x59\
-\xb1\x4c\xd0\xb9\x65\x72\x9c\x76\xa7\x44\x86\x06\xeb\xd6\x9f\xe4\
-\x6b\xb1\x67\x95\x3e\x67\x62\x1a\xd2\xd4\x8f\xaa\x62\x8d\x25\xa8\
-\xa1\x31\x32\xc2\xcd\x0f\xdc\xc7\x1f\x7f\xf4\x1f\xf9\xc0\x5b\xde\
-\xce\x22\x6b\x10\xd2\xb4\x61\x00\x9e\x7e\xec\xf1\xac\xfd\xaf\xe5\
-\xdc\xb0\x79\x13\x2c\x1a\x81\x32\x20\x14\x44\x27\x74\x24\xa2\x2a\
-\x14\x93\x1d\x3a\x9b\xb6\xf1\xbc\xa7\x9f\xc7\x9f\xbd\xe1\xad\x8c\
-\x16\x0d\x42\x08\x58\x31\x35\x32\xb1\x9a\xea\xdf\xe1\xf1\x9e\xff\
-\x35\x3f\xcd\xe6\xdf\x01\xcc\xc1\xaa\x8d\xcd\xa8\xa0\xa5\x72\xc4\
-\xc8\x62\xfe\xee\xcd\xef\x42\x80\xb6\xf7\x18\x6b\x29\xad\x26\x0d\
-\x75\xe7\x98\x6a\xc2\x55\xf7\xde\xc5\xc7\xbf\xfc\x45\x3e\x7f\xed\
-\xe5\x3c\xd8\x9e\xc0\xf5\xf5\xd3\xe8\x1f\xa2\x99\x21\x9a\x6f\x7e\
-\xc1\x8b\xd8\xbf\xd2\x8c\x2b\x2c\x1d\x02\x1d\x15\x5a\xc6\xf2\xa9\
-\xab\xbe\xcb\x7b\xfe\xf1\x83\x4c\x0e\xf5\x23\x62\x53\xcb\x2b\xf4\
-\xec\xf8\xf3\xd9\xff\x9e\x61\x55\xed\xa1\xa6\xf5\x86\x1e\x10\x79\
-\x2e\x2f\x95\x81\xc2\x58\x46\x87\x47\x09\x54\x65\x96\x59\x46\xff\
-\xa4\xba\xd6\xd2\x43\x55\x0e\xdb\xc6\xc6\x28\x43\xc0\xd8\xec\x08\
-\xf7\xb8\x65\xbf\x33\xab\x40\x5e\x8a\x8f\xa9\x6b\x60\x7c\x64\x70\
-\x78\x84\x2f\x5f\xf1\x1d\x3e\xf1\xd5\xc3\x78\xf3\xb9\xcf\x22\x76\
-\x3c\x45\x61\xe9\x68\x60\xff\xc1\x61\xce\x3e\xf2\x38\x7e\xf8\x8d\
-\x2f\x61\xbc\x10\xbd\xc5\x3b\xf0\xa1\x83\x34\x2d\x8d\xc9\x36\x7d\
-\x8f\x6c\xe3\xf9\x67\x9e\xc3\xef\xbc\xf6\x97\x58\xa8\x20\xa5\xc7\
-\x3a\x07\x84\x44\x73\xce\x1e\xb7\xce\x77\x6a\x4f\x0a\x07\xe0\x73\
-\x63\xca\x9a\xa4\x90\x42\x3b\xd2\xc4\x10\x42\xc9\x40\xd3\x32\xa5\
-\x81\x46\xa3\x40\x81\x6f\xdd\x7b\x1f\xff\xfc\xd5\xcf\xf3\xdf\x57\
-\x7d\x97\x0d\x93\xe3\xd8\xfe\x3e\x8a\xd1\x51\x7c\xe9\xc1\x3a\xc6\
-\x36\x6e\xe4\x92\xf3\xce\xe7\xdc\x83\xd7\x63\x62\xd2\x5d\x37\x31\
-\x31\xc2\x62\x1d\xff\xf1\xfd\x6b\xf9\xad\x0f\xbf\x9f\xb1\xa1\x7e\
-\xda\x45\x91\xd6\x42\x99\x78\xfc\xc4\x26\x2a\xec\x3d\xdd\x7a\x27\
-\x55\xd3\x90\x5a\xc4\xd9\x82\x81\xbe\xbe\x84\x97\x12\x5b\x0f\xfc\
-\xd4\x15\x68\xa9\x71\x56\x79\x98\x2b\xb5\xf9\x4a\x60\xf3\xb6\xad\
-\x88\x31\x79\x8c\x2b\xd4\x73\x3a\x4f\x0a\x8b\xb9\x4d\xab\x49\xd0\
-\x35\xc6\xc4\x14\x64\x17\x2f\xe0\x7d\xff\xf1\x7f\x39\xe1\x88\xa3\
-\x38\x73\xd9\x4a\xca\xd0\x01\x02\x03\xb6\x8f\xe7\x9c\x7a\x26\x9f\
-\xfc\xd6\x65\x6c\x29\x01\x63\x88\xd1\x27\x45\xab\x89\x71\x9a\x63\
-\x1d\xde\x74\xfe\x73\x78\xcb\x2b\x2e\xa1\x0f\xe8\x8f\x91\x18\x22\
-\xd8\x90\xa7\x24\x9f\x5c\xb6\xc7\x3b\x80\xaa\xc5\x13\x30\x94\x24\
-\x69\xaa\x86\x08\x5a\x46\x8c\x08\x5e\x23\xc1\x0a\x97\xfe\xe8\x3a\
-\xfe\xe3\x1b\x97\xf3\xf9\xeb\xaf\xe5\x9e\xf6\x36\x64\xe1\x08\x66\
-\x68\x31\xc6\x2b\xbe\xd3\xa1\x59\x34\xf1\x9b\xb7\x71\xf2\xea\x75\
-\xbc\xf1\xa2\x17\xd2\xd2\xb2\xd6\x24\x08\x5e\x29\x5a\x05\xff\x73\
-\xd3\x0f\x78\xe3\x07\xff\x9c\x89\x91\x16\x51\x0a\x14\x8b\x6a\xd2\
-\xc3\xdb\x53\x17\x7e\x26\xb9\xa9\x87\xa2\xd2\xec\x7b\xce\xfd\x43\
-\x84\xa0\x38\x0c\x03\x8d\x16\xad\x46\xb3\x0e\x0e\x54\xf3\xd0\xd3\
-\x2c\x34\x65\x09\xad\x9a\xdc\x41\x07\x78\x78\xeb\xe6\x3c\xf6\x46\
-\x37\x4f\xa8\x2a\x86\x7b\xf8\x13\x2f\x5d\x8a\xd3\x8c\x1d\x11\x4a\
-\x22\xa1\x55\x70\xdf\xd6\x31\xde\xff\xff\xfe\x8d\xa3\xde\xf8\x8e\
-\xd4\xe3\x8f\x25\x04\xcf\x51\xab\x0f\xe2\xb8\x83\x0e\xe1\x7f\x6f\
-\xbb\x09\xbb\x60\x08\x17\x04\x19\x9b\x60\xa0\x1d\x78\xcf\xcf\xff\
-\x12\xaf\x39\xed\x6c\x1c\x60\x42\x7a\x1e\x4d\xc3\xd6\x73\x24\x5a\
-\x4f\xbb\x3e\x39\xa2\x80\x79\x6e\xe6\xcc\xe5\x00\x2b\xca\xf0\x74\
-\x81\x4b\xb2\x3c\xb4\x8d\x88\x03\x88\x34\xb0\x3c\xb4\xe1\x11\x3e\
-\xf5\xd5\xcf\x73\x6f\x39\x46\xdf\x92\xc5\x68\x00\x8d\x42\x27\x46\
-\xb4\xd5\x20\x68\x64\xc0\x47\xde\xf9\xbc\x17\xb3\xb6\x7f\x10\x13\
-\x3d\x12\x42\x92\xce\x6a\x35\xb8\x65\xf3\x66\xde\xfd\x8f\x1f\x60\
-\x53\x53\x08\xfd\x4d\x3a\x21\x8f\x02\x92\x67\x0f\x2a\x1a\xec\x3d\
-\x28\xfc\xdf\xc1\x72\x61\x59\x63\xa4\xe2\x62\x2a\x8a\x82\xd8\x29\
-\x59\xb9\x78\x19\xfd\xad\x56\xae\xa9\x50\x53\xa3\xef\x78\xbd\xc9\
-\x14\x66\x09\x2c\x35\xa9\x91\x87\x37\x6d\x04\x6b\x93\x12\x90\xa6\
-\xd6\xa1\x2a\x4f\x34\xbb\xf9\x4f\x78\x4d\xf2\xb4\x5d\x56\x45\x8e\
-\x80\x3a\x4b\x3b\x94\xb8\xd1\x51\xbe\x72\xdd\x35\x7c\xe1\xea\xab\
-\x71\x62\xd3\xa8\xb4\x2a\x0b\x8c\x70\xfe\xf1\xc7\xd3\x17\x03\x85\
-\x89\xb0\x7d\x1b\x07\x95\x8e\xbf\x7f\xd3\x3b\x79\xfd\x69\x67\xe3\
-\x34\x62\x35\xe2\x4c\x6e\xe5\x55\xf3\x29\xd4\x9a\x51\xdd\x6a\xff\
-\x1e\x6e\x7b\xbc\x03\x40\x13\x7c\xd3\xa9\x50\xe4\x0b\x9c\xfa\xb6\
-\xe9\x87\x4e\x2c\xda\x69\xf3\xd2\xd3\x9f\xc1\x47\xde\xfb\x97\x1c\
-\xb2\x60\x19\x3c\xbc\x99\x56\x99\x64\xc6\xa4\x30\xa8\x13\x3a\x5b\
-\x37\xf2\xa2\x67\x3c\x83\x0b\xd7\x1f\x46\x0c\x9e\x52\x63\x6a\x3c\
-\x36\x1a\x3c\x82\xf2\xee\x8f\x7e\x98\x1f\x8d\x6d\xc1\x0d\x0c\x51\
-\x76\x14\x69\x34\x13\x9c\x14\xd9\xf3\x9f\xf4\xee\x28\x44\xdd\x12\
-\x8c\x22\x35\x4a\x59\x4b\xcf\xca\x25\x4b\x19\x48\x1e\x33\xd5\xf7\
-\xe6\x70\xdd\x15\x68\x87\xc8\x78\xa7\x9d\x0a\x82\x5a\x0d\x65\xd6\
-\x71\xc4\x7c\x9f\xf9\x1c\x2c\x7b\xaa\xfc\x8a\xa2\x04\x01\xc4\x21\
-\xce\x31\xa6\x81\x4f\x5d\xfa\x15\x36\xc4\x80\x88\x23\x58\x43\x09\
-\x9c\x77\xf2\x29\x1c\xb4\x60\x01\x93\xf7\xdd\xc7\xa9\xfb\xaf\xe2\
-\x23\xef\xfa\x5d\x2e\x3e\xf2\x68\xb4\xf4\x75\x01\x3f\x69\x5e\x24\
-\x31\xd2\x48\xd7\x01\xf4\x90\x29\xee\xf1\xb6\xe7\x3b\x00\xa8\xf8\
-\xc4\x28\x10\x1a\xe4\x0a\x6b\xbe\x0b\xd2\x09\xb4\x6c\x93\xd8\x09\
-\x3c\xf7\xc0\xb5\x7c\xea\x1d\xef\xe6\x82\xb5\xeb\xb1\x5b\xb6\x43\
-\xa7\x4d\x21\xc0\x96\xad\xac\x59\xb0\x84\xd7\x3f\xf7\x79\x18\xc8\
-\xbd\x7b\x47\x47\x2c\xdb\x04\x7e\xed\x1f\xfe\x96\xff\xb8\xfe\x2a\
-\xdc\xc2\x05\x84\xa9\x80\xa3\x48\x23\x6f\x99\xd6\xf9\xc9\x62\x15\
-\x3f\x82\x54\x4e\x4b\x35\x4d\xf3\xf9\xc8\x68\xff\x10\x4d\x7a\xa6\
-\x00\xd9\xf9\x3c\xbf\xc9\xb0\x6c\x05\x3a\x31\x32\xde\x9e\xca\x1d\
-\x01\xe9\xd6\x41\x9f\x24\x97\x45\x2a\xf6\xa0\x24\x3c\x91\x86\xc5\
-\xd4\x23\x85\xa3\x9c\x2a\xe9\x1b\x19\xe5\x1b\xb7\xdc\xc8\xe7\xae\
-\xbe\x12\x63\x9b\x4c\x94\x01\x8d\x91\x03\x07\x06\x39\x7e\xbf\xfd\
-\x79\xfe\xb1\x27\xf0\x0f\xbf\xfe\x3b\x9c\x74\xe0\xfe\xc4\x09\x4f\
-\x51\xa7\x14\xd3\x2b\xae\x7b\x86\xd4\xed\xae\xdb\x93\xc3\x01\x54\
-\x98\xcd\xdc\xbb\xb6\x40\x0c\x01\x75\x16\x2d\x1c\x51\x35\x0d\xf0\
-\x78\xcf\xe1\x8b\x97\xf0\xe1\x5f\x7d\x17\x6f\x78\xe6\x73\x19\xde\
-\x3e\x45\x6b\xeb\x38\x0b\xb6\x77\x78\xe3\x33\x7f\x8e\x43\x06\x46\
-\x88\xe5\x24\x85\x0a\xc6\x34\x18\xb3\x96\xdf\xfc\xe4\x47\xf8\xf8\
-\xe5\x5f\xa7\xb1\x62\x29\x65\x27\xd2\x34\x0d\xa4\x5d\xe2\xc4\x80\
-\x9f\x27\xc9\xd8\x5d\xb1\x6a\x34\xbf\x07\x8d\x5c\x73\xd6\x65\x1a\
-\x30\x89\x4a\x2b\xf3\x00\x68\xec\x0a\x6a\xee\x74\x0f\x57\x6a\xc4\
-\x7a\x27\x04\xc6\xdb\x93\xa9\x00\xda\x83\x5d\x79\x32\x3c\xee\xd5\
-\x31\x5a\x34\xb3\x47\x65\x32\x40\xa3\x48\x88\xb8\x4c\x19\x36\xd6\
-\xb0\xfc\xf3\x57\xbe\xc8\x03\x9d\x36\xcd\x46\xa3\xce\xe1\xdf\xf5\
-\xca\x9f\xe7\xfd\xbf\xfc\x36\x56\xb9\x26\xbe\x5d\x42\x61\xb2\xe8\
-\xaa\x60\x35\xc9\x88\x91\x79\x1e\xab\x85\x54\x0f\x86\x3e\x39\x56\
-\xd6\x9e\x7f\x98\x2a\x49\x9b\xad\xac\x78\xe1\xc8\x11\x96\x35\x74\
-\x34\x50\x3a\x43\x70\x42\xb0\xc2\x84\x8b\x94\xda\x61\x71\x34\xfc\
-\xf1\x8b\x5f\xc6\xfb\x5e\xff\x56\x96\x77\xe0\xc8\x7d\xf6\xe5\xe7\
-\xce\x38\x1b\x8d\x6d\x9a\x0a\xa6\xed\xb1\x2a\xfc\xf9\xa7\x3f\xc9\
-\x07\xbf\xf9\x05\x64\xe9\x42\x3a\x9d\x48\x43\x5d\xd2\x7e\x53\x85\
-\xd2\xa7\x16\xe0\x93\xc4\x7a\xe7\x91\xb4\x1a\xe5\x73\x96\x4e\xa7\
-\x43\xc3\x39\x96\x2c\x58\x08\x90\x72\x5d\x49\x2c\x48\x3b\x5b\xfc\
-\xbd\xef\x19\x80\x89\xf6\x54\x9e\x1e\xd4\x1d\x7e\x67\xbe\xcf\x79\
-\xc7\x83\xef\x1d\x73\xae\x8e\x57\xb1\x24\xee\xbe\x2a\x36\x97\xa8\
-\xb4\xac\xc3\x87\x88\x19\xe9\xe7\xaa\x3b\x7e\xcc\x7f\x7d\xeb\x1b\
-\x29\x4a\xf2\x8a\x25\x72\xf0\x82\x45\xec\xe3\x9a\x98\x76\x1b\xdb\
-\xb0\x74\x6c\x05\xa2\xea\x25\xa1\xa1\x9b\x1a\x4d\x3b\xb8\xb9\x09\
-\x88\xcc\xb7\xed\xf1\x5d\x80\x5e\x67\xda\xdd\x79\x04\x9b\x65\x9e\
-\xaa\x9e\xab\x1a\xa1\x55\x35\xb0\x82\x87\x20\xbc\xe2\xc4\x13\x59\
-\xb7\xf4\x3d\x4c\x4c\x8e\xb3\xdc\x35\x09\xe5\x24\x1d\x31\xb8\xfe\
-\x26\xff\xf0\xf5\x6f\xf0\xc1\xff\xfe\x1c\x66\xf1\x02\xbc\x14\x60\
-\x95\xb6\x0f\x38\x89\xd8\x42\x08\xbe\x9d\xb9\xfc\xed\x63\x1f\x20\
-\xcc\xe3\xa2\x90\xbc\x63\xc7\x2c\x8e\x99\xea\x16\x12\x0c\x58\xf0\
-\x36\xb2\xb4\xbf\xc5\xb1\x07\x1d\x94\x7e\x5b\xaa\xd9\x0b\x53\x03\
-\x80\x66\xbe\x5d\x04\xb2\xa4\x23\x1b\x36\x6f\xa4\x8c\xe4\x36\x43\
-\x40\x8d\x49\x7a\x08\xd5\xd0\xcd\xfc\x9c\x31\x36\x43\xfe\x82\xc9\
-\x05\xcb\x9a\xf8\x1f\x2a\xa2\x8d\x5e\x31\xe2\x52\x84\x20\x49\x89\
-\xd8\xe4\x3a\xc6\x44\xf4\x09\x0a\x2c\x20\xd1\xf3\xe9\xcf\xfc\x1b\
-\x17\x9d\x7e\x06\x0b\x1a\x4d\x44\x23\xc1\x7b\xac\x38\xc4\xd9\x54\
-\xdd\xcf\x1d\x13\x33\xdb\x0e\xbf\x43\x5d\xe5\x49\xb0\xfa\x79\x12\
-\x38\x00\x98\x6d\x09\xca\xac\xa1\x8b\x8d\xa9\x52\xaf\x45\x5a\x14\
-\x3e\x78\x4e\x38\x70\x75\x2e\x66\x95\x14\xb6\x49\xc3\x18\x3e\x7d\
-\xeb\x8f\xf8\x83\xff\xf8\x57\x7c\xab\x45\x4b\x9a\x4c\x4e\x94\x68\
-\xc3\xa1\x85\xe2\x63\xc4\x47\x8f\x33\x29\x0c\xde\x43\x36\xbb\x9d\
-\x9b\x4e\xff\xdf\x58\xaf\xca\xd4\x37\x09\xc1\xd3\x74\x05\x8b\x9b\
-\xcd\xfa\x77\x12\x46\x48\x76\x2a\xee\x19\x44\x73\xce\x2c\x6c\xd8\
-\xb8\x91\x76\xe9\x91\xbe\x82\x0a\x1b\x90\x30\xf6\xd5\x24\xe4\x3c\
-\x9d\xb6\x9a\x0a\xe4\xc0\x74\x46\xd3\x2c\xd3\xa6\xc9\x45\x45\x21\
-\x49\x84\x93\x98\xa3\x54\x53\xc5\xde\xab\x47\x9c\xd0\xe7\x0c\x13\
-\x1b\xb7\x71\xc0\xc0\x10\x2f\xfb\xb9\xe7\x51\x14\x69\xb1\x6b\x54\
-\x9c\x6d\x76\x15\xba\x64\xc6\x73\xf8\x98\xe7\xbd\xd7\x01\x3c\xe1\
-\x56\xf5\xb6\xd3\xce\x26\x58\xe3\xe8\x04\x4f\x88\x8a\x75\x96\x42\
-\x0c\x3f\xbc\xed\xc7\xfc\xf6\x9f\xfe\x3e\x8f\xb8\xc8\x82\xd1\x05\
-\x8c\x8d\x8f\x51\x98\x02\x1f\x94\x60\xf3\x30\xb0\x38\x3c\x9a\xa7\
-\xca\xf2\x63\xa5\x3b\xb9\xa5\x79\x0d\xcd\x2f\x2f\xc8\x6c\xdb\x78\
-\x84\xc2\x40\x54\x1a\xce\x52\xec\x62\xfb\xb2\x72\x7d\x5b\xb6\x6d\
-\x63\xaa\xec\x60\x06\x9a\x3b\x9c\xf3\x7c\x99\x92\xd8\x83\xa7\x9d\
-\x6f\xa6\x5c\x97\x4c\x0f\x57\xfd\xab\xb9\x35\x52\x84\x44\xea\x9a\
-\x38\x1e\x3d\xb6\x65\xb0\x93\x6d\xe4\xa1\x2d\x5c\x7c\xcc\x09\xbc\
-\xed\x25\x2f\xe3\x98\x65\xfb\x24\x15\xe4\xe0\x29\x8c\x25\xc6\x80\
-\xed\x49\x03\xf7\xf8\x7c\xf9\x27\xb0\xa7\xd4\x39\x49\x26\x19\xed\
-\xd5\x6d\x73\xc6\x52\xd8\x34\xf6\xe2\x51\x16\x2f\x5c\xcc\xab\x9e\
-\xfb\x3c\x96\x36\x1a\x6c\xdd\xf4\x30\xa6\x65\xa0\x65\x51\x2d\x71\
-\x51\x71\x21\xd1\x83\x27\x6a\xf0\x82\xba\x6e\x04\x35\x2f\x69\xf5\
-\x32\x9a\x38\xe6\xe7\xac\x5b\xf0\x78\x9a\xf6\xf0\x2a\x18\xc9\xc4\
-\x7d\xe9\x3b\x0b\x07\x87\x18\xec\xeb\x9f\xfb\x75\x84\xba\x53\x30\
-\xd9\x6e\xe7\x36\xba\xcc\x4c\xb1\xe7\xd7\x0f\xcc\x20\x61\x49\x04\
-\x21\x59\xaf\x50\x25\xb7\x41\x4d\x02\xff\xe4\x08\x40\x09\x58\x22\
-\xcd\x18\x88\x1b\x37\xb3\xc4\x2b\x7f\xf0\x0b\xaf\xe3\x43\x6f\xfd\
-\x55\x4e\x58\xb6\x0f\x65\x39\x45\x01\x89\x90\x06\xed\x8e\x1b\xf7\
-\x10\xf7\x3c\x39\xf6\xf5\xb9\xdb\x53\x2a\x02\xc0\x64\x46\x98\x9e\
-\x36\x57\x88\x01\x6b\x4c\xa2\xb1\x32\xc2\xc2\xd1\x05\xbc\xe3\xd9\
-\x2f\xe0\xb8\x63\x8e\xe3\x6f\x3e\xf3\xaf\x7c\xf1\xfb\x57\xe2\x07\
-\xfa\x29\xfa\x86\x10\x2f\x35\x15\xb8\x8a\xe9\x89\x71\x75\x1a\xed\
-\x5f\x15\x15\xd4\xca\xcf\x3d\x3f\x9b\x57\xab\xfa\xd3\x31\x62\x6c\
-\xa2\xc4\xd6\xc9\x29\xd6\x1d\xbd\x8a\xc5\x03\x03\x84\xa8\x3b\x95\
-\x9e\x9e\x76\x19\x2b\xe0\x0c\x30\x15\xca\x7a\xf6\xbf\xd2\x14\x98\
-\x39\xc5\x39\x3f\xd6\x8d\x00\x2a\x66\x20\x55\x43\xac\x90\x8d\x52\
-\x4f\x35\x60\x62\x62\x9e\x12\x84\x30\xb6\x9d\x66\xbb\xc3\x45\x27\
-\x9e\xca\xaf\xbc\xe8\xe5\x1c\xb9\x78\x29\xe2\x03\x22\x30\x58\x34\
-\x29\xcb\xc4\x12\xa5\x92\x80\x52\xd5\xa0\x77\x72\x8a\x7b\xc2\x79\
-\xef\x5e\x7b\x6a\x39\x80\x6c\xbd\x11\x80\xb5\x49\xfe\xc9\x18\xa9\
-\x39\xf2\xcb\xd2\x73\xe6\xca\x55\x1c\xfe\xe6\x77\xf1\x2f\x97\xfd\
-\x2f\x1f\xfb\xf2\x17\xf8\xe1\x03\xf7\xe3\x86\x86\xa1\xd1\x4c\xa2\
-\x8e\x51\x13\x1b\xb0\xcd\xa2\xe0\x42\xea\x85\xf7\x54\xcf\x43\x4f\
-\x5a\x30\xaf\x0c\xb9\xd0\x2d\xde\xd5\x07\x94\x24\xd9\xa3\x2f\xd9\
-\x77\xf1\x12\x06\x80\x32\x2b\x1a\xe9\x63\x00\x9b\x54\xbb\x28\xc8\
-\xf1\xb2\x8d\xaf\xb2\x68\xe9\x16\xfe\xe6\x3b\xe0\xa9\xd8\x7f\x2a\
-\xe7\x1b\xd5\x64\x35\xdf\x48\x2e\xe0\x40\x8c\x18\x85\xa6\x40\xec\
-\x94\xf8\x2d\x5b\x39\x79\xed\x21\xbc\xfa\xbc\x0b\x79\xee\x89\xa7\
-\xb0\x08\x88\xde\xe3\x4c\x26\xe9\x08\xd0\xb4\x29\xfd\xab\x68\xd3\
-\xeb\xc1\x9e\xf9\x3f\xe1\xc7\xc5\x9e\x92\x0e\xa0\xb2\xee\xfc\x75\
-\xea\x87\x57\x37\xb3\x85\x10\xcb\xc0\x82\x18\x78\xc7\x59\xcf\xe4\
-\x9c\xc3\x8f\xe1\xef\xbf\xf0\x9f\x7c\xfe\xca\xef\xf2\xe0\xd8\x66\
-\x5a\xa3\xa3\x94\x0a\x85\x35\x78\x4d\xc0\x10\xeb\x32\xb5\xf4\x8c\
-\x58\x5f\xeb\xff\xcc\xa7\x03\xc8\x5c\x73\xd5\x21\x18\x41\x43\xa2\
-\x32\x37\x62\x90\x4e\x99\x7e\x6b\x8e\x0f\xb1\xc9\x90\xd9\x48\x9a\
-\xb6\x8c\x59\xf5\xa6\x8a\xba\xf7\x84\xb5\x60\xb4\xbb\x1d\x6b\x3d\
-\xf9\xa8\x69\x72\x53\x03\x84\x48\x51\x38\xe8\x94\x74\x36\x6f\x67\
-\xff\xe1\x05\xbc\xe0\xa2\x17\x71\xc9\x05\xcf\x62\xdd\xc0\x60\x2a\
-\x1d\x86\x90\x16\x7f\x62\x07\xa4\xda\xeb\xab\xee\xd2\xcc\x61\xa9\
-\x3d\xe2\xc4\x77\xb3\x3d\xa5\x1d\x00\x4c\xc7\x68\x75\x99\x73\x0c\
-\x06\x68\x15\x96\x4e\xa7\xe4\x98\xc5\xcb\xf9\xeb\x4b\x5e\xcf\x0b\
-\x4e\x3e\x8b\x8f\x7c\xfe\xbf\xf8\xf2\x0d\xd7\x31\xd5\x10\x8a\xa1\
-\x21\x8a\x52\xc0\x16\x04\x49\x1c\xf1\x58\x9b\xc9\x40\xa6\x7d\xc8\
-\xfc\xb6\x01\x67\x1e\x86\xa6\x1d\x2c\x7a\x4f\xcb\x15\x2c\x5f\xb8\
-\x28\xfd\x7c\xae\x3e\x4a\xa9\xc3\xdf\xa4\xa0\x9b\xf9\x03\xab\x82\
-\xe7\x3c\x2f\x84\xaa\x06\x33\x9d\x8a\x4d\x91\x98\x06\xc4\x9a\x46\
-\x10\xaf\x4c\x6c\xd9\xc4\x80\x31\x9c\x73\xdc\x09\xfc\xf2\x73\x5f\
-\xc8\xd3\xf6\x3b\x00\xab\x10\x7d\xc0\x3a\x41\x33\xb3\x71\x55\x30\
-\xac\x2e\xd0\x4e\xc9\x7a\x9f\x42\xa1\x7f\x65\x4f\x79\x07\x30\xcd\
-\x6a\x68\x58\x5a\x2a\x41\x94\xe8\x04\xf5\x1d\xfa\xd4\x72\xfe\xda\
-\x43\x38\x79\xcd\x21\x7c\xf6\xda\xcb\xf9\xa7\xaf\x7c\x9e\x2b\x6f\
-\xf9\x11\xa6\xd1\x8f\x6d\x14\xa8\xa4\xc1\x1a\xaf\x71\xfa\x68\xc0\
-\x1e\xb7\x2b\x64\xca\xef\x00\xc4\xc8\xf0\xc0\x00\xc7\x1f\x7d\x54\
-\x3a\xfd\x39\x7a\x00\xd5\x58\xff\xee\x64\xd9\x49\x5a\x78\xd5\xa2\
-\xe8\x76\xdb\xe6\xcf\x12\xf0\xa3\xe7\x8b\xb4\x8b\x3b\x0c\x7d\xa5\
-\x87\xed\x13\x34\x83\xe7\xbc\xa3\x8e\xe5\x85\x17\x3c\x8b\xb3\x0e\
-\x3b\x92\x85\x00\x6d\x9f\xb4\xf9\x1a\x82\x62\x09\xa4\x48\x27\x89\
-\x9f\x48\x4d\x8e\x5a\xbd\x6b\x6f\xce\xff\x14\x4c\xff\x81\x9f\x25\
-\x07\xd0\xb3\x50\x4b\x93\xa6\x0a\x45\x63\x82\x89\x8a\xa0\xc1\x13\
-\x4b\xa5\xcf\x5a\x5e\x7a\xfc\xc9\x9c\x7d\xec\xf1\x7c\xf6\xf2\xef\
-\xf0\xcf\x5f\xbf\x94\x9b\x6e\xbb\x15\xdb\xd7\xa4\x8c\x81\x46\xb3\
-\x41\x19\x03\xbd\x2c\x80\xd5\x48\x6e\xd7\x9e\xc8\x90\x60\xc6\x6a\
-\xac\x66\x97\x34\xf1\x22\x16\x7d\x7d\x2c\x18\x1e\x21\x91\xf8\xce\
-\xed\xf1\x95\x2c\xfe\xd1\x06\x36\x6d\xd9\x9c\x98\x7f\x54\x7b\x08\
-\x2d\xe7\xd7\xeb\x29\x89\xfa\xab\xca\xbc\xc4\x24\x15\xa8\xce\xb6\
-\x6d\xf4\x45\xe1\x84\x55\x07\xf3\xea\x67\x3f\x97\x67\x1c\x73\x5c\
-\x5a\xf8\x41\xd1\xe0\x49\x75\xd1\xc4\x30\x65\x48\xfa\x92\x51\x0c\
-\x25\x52\xef\xfa\xb5\xac\xed\x4c\x27\x2f\xdd\x19\x9f\x27\x0f\x3e\
-\xf4\xb1\xed\x67\xc7\x01\x54\x56\xdf\x68\xc1\x89\xa9\x2b\xf9\x34\
-\x72\xb1\x90\x48\x8c\xb0\xaf\x71\xbc\xe9\xd4\x33\xb9\xe0\xb8\x93\
-\xf8\xc2\x77\xbe\xc9\xff\xfb\xda\x57\xb8\xfe\x81\x3b\x19\xef\x4c\
-\x60\x87\x06\xb0\xb6\x20\x94\x21\x0b\x53\x48\x9a\x47\xb0\x86\x18\
-\x02\x31\x2a\x85\xb3\x44\x4d\x34\x53\x55\x84\x09\x82\xf3\x92\x64\
-\xad\xf3\x08\x69\x05\xde\xe9\x8a\x9f\x66\xcb\x63\xbb\x42\xcf\x9a\
-\x9b\x65\xfc\x3e\x85\xc3\x09\xc3\x00\x20\x21\x9d\x5b\x74\x05\x78\
-\x4f\x33\x0a\xa6\xf4\xd0\x22\xc7\xee\x73\x70\x02\xf9\x43\xc7\x43\
-\xe0\x91\xed\x5b\x41\x92\x2a\x6f\x02\xd1\xa4\xe1\x9a\x38\xb3\x32\
-\xd6\x73\x8c\x3b\xd4\x44\x66\x52\x94\xcd\x68\x9b\x4e\x73\x9e\x55\
-\x9e\x16\x12\xe7\x9f\x33\x05\xa2\x89\xd7\xb0\x16\x6e\x35\x82\xc6\
-\x36\xb6\xb0\xd8\x32\x10\xb7\x6e\x65\x20\xc2\x31\x07\x1e\xc4\x8b\
-\x9f\x76\x1e\xcf\x3c\xe9\x54\x96\x59\x07\x1a\x11\xaf\x58\xb1\xa8\
-\x73\x60\x22\xce\x9a\x3c\x12\x9d\x11\x80\x08\x81\x19\x3b\x7f\xef\
-\xf9\xe4\xff\x7f\xaa\xed\xfc\x95\xfd\xec\x38\x80\x9e\x3b\x58\xe4\
-\x57\xc2\x6f\xda\x1c\xd2\xa7\x3c\xb7\x12\xa2\xd6\x18\x21\xc2\x3a\
-\xd7\x64\xed\x39\xe7\xf2\xfc\x53\x4f\xe7\xb3\x57\x7f\x9b\x7f\xfd\
-\xda\x97\xf9\xde\xdd\x77\xd2\x16\xa1\x31\x30\x98\xc4\x32\x11\x4a\
-\x02\x21\x86\x94\x83\xba\xac\x38\xcc\xf4\xe7\x3e\x09\xa1\xf4\x2a\
-\x1d\x6b\x4d\xdb\x55\x03\x98\xaa\x03\xd5\x54\xe8\xd2\x9e\x41\x9f\
-\xd9\xf6\x5d\x93\x7f\x2f\x9a\x54\x97\x28\xca\xd4\xbe\x2a\x25\x31\
-\xe0\xac\x5a\xb6\x82\x91\x66\xff\xdc\x17\x3f\x69\x41\x8a\x40\xd9\
-\xe9\x30\xd6\x69\x83\x49\xfd\xf5\x20\x59\xb3\x41\x93\xb6\xc2\x6c\
-\xf8\xa3\x1d\x2e\x76\xfd\x75\xcf\x79\xd5\x7f\xaa\x5d\x00\x55\x97\
-\xa9\x24\xa1\x0c\x8d\xc3\x22\x29\x5f\xc7\x82\x28\x62\x6d\x7a\x60\
-\x4d\x42\xea\xc5\xcd\x5b\x68\x79\xe5\x84\x55\x6b\x78\xc9\x39\xe7\
-\x71\xc1\x89\xa7\xb0\xa2\x68\xe2\xa3\xc7\xc4\x12\x43\x44\x72\xfa\
-\x92\x01\xd0\xdd\xfb\x40\xb7\x3e\xb4\xd3\x45\x20\x3b\x3d\x8b\xa7\
-\x8c\xfd\xec\x38\x80\x47\xb5\x1d\x97\x96\x48\x25\x1f\x95\x22\x82\
-\x65\xcd\x16\x6f\x38\xed\xe9\xfc\xdc\x49\x67\xf2\xd5\xab\xaf\xe2\
-\xff\x5d\x76\x29\xd7\xdf\x7b\x27\x0f\x8c\x6d\xc4\x0e\x0d\x60\xfa\
-\xfb\x09\x1a\xf1\x21\xe0\x45\xa1\xb0\x75\xab\x5a\xa2\xe0\x62\x8a\
-\xcd\xcb\x46\x24\x34\x7a\x18\x6d\x7b\x86\x49\xd2\xc2\x48\xc5\xb6\
-\x28\xd2\x0d\x73\x1f\xc5\x64\x96\xd3\x88\xa4\x7e\x7f\xec\x94\x1c\
-\xbe\x76\x1d\x43\x92\x22\x13\xb1\x73\xc3\x7d\x55\x92\x7b\x3e\x46\
-\x3a\xb9\x83\x50\x21\x03\x67\x8b\x40\xa8\x53\x83\x19\x41\x4c\xf5\
-\x45\xcc\xdc\x0c\x3d\xd3\x84\x29\xf2\x99\x31\x34\xaf\x69\x86\x41\
-\x8c\x21\xaa\x4f\x0a\x4e\x85\x41\x4d\x4c\x5a\x8e\x65\x1b\xa3\x8a\
-\xdf\x36\xc5\x12\x63\x38\xe5\x88\x13\xb8\xe0\xd4\x33\x38\xfb\xe8\
-\xe3\x58\x61\x1c\x16\x28\x43\x48\x12\xdc\x28\x41\xa1\x30\x4f\xa5\
-\x80\x7d\xf7\xdb\x5e\x07\xb0\x13\x13\x52\x68\xee\x55\x31\x51\x71\
-\x5e\xb1\x6a\x38\xc0\x14\xfc\xc2\xc9\xa7\xf2\x73\x27\x9f\xca\x77\
-\xee\xbc\x8d\x7f\xbd\xf4\x8b\x7c\xfb\x86\xeb\xb9\xf7\x91\x4d\x98\
-\xbe\x16\xb6\xd5\x04\x67\xf1\xd5\x92\xc9\x5b\x9c\xe4\x21\x14\x1f\
-\x63\x4f\x1a\xdd\x5d\x00\x2a\x10\x7a\x44\x86\x75\xda\x8e\xf5\xe8\
-\x36\x2d\x5d\xcd\x40\x20\xb1\x4d\xe8\x04\x86\x1b\xad\x34\x15\x20\
-\x31\x8f\x4a\xcd\xd1\x6c\x62\x4b\x2e\xbd\xcf\x6c\x48\x3b\xd6\xfe\
-\x44\x05\x1b\x2a\xf5\x9b\x59\x9c\xe8\x8c\x6f\x69\x15\xc6\xf7\x22\
-\xf8\x50\x24\x56\x90\xeb\xac\xf9\x48\xd2\x23\x10\x4b\xc2\x33\x74\
-\xa6\x60\xaa\x83\x1d\x9b\xe2\xa0\xe5\xfb\x70\xea\x71\xa7\xf0\x92\
-\x73\x9e\xce\xfa\xfd\x0e\x60\x00\x20\x2a\xb6\x8c\x38\x2a\xcd\xc7\
-\x88\x1a\x93\x64\xb9\x9e\x72\x7b\xf6\xee\xb5\xbd\x0e\x60\x27\xa6\
-\xa4\x8b\x23\x02\x45\x46\xd5\xa1\x8a\x7a\x45\x43\x64\xc0\x19\xce\
-\x3b\xf0\x20\x4e\xfd\x85\x37\x71\xd3\xc6\x87\xf8\xd2\x15\x57\xf2\
-\xd5\x2b\xaf\xe0\xc6\x3b\x6f\x67\xc2\x09\xa6\xaf\xc0\xf4\xf5\x11\
-\x8c\x41\x51\x4a\xd2\x0e\x68\x03\x10\x33\xb1\x46\xfe\x59\xaf\xca\
-\x4d\xef\xd2\xd8\xe1\x80\x76\x72\x9c\x09\xa6\xdb\x93\xb4\x9a\xa4\
-\x78\xe4\x8c\x65\xa4\x6f\x70\x97\x97\x80\x56\xf5\x86\x18\x53\x2a\
-\x63\x66\x2f\xfc\x89\x9a\x2e\x18\x67\xe6\x6f\x64\xd5\x1b\xed\x49\
-\x6b\xa2\x54\xf4\x6a\xb1\xfe\x83\x6a\x96\xde\xc4\x7c\x1e\x45\xbe\
-\x26\xea\x89\xe3\x6d\xd8\x36\xc6\x68\xab\x8f\x63\xf6\x3b\x88\x0b\
-\x4e\x3a\x99\xf3\x4f\x38\x95\x03\x47\x16\xd0\x0f\x68\x4c\x63\xdb\
-\xce\x15\xa9\x66\x90\x1d\x91\xe6\xcf\x0e\x21\x64\x01\x94\xa7\x14\
-\xe2\x7d\xb7\xda\x5e\x07\xc0\x4e\x26\xe3\x44\x30\x21\x29\x18\x27\
-\x26\x12\x05\x97\xb4\x0b\x11\x43\xc3\x08\x21\x78\x86\x81\xd3\x16\
-\x2d\xe3\xf8\x67\x3d\x87\xd7\x5e\x70\x21\x57\xfe\xe0\x7a\xbe\x7a\
-\xf5\x15\x7c\xfb\x87\xd7\x73\xe7\x86\x8d\x6c\x33\x11\x33\xd0\x8f\
-\xb4\x5a\x44\x2b\xe0\x05\x7c\xca\x67\x63\x0c\x75\x7f\x3d\xb1\x70\
-\xa7\xcf\x52\xed\x3a\x84\x2e\xd2\x68\x0e\xcb\xb8\x82\x27\x18\x21\
-\x76\x3a\x2c\x6a\xb6\x38\x78\x9f\x95\x29\x9a\xd1\x00\x19\x13\xff\
-\x18\x6f\x91\x58\x83\xb2\x68\x68\xec\x61\x10\x4a\x8e\x46\xa7\x2d\
-\xf8\x6a\x08\x57\xc5\xe4\xb1\xdc\xfc\xc3\x18\x12\x2f\xa1\x49\x08\
-\x3b\x83\xcb\x45\xbc\x98\xaa\xa2\x19\x80\xa3\xa2\x89\xea\xd5\x0a\
-\x36\x2a\xd2\x9e\xc2\x4f\x4c\x52\x78\xe5\xa8\xfd\x0f\xe4\x84\x93\
-\x0e\xe1\xfc\xe3\x4f\xe2\xb4\x75\x87\xb3\x88\x0a\xda\x1b\xeb\x22\
-\x29\x26\xa9\x3c\x63\x25\x21\x35\x43\xc8\x64\x51\x49\x68\x76\xb6\
-\xc5\xff\x68\x93\x90\x3f\x6b\xb6\xd7\x01\x64\x9b\xb5\x45\x66\x53\
-\x12\x5e\x49\x7f\xd5\x44\x1b\xf9\x2b\x67\x25\xd1\x4e\xfb\x12\x15\
-\xc3\x72\x6b\x79\xde\x51\x47\xf3\x9c\xa3\x8e\xe6\xd6\xcd\x1b\xf9\
-\xee\x4d\x37\xf0\xd5\x6b\xaf\xe6\xea\xbb\x7e\xcc\xdd\x5b\x1e\xa1\
-\xad\x11\x3f\x38\x8c\x34\x5b\x58\x55\x4c\xe1\x88\x41\xd1\x32\x37\
-\x15\x25\xb3\xcd\x88\x10\x89\x04\xcd\x3a\xbd\x62\x88\x15\xaf\xdd\
-\x2c\xc7\xd9\x45\x23\xa6\xb5\xa5\x39\xda\x58\xd4\x3f\xc4\x81\x8b\
-\x16\xd7\x9c\x98\x8f\x76\xbe\xdd\xf9\x09\xea\x10\x5d\x73\x77\xa3\
-\x62\x00\x9e\xb6\xd3\x67\xde\x81\x68\xd2\x20\x7c\xbd\x9c\x32\x70\
-\xc8\x64\xf1\x4d\x0d\x11\xc4\x76\xb1\x13\x62\x2a\x76\xb1\xb4\x34\
-\x23\xf8\xc9\x29\x82\x4f\x74\x5b\xab\x06\x47\x38\xf1\x94\x93\x39\
-\xe3\xe8\x63\x39\x69\xed\xa1\x1c\x34\x98\xa8\xcc\x62\x04\x34\xf3\
-\xf1\xd5\x04\xc5\x32\x6d\x70\x09\x62\xc6\x78\xa4\xd7\xa3\xb5\x3d\
-\xe7\xda\x12\x7d\xaa\xdb\x5e\x07\xf0\x28\x16\x49\xed\xa7\x84\x1c\
-\x8c\xd3\xaa\xc0\xf5\xe3\x93\x99\x8a\x4c\xa2\x21\x26\x44\x85\x28\
-\x1c\xba\x60\x11\x6b\x4f\x3d\x8b\x8b\x4f\x3d\x8b\xdb\xb6\x6f\xe4\
-\x3b\xdf\xbf\x8e\x2b\x6e\xb9\x81\x2b\x6e\xbb\x9d\x7b\xb7\x6c\x61\
-\x6a\x62\x02\x69\xb6\x68\xb6\xfa\xc0\x59\x82\xb1\x04\x20\x68\x24\
-\xe4\x9e\x7b\x62\x9d\x89\x88\x31\x35\x94\x79\xe6\xbe\x95\x3e\x9b\
-\x7a\x6a\x31\xa5\x14\x01\x89\x9e\x01\x5b\xd0\x27\x16\x47\xca\x89\
-\xe7\x62\xa9\x63\x97\x6a\x0f\x31\x04\xbc\xf7\xd9\x09\xe6\x1e\x7a\
-\xd5\x12\xcb\x93\x97\xc4\xdc\x31\xc9\x15\x3e\xc9\x51\x92\x68\x4c\
-\xb2\xed\x11\xa4\x69\x29\x8d\x47\x30\x58\x8d\xd0\x29\x61\x7c\x92\
-\xa2\x8c\x2c\x6c\xf6\xb1\x74\x68\x01\xc7\x1d\x76\x04\xa7\xae\x5f\
-\xcf\xc9\xeb\x0e\x65\xe5\xf0\x30\x03\x24\x8e\x8f\x72\xa2\x83\x38\
-\x87\xb3\x86\x58\x75\x37\xe8\xc6\x32\x55\x87\xd1\x4c\x3f\x83\xe9\
-\xf7\x68\xaf\xed\xd4\xf6\x3a\x80\xc7\xb0\x0a\x25\x6e\x2a\x41\xe7\
-\x19\xfd\xeb\x48\xee\x89\x4b\x40\xc8\x58\x00\x8d\x84\xb2\x8d\x88\
-\xa5\xdf\x08\xeb\x87\x16\x71\xec\xe9\xe7\xf2\xaa\xd3\xcf\xe5\x8e\
-\xf1\xad\x5c\xfb\xe3\x9b\xb9\xfe\x47\x37\xf3\xc3\x3b\x6e\xe3\x47\
-\xf7\xdc\xc5\x86\x2d\x93\x74\x8c\xa0\xcd\x26\xb6\xbf\x85\x5a\x8b\
-\x8d\x89\xbe\x2b\x1a\x93\xe5\xcd\xd3\x40\x93\xea\x8e\xdc\x03\x33\
-\x8b\x80\x58\x4b\x8c\x6d\x46\xfb\x07\x18\xea\xeb\x03\x55\x62\x1e\
-\x0e\x7a\x4c\x93\x9c\x5b\x8b\x64\x4c\x43\x0e\xf2\x45\x12\xc2\x50\
-\x35\x77\x09\x62\xea\xa7\xd7\x0c\x24\x8a\x31\x06\x13\x02\x06\x70\
-\x22\x14\xb6\xc0\x88\xb2\x7d\x72\x0c\x25\xa0\x65\xa0\xf0\x91\x7d\
-\x86\x46\x38\xe4\xc0\x35\x1c\xbf\xe6\x10\x4e\x59\x7f\x24\x87\xef\
-\x77\x00\x4b\x86\x86\x18\x20\x03\x18\x7d\x20\x06\xc5\xa9\xd0\x74\
-\x2e\xeb\x1c\x54\x2d\xd3\xb4\xd4\x4d\xe6\x6b\xaa\x22\x93\x2a\x15\
-\x99\x31\xc1\xbb\xd7\x1e\xc3\xf6\x3a\x80\x47\x31\x01\x1a\x79\x75\
-\xcd\x46\x9d\x95\xfe\x31\x79\x30\x25\xa1\xd1\x52\x78\x6c\x72\x25\
-\xdb\xd2\x10\x21\x84\x40\x54\x65\xc8\x58\x8e\x1c\x18\xe1\xa8\x63\
-\x4e\xa2\x73\xcc\x49\x6c\xc6\xf3\xa3\xbb\xef\xe6\xa6\x7b\xee\xe6\
-\x7b\x77\xde\xce\xf7\x6e\xfe\x11\x0f\x6e\xd9\xcc\x96\xc9\x31\xb6\
-\x44\x4f\xe9\x1c\x52\x14\x18\xe7\x70\xce\xd5\xc5\x42\xcd\xc9\x7e\
-\xda\x0b\x4d\x7e\xfa\x73\xf3\x5e\x63\x3d\x09\x77\xc0\xca\x7d\x59\
-\xd0\xd7\x82\xe8\x33\x47\xc0\xae\x9d\xff\x54\xa7\x43\x88\x21\x53\
-\x82\x2b\x55\x8a\x5f\x85\xcf\x06\x43\x61\x4d\x2d\xde\xe2\x7d\x49\
-\xd4\x88\xfa\x80\x6f\x77\x98\x2a\x3d\x03\x45\x83\x03\x07\x07\xd8\
-\x77\x64\x84\x23\xd7\x1d\xc2\xe1\x07\xae\xe1\xc8\x55\x6b\x58\xbb\
-\x74\x25\x43\x54\x65\x0e\x45\xb5\xa4\xcc\x92\x84\x22\x82\x34\x0c\
-\x2a\x92\x1d\x57\x56\xd7\xd5\xee\xfd\xa8\x71\xbb\xd2\x05\x4b\x4d\
-\x8f\x71\x9e\xaa\xe0\xdd\xdd\x6b\x7b\x1d\xc0\xa3\xd8\x34\xdc\x7b\
-\x55\x19\x9f\x09\x70\x83\xbc\x2a\x4d\x0e\x93\x13\xf8\x24\x15\xde\
-\x52\x96\x6a\xad\x4d\x70\x54\x55\x08\x25\xaa\x11\x67\x0c\x8b\xc4\
-\x71\xda\xfe\xab\x39\x73\xff\xd5\x6c\x3f\xed\x6c\xb6\xb6\xdb\x3c\
-\xbc\x6d\x1b\xd7\xdf\x74\x33\x37\x6d\xda\xc0\x4d\x1b\xee\xe7\x96\
-\xdb\x6e\x65\x2a\x78\x36\x6d\xdb\xc2\xb6\xc9\xc9\x34\xea\xda\x2c\
-\x90\xc2\x21\xd6\xa0\x6a\x70\x45\x0b\x63\x84\xe8\x15\xeb\x0a\x9c\
-\x58\x4a\xaf\xec\xb3\x78\x31\x05\x10\x43\xcc\x05\xc6\xb9\x15\x12\
-\x2b\xdb\x3e\xd5\xc6\xf8\x48\xab\x28\xe8\x64\x85\x24\x34\xe2\x7d\
-\x09\x28\xce\x7b\x98\x6a\x13\xbd\x27\x74\x4a\x46\x06\x07\x58\x3c\
-\x3a\x4a\xc3\x29\xeb\x8f\x38\x98\xd5\x2b\xf6\x63\xbf\x95\x2b\x39\
-\x69\xcd\x3a\xf6\x6f\xf6\xb3\xa0\xd1\x4c\x62\xac\x54\xc5\xc5\x00\
-\x40\xcc\x61\xbd\x58\xc5\x92\x08\x3c\x22\x4a\x24\xd6\xfc\x05\xb5\
-\xd8\xc6\xcc\xad\x3e\xff\xff\x8e\x12\xe9\x33\xa7\xb5\xf6\xda\x6c\
-\xb6\xd7\x01\x3c\x9a\xcd\x12\x4b\xce\xfa\x28\xa5\x75\x91\x81\x85\
-\xa9\x22\x96\xe6\xe7\x7b\xf6\x24\x5b\x91\x95\x14\x54\xe5\x2b\x43\
-\xca\x9f\x3b\x31\xd2\x67\x0c\x83\xcd\x26\xfb\x2e\x59\xc2\xb1\x4b\
-\x96\xa0\xc0\x56\x60\xc3\xb6\x2d\x4c\x86\x92\x2b\x6f\xfa\x01\x0f\
-\x6e\xdd\xc2\xa6\xa9\x09\x6e\xbc\xf3\x76\xee\x7a\xf0\x3e\x3a\xaa\
-\x4c\x04\xcf\xe6\x6d\x9b\x28\x43\xc4\xb8\x02\xdf\xf1\x38\xe3\x70\
-\x1b\xb7\xd0\xa7\x8a\x07\x8c\x38\x8c\x17\x92\x48\xc2\x74\xd3\x3c\
-\x39\x38\xad\x32\x1e\x92\xfa\xd2\xdd\x0f\x3e\xc0\xc4\xbd\x1b\x90\
-\x81\x26\xb1\x61\xc1\x40\xb3\xd9\x60\xb4\xbf\x1f\xeb\x3d\x8b\xfa\
-\x9a\xac\x59\xb5\x86\x43\x0f\x3a\x98\x01\xe7\x58\xbd\x6c\x05\x47\
-\xae\x5e\x4b\x7f\xa3\x60\xf1\xc0\x30\x83\xe9\xad\xd2\x79\xaa\x12\
-\x42\xa0\x54\xc5\x1a\x83\x15\x21\x4b\x3b\x25\x29\xf2\x14\xda\xe4\
-\x48\xab\x47\x22\x9e\x9e\x02\x65\x0f\x34\xe2\xb1\x8b\x78\x7b\x5b\
-\x7f\x73\xb1\xbd\x0e\x60\x77\xd9\x2e\x6d\x32\xdd\x22\x95\x88\x60\
-\x4c\x12\xe1\xd0\x10\x6a\x68\x90\x96\x9e\x51\x5b\x30\x3a\x34\x0a\
-\x02\x47\x9e\xfa\x34\x20\x0d\xe8\x6c\x8d\x91\xb1\x76\x87\x36\x81\
-\x89\xf6\x24\xb7\xde\x71\x07\x77\xde\x77\x1f\x93\x3e\xb0\x79\x7c\
-\x0c\x67\x1d\x53\x8f\x6c\xe4\xf0\x7d\xf7\xcb\xbd\x78\x9f\xda\x65\
-\xb3\xd1\xab\x4e\x5b\x48\x29\x85\x10\x49\xaa\x49\xfb\x8d\x8e\xf2\
-\xea\x0b\x9f\x8d\x0c\xf4\xe3\xfa\xfa\x68\x36\x1a\x1c\xb8\x62\x05\
-\x47\x1c\x74\x30\x43\xb6\xc0\x1a\xc3\x40\xab\xc5\x00\x09\x5a\x5d\
-\xc5\x18\x89\x99\x59\xf1\x31\x24\x99\x31\x6b\xd1\x3c\x74\x55\xc9\
-\x91\x4d\x73\x38\x75\x58\xb5\x77\xa7\x7e\xa2\x4d\x74\x6f\x43\xf4\
-\x09\xb5\xd9\x2e\xf7\xac\xbb\x59\x24\x09\x93\x88\xe9\x62\xdf\x55\
-\x11\x97\xa8\x4a\x4d\x35\xbe\xde\x13\xfa\x56\xff\x5b\xe6\x97\x00\
-\x0d\x22\x26\xe4\x1a\x80\x38\x1e\x6b\x91\xa9\x46\x54\x3b\x04\x11\
-\x90\xe9\x4c\xc2\x45\xfd\x4b\x24\x91\x60\x9b\x0a\x92\xa1\xec\xed\
-\x90\xe4\x9c\xdd\x64\x88\x50\xde\xd1\xeb\x8c\x7c\x6f\xfb\x6d\x8f\
-\xb2\xbd\x0e\x60\x0f\x35\x9f\xf3\x63\xa9\x00\x36\x79\x97\xb4\x08\
-\x31\xe6\xd1\x5c\x21\xe5\x1e\xb1\x4c\x40\x22\x63\xbb\xd3\x47\xd6\
-\x24\xe4\x42\x28\x31\xce\xa6\xfe\xbc\x69\xf0\xd8\xbb\xac\x02\x6d\
-\x42\xf0\x18\xdb\xa4\x0c\x8a\xaa\x60\xad\x43\x7c\xc0\x84\x04\xd3\
-\x25\xc6\x14\x55\x88\xc9\x23\xc8\x9a\x9d\x8c\x26\xd1\x91\x0a\xd9\
-\x28\x69\xf4\xd6\xec\x0d\xc9\xf7\x48\xdb\xeb\x00\xf6\x50\x2b\x35\
-\xe6\x11\xd8\x0c\x06\xca\x8d\xc8\x5e\x1a\x8c\x24\x94\x1a\x09\x69\
-\xa2\x3d\x61\x07\x48\x92\x55\x15\x66\x48\x35\x74\x3b\x18\xf2\xd8\
-\x48\xc0\xe4\x00\xf2\x00\x50\xd4\x3a\x4f\x4f\xeb\xdd\x02\x89\x2b\
-\x31\x45\x05\x26\x71\x07\x00\x41\x33\xf4\x37\x17\xf4\xba\xcc\x89\
-\xc9\x01\x14\x7b\x1d\xc0\x1e\x69\x7b\x1d\xc0\x1e\x6b\x8f\x41\xbd\
-\x99\x19\x71\x82\x44\x3a\xf5\xe8\x90\xd4\x7b\x6d\x2f\x59\x49\x85\
-\x63\x34\x73\xce\xb1\x43\xfe\x37\x33\xe5\xe4\xaf\x62\xfd\xea\xb2\
-\xe5\x4d\xaf\x2a\x74\x97\x7d\xef\x31\xc8\x34\x62\xb6\xbd\xb6\x27\
-\xd9\x5e\x07\xb0\xa7\x5a\xd4\x2e\xc4\x75\x66\x8d\x6c\xc6\x5a\x8a\
-\x3d\x20\xa5\x1a\xac\x94\x33\x81\x90\xa0\xf8\xb9\x1e\x30\x37\xab\
-\xb4\x76\x6a\x76\x9c\xea\x3d\xe9\x71\x49\x8f\xb2\x9e\xeb\xf6\x69\
-\x6f\x2b\x7e\x6f\x00\xb0\x47\xda\xde\x2e\xc0\x9e\x6a\x15\xc6\x35\
-\x9b\xf6\x14\xfa\xba\xd3\xf9\x60\x55\x30\x71\x96\xbf\xcd\x7f\xfe\
-\xd3\xac\xbd\x1a\x06\x31\x93\xc9\x67\xb6\x6d\x7e\x67\x7f\x5c\x79\
-\x92\xbd\xb6\x47\xda\x5e\x07\xb0\xa7\x9a\xc8\xac\x09\x40\x77\x64\
-\xa7\xc2\xd0\x75\xeb\x7e\x55\x15\xbe\x82\xcd\x42\x57\x59\x7d\x57\
-\x5a\x6c\x33\xd7\x6b\x3d\xbf\x9f\x21\x77\xa2\xba\xe3\xfb\x49\x8f\
-\xc3\xa8\xde\x64\x67\x28\xca\xbd\xb6\xc7\xd8\xde\x14\xe0\xc9\x64\
-\xba\xe3\x37\x54\xc0\x53\xa1\xe5\x52\xc6\x2f\xb9\x26\x30\x7d\x76\
-\x21\x67\xec\x73\x59\x8c\xd3\xe6\x1d\x62\x9a\x77\xa0\xf7\x7d\x64\
-\xda\x7c\x44\x9c\xf1\x9a\x89\xc7\xef\x3a\xa1\xbd\xb6\xa7\xd9\xff\
-\x0f\x09\x30\x2d\x24\xf3\xd1\xe4\xe6\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x08\
-\x05\xe2\x41\xff\
-\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x69\x00\x63\x00\x6f\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x7b\xd3\xc1\xd9\xb3\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -1,8 +1,5 @@
 # general
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
 from functools import partial
-import seaborn as sns
 import numpy as np
 import pandas as pd
 import datetime
@@ -13,25 +10,28 @@ import traceback
 import cv2
 # pyQT5
 from PyQt5.QtCore import Qt, pyqtSignal, QObject, QThread, QSize, QByteArray, QVariantAnimation, QAbstractAnimation
-from PyQt5.QtGui import QImage, QPixmap, QCursor, QMovie
+from PyQt5.QtGui import QImage, QPixmap, QCursor, QMovie, QIntValidator
 from PyQt5.QtWidgets import (QLabel, QRadioButton, QCheckBox, QHBoxLayout, QPushButton, QWidget, QSizePolicy,
                              QFormLayout, QLineEdit,
                              QComboBox, QProgressBar, QToolButton, QVBoxLayout, QListWidgetItem)
 # views
-from views.image_viewer import QImageViewer
+from views.image_viewer import QImageViewer, render_thumbnail
 from views.logger import Logger
 # utils
-from globals import PALETTE_OPS, PROG_COLOR_1, PROG_COLOR_2, REAL_COLOR, RAND_COLOR
+from globals import PALETTE_OPS, PROG_COLOR_1, PROG_COLOR_2, DEFAULT_SEED, ANALYSIS_PROGRESS, PAGE_VISIBLE_PRIORITY
 from typings import Unit, Workflow, DataObj, OutputOptions, WorkflowObj
-from typing import List, Tuple
-from utils import Progress, create_color_pal, enum_to_unit, to_coord_list, pixels_conversion
-from threads import AnalysisWorker, DownloadWorker
-from workflows.random_coords import gen_random_coordinates
-from workflows.clust import draw_clust
-from workflows.gold_rippler import draw_rippler
-from workflows.separation import draw_separation
-from workflows.goldstar import draw_goldstar
-from workflows.nnd import draw_length
+from typing import Callable, List, Tuple
+from utils import create_color_pal, enum_to_unit, to_coord_list, pixels_conversion, convert_value
+from threads import AnalysisWorker, DownloadWorker, GraphWorker, RunPool
+from annotations import AnnotationLayer
+from spatial import ParticleIndex
+from output import read_tiff_levels
+from pipeline import finalize_data, layer_drawers, workflow_inputs
+from analysis import AnalysisContext
+from cancel import CancelToken
+from progress import ProgressUpdate, fmt_eta
+from timing import RunTimings, activate, span
+from registry import get_plugin
 
 
 class WorkflowPage(QWidget):
@@ -56,12 +56,15 @@ class WorkflowPage(QWidget):
     @output_ops.output_scalar: multiplier ratio between pixels and desired output metric unit
     @output_ops.output_dir: the directory to create output data in
     @output_ops.delete_old: delete output data older than 5 runs
-    @pg: primary loading/progress bar ref
+    @pg: called with the fraction of the first run done (0..1), feeds the main progress bar
+    @use_cache: reuse results of identical earlier runs from the result cache
+    @timings: timings of loading the dataset, every run's timings start from them
     """
 
     def __init__(self, wf: WorkflowObj, coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]] = None,
                  output_ops: OutputOptions = None, img: str = "", mask: str = "", csv: str = "", csv2: str = "",
-                 pg: Progress = None, clust_area: bool = False, log: Logger = None):
+                 pg: Callable[[float], None] = None, clust_area: bool = False, log: Logger = None, use_cache: bool = True,
+                 ctx: AnalysisContext = None, token: CancelToken = None, timings: RunTimings = None):
         super().__init__()
         # init class vars: allow referencing within functions without passing explicitly
         self.is_init = False
@@ -70,7 +73,34 @@ class WorkflowPage(QWidget):
         self.pg = pg
         self.output_ops = output_ops
         self.draw_clust_area = clust_area
+        self.use_cache = use_cache
+        # intermediates shared with the other pages of this run
+        self.ctx = ctx
+        # analyses run in workers, a new run cancels the one in flight and only the newest generation is displayed
+        self.token = token
+        self.run_token: CancelToken = None
+        self.run_gen = 0
+        self.run_jobs = []
+        self.run_job = None
+        # stage timings of the current run, written next to its outputs
+        self.load_timings = timings
+        self.timings: RunTimings = None
         self.dlg = log
+        # base image is decoded once per page, annotations live on separate cached layers
+        self.base_img = None
+        self.base_rgb = None
+        self.base_qimg: QImage = None
+        self.base_level_arrays: List[np.ndarray] = []
+        self.base_levels: List[QImage] = []
+        self.layers = {}
+        self.visible_layers: List[AnnotationLayer] = []
+        self.particle_indexes = {}
+        # graph renders run in workers, only the newest generation is displayed
+        self.graph = None
+        self.graph_rgba = None
+        self.graph_gen = 0
+        self.graph_jobs = []
+        self.data_version = 0
         # init layout
         layout = QFormLayout()
         # header
@@ -177,9 +207,18 @@ class WorkflowPage(QWidget):
             "font-size: 16px; padding: 8px;  font-weight: 400; background: #ddd; border-radius: 7px;  margin-bottom: 5px; ")  # max-width: 200px;
         self.n_coord_ip.setPlaceholderText("default is # in real csv")
         layout.addRow(n_coord_lb, self.n_coord_ip)
+        # random coords seed
+        seed_lb = QLabel("random seed")
+        seed_lb.setStyleSheet("font-size: 17px; font-weight: 400;")
+        self.seed_ip = QLineEdit()
+        self.seed_ip.setStyleSheet(
+            "font-size: 16px; padding: 8px;  font-weight: 400; background: #ddd; border-radius: 7px;  margin-bottom: 5px; ")
+        self.seed_ip.setPlaceholderText(f"default is {DEFAULT_SEED}")
+        self.seed_ip.setValidator(QIntValidator())
+        layout.addRow(seed_lb, self.seed_ip)
         # set adv hidden by default
         self.theme_props = [pal_lb, self.pal_type, bars_lb, self.bars_ip, self.r_pal_type, r_pal_lb, n_coord_lb,
-                            self.n_coord_ip]
+                            self.n_coord_ip, seed_lb, self.seed_ip]
         for prop in self.theme_props:
             prop.setHidden(True)
         # output header
@@ -218,7 +257,8 @@ class WorkflowPage(QWidget):
         self.image_frame.setMaximumSize(400, 250)
         self.image_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.image_frame.setCursor(QCursor(Qt.PointingHandCursor))
-        self.image_frame.mouseDoubleClickEvent = lambda event: self.open_large(event, self.display_img)
+        self.image_frame.mouseDoubleClickEvent = lambda event: self.open_large(event, self.base_qimg, self.visible_layers, self.inspect_particle,
+                                                                          self.base_levels)
         # graph
         self.graph_frame = QLabel()
         self.graph_frame.setStyleSheet("padding-top: 3px; background: white;")
@@ -266,13 +306,18 @@ class WorkflowPage(QWidget):
         # assign layout
         self.setLayout(layout)
         # props to enable and disable when running wf
-        self.wf_props = [self.run_btn, self.image_frame, self.graph_frame, self.gen_rand_cb, self.gen_real_cb]
+        # (run stays enabled, running again supersedes the run in flight)
+        self.wf_props = [self.image_frame, self.graph_frame, self.gen_rand_cb, self.gen_real_cb]
         # run on init
         self.run(wf, coords, alt_coords)
 
-    def update_progress(self, value: int):
-        """ UPDATE PROGRESS BAR """
-        self.progress.setValue(value)
+    def update_progress(self, update: ProgressUpdate):
+        """ UPDATE PROGRESS BAR, SHOWING THE STAGE AND ETA WHILE RUNNING """
+        self.progress.setValue(update.percent)
+        if self.is_init is False and self.pg is not None:
+            self.pg(update.fraction)
+        text = f'{update.stage}  %p%' if update.stage else '%p%'
+        self.progress.setFormat(text + (f'  eta {fmt_eta(update.eta)}' if update.eta is not None else ''))
 
     def _animate_prog(self, value):
         if self.progress.value() < 100:
@@ -314,8 +359,9 @@ class WorkflowPage(QWidget):
         self.dl_worker = DownloadWorker()
         self.dl_worker.moveToThread(self.dl_thread)
         self.dl_thread.started.connect(
-            partial(self.dl_worker.run, wf, self.data, output_ops, self.img_drop.currentText(), self.display_img,
-                    self.graph))
+            partial(self.dl_worker.run, wf, self.data, output_ops, self.img_drop.currentText(), self.base_img,
+                    list(self.visible_layers), self.graph_rgba,
+                    {prop['title']: val for prop, val in zip(wf['props'], self.get_custom_values())}, self.timings))
         self.dl_worker.finished.connect(self.on_finish_download)
         self.dl_worker.finished.connect(self.dl_thread.quit)
         self.dl_worker.finished.connect(self.dl_worker.deleteLater)
@@ -330,8 +376,6 @@ class WorkflowPage(QWidget):
     def run(self, wf: WorkflowObj, coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]]):
         """ RUN WORKFLOW """
         try:
-            prog_wrapper = Progress()
-            prog_wrapper.prog.connect(self.update_progress)
             self.prog_animation.start()
 
             for prop in self.wf_props:
@@ -340,33 +384,74 @@ class WorkflowPage(QWidget):
             # set coords
             self.coords = coords
             self.alt_coords = alt_coords
-            self.rand_coords = gen_random_coordinates(img_path=self.img_drop.currentText(),
-                                                      mask_path=self.mask_drop.currentText(), count=int(
-                    self.n_coord_ip.text()) if self.n_coord_ip.text() else len(coords))
+            # random coords are generated (or restored from the result cache) by the worker
+            rand_count = int(self.n_coord_ip.text()) if self.n_coord_ip.text() else len(coords)
+            seed = int(self.seed_ip.text()) if self.seed_ip.text() else DEFAULT_SEED
             # obtain custom props
             vals = self.get_custom_values()
             logging.info('%s: running analysis, opening thread', wf['name'])
-            # generate thread
-            self.thread = QThread()
-            self.worker = AnalysisWorker()
-            self.worker.moveToThread(self.thread)
-            self.thread.started.connect(
-                partial(self.worker.run, wf, vals, coords, self.rand_coords, alt_coords, self.img_drop.currentText(),
-                        self.mask_drop.currentText(), self.draw_clust_area))
-            self.worker.progress.connect(self.update_progress)
-            self.worker.finished.connect(self.on_receive_data)
-            self.worker.finished.connect(self.thread.quit)
-            self.worker.finished.connect(self.worker.deleteLater)
-            self.thread.finished.connect(self.thread.deleteLater)
-            self.thread.start()
+            # supersede the run in flight, it stops at its next chunk boundary and its results are dropped
+            self.cancel()
+            self.run_gen += 1
+            self.run_token = CancelToken(parent=self.token)
+            self.timings = RunTimings(wf['name'], base=self.load_timings)
+            # queue on the shared pool, the worker stays in the gui thread and reports back through queued signals
+            worker = AnalysisWorker()
+            worker.progress.connect(self.update_progress)
+            worker.finished.connect(self.on_receive_data)
+            worker.finished.connect(worker.deleteLater)
+            # hold a reference until it is done so python does not collect it before its signals are delivered
+            self.run_jobs.append(worker)
+            worker.finished.connect(partial(self.run_jobs.remove, worker))
+            self.worker = worker
+            self.run_job = RunPool.instance().submit(
+                partial(worker.run, self.run_gen, wf, vals, coords, rand_count, alt_coords, self.img_drop.currentText(),
+                        self.mask_drop.currentText(), self.draw_clust_area, seed, self.use_cache, self.ctx,
+                        self.run_token, self.timings), owner=self, priority=self.priority())
         except Exception as e:
             self.handle_except(traceback.format_exc())
 
-    def on_receive_data(self, output_data: DataObj):
+    def priority(self) -> int:
+        """ POOL PRIORITY OF THIS PAGE'S JOBS, THE PAGE ON SCREEN GOES FIRST """
+        return PAGE_VISIBLE_PRIORITY if self.isVisible() else 0
+
+    def cancel(self):
+        """ CANCEL THE RUN IN FLIGHT (IF ANY), ITS PROGRESS AND RESULTS ARE IGNORED FROM NOW ON """
+        if self.run_token is not None:
+            self.run_token.cancel()
+            self.run_token = None
+            try:
+                self.worker.progress.disconnect(self.update_progress)
+            except (TypeError, RuntimeError):
+                # already finished and deleted
+                pass
+            # never started, it will not report back either
+            if RunPool.instance().discard(self.run_job) > 0:
+                self.run_jobs.remove(self.worker)
+                self.worker.deleteLater()
+
+    def on_receive_data(self, result: Tuple[int, DataObj]):
+        gen, output_data = result
+        if gen != self.run_gen:
+            logging.info('%s: dropping results of superseded run %d', self.wf['name'], gen)
+            return
+        self.run_token = None
+        if output_data is None:
+            # failed (already logged) or cancelled
+            self.progress.setFormat('%p%')
+            if self.is_init is False and self.pg is not None:
+                # nothing more to wait for on this page
+                self.pg(1.0)
+            for prop in self.wf_props:
+                prop.setEnabled(True)
+            return
         try:
             logging.info(
                 '%s: finished running analysis, closing thread', self.wf['name'])
             self.data = output_data
+            self.rand_coords = output_data.rand_coords
+            self.data_version += 1
+            self.update_progress(ProgressUpdate(ANALYSIS_PROGRESS, 'drawing'))
             # create ui scheme
             self.create_visuals(wf=self.wf, n_bins=(self.bars_ip.text() if self.bars_ip.text() else 'fd'),
                                 output_ops=self.output_ops)
@@ -376,10 +461,12 @@ class WorkflowPage(QWidget):
     def on_finish_visuals(self):
         try:
             self.progress.setValue(100)
+            self.progress.setFormat('%p%')
             for prop in self.wf_props:
                 prop.setEnabled(True)
             if self.is_init is False:
-                self.pg()
+                if self.pg is not None:
+                    self.pg(1.0)
                 self.is_init = True
                 self.prog_animation.stop()
                 # download files automatically
@@ -391,247 +478,136 @@ class WorkflowPage(QWidget):
 
     def create_visuals(self, wf: WorkflowObj, n_bins, output_ops: OutputOptions, n: List[int] = np.zeros(11)):
         """ CREATE DATA VISUALIZATIONS """
-        # plt.switch_backend('Agg') 
-        # TODO: potentially move some drawing functions to separate threads?
         try:
             if self.gen_real_cb.isChecked() or self.gen_rand_cb.isChecked() and len(self.coords) > 0:
                 logging.info('%s: generating visualizations', wf['name'])
-                plt.close('all')
-                graph_df = pd.DataFrame([])
-                cm = plt.cm.get_cmap("mako")
-                fig = plt.figure()
-                canvas = FigureCanvas(fig)
-                ax = fig.add_subplot(111)
-                # fix csv index not matching id
-                self.data.real_df1.sort_values(wf["graph"]["x_type"], inplace=True)
-                self.data.real_df1 = self.data.real_df1.reset_index(drop=True)
-                # logging.info('output_ops', output_ops)
-                self.data.final_real = pixels_conversion(
-                    data=self.data.real_df1, unit=Unit.PIXEL, scalar=float(output_ops.output_scalar))
-                if wf["graph"]["x_type"] in self.data.rand_df1.columns and len(
-                        self.data.rand_df1[wf["graph"]["x_type"]]) > 0:
-                    self.data.rand_df1.sort_values(wf["graph"]["x_type"], inplace=True)
-                    self.data.rand_df1 = self.data.rand_df1.reset_index(drop=True)
-                if not self.data.rand_df1.empty:
-                    self.data.final_rand = pixels_conversion(
-                        data=self.data.rand_df1, unit=Unit.PIXEL, scalar=float(output_ops.output_scalar))
-                # convert back to proper size
-                if wf["graph"]["type"] == "hist":
-                    # create histogram
-                    if self.gen_real_cb.isChecked() and not self.gen_rand_cb.isChecked():
-                        graph_df = self.data.final_real[wf["graph"]["x_type"]]
-                        cm = sns.color_palette(self.pal_type.currentText(), as_cmap=True)
-                        ax.set_title(f'{wf["graph"]["title"]} (Real)')
-                    elif self.gen_rand_cb.isChecked() and not self.gen_real_cb.isChecked():
-                        ax.set_title(f'{wf["graph"]["title"]} (Random)')
-                        cm = sns.color_palette(self.r_pal_type.currentText(), as_cmap=True)
-                        graph_df = self.data.final_rand[wf["graph"]["x_type"]]
-                    if self.gen_real_cb.isChecked() and not self.gen_rand_cb.isChecked() or self.gen_rand_cb.isChecked() and not self.gen_real_cb.isChecked():
-                        # draw graph
-                        n, bins, patches = ax.hist(graph_df, bins=(int(n_bins) if n_bins.isdecimal() else n_bins),
-                                                   color='green')
-                        # normalize values
-                        col = (n - n.min()) / (n.max() - n.min())
-                        for c, p in zip(col, patches):
-                            p.set_facecolor(cm(c))
-                    elif self.gen_real_cb.isChecked() and self.gen_rand_cb.isChecked():
-                        if wf["graph"]["x_type"] in self.data.rand_df1.columns and len(
-                                self.data.rand_df1[wf["graph"]["x_type"]]) > 0:
-                            rand_graph = self.data.final_rand[wf["graph"]["x_type"]]
-                        real_graph = self.data.final_real[wf["graph"]["x_type"]]
-                        ax.hist(rand_graph, bins=(int(n_bins) if n_bins.isdecimal() else n_bins), alpha=0.75,
-                                color=create_color_pal(n_bins=1, palette_type=self.r_pal_type.currentText()),
-                                label='Random')
-                        n, bins, patches = ax.hist(real_graph, bins=(int(n_bins) if n_bins.isdecimal() else n_bins),
-                                                   alpha=0.75, color=create_color_pal(n_bins=1, palette_type=self.pal_type.currentText()),
-                                                   label='Real')
-                        ax.set_title(f'{wf["graph"]["title"]} (Real & Random)')
-                        ax.legend(loc='upper right')
-                elif wf["graph"]["type"] == "line":
-                    # create line graph
-                    if self.gen_real_cb.isChecked():
-                        cm = sns.color_palette(self.pal_type.currentText(), as_cmap=True)
-                        ax.set_title(f'{wf["graph"]["title"]} (Real)')
-                        graph_df = self.data.final_real
-                    elif self.gen_rand_cb.isChecked():
-                        ax.set_title(f'{wf["graph"]["title"]} (Random)')
-                        cm = sns.color_palette(self.r_pal_type.currentText(), as_cmap=True)
-                        graph_df = self.data.final_rand
-                    ax.plot(graph_df[wf["graph"]["x_type"]], graph_df[wf["graph"]["y_type"]], color='blue')
-                elif wf["graph"]["type"] == "bar":
-                    # create bar graph
-                    if self.gen_real_cb.isChecked():
-                        c = 1
-                        ax.set_title(f'{wf["graph"]["title"]} (Real)')
-                        graph_y = self.data.final_real[wf["graph"]["y_type"]],
-                        graph_x = np.array(self.data.final_real[wf["graph"]["x_type"]])
-                        # logging.info(self.real_df[wf["graph"]["y_type"]], np.array(self.real_df[wf["graph"]["y_type"]]))
-                        if wf['type'] == Workflow.CLUST:
-                            graph_y = np.bincount(np.bincount(self.data.final_real[wf["graph"]["x_type"]]))[1:]
-                            graph_x = list(range(1, (len(graph_y) + 1)))
-                            c = len(graph_x)
-                        c = create_color_pal(n_bins=c, palette_type=self.pal_type.currentText())
-                        n = graph_x
-                    elif self.gen_rand_cb.isChecked():
-                        ax.set_title(f'{wf["graph"]["title"]} (Random)')
-                        c = 1
-                        graph_y = self.data.final_rand[wf["graph"]["y_type"]],
-                        graph_x = np.array(self.data.final_rand[wf["graph"]["x_type"]])
-                        if wf['type'] == Workflow.CLUST:
-                            graph_y = np.bincount(np.bincount(self.data.final_rand[wf["graph"]["x_type"]]))[1:]
-                            graph_x = list(range(1, (len(graph_y) + 1)))
-                            c = len(graph_x)
-                        c = create_color_pal(n_bins=c, palette_type=self.r_pal_type.currentText())
-                        n = graph_x
-                    if self.gen_real_cb.isChecked() and not self.gen_rand_cb.isChecked() or self.gen_rand_cb.isChecked() and not self.gen_real_cb.isChecked():
-                        if wf['type'] == Workflow.RIPPLER:
-                            ax.bar(graph_x, graph_y[0].values, width=(max(graph_x) / (len(graph_x) + 2)), color=c)
-                        else:
-                            bar_plot = ax.bar(graph_x, graph_y, color=c)
-                            for idx, rect in enumerate(bar_plot):
-                                height = rect.get_height()
-                                ax.text(rect.get_x() + rect.get_width() / 2., 1.05 * height,
-                                        graph_y[idx],
-                                        ha='center', va='bottom', rotation=0)
-                    elif self.gen_real_cb.isChecked() and self.gen_rand_cb.isChecked():
-                        if wf['type'] != Workflow.RIPPLER:
-                            real_graph_y = np.bincount(np.bincount(self.data.final_real[wf["graph"]["x_type"]]))[1:]
-                            real_graph_x = list(range(1, (len(set(real_graph_y))) + 1))
-                            rand_graph_y = np.bincount(np.bincount(self.data.final_rand[wf["graph"]["x_type"]]))[1:]
-                            rand_graph_x = list(range(1, (len(set(rand_graph_y))) + 1))
-                        if wf['type'] == Workflow.CLUST:
-                            real_graph_x = list(range(1, (len(real_graph_y) + 1)))
-                            rand_graph_x = list(range(1, (len(rand_graph_y) + 1)))
-                        if wf['type'] == Workflow.RIPPLER:
-                            rand_x = np.array(self.data.final_rand[wf["graph"]["x_type"]])
-                            shift_rand_x = (max(rand_x) / (len(rand_x) + 2)) / 4
-                            ax.bar([el - shift_rand_x for el in rand_x],
-                                   np.array(self.data.final_rand[wf["graph"]["y_type"]]),
-                                   width=(max(rand_x) / (len(rand_x) + 2)), alpha=0.7,
-                                   color=create_color_pal(n_bins=1, palette_type=self.r_pal_type.currentText()),
-                                   label='Random')
-                            real_x = np.array(self.data.final_real[wf["graph"]["x_type"]])
-                            shift_real_x = (max(real_x) / (len(real_x) + 2)) / 4
-                            ax.bar([el + shift_real_x for el in real_x],
-                                   np.array(self.data.final_real[wf["graph"]["y_type"]]),
-                                   width=(max(real_x) / (len(real_x) + 2)), alpha=0.7,
-                                   color=create_color_pal(n_bins=1, palette_type=self.pal_type.currentText()),
-                                   label='Real')
-                            ax.set_xlim(xmin=0, xmax=max(rand_x) * 1.3)
-                            n = rand_x
-                        else:
-                            ax.bar([el + 0.2 for el in real_graph_x], real_graph_y, 0.4,
-                                   color=create_color_pal(n_bins=len(real_graph_x),
-                                                          palette_type=self.pal_type.currentText()), alpha=0.7,
-                                   label='Real')
-                            ax.bar([el - 0.2 for el in rand_graph_x], rand_graph_y, 0.4,
-                                   color=create_color_pal(n_bins=len(rand_graph_x),
-                                                          palette_type=self.r_pal_type.currentText()), alpha=0.7,
-                                   label='Random')
-                            n = rand_graph_x
-                        ax.set_title(f'{wf["graph"]["title"]} (Real & Random)')
-                        ax.legend(loc='upper right')
+                with activate(self.timings), span('create_visuals'):
+                    finalize_data(wf, self.data, output_ops.output_scalar)
+                # render graph in a worker, stale renders (e.g. quick checkbox toggles) are dropped on arrival
+                self.graph_gen += 1
+                graph_worker = GraphWorker()
+                graph_worker.finished.connect(self.on_receive_graph)
+                graph_worker.finished.connect(graph_worker.deleteLater)
+                # hold a reference until it is done so python does not collect it before its signals are delivered
+                self.graph_jobs.append(graph_worker)
+                graph_worker.finished.connect(partial(self.graph_jobs.remove, graph_worker))
+                RunPool.instance().submit(
+                    partial(graph_worker.run, self.graph_gen, wf, self.data.final_real, self.data.final_rand,
+                            self.gen_real_cb.isChecked(), self.gen_rand_cb.isChecked(), self.pal_type.currentText(),
+                            self.r_pal_type.currentText(), n_bins, output_ops.output_unit, n, self.timings),
+                    owner=self, priority=self.priority())
+        except Exception as e:
+            self.handle_except(traceback.format_exc())
 
-                # label graph
-                ax.set_xlabel(f'{wf["graph"]["x_label"]} ({enum_to_unit(output_ops.output_unit)})')
-                ax.set_ylabel(wf["graph"]["y_label"])
-                ax.set_ylim(ymin=0)
-                logging.info('%s: generated graphs', wf['name'])
-                # generate palette
-                palette = create_color_pal(n_bins=int(len(n)), palette_type=self.pal_type.currentText())
-                r_palette = create_color_pal(n_bins=int(len(n)), palette_type=self.r_pal_type.currentText())
-                # draw on canvas
-                canvas.draw()
-                # determine shape of canvas
-                size = canvas.size()
-                width, height = size.width(), size.height()
-                # set graph to image of plotted hist
-                self.graph = QImage(canvas.buffer_rgba(), width, height, QImage.Format_ARGB32)
-                # load in image
-                drawn_img = cv2.imread(self.img_drop.currentText())
-                # display img
-                pixmap = QPixmap.fromImage(self.graph)
-                smaller_pixmap = pixmap.scaled(300, 250, Qt.KeepAspectRatio, Qt.FastTransformation)
-                self.graph_frame.setPixmap(smaller_pixmap)
-                logging.info('%s: generated graph', wf['name'])
-                # save image
-                # cv2.imwrite(f'{self.img_drop.currentText()}', self.graph)
-                # logging.info(f'{wf["name"]}: saved graph')
-                """ ADD NEW VISUALIZATIONS HERE """
-                if wf["type"] == Workflow.NND:
-                    # if real coords selected, annotate them on img with lines indicating length
-                    if self.gen_real_cb.isChecked():
-                        drawn_img = draw_length(nnd_df=self.data.real_df1, bin_counts=n, img=drawn_img, palette=palette,
-                                                circle_c=(103, 114, 0))
-                    # if rand coords selected, annotate them on img with lines indicating length
-                    if self.gen_rand_cb.isChecked():
-                        drawn_img = draw_length(nnd_df=self.data.rand_df1, bin_counts=n, img=drawn_img,
-                                                palette=r_palette, circle_c=(18, 156, 232))
-                elif wf["type"] == Workflow.CLUST:
-                    vals = self.get_custom_values()
-                    if self.gen_real_cb.isChecked():
-                        drawn_img = draw_clust(clust_df=self.data.real_df1, img=drawn_img, palette=palette,
-                                               distance_threshold=vals[0], draw_clust_area=self.draw_clust_area,
-                                               clust_area_color=REAL_COLOR)
-                    if self.gen_rand_cb.isChecked():
-                        drawn_img = draw_clust(clust_df=self.data.rand_df1, img=drawn_img, palette=r_palette,
-                                               distance_threshold=vals[0], draw_clust_area=self.draw_clust_area,
-                                               clust_area_color=RAND_COLOR)
-                elif wf["type"] == Workflow.SEPARATION:
-                    vals = self.get_custom_values()
-                    if self.gen_real_cb.isChecked():
-                        drawn_img = draw_separation(nnd_df=self.data.real_df1, clust_df=self.data.real_df2,
-                                                    img=drawn_img, palette=palette, bin_counts=n,
-                                                    circle_c=(103, 114, 0), distance_threshold=vals[0],
-                                                    draw_clust_area=self.draw_clust_area, clust_area_color=REAL_COLOR)
-                    if self.gen_rand_cb.isChecked():
-                        drawn_img = draw_separation(nnd_df=self.data.rand_df1, clust_df=self.data.rand_df2,
-                                                    img=drawn_img, palette=r_palette, bin_counts=n,
-                                                    circle_c=(18, 156, 232), distance_threshold=vals[0],
-                                                    draw_clust_area=self.draw_clust_area, clust_area_color=RAND_COLOR)
-                elif wf["type"] == Workflow.RIPPLER:
-                    vals = self.get_custom_values()
-                    if self.gen_real_cb.isChecked():
-                        drawn_img = draw_rippler(coords=self.coords, alt_coords=self.alt_coords,
-                                                 mask_path=self.mask_drop.currentText(), img=drawn_img, palette=palette,
-                                                 circle_c=(18, 156, 232), max_steps=vals[0], step_size=vals[1], initial_radius=vals[2])
-                    if self.gen_rand_cb.isChecked():
-                        drawn_img = draw_rippler(coords=self.rand_coords, alt_coords=self.alt_coords,
-                                                 mask_path=self.mask_drop.currentText(), img=drawn_img,
-                                                 palette=r_palette, circle_c=(103, 114, 0), max_steps=vals[0],
-                                                 step_size=vals[1], initial_radius=vals[2])
-                elif wf["type"] == Workflow.GOLDSTAR:
-                    # if real coords selected, annotate them on img with lines indicating length
-                    if self.gen_real_cb.isChecked():
-                        drawn_img = draw_goldstar(nnd_df=self.data.real_df1, bin_counts=n, img=drawn_img,
-                                                  palette=palette, circle_c=(103, 114, 0))
-                    # if rand coords selected, annotate them on img with lines indicating length
-                    if self.gen_rand_cb.isChecked():
-                        drawn_img = draw_goldstar(nnd_df=self.data.rand_df1, bin_counts=n, img=drawn_img,
-                                                  palette=r_palette, circle_c=(18, 156, 232))
-                # end graph display, set display img to annotated image
-                # https://stackoverflow.com/questions/33741920/convert-opencv-3-iplimage-to-pyqt5-qimage-qpixmap-in-python
-                height, width, bytesPerComponent = drawn_img.shape
-                bytesPerLine = 3 * width
-                cv2.cvtColor(drawn_img, cv2.COLOR_BGR2RGB, drawn_img)
-                self.display_img = QImage(drawn_img.data, width, height, bytesPerLine, QImage.Format_RGB888)
-                # resize to fit on gui
-                pixmap = QPixmap.fromImage(self.display_img)
-                smaller_pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.FastTransformation)
-                self.image_frame.setPixmap(smaller_pixmap)
-                logging.info('%s: finished generating visuals', wf['name'])
+    def on_receive_graph(self, result: Tuple[int, np.ndarray, np.ndarray]):
+        """ DISPLAY RENDERED GRAPH AND ANNOTATE IMAGE USING THE SAME BIN COUNTS """
+        gen, graph_img, n = result
+        if gen != self.graph_gen:
+            return
+        wf = self.wf
+        try:
+            if graph_img is None:
+                raise RuntimeError(f'{wf["name"]}: failed to render graph')
+            # generate palette, one color per graph bin
+            palette = create_color_pal(n_bins=int(len(n)), palette_type=self.pal_type.currentText())
+            r_palette = create_color_pal(n_bins=int(len(n)), palette_type=self.r_pal_type.currentText())
+            # set graph to image of plotted hist
+            height, width = graph_img.shape[:2]
+            self.graph = QImage(graph_img.data, width, height, 4 * width, QImage.Format_RGBA8888).copy()
+            self.graph_rgba = graph_img
+            # load in image
+            with activate(self.timings), span('load_image'):
+                self.load_base_img()
+            # display img
+            pixmap = QPixmap.fromImage(self.graph)
+            smaller_pixmap = pixmap.scaled(300, 250, Qt.KeepAspectRatio, Qt.FastTransformation)
+            self.graph_frame.setPixmap(smaller_pixmap)
+            # layers are only redrawn when something they depend on changed
+            real_key = (self.data_version, self.pal_type.currentText(), tuple(n), tuple(self.get_custom_values()), self.draw_clust_area)
+            rand_key = (self.data_version, self.r_pal_type.currentText(), tuple(n), tuple(self.get_custom_values()), self.draw_clust_area)
+            drawers = layer_drawers(wf, self.data, n, palette, r_palette, self.get_custom_values(), coords=self.coords,
+                                    rand_coords=self.rand_coords, alt_coords=self.alt_coords,
+                                    mask_path=self.mask_drop.currentText(), clust_area=self.draw_clust_area)
+            layers = []
+            with activate(self.timings), span('draw'):
+                if self.gen_real_cb.isChecked() and 'real' in drawers:
+                    layers.append(self.get_layer('real', real_key, drawers['real']))
+                if self.gen_rand_cb.isChecked() and 'rand' in drawers:
+                    layers.append(self.get_layer('rand', rand_key, drawers['rand']))
+            # end graph display, show base image with annotation layers painted over it
+            self.visible_layers = layers
+            self.image_frame.setPixmap(render_thumbnail(self.base_qimg, layers, 200, 200))
+            logging.info('%s: finished generating visuals', wf['name'])
 
-                self.on_finish_visuals()
+            self.on_finish_visuals()
         except Exception as e:
             self.error_gif = QMovie("./images/caterror.gif")
             self.image_frame.setMovie(self.error_gif)
             self.error_gif.start()
             self.handle_except(traceback.format_exc())
 
-    def open_large(self, event, img: QImage):
+    def load_base_img(self):
+        """ DECODE BASE IMAGE ONCE, KEEPING BOTH THE BGR ARRAY AND AN RGB QIMAGE VIEW OF IT """
+        if self.base_img is None:
+            self.base_img = cv2.imread(self.img_drop.currentText())
+            # https://stackoverflow.com/questions/33741920/convert-opencv-3-iplimage-to-pyqt5-qimage-qpixmap-in-python
+            height, width, bytesPerComponent = self.base_img.shape
+            self.base_rgb = cv2.cvtColor(self.base_img, cv2.COLOR_BGR2RGB)
+            self.base_qimg = QImage(self.base_rgb.data, width, height, 3 * width, QImage.Format_RGB888)
+            # pyramidal tiffs (e.g. a previous drawn export) already carry the viewer's lower resolution levels
+            self.base_level_arrays = read_tiff_levels(self.img_drop.currentText()) or []
+            self.base_levels = [QImage(lvl.data, lvl.shape[1], lvl.shape[0], 3 * lvl.shape[1], QImage.Format_RGB888)
+                                for lvl in self.base_level_arrays]
+
+    def get_layer(self, kind: str, key: tuple, draw: partial) -> AnnotationLayer:
+        """ REUSE CACHED ANNOTATION LAYER UNLESS THE DATA, PALETTE, BINS OR PARAMS IT WAS DRAWN WITH CHANGED """
+        cached = self.layers.get(kind)
+        if cached is None or cached[0] != key:
+            cached = (key, draw(layer=AnnotationLayer(self.base_img.shape)))
+            self.layers[kind] = cached
+        return cached[1]
+
+    def get_particle_index(self, kind: str) -> ParticleIndex:
+        """ BUILD (ONCE PER RUN) THE HOVER/CLICK LOOKUP INDEX FOR THE REAL OR RANDOM POPULATION """
+        cached = self.particle_indexes.get(kind)
+        if cached is None or cached[0] != self.data_version:
+            inputs = workflow_inputs(self.coords, self.rand_coords, self.alt_coords,
+                                     mask_path=self.mask_drop.currentText(), clust_area=self.draw_clust_area)
+            table = get_plugin(self.wf['type']).table(kind, self.data, self.get_custom_values(), inputs)
+            cached = (self.data_version, ParticleIndex(table))
+            self.particle_indexes[kind] = cached
+        return cached[1]
+
+    def inspect_particle(self, x: float, y: float, max_dist: float):
+        """ DESCRIBE THE SHOWN PARTICLE CLOSEST TO (x, y), FOR THE IMAGE VIEWER """
+        try:
+            best = None
+            for kind, cb in (('real', self.gen_real_cb), ('rand', self.gen_rand_cb)):
+                if cb.isChecked():
+                    index = self.get_particle_index(kind)
+                    found = index.nearest(x, y, max_dist)
+                    if found is not None and (best is None or found[1] < best[2]):
+                        best = (kind, index, found[1], found[0])
+            if best is None:
+                return None
+            kind, index, dist, pos = best
+            table = index.table
+            scalar = float(self.output_ops.output_scalar)
+            # read column by column so ints stay ints (a mixed-dtype row would upcast everything to float)
+            desc = ', '.join(f'{col}: {convert_value(col, table[col].iat[pos], scalar)}' for col in table.columns
+                             if col not in ('X', 'Y'))
+            label = 'real' if kind == 'real' else 'random'
+            return (table['X'].iat[pos], table['Y'].iat[pos]), \
+                f"{self.wf['name']} {label} #{table.index[pos]} ({enum_to_unit(self.output_ops.output_unit)}) - {desc}"
+        except Exception as e:
+            logging.error(traceback.format_exc())
+            return None
+
+    def open_large(self, event, img: QImage, layers: List[AnnotationLayer] = None, inspector=None,
+                   levels: List[QImage] = None):
         """ OPEN IMAGE IN VIEWER """
         try:
-            self.image_viewer = QImageViewer(img)
+            self.image_viewer = QImageViewer(img, layers, inspector, levels)
             self.image_viewer.show()
         except Exception as e:
             self.handle_except(traceback.format_exc())
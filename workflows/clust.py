@@ -1,20 +1,25 @@
 import logging
 import pandas as pd
-from sklearn.cluster import AgglomerativeClustering
 import numpy as np
 import cv2
-from utils import create_color_pal, to_df
-from PyQt5.QtCore import pyqtSignal
+from utils import create_color_pal
 from PyQt5.QtGui import QImage, QColor
 from typing import List, Tuple
-from globals import REAL_COLOR
+from globals import REAL_COLOR, RAND_COLOR
+from annotations import AnnotationLayer
+from functools import partial
+from typings import Workflow, WorkflowPlugin, DataObj
+from analysis import AnalysisContext
+from progress import ProgressReporter
+from timing import timed
 
 
-def run_clust(pb: pyqtSignal, real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], img_path: str, distance_threshold: int = 27, affinity: str = 'euclidean', linkage: str = 'single', clust_area: bool = False):
+@timed()
+def run_clust(pb: ProgressReporter, real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], img_path: str, distance_threshold: int = 27, affinity: str = 'euclidean', linkage: str = 'single', clust_area: bool = False, ctx: AnalysisContext = None, tiled: bool = False):
     """
     HIERARCHICAL CLUSTERING
     _______________________________
-    @pb: progress bar wrapper element, allows us to track how much time is left in process
+    @pb: progress reporter, stages and fraction done
     @distance_threshold: using a distance threshold to automatically cluster particles
     @affinity: metric used to calc linkage
     @linkage: linkage criteria to use - determines which distance to use between sets of observation
@@ -24,73 +29,99 @@ def run_clust(pb: pyqtSignal, real_coords: List[Tuple[float, float]], rand_coord
         @maximum: linkage uses the maximum distances between all observations of the two sets
     @real_coords: the real coordinates
     @rand_coords: list of randomly generated coordinates
+    @ctx: shared analysis intermediates, cluster labels are shared with SEPARATION
+    @tiled: measure cluster areas on a canvas cropped around each cluster instead of a full image sized one, same areas
     """
+    ctx = ctx if ctx is not None else AnalysisContext(real_coords, img_path=img_path, rand_coords=rand_coords)
     logging.info("clustering")
-    pb.emit(10)
-    # handle ugly pyqt5 props
-    n_clusters = None
-    # cluster
-    hc = AgglomerativeClustering(n_clusters=n_clusters, distance_threshold=distance_threshold*2, affinity=affinity, linkage=linkage)
-    cluster = hc.fit_predict(real_coords)
-
-    df = to_df(real_coords)
-    df['cluster_id'] = cluster
+    pb.stage('clustering real', 0.1)
+    # cluster (copies, the labels are shared)
+    df = ctx.get('cluster_labels', 'real', distance_threshold, affinity, linkage).copy()
     # random coords
-    pb.emit(30)
-    rand_coordinates = np.array(rand_coords)
-    rand_coordinates = np.flip(rand_coordinates, 1)
-    rand_cluster = hc.fit_predict(rand_coordinates)
-    rand_df = pd.DataFrame(rand_coordinates, columns=["X", "Y"])
-    rand_df['cluster_id'] = rand_cluster
-    pb.emit(50)
+    pb.stage('clustering random', 0.3)
+    rand_df = ctx.get('cluster_labels', 'rand', distance_threshold, affinity, linkage).copy()
+    pb.update(0.5)
     clust_details_dfs = []
     if clust_area:
-        # create copy of og image
-        img_og = cv2.imread(img_path)
-        lower_bound = np.array([0, 250, 0])
-        upper_bound = np.array([40, 255, 40])
+        img_shape = ctx.get('image_shape')
+        area_of = cluster_area_tiled if tiled else cluster_area
         # iterate through clusters and find cluster area
-        prog_e = 0
+        pb.stage('cluster areas')
+        done, total = 0, len(set(df['cluster_id'])) + len(set(rand_df['cluster_id']))
         for data in [df, rand_df]:
             clust_objs = []
             unique_ids = set(data['cluster_id'])
             for _id in unique_ids:
-                prog_e += 20 / len(unique_ids)
-                pb.emit(50 + prog_e)
+                ctx.check()
+                done += 1
+                pb.advance(done, total, 0.5, 0.9)
                 count = np.count_nonzero(np.array(data['cluster_id']) == _id)
-                clust_obj = [_id, count, 0]  # id, size, area
-                # create new blank image to perform calculations on
-                new_img = np.zeros(img_og.shape, dtype=np.uint8)
-                new_img.fill(255)
-                # for each coordinate in cluster, draw circle and find contours to determine cluster area
-                for index, row in data[data['cluster_id'] == _id].iterrows():
-                    particle = tuple(int(x) for x in [row['X'], row['Y']])
-                    new_img = cv2.circle(new_img, particle, radius=distance_threshold, color=(0, 255, 0), thickness=-1)  # thickness =  -1 for filled circle
-                img_mask = cv2.inRange(new_img, lower_bound, upper_bound)
-                clust_cnts, clust_hierarchy = cv2.findContours(
-                    img_mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
-                for cnt in clust_cnts:
-                    area = cv2.contourArea(cnt)
-                    clust_obj[2] += area
-                clust_objs.append(clust_obj)
+                particles = [tuple(int(x) for x in [row['X'], row['Y']])
+                             for index, row in data[data['cluster_id'] == _id].iterrows()]
+                clust_objs.append([_id, count, area_of(particles, img_shape, distance_threshold)])  # id, size, area
             new_df = pd.DataFrame(clust_objs, columns=["cluster_id", "cluster_size", "cluster_area"])
             new_df = new_df.reset_index(drop=True)
             clust_details_dfs.append(new_df)
     else: 
         emp_df = pd.DataFrame()
         clust_details_dfs = [emp_df, emp_df]
-    pb.emit(90)
+    pb.update(1.0)
     return df, rand_df, clust_details_dfs[0], clust_details_dfs[1]
 
 
-def draw_clust(clust_df: pd.DataFrame, img: List, palette: str = "rocket_r", distance_threshold: int = 27, draw_clust_area: bool = False, clust_area_color: Tuple[int, int, int] = REAL_COLOR):
+def cluster_area(particles: List[Tuple[int, int]], img_shape: Tuple[int, ...], radius: int) -> float:
+    """
+    AREA COVERED BY A CLUSTER
+    _______________________________
+    @particles: (x, y) of the cluster's particles
+    @img_shape: shape of the image, the canvas circles are drawn on
+    @radius: circle drawn around every particle
+    """
+    lower_bound = np.array([0, 250, 0])
+    upper_bound = np.array([40, 255, 40])
+    # create new blank image to perform calculations on
+    new_img = np.zeros(img_shape, dtype=np.uint8)
+    new_img.fill(255)
+    # for each coordinate in cluster, draw circle and find contours to determine cluster area
+    for particle in particles:
+        new_img = cv2.circle(new_img, particle, radius=radius, color=(0, 255, 0), thickness=-1)  # thickness =  -1 for filled circle
+    img_mask = cv2.inRange(new_img, lower_bound, upper_bound)
+    clust_cnts, clust_hierarchy = cv2.findContours(
+        img_mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
+    area = 0
+    for cnt in clust_cnts:
+        area += cv2.contourArea(cnt)
+    return area
+
+
+def cluster_area_tiled(particles: List[Tuple[int, int]], img_shape: Tuple[int, ...], radius: int) -> float:
+    """ cluster_area ON A SINGLE CHANNEL CANVAS CROPPED TO THE CLUSTER (CLIPPED TO THE IMAGE), EXACTLY THE SAME AREA """
+    pts = np.array(particles, dtype=np.int64).reshape(-1, 2)
+    # one blank pixel around the circles, so contours only touch the canvas edge where they touch the image's
+    x0, y0 = np.maximum(pts.min(axis=0) - radius - 1, 0)
+    x1 = min(pts[:, 0].max() + radius + 2, img_shape[1])
+    y1 = min(pts[:, 1].max() + radius + 2, img_shape[0])
+    if x1 <= x0 or y1 <= y0:
+        return 0
+    canvas = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    for x, y in pts:
+        cv2.circle(canvas, (int(x - x0), int(y - y0)), radius=radius, color=255, thickness=-1)
+    clust_cnts, clust_hierarchy = cv2.findContours(canvas, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
+    area = 0
+    for cnt in clust_cnts:
+        area += cv2.contourArea(cnt)
+    return area
+
+
+@timed()
+def draw_clust(clust_df: pd.DataFrame, layer: AnnotationLayer, palette: str = "rocket_r", distance_threshold: int = 27, draw_clust_area: bool = False, clust_area_color: Tuple[int, int, int] = REAL_COLOR):
     def sea_to_rgb(color):
         color = [val * 255 for val in color]
         return color
 
     if draw_clust_area:
-        new_img = np.zeros(img.shape, dtype=np.uint8)
-        new_img.fill(255)
+        # single channel, circles are the only thing drawn on it
+        clust_mask = np.zeros(layer.shape[:2], dtype=np.uint8)
 
     # make color pal
     palette = create_color_pal(n_bins=len(set(clust_df['cluster_id'])), palette_type=palette)
@@ -98,18 +129,15 @@ def draw_clust(clust_df: pd.DataFrame, img: List, palette: str = "rocket_r", dis
     for idx, entry in clust_df.iterrows():
         particle = tuple(int(x) for x in [entry['X'], entry['Y']])
         # TODO: remove int from this next line if able to stop from converting to float
-        img = cv2.circle(img, particle, 10, sea_to_rgb(palette[int(clust_df['cluster_id'][idx])]), -1)
+        layer.circle(particle, 10, sea_to_rgb(palette[int(clust_df['cluster_id'][idx])]), -1)
         if draw_clust_area:
-            new_img = cv2.circle(new_img, particle, radius=distance_threshold, color=(0, 255, 0), thickness=-1)
+            cv2.circle(clust_mask, particle, radius=distance_threshold, color=255, thickness=-1)
     # find centroids in df w/ clusters
     if draw_clust_area:
-        lower_bound = np.array([0, 250, 0])
-        upper_bound = np.array([40, 255, 40])
-        clust_mask = cv2.inRange(new_img, lower_bound, upper_bound)
         clust_cnts, clust_hierarchy = cv2.findContours(clust_mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
-        img = cv2.drawContours(img, clust_cnts, -1, clust_area_color, 3)
+        layer.contours(clust_cnts, clust_area_color, 3)
 
-    def draw_clust_id_at_centroids(image, cl_df):
+    def draw_clust_id_at_centroids(lyr, cl_df):
         for c_id in set(cl_df['cluster_id']):
             cl = cl_df.loc[cl_df['cluster_id'] == c_id]
             n, x, y = 0, 0, 0
@@ -120,6 +148,62 @@ def draw_clust(clust_df: pd.DataFrame, img: List, palette: str = "rocket_r", dis
             if n > 0:
                 x /= n
                 y /= n
-                cv2.putText(image, str(int(c_id)), org=(int(x), int(y)), fontFace=cv2.FONT_HERSHEY_SIMPLEX, color=(255, 255, 255), fontScale=1)
-    draw_clust_id_at_centroids(img, clust_df)
-    return img
+                lyr.text(str(int(c_id)), org=(int(x), int(y)), color=(255, 255, 255), font_scale=1)
+    draw_clust_id_at_centroids(layer, clust_df)
+    return layer
+
+
+def inspect_clust(clust_df: pd.DataFrame, details_df: pd.DataFrame = None) -> pd.DataFrame:
+    """ ONE ROW PER PARTICLE WITH ITS CLUSTER ID, CLUSTER SIZE AND (IF COMPUTED) CLUSTER AREA """
+    table = clust_df[['X', 'Y', 'cluster_id']].copy()
+    table['cluster_size'] = table.groupby('cluster_id')['cluster_id'].transform('size')
+    if details_df is not None and not details_df.empty:
+        table = table.join(details_df.set_index('cluster_id')['cluster_area'], on='cluster_id')
+    return table
+
+
+def clust_layers(data: DataObj, n: List[int], palette: List[Tuple[int, int, int]], r_palette: List[Tuple[int, int, int]], vals: List[int], inputs: dict):
+    """ REAL AND RANDOM CLUSTER ANNOTATIONS """
+    return {'real': partial(draw_clust, clust_df=data.real_df1, palette=palette, distance_threshold=vals[0],
+                            draw_clust_area=inputs['clust_area'], clust_area_color=REAL_COLOR),
+            'rand': partial(draw_clust, clust_df=data.rand_df1, palette=r_palette, distance_threshold=vals[0],
+                            draw_clust_area=inputs['clust_area'], clust_area_color=RAND_COLOR)}
+
+
+def clust_table(kind: str, data: DataObj, vals: List[int], inputs: dict) -> pd.DataFrame:
+    return inspect_clust(data.real_df1, data.real_df2) if kind == 'real' else inspect_clust(data.rand_df1, data.rand_df2)
+
+
+""" WORKFLOW PLUGIN """
+WORKFLOW = WorkflowPlugin(
+    meta={
+        "name": "CLUST",
+        "type": Workflow.CLUST,
+        "header": "Hierarchical Clustering of Particles",
+        "desc": "Cluster gold particles into groups. Optionally generate random coordinates.",
+        "checked": True,
+        "graph": {
+            "type": "bar",
+            "title": "Hierarchical Clustering of Particles",
+            "x_label": "Number of Particles In Cluster",
+            "y_label": "Number of Clusters",
+            "x_type": "cluster_id",
+            "y_type": "cluster_id",
+            "x_mode": "sizes"
+        },
+        "props": [
+            {
+                "title": "distance threshold (px)",
+                "placeholder": "27"
+            }
+        ]
+    },
+    run=run_clust,
+    inputs={'real_coords': 'coords', 'rand_coords': 'rand_coords', 'img_path': 'img_path', 'clust_area': 'clust_area',
+            'ctx': 'ctx'},
+    needs=['cluster_labels', 'image_shape'],
+    props=['distance_threshold'],
+    outputs=['real_df1', 'rand_df1', 'real_df2', 'rand_df2'],
+    engines={'tiled': partial(run_clust, tiled=True)},
+    layers=clust_layers,
+    table=clust_table)
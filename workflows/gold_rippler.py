@@ -2,9 +2,14 @@ import logging
 import pandas as pd
 import numpy as np
 import cv2
-from PyQt5.QtCore import pyqtSignal
 from typing import List, Tuple
 from utils import create_color_pal
+from annotations import AnnotationLayer
+from functools import partial
+from typings import Workflow, WorkflowPlugin, DataObj
+from analysis import AnalysisContext
+from progress import ProgressReporter
+from timing import timed
 
 COLORS = [(128, 0, 0),
               (139, 0, 0),
@@ -19,7 +24,8 @@ COLORS = [(128, 0, 0),
               (233, 150, 122)]
 
 
-def run_rippler(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], img_path: str, mask_path: str, pb: pyqtSignal, max_steps: int = 10, step_size: int = 60, initial_radius: int = 50):
+@timed()
+def run_rippler(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], img_path: str, mask_path: str, pb: ProgressReporter, max_steps: int = 10, step_size: int = 60, initial_radius: int = 50, ctx: AnalysisContext = None, tiled: bool = False):
     """
     GOLD RIPPLER (LCPI)
     _______________________________
@@ -28,111 +34,108 @@ def run_rippler(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[
     @alt_coords: 2nd csv coordinates being measured against scaled to whatever format desired
     @img_path: path to img
     @mask_path: path to p-face mask
-    @pb: progress bar wrapper element, allows us to track how much time is left in process
+    @pb: progress reporter, stages and fraction done
     @max_steps: maximum number of steps
     @initial_radius: initial radius of ripples
+    @ctx: shared analysis intermediates, the p-face mask and its area come from it
+    @tiled: draw ripples on a canvas cropped around the largest ones (reused for every radius) instead of a new full
+        image sized one per radius, same results
     """
+    ctx = ctx if ctx is not None else AnalysisContext(real_coords, alt_coords, img_path, mask_path, rand_coords=rand_coords)
     logging.info("running gold rippler (LCPI)")
     # find LCPI (Landmark correlated particle intensity)
-    img_og = cv2.imread(img_path)
-    img_pface = cv2.imread(mask_path)
-    # convert to grayscale
-    img_pface2 = cv2.cvtColor(img_pface, cv2.COLOR_BGR2GRAY)
-    # convert to binary
-    ret, binary = cv2.threshold(img_pface2, 100, 255, cv2.THRESH_OTSU)
-    pface_mask = ~binary
+    pb.stage('p-face mask', 0.05)
+    pface_mask = ctx.get('pface_mask', False)
     # find pface area
-    pface_cnts, pface_hierarchy = cv2.findContours(
-        pface_mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
-    pface_cnts2, pface_hierarchy2 = cv2.findContours(
-        pface_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)[-2:]
-    pface_area_external, pface_area_tree = 0, 0
-    for cnt in pface_cnts2:
-        area = cv2.contourArea(cnt)
-        pface_area_external += area
-    for cnt in pface_cnts:
-        area = cv2.contourArea(cnt)
-        pface_area_tree += area
-    difference = (pface_area_tree - pface_area_external)
-    pface_area = pface_area_external - difference
-    original_copy = img_og.copy()
-    pb.emit(30)
-    step = 0
-    rippler_out = []
-    for coord_list in [real_coords, rand_coords]:
-        LCPI, radius, gp_captured, img_covered, total_gp = [[] for _ in range(5)]
-        rad = initial_radius
-        max = (max_steps * step_size) + rad
-        while rad <= max:
-            total_captured_particles = 0
+    pface_area = ctx.get('pface_area')
+    pb.stage('ripples', 0.3)
+    populations = [real_coords, rand_coords]
+    LCPI, radius, gp_captured, img_covered, total_gp = [[[] for _ in populations] for _ in range(5)]
+    rad = initial_radius
+    max = (max_steps * step_size) + rad
+    # canvas offset (row, col), the full mask unless tiled
+    r0, c0 = 0, 0
+    if tiled:
+        r0, c0, r1, c1 = ripple_bounds(alt_coords, max, pface_mask.shape)
+        pface_mask = np.ascontiguousarray(pface_mask[r0:r1, c0:c1])
+        scale_mask = np.zeros(pface_mask.shape, np.uint8)
+        mask_combined = np.zeros(pface_mask.shape, np.uint8)
+    # ripples only depend on the landmarks, draw and measure each radius once for both populations
+    while rad <= max:
+        ctx.check()
+        if tiled:
+            scale_mask.fill(0)
+        else:
             scale_mask = np.zeros(pface_mask.shape, np.uint8)
-            color_step = step % 11
-            # draw ripples
-            # print("alt coords in rip", alt_coords)
-            for s in alt_coords:
-                x, y = int(s[0]), int(s[1])
-                cv2.circle(scale_mask, (y, x), rad, 255, -1)
-                cv2.circle(original_copy, (y, x), rad, COLORS[color_step], 5)
-            step += 1
+        # draw ripples
+        for s in alt_coords:
+            x, y = int(s[0]), int(s[1])
+            cv2.circle(scale_mask, (y - c0, x - r0), rad, 255, -1)
+        # find spine contour area and pface contour area
+        if tiled:
+            cv2.bitwise_and(scale_mask, pface_mask, dst=mask_combined)
+        else:
+            mask_combined = cv2.bitwise_and(scale_mask, pface_mask)
+        mask_cnts, mask_hierarchy = cv2.findContours(
+            mask_combined, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
+        mask_cnts2, mask_hierarchy2 = cv2.findContours(
+            mask_combined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)[-2:]
+        # find scale area
+        scale_area_external = 0
+        scale_area_tree = 0
+        # find cts
+        for cnt in mask_cnts2:
+            area = cv2.contourArea(cnt)
+            scale_area_external += area
+        for cnt in mask_cnts:
+            area = cv2.contourArea(cnt)
+            scale_area_tree += area
+        # find stats
+        difference = (scale_area_tree - scale_area_external)
+        scale_area = scale_area_external - difference
+        percent_area = scale_area / pface_area
+        for i, coord_list in enumerate(populations):
+            total_captured_particles = 0
             for c in coord_list:
                 x, y = int(c[0]), int(c[1])
-                if rad == max:
-                    if scale_mask[x, y] != 0:
-                        cv2.circle(original_copy, (y, x), 8, (0, 0, 255), -1)
-                        total_captured_particles += 1
-                        # print('was in mask')
-                    else:
-                        cv2.circle(original_copy, (y, x), 8, (255, 0, 255), -1)
-                        # print('nope')
-                else:
-                    if scale_mask[x, y] != 0:
-                        total_captured_particles += 1
-                        cv2.circle(original_copy, (y, x), 8, (0, 0, 255), -1)
-                        # print('was in mask but not max')
+                if tiled and not (0 <= x - r0 < scale_mask.shape[0] and 0 <= y - c0 < scale_mask.shape[1]):
+                    # off the canvas, no ripple reaches it
+                    continue
+                if scale_mask[x - r0, y - c0] != 0:
+                    total_captured_particles += 1
             gp_in_spine = total_captured_particles / len(coord_list)
-            # find spine contour area and pface contour area
-            mask_combined = cv2.bitwise_and(scale_mask, pface_mask.copy())
-            mask_cnts, mask_hierarchy = cv2.findContours(
-                mask_combined, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
-            mask_cnts2, mask_hierarchy2 = cv2.findContours(
-                mask_combined, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)[-2:]
-            # find scale area
-            scale_area_external = 0
-            scale_area_tree = 0
-            # find cts
-            for cnt in mask_cnts2:
-                area = cv2.contourArea(cnt)
-                scale_area_external += area
-            for cnt in mask_cnts:
-                area = cv2.contourArea(cnt)
-                scale_area_tree += area
-            # find stats
-            difference = (scale_area_tree - scale_area_external)
-            scale_area = scale_area_external - difference
-            percent_area = scale_area / pface_area
             # calculate LCPI
-            # print("lcpi", gp_in_spine, percent_area, gp_in_spine / percent_area )
             scaled_LCPI = 0.0
             if percent_area > 0.01:
                 scaled_LCPI = gp_in_spine / percent_area
-            LCPI.append(scaled_LCPI)
-            radius.append(rad)
-            gp_captured.append(gp_in_spine)
-            img_covered.append(percent_area)
-            total_gp.append(len(coord_list))
-            rad += step_size
-            pb.emit(rad)
-        # generate new df and return
-        new_df = pd.DataFrame(data={'radius': radius, '%_gp_captured': gp_captured, '%_img_covered': img_covered, 'LCPI': LCPI, 'total_gp': total_gp})
-        rippler_out.append(new_df)
-    return rippler_out
+            LCPI[i].append(scaled_LCPI)
+            radius[i].append(rad)
+            gp_captured[i].append(gp_in_spine)
+            img_covered[i].append(percent_area)
+            total_gp[i].append(len(coord_list))
+        rad += step_size
+        pb.advance(len(radius[0]), max_steps + 1, 0.3, 1.0)
+    # generate new dfs and return
+    return [pd.DataFrame(data={'radius': radius[i], '%_gp_captured': gp_captured[i], '%_img_covered': img_covered[i],
+                               'LCPI': LCPI[i], 'total_gp': total_gp[i]}) for i in range(len(populations))]
+
+
+def ripple_bounds(alt_coords: List[Tuple[float, float]], radius: int, shape: Tuple[int, ...]) -> Tuple[int, int, int, int]:
+    """ (ROW0, COL0, ROW1, COL1) CROP OF shape HOLDING EVERY RIPPLE UP TO radius PLUS A BLANK PIXEL AROUND THEM """
+    if len(alt_coords) == 0:
+        return 0, 0, 1, 1
+    pts = np.array([[int(s[0]), int(s[1])] for s in alt_coords], dtype=np.int64)
+    r0, c0 = np.maximum(pts.min(axis=0) - radius - 1, 0)
+    r1 = min(pts[:, 0].max() + radius + 2, shape[0])
+    c1 = min(pts[:, 1].max() + radius + 2, shape[1])
+    return int(r0), int(c0), max(int(r1), int(r0) + 1), max(int(c1), int(c0) + 1)
 
 
-def draw_rippler(coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], img: List, mask_path: str, palette: str = "rocket_r", max_steps: int = 10, step_size: int = 60, circle_c: Tuple[int, int, int] = (0, 0, 255), initial_radius: int = 50):
+@timed()
+def draw_rippler(coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], layer: AnnotationLayer, mask_path: str, palette: str = "rocket_r", max_steps: int = 10, step_size: int = 60, circle_c: Tuple[int, int, int] = (0, 0, 255), initial_radius: int = 50):
     def sea_to_rgb(color):
         color = [val * 255 for val in color]
         return color
-    output_img = img.copy()
     rad, step = initial_radius, 0
     max = (max_steps * step_size) + rad
     pal = create_color_pal(n_bins=11, palette_type=palette)
@@ -142,27 +145,106 @@ def draw_rippler(coords: List[Tuple[float, float]], alt_coords: List[Tuple[float
     # convert to binary
     ret, binary = cv2.threshold(img_pface2, 100, 255, cv2.THRESH_OTSU)
     pface_mask = ~binary
+    # reused for every radius
+    scale_mask = np.zeros(pface_mask.shape, np.uint8)
     while rad <= max:
         color_step = step % 11
-        scale_mask = np.zeros(pface_mask.shape, np.uint8)
+        scale_mask.fill(0)
         # draw ripples
         for s in alt_coords:
             x, y = int(s[0]), int(s[1])
             cv2.circle(scale_mask, (y, x), rad, 255, -1)
-            cv2.circle(output_img, (y, x), rad, sea_to_rgb(pal[color_step]), 5)
+            layer.circle((y, x), rad, sea_to_rgb(pal[color_step]), 5)
         for c in coords:
             x, y = int(c[0]), int(c[1])
             if rad == max:
                 if scale_mask[x, y] != 0:
                     #  orange particles: inside ripple
-                    cv2.circle(output_img, (y, x), 8, circle_c, -1)
+                    layer.circle((y, x), 8, circle_c, -1)
                 else:
                     #  pink particles: outside ripple
-                    cv2.circle(output_img, (y, x), 8, (255, 0, 255), -1)
+                    layer.circle((y, x), 8, (255, 0, 255), -1)
             else:
                 if scale_mask[x, y] != 0:
                     #  orange particles: inside ripple
-                    cv2.circle(output_img, (y, x), 8, circle_c, -1)
+                    layer.circle((y, x), 8, circle_c, -1)
         rad += step_size
         step += 1
-    return output_img
+    return layer
+
+
+def inspect_rippler(coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], max_steps: int = 10, step_size: int = 60, initial_radius: int = 50) -> pd.DataFrame:
+    """ ONE ROW PER PARTICLE WITH ITS CLOSEST LANDMARK AND THE FIRST RIPPLE RADIUS THAT CAPTURES IT (NaN IF NONE DOES) """
+    # same int truncation as run_rippler/draw_rippler, coords are (row, col)
+    pts = np.array([[int(c[1]), int(c[0])] for c in coords], dtype=float).reshape(-1, 2)
+    landmarks = np.array([[int(s[1]), int(s[0])] for s in alt_coords], dtype=float).reshape(-1, 2)
+    table = pd.DataFrame(data={'X': pts[:, 0], 'Y': pts[:, 1]})
+    if len(pts) == 0 or len(landmarks) == 0:
+        return table
+    from sklearn.neighbors import KDTree
+    dist, idx = KDTree(landmarks).query(pts, k=1)
+    dist, idx = dist[:, 0], idx[:, 0]
+    radii = np.arange(initial_radius, (max_steps * step_size) + initial_radius + 1, step_size, dtype=float)
+    step = np.searchsorted(radii, dist)
+    table['landmark'] = [tuple(landmarks[i]) for i in idx]
+    table['landmark_dist'] = dist
+    table['capture_radius'] = np.where(step < len(radii), radii[np.minimum(step, len(radii) - 1)], np.nan)
+    return table
+
+
+def rippler_layers(data: DataObj, n: List[int], palette: List[Tuple[int, int, int]], r_palette: List[Tuple[int, int, int]], vals: List[int], inputs: dict):
+    """ REAL AND RANDOM RIPPLE ANNOTATIONS AROUND EACH LANDMARK """
+    return {'real': partial(draw_rippler, coords=inputs['coords'], alt_coords=inputs['alt_coords'],
+                            mask_path=inputs['mask_path'], palette=palette, circle_c=(18, 156, 232),
+                            max_steps=vals[0], step_size=vals[1], initial_radius=vals[2]),
+            'rand': partial(draw_rippler, coords=inputs['rand_coords'], alt_coords=inputs['alt_coords'],
+                            mask_path=inputs['mask_path'], palette=r_palette, circle_c=(103, 114, 0),
+                            max_steps=vals[0], step_size=vals[1], initial_radius=vals[2])}
+
+
+def rippler_table(kind: str, data: DataObj, vals: List[int], inputs: dict) -> pd.DataFrame:
+    return inspect_rippler(inputs['coords'] if kind == 'real' else inputs['rand_coords'], inputs['alt_coords'],
+                           max_steps=vals[0], step_size=vals[1], initial_radius=vals[2])
+
+
+""" WORKFLOW PLUGIN """
+WORKFLOW = WorkflowPlugin(
+    meta={
+        "name": "RIPPLER",
+        "type": Workflow.RIPPLER,
+        "header": "Gold Rippler: Landmark-Particle Correlation",
+        "desc": "Separate landmark masks as individual components, grow components until they contain X gold particles, calculate Landmark Correlated Particle Index (LCPI): (% of gold particles within landmark masks) / (% of total area of img taken up by landmark masks).  Requires lighthouse population.",
+        "checked": False,
+        "graph": {
+            "type": "bar",
+            "title": "Landmark Correlated Particle Index (LCPI) By Radius",
+            "x_label": "radius",
+            "y_label": "LCPI",
+            "x_type": "radius",
+            "y_type": "LCPI",
+            "x_mode": "values"
+        },
+        "props": [
+            {
+                "title": "maximum steps",
+                "placeholder": "10"
+            },
+            {
+                "title": "step size (px)",
+                "placeholder": "60"
+            },
+            {
+                "title": "initial radius (px)",
+                "placeholder": "50"
+            }
+        ]
+    },
+    run=run_rippler,
+    inputs={'real_coords': 'coords', 'rand_coords': 'rand_coords', 'alt_coords': 'alt_coords', 'img_path': 'img_path',
+            'mask_path': 'mask_path', 'ctx': 'ctx'},
+    needs=['pface_mask', 'pface_area'],
+    props=['max_steps', 'step_size', 'initial_radius'],
+    outputs=['real_df1', 'rand_df1'],
+    engines={'tiled': partial(run_rippler, tiled=True)},
+    layers=rippler_layers,
+    table=rippler_table)
@@ -1,19 +1,25 @@
 import logging
 import pandas as pd
 from typing import List, Tuple
-import math
 import numpy as np
-from PyQt5.QtCore import pyqtSignal
-import cv2
+from annotations import AnnotationLayer
+from functools import partial
+from typings import Workflow, WorkflowPlugin, DataObj
+from analysis import AnalysisContext
+from progress import ProgressReporter
+from timing import timed
 
-def run_goldstar(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], pb: pyqtSignal):
+@timed()
+def run_goldstar(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], alt_coords: List[Tuple[float, float]], pb: ProgressReporter, ctx: AnalysisContext = None):
     """
     NEAREST NEIGHBOR DISTANCE
     _______________________________
     @real_coords: real coordinates scaled to whatever format desired
     @rand_coords: list of randomly generated coordinates
-    @pb: progress bar wrapper element, allows us to track how much time is left in process
+    @pb: progress reporter, stages and fraction done
+    @ctx: shared analysis intermediates, particle to landmark distances come from the landmarks' spatial index
     """
+    ctx = ctx if ctx is not None else AnalysisContext(real_coords, alt_coords, rand_coords=rand_coords)
     # def a_star_nnd(coord_list: List[Tuple[float, float]], rand_list: List[Tuple[float, float]], alt_list: List[Tuple[float, float]], img_path: str = "", mask_path: str = ""):
     #     # import img
     #     img_original = cv2.imread(img_path)
@@ -42,49 +48,45 @@ def run_goldstar(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple
 
     #     print(pface_mask, pface_mask.shape)
 
-    def goldstar_nnd(coordinate_list: List[Tuple[float, float]], random_coordinate_list: List[Tuple[float, float]], alt_coordinate_list: List[Tuple[float, float]]):
+    def goldstar_nnd():
 
-        def goldstar_distance_closest(coord_list: List[Tuple[float, float]], alt_list: List[Tuple[float, float]]):
+        def goldstar_distance_closest(pop: str):
+            coord_list, alt_list = ctx.points(pop), ctx.points('alt')
+            closest, dists = ctx.get('landmark_distances', pop)
             nnd_list = []
-            for p in coord_list:
-                pb.emit(p)
-                small_dist = 10000000000000000000
-                p1 = (p[1], p[0])
-                nnd_obj = [p1, (0,0), 0]
-                p_if_y, p_if_x = p1
-                for j in alt_list:
-                    p2 = (j[1], j[0])
-                    # print('pj', p1, p2)
-                    if p1 != p2:
-                        p_jf_y, p_jf_x = p2
-                        dist = math.sqrt(((p_jf_y - p_if_y) ** 2) + ((p_jf_x - p_if_x) ** 2))
-                        if dist < small_dist:
-                            small_dist = dist
-                            nnd_obj[1], nnd_obj[2] = p2, small_dist
+            for z, p in enumerate(coord_list):
+                nnd_obj = [(p[1], p[0]), (0,0), 0]
+                j = closest[z]
+                if j >= 0:
+                    nnd_obj[1], nnd_obj[2] = (alt_list[j][1], alt_list[j][0]), dists[z]
                 nnd_list.append(nnd_obj)
             return nnd_list
         # find dist to closest particle goldstar
         logging.info("running goldstar nnd")
-        real_goldstar_list = goldstar_distance_closest(coordinate_list, alt_coordinate_list)
+        pb.stage('real goldstar', 0.1)
+        real_goldstar_list = goldstar_distance_closest('real')
         real_df = pd.DataFrame(data={'Nearest Neighbor Starfish Distance': real_goldstar_list})
         # clean up df
         clean_real_df = pd.DataFrame()
         clean_real_df[['og_coord', 'goldstar_coord', 'dist']] = pd.DataFrame(
             [x for x in real_df['Nearest Neighbor Starfish Distance'].tolist()])
+        pb.stage('random goldstar', 0.5)
         # find random dist
-        random_goldstar_list = goldstar_distance_closest(random_coordinate_list, alt_coordinate_list)
+        random_goldstar_list = goldstar_distance_closest('rand')
         rand_df = pd.DataFrame(data={'Nearest Neighbor Starfish Distance': random_goldstar_list})
         # fill clean random df
         clean_rand_df = pd.DataFrame()
         clean_rand_df[['og_coord', 'goldstar_coord', 'dist']] = pd.DataFrame(
             [x for x in rand_df['Nearest Neighbor Starfish Distance'].tolist()])
+        pb.update(1.0)
         return clean_real_df, clean_rand_df
     # if generate_random prop enabled, create random coordinates and return results, else return real coordinates
-    return goldstar_nnd(coordinate_list=real_coords, random_coordinate_list=rand_coords, alt_coordinate_list=alt_coords)
+    return goldstar_nnd()
 
 
-def draw_goldstar(nnd_df: pd.DataFrame, bin_counts: List[int], img: List, palette: List[Tuple[int, int, int]], circle_c: Tuple[int, int, int] = (0, 0, 255)):
-    """ DRAW LINES TO ANNOTATE N NEAREST DIST ON IMAGE """
+@timed()
+def draw_goldstar(nnd_df: pd.DataFrame, bin_counts: List[int], layer: AnnotationLayer, palette: List[Tuple[int, int, int]], circle_c: Tuple[int, int, int] = (0, 0, 255)):
+    """ DRAW LINES TO ANNOTATE N NEAREST DIST ON ANNOTATION LAYER """
     def sea_to_rgb(color):
         color = [val * 255 for val in color]
         return color
@@ -97,11 +99,63 @@ def draw_goldstar(nnd_df: pd.DataFrame, bin_counts: List[int], img: List, palett
         if count >= bin_counts[bin_idx] and bin_idx < len(bin_counts) - 1:
             bin_idx += 1
             count = 0
-        img = cv2.circle(img, particle_1, 10, circle_c, -1)
-        img = cv2.line(img, particle_1, particle_2, sea_to_rgb(palette[bin_idx]), 5)
-        img = cv2.circle(img, particle_2, 10, (0, 0, 255), -1)
+        layer.circle(particle_1, 10, circle_c, -1)
+        layer.line(particle_1, particle_2, sea_to_rgb(palette[bin_idx]), 5)
+        layer.circle(particle_2, 10, (0, 0, 255), -1)
 
     for idx, entry in nnd_df.iterrows():
         particle_1 = tuple(int(x) for x in entry['og_coord'])
-        cv2.putText(img, str(idx), org=particle_1, fontFace=cv2.FONT_HERSHEY_SIMPLEX, color=(255, 255, 255), fontScale=0.5)
-    return img
+        layer.text(str(idx), org=particle_1, color=(255, 255, 255), font_scale=0.5)
+    return layer
+
+
+def inspect_goldstar(nnd_df: pd.DataFrame) -> pd.DataFrame:
+    """ ONE ROW PER PARTICLE WITH ITS DISTANCE TO THE CLOSEST LANDMARK AND THAT LANDMARK """
+    table = pd.DataFrame(index=nnd_df.index)
+    table['X'] = [coord[0] for coord in nnd_df['og_coord']]
+    table['Y'] = [coord[1] for coord in nnd_df['og_coord']]
+    table['dist'] = nnd_df['dist']
+    table['goldstar_coord'] = nnd_df['goldstar_coord']
+    return table
+
+
+def goldstar_layers(data: DataObj, n: List[int], palette: List[Tuple[int, int, int]], r_palette: List[Tuple[int, int, int]], vals: List[int], inputs: dict):
+    """ REAL AND RANDOM PARTICLE TO LANDMARK NND ANNOTATIONS """
+    return {'real': partial(draw_goldstar, nnd_df=data.real_df1, bin_counts=n, palette=palette, circle_c=(103, 114, 0)),
+            'rand': partial(draw_goldstar, nnd_df=data.rand_df1, bin_counts=n, palette=r_palette, circle_c=(18, 156, 232))}
+
+
+def goldstar_table(kind: str, data: DataObj, vals: List[int], inputs: dict) -> pd.DataFrame:
+    return inspect_goldstar(data.real_df1 if kind == 'real' else data.rand_df1)
+
+
+""" WORKFLOW PLUGIN """
+WORKFLOW = WorkflowPlugin(
+    meta={
+        "name": "GOLDSTAR",
+        "type": Workflow.GOLDSTAR,
+        "header": "Gold Star Nearest Neighbor Distance",
+        "desc": "Find the nearest neighbor distance of two different populations. Requires lighthouse population",
+        "checked": False,
+        "graph": {
+            "type": "hist",
+            "title": "Gold Star NND",
+            "x_label": "Distance",
+            "y_label": "Number of Particles",
+            "x_type": "dist"
+        },
+        "props": [
+            {
+                "title": "A* (around landmarks)",
+                "placeholder": "0"
+            }
+        ]
+    },
+    run=run_goldstar,
+    inputs={'real_coords': 'coords', 'rand_coords': 'rand_coords', 'alt_coords': 'alt_coords', 'ctx': 'ctx'},
+    needs=['landmark_distances'],
+    # A* is not wired into run_goldstar yet
+    props=[None],
+    outputs=['real_df1', 'rand_df1'],
+    layers=goldstar_layers,
+    table=goldstar_table)
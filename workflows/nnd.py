@@ -1,63 +1,63 @@
-from PyQt5.QtCore import pyqtSignal
 from typing import List, Tuple
 import logging
 import pandas as pd
-import math
-import cv2
+from annotations import AnnotationLayer
+from functools import partial
+from typings import Workflow, WorkflowPlugin, DataObj
+from analysis import AnalysisContext
+from progress import ProgressReporter
+from timing import timed
 
 
-def run_nnd(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], pb: pyqtSignal):
+@timed()
+def run_nnd(real_coords: List[Tuple[float, float]], rand_coords: List[Tuple[float, float]], pb: ProgressReporter, ctx: AnalysisContext = None):
     """
     NEAREST NEIGHBOR DISTANCE
     _______________________________
     @real_coords: real coordinates scaled to whatever format desired
     @rand_coords: list of randomly generated coordinates
-    @pb: progress bar wrapper element, allows us to track how much time is left in process
+    @pb: progress reporter, stages and fraction done
+    @ctx: shared analysis intermediates, nearest neighbors come from its spatial index
     """
-    def nnd(coordinate_list: List[Tuple[float, float]], random_coordinate_list: List[Tuple[float, float]]):
-        # find dist to closest particle
-        def distance_to_closest_particle(coord_list):
-            nnd_list = []
-            for z in range(len(coord_list)):
-                pb.emit(z)
-                closest_d = 10000000000000000000
-                # og coord (x, y), closest coord (x, y), distance
-                nnd_obj = [(0, 0), (0, 0), 0]
-                p_if = (coord_list[z][1], coord_list[z][0])
-                p_if_y, p_if_x = p_if
-                nnd_obj[0] = p_if
-                for j in range(0, len(coord_list)):
-                    p_jf = (coord_list[j][1], coord_list[j][0])
-                    if z is not j and p_if is not p_jf:
-                        p_jf_y, p_jf_x = p_jf
-                        dist = math.sqrt(((p_jf_y - p_if_y) ** 2) + ((p_jf_x - p_if_x) ** 2))
-                        if dist < closest_d and dist != 0:
-                            closest_d = dist
-                            nnd_obj[1], nnd_obj[2] = p_jf, closest_d
-                nnd_list.append(nnd_obj)
-            return nnd_list
-
-        logging.info("running nnd")
-        real_nnd_list = distance_to_closest_particle(coordinate_list)
-        real_df = pd.DataFrame(data={'Nearest Neighbor Distance': real_nnd_list})
-        # clean up df
-        clean_real_df = pd.DataFrame()
-        clean_real_df[['og_coord', 'closest_coord', 'dist']] = pd.DataFrame(
-            [x for x in real_df['Nearest Neighbor Distance'].tolist()])
-        # find random dist
-        random_nnd_list = distance_to_closest_particle(random_coordinate_list)
-        rand_df = pd.DataFrame(data={'Nearest Neighbor Distance': random_nnd_list})
-        # fill clean random df
-        clean_rand_df = pd.DataFrame()
-        clean_rand_df[['og_coord', 'closest_coord', 'dist']] = pd.DataFrame(
-            [x for x in rand_df['Nearest Neighbor Distance'].tolist()])
-        return clean_real_df, clean_rand_df
-
-    return nnd(coordinate_list=real_coords, random_coordinate_list=rand_coords)
-
-
-def draw_length(nnd_df: pd.DataFrame, bin_counts: List[int], img: List, palette: List[Tuple[int, int, int]], circle_c: Tuple[int, int, int] = (0, 0, 255)):
-    """ DRAW LINES TO ANNOTATE N NEAREST DIST ON IMAGE """
+    ctx = ctx if ctx is not None else AnalysisContext(real_coords, rand_coords=rand_coords)
+
+    # find dist to closest particle
+    def distance_to_closest_particle(pop: str):
+        coord_list = ctx.points(pop)
+        closest, dists = ctx.get('nearest_neighbors', pop)
+        nnd_list = []
+        for z in range(len(coord_list)):
+            # og coord (x, y), closest coord (x, y), distance
+            nnd_obj = [(coord_list[z][1], coord_list[z][0]), (0, 0), 0]
+            j = closest[z]
+            if j >= 0:
+                nnd_obj[1], nnd_obj[2] = (coord_list[j][1], coord_list[j][0]), dists[z]
+            nnd_list.append(nnd_obj)
+        return nnd_list
+
+    logging.info("running nnd")
+    pb.stage('real nnd', 0.1)
+    real_nnd_list = distance_to_closest_particle('real')
+    real_df = pd.DataFrame(data={'Nearest Neighbor Distance': real_nnd_list})
+    # clean up df
+    clean_real_df = pd.DataFrame()
+    clean_real_df[['og_coord', 'closest_coord', 'dist']] = pd.DataFrame(
+        [x for x in real_df['Nearest Neighbor Distance'].tolist()])
+    pb.stage('random nnd', 0.5)
+    # find random dist
+    random_nnd_list = distance_to_closest_particle('rand')
+    rand_df = pd.DataFrame(data={'Nearest Neighbor Distance': random_nnd_list})
+    # fill clean random df
+    clean_rand_df = pd.DataFrame()
+    clean_rand_df[['og_coord', 'closest_coord', 'dist']] = pd.DataFrame(
+        [x for x in rand_df['Nearest Neighbor Distance'].tolist()])
+    pb.update(1.0)
+    return clean_real_df, clean_rand_df
+
+
+@timed()
+def draw_length(nnd_df: pd.DataFrame, bin_counts: List[int], layer: AnnotationLayer, palette: List[Tuple[int, int, int]], circle_c: Tuple[int, int, int] = (0, 0, 255)):
+    """ DRAW LINES TO ANNOTATE N NEAREST DIST ON ANNOTATION LAYER """
     def sea_to_rgb(color):
         color = [val * 255 for val in color]
         return color
@@ -70,10 +70,55 @@ def draw_length(nnd_df: pd.DataFrame, bin_counts: List[int], img: List, palette:
         if count >= bin_counts[bin_idx] and bin_idx < len(bin_counts) - 1:
             bin_idx += 1
             count = 0
-        img = cv2.circle(img, particle_1, 10, circle_c, -1)
-        img = cv2.line(img, particle_1, particle_2, sea_to_rgb(palette[bin_idx]), 5)
+        layer.circle(particle_1, 10, circle_c, -1)
+        layer.line(particle_1, particle_2, sea_to_rgb(palette[bin_idx]), 5)
 
     for idx, entry in nnd_df.iterrows():
         particle_1 = tuple(int(x) for x in entry['og_coord'])
-        cv2.putText(img, str(int(idx)), org=particle_1, fontFace=cv2.FONT_HERSHEY_SIMPLEX, color=(255, 255, 255), fontScale=0.5)
-    return img
+        layer.text(str(int(idx)), org=particle_1, color=(255, 255, 255), font_scale=0.5)
+    return layer
+
+
+def inspect_nnd(nnd_df: pd.DataFrame) -> pd.DataFrame:
+    """ ONE ROW PER PARTICLE (INDEXED LIKE THE IDS DRAWN ON THE IMAGE) WITH ITS NND AND THE NEIGHBOR IT WAS MEASURED TO """
+    table = pd.DataFrame(index=nnd_df.index)
+    table['X'] = [coord[0] for coord in nnd_df['og_coord']]
+    table['Y'] = [coord[1] for coord in nnd_df['og_coord']]
+    table['dist'] = nnd_df['dist']
+    table['closest_coord'] = nnd_df['closest_coord']
+    return table
+
+
+def nnd_layers(data: DataObj, n: List[int], palette: List[Tuple[int, int, int]], r_palette: List[Tuple[int, int, int]], vals: List[int], inputs: dict):
+    """ REAL AND RANDOM NND ANNOTATIONS, LINES COLORED BY HIST BIN """
+    return {'real': partial(draw_length, nnd_df=data.real_df1, bin_counts=n, palette=palette, circle_c=(103, 114, 0)),
+            'rand': partial(draw_length, nnd_df=data.rand_df1, bin_counts=n, palette=r_palette, circle_c=(18, 156, 232))}
+
+
+def nnd_table(kind: str, data: DataObj, vals: List[int], inputs: dict) -> pd.DataFrame:
+    return inspect_nnd(data.real_df1 if kind == 'real' else data.rand_df1)
+
+
+""" WORKFLOW PLUGIN """
+WORKFLOW = WorkflowPlugin(
+    meta={
+        "name": "NND",
+        "type": Workflow.NND,
+        "header": "Nearest Neighbor Distance of Particles",
+        "desc": "Find the nearest neighbor distance (NND) between gold particles. Optionally generate random coordinates.",
+        "checked": True,
+        "graph": {
+            "type": "hist",
+            "title": "NND of Particles",
+            "x_label": "Distance",
+            "y_label": "Number of Particles",
+            "x_type": "dist"
+        },
+        "props": []
+    },
+    run=run_nnd,
+    inputs={'real_coords': 'coords', 'rand_coords': 'rand_coords', 'ctx': 'ctx'},
+    needs=['nearest_neighbors'],
+    outputs=['real_df1', 'rand_df1'],
+    layers=nnd_layers,
+    table=nnd_table)
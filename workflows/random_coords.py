@@ -2,16 +2,51 @@ import logging
 import numpy as np
 import random
 import cv2
-from globals import DEFAULT_DISTANCE_THRESH 
+from globals import DEFAULT_DISTANCE_THRESH
+from typing import Callable, Tuple
+from timing import timed
 
-def gen_random_coordinates(img_path: str, mask_path: str, count: int = 0):
+
+def pface_mask_of(mask_path: str, crop: Tuple[int, ...] = None) -> np.ndarray:
     """
-    RANDOM COORDS GENERATOR
+    BINARY P-FACE MASK
     _______________________________
-    @img_path: path to image
     @mask_path: path to mask
+    @crop: shape of the image, crops the mask to it (and stands in for a missing mask). None reads the mask as is
+    """
+    if crop is not None:
+        # if no mask provided, use the entire image
+        if len(mask_path) > 0:
+            img_pface = cv2.imread(mask_path)
+        else:
+            img_pface = np.zeros(crop, dtype=np.uint8)
+            img_pface.fill(245)
+        # crop to size of normal image
+        img_pface = img_pface[:crop[0], :crop[1], :3]
+    else:
+        img_pface = cv2.imread(mask_path)
+    # convert to grayscale
+    img_pface2 = cv2.cvtColor(img_pface, cv2.COLOR_BGR2GRAY)
+    # # convert to binary
+    ret, binary = cv2.threshold(img_pface2, 100, 255, cv2.THRESH_OTSU)
+    # Alternative method of grabbing contours of pface
+    # lower_bound = np.array([239, 174, 0])
+    # upper_bound = np.array([254, 254, 254])
+    # pface_mask: list = cv2.inRange(img_pface, lower_bound, upper_bound)
+    return ~binary
+
+
+def random_points(pface_mask: np.ndarray, count: int = 0, seed: int = None, check: Callable = None):
+    """
+    RANDOM POINTS IN A P-FACE MASK
+    _______________________________
+    @pface_mask: binary p-face mask, see pface_mask_of
     @count: number of random particles to generate
+    @seed: seed for reproducible coords, None draws a fresh set every call
+    @check: called every few hundred draws, raises to abandon generating (see cancel.CancelToken)
     """
+    rng = random.Random(seed)
+
     def generate_random_points(boundary: list, quantity: int, mask: list):
         # generate pseudo-random distribution of particles within the p-face
         def meets_threshold(new_point, points):
@@ -22,10 +57,13 @@ def gen_random_coordinates(img_path: str, mask_path: str, count: int = 0):
             return True
 
         def generate_K_points(K):
-            points = []
+            points, draws = [], 0
             while len(points) < K:
-                x = random.randint(1, boundary[0] - 1)
-                y = random.randint(1, boundary[1] - 1)
+                draws += 1
+                if check is not None and draws % 64 == 0:
+                    check()
+                x = rng.randint(1, boundary[0] - 1)
+                y = rng.randint(1, boundary[1] - 1)
                 if mask[x, y] != 0:
                     new_point = np.array([x, y])
                     if meets_threshold(new_point, points):
@@ -34,28 +72,22 @@ def gen_random_coordinates(img_path: str, mask_path: str, count: int = 0):
 
         return generate_K_points(quantity)
 
+    logging.info("Generated random particles")
+    return generate_random_points(pface_mask.shape, count, pface_mask)
+
+
+@timed()
+def gen_random_coordinates(img_path: str, mask_path: str, count: int = 0, seed: int = None):
+    """
+    RANDOM COORDS GENERATOR
+    _______________________________
+    @img_path: path to image
+    @mask_path: path to mask
+    @count: number of random particles to generate
+    @seed: seed for reproducible coords, None draws a fresh set every call
+    """
     if len(img_path) == 0:
         return []
     # import img
     img_original = cv2.imread(img_path)
-    crop = img_original.shape
-    # if no mask provided, use the entire image
-    if len(mask_path) > 0:
-        img_pface = cv2.imread(mask_path)
-    else:
-        img_pface = np.zeros(crop, dtype=np.uint8)
-        img_pface.fill(245)
-    # crop to size of normal image
-    img_pface = img_pface[:crop[0], :crop[1], :3]
-    # convert to grayscale
-    img_pface2 = cv2.cvtColor(img_pface, cv2.COLOR_BGR2GRAY)
-    # # convert to binary
-    ret, binary = cv2.threshold(img_pface2, 100, 255, cv2.THRESH_OTSU)
-    pface_mask = ~binary
-    # Alternative method of grabbing contours of pface
-    # lower_bound = np.array([239, 174, 0])
-    # upper_bound = np.array([254, 254, 254])
-    # pface_mask: list = cv2.inRange(img_pface, lower_bound, upper_bound)
-    # print(pface_mask.shape, pface_mask)
-    logging.info("Generated random particles")
-    return generate_random_points(pface_mask.shape, count, pface_mask)
+    return random_points(pface_mask_of(mask_path, img_original.shape), count, seed)